@@ -110,6 +110,9 @@ class Athena_Vortex_Lattice(Aerodynamics):
         settings.model_fuselage                                      = False 
         settings.print_output                                        = False 
         settings.keep_files                                          = False
+        settings.number_of_processes                                 = None # AVL processes run at the same time to train the surrogates, all the available processors if None
+        settings.use_training_cache                                  = False # reuse the AVL results of earlier trainings with the same inputs and AVL executable
+        settings.training_cache_directory                            = None # folder of the stored AVL results, required to use the training cache
         settings.save_regression_results                             = False          
         settings.regression_flag                                     = False  
         settings.side_slip_angle                                     = 0.0
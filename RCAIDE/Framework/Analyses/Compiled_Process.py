@@ -0,0 +1,208 @@
+# RCAIDE/Framework/Analyses/Compiled_Process.py
+#
+#
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+from RCAIDE.Framework.Core import Data
+
+import time
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Compiled_Process
+# ----------------------------------------------------------------------------------------------------------------------
+class Compiled_Process(object):
+    """ RCAIDE.Framework.Analyses.Compiled_Process()
+
+        An execution plan of a Process, built with Process.compile. The nested processes are flattened once into a
+        list of the callables of their steps, which are then run in order without walking the tree, checking the
+        type of the steps or storing their results. The wall time and number of calls of every step are recorded
+        when profile is True.
+
+            Assumptions:
+            The results of the steps are not used. The plan is built at the first evaluation, so that the steps added
+            when a mission is initialized (e.g. the unknowns and residuals of the network) are part of it. Changes made
+            to the process after that are only part of the plan once build is called again.
+
+            Source:
+            N/A
+    """
+
+    def __init__(self,process,profile=False):
+        """This builds the plan of a process.
+
+                Assumptions:
+                None
+
+                Source:
+                N/A
+
+                Inputs:
+                process   - process to compile                     [Process]
+                profile   - flag to time the steps                 [boolean]
+
+                Outputs:
+                None
+
+                Properties Used:
+                N/A
+            """
+        self.process = process
+        self.profile = profile
+        self.steps   = None
+
+    def build(self):
+        """Flattens the process into the list of its steps and clears the profile.
+
+                Assumptions:
+                None
+
+                Source:
+                N/A
+
+                Inputs:
+                None
+
+                Outputs:
+                None
+
+                Properties Used:
+                N/A
+            """
+        self.steps = self.process.flatten()
+        self.reset_profile()
+
+    def reset_profile(self):
+        """Clears the wall times and numbers of calls of the steps.
+
+                Assumptions:
+                None
+
+                Source:
+                N/A
+
+                Inputs:
+                None
+
+                Outputs:
+                None
+
+                Properties Used:
+                N/A
+            """
+        self.calls = [0]*len(self.steps)
+        self.times = [0.]*len(self.steps)
+
+    def evaluate(self,*args,**kwarg):
+        """Runs the steps of the plan in order.
+
+                Assumptions:
+                None
+
+                Source:
+                N/A
+
+                Inputs:
+                None
+
+                Outputs:
+                None
+
+                Properties Used:
+                N/A
+            """
+        if self.steps is None:
+            self.build()
+
+        if self.profile:
+            calls = self.calls
+            times = self.times
+            for i,(tag,step) in enumerate(self.steps):
+                start     = time.perf_counter()
+                step(*args,**kwarg)
+                times[i] += time.perf_counter() - start
+                calls[i] += 1
+        else:
+            for tag,step in self.steps:
+                step(*args,**kwarg)
+
+        return None
+
+    def __call__(self,*args,**kwarg):
+        """This is used to set the class' call behavior to the evaluate function.
+
+                Assumptions:
+                None
+
+                Source:
+                N/A
+
+                Inputs:
+                None
+
+                Outputs:
+                None
+
+                Properties Used:
+                N/A
+            """
+        return self.evaluate(*args,**kwarg)
+
+    def __getattr__(self,key):
+        """Gives access to the steps of the compiled process, e.g. plan.conditions.
+
+                Assumptions:
+                None
+
+                Source:
+                N/A
+
+                Inputs:
+                key       - tag of the step             [string]
+
+                Outputs:
+                step of the compiled process
+
+                Properties Used:
+                N/A
+            """
+        if key in ['process','steps']:
+            raise AttributeError(key)
+        return getattr(self.process,key)
+
+    def profiling_report(self):
+        """Collects the wall times and numbers of calls of the steps, from the slowest step to the fastest.
+
+                Assumptions:
+                None
+
+                Source:
+                N/A
+
+                Inputs:
+                None
+
+                Outputs:
+                report.<path>.calls        - calls of the step, path is e.g. 'conditions.aerodynamics'  [-]
+                report.<path>.total_time   - wall time of all the calls                                 [s]
+                report.<path>.mean_time    - wall time per call                                         [s]
+                report.<path>.fraction     - fraction of the wall time of the plan                      [-]
+
+                Properties Used:
+                N/A
+            """
+        if self.steps is None:
+            self.build()
+
+        total_time = sum(self.times)
+        report     = Data()
+        for i in sorted(range(len(self.steps)),key=lambda i: -self.times[i]):
+            tag                    = self.steps[i][0]
+            report[tag]            = Data()
+            report[tag].calls      = self.calls[i]
+            report[tag].total_time = self.times[i]
+            report[tag].mean_time  = self.times[i]/self.calls[i] if self.calls[i] > 0 else 0.
+            report[tag].fraction   = self.times[i]/total_time    if total_time > 0    else 0.
+
+        return report
@@ -40,6 +40,9 @@ class Emission_Index_CRN_Method(Emissions):
         
         # surrogoate models                 
         self.surrogates                 = Data() 
+        
+        # size of the process pool the reactor networks are evaluated on, all the processors if None 
+        self.settings.number_of_processes = 1
 
         # build the evaluation process
         compute                         = Process()  
@@ -7,6 +7,10 @@
 # ----------------------------------------------------------------------------------------------------------------------  
 # RCAIDE imports
 from  RCAIDE.Library.Methods.Geodesics.Geodesics import Geodesic_Calculate
+from  RCAIDE.Library.Methods.Geodesics.compute_geodesic_inverse import compute_geodesic_inverse
+
+# package imports
+import numpy as np 
 
 # ----------------------------------------------------------------------------------------------------------------------
 #  Calculate Distance between two coordinate locations
@@ -27,4 +31,29 @@ def Calculate_Distance(coord1, coord2):
        None 
             """    
     distance = Geodesic_Calculate(coord1, coord2).kilometers
-    return(distance)
\ No newline at end of file
+    return(distance)
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Calculate Distances between arrays of coordinate locations
+# ----------------------------------------------------------------------------------------------------------------------  
+def Calculate_Distances(coords1, coords2):
+    """This computes the distances between many pairs of coordinates at once with the batch geodesic solver 
+    and returns the results in kilometers
+    
+       Inputs:
+       - Coordinates (lat, long), arrays of size (number of pairs, 2) or a single pair 
+       
+       Outputs:
+       - Distances in kilometers between the coordinates, size (number of pairs)
+       
+       Assumptions:
+       WGS-84 ellipsoid, as in Calculate_Distance
+
+       Source:
+       None 
+            """    
+    coords1  = np.atleast_2d(coords1)
+    coords2  = np.atleast_2d(coords2)
+    geodesic = compute_geodesic_inverse(coords1[:,0],coords1[:,1],coords2[:,0],coords2[:,1])
+    distance = geodesic.distance / 1000. 
+    return(distance)
@@ -8,4 +8,4 @@
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------
 
-from .Geodesics import Calculate_Distance
+from .Geodesics import Calculate_Distance, Calculate_Distances
@@ -0,0 +1,129 @@
+# RCAIDE/Framework/Analyses/Memoized_Step.py
+#
+#
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+import numpy as np
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Memoized_Step
+# ----------------------------------------------------------------------------------------------------------------------
+class Memoized_Step(object):
+    """ RCAIDE.Framework.Analyses.Memoized_Step()
+
+        A step of a Process that is only run when its inputs change. The step declares the paths of its inputs and
+        outputs, relative to the object the Process is evaluated on (the segment for mission processes). When the
+        inputs are bitwise identical to those of the last run, the step is skipped and its outputs are set back to
+        the values it computed on that run. Steps are memoized with Process.memoize.
+
+            Assumptions:
+            The outputs of the step only depend on the declared inputs and on objects that do not change between
+            calls, such as the analyses of a segment
+
+            Source:
+            N/A
+    """
+
+    def __init__(self,function,inputs,outputs):
+        """This sets the step and its dependencies.
+
+                Assumptions:
+                None
+
+                Source:
+                N/A
+
+                Inputs:
+                function  - step of the process                          [function]
+                inputs    - paths of the inputs of the step              [list of strings]
+                outputs   - paths of the outputs of the step             [list of strings]
+
+                Outputs:
+                None
+
+                Properties Used:
+                N/A
+            """
+        self.function = function
+        self.inputs   = list(inputs)
+        self.outputs  = list(outputs)
+        self.reset()
+
+    def reset(self):
+        """Forgets the last run of the step and its call counts.
+
+                Assumptions:
+                None
+
+                Source:
+                N/A
+
+                Inputs:
+                None
+
+                Outputs:
+                None
+
+                Properties Used:
+                N/A
+            """
+        self.calls            = 0
+        self.skips            = 0
+        self.previous_inputs  = None
+        self.previous_outputs = None
+
+    def __call__(self,target,*args,**kwarg):
+        """Runs the step, or restores its last outputs if its inputs did not change.
+
+                Assumptions:
+                None
+
+                Source:
+                N/A
+
+                Inputs:
+                target    - object the process is evaluated on, e.g. a segment   [-]
+
+                Outputs:
+                Result of the step, None if the step is skipped
+
+                Properties Used:
+                N/A
+            """
+        self.calls += 1
+        current_inputs = [np.array(target.deep_get(path)) for path in self.inputs]
+
+        if self.previous_inputs is not None and all(map(bitwise_equal,current_inputs,self.previous_inputs)):
+            self.skips += 1
+            for path,value in zip(self.outputs,self.previous_outputs):
+                target.deep_set(path,np.array(value))
+            return None
+
+        result                = self.function(target,*args,**kwarg)
+        self.previous_inputs  = current_inputs
+        self.previous_outputs = [np.array(target.deep_get(path)) for path in self.outputs]
+
+        return result
+
+def bitwise_equal(a,b):
+    """Checks that two arrays have the same shape, type and bytes.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            a, b      - arrays              [-]
+
+            Outputs:
+            equal     - comparison result   [boolean]
+
+            Properties Used:
+            N/A
+        """
+    equal = a.shape == b.shape and a.dtype == b.dtype and a.tobytes() == b.tobytes()
+    return equal
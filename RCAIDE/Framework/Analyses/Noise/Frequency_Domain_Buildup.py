@@ -63,6 +63,8 @@ class Frequency_Domain_Buildup(Noise):
         self.tag                                   =  "Frequency_Domain_Buildup"        
         self.settings.fidelity                     = 'line_source'
         self.settings.use_plane_loading_surrogate =  True 
+        self.settings.noise_memory_budget         =  5E8  # maximum memory of arrays for a chunk of control points [bytes]
+        self.settings.use_airfoil_analysis_memoization = True 
     def evaluate_noise(self,segment):
         """ Process vehicle to setup vehicle, condititon and configuration
     
@@ -8,6 +8,8 @@
 # ----------------------------------------------------------------------------------------------------------------------   
 from RCAIDE.Framework.Core import ContainerOrdered
 from RCAIDE.Framework.Core import Data 
+from .Memoized_Step        import Memoized_Step
+from .Compiled_Process     import Compiled_Process
 
 # ----------------------------------------------------------------------------------------------------------------------
 # Process
@@ -56,6 +58,127 @@ class Process(ContainerOrdered):
             results[tag] = result
          
         return results
+    
+    def memoize(self,tag,inputs=None,outputs=None):
+        """Replaces a step of the process with a memoized step, which is skipped when its
+            inputs are unchanged since its last run, see Memoized_Step. 
+        
+                Assumptions:
+                The step only depends on the declared inputs
+        
+                Source:
+                N/A
+        
+                Inputs:
+                tag      - tag of the step                                           [string]
+                inputs   - paths of the inputs of the step, defaults to step.inputs  [list of strings]
+                outputs  - paths of the outputs of the step, defaults to step.outputs [list of strings]
+        
+                Outputs:
+                None
+        
+                Properties Used:
+                N/A
+            """   
+        step = self[tag]
+        if isinstance(step,Memoized_Step):
+            step = step.function
+        if inputs is None:
+            inputs  = step.inputs
+        if outputs is None:
+            outputs = step.outputs
+        self[tag] = Memoized_Step(step,inputs,outputs)
+        
+        return
+    
+    def memoization_report(self):
+        """Collects the number of calls and of skipped calls of the memoized steps of the
+            process and of its nested processes.
+        
+                Assumptions:
+                None
+        
+                Source:
+                N/A
+        
+                Inputs:
+                None
+        
+                Outputs:
+                report.<tag>.calls   - calls of the memoized step                   [-]
+                report.<tag>.skips   - calls that were skipped                      [-]
+        
+                Properties Used:
+                N/A
+            """   
+        report = Data()
+        for tag,step in self.items(): 
+            if isinstance(step,Memoized_Step):
+                report[tag]       = Data()
+                report[tag].calls = step.calls
+                report[tag].skips = step.skips
+            elif isinstance(step,Process) or isinstance(step,Compiled_Process):
+                step_report = step.memoization_report()
+                if len(step_report) > 0:
+                    report[tag] = step_report
+                    
+        return report
+    
+    def flatten(self,prefix=''):
+        """Lists the callables of the steps of the process and of its nested processes, 
+            in the order they are evaluated.
+        
+                Assumptions:
+                None
+        
+                Source:
+                N/A
+        
+                Inputs:
+                prefix   - prefix of the paths of the steps                    [string]
+        
+                Outputs:
+                steps    - (path, callable) of each step, the path is e.g. 
+                           'conditions.aerodynamics'                           [list]
+        
+                Properties Used:
+                N/A
+            """   
+        steps = []
+        for tag,step in self.items():
+            path = prefix + tag
+            if isinstance(step,Process):
+                steps.extend(step.flatten(path + '.'))
+            elif hasattr(step,'evaluate'):
+                steps.append((path,step.evaluate))
+            else:
+                steps.append((path,step))
+                
+        return steps
+    
+    def compile(self,profile=False):
+        """Builds an execution plan of the process, see Compiled_Process. The plan 
+            replaces the process where it is evaluated many times, for example 
+            segment.process.iterate = segment.process.iterate.compile()
+        
+                Assumptions:
+                The results of the steps are not used
+        
+                Source:
+                N/A
+        
+                Inputs:
+                profile  - flag to record the wall time and calls of the steps  [boolean]
+        
+                Outputs:
+                plan     - compiled process                                     [Compiled_Process]
+        
+                Properties Used:
+                N/A
+            """   
+        plan = Compiled_Process(self,profile)
+        
+        return plan
         
     def __call__(self,*args,**kwarg):
         """This is used to set the class' call behavior to the evaluate functions.
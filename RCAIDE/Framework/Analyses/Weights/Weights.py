@@ -5,6 +5,10 @@ import RCAIDE
 from RCAIDE.Framework.Core     import Data
 from RCAIDE.Framework.Analyses import Analysis  
 
+# package imports
+import numpy as np
+import copy
+
 # ----------------------------------------------------------------------
 #  Analysis
 # ---------------------------------------------------------------------- 
@@ -94,4 +98,84 @@ class Weights(Analysis):
         vehicle.mass_properties.operating_empty = results.empty.total
 
         # done!
-        return results        
\ No newline at end of file
+        return results
+
+    def evaluate_batch(self, design_variables):
+        """Evaluate the weight analysis over a set of design points at once. The driving parameters of the vehicle
+        are replaced by arrays with one value per design point and the correlation buildups are evaluated once, with
+        the design points along the array axis. The vehicle of the analysis is copied once for the whole set and is
+        not modified.
+
+        Assumptions:
+        Parameters derived from the driving parameters, such as the span of a wing whose area and aspect ratio are
+        varied, are given in design_variables, they are not recomputed. The physics based buildup of
+        Weights_EVTOL, which sizes the structure along the span of each component, is not supported.
+
+        Source:
+        N/A
+
+        Inputs:
+        design_variables   - dictionary of the paths of the vehicle parameters, such as
+                             'wings.main_wing.areas.reference', to their values at each design point, shape (n_points)
+
+        Outputs:
+        weights            - structured array of shape (n_points), with one field per entry of the weight breakdown
+                             named after its path, such as 'empty.structural.wings'                                    [kg]
+
+        Properties Used:
+        N/A
+        """
+        shape = np.broadcast(*[np.asarray(values) for values in design_variables.values()]).shape
+        if len(shape) != 1:
+            raise ValueError('the design variables must be one dimensional arrays of the same length')
+
+        # one vehicle for all the design points
+        vehicle = copy.deepcopy(self.vehicle)
+        for key, values in design_variables.items():
+            vehicle.deep_set(key, np.broadcast_to(np.asarray(values,dtype=float), shape).copy())
+
+        original     = self.vehicle
+        self.vehicle = vehicle
+        try:
+            results = self.evaluate()
+        finally:
+            self.vehicle = original
+
+        # pack the breakdown into a structured array
+        fields  = flatten_weights(results, shape[0])
+        weights = np.zeros(shape, dtype = [(key, float) for key in fields.keys()])
+        for key, values in fields.items():
+            weights[key] = values
+
+        return weights
+
+def flatten_weights(results, n_points, path = ''):
+    """Collects the numerical entries of a weight breakdown with their values at each design point.
+
+    Assumptions:
+    Entries that are neither numbers nor arrays of one value or of one value per design point are skipped.
+
+    Source:
+    N/A
+
+    Inputs:
+    results    - weight breakdown
+    n_points   - number of design points
+    path       - path of the breakdown in the outer breakdown
+
+    Outputs:
+    fields     - dictionary of the paths of the entries to their values, shape (n_points)                      [kg]
+
+    Properties Used:
+    N/A
+    """
+    fields = {}
+    for key, value in results.items():
+        if isinstance(value, dict):
+            fields.update(flatten_weights(value, n_points, path + key + '.'))
+        elif isinstance(value, (int, float, np.number, np.ndarray)) and not isinstance(value, bool):
+            value = np.asarray(value, dtype = float).ravel()
+            if value.size in [1, n_points]:
+                fields[path + key] = np.broadcast_to(value, (n_points,))
+
+    return fields        
\ No newline at end of file
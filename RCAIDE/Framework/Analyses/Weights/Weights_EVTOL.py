@@ -77,4 +77,22 @@ class Weights_EVTOL(Weights):
         vehicle.mass_properties.operating_empty = results.empty.total
 
         # done!
-        return results        
\ No newline at end of file
+        return results
+
+    def evaluate_batch(self, design_variables):
+        """The physics based buildup sizes the structure of the rotors, wings and fuselages along their span, and
+        cannot be evaluated over several design points at once.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        design_variables   - dictionary of the paths of the vehicle parameters to their values at each design point
+
+        Outputs:
+        None
+        """
+        raise NotImplementedError('evaluate_batch is only available for the correlation buildups, evaluate each design point of the EVTOL weight analysis separately')        
\ No newline at end of file
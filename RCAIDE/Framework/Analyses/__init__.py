@@ -8,10 +8,12 @@
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------
 
-from .Analysis  import Analysis 
-from .Process   import Process
-from .Settings  import Settings
-from .Vehicle   import Vehicle 
+from .Analysis         import Analysis 
+from .Process          import Process
+from .Memoized_Step    import Memoized_Step
+from .Compiled_Process import Compiled_Process
+from .Settings         import Settings
+from .Vehicle          import Vehicle 
 
 from . import Common
 from . import Aerodynamics
@@ -308,4 +308,42 @@ def new_tensor(a):
     
     T = np.resize(T,[n_a,3,3])
     
-    return T
\ No newline at end of file
+    return T
+
+# ----------------------------------------------------------------------------------------------------------------------
+# hash_data
+# ----------------------------------------------------------------------------------------------------------------------
+
+def hash_data(key_hash,value): 
+    '''Updates a hash with the arrays and values of a data structure, in key order
+    
+    Source:
+    None
+    
+    Assumptions:
+    None 
+    
+    Inputs:
+    key_hash   <hashlib hash>
+    value      <data_structure>, array or value
+    
+    Outputs:
+    None
+    
+    Properties Used:
+    N/A
+    '''
+    if isinstance(value,dict):
+        for key in sorted(value.keys()):
+            key_hash.update(str(key).encode())
+            hash_data(key_hash,value[key])
+    elif isinstance(value,(list,tuple)):
+        for item in value:
+            hash_data(key_hash,item)
+    elif isinstance(value,np.ndarray):
+        key_hash.update(str((value.dtype,value.shape)).encode())
+        key_hash.update(np.ascontiguousarray(value).tobytes())
+    else:
+        key_hash.update(repr(value).encode())
+    
+    return
@@ -49,6 +49,8 @@ class Numerics(Conditions):
         self.solver_jacobian                  = "none"
         self.tolerance_solution               = 1e-8
         self.converged                        = None
+        self.number_of_function_evaluations   = 0
+        self.residual_norm                    = None
         self.max_evaluations                  = 0.
         self.step_size                        = None
         
@@ -61,6 +63,7 @@ class Numerics(Conditions):
         self.time.control_points              = np.empty([0,0])
         self.time.differentiate               = np.empty([0,0])
         self.time.integrate                   = np.empty([0,0]) 
+        self.time.duration                    = np.empty([0,0]) 
         
         
         
@@ -0,0 +1,595 @@
+# RCAIDE/Framework/Mission/Mission_Profiler.py
+#
+#
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+from RCAIDE.Framework.Core                      import Data
+from RCAIDE.Framework.Analyses                  import Compiled_Process
+from RCAIDE.Framework.Analyses.Analysis         import Analysis
+
+# package imports
+import time
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Mission_Profiler
+# ----------------------------------------------------------------------------------------------------------------------
+class Mission_Profiler(object):
+    """ RCAIDE.Framework.Mission.Mission_Profiler()
+
+        Evaluates a mission and reports where the time is spent. While the mission is evaluated, the stages of the
+        mission and of its segments are timed, the iterate process of each segment is replaced by a profiled execution
+        plan (see Compiled_Process) and the initialize and evaluate calls of the analyses of the segments are timed.
+        The mission is restored once it is evaluated, so missions that are not profiled run without any overhead.
+        The report can be written as JSON with RCAIDE.save.
+
+            Assumptions:
+            The analyses are timed by wrapping the initialize and evaluate functions of each analysis of the mission
+            while the mission is evaluated, their classes are not modified.
+
+            Source:
+            N/A
+    """
+
+    def __init__(self):
+        """This sets the default values.
+
+                Assumptions:
+                None
+
+                Source:
+                N/A
+
+                Inputs:
+                None
+
+                Outputs:
+                None
+
+                Properties Used:
+                N/A
+            """
+        self.report = None
+
+    def evaluate(self,mission):
+        """Evaluates a mission and builds the profiling report, see build_report.
+
+                Assumptions:
+                None
+
+                Source:
+                N/A
+
+                Inputs:
+                mission   - mission to evaluate                 [Sequential_Segments]
+
+                Outputs:
+                results   - results of the mission              [Sequential_Segments]
+
+                Properties Used:
+                N/A
+            """
+        self.current_segment = None
+        self.active          = set()
+        self.analyses        = {}
+        self.analysis_timers = {}
+        self.stages          = Data()
+        self.plans           = Data()
+
+        # time the stages of the mission and of its segments
+        originals          = Data()
+        originals.mission  = self.instrument_process(mission.process,None)
+        originals.segments = Data()
+        for tag,segment in mission.segments.items():
+            originals.segments[tag] = self.instrument_process(segment.process,tag)
+            for key,analysis in segment.analyses.items():
+                if isinstance(analysis,Analysis):
+                    self.analyses[id(analysis)] = (key,analysis)
+
+        # time the analyses
+        patched_methods = self.instrument_analyses()
+
+        start = time.perf_counter()
+        try:
+            results = mission.evaluate()
+        finally:
+            wall_time = time.perf_counter() - start
+            restore_methods(patched_methods)
+            restore_process(mission.process,originals.mission)
+            for tag,segment in mission.segments.items():
+                restore_process(segment.process,originals.segments[tag])
+
+        self.report = self.build_report(mission,wall_time)
+
+        return results
+
+    def save(self,filename):
+        """Writes the profiling report to a JSON file.
+
+                Assumptions:
+                None
+
+                Source:
+                N/A
+
+                Inputs:
+                filename  - path of the file                    [string]
+
+                Outputs:
+                None
+
+                Properties Used:
+                N/A
+            """
+        from RCAIDE.save import save
+        save(self.report,filename)
+
+        return
+
+    def instrument_process(self,process,segment_tag):
+        """Replaces the top level steps of a process by timed steps. The iterate process of a segment is replaced by
+            a profiled execution plan.
+
+                Assumptions:
+                None
+
+                Source:
+                N/A
+
+                Inputs:
+                process      - process of the mission or of a segment    [Process]
+                segment_tag  - tag of the segment, None for the mission   [string]
+
+                Outputs:
+                originals    - replaced steps                             [Data]
+
+                Properties Used:
+                N/A
+            """
+        originals = Data()
+        stages    = Data()
+        for key,step in list(process.items()):
+            originals[key] = step
+            if key == 'iterate' and segment_tag is not None:
+                if isinstance(step,Compiled_Process):
+                    step = step.process
+                step                    = Compiled_Process(step,profile=True)
+                self.plans[segment_tag] = step
+            stages[key]  = Timed_Step(self,step,segment_tag)
+            process[key] = stages[key]
+
+        if segment_tag is None:
+            self.mission_stages = stages
+        else:
+            self.stages[segment_tag] = stages
+
+        return originals
+
+    def instrument_analyses(self):
+        """Wraps the initialize and evaluate functions of each analysis by timed functions, set on the analysis
+            itself so that its class and the other instances of the class are not modified.
+
+                Assumptions:
+                None
+
+                Source:
+                N/A
+
+                Inputs:
+                None
+
+                Outputs:
+                patched_methods  - (analysis, name, original function, flag of a function set on the analysis)  [list]
+
+                Properties Used:
+                N/A
+            """
+        patched_methods = []
+        for tag,analysis in self.analyses.values():
+            for name in ['initialize','evaluate']:
+                original = getattr(analysis,name)
+                patched_methods.append((analysis,name,original,name in vars(analysis)))
+                object.__setattr__(analysis,name,timed_method(self,analysis,original,name))
+
+        return patched_methods
+
+    def record_analysis(self,analysis,name,elapsed):
+        """Adds a call of an analysis to its timer in the segment being evaluated.
+
+                Assumptions:
+                None
+
+                Source:
+                N/A
+
+                Inputs:
+                analysis  - analysis                            [Analysis]
+                name      - 'initialize' or 'evaluate'          [string]
+                elapsed   - wall time of the call               [s]
+
+                Outputs:
+                None
+
+                Properties Used:
+                N/A
+            """
+        key   = (self.current_segment,self.analyses[id(analysis)][0],name)
+        timer = self.analysis_timers.get(key)
+        if timer is None:
+            timer = self.analysis_timers[key] = [0,0.]
+        timer[0] += 1
+        timer[1] += elapsed
+
+        return
+
+    def build_report(self,mission,wall_time):
+        """Collects the timings, the solver evaluations and the convergence of the segments.
+
+                Assumptions:
+                None
+
+                Source:
+                N/A
+
+                Inputs:
+                mission    - evaluated mission                  [Sequential_Segments]
+                wall_time  - wall time of the mission           [s]
+
+                Outputs:
+                report.mission.wall_time                                 [s]
+                report.mission.converged                                 [boolean], of the segments with a solve
+                report.mission.stages.<stage>.calls, total_time          [-], [s]
+                report.mission.analyses.<analysis>.<function>            calls of the analyses outside the segments,
+                                                                         e.g. initialize in the pre-processing
+                report.segments.<tag>.wall_time                          [s]
+                report.segments.<tag>.converged                          [boolean], None without a solve
+                report.segments.<tag>.number_of_function_evaluations     evaluations of the solver              [-]
+                report.segments.<tag>.residual_norm                      norm of the residuals at the solution  [-]
+                report.segments.<tag>.iterations                         evaluations of the iterate process     [-]
+                report.segments.<tag>.stages.<stage>.calls, total_time   [-], [s]
+                report.segments.<tag>.iterate                            profile of the steps of the iterate
+                                                                         process, see Compiled_Process
+                report.segments.<tag>.analyses.<analysis>.<function>     calls of the analyses in the segment
+                report.analyses.<analysis>.<function>.calls, total_time  calls of the analyses in the mission   [-], [s]
+
+                Properties Used:
+                N/A
+            """
+        report                  = Data()
+        report.mission          = Data()
+        report.mission.tag      = str(mission.tag)
+        report.mission.wall_time = wall_time
+        report.mission.stages   = stages_report(self.mission_stages)
+        report.mission.analyses = Data()
+        report.segments         = Data()
+        report.analyses         = Data()
+
+        converged = True
+        for tag,segment in mission.segments.items():
+            numerics                   = segment.state.numerics
+            segment_report             = Data()
+            stages                     = self.stages[tag]
+            starts                     = [stage.start for stage in stages.values() if stage.start is not None]
+            ends                       = [stage.end   for stage in stages.values() if stage.end   is not None]
+            segment_report.wall_time   = max(ends) - min(starts) if len(starts) > 0 else 0.
+            segment_report.converged   = bool(numerics.converged) if numerics.converged is not None else None
+            segment_report.number_of_function_evaluations = int(numerics.get('number_of_function_evaluations',0))
+            segment_report.residual_norm = numerics.get('residual_norm',None)
+            segment_report.iterations  = stages.iterate.calls if 'iterate' in stages else 0
+            segment_report.stages      = stages_report(stages)
+            if tag in self.plans:
+                segment_report.iterate = self.plans[tag].profiling_report()
+            segment_report.analyses    = Data()
+            report.segments[tag]       = segment_report
+            if segment_report.converged is not None:
+                converged              = converged and segment_report.converged
+        report.mission.converged = converged
+
+        for (segment_tag,analysis_tag,name),(calls,total_time) in self.analysis_timers.items():
+            if segment_tag is None:
+                analyses = report.mission.analyses
+            else:
+                analyses = report.segments[segment_tag].analyses
+            add_timer(analyses,analysis_tag,name,calls,total_time)
+            add_timer(report.analyses,analysis_tag,name,calls,total_time)
+
+        return report
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Timed_Step
+# ----------------------------------------------------------------------------------------------------------------------
+class Timed_Step(object):
+    """ RCAIDE.Framework.Mission.Mission_Profiler.Timed_Step()
+
+        A step of a process that records its number of calls and wall time, and the segment being evaluated. The
+        attributes of the step, e.g. the steps of a nested process, are accessed through the timed step.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+    """
+
+    def __init__(self,profiler,step,segment_tag):
+        """This sets the step.
+
+                Assumptions:
+                None
+
+                Source:
+                N/A
+
+                Inputs:
+                profiler     - profiler of the mission                    [Mission_Profiler]
+                step         - step of the process                        [-]
+                segment_tag  - tag of the segment, None for the mission   [string]
+
+                Outputs:
+                None
+
+                Properties Used:
+                N/A
+            """
+        object.__setattr__(self,'step',step)
+        object.__setattr__(self,'profiler',profiler)
+        object.__setattr__(self,'segment_tag',segment_tag)
+        object.__setattr__(self,'calls',0)
+        object.__setattr__(self,'total_time',0.)
+        object.__setattr__(self,'start',None)
+        object.__setattr__(self,'end',None)
+
+    def evaluate(self,*args,**kwarg):
+        """Runs the step and records its wall time.
+
+                Assumptions:
+                None
+
+                Source:
+                N/A
+
+                Inputs:
+                None
+
+                Outputs:
+                Result of the step
+
+                Properties Used:
+                N/A
+            """
+        step     = self.step
+        profiler = self.profiler
+        previous = profiler.current_segment
+        if self.segment_tag is not None:
+            profiler.current_segment = self.segment_tag
+
+        start = time.perf_counter()
+        try:
+            if hasattr(step,'evaluate'):
+                result = step.evaluate(*args,**kwarg)
+            else:
+                result = step(*args,**kwarg)
+        finally:
+            end = time.perf_counter()
+            profiler.current_segment = previous
+            object.__setattr__(self,'calls',self.calls + 1)
+            object.__setattr__(self,'total_time',self.total_time + end - start)
+            if self.start is None:
+                object.__setattr__(self,'start',start)
+            object.__setattr__(self,'end',end)
+
+        return result
+
+    def __call__(self,*args,**kwarg):
+        """This is used to set the class' call behavior to the evaluate function.
+
+                Assumptions:
+                None
+
+                Source:
+                N/A
+
+                Inputs:
+                None
+
+                Outputs:
+                None
+
+                Properties Used:
+                N/A
+            """
+        return self.evaluate(*args,**kwarg)
+
+    def __getattr__(self,key):
+        """Gives access to the attributes of the step.
+
+                Assumptions:
+                None
+
+                Source:
+                N/A
+
+                Inputs:
+                key       - name of the attribute       [string]
+
+                Outputs:
+                attribute of the step
+
+                Properties Used:
+                N/A
+            """
+        if key == 'step':
+            raise AttributeError(key)
+        return getattr(self.step,key)
+
+    def __setattr__(self,key,value):
+        """Sets the attributes of the step, e.g. segment.process.initialize.expand_state.
+
+                Assumptions:
+                None
+
+                Source:
+                N/A
+
+                Inputs:
+                key       - name of the attribute       [string]
+                value     - value of the attribute      [-]
+
+                Outputs:
+                None
+
+                Properties Used:
+                N/A
+            """
+        setattr(self.step,key,value)
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------------------------------------------------------
+def timed_method(profiler,analysis,function,name):
+    """Wraps the initialize or evaluate function of an analysis so that its calls are recorded. Calls made by the
+        analysis on itself while it is timed, e.g. an evaluation in its initialize function, are not recorded.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            profiler  - profiler of the mission                 [Mission_Profiler]
+            analysis  - analysis                                [Analysis]
+            function  - original bound function of the analysis [function]
+            name      - 'initialize' or 'evaluate'              [string]
+
+            Outputs:
+            wrapper   - timed function                          [function]
+
+            Properties Used:
+            N/A
+        """
+    def wrapper(*args,**kwarg):
+        key = id(analysis)
+        if key in profiler.active:
+            return function(*args,**kwarg)
+
+        profiler.active.add(key)
+        start = time.perf_counter()
+        try:
+            return function(*args,**kwarg)
+        finally:
+            profiler.record_analysis(analysis,name,time.perf_counter() - start)
+            profiler.active.discard(key)
+
+    return wrapper
+
+def restore_methods(patched_methods):
+    """Removes the timed functions set on the analyses by instrument_analyses.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            patched_methods  - see Mission_Profiler.instrument_analyses   [list]
+
+            Outputs:
+            None
+
+            Properties Used:
+            N/A
+        """
+    for analysis,name,original,defined in reversed(patched_methods):
+        if defined:
+            object.__setattr__(analysis,name,original)
+        else:
+            object.__delattr__(analysis,name)
+
+    return
+
+def restore_process(process,originals):
+    """Puts back the steps of a process replaced by instrument_process.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            process    - process of the mission or of a segment       [Process]
+            originals  - replaced steps                               [Data]
+
+            Outputs:
+            None
+
+            Properties Used:
+            N/A
+        """
+    for key,step in originals.items():
+        process[key] = step
+
+    return
+
+def stages_report(stages):
+    """Collects the calls and wall times of timed steps.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            stages     - timed steps                    [Data]
+
+            Outputs:
+            report.<stage>.calls, total_time            [-], [s]
+
+            Properties Used:
+            N/A
+        """
+    report = Data()
+    for key,stage in stages.items():
+        report[key]            = Data()
+        report[key].calls      = stage.calls
+        report[key].total_time = stage.total_time
+
+    return report
+
+def add_timer(report,analysis_tag,name,calls,total_time):
+    """Adds the calls and wall time of a function of an analysis to a report.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            report        - report of the analyses      [Data]
+            analysis_tag  - tag of the analysis         [string]
+            name          - name of the function        [string]
+            calls         - number of calls             [-]
+            total_time    - wall time of the calls      [s]
+
+            Outputs:
+            None
+
+            Properties Used:
+            N/A
+        """
+    if analysis_tag not in report:
+        report[analysis_tag] = Data()
+    if name not in report[analysis_tag]:
+        report[analysis_tag][name]            = Data()
+        report[analysis_tag][name].calls      = 0
+        report[analysis_tag][name].total_time = 0.
+    report[analysis_tag][name].calls      += calls
+    report[analysis_tag][name].total_time += total_time
+
+    return
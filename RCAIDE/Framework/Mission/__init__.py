@@ -9,5 +9,6 @@
 # ---------------------------------------------------------------------------------------------------------------------- 
 from .Missions            import Missions
 from .Sequential_Segments import Sequential_Segments 
+from .Mission_Profiler    import Mission_Profiler
 from .                    import Common
 from .                    import Segments 
\ No newline at end of file
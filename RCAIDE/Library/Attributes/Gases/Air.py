@@ -108,7 +108,7 @@ class Air(Gas):
         """   
 
         c = [-7.357e-007, 0.001307, -0.5558, 1074.0]
-        cp = c[0]*T*T*T + c[1]*T*T + c[2]*T + c[3]
+        cp = ((c[0]*T + c[1])*T + c[2])*T + c[3]
 
         return cp
 
@@ -138,7 +138,7 @@ class Air(Gas):
         """     
 
         c = [1.629e-010, -3.588e-007, 0.0001418, 1.386]
-        g = c[0]*T*T*T + c[1]*T*T + c[2]*T + c[3]
+        g = ((c[0]*T + c[1])*T + c[2])*T + c[3]
 
         return g
 
@@ -30,3 +30,28 @@ class Gas(Data):
         self.gas_specific_constant = 0.0              
         self.composition           = Data()
         self.composition.gas       = 1.0
+
+    def compute_thermodynamic_properties(self,T=300.,p=101325.):
+        """Computes the specific heat capacity, ratio of specific heats and specific gas constant
+        of the gas in one call, as needed by the propulsion converters
+
+        Assumptions:
+            R = cp (gamma - 1)/gamma, as in compute_R
+
+        Source:
+            None
+
+        Args:
+            self       : gas                            [unitless]
+            T (float)  : temperature                    [K]
+            p (float)  : pressure                       [Pa]
+
+        Returns:
+            cp (float)    : specific heat capacity      [J/(kg K)]
+            gamma (float) : ratio of specific heats     [unitless]
+            R (float)     : specific gas constant       [J/(kg K)]
+        """
+        cp    = self.compute_cp(T,p)
+        gamma = self.compute_gamma(T,p)
+        R     = ((gamma - 1)/gamma)*cp
+        return cp, gamma, R
@@ -108,6 +108,15 @@ class Rotor(Component):
         self.optimization_parameters.ideal_efficiency                   = 1.0     
         self.optimization_parameters.ideal_figure_of_merit              = 1.0
 
+        # rotor map surrogate, trained once on first use when use_surrogate is True
+        self.use_surrogate                     = False
+        self.training                          = Data()
+        self.training.advance_ratio            = np.linspace(0.0,2.5,26)
+        self.training.tip_mach                 = np.linspace(0.1,0.9,9)
+        self.training.pitch_command            = None                        # defaults to [0] for fixed pitch and +/- 20 degrees for variable pitch rotors
+        self.training.altitude                 = np.array([0.,2500.,5000.]) * Units.m
+        self.surrogates                        = Data()
+
     def append_operating_conditions(rotor,segment,propulsor): 
         energy_conditions       = segment.state.conditions.energy[propulsor.tag]
         noise_conditions        = segment.state.conditions.noise[propulsor.tag]
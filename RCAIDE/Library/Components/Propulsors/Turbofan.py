@@ -7,7 +7,7 @@
 #  IMPORT
 # ---------------------------------------------------------------------------------------------------------------------- 
  # RCAIDE imports  
-from RCAIDE.Framework.Core      import Container
+from RCAIDE.Framework.Core      import Container, Data
 from .                          import Propulsor
 from RCAIDE.Library.Methods.Propulsors.Turbofan_Propulsor.append_turbofan_conditions     import append_turbofan_conditions 
 from RCAIDE.Library.Methods.Propulsors.Turbofan_Propulsor.compute_turbofan_performance   import compute_turbofan_performance, reuse_stored_turbofan_data
@@ -57,6 +57,10 @@ class Turbofan(Propulsor):
         self.design_thrust                            = 0.0
         self.mass_flow_rate_design                    = 0.0
         self.OpenVSP_flow_through                     = False
+
+        # engine deck, generated on first use when use_engine_deck is True, see generate_engine_deck
+        self.use_engine_deck                          = False
+        self.engine_deck                              = Data()
     
     def append_operating_conditions(self,segment):
         append_turbofan_conditions(self,segment)
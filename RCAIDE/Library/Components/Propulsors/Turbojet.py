@@ -53,6 +53,10 @@ class Turbojet(Propulsor):
         self.mass_flow_rate_design                    = 0.0 
         self.OpenVSP_flow_through                     = False
 
+        # engine deck, generated on first use when use_engine_deck is True, see generate_engine_deck
+        self.use_engine_deck                          = False
+        self.engine_deck                              = Data()
+
         #areas needed for drag; not in there yet
         self.areas                                    = Data()
         self.areas.wetted                             = 0.0
@@ -7,6 +7,7 @@
 #  IMPORT
 # ---------------------------------------------------------------------------------------------------------------------- 
  # RCAIDE imports   
+from RCAIDE.Framework.Core      import Data
 from .                          import Propulsor
 from RCAIDE.Library.Methods.Propulsors.Turboprop_Propulsor.append_turboprop_conditions     import append_turboprop_conditions 
 from RCAIDE.Library.Methods.Propulsors.Turboprop_Propulsor.compute_turboprop_performance   import compute_turboprop_performance, reuse_stored_turboprop_data
@@ -41,7 +42,11 @@ class Turboprop(Propulsor):
         self.design_mach_number                       = 0.0
         self.compressor_nondimensional_massflow       = 0.0
         self.reference_temperature                    = 288.15
-        self.reference_pressure                       = 1.01325*10**5  
+        self.reference_pressure                       = 1.01325*10**5
+
+        # engine deck, generated on first use when use_engine_deck is True, see generate_engine_deck
+        self.use_engine_deck                          = False
+        self.engine_deck                              = Data()
     
     def append_operating_conditions(self,segment):
         append_turboprop_conditions(self,segment)
@@ -55,6 +55,10 @@ class Turboshaft(Propulsor):
         self.conversion_efficiency                            = 0.5
         self.compressor_nondimensional_massflow               = 0.0
         self.OpenVSP_flow_through                             = False
+
+        # engine deck, generated on first use when use_engine_deck is True, see generate_engine_deck
+        self.use_engine_deck                                  = False
+        self.engine_deck                                      = Data()
                                                               
         #areas needed for drag; not in there yet              
         self.areas                                            = Data()
@@ -10,6 +10,7 @@
 
 from .aero_coeff             import aero_coeff    
 from .airfoil_analysis       import airfoil_analysis 
+from .memoized_airfoil_analysis import memoized_airfoil_analysis, clear_airfoil_analysis_cache
 from .heads_method           import heads_method       
 from .hess_smith             import hess_smith               
 from .infl_coeff             import infl_coeff       
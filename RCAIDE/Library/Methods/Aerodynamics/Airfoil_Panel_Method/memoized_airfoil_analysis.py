@@ -0,0 +1,104 @@
+# RCAIDE/Methods/Aerodynamics/Airfoil_Panel_Method/memoized_airfoil_analysis.py
+# 
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+from RCAIDE.Framework.Core import Data
+from .airfoil_analysis     import airfoil_analysis
+
+# pacakge imports
+from collections import OrderedDict
+import numpy as np
+
+# process-wide store of single-case airfoil analysis results, least recently used entries first
+airfoil_analysis_cache = OrderedDict()
+
+# ----------------------------------------------------------------------------------------------------------------------
+# memoized_airfoil_analysis.py
+# ----------------------------------------------------------------------------------------------------------------------
+def memoized_airfoil_analysis(airfoil_geometry,alpha,Re_L,alpha_resolution = 1E-5,Re_resolution = 1E-4,cache_size = 10000,
+                              initial_momentum_thickness=1E-5,tolerance = 1E0,H_wake = 1.05,Ue_wake = 0.99):
+    """This returns the results of airfoil_analysis, only running the panel and boundary layer solvers for
+    (angle of attack, Reynolds number) pairs that have not already been computed for the same airfoil geometry
+
+    Assumptions:
+    Each case of airfoil_analysis is independent of the others. Angles of attack are quantized to multiples of
+    alpha_resolution and Reynolds numbers to multiples of Re_resolution in log10(Re). Each new case is solved at the
+    center of its quantization bin so that results do not depend on the order in which cases are requested. When
+    the cache holds more than cache_size cases, the least recently used cases are evicted.
+
+    Source:
+    None
+
+    Inputs:
+    airfoil_geometry            - airfoil geometry points                                          [unitless]
+    alpha                       - angle of attacks, size (1, number of cases)                      [radians]
+    Re_L                        - Reynolds numbers, size (1, number of cases)                      [unitless]
+    alpha_resolution            - quantization of angle of attack                                  [radians]
+    Re_resolution               - quantization of log10 of Reynolds number                         [unitless]
+    cache_size                  - maximum number of cases kept in the cache                        [unitless]
+    initial_momentum_thickness, tolerance, H_wake, Ue_wake - see airfoil_analysis
+
+    Outputs:
+    airfoil_properties          - see airfoil_analysis                                             [None]
+
+    Properties Used:
+    N/A
+    """
+    alpha_vals   = np.atleast_2d(alpha)[0]
+    Re_vals      = np.atleast_2d(Re_L)[0]
+    q_alpha      = np.round(alpha_vals/alpha_resolution).astype(np.int64)
+    q_Re         = np.round(np.log10(np.maximum(Re_vals,1.))/Re_resolution).astype(np.int64)
+    geometry_key = hash((airfoil_geometry.x_coordinates.tobytes(),airfoil_geometry.y_coordinates.tobytes(),
+                         alpha_resolution,Re_resolution,initial_momentum_thickness,tolerance,H_wake,Ue_wake))
+    keys         = [(geometry_key,a,r) for a,r in zip(q_alpha,q_Re)]
+
+    # solve all cases missing from the cache in one batch
+    missing      = [key for key in dict.fromkeys(keys) if key not in airfoil_analysis_cache]
+    if len(missing) > 0:
+        alpha_new  = np.array([[key[1]*alpha_resolution for key in missing]])
+        Re_new     = np.array([[10**(key[2]*Re_resolution) for key in missing]])
+        results    = airfoil_analysis(airfoil_geometry,alpha_new,Re_new,initial_momentum_thickness,tolerance,H_wake,Ue_wake)
+        for i,key in enumerate(missing):
+            airfoil_analysis_cache[key] = dict((name,np.take(value,i,axis=1)) for name,value in results.items())
+
+    # assemble results in the order requested, cases are stored along the second axis
+    cases              = [airfoil_analysis_cache[key] for key in keys]
+    airfoil_properties = Data()
+    for name in cases[0].keys():
+        airfoil_properties[name] = np.stack([case[name] for case in cases],axis=1)
+
+    # evict least recently used cases
+    for key in keys:
+        airfoil_analysis_cache.move_to_end(key)
+    while len(airfoil_analysis_cache) > cache_size:
+        airfoil_analysis_cache.popitem(last=False)
+
+    return airfoil_properties
+
+# ----------------------------------------------------------------------------------------------------------------------
+# clear_airfoil_analysis_cache
+# ----------------------------------------------------------------------------------------------------------------------
+def clear_airfoil_analysis_cache():
+    """This removes all memoized airfoil analysis results
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    None
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+    airfoil_analysis_cache.clear()
+
+    return
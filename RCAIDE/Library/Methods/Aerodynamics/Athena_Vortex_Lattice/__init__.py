@@ -9,6 +9,7 @@ from .create_avl_datastructures import translate_avl_wing, translate_avl_body ,
 from .purge_files               import purge_files
 from .read_results              import read_results
 from .run_AVL_analysis          import run_AVL_analysis
+from .run_AVL_batch             import run_AVL_batch
 from .translate_data            import translate_conditions_to_cases, translate_results_to_conditions
 from .write_geometry            import write_geometry
 from .write_mass_file           import write_mass_file
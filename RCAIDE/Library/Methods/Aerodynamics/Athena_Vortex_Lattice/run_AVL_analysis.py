@@ -59,9 +59,60 @@ def run_AVL_analysis(aerodynamics,run_conditions):
     """           
     
     # unpack
-    trim_aircraft                    = aerodynamics.settings.trim_aircraft
     run_folder                       = os.path.abspath(aerodynamics.settings.filenames.run_folder)
     run_script_path                  = run_folder.rstrip('avl_files').rstrip('/')   
+    print_output                     = aerodynamics.settings.print_output 
+
+    # set up the run cases
+    cases, control_surfaces          = setup_AVL_cases(aerodynamics,run_conditions)
+    
+    # write the input files
+    with redirect.folder(run_folder,force=False):
+        write_AVL_inputs(aerodynamics,run_conditions,run_script_path,control_surfaces)
+
+        # RUN AVL! 
+        exit_status = call_avl(aerodynamics,print_output)
+        results_avl = read_results(aerodynamics)
+        
+    # translate results
+    translate_results_to_conditions(cases,run_conditions,results_avl) 
+
+    if not aerodynamics.settings.keep_files:
+        rmtree( run_folder )
+        
+    return 
+
+
+def setup_AVL_cases(aerodynamics,run_conditions):
+    """Translates the conditions of a run to AVL run cases, and sets the batch and deck files and the result files 
+    of the cases of the run.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    aerodynamics   <RCAIDE data type> AVL analysis 
+    run_conditions <RCAIDE data type> aerodynamic conditions 
+
+    Outputs:
+    cases            run cases                                     [Run_Case.Container]
+    control_surfaces flag of a vehicle with control surfaces       [boolean]
+
+    Properties Used:
+    aerodynamics.settings.filenames.
+      output_template
+      batch_template
+      deck_template
+    aerodynamics.current_status.
+      batch_index
+      batch_file
+      deck_file
+      cases
+    """
+    # unpack
     aero_results_template_1          = aerodynamics.settings.filenames.aero_output_template_1       # 'stability_axis_derivatives_{}.dat' 
     aero_results_template_2          = aerodynamics.settings.filenames.aero_output_template_2       # 'surface_forces_{}.dat'
     aero_results_template_3          = aerodynamics.settings.filenames.aero_output_template_3       # 'strip_forces_{}.dat'      
@@ -70,7 +121,6 @@ def run_AVL_analysis(aerodynamics,run_conditions):
     dynamic_results_template_2       = aerodynamics.settings.filenames.dynamic_output_template_2    # 'system_matrix_{}.dat'
     batch_template                   = aerodynamics.settings.filenames.batch_template
     deck_template                    = aerodynamics.settings.filenames.deck_template 
-    print_output                     = aerodynamics.settings.print_output 
 
     # rename defaul avl aircraft tag
     aerodynamics.tag                         = 'avl_analysis_of_{}'.format(aerodynamics.vehicle.tag) 
@@ -125,24 +175,37 @@ def run_AVL_analysis(aerodynamics,run_conditions):
         case.eigen_result_filename_1    = dynamic_results_template_1.format(case.tag)     # 'eigen_mode_{}.dat'
         case.eigen_result_filename_2    = dynamic_results_template_2.format(case.tag)     # 'system_matrix_{}.dat'
     
-    # write the input files
-    with redirect.folder(run_folder,force=False):
-        write_geometry(aerodynamics,run_script_path)
-        write_mass_file(aerodynamics,run_conditions)
-        write_run_cases(aerodynamics,trim_aircraft)
-        write_input_deck(aerodynamics, trim_aircraft,control_surfaces)
+    return cases, control_surfaces
 
-        # RUN AVL! 
-        exit_status = call_avl(aerodynamics,print_output)
-        results_avl = read_results(aerodynamics)
-        
-    # translate results
-    translate_results_to_conditions(cases,run_conditions,results_avl) 
+def write_AVL_inputs(aerodynamics,run_conditions,run_script_path,control_surfaces):
+    """Writes the geometry, mass, run case and input deck files of the current run in the working directory.
 
-    if not aerodynamics.settings.keep_files:
-        rmtree( run_folder )
-        
-    return 
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    aerodynamics     <RCAIDE data type> AVL analysis 
+    run_conditions   <RCAIDE data type> aerodynamic conditions 
+    run_script_path  path of the folder of the run folder               [string]
+    control_surfaces flag of a vehicle with control surfaces            [boolean]
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+    trim_aircraft = aerodynamics.settings.trim_aircraft
+    
+    write_geometry(aerodynamics,run_script_path)
+    write_mass_file(aerodynamics,run_conditions)
+    write_run_cases(aerodynamics,trim_aircraft)
+    write_input_deck(aerodynamics,trim_aircraft,control_surfaces)
+    
+    return
  
 def call_avl(avl_object,print_output):
     """ This function calls the AVL executable and executes analyses
@@ -169,7 +232,7 @@ def call_avl(avl_object,print_output):
             purge_files(log_file)
         if isinstance(err_file,str):
             purge_files(err_file)
-        avl_call = avl_object.settings.filenames.avl_bin_name
+        avl_call = avl_command(avl_object)
         geometry = avl_object.settings.filenames.features
         in_deck  = avl_object.current_status.deck_file  
     
@@ -185,7 +248,7 @@ def call_avl(avl_object,print_output):
                     sys.stdout = devnull       
                     
                 # Run AVL
-                avl_run = subprocess.Popen([avl_call,geometry],stdout=sys.stdout,stderr=sys.stderr,stdin=subprocess.PIPE)
+                avl_run = subprocess.Popen(avl_call + [geometry],stdout=sys.stdout,stderr=sys.stderr,stdin=subprocess.PIPE)
                 for line in commands:
                     avl_run.stdin.write(line.encode('utf-8'))
                     avl_run.stdin.flush()
@@ -201,3 +264,26 @@ def call_avl(avl_object,print_output):
 
     return exit_status
 
+def avl_command(avl_object):
+    """ Returns the command that launches AVL. The executable is settings.filenames.avl_bin_name, which can also 
+    be a list, e.g. to run a script standing in for the AVL binary with a given interpreter.
+    
+    Assumptions:
+        None
+        
+    Source:
+        None
+    Inputs:
+        avl_object
+    Outputs:
+        command      [list of strings]
+    Properties Used:
+        N/A
+    """
+    avl_call = avl_object.settings.filenames.avl_bin_name
+    if isinstance(avl_call,str):
+        command = [avl_call]
+    else:
+        command = list(avl_call)
+        
+    return command
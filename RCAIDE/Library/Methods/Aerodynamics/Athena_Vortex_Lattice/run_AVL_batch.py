@@ -0,0 +1,171 @@
+# RCAIDE/Library/Methods/Aerodynamics/Athena_Vortex_Lattice/run_AVL_batch.py
+#
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+
+# RCAIDE imports
+from RCAIDE.Framework.Core                                                        import Data, redirect
+from RCAIDE.Library.Methods.Aerodynamics.Athena_Vortex_Lattice.read_results       import read_results
+from RCAIDE.Library.Methods.Aerodynamics.Athena_Vortex_Lattice.translate_data     import translate_results_to_conditions
+from RCAIDE.Library.Methods.Aerodynamics.Athena_Vortex_Lattice.run_AVL_analysis   import run_AVL_analysis, setup_AVL_cases, write_AVL_inputs, avl_command
+
+# package imports
+import os
+import time
+import tempfile
+import subprocess
+from shutil import rmtree
+
+# ----------------------------------------------------------------------------------------------------------------------
+# run_AVL_batch
+# ----------------------------------------------------------------------------------------------------------------------
+def run_AVL_batch(aerodynamics,run_conditions,number_of_processes = None):
+    """Runs AVL on several groups of conditions at once. Each group is written to its own temporary folder in the
+    run folder and solved by its own AVL process, up to number_of_processes processes running at the same time. The
+    results of a group are read as soon as its process finishes.
+
+    Assumptions:
+    The groups are independent. With settings.regression_flag, the groups are run one after the other with
+    run_AVL_analysis.
+
+    Source:
+    N/A
+
+    Inputs:
+    aerodynamics        <RCAIDE data type> AVL analysis
+    run_conditions      list of <RCAIDE data type> aerodynamic conditions, one AVL run per entry
+    number_of_processes maximum number of AVL processes, all the available processors if None      [-]
+
+    Outputs:
+    None, the results are written in the conditions as in run_AVL_analysis
+
+    Properties Used:
+    aerodynamics.settings.filenames.
+      avl_bin_name
+      run_folder
+      log_filename
+      err_filename
+    aerodynamics.settings.keep_files
+    """
+    if aerodynamics.settings.regression_flag:
+        for conditions in run_conditions:
+            run_AVL_analysis(aerodynamics,conditions)
+        return
+
+    # unpack
+    run_folder      = os.path.abspath(aerodynamics.settings.filenames.run_folder)
+    run_script_path = run_folder.rstrip('avl_files').rstrip('/')
+    keep_files      = aerodynamics.settings.keep_files
+    workers         = number_of_processes if number_of_processes is not None else os.cpu_count()
+    if not os.path.exists(run_folder):
+        os.makedirs(run_folder)
+
+    # write the input files of each group in its own folder
+    runs = []
+    for conditions in run_conditions:
+        cases, control_surfaces = setup_AVL_cases(aerodynamics,conditions)
+        run                     = Data()
+        run.conditions          = conditions
+        run.cases               = cases
+        run.deck_file           = aerodynamics.current_status.deck_file
+        run.folder              = tempfile.mkdtemp(prefix = 'batch_{0:04d}_'.format(aerodynamics.current_status.batch_index),dir = run_folder)
+        run.process             = None
+        with redirect.folder(run.folder,force=False):
+            write_AVL_inputs(aerodynamics,conditions,run_script_path,control_surfaces)
+        runs.append(run)
+
+    # run AVL
+    pending = list(runs)
+    running = []
+    try:
+        while len(pending) > 0 or len(running) > 0:
+            while len(pending) > 0 and len(running) < workers:
+                run = pending.pop(0)
+                launch_avl(aerodynamics,run)
+                running.append(run)
+
+            finished = [run for run in running if run.process.poll() is not None]
+            running  = [run for run in running if run.process.returncode is None]
+            if len(finished) == 0:
+                time.sleep(0.01)
+                continue
+
+            for run in finished:
+                close_files(run)
+
+                # read and translate the results
+                aerodynamics.current_status.cases = run.cases
+                with redirect.folder(run.folder,force=False):
+                    results_avl = read_results(aerodynamics)
+                translate_results_to_conditions(run.cases,run.conditions,results_avl)
+
+                if not keep_files:
+                    rmtree(run.folder)
+    finally:
+        for run in running:
+            run.process.kill()
+            run.process.wait()
+            close_files(run)
+
+    if not keep_files:
+        rmtree(run_folder)
+
+    return
+
+def launch_avl(aerodynamics,run):
+    """Starts the AVL process of a group of run cases in its folder. The input deck is sent to the standard input of
+    AVL and its output is written to the log and error files of the folder.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    aerodynamics  <RCAIDE data type> AVL analysis
+    run.folder    folder of the group                                   [string]
+    run.deck_file input deck of the group                               [string]
+
+    Outputs:
+    run.process   AVL process                                           [subprocess.Popen]
+
+    Properties Used:
+    N/A
+    """
+    filenames  = aerodynamics.settings.filenames
+    log_file   = filenames.log_filename if isinstance(filenames.log_filename,str) else os.devnull
+    err_file   = filenames.err_filename if isinstance(filenames.err_filename,str) else os.devnull
+    run.files  = [open(os.path.join(run.folder,run.deck_file),'r'),
+                  open(os.path.join(run.folder,log_file),'w'),
+                  open(os.path.join(run.folder,err_file),'w')]
+    run.process = subprocess.Popen(avl_command(aerodynamics) + [filenames.features],cwd=run.folder,
+                                   stdin=run.files[0],stdout=run.files[1],stderr=run.files[2])
+
+    return
+
+def close_files(run):
+    """Closes the input deck, log and error files of a group of run cases.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    run.files     open files of the group                               [list]
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+    for f in run.files:
+        f.close()
+    run.files = []
+
+    return
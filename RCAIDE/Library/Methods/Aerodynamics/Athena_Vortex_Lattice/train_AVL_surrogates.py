@@ -6,13 +6,26 @@
 
 # RCAIDE imports
 import RCAIDE 
+from RCAIDE.Framework.Core                                                       import Data, redirect
 from RCAIDE.Framework.Mission.Common                                             import Results  
-from RCAIDE.Library.Methods.Aerodynamics.Athena_Vortex_Lattice.run_AVL_analysis  import run_AVL_analysis  
+from RCAIDE.Library.Methods.Aerodynamics.Athena_Vortex_Lattice.run_AVL_batch     import run_AVL_batch  
+from RCAIDE.Library.Methods.Aerodynamics.Athena_Vortex_Lattice.run_AVL_analysis  import setup_AVL_cases, write_AVL_inputs, avl_command
+from RCAIDE.Library.Methods.Aerodynamics.Athena_Vortex_Lattice.read_results      import read_results
+from RCAIDE.Library.Methods.Aerodynamics.Athena_Vortex_Lattice.translate_data    import translate_results_to_conditions
  
 # Package imports 
 import os
+import sys
+import hashlib
+import tempfile
 import numpy as np
-from shutil import rmtree    
+from shutil import rmtree, which
+
+# hash of the source of the modules reading the AVL results, computed once per process and part of every cache key
+source_code_hash = []
+
+# training coefficients stored in the cache, in the order of training.coefficients
+training_coefficients = ['CL','CD','e','CM','Cm_alpha','Cn_beta','NP']
 
 # ----------------------------------------------------------------------------------------------------------------------
 #  train_AVL_surrogates
@@ -21,7 +34,10 @@ def train_AVL_surrogates(aerodynamics):
     """Call methods to run VLM for sample point evaluation. 
     
     Assumptions:
-        None
+        With settings.use_training_cache, the AVL results of each Mach number are stored in
+        settings.training_cache_directory under a hash of the geometry, mass, run case and input deck files written
+        for it and of the AVL executable, and are read back instead of running AVL when the same files are written
+        again for the same executable. The cache is not used with settings.regression_flag.
         
     Source:
         None
@@ -60,6 +76,7 @@ def train_AVL_surrogates(aerodynamics):
         if not aerodynamics.settings.regression_flag:
             rmtree(run_folder)
 
+    Mach_conditions = []
     for i,_ in enumerate(Mach):
         # Set training conditions
         run_conditions = Results()
@@ -78,16 +95,43 @@ def train_AVL_surrogates(aerodynamics):
             run_conditions.aerodynamics.coefficients.lift.total= np.array([lift_coefficient]).T  
         run_conditions.static_stability.coefficients.pitch = np.ones_like(run_conditions.aerodynamics.angles.alpha)*pitch_rate_coefficient 
 
-        # Run Analysis at AoA[i] and Mach[i]
-        run_AVL_analysis(aerodynamics,run_conditions)
+        Mach_conditions.append(run_conditions)
+
+    # Look up the Mach numbers already run with the same inputs
+    use_cache   = aerodynamics.settings.use_training_cache and not aerodynamics.settings.regression_flag
+    cache_files = [None]*len_Mach
+    cached      = [None]*len_Mach
+    if use_cache:
+        cache_directory = aerodynamics.settings.training_cache_directory
+        if cache_directory is None:
+            raise ValueError('settings.training_cache_directory must be given to use the AVL training cache')
+        for i,run_conditions in enumerate(Mach_conditions):
+            cache_files[i] = os.path.join(cache_directory,AVL_training_key(aerodynamics,run_conditions) + '.npz')
+            if os.path.isfile(cache_files[i]):
+                try:
+                    cached[i] = load_AVL_training_data(cache_files[i],len_AoA)
+                except (OSError,ValueError,KeyError):
+                    cached[i] = None
+
+    # Run Analysis at all AoA of the other Mach numbers, one AVL process per Mach number
+    new_runs = [i for i in range(len_Mach) if cached[i] is None]
+    if len(new_runs) > 0:
+        run_AVL_batch(aerodynamics,[Mach_conditions[i] for i in new_runs],aerodynamics.settings.number_of_processes)
  
-        CL[:,i]       = run_conditions.aerodynamics.coefficients.lift.total[:,0]
-        CD[:,i]       = run_conditions.aerodynamics.coefficients.drag.induced.total[:,0]      
-        e [:,i]       = run_conditions.aerodynamics.coefficients.drag.induced.efficiency_factor[:,0]   
-        CM[:,i]       = run_conditions.static_stability.coefficients.pitch[:,0]
-        Cm_alpha[:,i] = run_conditions.static_stability.derivatives.CM_alpha[:,0]
-        Cn_beta[:,i]  = run_conditions.static_stability.derivatives.CN_beta[:,0]
-        NP[:,i]       = run_conditions.static_stability.neutral_point[:,0]     
+    for i,run_conditions in enumerate(Mach_conditions):
+        if cached[i] is None:
+            Mach_data = extract_AVL_training_data(run_conditions)
+            if use_cache:
+                save_AVL_training_data(Mach_data,cache_files[i])
+        else:
+            Mach_data = cached[i]
+        CL[:,i]       = Mach_data.CL
+        CD[:,i]       = Mach_data.CD
+        e [:,i]       = Mach_data.e
+        CM[:,i]       = Mach_data.CM
+        Cm_alpha[:,i] = Mach_data.Cm_alpha
+        Cn_beta[:,i]  = Mach_data.Cn_beta
+        NP[:,i]       = Mach_data.NP
 
     if aerodynamics.training_file:
         # load data 
@@ -137,3 +181,143 @@ def train_AVL_surrogates(aerodynamics):
     # Store training data
     training.coefficients = training_data
     
+
+def extract_AVL_training_data(run_conditions):
+    """Collects the training coefficients of the AVL results of one Mach number.
+    
+    Assumptions:
+        None
+        
+    Source:
+        None
+
+    Args:
+        run_conditions     : aerodynamic conditions of one Mach number, with the AVL results   [unitless]
+        
+    Returns: 
+        Mach_data          : training coefficients at each angle of attack                      [unitless]
+    """ 
+    Mach_data          = Data()
+    Mach_data.CL       = run_conditions.aerodynamics.coefficients.lift.total[:,0]
+    Mach_data.CD       = run_conditions.aerodynamics.coefficients.drag.induced.total[:,0]      
+    Mach_data.e        = run_conditions.aerodynamics.coefficients.drag.induced.efficiency_factor[:,0]   
+    Mach_data.CM       = run_conditions.static_stability.coefficients.pitch[:,0]
+    Mach_data.Cm_alpha = run_conditions.static_stability.derivatives.CM_alpha[:,0]
+    Mach_data.Cn_beta  = run_conditions.static_stability.derivatives.CN_beta[:,0]
+    Mach_data.NP       = run_conditions.static_stability.neutral_point[:,0]     
+    
+    return Mach_data
+
+def AVL_training_key(aerodynamics,run_conditions):
+    """Computes the cache key of the AVL results of one Mach number. The geometry, mass, run case and input deck
+    files of the run are written in a temporary folder and hashed, after replacing the names that depend on the
+    batch index, together with the source of the modules reading the results and the AVL command: the path,
+    modification time and size of the executable, and its arguments.
+    
+    Assumptions:
+        AVL gives the same results for the same input files and executable. The batch index of the analysis is not
+        changed.
+        
+    Source:
+        None
+
+    Args:
+        aerodynamics       : AVL analysis                                    [unitless]
+        run_conditions     : aerodynamic conditions of one Mach number       [unitless]
+        
+    Returns: 
+        key                : hexadecimal hash                                [string]
+    """ 
+    if not source_code_hash:
+        source_hash = hashlib.sha1()
+        for module in [__name__, read_results.__module__, translate_results_to_conditions.__module__]:
+            with open(sys.modules[module].__file__,'rb') as source:
+                source_hash.update(source.read())
+        source_code_hash.append(source_hash.hexdigest())
+
+    status                  = aerodynamics.current_status
+    batch_index             = status.batch_index
+    run_folder              = os.path.abspath(aerodynamics.settings.filenames.run_folder)
+    run_script_path         = run_folder.rstrip('avl_files').rstrip('/')
+    cases, control_surfaces = setup_AVL_cases(aerodynamics,run_conditions)
+    names                   = [(status.batch_file,'batch'),(status.deck_file,'deck')] + \
+                              [(case.tag,'case_{}'.format(i)) for i,case in enumerate(cases)]
+    
+    key_hash   = hashlib.sha1(source_code_hash[0].encode())
+    command    = avl_command(aerodynamics)
+    executable = which(command[0])
+    if executable is None:
+        key_hash.update(repr(command).encode())
+    else:
+        stat = os.stat(executable)
+        key_hash.update(repr([os.path.abspath(executable)] + command[1:] + [stat.st_mtime_ns,stat.st_size]).encode())
+    with tempfile.TemporaryDirectory() as folder:
+        with redirect.folder(folder,force=False):
+            write_AVL_inputs(aerodynamics,run_conditions,run_script_path,control_surfaces)
+        for file_name in [aerodynamics.settings.filenames.features,aerodynamics.settings.filenames.mass_file,
+                          status.batch_file,status.deck_file]:
+            with open(os.path.join(folder,file_name),'r') as f:
+                text = f.read()
+            for name,replacement in names:
+                text = text.replace(name,replacement)
+            key_hash.update(text.encode())
+    status.batch_index = batch_index
+    
+    return key_hash.hexdigest()
+
+def save_AVL_training_data(Mach_data,cache_file):
+    """Writes the training coefficients of one Mach number to a cache file. The file is written under a temporary
+    name and then renamed so that other processes never read a partial file.
+    
+    Assumptions:
+        Failure to write the cache file is ignored
+        
+    Source:
+        None
+
+    Args:
+        Mach_data          : training coefficients at each angle of attack   [unitless]
+        cache_file         : path of the cache file                          [string]
+        
+    Returns: 
+        None
+    """ 
+    arrays = {}
+    for key in training_coefficients:
+        arrays[key] = np.asarray(Mach_data[key])
+    
+    try:
+        os.makedirs(os.path.dirname(cache_file),exist_ok=True)
+        partial_file = cache_file + '.' + str(os.getpid()) + '.tmp'
+        with open(partial_file,'wb') as f:
+            np.savez(f,**arrays)
+        os.replace(partial_file,cache_file)
+    except OSError:
+        pass
+    
+    return 
+
+def load_AVL_training_data(cache_file,len_AoA):
+    """Reads the training coefficients of one Mach number from a cache file.
+    
+    Assumptions:
+        None
+        
+    Source:
+        None
+
+    Args:
+        cache_file         : path of the cache file                          [string]
+        len_AoA            : number of angles of attack                      [unitless]
+        
+    Returns: 
+        Mach_data          : training coefficients at each angle of attack   [unitless]
+    """ 
+    Mach_data = Data()
+    with np.load(cache_file,allow_pickle=False) as arrays:
+        for key in training_coefficients:
+            Mach_data[key] = arrays[key]
+            if Mach_data[key].shape != (len_AoA,):
+                raise ValueError('cached training data of the wrong size')
+    
+    return Mach_data
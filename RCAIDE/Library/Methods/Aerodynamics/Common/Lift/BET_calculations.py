@@ -7,7 +7,7 @@
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------   
  
-from RCAIDE.Framework.Core import interp2d 
+from RCAIDE.Framework.Core import Data
 
 # package imports 
 import numpy as np
@@ -15,17 +15,17 @@ import numpy as np
 # ----------------------------------------------------------------------------------------------------------------------
 #  compute_airfoil_aerodynamics
 # ----------------------------------------------------------------------------------------------------------------------   
-def compute_airfoil_aerodynamics(beta,c,r,R,B,Wa,Wt,a,nu,airfoils,a_loc,ctrl_pts,Nr,Na,tc,use_2d_analysis):
+def compute_airfoil_aerodynamics(beta,c,r,R,B,Wa,Wt,a,nu,polar_table,ctrl_pts,Nr,Na,tc,use_2d_analysis):
     """
     Cl, Cdval = compute_airfoil_aerodynamics( beta,c,r,R,B,
                                               Wa,Wt,a,nu,
-                                              airfoils,a_loc
+                                              polar_table,
                                               ctrl_pts,Nr,Na,tc,use_2d_analysis )
 
     Computes the aerodynamic forces at sectional blade locations. If airfoil
     geometry and locations are specified, the forces are computed using the
-    airfoil polar lift and drag surrogates, accounting for the local Reynolds
-    number and local angle of attack.
+    airfoil polar table of the rotor, see build_airfoil_polar_table, accounting 
+    for the local Reynolds number and local angle of attack.
 
     If the airfoils are not specified, an approximation is used.
 
@@ -46,7 +46,7 @@ def compute_airfoil_aerodynamics(beta,c,r,R,B,Wa,Wt,a,nu,airfoils,a_loc,ctrl_pts
        Wt                         tangential velocity                             [-]
        a                          speed of sound                                  [-]
        nu                         viscosity                                       [-]
-       airfoil_data               Data structure of airfoil polar information     [-]
+       polar_table                airfoil polar table of the rotor, or None       [-]
        ctrl_pts                   Number of control points                        [-]
        Nr                         Number of radial blade sections                 [-]
        Na                         Number of azimuthal blade stations              [-]
@@ -65,35 +65,14 @@ def compute_airfoil_aerodynamics(beta,c,r,R,B,Wa,Wt,a,nu,airfoils,a_loc,ctrl_pts
     Re       = (W*c)/nu
 
     # If rotor airfoils are defined, use airfoil surrogate
-    a_loc = np.array(a_loc)
-    if np.any(a_loc) != None:  
-        # Compute blade Cl and Cd distribution from the airfoil data 
+    if polar_table is not None:  
+        # Compute blade Cl and Cd distribution from the prebuilt airfoil polar table, 
+        # returns the 2D Cl and CDval of shape (ctrl_pts, Nr, Na) or the 1D Cl and CDval of shape (ctrl_pts, Nr)
+        Cl, Cdval   = interpolate_airfoil_polar_table(polar_table,Re,alpha)
         if use_2d_analysis:
-            # return the 2D Cl and CDval of shape (ctrl_pts, Nr, Na)
-            Cl         = np.zeros((ctrl_pts,Nr,Na))
-            Cdval      = np.zeros((ctrl_pts,Nr,Na))
-            
-            for jj,airfoil in enumerate(airfoils):
-                pd                   = airfoil.polars
-                Cl_af                = interp2d(Re,alpha,pd.reynolds_numbers, pd.angle_of_attacks, pd.lift_coefficients) 
-                Cdval_af             = interp2d(Re,alpha,pd.reynolds_numbers, pd.angle_of_attacks, pd.drag_coefficients)
-                locs                 = np.where(np.array(a_loc) == jj )
-                Cl[:,locs,:]         = Cl_af[:,locs,:]
-                Cdval[:,locs,:]      = Cdval_af[:,locs,:]
             alpha_disc           = alpha
             Re_disc              = Re
         else:
-            # return the 1D Cl and CDval of shape (ctrl_pts, Nr)
-            Cl         = np.zeros((ctrl_pts,Nr))
-            Cdval      = np.zeros((ctrl_pts,Nr))             
-
-            for jj,airfoil in enumerate(airfoils):
-                pd                   = airfoil.polars
-                Cl_af                = interp2d(Re,alpha,pd.reynolds_numbers, pd.angle_of_attacks, pd.lift_coefficients)
-                Cdval_af             = interp2d(Re,alpha,pd.reynolds_numbers, pd.angle_of_attacks, pd.drag_coefficients)
-                locs                 = np.where(np.array(a_loc) == jj )
-                Cl[:,locs]           = Cl_af[:,locs]
-                Cdval[:,locs]        = Cdval_af[:,locs] 
             alpha_disc = np.tile(alpha[:,:, None], (1, 1, Na)) 
             Re_disc    = np.tile(Re[:,:, None], (1, 1, Na))  
 
@@ -167,4 +146,174 @@ def compute_inflow_and_tip_loss(r,R,Wa,Wt,B,et1=1,et2=1,et3=1):
     piece = np.exp(-tipfactor)
     Ftip  = 2.*np.arccos(piece)/np.pi  
 
-    return lamdaw, Ftip, piece
\ No newline at end of file
+    return lamdaw, Ftip, piece
+# ----------------------------------------------------------------------------------------------------------------------
+#  build_airfoil_polar_table
+# ----------------------------------------------------------------------------------------------------------------------    
+def build_airfoil_polar_table(airfoils,a_loc):
+    """
+    Builds the polar interpolation table of a set of rotor airfoils. Airfoils that share Reynolds number and 
+    angle of attack axes are stacked in one group, and the lift and drag coefficients are stored side by side so
+    that both are interpolated with the same indices and weights. The radial stations of each group and their
+    airfoil within the group are precomputed from the airfoil polar stations. The table is built once per rotor
+    evaluation, before the inflow is solved, so that it follows changes of the polars.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+       airfoils   data structure of rotor airfoils                                      [-]
+       a_loc      index of the airfoil of each radial blade station                     [-]
+       
+    Outputs:               
+       table      None if the airfoil polar stations of the rotor are not defined       [-]
+       table.groups[i].
+          reynolds_numbers   Reynolds number axis                                       [-]
+          angle_of_attacks   angle of attack axis                                       [rad]
+          coefficients       lift and drag coefficients, (airfoil, Re, AoA, 2)          [-]
+          stations           radial stations using the airfoils of the group            [-]
+          station_airfoils   airfoil of each station within the group                   [-]
+          Re_spacing         spacing of a uniform Reynolds number axis, else None       [-]
+          AoA_spacing        spacing of a uniform angle of attack axis, else None       [rad]
+    """
+    a_loc  = np.array(a_loc)
+    if np.any(a_loc) == None:
+        return None
+    polars = [airfoil.polars for airfoil in airfoils]
+    table  = Data()
+    table.groups  = []
+    
+    grouped = []
+    for jj,pd in enumerate(polars):
+        for group in grouped:
+            ref = polars[group[0]]
+            if np.array_equal(ref.reynolds_numbers,pd.reynolds_numbers) and np.array_equal(ref.angle_of_attacks,pd.angle_of_attacks):
+                group.append(jj)
+                break
+        else:
+            grouped.append([jj])
+
+    for group in grouped:
+        stations = np.where(np.isin(a_loc,group))[0]
+        if len(stations) == 0:
+            continue
+        pd                     = polars[group[0]]
+        table_group            = Data()
+        table_group.reynolds_numbers = np.asarray(pd.reynolds_numbers,dtype=float)
+        table_group.angle_of_attacks = np.asarray(pd.angle_of_attacks,dtype=float)
+        table_group.coefficients     = np.stack([np.stack((polars[jj].lift_coefficients,polars[jj].drag_coefficients),axis=-1) for jj in group])
+        table_group.stations         = stations
+        table_group.station_airfoils = np.searchsorted(group,a_loc[stations])
+        table_group.Re_spacing       = uniform_spacing(table_group.reynolds_numbers)
+        table_group.AoA_spacing      = uniform_spacing(table_group.angle_of_attacks)
+        table.groups.append(table_group)
+
+    return table
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  interpolate_airfoil_polar_table
+# ----------------------------------------------------------------------------------------------------------------------    
+def interpolate_airfoil_polar_table(table,Re,alpha):
+    """
+    Interpolates the lift and drag coefficients of the blade stations from an airfoil polar table. The bilinear
+    interpolation matches RCAIDE.Framework.Core.interp2d, including linear extrapolation outside of the polars,
+    but the cell indices and weights are computed once for both coefficients and only at the stations using 
+    each airfoil.
+
+    Assumptions:
+    Radial blade stations lie along the second axis of Re and alpha
+
+    Source:
+    N/A
+
+    Inputs:
+       table      airfoil polar table, see build_airfoil_polar_table               [-]
+       Re         Reynolds number of the blade stations                            [-]
+       alpha      angle of attack of the blade stations                            [rad]
+       
+    Outputs:               
+       Cl         lift coefficient, zero at stations without an airfoil            [-]
+       Cdval      drag coefficient, zero at stations without an airfoil            [-]
+    """
+    Cl    = np.zeros(np.shape(Re))
+    Cdval = np.zeros(np.shape(Re))
+    
+    for group in table.groups:
+        Re_s    = Re[:,group.stations]
+        alpha_s = alpha[:,group.stations]
+        xp      = group.reynolds_numbers
+        yp      = group.angle_of_attacks
+        ix      = grid_cell_index(xp,Re_s,group.Re_spacing)
+        iy      = grid_cell_index(yp,alpha_s,group.AoA_spacing)
+        wx      = ((Re_s - xp[ix - 1])/(xp[ix] - xp[ix - 1]))[...,None]
+        wy      = ((alpha_s - yp[iy - 1])/(yp[iy] - yp[iy - 1]))[...,None]
+        
+        # airfoil of each station, broadcast over the control points and azimuthal stations
+        af      = group.station_airfoils.reshape((1,-1) + (1,)*(np.ndim(Re) - 2))
+        z       = group.coefficients
+        z_xy1   = (1 - wx)*z[af,ix - 1,iy - 1] + wx*z[af,ix,iy - 1]
+        z_xy2   = (1 - wx)*z[af,ix - 1,iy]     + wx*z[af,ix,iy]
+        coeffs  = (1 - wy)*z_xy1 + wy*z_xy2
+        
+        Cl[:,group.stations]    = coeffs[...,0]
+        Cdval[:,group.stations] = coeffs[...,1]
+
+    return Cl, Cdval
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  uniform_spacing
+# ----------------------------------------------------------------------------------------------------------------------    
+def uniform_spacing(xp):
+    """
+    Returns the spacing of a uniformly spaced grid axis, or None if the spacing is not uniform
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+       xp         grid axis                                                        [-]
+       
+    Outputs:               
+       dx         grid spacing                                                     [-]
+    """
+    if len(xp) < 2:
+        return None
+    dx = np.diff(xp)
+    if np.allclose(dx,dx[0],rtol=1e-9,atol=0):
+        return (xp[-1] - xp[0])/(len(xp) - 1)
+    return None
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  grid_cell_index
+# ----------------------------------------------------------------------------------------------------------------------    
+def grid_cell_index(xp,x,dx = None):
+    """
+    Returns the index of the upper node of the grid cell used to interpolate each value, clamped to the first
+    and last cells. Uniform axes are indexed directly instead of searched.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+       xp         sorted grid axis                                                 [-]
+       x          values to locate                                                 [-]
+       dx         spacing of a uniform grid axis, or None                          [-]
+       
+    Outputs:               
+       ix         index of the upper grid node of the cell of each value           [-]
+    """
+    if dx is None:
+        return np.clip(np.searchsorted(xp,x,side="right"),1,len(xp) - 1)
+    
+    with np.errstate(invalid='ignore'):
+        ix = np.floor((x - xp[0])/dx) + 1
+    return np.clip(np.nan_to_num(ix),1,len(xp) - 1).astype(int)
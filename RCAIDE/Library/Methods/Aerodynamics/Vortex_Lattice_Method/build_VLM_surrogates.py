@@ -10,6 +10,7 @@ from RCAIDE.Framework.Core import  Data
 # package imports 
 from scipy.interpolate                                           import RegularGridInterpolator
 from scipy import interpolate
+import numpy as np
 
 # ----------------------------------------------------------------------------------------------------------------------
 #  Vortex_Lattice
@@ -18,7 +19,10 @@ def build_VLM_surrogates(aerodynamics):
     """Build a surrogate using sample evaluation results.
     
     Assumptions:
-        None
+        Along with the surrogates of the individual coefficients, each regime has fused surrogates in
+        surrogates.<regime>.fused: one per set of perturbations (alpha, beta, u, v, w, p, q, r and each control
+        surface), whose values carry the Clift, Cdrag, CX, CY, CZ, CL, CM and CN coefficients along a trailing
+        axis so that all of them are interpolated with a single grid search.
         
     Source:
         None
@@ -296,6 +300,52 @@ def build_surrogate(aerodynamics, training):
         surrogates.dCL_ddelta_s     = interpolate.interp1d(mach_data,training.dCL_ddelta_s     ,kind = 'linear',   bounds_error=False, fill_value="extrapolate") 
         surrogates.dCM_ddelta_s     = interpolate.interp1d(mach_data,training.dCM_ddelta_s     ,kind = 'linear',   bounds_error=False, fill_value="extrapolate") 
         surrogates.dCN_ddelta_s     = interpolate.interp1d(mach_data,training.dCN_ddelta_s     ,kind = 'linear',   bounds_error=False, fill_value="extrapolate")   
+
+    # Fused surrogates of all the coefficients of each set of perturbations 
+    surrogates.fused          = Data()
+    surrogates.fused.alpha    = build_fused_surrogate(training,'alpha',AoA_data ,mach_data)
+    surrogates.fused.beta     = build_fused_surrogate(training,'beta' ,Beta_data,mach_data)
+    surrogates.fused.u        = build_fused_surrogate(training,'u'    ,u_data   ,mach_data)
+    surrogates.fused.v        = build_fused_surrogate(training,'v'    ,v_data   ,mach_data)
+    surrogates.fused.w        = build_fused_surrogate(training,'w'    ,w_data   ,mach_data)
+    surrogates.fused.p        = build_fused_surrogate(training,'p'    ,p_data   ,mach_data)
+    surrogates.fused.q        = build_fused_surrogate(training,'q'    ,q_data   ,mach_data)
+    surrogates.fused.r        = build_fused_surrogate(training,'r'    ,r_data   ,mach_data)
+    if aerodynamics.aileron_flag: 
+        surrogates.fused.delta_a = build_fused_surrogate(training,'delta_a',aileron_data ,mach_data)
+    if aerodynamics.elevator_flag: 
+        surrogates.fused.delta_e = build_fused_surrogate(training,'delta_e',elevator_data,mach_data)
+    if aerodynamics.rudder_flag: 
+        surrogates.fused.delta_r = build_fused_surrogate(training,'delta_r',rudder_data  ,mach_data)
+    if aerodynamics.flap_flag:
+        surrogates.fused.delta_f = build_fused_surrogate(training,'delta_f',flap_data    ,mach_data)
+    if aerodynamics.slat_flag: 
+        surrogates.fused.delta_s = build_fused_surrogate(training,'delta_s',slat_data    ,mach_data)
    
     return surrogates
+
+def build_fused_surrogate(training,perturbation,input_data,mach_data):
+    """Builds a single surrogate of the Clift, Cdrag, CX, CY, CZ, CL, CM and CN coefficients of a set of
+    perturbations. The values of the surrogate are the training data of the coefficients stacked along a trailing
+    axis, so that the surrogate returns the eight coefficients, in that order, for each query point.
+    
+    Assumptions:
+        The training data of all the coefficients share the (input, Mach number) grid
+        
+    Source:
+        None
+
+    Args:
+        training     : training data of a regime           [unitless]
+        perturbation : tag of the perturbation, e.g. alpha  [string]
+        input_data   : perturbation training values         [unitless]
+        mach_data    : Mach number training values          [unitless]
+        
+    Returns: 
+        surrogate    : interpolator of the eight coefficients [unitless]
+    """
+    coefficients = ['Clift','Cdrag','CX','CY','CZ','CL','CM','CN']
+    values       = np.stack([training[coefficient + '_' + perturbation] for coefficient in coefficients],axis = -1)
+    surrogate    = RegularGridInterpolator((input_data,mach_data),values,method = 'linear',   bounds_error=False, fill_value=None)
+    return surrogate
  
\ No newline at end of file
@@ -110,10 +110,7 @@ def evaluate_surrogate(state,settings,vehicle):
     pts_r       = np.hstack((r,Mach))
     
     # Alpha 
-    results_alpha = compute_coefficients(sub_sur.Clift_alpha,  sub_sur.Cdrag_alpha,  sub_sur.CX_alpha,  sub_sur.CY_alpha,  sub_sur.CZ_alpha,  sub_sur.CL_alpha,  sub_sur.CM_alpha,   sub_sur.CN_alpha,
-                                         trans_sur.Clift_alpha,trans_sur.Cdrag_alpha,trans_sur.CX_alpha,trans_sur.CY_alpha,trans_sur.CZ_alpha,trans_sur.CL_alpha,trans_sur.CM_alpha, trans_sur.CN_alpha,
-                                         sup_sur.Clift_alpha,  sup_sur.Cdrag_alpha,  sup_sur.CX_alpha,  sup_sur.CY_alpha,  sup_sur.CZ_alpha,  sup_sur.CL_alpha,  sup_sur.CM_alpha,   sup_sur.CN_alpha,
-                                         h_sub,h_sup,Mach, pts_alpha)        
+    results_alpha = compute_coefficients(sub_sur.fused.alpha,trans_sur.fused.alpha,sup_sur.fused.alpha,h_sub,h_sup,Mach,pts_alpha)        
 
     Clift_alpha             = results_alpha.Clift   
     Cdrag_alpha             = results_alpha.Cdrag   
@@ -133,10 +130,7 @@ def evaluate_surrogate(state,settings,vehicle):
     CN_alpha[AoA==0.0]      = 0  
     
     # Beta 
-    results_beta  = compute_coefficients(sub_sur.Clift_beta,  sub_sur.Cdrag_beta,  sub_sur.CX_beta,  sub_sur.CY_beta,  sub_sur.CZ_beta,  sub_sur.CL_beta,  sub_sur.CM_beta,   sub_sur.CN_beta,
-                                         trans_sur.Clift_beta,trans_sur.Cdrag_beta,trans_sur.CX_beta,trans_sur.CY_beta,trans_sur.CZ_beta,trans_sur.CL_beta,trans_sur.CM_beta, trans_sur.CN_beta,
-                                         sup_sur.Clift_beta,  sup_sur.Cdrag_beta,  sup_sur.CX_beta,  sup_sur.CY_beta,  sup_sur.CZ_beta,  sup_sur.CL_beta,  sup_sur.CM_beta,   sup_sur.CN_beta,
-                                         h_sub,h_sup,Mach, pts_beta)
+    results_beta  = compute_coefficients(sub_sur.fused.beta,trans_sur.fused.beta,sup_sur.fused.beta,h_sub,h_sup,Mach,pts_beta)
      
     Clift_beta              = results_beta.Clift   
     Cdrag_beta              = results_beta.Cdrag 
@@ -156,10 +150,7 @@ def evaluate_surrogate(state,settings,vehicle):
     CN_beta[Beta==0.0]      = 0
 
     # u  
-    results_u     =  compute_coefficients(sub_sur.Clift_u,  sub_sur.Cdrag_u,  sub_sur.CX_u,  sub_sur.CY_u,  sub_sur.CZ_u,  sub_sur.CL_u,  sub_sur.CM_u,   sub_sur.CN_u,
-                                          trans_sur.Clift_u,trans_sur.Cdrag_u,trans_sur.CX_u,trans_sur.CY_u,trans_sur.CZ_u,trans_sur.CL_u,trans_sur.CM_u, trans_sur.CN_u,
-                                          sup_sur.Clift_u,  sup_sur.Cdrag_u,  sup_sur.CX_u,  sup_sur.CY_u,  sup_sur.CZ_u,  sup_sur.CL_u,  sup_sur.CM_u,   sup_sur.CN_u,
-                                          h_sub,h_sup,Mach, pts_u)
+    results_u     =  compute_coefficients(sub_sur.fused.u,trans_sur.fused.u,sup_sur.fused.u,h_sub,h_sup,Mach,pts_u)
                   
     Clift_u           = results_u.Clift   
     Cdrag_u           = results_u.Cdrag   
@@ -179,10 +170,7 @@ def evaluate_surrogate(state,settings,vehicle):
     CN_u[u==0.0]      = 0  
 
     # v  
-    results_v     =  compute_coefficients(sub_sur.Clift_v,  sub_sur.Cdrag_v,  sub_sur.CX_v,  sub_sur.CY_v,  sub_sur.CZ_v,  sub_sur.CL_v,  sub_sur.CM_v,   sub_sur.CN_v,
-                                          trans_sur.Clift_v,trans_sur.Cdrag_v,trans_sur.CX_v,trans_sur.CY_v,trans_sur.CZ_v,trans_sur.CL_v,trans_sur.CM_v, trans_sur.CN_v,
-                                          sup_sur.Clift_v,  sup_sur.Cdrag_v,  sup_sur.CX_v,  sup_sur.CY_v,  sup_sur.CZ_v,  sup_sur.CL_v,  sup_sur.CM_v,   sup_sur.CN_v,
-                                          h_sub,h_sup,Mach, pts_v)
+    results_v     =  compute_coefficients(sub_sur.fused.v,trans_sur.fused.v,sup_sur.fused.v,h_sub,h_sup,Mach,pts_v)
      
     Clift_v           = results_v.Clift   
     Cdrag_v           = results_v.Cdrag   
@@ -202,10 +190,7 @@ def evaluate_surrogate(state,settings,vehicle):
     CN_v[v==0.0]      = 0
 
     # w  
-    results_w    =  compute_coefficients(sub_sur.Clift_w,  sub_sur.Cdrag_w,  sub_sur.CX_w,  sub_sur.CY_w,  sub_sur.CZ_w,  sub_sur.CL_w,  sub_sur.CM_w,   sub_sur.CN_w,
-                                         trans_sur.Clift_w,trans_sur.Cdrag_w,trans_sur.CX_w,trans_sur.CY_w,trans_sur.CZ_w,trans_sur.CL_w,trans_sur.CM_w, trans_sur.CN_w,
-                                         sup_sur.Clift_w,  sup_sur.Cdrag_w,  sup_sur.CX_w,  sup_sur.CY_w,  sup_sur.CZ_w,  sup_sur.CL_w,  sup_sur.CM_w,   sup_sur.CN_w,
-                                         h_sub,h_sup,Mach, pts_w)
+    results_w    =  compute_coefficients(sub_sur.fused.w,trans_sur.fused.w,sup_sur.fused.w,h_sub,h_sup,Mach,pts_w)
      
     Clift_w           = results_w.Clift   
     Cdrag_w           = results_w.Cdrag   
@@ -225,10 +210,7 @@ def evaluate_surrogate(state,settings,vehicle):
     CN_w[w==0.0]      = 0
                         
     # p  
-    results_p    =  compute_coefficients(sub_sur.Clift_p,  sub_sur.Cdrag_p,  sub_sur.CX_p,  sub_sur.CY_p,  sub_sur.CZ_p,  sub_sur.CL_p,  sub_sur.CM_p,   sub_sur.CN_p,
-                                         trans_sur.Clift_p,trans_sur.Cdrag_p,trans_sur.CX_p,trans_sur.CY_p,trans_sur.CZ_p,trans_sur.CL_p,trans_sur.CM_p, trans_sur.CN_p,
-                                         sup_sur.Clift_p,  sup_sur.Cdrag_p,  sup_sur.CX_p,  sup_sur.CY_p,  sup_sur.CZ_p,  sup_sur.CL_p,  sup_sur.CM_p,   sup_sur.CN_p,
-                                         h_sub,h_sup,Mach, pts_p)
+    results_p    =  compute_coefficients(sub_sur.fused.p,trans_sur.fused.p,sup_sur.fused.p,h_sub,h_sup,Mach,pts_p)
      
     Clift_p           = results_p.Clift   
     Cdrag_p           = results_p.Cdrag   
@@ -248,10 +230,7 @@ def evaluate_surrogate(state,settings,vehicle):
     CN_p[p==0.0]      = 0 
      
     # q  
-    results_q    =  compute_coefficients(sub_sur.Clift_q,  sub_sur.Cdrag_q,  sub_sur.CX_q,  sub_sur.CY_q,  sub_sur.CZ_q,  sub_sur.CL_q,  sub_sur.CM_q,   sub_sur.CN_q,
-                                         trans_sur.Clift_q,trans_sur.Cdrag_q,trans_sur.CX_q,trans_sur.CY_q,trans_sur.CZ_q,trans_sur.CL_q,trans_sur.CM_q, trans_sur.CN_q,
-                                         sup_sur.Clift_q,  sup_sur.Cdrag_q,  sup_sur.CX_q,  sup_sur.CY_q,  sup_sur.CZ_q,  sup_sur.CL_q,  sup_sur.CM_q,   sup_sur.CN_q,
-                                         h_sub,h_sup,Mach, pts_q)
+    results_q    =  compute_coefficients(sub_sur.fused.q,trans_sur.fused.q,sup_sur.fused.q,h_sub,h_sup,Mach,pts_q)
      
     Clift_q           = results_q.Clift   
     Cdrag_q           = results_q.Cdrag   
@@ -271,10 +250,7 @@ def evaluate_surrogate(state,settings,vehicle):
     CN_q[q==0.0]      = 0
     
     # r  
-    results_r    =  compute_coefficients(sub_sur.Clift_r,  sub_sur.Cdrag_r,  sub_sur.CX_r,  sub_sur.CY_r,  sub_sur.CZ_r,  sub_sur.CL_r,  sub_sur.CM_r,   sub_sur.CN_r,
-                                         trans_sur.Clift_r,trans_sur.Cdrag_r,trans_sur.CX_r,trans_sur.CY_r,trans_sur.CZ_r,trans_sur.CL_r,trans_sur.CM_r, trans_sur.CN_r,
-                                         sup_sur.Clift_r,  sup_sur.Cdrag_r,  sup_sur.CX_r,  sup_sur.CY_r,  sup_sur.CZ_r,  sup_sur.CL_r,  sup_sur.CM_r,   sup_sur.CN_r,
-                                         h_sub,h_sup,Mach, pts_r)
+    results_r    =  compute_coefficients(sub_sur.fused.r,trans_sur.fused.r,sup_sur.fused.r,h_sub,h_sup,Mach,pts_r)
      
     Clift_r           = results_r.Clift   
     Cdrag_r           = results_r.Cdrag   
@@ -319,10 +295,7 @@ def evaluate_surrogate(state,settings,vehicle):
     if aerodynamics.aileron_flag: 
         pts_delta_a     = np.hstack((delta_a,Mach))
         
-        results_delta_a =  compute_coefficients(sub_sur.Clift_delta_a,sub_sur.Cdrag_delta_a,sub_sur.CX_delta_a,sub_sur.CY_delta_a,sub_sur.CZ_delta_a,sub_sur.CL_delta_a,sub_sur.CM_delta_a, sub_sur.CN_delta_a,
-         trans_sur.Clift_delta_a,trans_sur.Cdrag_delta_a,trans_sur.CX_delta_a,trans_sur.CY_delta_a,trans_sur.CZ_delta_a,trans_sur.CL_delta_a,trans_sur.CM_delta_a, trans_sur.CN_delta_a,
-         sup_sur.Clift_delta_a,sup_sur.Cdrag_delta_a,sup_sur.CX_delta_a,sup_sur.CY_delta_a,sup_sur.CZ_delta_a,sup_sur.CL_delta_a,sup_sur.CM_delta_a, sup_sur.CN_delta_a,
-        h_sub,h_sup,Mach, pts_delta_a)
+        results_delta_a =  compute_coefficients(sub_sur.fused.delta_a,trans_sur.fused.delta_a,sup_sur.fused.delta_a,h_sub,h_sup,Mach,pts_delta_a)
          
         Clift_delta_a   = results_delta_a.Clift   
         Cdrag_delta_a   = results_delta_a.Cdrag   
@@ -362,10 +335,7 @@ def evaluate_surrogate(state,settings,vehicle):
     if aerodynamics.elevator_flag: 
         pts_delta_e     = np.hstack((delta_e,Mach))
 
-        results_delta_e =  compute_coefficients(sub_sur.Clift_delta_e,sub_sur.Cdrag_delta_e,sub_sur.CX_delta_e,sub_sur.CY_delta_e,sub_sur.CZ_delta_e,sub_sur.CL_delta_e,sub_sur.CM_delta_e, sub_sur.CN_delta_e,
-         trans_sur.Clift_delta_e,trans_sur.Cdrag_delta_e,trans_sur.CX_delta_e,trans_sur.CY_delta_e,trans_sur.CZ_delta_e,trans_sur.CL_delta_e,trans_sur.CM_delta_e, trans_sur.CN_delta_e,
-         sup_sur.Clift_delta_e,sup_sur.Cdrag_delta_e,sup_sur.CX_delta_e,sup_sur.CY_delta_e,sup_sur.CZ_delta_e,sup_sur.CL_delta_e,sup_sur.CM_delta_e, sup_sur.CN_delta_e,
-        h_sub,h_sup,Mach, pts_delta_e)
+        results_delta_e =  compute_coefficients(sub_sur.fused.delta_e,trans_sur.fused.delta_e,sup_sur.fused.delta_e,h_sub,h_sup,Mach,pts_delta_e)
          
         Clift_delta_e   = results_delta_e.Clift   
         Cdrag_delta_e   = results_delta_e.Cdrag   
@@ -405,10 +375,7 @@ def evaluate_surrogate(state,settings,vehicle):
     if aerodynamics.rudder_flag:  
         pts_delta_r    = np.hstack((delta_r,Mach))
         
-        results_delta_r =  compute_coefficients(sub_sur.Clift_delta_r,sub_sur.Cdrag_delta_r,sub_sur.CX_delta_r,sub_sur.CY_delta_r,sub_sur.CZ_delta_r,sub_sur.CL_delta_r,sub_sur.CM_delta_r, sub_sur.CN_delta_r,
-         trans_sur.Clift_delta_r,trans_sur.Cdrag_delta_r,trans_sur.CX_delta_r,trans_sur.CY_delta_r,trans_sur.CZ_delta_r,trans_sur.CL_delta_r,trans_sur.CM_delta_r, trans_sur.CN_delta_r,
-         sup_sur.Clift_delta_r,sup_sur.Cdrag_delta_r,sup_sur.CX_delta_r,sup_sur.CY_delta_r,sup_sur.CZ_delta_r,sup_sur.CL_delta_r,sup_sur.CM_delta_r, sup_sur.CN_delta_r,
-        h_sub,h_sup,Mach, pts_delta_r)
+        results_delta_r =  compute_coefficients(sub_sur.fused.delta_r,trans_sur.fused.delta_r,sup_sur.fused.delta_r,h_sub,h_sup,Mach,pts_delta_r)
          
         Clift_delta_r   = results_delta_r.Clift   
         Cdrag_delta_r   = results_delta_r.Cdrag   
@@ -448,10 +415,7 @@ def evaluate_surrogate(state,settings,vehicle):
     if aerodynamics.flap_flag:
         pts_delta_f    = np.hstack((delta_f,Mach))
         
-        results_delta_f =  compute_coefficients(sub_sur.Clift_delta_f,sub_sur.Cdrag_delta_f,sub_sur.CX_delta_f,sub_sur.CY_delta_f,sub_sur.CZ_delta_f,sub_sur.CL_delta_f,sub_sur.CM_delta_f, sub_sur.CN_delta_f,
-         trans_sur.Clift_delta_f,trans_sur.Cdrag_delta_f,trans_sur.CX_delta_f,trans_sur.CY_delta_f,trans_sur.CZ_delta_f,trans_sur.CL_delta_f,trans_sur.CM_delta_f, trans_sur.CN_delta_f,
-         sup_sur.Clift_delta_f,sup_sur.Cdrag_delta_f,sup_sur.CX_delta_f,sup_sur.CY_delta_f,sup_sur.CZ_delta_f,sup_sur.CL_delta_f,sup_sur.CM_delta_f, sup_sur.CN_delta_f,
-        h_sub,h_sup,Mach, pts_delta_f)
+        results_delta_f =  compute_coefficients(sub_sur.fused.delta_f,trans_sur.fused.delta_f,sup_sur.fused.delta_f,h_sub,h_sup,Mach,pts_delta_f)
          
         Clift_delta_f   = results_delta_f.Clift   
         Cdrag_delta_f   = results_delta_f.Cdrag   
@@ -492,10 +456,7 @@ def evaluate_surrogate(state,settings,vehicle):
     
         pts_delta_s    = np.hstack((delta_s,Mach)) 
         
-        results_delta_s =  compute_coefficients(sub_sur.Clift_delta_s,sub_sur.Cdrag_delta_s,sub_sur.CX_delta_s,sub_sur.CY_delta_s,sub_sur.CZ_delta_s,sub_sur.CL_delta_s,sub_sur.CM_delta_s, sub_sur.CN_delta_s,
-         trans_sur.Clift_delta_s,trans_sur.Cdrag_delta_s,trans_sur.CX_delta_s,trans_sur.CY_delta_s,trans_sur.CZ_delta_s,trans_sur.CL_delta_s,trans_sur.CM_delta_s, trans_sur.CN_delta_s,
-         sup_sur.Clift_delta_s,sup_sur.Cdrag_delta_s,sup_sur.CX_delta_s,sup_sur.CY_delta_s,sup_sur.CZ_delta_s,sup_sur.CL_delta_s,sup_sur.CM_delta_s, sup_sur.CN_delta_s,
-        h_sub,h_sup,Mach, pts_delta_s)
+        results_delta_s =  compute_coefficients(sub_sur.fused.delta_s,trans_sur.fused.delta_s,sup_sur.fused.delta_s,h_sub,h_sup,Mach,pts_delta_s)
          
         Clift_delta_s   = results_delta_s.Clift   
         Cdrag_delta_s   = results_delta_s.Cdrag   
@@ -1265,54 +1226,41 @@ def evaluate_no_surrogate(state,settings,base_vehicle):
     return
 
 def compute_stability_derivative(sub_sur,trans_sur,sup_sur,h_sub,h_sup,Mach):
-    derivative = h_sub(Mach)*sub_sur(Mach) +   (1 - (h_sup(Mach) + h_sub(Mach)))*trans_sur(Mach)  + h_sup(Mach)*sup_sur(Mach) 
+    """Blends the subsonic, transonic and supersonic surrogates of a stability derivative. Regimes whose weight is
+    zero at all the queried Mach numbers are not evaluated.
+    """
+    w_sub      = h_sub(Mach)
+    w_sup      = h_sup(Mach)
+    w_trans    = 1 - (w_sup + w_sub)
+    derivative = 0
+    for weight, surrogate in [(w_sub,sub_sur),(w_trans,trans_sur),(w_sup,sup_sur)]:
+        if np.any(weight != 0):
+            derivative = derivative + weight*surrogate(Mach)
     return derivative
 
-def compute_coefficients(sub_sur_Clift,sub_sur_Cdrag,sub_sur_CX,sub_sur_CY,sub_sur_CZ,sub_sur_CL,sub_sur_CM,sub_sur_CN,
-                         trans_sur_Clift,trans_sur_Cdrag,trans_sur_CX,trans_sur_CY,trans_sur_CZ,trans_sur_CL,trans_sur_CM,trans_sur_CN,
-                         sup_sur_Clift,sup_sur_Cdrag,sup_sur_CX,sup_sur_CY,sup_sur_CZ,sup_sur_CL,sup_sur_CM,sup_sur_CN,
-                         h_sub,h_sup,Mach, pts): 
- 
-     #  subsonic 
-    sub_Clift     = np.atleast_2d(sub_sur_Clift(pts)).T  
-    sub_Cdrag     = np.atleast_2d(sub_sur_Cdrag(pts)).T  
-    sub_CX        = np.atleast_2d(sub_sur_CX(pts)).T 
-    sub_CY        = np.atleast_2d(sub_sur_CY(pts)).T     
-    sub_CZ        = np.atleast_2d(sub_sur_CZ(pts)).T     
-    sub_CL        = np.atleast_2d(sub_sur_CL(pts)).T     
-    sub_CM        = np.atleast_2d(sub_sur_CM(pts)).T     
-    sub_CN        = np.atleast_2d(sub_sur_CN(pts)).T
-
-    # transonic   
-    trans_Clift   = np.atleast_2d(trans_sur_Clift(pts)).T  
-    trans_Cdrag   = np.atleast_2d(trans_sur_Cdrag(pts)).T  
-    trans_CX      = np.atleast_2d(trans_sur_CX(pts)).T 
-    trans_CY      = np.atleast_2d(trans_sur_CY(pts)).T     
-    trans_CZ      = np.atleast_2d(trans_sur_CZ(pts)).T     
-    trans_CL      = np.atleast_2d(trans_sur_CL(pts)).T     
-    trans_CM      = np.atleast_2d(trans_sur_CM(pts)).T     
-    trans_CN      = np.atleast_2d(trans_sur_CN(pts)).T
-
-    # supersonic 
-    sup_Clift     = np.atleast_2d(sup_sur_Clift(pts)).T  
-    sup_Cdrag     = np.atleast_2d(sup_sur_Cdrag(pts)).T  
-    sup_CX        = np.atleast_2d(sup_sur_CX(pts)).T 
-    sup_CY        = np.atleast_2d(sup_sur_CY(pts)).T     
-    sup_CZ        = np.atleast_2d(sup_sur_CZ(pts)).T     
-    sup_CL        = np.atleast_2d(sup_sur_CL(pts)).T     
-    sup_CM        = np.atleast_2d(sup_sur_CM(pts)).T     
-    sup_CN        = np.atleast_2d(sup_sur_CN(pts)).T            
+def compute_coefficients(sub_sur,trans_sur,sup_sur,h_sub,h_sup,Mach,pts):
+    """Blends the subsonic, transonic and supersonic fused surrogates of a set of perturbations, see
+    build_fused_surrogate. Each fused surrogate returns all the coefficients at once, and regimes whose weight is
+    zero at all the queried Mach numbers are not evaluated.
+    """
+    w_sub        = h_sub(Mach)
+    w_sup        = h_sup(Mach)
+    w_trans      = 1 - (w_sup + w_sub)
+    coefficients = 0
+    for weight, surrogate in [(w_sub,sub_sur),(w_trans,trans_sur),(w_sup,sup_sur)]:
+        if np.any(weight != 0):
+            coefficients = coefficients + weight*np.atleast_2d(surrogate(pts))
 
     # apply 
     results       = Data() 
-    results.Clift = h_sub(Mach)*sub_Clift + (1 - (h_sup(Mach) + h_sub(Mach)))*trans_Clift  + h_sup(Mach)*sup_Clift
-    results.Cdrag = h_sub(Mach)*sub_Cdrag + (1 - (h_sup(Mach) + h_sub(Mach)))*trans_Cdrag  + h_sup(Mach)*sup_Cdrag
-    results.CX    = h_sub(Mach)*sub_CX    + (1 - (h_sup(Mach) + h_sub(Mach)))*trans_CX     + h_sup(Mach)*sup_CX   
-    results.CY    = h_sub(Mach)*sub_CY    + (1 - (h_sup(Mach) + h_sub(Mach)))*trans_CY     + h_sup(Mach)*sup_CY   
-    results.CZ    = h_sub(Mach)*sub_CZ    + (1 - (h_sup(Mach) + h_sub(Mach)))*trans_CZ     + h_sup(Mach)*sup_CZ   
-    results.CL    = h_sub(Mach)*sub_CL    + (1 - (h_sup(Mach) + h_sub(Mach)))*trans_CL     + h_sup(Mach)*sup_CL   
-    results.CM    = h_sub(Mach)*sub_CM    + (1 - (h_sup(Mach) + h_sub(Mach)))*trans_CM     + h_sup(Mach)*sup_CM   
-    results.CN    = h_sub(Mach)*sub_CN    + (1 - (h_sup(Mach) + h_sub(Mach)))*trans_CN     + h_sup(Mach)*sup_CN
+    results.Clift = coefficients[:,0][:,None]
+    results.Cdrag = coefficients[:,1][:,None]
+    results.CX    = coefficients[:,2][:,None]
+    results.CY    = coefficients[:,3][:,None]
+    results.CZ    = coefficients[:,4][:,None]
+    results.CL    = coefficients[:,5][:,None]
+    results.CM    = coefficients[:,6][:,None]
+    results.CN    = coefficients[:,7][:,None]
 
     return results
 
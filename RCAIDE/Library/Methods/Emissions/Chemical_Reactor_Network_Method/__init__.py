@@ -11,4 +11,5 @@
 from .build_CRN_EI_surrogates       import build_CRN_EI_surrogates
 from .train_CRN_EI_surrogates       import train_CRN_EI_surrogates
 from .evaluate_cantera              import evaluate_cantera
+from .evaluate_cantera_batch        import evaluate_cantera_batch
 from .evaluate_CRN_emission_indices import *  
\ No newline at end of file
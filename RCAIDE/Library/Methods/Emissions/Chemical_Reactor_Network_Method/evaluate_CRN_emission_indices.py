@@ -7,7 +7,7 @@
 # ----------------------------------------------------------------------------------------------------------------------
 import  RCAIDE
 from RCAIDE.Framework.Core import Data
-from RCAIDE.Library.Methods.Emissions.Chemical_Reactor_Network_Method.evaluate_cantera import evaluate_cantera 
+from RCAIDE.Library.Methods.Emissions.Chemical_Reactor_Network_Method.evaluate_cantera_batch import evaluate_cantera_batch 
  
 # package imports
 import numpy as np
@@ -38,6 +38,7 @@ def evaluate_CRN_emission_indices_no_surrogate(segment,settings,vehicle):
                             type(propulsor) == RCAIDE.Library.Components.Propulsors.Turbojet:    
                         
                             combustor = propulsor.combustor
+                            check_engine_deck(propulsor)
                         
                             # unpack component conditions
                             n_cp                 = state.numerics.number_of_control_points 
@@ -63,21 +64,20 @@ def evaluate_CRN_emission_indices_no_surrogate(segment,settings,vehicle):
                                 EI_NO2_comb = EI_NO2_prev 
                                 
                             else:     
-                                for t_idx in range(n_cp):
-                                    # Call cantera 
-                                    results = evaluate_cantera(combustor,T[t_idx,0],P[t_idx,0],mdot[t_idx,0],FAR[t_idx,0])
-                                    
-                                    EI_CO2_comb[t_idx,0] = results.EI_CO2
-                                    EI_CO_comb[t_idx,0]  = results.EI_CO 
-                                    EI_H2O_comb[t_idx,0] = results.EI_H2O
-                                    EI_NO_comb[t_idx,0]  = results.EI_NO 
-                                    EI_NO2_comb[t_idx,0] = results.EI_NO2
-                                    
-                                    EI_CO2_prev = EI_CO2_comb 
-                                    EI_CO_prev  =  EI_CO_comb  
-                                    EI_H2O_prev = EI_H2O_comb 
-                                    EI_NO_prev  =  EI_NO_comb  
-                                    EI_NO2_prev = EI_NO2_comb 
+                                # Call cantera at all the control points 
+                                results = evaluate_cantera_batch(combustor,T[:n_cp,0],P[:n_cp,0],mdot[:n_cp,0],FAR[:n_cp,0],settings.number_of_processes)
+                                
+                                EI_CO2_comb[:n_cp,0] = results.EI_CO2
+                                EI_CO_comb[:n_cp,0]  = results.EI_CO 
+                                EI_H2O_comb[:n_cp,0] = results.EI_H2O
+                                EI_NO_comb[:n_cp,0]  = results.EI_NO 
+                                EI_NO2_comb[:n_cp,0] = results.EI_NO2
+                                
+                                EI_CO2_prev = EI_CO2_comb 
+                                EI_CO_prev  =  EI_CO_comb  
+                                EI_H2O_prev = EI_H2O_comb 
+                                EI_NO_prev  =  EI_NO_comb  
+                                EI_NO2_prev = EI_NO2_comb 
                                 
                             CO2_total  += np.dot(I,mdot*EI_CO2_comb)
                             CO_total   += np.dot(I,mdot *EI_CO_comb )
@@ -121,6 +121,7 @@ def evaluate_CRN_emission_indices_surrogate(segment,settings,vehicle):
                     type(propulsor) == RCAIDE.Library.Components.Propulsors.Turbojet:    
                 
                     combustor = propulsor.combustor
+                    check_engine_deck(propulsor)
                 
                     # unpack component conditions
                     propulsor_conditions = segment.state.conditions.energy[propulsor.tag] 
@@ -160,4 +161,22 @@ def evaluate_CRN_emission_indices_surrogate(segment,settings,vehicle):
     segment.state.conditions.emissions =  emissions
     return   
 
-     
\ No newline at end of file
+def check_engine_deck(propulsor):
+    """ Raises an error for propulsors that interpolate an engine deck, which does not compute the combustor
+    conditions the chemical reactor network is evaluated at
+    
+    Assumptions:
+        None
+
+    Source:
+        None
+
+    Inputs:
+        propulsor.use_engine_deck     [Boolean]
+
+    Outputs:
+        None
+    """
+    if propulsor.use_engine_deck:
+        raise ValueError('the emissions of ' + propulsor.tag + ' require its combustor conditions, which the engine deck does not compute: set use_engine_deck to False')
+    return
@@ -10,6 +10,9 @@ import pandas                as pd
 import numpy                 as np
 import os
 
+# kinetic mechanisms parsed in this process, indexed by path
+solution_pool = {}
+
 # ----------------------------------------------------------------------------------------------------------------------
 #  evaluate_cantera
 # ----------------------------------------------------------------------------------------------------------------------   
@@ -20,7 +23,8 @@ def evaluate_cantera(combustor,T,P,mdot,FAR):
     Network (CRN) built using Cantera.
     
     Assumptions: PSRs represent the Primary Zone, while In the Secondary 
-    Zone Air is added between different PFRs.
+    Zone Air is added between different PFRs. Each kinetic mechanism is 
+    parsed once per process, see get_solution.
     
     Improvements required:
     - Comparison of resulting NO, NO2 and CO with literature
@@ -145,7 +149,7 @@ def combustor_model(ct, kinetics_model,oxidizer_model,high_fidelity_kin_mech, di
        
     for PSR_i in range(N_PZ):     
         f_PZ_1                            = (1 / (np.sqrt(2 * np.pi) * sigma_phi)) * np.exp((-(phi_PSR[PSR_i] - phi_sign) ** 2) / (2 * sigma_phi ** 2)) * Delta_phi # [-]       Fraction of mass flow entering the PSR at the PSR equivalence ratio                                                                                       
-        Fuel_list.append(ct.Solution(rel_path+kinetics_model) )                     # [-]       Import surrogate fuel kinematic mechanism
+        Fuel_list.append(get_solution(ct,rel_path+kinetics_model))                  # [-]       Import surrogate fuel kinematic mechanism
         Fuel_list[PSR_i].TP               = T_stag_0, P_stag_0                      # [-]       Set the fuel temperature and pressure
         Fuel_list[PSR_i].set_equivalence_ratio(phi_PSR[PSR_i], fuel=dict_fuel, oxidizer=dict_oxy) # [-]       Set the euivalence ratio inside the PSR
         Fuel_list[PSR_i].equilibrate('HP')                                          # [-]       Fix the specific enthalpy and pressure 
@@ -212,7 +216,7 @@ def combustor_model(ct, kinetics_model,oxidizer_model,high_fidelity_kin_mech, di
     total_mass_flow = np.sum(np.array(mass_flow_rates))                             # [kg/s]    Total mass flow entering the first mixer  
 
     for _ in  range(N_SZ): 
-        Air                   = ct.Solution(rel_path+oxidizer_model)                # [-]       Import air kinematic mechanism           
+        Air                   = get_solution(ct,rel_path+oxidizer_model)            # [-]       Import air kinematic mechanism           
         Air.TPX               = T_stag_0, P_stag_0, dict_oxy                        # [-]       Set the air temperature, pressure and mole fractions
         rho_air               = Air.density                                         # [kg/m**3] Fuel density
         res_air               = ct.Reservoir(Air)                                   # [-]       Create a resevoir for the air upstream of the mixer
@@ -242,4 +246,30 @@ def combustor_model(ct, kinetics_model,oxidizer_model,high_fidelity_kin_mech, di
     m_dot_input_combustor   = m_dot_fuel + m_dot_air                                # [kg/s]    Total mass flow rate entering a single combustor (air + fuel)
     Emission_Index          = Fuel_list[0].Y * (m_dot_input_combustor)/m_dot_fuel   # [-]       Computation of the Emission Index   
 
-    return (Fuel_list[0], Emission_Index)  
\ No newline at end of file
+    return (Fuel_list[0], Emission_Index)
+
+def get_solution(ct,mechanism):
+    '''
+    Returns a new Cantera Solution of a kinetic mechanism. The mechanism
+    file is parsed on the first request of each process only: later 
+    Solutions are built from the species and reactions of the parsed one,
+    which avoids reading the YAML file again for every reactor.
+    
+    Assumptions: The mechanism file is not modified while it is in use
+    
+    Source: None
+    
+    Inputs:
+        ct        - cantera module                              [-]
+        mechanism - path of the kinetic mechanism file          [-]
+        
+    Outputs:
+        solution  - Cantera Solution of the mechanism           [-]
+    '''
+    if mechanism not in solution_pool:
+        parsed                   = ct.Solution(mechanism)
+        solution_pool[mechanism] = (parsed.thermo_model, parsed.kinetics_model, parsed.species(), parsed.reactions())
+    thermo_model, kinetics_model, species, reactions = solution_pool[mechanism]
+    solution = ct.Solution(thermo = thermo_model, kinetics = kinetics_model, species = species, reactions = reactions)
+    
+    return solution  
\ No newline at end of file
@@ -0,0 +1,66 @@
+# RCAIDE/Library/Methods/Emissions/Chemical_Reactor_Network_Method/evaluate_cantera_batch.py
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+
+# RCAIDE imports
+from   RCAIDE.Framework.Core import Data
+from   RCAIDE.Library.Methods.Emissions.Chemical_Reactor_Network_Method.evaluate_cantera import evaluate_cantera
+
+# package imports
+from   concurrent.futures    import ProcessPoolExecutor
+from   itertools             import repeat
+import numpy                 as np
+import os
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  evaluate_cantera_batch
+# ----------------------------------------------------------------------------------------------------------------------
+def evaluate_cantera_batch(combustor,T,P,mdot,FAR,number_of_processes = 1):
+    '''
+    Computes the Emission Indices of a combustor with the Chemical Reactor
+    Network of evaluate_cantera at several independent operating points.
+    The points are shared among a pool of processes, each of which parses
+    the kinetic mechanisms once and reuses them for all of its points.
+
+    Assumptions: The operating points are independent. The points are
+    evaluated in this process if number_of_processes is 1.
+
+    Source: None
+
+    Inputs:
+        combustor            - combustor                                  [-]
+        T                    - stagnation temperatures                    [K]
+        P                    - stagnation pressures                       [Pa]
+        mdot                 - air mass flow rates                        [kg/s]
+        FAR                  - fuel-to-air ratios                         [-]
+        number_of_processes  - size of the process pool, all the
+                               available processors if None               [-]
+
+    Outputs:
+        results.
+          EI_CO2, EI_CO, EI_H2O, EI_NO, EI_NO2 - Emission Indices, one
+                                                 per operating point      [-]
+    '''
+    T    = np.ravel(T)
+    P    = np.ravel(P)
+    mdot = np.ravel(mdot)
+    FAR  = np.ravel(FAR)
+
+    if number_of_processes == 1:
+        point_results = list(map(evaluate_cantera,repeat(combustor),T,P,mdot,FAR))
+    else:
+        workers   = number_of_processes if number_of_processes is not None else os.cpu_count()
+        chunksize = max(1,len(T)//(4*workers))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            point_results = list(executor.map(evaluate_cantera,repeat(combustor,len(T)),T,P,mdot,FAR,chunksize=chunksize))
+
+    results        = Data()
+    results.EI_CO2 = np.array([point.EI_CO2 for point in point_results],dtype=float)
+    results.EI_CO  = np.array([point.EI_CO  for point in point_results],dtype=float)
+    results.EI_H2O = np.array([point.EI_H2O for point in point_results],dtype=float)
+    results.EI_NO  = np.array([point.EI_NO  for point in point_results],dtype=float)
+    results.EI_NO2 = np.array([point.EI_NO2 for point in point_results],dtype=float)
+
+    return results
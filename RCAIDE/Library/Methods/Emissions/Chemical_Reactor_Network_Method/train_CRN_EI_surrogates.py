@@ -6,7 +6,7 @@
 
 # RCAIDE imports
 import RCAIDE 
-from RCAIDE.Library.Methods.Emissions.Chemical_Reactor_Network_Method.evaluate_cantera import evaluate_cantera 
+from RCAIDE.Library.Methods.Emissions.Chemical_Reactor_Network_Method.evaluate_cantera_batch import evaluate_cantera_batch 
 
 # package imports    
 import numpy    as np  
@@ -21,6 +21,7 @@ def train_CRN_EI_surrogates(emissions):
     T              = emissions.training.temperature      
     mdot           = emissions.training.air_mass_flowrate
     FAR            = emissions.training.fuel_to_air_ratio
+    processes      = emissions.settings.number_of_processes
     
     vehicle        = emissions.vehicle
     for network in vehicle.networks:   
@@ -48,19 +49,15 @@ def train_CRN_EI_surrogates(emissions):
         emissions.no_combustor = True
         return 
     
-    for p_i in range(len_P):
-        for t_i in range(len_T):
-            for mdot_i in  range(len_mdot):
-                for far_i in  range(len_far):
-                    
-                    # Call cantera 
-                    results = evaluate_cantera(combustor,T[t_i],P[p_i],mdot[mdot_i],FAR[far_i]) 
-                    
-                    EI_CO2[p_i, t_i, mdot_i,far_i] = results.EI_CO2
-                    EI_CO [p_i, t_i, mdot_i,far_i] = results.EI_CO 
-                    EI_H2O[p_i, t_i, mdot_i,far_i] = results.EI_H2O
-                    EI_NO [p_i, t_i, mdot_i,far_i] = results.EI_NO 
-                    EI_NO2[p_i, t_i, mdot_i,far_i] = results.EI_NO2
+    # Call cantera at all the points of the training grid 
+    P_grid, T_grid, mdot_grid, FAR_grid = np.meshgrid(P,T,mdot,FAR,indexing='ij')
+    results = evaluate_cantera_batch(combustor,T_grid,P_grid,mdot_grid,FAR_grid,processes) 
+    
+    EI_CO2[:] = np.reshape(results.EI_CO2,EI_CO2.shape)
+    EI_CO [:] = np.reshape(results.EI_CO ,EI_CO.shape )
+    EI_H2O[:] = np.reshape(results.EI_H2O,EI_H2O.shape)
+    EI_NO [:] = np.reshape(results.EI_NO ,EI_NO.shape )
+    EI_NO2[:] = np.reshape(results.EI_NO2,EI_NO2.shape)
     
     emissions.training.EI_CO2 = EI_CO2
     emissions.training.EI_CO =  EI_CO
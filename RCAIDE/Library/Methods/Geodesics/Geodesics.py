@@ -371,7 +371,7 @@ class Geodesic:
             m = (Geodesic.nC1_ - l) // 2        # order of polynomial in eps^2
             c[l] = d * Math.polyval(m, coeff, o, eps2) / coeff[o + m + 1]
             o += m + 2
-            d *= eps
+            d = d * eps
 
     @staticmethod
     def _C1pf(eps, c):
@@ -391,7 +391,7 @@ class Geodesic:
             m = (Geodesic.nC1p_ - l) // 2 # order of polynomial in eps^2
             c[l] = d * Math.polyval(m, coeff, o, eps2) / coeff[o + m + 1]
             o += m + 2
-            d *= eps
+            d = d * eps
 
     @staticmethod
     def _A2m1f(eps):
@@ -421,7 +421,7 @@ class Geodesic:
             m = (Geodesic.nC2_ - l) // 2        # order of polynomial in eps^2
             c[l] = d * Math.polyval(m, coeff, o, eps2) / coeff[o + m + 1]
             o += m + 2
-            d *= eps
+            d = d * eps
 
     def __init__(self, a, f):
         """Construct a Geodesic object
@@ -561,7 +561,7 @@ class Geodesic:
         o = 0
         for l in range(1, Geodesic.nC3_): # l is index of C3[l]
             m = Geodesic.nC3_ - l - 1       # order of polynomial in eps
-            mult *= eps
+            mult = mult * eps
             c[l] = mult * Math.polyval(m, self._C3x, o, eps)
             o += m + 1
 
@@ -575,7 +575,7 @@ class Geodesic:
             m = Geodesic.nC4_ - l - 1    # order of polynomial in eps
             c[l] = mult * Math.polyval(m, self._C4x, o, eps)
             o += m + 1
-            mult *= eps
+            mult = mult * eps
 
     # return s12b, m12b, m0, M12, M21
     def _Lengths(self, eps, sig12,
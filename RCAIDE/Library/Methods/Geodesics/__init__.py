@@ -13,4 +13,6 @@ from .Geodesics import Geodesic
 from .Geodesics import Distance
 from .Geodesics import Math
 from .Geodesics import Geodesic_Calculate
-from .compute_point_to_point_geospacial_data import compute_point_to_point_geospacial_data
\ No newline at end of file
+from .compute_point_to_point_geospacial_data import compute_point_to_point_geospacial_data
+from .compute_geodesic_inverse               import compute_geodesic_inverse
+from .compute_geodesic_direct                import compute_geodesic_direct
\ No newline at end of file
@@ -0,0 +1,119 @@
+# RCAIDE/Library/Methods/Geodesics/compute_geodesic_direct.py
+#
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+from RCAIDE.Framework.Core                     import Data
+from .Geodesics                                import Geodesic, Constants
+from .geodesic_array_math                      import ang_round, ang_normalize, lat_fix, sincosd, atan2d, norm
+
+# package imports
+import numpy as np
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  compute_geodesic_direct
+# ----------------------------------------------------------------------------------------------------------------------
+def compute_geodesic_direct(lat1, lon1, azi1, s12, a = Constants.WGS84_a, f = Constants.WGS84_f):
+    """This solves the direct geodesic problem (position reached after travelling a distance along a given
+    azimuth) for arrays of starting points, azimuths and distances at once, following the GeodesicLine
+    position computation of GeographicLib.
+
+    Assumptions:
+        None
+
+    Source:
+        Karney, C. F. F., "Algorithms for geodesics", J. Geodesy 87, 43-55 (2013)
+
+    Inputs:
+        lat1, lon1   - coordinates of the first points                     [degrees]
+        azi1         - azimuth at the first points                         [degrees]
+        s12          - distance from the first points, in the units of a   [meters]
+        a            - equatorial radius of the ellipsoid                  [meters]
+        f            - flattening of the ellipsoid                         [unitless]
+
+    Outputs:
+        geodesic.latitude         - latitude of the second points          [degrees]
+        geodesic.longitude        - longitude of the second points         [degrees]
+        geodesic.final_azimuth    - azimuth at the second points           [degrees]
+        geodesic.arc_length       - arc length on the auxiliary sphere     [degrees]
+
+    Properties Used:
+        N/A
+    """
+    geod                   = Geodesic(a, f)
+    lat1, lon1, azi1, s12  = np.broadcast_arrays(*[np.asarray(x, dtype=float) for x in (lat1, lon1, azi1, s12)])
+    nC1                    = Geodesic.nC1_ + 1
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # starting point and azimuth on the auxiliary sphere
+        salp1, calp1 = sincosd(ang_round(ang_normalize(azi1)))
+        sbet1, cbet1 = sincosd(ang_round(lat_fix(lat1)))
+        sbet1, cbet1 = norm(sbet1 * geod._f1, cbet1)
+        cbet1        = np.maximum(Geodesic.tiny_, cbet1)
+
+        salp0 = salp1 * cbet1
+        calp0 = np.hypot(calp1, salp1 * sbet1)
+
+        ssig1 = sbet1; somg1 = salp0 * sbet1
+        csig1 = comg1 = np.where((sbet1 != 0) | (calp1 != 0), cbet1 * calp1, 1.)
+        ssig1, csig1 = norm(ssig1, csig1)
+
+        k2    = calp0**2 * geod._ep2
+        eps   = k2 / (2 * (1 + np.sqrt(1 + k2)) + k2)
+
+        A1m1  = Geodesic._A1m1f(eps)
+        C1a   = [0.]*nC1
+        Geodesic._C1f(eps, C1a)
+        B11   = Geodesic._SinCosSeries(True, ssig1, csig1, C1a)
+        s     = np.sin(B11); c = np.cos(B11)
+        stau1 = ssig1 * c + csig1 * s
+        ctau1 = csig1 * c - ssig1 * s
+        C1pa  = [0.]*nC1
+        Geodesic._C1pf(eps, C1pa)
+
+        A3c   = -geod.f * salp0 * geod._A3f(eps)
+        C3a   = [0.]*Geodesic.nC3_
+        geod._C3f(eps, C3a)
+        B31   = Geodesic._SinCosSeries(True, ssig1, csig1, C3a)
+
+        # arc length from the distance
+        tau12  = s12 / (geod._b * (1 + A1m1))
+        s      = np.sin(tau12); c = np.cos(tau12)
+        B12    = - Geodesic._SinCosSeries(True, stau1 * c + ctau1 * s, ctau1 * c - stau1 * s, C1pa)
+        sig12  = tau12 - (B12 - B11)
+        ssig12 = np.sin(sig12); csig12 = np.cos(sig12)
+        if abs(geod.f) > 0.01:
+            # one Newton step for strongly flattened ellipsoids
+            ssig2  = ssig1 * csig12 + csig1 * ssig12
+            csig2  = csig1 * csig12 - ssig1 * ssig12
+            B12    = Geodesic._SinCosSeries(True, ssig2, csig2, C1a)
+            serr   = (1 + A1m1) * (sig12 + (B12 - B11)) - s12 / geod._b
+            sig12  = sig12 - serr / np.sqrt(1 + k2 * ssig2**2)
+            ssig12 = np.sin(sig12); csig12 = np.cos(sig12)
+
+        # end point on the auxiliary sphere
+        ssig2 = ssig1 * csig12 + csig1 * ssig12
+        csig2 = csig1 * csig12 - ssig1 * ssig12
+        sbet2 = calp0 * ssig2
+        cbet2 = np.hypot(salp0, calp0 * csig2)
+        csig2 = np.where(cbet2 == 0, Geodesic.tiny_, csig2)
+        cbet2 = np.where(cbet2 == 0, Geodesic.tiny_, cbet2)
+        salp2 = salp0
+        calp2 = calp0 * csig2
+
+        # longitude difference
+        somg2 = salp0 * ssig2
+        comg2 = csig2
+        omg12 = np.arctan2(somg2 * comg1 - comg2 * somg1, comg2 * comg1 + somg2 * somg1)
+        lam12 = omg12 + A3c * (sig12 + (Geodesic._SinCosSeries(True, ssig2, csig2, C3a) - B31))
+        lon12 = np.degrees(lam12)
+
+    geodesic               = Data()
+    geodesic.latitude      = atan2d(sbet2, geod._f1 * cbet2)
+    geodesic.longitude     = ang_normalize(ang_normalize(lon1) + ang_normalize(lon12))
+    geodesic.final_azimuth = atan2d(salp2, calp2)
+    geodesic.arc_length    = np.degrees(sig12)
+
+    return geodesic
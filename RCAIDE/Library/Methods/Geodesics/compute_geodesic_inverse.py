@@ -0,0 +1,399 @@
+# RCAIDE/Library/Methods/Geodesics/compute_geodesic_inverse.py
+#
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+from RCAIDE.Framework.Core                     import Data
+from .Geodesics                                import Geodesic, Constants
+from .geodesic_array_math                      import ang_round, lat_fix, ang_diff, sincosd, sincosde, atan2d, norm
+
+# package imports
+import numpy as np
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  compute_geodesic_inverse
+# ----------------------------------------------------------------------------------------------------------------------
+def compute_geodesic_inverse(lat1, lon1, lat2, lon2, a = Constants.WGS84_a, f = Constants.WGS84_f):
+    """This solves the inverse geodesic problem (distance and azimuths between two points) for arrays of
+    coordinate pairs at once. It follows the same steps as Geodesic._GenInverse, with every branch
+    evaluated as an array operation and Newton's method iterated until all pairs have converged.
+
+    Assumptions:
+        Oblate (or spherical) ellipsoid, i.e. f >= 0
+
+    Source:
+        Karney, C. F. F., "Algorithms for geodesics", J. Geodesy 87, 43-55 (2013)
+
+    Inputs:
+        lat1, lon1   - coordinates of the first points                     [degrees]
+        lat2, lon2   - coordinates of the second points                    [degrees]
+        a            - equatorial radius of the ellipsoid                  [meters]
+        f            - flattening of the ellipsoid                         [unitless]
+
+    Outputs:
+        geodesic.distance         - distance between the points, in the units of a   [meters]
+        geodesic.initial_azimuth  - azimuth at the first points                      [degrees]
+        geodesic.final_azimuth    - azimuth at the second points                     [degrees]
+        geodesic.arc_length       - arc length on the auxiliary sphere               [degrees]
+
+    Properties Used:
+        N/A
+    """
+    if f < 0:
+        raise ValueError('the batch geodesic solver only supports oblate ellipsoids')
+
+    geod                    = Geodesic(a, f)
+    lat1, lon1, lat2, lon2  = np.broadcast_arrays(*[np.asarray(x, dtype=float) for x in (lat1, lon1, lat2, lon2)])
+    shape                   = lat1.shape
+    lat1, lon1, lat2, lon2  = lat1.ravel(), lon1.ravel(), lat2.ravel(), lon2.ravel()
+    n_pairs                 = len(lat1)
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        # Compute longitude difference and make it positive
+        lon12, lon12s  = ang_diff(lon1, lon2)
+        lonsign        = np.copysign(1., lon12)
+        lon12          = lonsign * lon12
+        lon12s         = lonsign * lon12s
+        lam12          = np.radians(lon12)
+        slam12, clam12 = sincosde(lon12, lon12s)
+        lon12s         = (180 - lon12) - lon12s
+
+        # Swap points so that point with higher (abs) latitude is point 1 and make lat1 <= 0
+        lat1     = ang_round(lat_fix(lat1))
+        lat2     = ang_round(lat_fix(lat2))
+        swapp    = np.where((np.abs(lat1) < np.abs(lat2)) | np.isnan(lat2), -1., 1.)
+        lonsign  = lonsign * swapp
+        lat1, lat2 = np.where(swapp < 0, lat2, lat1), np.where(swapp < 0, lat1, lat2)
+        latsign  = np.copysign(1., -lat1)
+        lat1     = lat1 * latsign
+        lat2     = lat2 * latsign
+
+        sbet1, cbet1 = sincosd(lat1)
+        sbet1, cbet1 = norm(sbet1 * geod._f1, cbet1)
+        cbet1        = np.maximum(Geodesic.tiny_, cbet1)
+        sbet2, cbet2 = sincosd(lat2)
+        sbet2, cbet2 = norm(sbet2 * geod._f1, cbet2)
+        cbet2        = np.maximum(Geodesic.tiny_, cbet2)
+
+        # force bet2 = +/- bet1 exactly when these quantities vanish
+        polar        = cbet1 < -sbet1
+        sbet2        = np.where(polar & (cbet2 == cbet1), np.copysign(sbet1, sbet2), sbet2)
+        cbet2        = np.where(~polar & (np.abs(sbet2) == -sbet1), cbet1, cbet2)
+
+        dn1 = np.sqrt(1 + geod._ep2 * sbet1**2)
+        dn2 = np.sqrt(1 + geod._ep2 * sbet2**2)
+
+        a12   = np.full(n_pairs, np.nan)
+        s12x  = np.full(n_pairs, np.nan)
+        salp1 = np.full(n_pairs, np.nan)
+        calp1 = np.full(n_pairs, np.nan)
+        salp2 = np.full(n_pairs, np.nan)
+        calp2 = np.full(n_pairs, np.nan)
+
+        # Endpoints on a single full meridian
+        meridian = (lat1 == -90) | (slam12 == 0)
+        m        = np.where(meridian)[0]
+        if len(m) > 0:
+            m_calp1 = clam12[m]; m_salp1 = slam12[m]
+            ssig1   = sbet1[m];  csig1   = m_calp1 * cbet1[m]
+            ssig2   = sbet2[m];  csig2   = cbet2[m]
+            sig12   = np.arctan2(np.maximum(0.0, csig1 * ssig2 - ssig1 * csig2) + 0.0, csig1 * csig2 + ssig1 * ssig2)
+            m_s12x, m12x, _, _, _ = geod._Lengths(geod._n, sig12, ssig1, csig1, dn1[m], ssig2, csig2, dn2[m], cbet1[m], cbet2[m],
+                                                  Geodesic.DISTANCE | Geodesic.REDUCEDLENGTH, [0.]*(Geodesic.nC1_ + 1), [0.]*(Geodesic.nC2_ + 1))
+            shortest = (sig12 < 1) | (m12x >= 0)
+            zero     = (sig12 < 3 * Geodesic.tiny_) | ((sig12 < Geodesic.tol0_) & ((m_s12x < 0) | (m12x < 0)))
+            sig12    = np.where(zero, 0.0, sig12)
+            m_s12x   = np.where(zero, 0.0, m_s12x)
+
+            # m12 < 0, i.e., prolate and too close to anti-podal
+            meridian[m[~shortest]] = False
+            m          = m[shortest]
+            s12x[m]    = m_s12x[shortest] * geod._b
+            a12[m]     = np.degrees(sig12[shortest])
+            salp1[m]   = m_salp1[shortest]
+            calp1[m]   = m_calp1[shortest]
+            salp2[m]   = 0.0
+            calp2[m]   = 1.0
+
+        # Geodesic runs along equator
+        equatorial = ~meridian & (sbet1 == 0) & ((f <= 0) | (lon12s >= f * 180))
+        e          = np.where(equatorial)[0]
+        salp1[e]   = 1.0; calp1[e] = 0.0
+        salp2[e]   = 1.0; calp2[e] = 0.0
+        s12x[e]    = geod.a * lam12[e]
+        a12[e]     = lon12[e] / geod._f1
+
+        # General case, find a starting point for Newton's method
+        g = np.where(~meridian & ~equatorial)[0]
+        if len(g) > 0:
+            start = inverse_start(geod, sbet1[g], cbet1[g], dn1[g], sbet2[g], cbet2[g], dn2[g], lam12[g], slam12[g], clam12[g])
+            salp1[g] = start.salp1
+            calp1[g] = start.calp1
+
+            # Short lines
+            short           = start.sig12 >= 0
+            sg              = g[short]
+            s12x[sg]        = start.sig12[short] * geod._b * start.dnm[short]
+            a12[sg]         = np.degrees(start.sig12[short])
+            salp2[sg]       = start.salp2[short]
+            calp2[sg]       = start.calp2[short]
+
+            # Newton's method
+            ng = g[~short]
+            if len(ng) > 0:
+                sol         = inverse_newton(geod, sbet1[ng], cbet1[ng], dn1[ng], sbet2[ng], cbet2[ng], dn2[ng],
+                                             salp1[ng], calp1[ng], slam12[ng], clam12[ng])
+                s12b, _, _, _, _ = geod._Lengths(sol.eps, sol.sig12, sol.ssig1, sol.csig1, dn1[ng], sol.ssig2, sol.csig2, dn2[ng],
+                                                 cbet1[ng], cbet2[ng], Geodesic.DISTANCE, [0.]*(Geodesic.nC1_ + 1), [0.]*(Geodesic.nC2_ + 1))
+                s12x[ng]    = s12b * geod._b
+                a12[ng]     = np.degrees(sol.sig12)
+                salp1[ng]   = sol.salp1
+                calp1[ng]   = sol.calp1
+                salp2[ng]   = sol.salp2
+                calp2[ng]   = sol.calp2
+
+        # Convert calp, salp to azimuth accounting for lonsign, swapp, latsign.
+        swap           = swapp < 0
+        salp1, salp2   = np.where(swap, salp2, salp1), np.where(swap, salp1, salp2)
+        calp1, calp2   = np.where(swap, calp2, calp1), np.where(swap, calp1, calp2)
+        salp1          = salp1 * swapp * lonsign
+        calp1          = calp1 * swapp * latsign
+        salp2          = salp2 * swapp * lonsign
+        calp2          = calp2 * swapp * latsign
+
+    geodesic                 = Data()
+    geodesic.distance        = (0.0 + s12x).reshape(shape)
+    geodesic.initial_azimuth = atan2d(salp1, calp1).reshape(shape)
+    geodesic.final_azimuth   = atan2d(salp2, calp2).reshape(shape)
+    geodesic.arc_length      = a12.reshape(shape)
+
+    return geodesic
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  inverse_start
+# ----------------------------------------------------------------------------------------------------------------------
+def inverse_start(geod, sbet1, cbet1, dn1, sbet2, cbet2, dn2, lam12, slam12, clam12):
+    """Array version of Geodesic._InverseStart, finds a starting value for Newton's method. Entries of sig12
+    that are not negative are short lines that do not need Newton's method."""
+    sbet12  = sbet2 * cbet1 - cbet2 * sbet1
+    cbet12  = cbet2 * cbet1 + sbet2 * sbet1
+    sbet12a = sbet2 * cbet1 + cbet2 * sbet1
+
+    shortline = (cbet12 >= 0) & (sbet12 < 0.5) & (cbet2 * lam12 < 0.5)
+    sbetm2    = (sbet1 + sbet2)**2
+    sbetm2    = sbetm2 / (sbetm2 + (cbet1 + cbet2)**2)
+    dnm       = np.sqrt(1 + geod._ep2 * sbetm2)
+    omg12     = lam12 / (geod._f1 * dnm)
+    somg12    = np.where(shortline, np.sin(omg12), slam12)
+    comg12    = np.where(shortline, np.cos(omg12), clam12)
+
+    salp1     = cbet2 * somg12
+    calp1     = np.where(comg12 >= 0,
+                         sbet12 + cbet2 * sbet1 * somg12**2 / (1 + comg12),
+                         sbet12a - cbet2 * sbet1 * somg12**2 / (1 - comg12))
+    ssig12    = np.hypot(salp1, calp1)
+    csig12    = sbet1 * sbet2 + cbet1 * cbet2 * comg12
+
+    # really short lines
+    really_short  = shortline & (ssig12 < geod._etol2)
+    salp2         = cbet1 * somg12
+    calp2         = sbet12 - cbet1 * sbet2 * np.where(comg12 >= 0, somg12**2 / (1 + comg12), 1 - comg12)
+    salp2, calp2  = norm(salp2, calp2)
+    sig12         = np.where(really_short, np.arctan2(ssig12, csig12), -1.)
+    salp2         = np.where(really_short, salp2, np.nan)
+    calp2         = np.where(really_short, calp2, np.nan)
+    dnm           = np.where(really_short, dnm, np.nan)
+
+    # near anti-podal points, scale lam12 and bet2 to x, y coordinate system where antipodal point is at origin
+    spherical = (abs(geod._n) >= 0.1) | (csig12 >= 0) | (ssig12 >= 6 * abs(geod._n) * np.pi * cbet1**2)
+    antipodal = ~really_short & ~spherical
+    if np.any(antipodal):
+        lam12x   = np.arctan2(-slam12, -clam12)
+        k2       = sbet1**2 * geod._ep2
+        eps      = k2 / (2 * (1 + np.sqrt(1 + k2)) + k2)
+        lamscale = geod.f * cbet1 * geod._A3f(eps) * np.pi
+        betscale = lamscale * cbet1
+        x        = lam12x / lamscale
+        y        = sbet12a / betscale
+
+        # strip near cut
+        strip        = (y > -Geodesic.tol1_) & (x > -1 - Geodesic.xthresh_)
+        strip_salp1  = np.minimum(1.0, -x)
+        strip_calp1  = - np.sqrt(1 - strip_salp1**2)
+
+        # estimate alp1 by solving the astroid problem
+        k            = astroid(x, y)
+        omg12a       = lamscale * (-x * k / (1 + k))
+        somg12       = np.sin(omg12a)
+        comg12       = -np.cos(omg12a)
+        astroid_salp1 = cbet2 * somg12
+        astroid_calp1 = sbet12a - cbet2 * sbet1 * somg12**2 / (1 - comg12)
+
+        salp1 = np.where(antipodal, np.where(strip, strip_salp1, astroid_salp1), salp1)
+        calp1 = np.where(antipodal, np.where(strip, strip_calp1, astroid_calp1), calp1)
+
+    # Sanity check on starting guess.  Backwards check allows NaN through.
+    valid        = ~(salp1 <= 0)
+    nsalp1, ncalp1 = norm(salp1, calp1)
+    salp1        = np.where(valid, nsalp1, 1.)
+    calp1        = np.where(valid, ncalp1, 0.)
+
+    start       = Data()
+    start.sig12 = sig12
+    start.salp1 = salp1
+    start.calp1 = calp1
+    start.salp2 = salp2
+    start.calp2 = calp2
+    start.dnm   = dnm
+
+    return start
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  astroid
+# ----------------------------------------------------------------------------------------------------------------------
+def astroid(x, y):
+    """Array version of Geodesic._Astroid, solves k^4+2*k^3-(x^2+y^2-1)*k^2-2*y^2*k-y^2 = 0 for the positive root k"""
+    p    = x**2
+    q    = y**2
+    r    = (p + q - 1) / 6
+    S    = p * q / 4
+    r2   = r**2
+    r3   = r * r2
+    disc = S * (S + 2 * r3)
+
+    T3   = S + r3
+    T3   = T3 + np.where(T3 < 0, -np.sqrt(np.abs(disc)), np.sqrt(np.abs(disc)))
+    T    = np.cbrt(T3)
+    u_real    = r + T + np.where(T != 0, r2 / T, 0)
+    ang       = np.arctan2(np.sqrt(np.abs(disc)), -(S + r3))
+    u_complex = r + 2 * r * np.cos(ang / 3)
+    u    = np.where(disc >= 0, u_real, u_complex)
+
+    v    = np.sqrt(u**2 + q)
+    uv   = np.where(u < 0, q / (v - u), u + v)
+    w    = (uv - q) / (2 * v)
+    k    = uv / (np.sqrt(uv + w**2) + w)
+
+    return np.where((q == 0) & (r <= 0), 0., k)
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  lambda12
+# ----------------------------------------------------------------------------------------------------------------------
+def lambda12(geod, sbet1, cbet1, dn1, sbet2, cbet2, dn2, salp1, calp1, slam120, clam120, diffp):
+    """Array version of Geodesic._Lambda12, solves the hybrid problem"""
+    # Break degeneracy of equatorial line
+    calp1 = np.where((sbet1 == 0) & (calp1 == 0), -Geodesic.tiny_, calp1)
+
+    salp0 = salp1 * cbet1
+    calp0 = np.hypot(calp1, salp1 * sbet1)
+
+    ssig1 = sbet1; somg1 = salp0 * sbet1
+    csig1 = comg1 = calp1 * cbet1
+    ssig1, csig1 = norm(ssig1, csig1)
+
+    # Enforce symmetries in the case abs(bet2) = -bet1
+    salp2 = np.where(cbet2 != cbet1, salp0 / cbet2, salp1)
+    calp2 = np.where((cbet2 != cbet1) | (np.abs(sbet2) != -sbet1),
+                     np.sqrt((calp1 * cbet1)**2 + np.where(cbet1 < -sbet1, (cbet2 - cbet1) * (cbet1 + cbet2),
+                                                           (sbet1 - sbet2) * (sbet1 + sbet2))) / cbet2,
+                     np.abs(calp1))
+
+    ssig2 = sbet2; somg2 = salp0 * sbet2
+    csig2 = comg2 = calp2 * cbet2
+    ssig2, csig2 = norm(ssig2, csig2)
+
+    # sig12 = sig2 - sig1, limit to [0, pi]
+    sig12  = np.arctan2(np.maximum(0.0, csig1 * ssig2 - ssig1 * csig2) + 0.0, csig1 * csig2 + ssig1 * ssig2)
+
+    # omg12 = omg2 - omg1, limit to [0, pi]
+    somg12 = np.maximum(0.0, comg1 * somg2 - somg1 * comg2) + 0.0
+    comg12 = comg1 * comg2 + somg1 * somg2
+    eta    = np.arctan2(somg12 * clam120 - comg12 * slam120, comg12 * clam120 + somg12 * slam120)
+
+    k2     = calp0**2 * geod._ep2
+    eps    = k2 / (2 * (1 + np.sqrt(1 + k2)) + k2)
+    C3a    = [0.]*Geodesic.nC3_
+    geod._C3f(eps, C3a)
+    B312   = (Geodesic._SinCosSeries(True, ssig2, csig2, C3a) - Geodesic._SinCosSeries(True, ssig1, csig1, C3a))
+    domg12 = -geod.f * geod._A3f(eps) * salp0 * (sig12 + B312)
+    lam12  = eta + domg12
+
+    if diffp:
+        _, m12b, _, _, _ = geod._Lengths(eps, sig12, ssig1, csig1, dn1, ssig2, csig2, dn2, cbet1, cbet2,
+                                         Geodesic.REDUCEDLENGTH, [0.]*(Geodesic.nC1_ + 1), [0.]*(Geodesic.nC2_ + 1))
+        dlam12 = np.where(calp2 == 0, - 2 * geod._f1 * dn1 / sbet1, m12b * geod._f1 / (calp2 * cbet2))
+    else:
+        dlam12 = np.full(np.shape(lam12), np.nan)
+
+    return lam12, salp2, calp2, sig12, ssig1, csig1, ssig2, csig2, eps, dlam12
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  inverse_newton
+# ----------------------------------------------------------------------------------------------------------------------
+def inverse_newton(geod, sbet1, cbet1, dn1, sbet2, cbet2, dn2, salp1, calp1, slam12, clam12):
+    """Solves lambda12(alp1) - lam12 = 0 for all pairs with Newton's method, falling back to bisection of the
+    bracketing range (alp1a, alp1b) exactly as in Geodesic._GenInverse. Pairs are removed from the active set as
+    they converge."""
+    n      = len(sbet1)
+    tiny   = Geodesic.tiny_
+    tol0   = Geodesic.tol0_
+    salp1a = np.full(n, tiny); calp1a = np.full(n,  1.0)
+    salp1b = np.full(n, tiny); calp1b = np.full(n, -1.0)
+    tripn  = np.zeros(n, dtype=bool)
+    tripb  = np.zeros(n, dtype=bool)
+    salp1  = salp1.copy()
+    calp1  = calp1.copy()
+
+    sol        = Data()
+    outputs    = ['salp2', 'calp2', 'sig12', 'ssig1', 'csig1', 'ssig2', 'csig2', 'eps']
+    for name in outputs:
+        sol[name] = np.full(n, np.nan)
+
+    active = np.arange(n)
+    numit  = 0
+    while numit < Geodesic.maxit2_ and len(active) > 0:
+        i   = active
+        res = lambda12(geod, sbet1[i], cbet1[i], dn1[i], sbet2[i], cbet2[i], dn2[i], salp1[i], calp1[i],
+                       slam12[i], clam12[i], numit < Geodesic.maxit1_)
+        v, dv = res[0], res[-1]
+        for name, value in zip(outputs, res[1:-1]):
+            sol[name][i] = value
+
+        # Reversed test to allow escape with NaNs
+        done   = tripb[i] | ~(np.abs(v) >= np.where(tripn[i], 8, 1) * tol0)
+        keep   = ~done
+        i, v, dv = i[keep], v[keep], dv[keep]
+        s1, c1 = salp1[i], calp1[i]
+
+        # Update bracketing values
+        update_b = (v > 0) & ((numit > Geodesic.maxit1_) | (c1/s1 > calp1b[i]/salp1b[i]))
+        update_a = ~update_b & (v < 0) & ((numit > Geodesic.maxit1_) | (c1/s1 < calp1a[i]/salp1a[i]))
+        salp1b[i[update_b]] = s1[update_b]; calp1b[i[update_b]] = c1[update_b]
+        salp1a[i[update_a]] = s1[update_a]; calp1a[i[update_a]] = c1[update_a]
+
+        numit += 1
+        dalp1  = -v/dv
+        sdalp1 = np.sin(dalp1); cdalp1 = np.cos(dalp1)
+        nsalp1 = s1 * cdalp1 + c1 * sdalp1
+        newton = (numit < Geodesic.maxit1_) & (dv > 0) & (nsalp1 > 0) & (np.abs(dalp1) < np.pi)
+
+        # Newton step, use convergence conditions based on epsilon instead of sqrt(epsilon) where the slope vanishes
+        ns1, nc1 = norm(nsalp1, c1 * cdalp1 - s1 * sdalp1)
+
+        # Otherwise use the midpoint of the bracket as the next estimate
+        bs1, bc1 = norm((salp1a[i] + salp1b[i])/2, (calp1a[i] + calp1b[i])/2)
+        bisect_tripb = ((np.abs(salp1a[i] - bs1) + (calp1a[i] - bc1) < Geodesic.tolb_) |
+                        (np.abs(bs1 - salp1b[i]) + (bc1 - calp1b[i]) < Geodesic.tolb_))
+
+        salp1[i] = np.where(newton, ns1, bs1)
+        calp1[i] = np.where(newton, nc1, bc1)
+        tripn[i] = newton & (np.abs(v) <= 16 * tol0)
+        tripb[i] = ~newton & bisect_tripb
+        active   = i
+
+    sol.salp1 = salp1
+    sol.calp1 = calp1
+
+    return sol
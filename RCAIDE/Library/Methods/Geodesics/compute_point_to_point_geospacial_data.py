@@ -6,9 +6,8 @@
 # ----------------------------------------------------------------------------------------------------------------------
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------  
-import RCAIDE
-from RCAIDE.Framework.Core import Units 
-from scipy.interpolate import griddata
+from RCAIDE.Library.Methods.Topography          import load_topography, interpolate_topography
+from .compute_geodesic_inverse                   import compute_geodesic_inverse
 import numpy as np
 
 # ----------------------------------------------------------------------
@@ -42,14 +41,14 @@ def compute_point_to_point_geospacial_data(settings):
     origin_coordinates   = np.asarray(settings.aircraft_origin_coordinates)
     destination_coordinates = np.asarray(settings.aircraft_destination_coordinates)
     
-    # extract data from file 
-    data  = np.loadtxt(settings.topography_file)
-    Long  = data[:,0]
-    Lat   = data[:,1]
-    Elev  = data[:,2] 
-
-    x_min_coord = np.min(Lat)
-    y_min_coord = np.min(Long)
+    # extract data from file, only the grid axes of the memory-mapped file are read for the map corner
+    topography  = load_topography(settings.topography_file)
+    if topography.regular_grid:
+        x_min_coord = topography.latitude[0]
+        y_min_coord = topography.longitude[0]
+    else:
+        x_min_coord = np.min(topography.points[:,1])
+        y_min_coord = np.min(topography.points[:,0])
     dep_lat     = origin_coordinates[0]
     dep_long    = origin_coordinates[1]
     des_lat     = destination_coordinates[0]
@@ -65,17 +64,20 @@ def compute_point_to_point_geospacial_data(settings):
     x1_coord                 = np.array([des_lat,y_min_coord])
     y1_coord                 = np.array([x_min_coord,des_long])  
     
-    x0 = RCAIDE.Framework.Analyses.Geodesics.Geodesics.Calculate_Distance(x0_coord,bottom_left_map_coords) * Units.kilometers
-    y0 = RCAIDE.Framework.Analyses.Geodesics.Geodesics.Calculate_Distance(y0_coord,bottom_left_map_coords) * Units.kilometers
-    x1 = RCAIDE.Framework.Analyses.Geodesics.Geodesics.Calculate_Distance(x1_coord,bottom_left_map_coords) * Units.kilometers
-    y1 = RCAIDE.Framework.Analyses.Geodesics.Geodesics.Calculate_Distance(y1_coord,bottom_left_map_coords) * Units.kilometers
+    map_coords  = np.array([x0_coord,y0_coord,x1_coord,y1_coord])
+    x0,y0,x1,y1 = compute_geodesic_inverse(map_coords[:,0],map_coords[:,1],bottom_left_map_coords[0],bottom_left_map_coords[1]).distance
     
     lat_flag             = np.where(origin_coordinates<0)[0]
     origin_coordinates[lat_flag]  = origin_coordinates[lat_flag] + 360 
     long_flag            = np.where(destination_coordinates<0)[0]
     destination_coordinates[long_flag] = destination_coordinates[long_flag] + 360 
-    z0                   = griddata((Lat,Long), Elev, (np.array([origin_coordinates[0]]),np.array([origin_coordinates[1]])), method='nearest')[0]
-    z1                   = griddata((Lat,Long), Elev, (np.array([destination_coordinates[0]]),np.array([destination_coordinates[1]])), method='nearest')[0] 
+    
+    # the elevations of the origin and destination only need the window of the map covering the route
+    route_latitude       = np.array([origin_coordinates[0],destination_coordinates[0]])
+    route_longitude      = np.array([origin_coordinates[1],destination_coordinates[1]])
+    bounding_box         = [np.min(route_latitude),np.max(route_latitude),np.min(route_longitude),np.max(route_longitude)]
+    route_topography     = load_topography(settings.topography_file, bounding_box = bounding_box)
+    z0,z1                = interpolate_topography(route_topography,route_latitude,route_longitude, method='nearest')
     dep_loc              = np.array([x0,y0,z0])
     des_loc              = np.array([x1,y1,z1])
     
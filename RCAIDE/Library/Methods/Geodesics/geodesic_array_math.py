@@ -0,0 +1,88 @@
+# RCAIDE/Library/Methods/Geodesics/geodesic_array_math.py
+#
+# Array versions of the angle routines of the Math class in Geodesics.py, used by the batch geodesic solvers.
+# Each function mirrors its scalar counterpart elementwise.
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+import numpy as np
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Angle routines
+# ----------------------------------------------------------------------------------------------------------------------
+def ang_round(x):
+    """Round angles so that small values underflow to zero, see Math.AngRound"""
+    z = 1/16.0
+    y = np.abs(x)
+    y = np.where(y < z, z - (z - y), y)
+    return np.copysign(y, x)
+
+def remainder(x, y):
+    """Remainder of x/y in the range [-y/2, y/2], see Math.remainder"""
+    r = np.fmod(x, y)
+    r = np.where(r >  y/2, r - y, r)
+    r = np.where(r < -y/2, r + y, r)
+    return r
+
+def ang_normalize(x):
+    """Reduce angles to [-180,180], see Math.AngNormalize"""
+    y = remainder(x, 360.)
+    return np.where(np.abs(y) == 180, np.copysign(180.0, x), y)
+
+def lat_fix(x):
+    """Replace latitudes outside [-90,90] by NaN, see Math.LatFix"""
+    return np.where(np.abs(x) > 90, np.nan, x)
+
+def error_free_sum(u, v):
+    """Error free transformation of a sum, see Math.sum"""
+    s   = u + v
+    up  = s - v
+    vpp = s - up
+    up  = up - u
+    vpp = vpp - v
+    t   = np.where(s == 0, s, 0.0 - (up + vpp))
+    return s, t
+
+def ang_diff(x, y):
+    """Compute y - x reduced to [-180,180] accurately, see Math.AngDiff"""
+    d, t = error_free_sum(remainder(-x, 360.), remainder(y, 360.))
+    d, t = error_free_sum(remainder(d, 360.), t)
+    d    = np.where((d == 0) | (np.abs(d) == 180), np.copysign(d, np.where(t == 0, y - x, -t)), d)
+    return d, t
+
+def quadrant_rotate(s, c, q, x):
+    """Rotate the sine and cosine of the reduced angle back into quadrant q"""
+    q      = np.mod(q, 4)
+    s, c   = (np.select([q == 1, q == 2, q == 3], [c, -s, -c], s),
+              np.select([q == 1, q == 2, q == 3], [-s, -c, s], c))
+    c      = c + 0.0
+    s      = np.where(s == 0, np.copysign(s, x), s)
+    return s, c
+
+def sincosd(x):
+    """Sine and cosine of angles in degrees, see Math.sincosd"""
+    r = np.where(np.isfinite(x), np.fmod(x, 360.), np.nan)
+    q = np.where(np.isnan(r), 0, np.round(r / 90))
+    r = np.radians(r - 90 * q)
+    return quadrant_rotate(np.sin(r), np.cos(r), q, x)
+
+def sincosde(x, t):
+    """Sine and cosine of (x + t) in degrees with x in [-180, 180], see Math.sincosde"""
+    q = np.where(np.isfinite(x), np.round(x / 90), 0)
+    r = np.radians(ang_round(x - 90 * q + t))
+    return quadrant_rotate(np.sin(r), np.cos(r), q, x)
+
+def atan2d(y, x):
+    """atan2(y, x) with the result in degrees, see Math.atan2d"""
+    swap    = np.abs(y) > np.abs(x)
+    x, y    = np.where(swap, y, x), np.where(swap, x, y)
+    q       = np.where(swap, 2, 0) + np.where(x < 0, 1, 0)
+    x       = np.abs(x)
+    ang     = np.degrees(np.arctan2(y, x))
+    return np.select([q == 1, q == 2, q == 3], [np.copysign(180, y) - ang, 90 - ang, -90 + ang], ang)
+
+def norm(x, y):
+    """Normalize two-vectors, see Math.norm"""
+    r = np.hypot(x, y)
+    return x/r, y/r
@@ -12,5 +12,6 @@ from .compute_naca_4series        import compute_naca_4series
 from .compute_airfoil_properties  import compute_airfoil_properties
 from .import_airfoil_dat          import import_airfoil_dat
 from .import_airfoil_geometry     import import_airfoil_geometry 
+from .import_cached_airfoil_geometry import import_cached_airfoil_geometry, clear_airfoil_geometry_cache
 from .import_airfoil_polars       import import_airfoil_polars
 from .convert_airfoil_to_meshgrid import convert_airfoil_to_meshgrid
\ No newline at end of file
@@ -9,7 +9,7 @@
 
 # RCAIDE imports 
 import RCAIDE
-from RCAIDE.Framework.Core                                                          import Data , Units 
+from RCAIDE.Framework.Core                                                          import Data , Units, hash_data 
 from RCAIDE.Library.Methods.Aerodynamics.Airfoil_Panel_Method.airfoil_analysis      import airfoil_analysis
 from RCAIDE.Library.Methods.Geometry.Airfoil.import_airfoil_polars                  import import_airfoil_polars 
 from RCAIDE.Library.Methods.Geometry.Airfoil.compute_naca_4series                   import compute_naca_4series  
@@ -20,18 +20,28 @@ from RCAIDE.Library.Methods.Aerodynamics.AERODAS.post_stall_coefficients
 import numpy as np
 from scipy.interpolate     import RegularGridInterpolator
 from RCAIDE.Framework.Core import interp2d 
+import hashlib
+import tempfile
+import sys
+import os
+
+# hash of the source of the airfoil analysis modules, computed once per process and part of every cache key
+source_code_hash = []
 
 # ----------------------------------------------------------------------------------------------------------------------
 #  compute_airfoil_properties
 # ----------------------------------------------------------------------------------------------------------------------   
-def compute_airfoil_properties(airfoil_geometry, airfoil_polar_files = None,use_pre_stall_data=True):
+def compute_airfoil_properties(airfoil_geometry, airfoil_polar_files = None,use_pre_stall_data=True,use_cache=True,cache_directory=None):
     """This computes the aerodynamic properties and coefficients of an airfoil in stall regimes using pre-stall
     characterstics and AERODAS formation for post stall characteristics. This is useful for 
     obtaining a more accurate prediction of wing and blade loading as well as aeroacoustics. Pre stall characteristics 
     are obtained in the form of a text file of airfoil polar data obtained from airfoiltools.com
     
     Assumptions:
-        None 
+        Computed properties are stored in cache_directory under a hash of the airfoil geometry, the contents of 
+        the polar files, use_pre_stall_data and the source of the analysis modules. Later calls with the same 
+        inputs, in this or in other processes, load the stored arrays and rebuild the interpolators instead of 
+        repeating the panel and boundary layer analysis.
         
     Source
         None
@@ -41,6 +51,8 @@ def compute_airfoil_properties(airfoil_geometry, airfoil_polar_files = None,use_
     airfoil_polar_files                     <string>
     boundary_layer_files                    <string>
     use_pre_stall_data                      [Boolean]
+    use_cache                               [Boolean]
+    cache_directory                         <string>, defaults to the temporary directory
     Outputs:
     airfoil_data.
         cl_polars                           [unitless]
@@ -51,6 +63,21 @@ def compute_airfoil_properties(airfoil_geometry, airfoil_polar_files = None,use_
     Properties Used:
     N/A
     """     
+    if use_cache:
+        if cache_directory is None:
+            cache_directory = os.path.join(tempfile.gettempdir(),'RCAIDE_airfoil_properties')
+        key        = airfoil_properties_key(airfoil_geometry,airfoil_polar_files,use_pre_stall_data)
+        cache_file = os.path.join(cache_directory,key + '.npz')
+        if os.path.isfile(cache_file):
+            try:
+                return load_airfoil_properties(cache_file)
+            except (OSError,ValueError,KeyError):
+                pass
+        
+        Airfoil_Data = compute_airfoil_properties(airfoil_geometry,airfoil_polar_files,use_pre_stall_data,use_cache=False)
+        save_airfoil_properties(Airfoil_Data,cache_file)
+        return Airfoil_Data
+    
     Airfoil_Data   = Data()  
    
     # ----------------------------------------------------------------------------------------
@@ -296,4 +323,125 @@ def compute_boundary_layer_properties(airfoil_geometry,Airfoil_Data):
     Airfoil_Data.lift_distribution                                  = fL 
     Airfoil_Data.drag_distribution                                  = fD  
     
-    return Airfoil_Data
\ No newline at end of file
+    return Airfoil_Data
+
+def airfoil_properties_key(airfoil_geometry,airfoil_polar_files,use_pre_stall_data): 
+    '''Computes the content hash identifying the properties of an airfoil
+    
+    Source:
+    None
+    
+    Assumptions:
+    Polar files are identified by their contents, not their paths
+    
+    Inputs:
+    airfoil_geometry     <data_structure>
+    airfoil_polar_files  <string>
+    use_pre_stall_data   [Boolean]
+    
+    Outputs:
+    key                  <string>
+    
+    Properties Used:
+    N/A
+    '''
+    if not source_code_hash:
+        source_hash = hashlib.sha1()
+        modules     = [__name__, airfoil_analysis.__module__, import_airfoil_polars.__module__, compute_naca_4series.__module__,
+                       pre_stall_coefficients.__module__, post_stall_coefficients.__module__]
+        package     = os.path.dirname(sys.modules[airfoil_analysis.__module__].__file__)
+        files       = [sys.modules[module].__file__ for module in modules] + \
+                      [os.path.join(package,name) for name in sorted(os.listdir(package)) if name.endswith('.py')]
+        for file_name in files:
+            with open(file_name,'rb') as source:
+                source_hash.update(source.read())
+        source_code_hash.append(source_hash.hexdigest())
+    
+    key_hash = hashlib.sha1(source_code_hash[0].encode())
+    key_hash.update(repr(bool(use_pre_stall_data)).encode())
+    hash_data(key_hash,airfoil_geometry)
+    if airfoil_polar_files != None:
+        for polar_file in airfoil_polar_files:
+            with open(polar_file,'rb') as polar:
+                key_hash.update(polar.read())
+    else:
+        key_hash.update(b'no polar files')
+    
+    return key_hash.hexdigest()
+
+def save_airfoil_properties(Airfoil_Data,cache_file): 
+    '''Writes the arrays of computed airfoil properties to a cache file. Interpolators are not stored, they are 
+    rebuilt from the stored distributions on loading. The file is written under a temporary name and then 
+    renamed so that other processes never read a partial file.
+    
+    Source:
+    None
+    
+    Assumptions:
+    Failure to write the cache file is ignored 
+    
+    Inputs:
+    Airfoil_Data   <data_structure>
+    cache_file     <string>
+    
+    Outputs:
+    None
+    
+    Properties Used:
+    N/A
+    '''
+    arrays = {}
+    for key,value in Airfoil_Data.items():
+        if key == 'boundary_layer':
+            for bl_key,bl_value in value.items():
+                arrays['boundary_layer.' + bl_key] = np.asarray(bl_value)
+        elif not callable(value):
+            arrays[key] = np.asarray(value)
+    
+    try:
+        os.makedirs(os.path.dirname(cache_file),exist_ok=True)
+        partial_file = cache_file + '.' + str(os.getpid()) + '.tmp'
+        with open(partial_file,'wb') as f:
+            np.savez(f,**arrays)
+        os.replace(partial_file,cache_file)
+    except OSError:
+        pass
+    
+    return 
+
+def load_airfoil_properties(cache_file): 
+    '''Reads airfoil properties from a cache file and rebuilds the lift and drag distribution interpolators
+    
+    Source:
+    None
+    
+    Assumptions:
+    None 
+    
+    Inputs:
+    cache_file     <string>
+    
+    Outputs:
+    Airfoil_Data   <data_structure>
+    
+    Properties Used:
+    N/A
+    '''
+    Airfoil_Data = Data()
+    with np.load(cache_file,allow_pickle=False) as arrays:
+        for key in arrays.files:
+            if key.startswith('boundary_layer.'):
+                if 'boundary_layer' not in Airfoil_Data:
+                    Airfoil_Data.boundary_layer = Data()
+                Airfoil_Data.boundary_layer[key.split('.',1)[1]] = arrays[key]
+                continue
+            
+            if key == 'lift_distribution':
+                # interpolators precede the distributions, as in compute_boundary_layer_properties
+                AoA_sweep = Airfoil_Data.boundary_layer.angle_of_attacks
+                Re_sweep  = Airfoil_Data.boundary_layer.reynolds_numbers
+                Airfoil_Data.lift_distribution_func = RegularGridInterpolator((AoA_sweep,Re_sweep),arrays['lift_distribution'],method = 'linear',   bounds_error=False, fill_value=None)
+                Airfoil_Data.drag_distribution_func = RegularGridInterpolator((AoA_sweep,Re_sweep),arrays['drag_distribution'],method = 'linear',   bounds_error=False, fill_value=None)
+            Airfoil_Data[key] = arrays[key]
+    
+    return Airfoil_Data
@@ -0,0 +1,72 @@
+# RCAIDE/Library/Methods/Geometry/Airfoil/import_cached_airfoil_geometry.py
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+from .import_airfoil_geometry import import_airfoil_geometry
+
+# package imports
+from copy import deepcopy
+import os
+
+# process-wide store of parsed airfoil geometries
+airfoil_geometry_cache = {}
+
+# ----------------------------------------------------------------------------------------------------------------------
+# import_cached_airfoil_geometry
+# ----------------------------------------------------------------------------------------------------------------------
+def import_cached_airfoil_geometry(airfoil_geometry_file, npoints = 201,surface_interpolation = 'cubic'):
+    """This returns the geometry of an airfoil coordinate file, parsing the file only the first
+    time a given file and number of points is requested in the process
+
+    Assumptions:
+    The file is parsed again if it has been modified since it was cached. A copy of the cached
+    geometry is returned so that callers may modify it freely.
+
+    Source:
+    None
+
+    Inputs:
+    airfoil_geometry_file   - path of airfoil coordinate file                                 <string>
+    npoints                 - number of points used to discretize the airfoil                [unitless]
+    surface_interpolation   - type of interpolation used in the SciPy function               <string>
+
+    Outputs:
+    airfoil_data            - see import_airfoil_geometry                                    [None]
+
+    Properties Used:
+    N/A
+    """
+
+    file_path = os.path.abspath(airfoil_geometry_file)
+    key       = (file_path,npoints,surface_interpolation,os.path.getmtime(file_path))
+
+    if key not in airfoil_geometry_cache:
+        airfoil_geometry_cache[key] = import_airfoil_geometry(airfoil_geometry_file,npoints,surface_interpolation)
+
+    return deepcopy(airfoil_geometry_cache[key])
+
+# ----------------------------------------------------------------------------------------------------------------------
+# clear_airfoil_geometry_cache
+# ----------------------------------------------------------------------------------------------------------------------
+def clear_airfoil_geometry_cache():
+    """This removes all parsed airfoil geometries from the process-wide cache
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    None
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+    airfoil_geometry_cache.clear()
+
+    return
@@ -0,0 +1,78 @@
+# RCAIDE/Methods/Noise/Common/compute_nearest_microphones.py
+#
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# package imports
+import numpy as np
+from scipy.spatial import cKDTree
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  generate_microphone_spatial_index
+# ----------------------------------------------------------------------------------------------------------------------
+def generate_microphone_spatial_index(microphone_locations,MSL_altitude):
+    """This builds a KD-tree over the ground microphone locations, expressed in the same frame as the
+    aircraft positions used by compute_relative_noise_evaluation_locations, so that the microphones
+    closest to the aircraft can be found without sorting every microphone at every noise time step
+
+    Assumptions:
+        The microphone locations do not change during the mission
+
+    Source:
+        N/A
+
+    Inputs:
+        microphone_locations  - array of microphone locations on the ground                   [meters]
+        MSL_altitude          - flag indicating if microphone elevations are included         [boolean]
+
+    Outputs:
+        microphone_index      - KD-tree of microphone locations                               [None]
+
+    Properties Used:
+        N/A
+    """
+    points       = np.array(microphone_locations,dtype=float)
+    if MSL_altitude:
+        points[:,2] = -microphone_locations[:,2]
+    else:
+        points[:,2] = 0.
+
+    microphone_index = cKDTree(points)
+
+    return microphone_index
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  compute_nearest_microphones
+# ----------------------------------------------------------------------------------------------------------------------
+def compute_nearest_microphones(microphone_index,settings,noise_pos,n):
+    """This finds the n ground microphones closest to the aircraft at each noise time step
+
+    Assumptions:
+        Distances are those of the relative microphone locations of compute_relative_noise_evaluation_locations
+
+    Source:
+        N/A
+
+    Inputs:
+        microphone_index                   - KD-tree from generate_microphone_spatial_index   [None]
+        settings.aircraft_origin_location  - origin of aircraft position vector               [meters]
+        noise_pos                          - aircraft position at each noise time step        [meters]
+        n                                  - number of microphones in stencil                 [unitless]
+
+    Outputs:
+        locs                               - indices of closest microphones, nearest first    [unitless]
+
+    Properties Used:
+        N/A
+    """
+    source_points      = np.zeros((len(noise_pos),3))
+    source_points[:,0] = settings.aircraft_origin_location[0] + noise_pos[:,0]
+    source_points[:,1] = settings.aircraft_origin_location[1] + noise_pos[:,1]
+    source_points[:,2] = noise_pos[:,2]
+
+    k        = min(n,microphone_index.n)
+    _ , locs = microphone_index.query(source_points,k = k)
+    locs     = np.reshape(locs,(len(noise_pos),k))
+
+    return locs
@@ -8,10 +8,10 @@
 # ---------------------------------------------------------------------------------------------------------------------- 
 # RCAIDE imports  
 from RCAIDE.Framework.Core import Units, Data
-from RCAIDE.Framework.Analyses.Geodesics.Geodesics import Calculate_Distance
+from RCAIDE.Framework.Analyses.Geodesics.Geodesics import Calculate_Distances
+from RCAIDE.Library.Methods.Topography             import load_topography, interpolate_topography
 
 # package imports 
-from scipy.interpolate import griddata
 import numpy as np 
  
 # ---------------------------------------------------------------------------------------------------------------------- 
@@ -57,10 +57,13 @@ def generate_terrain_microphone_locations(settings):
     x_res = settings.microphone_x_resolution 
     
     # extract data from file 
-    data  = np.loadtxt(settings.topography_file) # settings.topography_file) CHANGED 10-15-2024
-    Long  = data[:,0]
-    Lat   = data[:,1]
-    Elev  = data[:,2] 
+    topography  = load_topography(settings.topography_file)
+    if topography.regular_grid:
+        Lat     = topography.latitude
+        Long    = topography.longitude 
+    else:
+        Lat     = topography.points[:,1]
+        Long    = topography.points[:,0]
     
     x_min_coord = np.min(Lat)
     x_max_coord = np.max(Lat)
@@ -76,12 +79,11 @@ def generate_terrain_microphone_locations(settings):
     bottom_left_map_coords   = np.array([x_min_coord,y_min_coord])  
     bottom_right_map_coords  = np.array([x_min_coord,y_max_coord]) 
     
-    x_dist_max = Calculate_Distance(top_left_map_coords,bottom_left_map_coords) * Units.kilometers
-    y_dist_max = Calculate_Distance(bottom_right_map_coords,bottom_left_map_coords) * Units.kilometers
+    x_dist_max, y_dist_max = Calculate_Distances(np.array([top_left_map_coords,bottom_right_map_coords]),bottom_left_map_coords) * Units.kilometers
     
     [y_pts,x_pts]      = np.meshgrid(np.linspace(0,y_dist_max,y_res),np.linspace(0,x_dist_max,x_res))
     [long_deg,lat_deg] = np.meshgrid(np.linspace(np.min(Long),np.max(Long),y_res),np.linspace(np.min(Lat),np.max(Lat),x_res)) 
-    z_deg              = griddata((Lat,Long), Elev, (lat_deg, long_deg), method='linear')        
+    z_deg              = interpolate_topography(topography, lat_deg, long_deg, method='linear')        
     cartesian_pts      = np.dstack((np.dstack((x_pts[:,:,None],y_pts[:,:,None] )),z_deg[:,:,None])).reshape(x_res*y_res,3)
     lat_long_pts       = np.dstack((np.dstack((lat_deg[:,:,None],long_deg[:,:,None] )),z_deg[:,:,None])).reshape(x_res*y_res,3)  
     return cartesian_pts , lat_long_pts
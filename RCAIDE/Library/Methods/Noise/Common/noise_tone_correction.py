@@ -34,137 +34,98 @@ def noise_tone_correction(SPL):
     """
         
         
-    # Defining the necessary arrays for the tone correction procedure
+    # Defining the necessary arrays for the tone correction procedure, bands are on the last axis
+    SPL                 = np.asarray(SPL,dtype=float)
     n_cpts              = len(SPL[:,0,0])
     n_mic               = len(SPL[0,:,0])
-    slope               = np.zeros(23)
-    aux_ds              = np.zeros(23)
-    delta_slope         = np.zeros(23)
-    tone_correction_max = np.zeros((n_cpts,n_mic))
+    slope               = np.zeros((n_cpts,n_mic,23))
+    delta_slope         = np.zeros((n_cpts,n_mic,23),dtype=bool)
     
-    for j in range(n_cpts):
-        for k in range(n_mic):
-            #------------------------------------------------------------
-            #STEP 1 - Calculation of slopes in the one-third octave bands
-            #------------------------------------------------------------
-            for i in range(3,23):
-                slope[i] = SPL[j][k][i]-SPL[j][k][i-1]
-            
-            #------------------------------------------------------------
-            #STEP 2 - Encircle the necessary values of the slope
-            #------------------------------------------------------------    
-            for i in range(3,23):        
-                aux_ds[i] = np.abs(slope[i]-slope[i-1])
-                
-                if aux_ds[i]>5:
-                    delta_slope[i]=1
-                else:
-                    delta_slope[i]=0
-            #------------------------------------------------------------
-            #STEP 3 - Encircle the slope
-            #------------------------------------------------------------
-            step3  = np.zeros(23)
-            step3a = np.zeros(23)
-            step3b = np.zeros(23)
-            for i in range(3,23):
-                if delta_slope[i]==1 and slope[i]>0 and slope[i]>slope[i-1]:
-                    step3a[i]   = 1
-                if  delta_slope[i]==1 and slope[i]<=0 and slope[i-1]>0:
-                    step3b[i-1] = 1
-            step3 = step3a + step3b
-            
-            #------------------------------------------------------------
-            #STEP 4 - Compute new adjusted sound pressure level
-            #------------------------------------------------------------        
-            step4 = np.zeros(23)
-            for i in range(1,23):
-                if step3[i]!=0 and i<23:
-                    step4[i] = (SPL[j][k][i-1]+SPL[j][k][i+1])/2
-                if step3[i]!=0 and i==22:
-                    step4[i] = SPL[j][k][i-1]+slope[i-1]
-                if step3[i]==0:
-                    step4[i] = SPL[j][k][i]
-                    
-            #------------------------------------------------------------
-            #STEP 5 - Recompute new slope
-            #------------------------------------------------------------    
-            step5 = np.zeros(25)
-            for i in range(3,23):
-                step5[i]=step4[i]-step4[i-1]
-            step5[2]  = step5[3]
-            step5[24] = step5[23]
-            
-            #------------------------------------------------------------
-            #STEP 6 - Compute the arithmetic average of the three adjacent slopes
-            #------------------------------------------------------------
-            step6 = np.zeros(23)
-            for i in range(2,22):
-                if i==22:
-                    step6[i] = (step5[i]+step5[i+1])/3.
-                else:
-                    step6[i] = (step5[i]+step5[i+1]+step5[i+2])/3.
-            
-            #------------------------------------------------------------
-            #STEP 7 - Compute the final 1/3 octave band
-            #------------------------------------------------------------
-            step7 = np.zeros(24)
-            step7[2]=SPL[j][k][2]
-            for i in range(3,23):
-                step7[i] = step7[i-1]+step6[i-1]
+    #------------------------------------------------------------
+    #STEP 1 - Calculation of slopes in the one-third octave bands
+    #------------------------------------------------------------
+    slope[:,:,3:23] = SPL[:,:,3:23]-SPL[:,:,2:22]
+    
+    #------------------------------------------------------------
+    #STEP 2 - Encircle the necessary values of the slope
+    #------------------------------------------------------------    
+    delta_slope[:,:,3:23] = np.abs(slope[:,:,3:23]-slope[:,:,2:22]) > 5
+    
+    #------------------------------------------------------------
+    #STEP 3 - Encircle the slope
+    #------------------------------------------------------------
+    step3a = np.zeros((n_cpts,n_mic,23),dtype=bool)
+    step3b = np.zeros((n_cpts,n_mic,23),dtype=bool)
+    step3a[:,:,3:23] = delta_slope[:,:,3:23] & (slope[:,:,3:23]>0) & (slope[:,:,3:23]>slope[:,:,2:22])
+    step3b[:,:,2:22] = delta_slope[:,:,3:23] & (slope[:,:,3:23]<=0) & (slope[:,:,2:22]>0)
+    step3  = step3a | step3b
+    
+    #------------------------------------------------------------
+    #STEP 4 - Compute new adjusted sound pressure level
+    #------------------------------------------------------------        
+    step4            = np.zeros((n_cpts,n_mic,23))
+    encircled        = (SPL[:,:,0:22]+SPL[:,:,2:24])/2
+    encircled[:,:,21]= SPL[:,:,21]+slope[:,:,21]
+    step4[:,:,1:23]  = np.where(step3[:,:,1:23],encircled,SPL[:,:,1:23])
             
-            #------------------------------------------------------------
-            #STEP 8 - Compute the differences between original SPL and final SPL
-            #------------------------------------------------------------    
-            step8 = np.zeros(24)
-            step8_aux = np.zeros(24)
-            for i in range(2,16):
-                step8_aux[i] = SPL[j][k][i]-step7[i]
-                if step8_aux[i]>=1.5:
-                    step8[i] = step8_aux[i]
-                else:
-                    step8[i]=0.
-            for i in range(17,22):
-                step8_aux[i] = SPL[j][k][i]-step7[i]
-                if step8_aux[i]>=1.5 and SPL[j][k][i]>0 and SPL[j][k][i+1]>0 and SPL[j][k][i-1]>0:
-                    step8[i] = step8_aux[i]
-                else:
-                    step8[i] = 0.
+    #------------------------------------------------------------
+    #STEP 5 - Recompute new slope
+    #------------------------------------------------------------    
+    step5            = np.zeros((n_cpts,n_mic,25))
+    step5[:,:,3:23]  = step4[:,:,3:23]-step4[:,:,2:22]
+    step5[:,:,2]     = step5[:,:,3]
+    step5[:,:,24]    = step5[:,:,23]
+    
+    #------------------------------------------------------------
+    #STEP 6 - Compute the arithmetic average of the three adjacent slopes
+    #------------------------------------------------------------
+    step6            = np.zeros((n_cpts,n_mic,23))
+    step6[:,:,2:22]  = (step5[:,:,2:22]+step5[:,:,3:23]+step5[:,:,4:24])/3.
+    
+    #------------------------------------------------------------
+    #STEP 7 - Compute the final 1/3 octave band
+    #------------------------------------------------------------
+    step7            = np.zeros((n_cpts,n_mic,24))
+    step7[:,:,2]     = SPL[:,:,2]
+    step7[:,:,3:23]  = SPL[:,:,2,None] + np.cumsum(step6[:,:,2:22],axis=2)
+    
+    #------------------------------------------------------------
+    #STEP 8 - Compute the differences between original SPL and final SPL
+    #------------------------------------------------------------    
+    step8_aux        = SPL-step7
+    positive         = SPL > 0
+    tonal            = step8_aux >= 1.5
+    tonal[:,:,16]    = False
+    tonal[:,:,17:22] = tonal[:,:,17:22] & positive[:,:,17:22] & positive[:,:,18:23] & positive[:,:,16:21]
+    tonal[:,:,22]    = False
+    tonal[:,:,23]    = tonal[:,:,23] & positive[:,:,23] & positive[:,:,22]
+    tonal[:,:,0:2]   = False
+    step8            = np.where(tonal,step8_aux,0.)
+        
+    #------------------------------------------------------------
+    #STEP 9 - Determine tone correction factors for each 1/3 octave band
+    #------------------------------------------------------------
+    F                = step8[:,:,0:23]
+    low              = (F>=1.5) & (F<3)
+    mid              = (F>=3) & (F<20)
+    high             = F>20
+    tone_correction  = np.zeros((n_cpts,n_mic,23))
+    tone_correction  = np.where(low,(F/3)-0.5,tone_correction)
+    tone_correction  = np.where(mid,F/6.,tone_correction)
+    tone_correction  = np.where(high,3+(1/3),tone_correction)
+    
+    # mid frequency bands carry twice the correction 
+    mid_bands                    = slice(10,20)
+    tone_correction[:,:,mid_bands] = np.where(low[:,:,mid_bands],(2/3)*(F[:,:,mid_bands])-1,tone_correction[:,:,mid_bands])
+    tone_correction[:,:,mid_bands] = np.where(mid[:,:,mid_bands],F[:,:,mid_bands]/3.,tone_correction[:,:,mid_bands])
+    tone_correction[:,:,mid_bands] = np.where(high[:,:,mid_bands],6+(2/3),tone_correction[:,:,mid_bands])
+    tone_correction[:,:,0:2]     = 0.
+    tone_correction[:,:,9]       = 0.
+    tone_correction[:,:,20]      = 0.
             
-            step8_aux[23] = SPL[j][k][23]-step7[23]
-            if step8_aux[23]>=1.5 and SPL[j][k][23]>0 and SPL[j][k][22]>0:
-                step8[23] = step8_aux[23]
-            else:
-                step8[23]=0.
-                
-            #------------------------------------------------------------
-            #STEP 9 - Determine tone correction factors for each 1/3 octave band
-            #------------------------------------------------------------
-            tone_correction = np.zeros(23)
-            for i in range(2,9):
-                if step8[i]>=1.5 and step8[i]<3:
-                    tone_correction[i] = (step8[i]/3)-0.5
-                if step8[i]>=3 and step8[i]<20:
-                    tone_correction[i] = step8[i]/6.
-                if step8[i]>20:
-                    tone_correction[i] = 3+(1/3)
-            for i in range(10,20):
-                if step8[i]>=1.5 and step8[i]<3:
-                    tone_correction[i] = (2/3)*(step8[i])-1
-                if step8[i]>=3 and step8[i]<20:
-                    tone_correction[i] = step8[i]/3.
-                if step8[i]>20:
-                    tone_correction[i] = 6+(2/3)
-            for i in range(21,23):
-                if step8[i]>=1.5 and step8[i]<3:
-                    tone_correction[i] = (step8[i]/3)-(1/2)
-                if step8[i]>=3 and step8[i]<20:
-                    tone_correction[i] = step8[i]/6.
-                if step8[i]>20:
-                    tone_correction[i] = 3+(1/3)
-                    
-            #------------------------------------------------------------
-            #STEP 10 - Largest tone correction factor
-            #------------------------------------------------------------
-            tone_correction_max[j,k] = np.max(tone_correction)
+    #------------------------------------------------------------
+    #STEP 10 - Largest tone correction factor
+    #------------------------------------------------------------
+    tone_correction_max = np.max(tone_correction,axis=2)
     
-        return tone_correction_max
+    return tone_correction_max
@@ -69,6 +69,10 @@ def turbofan_engine_noise(microphone_locations,turbofan,aeroacoustic_data,segmen
         SPL_total                       - Sound Pressure Level of the total jet noise        [dB]
 
     """ 
+    # the engine deck only computes the thrust, power and fuel flow rate, not the nozzle conditions of the jet noise
+    if turbofan.use_engine_deck:
+        raise ValueError('the jet noise of ' + turbofan.tag + ' requires its nozzle conditions, which the engine deck does not compute: set use_engine_deck to False')
+
     # unpack   
     Velocity_primary       = aeroacoustic_data.core_nozzle.exit_velocity * 0.92*(turbofan.design_thrust/52700.)   
     Temperature_primary    = aeroacoustic_data.core_nozzle.exit_stagnation_temperature[:,0] 
@@ -44,6 +44,7 @@ def broadband_noise(conditions,propulsor_conditions,coordinates,rotor,settings,N
         aeroacoustic_data                            - data structure of acoustic data                                                    [None] 
         settings                                     - accoustic settings                                                                 [None] 
         res                                          - results data structure                                                             [None] 
+        cpt                                          - control point index or slice of control point indices                              [None] 
     
     Outputs 
        res.                                           *acoustic data is stored and passed in data structures*                                          
@@ -60,7 +61,8 @@ def broadband_noise(conditions,propulsor_conditions,coordinates,rotor,settings,N
         N/A   
     '''     
     aeroacoustic_data       = propulsor_conditions[rotor.tag]
-    num_cpt                 = 1
+    ctrl_pts                = np.atleast_1d(np.arange(conditions._size)[cpt])
+    num_cpt                 = len(ctrl_pts)
     num_mic                 = len(coordinates.X[0,:,0,0,0])  
     num_blades              = len(coordinates.X[0,0,:,0,0])
     num_sec                 = len(coordinates.X[0,0,0,:,0]) 
@@ -107,25 +109,25 @@ def broadband_noise(conditions,propulsor_conditions,coordinates,rotor,settings,N
         L                 = np.tile(L[None,None,None,:,None,None],(num_cpt,num_mic,num_blades,1,num_cf,num_az))
         f                 = np.tile(frequency[None,None,None,None,:,None],(num_cpt,num_mic,num_blades,num_sec,1,num_az)) 
         
-        alpha_disk        = np.tile(alpha[cpt,None,None,:,None,:],(1,num_mic,num_blades,1,num_cf,1))
+        alpha_disk        = np.tile(alpha[ctrl_pts,None,None,:,None,:],(1,num_mic,num_blades,1,num_cf,1))
         V                 = np.zeros((num_cpt,num_mic,num_blades,num_sec,num_cf,num_az,3))
-        V[:,:,:,:,:,:,0]  = -np.tile(Vt[cpt,None,None,:,None,:],(1,num_mic,num_blades,1,num_cf,1)) 
-        V[:,:,:,:,:,:,2]  = np.tile(Va[cpt,None,None,:,None,:],(1,num_mic,num_blades,1,num_cf,1))  
+        V[:,:,:,:,:,:,0]  = -np.tile(Vt[ctrl_pts,None,None,:,None,:],(1,num_mic,num_blades,1,num_cf,1)) 
+        V[:,:,:,:,:,:,2]  = np.tile(Va[ctrl_pts,None,None,:,None,:],(1,num_mic,num_blades,1,num_cf,1))  
         V_tot             = np.linalg.norm(V, axis=6)
-        alpha_tip         = np.tile(alpha_tip[cpt,None,None,None,None,:],(1,num_mic,num_blades,num_sec,num_cf,1))  
-        c_0               = np.tile(speed_of_sound[cpt,:,None,None,None,None],(1,num_mic,num_blades,num_sec,num_cf,num_az))
-        rho               = np.tile(density[cpt,:,None,None,None,None],(1,num_mic,num_blades,num_sec,num_cf,num_az)) 
-        mu                = np.tile(dyna_visc[cpt,:,None,None,None,None],(1,num_mic,num_blades,num_sec,num_cf,num_az)) 
-        R_c               = np.tile(disc_Re[cpt,None,None,:,None,:],(1,num_mic,num_blades,1,num_cf,1))
-        U                 = np.tile(disc_speed[cpt,None,None,:,None,:],(1,num_mic,num_blades,1,num_cf,1))
-        M                 = np.tile(disc_Ma[cpt,None,None,:,None,:],(1,num_mic,num_blades,1,num_cf,1)) # U/c_0 
+        alpha_tip         = np.tile(alpha_tip[ctrl_pts,None,None,None,None,:],(1,num_mic,num_blades,num_sec,num_cf,1))  
+        c_0               = np.tile(speed_of_sound[ctrl_pts,:,None,None,None,None],(1,num_mic,num_blades,num_sec,num_cf,num_az))
+        rho               = np.tile(density[ctrl_pts,:,None,None,None,None],(1,num_mic,num_blades,num_sec,num_cf,num_az)) 
+        mu                = np.tile(dyna_visc[ctrl_pts,:,None,None,None,None],(1,num_mic,num_blades,num_sec,num_cf,num_az)) 
+        R_c               = np.tile(disc_Re[ctrl_pts,None,None,:,None,:],(1,num_mic,num_blades,1,num_cf,1))
+        U                 = np.tile(disc_speed[ctrl_pts,None,None,:,None,:],(1,num_mic,num_blades,1,num_cf,1))
+        M                 = np.tile(disc_Ma[ctrl_pts,None,None,:,None,:],(1,num_mic,num_blades,1,num_cf,1)) # U/c_0 
         M_tot             = V_tot/c_0   
           
-        X_prime_r         = np.tile(coordinates.X_prime_r[cpt,:,:,:,None,None,:],(1,1,1,1,num_cf,num_az,1))
+        X_prime_r         = np.tile(coordinates.X_prime_r[ctrl_pts,:,:,:,None,None,:],(1,1,1,1,num_cf,num_az,1))
         cos_zeta_r        = np.sum(X_prime_r*V, axis = 6)/(np.linalg.norm(X_prime_r, axis = 6)*V_tot) 
-        r_er              = np.tile(np.linalg.norm(coordinates.X_e_r[cpt], axis = 3)[None,:,:,:,None,None],(1,1,1,1,num_cf,num_az))           
-        Phi_er            = np.tile(coordinates.phi_e_r[cpt,:,:,:,None,None],(1,1,1,1,num_cf,num_az))
-        Theta_er          = np.tile(coordinates.theta_e_r[cpt,:,:,:,None,None],(1,1,1,1,num_cf,num_az))    
+        r_er              = np.tile(np.linalg.norm(coordinates.X_e_r[ctrl_pts], axis = 4)[:,:,:,:,None,None],(1,1,1,1,num_cf,num_az))           
+        Phi_er            = np.tile(coordinates.phi_e_r[ctrl_pts,:,:,:,None,None],(1,1,1,1,num_cf,num_az))
+        Theta_er          = np.tile(coordinates.theta_e_r[ctrl_pts,:,:,:,None,None],(1,1,1,1,num_cf,num_az))    
         
         # flatten matrices 
         R_c        = flatten_matrix(R_c,num_cpt,num_mic,num_blades,num_sec,num_cf,num_az)
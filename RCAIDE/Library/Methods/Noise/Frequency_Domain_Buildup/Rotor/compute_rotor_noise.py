@@ -18,8 +18,9 @@ from RCAIDE.Library.Methods.Noise.Frequency_Domain_Buildup.Rotor.harmonic_noise_
 from RCAIDE.Library.Methods.Noise.Frequency_Domain_Buildup.Rotor.broadband_noise           import broadband_noise
 from RCAIDE.Library.Methods.Noise.Common                                                   import atmospheric_attenuation
 from RCAIDE.Library.Methods.Noise.Metrics.A_weighting_metric                               import A_weighting_metric  
-from RCAIDE.Library.Methods.Geometry.Airfoil.import_airfoil_geometry                       import import_airfoil_geometry
+from RCAIDE.Library.Methods.Geometry.Airfoil.import_cached_airfoil_geometry                import import_cached_airfoil_geometry
 from RCAIDE.Library.Methods.Aerodynamics.Airfoil_Panel_Method.airfoil_analysis             import airfoil_analysis
+from RCAIDE.Library.Methods.Aerodynamics.Airfoil_Panel_Method.memoized_airfoil_analysis    import memoized_airfoil_analysis
 
 # Python package imports   
 import numpy as np    
@@ -64,6 +65,10 @@ def compute_rotor_noise(microphone_locations,propulsor,rotor,segment,settings, r
         N/A   
     '''
  
+    # the rotor operating map only computes the integrated loads, not the blade loading the noise is computed from
+    if rotor.use_surrogate:
+        raise ValueError('the noise of rotor ' + rotor.tag + ' requires its blade and disc distributions, which the rotor operating map does not compute: set use_surrogate to False')
+ 
     # unpack 
     conditions           = segment.state.conditions
     propulsor_conditions = conditions.energy[propulsor.tag]
@@ -96,70 +101,93 @@ def compute_rotor_noise(microphone_locations,propulsor,rotor,segment,settings, r
     # compute position vector from point source (or should it be origin) at rotor hub to microphones 
     coordinates   = compute_rotor_point_source_coordinates(propulsor,rotor,conditions,microphone_locations,settings)        
 
-    for cpt in range(num_cpt): 
+    # ----------------------------------------------------------------------------------    
+    # Atmospheric attenuation 
+    # ----------------------------------------------------------------------------------
+    delta_atmo = atmospheric_attenuation(np.linalg.norm(coordinates.X_r[:,0,0,0,:],axis=1),settings.center_frequencies)
+    
+    # ----------------------------------------------------------------------------------
+    # Planar load distribution  
+    # ---------------------------------------------------------------------------------- 
+    if settings.fidelity == 'plane_source': 
+        aeroacoustic_data = propulsor_conditions[rotor.tag]       
+        Re                = aeroacoustic_data.disc_reynolds_number
+        AOA_sec           = aeroacoustic_data.disc_effective_angle_of_attack  
+        a_loc             = rotor.airfoil_polar_stations
+        num_az            = aeroacoustic_data.number_azimuthal_stations     
+        airfoils          = rotor.Airfoils         
+        for jj,airfoil in enumerate(airfoils):
+            airfoil_points      = airfoil.number_of_points 
+        chord_coord             = int(np.floor(airfoil_points/2))       
+        compute_loading         = True 
+            
+        if (identical_propulsors == False) and rotor_index !=0: 
+            prev_aeroacoustic_data                   = propulsor_conditions[previous_rotor_tag]                 
+            prev_aeroacoustic_data                   = propulsor_conditions[rotor.tag]  
+            aeroacoustic_data.disc_lift_distribution = prev_aeroacoustic_data.disc_lift_distribution
+            aeroacoustic_data.disc_drag_distribution = prev_aeroacoustic_data.disc_lift_distribution
+            aeroacoustic_data.disc_lift_coefficient  = prev_aeroacoustic_data.disc_lift_coefficient 
+            aeroacoustic_data.disc_drag_coefficient  = prev_aeroacoustic_data.disc_drag_coefficient  
+            aeroacoustic_data.blade_upper_surface    = prev_aeroacoustic_data.blade_upper_surface
+            aeroacoustic_data.blade_lower_surface    = prev_aeroacoustic_data.blade_lower_surface
+            compute_loading                          = False 
+        else: 
+            # Lift and Drag - coefficients and distributions, filled in chunk by chunk below 
+            aeroacoustic_data.disc_lift_distribution = np.tile(np.zeros_like(Re)[:,:,:,None],(1,1,1,chord_coord))
+            aeroacoustic_data.disc_drag_distribution = np.zeros_like(aeroacoustic_data.disc_lift_distribution)
+            aeroacoustic_data.disc_lift_coefficient  = np.zeros_like(Re)
+            aeroacoustic_data.disc_drag_coefficient  = np.zeros_like(Re) 
+            aeroacoustic_data.blade_upper_surface    = np.zeros_like(aeroacoustic_data.disc_lift_distribution)
+            aeroacoustic_data.blade_lower_surface    = np.zeros_like(aeroacoustic_data.disc_lift_distribution)
+
+    # ----------------------------------------------------------------------------------
+    # Control points are evaluated together in chunks sized to fit the memory budget
+    # ----------------------------------------------------------------------------------
+    chunk_size = control_point_chunk_size(propulsor_conditions[rotor.tag],rotor,coordinates,settings,len(harmonics_blade),len(harmonics_load))
+    
+    for start in range(0,num_cpt,chunk_size): 
+        cpt     = slice(start,min(start + chunk_size,num_cpt))
+        num_chk = cpt.stop - cpt.start
+        
         # ----------------------------------------------------------------------------------
         # Harmonic Noise
         # ---------------------------------------------------------------------------------- 
         # harmonic noise with planar load distribution
         if settings.fidelity == 'plane_source': 
-            aeroacoustic_data = propulsor_conditions[rotor.tag]       
-            Re                = aeroacoustic_data.disc_reynolds_number
-            AOA_sec           = aeroacoustic_data.disc_effective_angle_of_attack  
-            a_loc             = rotor.airfoil_polar_stations
-            num_az            = aeroacoustic_data.number_azimuthal_stations     
-            airfoils          = rotor.Airfoils         
-            for jj,airfoil in enumerate(airfoils):
-                airfoil_points      = airfoil.number_of_points 
-            chord_coord             = int(np.floor(airfoil_points/2))       
-                
-            if (identical_propulsors == False) and rotor_index !=0: 
-                prev_aeroacoustic_data                   = propulsor_conditions[previous_rotor_tag]                 
-                prev_aeroacoustic_data                   = propulsor_conditions[rotor.tag]  
-                aeroacoustic_data.disc_lift_distribution = prev_aeroacoustic_data.disc_lift_distribution
-                aeroacoustic_data.disc_drag_distribution = prev_aeroacoustic_data.disc_lift_distribution
-                aeroacoustic_data.disc_lift_coefficient  = prev_aeroacoustic_data.disc_lift_coefficient 
-                aeroacoustic_data.disc_drag_coefficient  = prev_aeroacoustic_data.disc_drag_coefficient  
-                aeroacoustic_data.blade_upper_surface    = prev_aeroacoustic_data.blade_upper_surface
-                aeroacoustic_data.blade_lower_surface    = prev_aeroacoustic_data.blade_lower_surface
-            else: 
-                # Lift and Drag - coefficients and distributions 
-                fL      = np.tile(np.zeros_like(Re)[:,:,:,None],(1,1,1,chord_coord))
-                fD      = np.zeros_like(fL)
-                CL      = np.zeros_like(Re)
-                CD      = np.zeros_like(Re) 
-                y_up    = np.zeros_like(fL)
-                y_low   = np.zeros_like(fL)
+            if compute_loading: 
+                fL      = aeroacoustic_data.disc_lift_distribution[cpt]
+                fD      = aeroacoustic_data.disc_drag_distribution[cpt]
+                CL      = aeroacoustic_data.disc_lift_coefficient[cpt]
+                CD      = aeroacoustic_data.disc_drag_coefficient[cpt]
+                y_up    = aeroacoustic_data.blade_upper_surface[cpt]
+                y_low   = aeroacoustic_data.blade_lower_surface[cpt]
                                   
                 for jj,airfoil in enumerate(airfoils):    
-                    locs                  = np.where(np.array(a_loc) == jj ) 
-                    alpha_azi             = np.atleast_2d(AOA_sec[cpt,locs,:].flatten())
-                    Re_azi                = np.atleast_2d(Re[cpt,locs,:].flatten())      
+                    locs                  = np.where(np.array(a_loc) == jj )[0] 
+                    alpha_azi             = np.atleast_2d(AOA_sec[cpt][:,locs,:].flatten())
+                    Re_azi                = np.atleast_2d(Re[cpt][:,locs,:].flatten())      
                     pd                    = airfoil.polars 
                     if settings.use_plane_loading_surrogate: 
-                        fL[cpt,locs,:,:]      = pd.lift_distribution_func((alpha_azi,Re_azi)).reshape(1,len(a_loc), num_az,chord_coord) 
-                        fD[cpt,locs,:,:]      = pd.drag_distribution_func((alpha_azi,Re_azi)).reshape(1,len(a_loc), num_az,chord_coord)  
+                        fL[:,locs,:,:]        = pd.lift_distribution_func((alpha_azi,Re_azi)).reshape(num_chk,len(locs), num_az,chord_coord) 
+                        fD[:,locs,:,:]        = pd.drag_distribution_func((alpha_azi,Re_azi)).reshape(num_chk,len(locs), num_az,chord_coord)  
                         cl_invisc             = interp2d(Re_azi,alpha_azi,pd.reynolds_numbers, pd.angle_of_attacks, pd.lift_coefficients)
                         cd_visc               = interp2d(Re_azi,alpha_azi,pd.reynolds_numbers, pd.angle_of_attacks, pd.drag_coefficients)   
-                        CL[cpt,locs,:]        = cl_invisc.reshape(1, len(a_loc), num_az) 
-                        CD[cpt,locs,:]        = cd_visc.reshape(1, len(a_loc), num_az)                             
+                        CL[:,locs,:]          = cl_invisc.reshape(num_chk, len(locs), num_az) 
+                        CD[:,locs,:]          = cd_visc.reshape(num_chk, len(locs), num_az)                             
                     
                     else : 
-                        airfoil_geometry      = import_airfoil_geometry(airfoil.coordinate_file,airfoil_points)
-                        airfoil_properties    = airfoil_analysis(airfoil_geometry,alpha_azi,Re_azi)
-                        fL[cpt,locs,:,:]      = airfoil_properties.fL.reshape(chord_coord, len(a_loc), num_az,1).swapaxes(0, 3)
-                        fD[cpt,locs,:,:]      = airfoil_properties.fD.reshape(chord_coord, len(a_loc), num_az,1).swapaxes(0, 3)
-                        CL[cpt,locs,:]        = airfoil_properties.cl_invisc.reshape(1, len(a_loc), num_az) 
-                        CD[cpt,locs,:]        = airfoil_properties.cd_visc.reshape(1, len(a_loc), num_az) 
-                        
-                    y_up[cpt,locs,:,:]    = airfoil.geometry.y_upper_surface
-                    y_low[cpt,locs,:,:]   = airfoil.geometry.y_lower_surface
+                        airfoil_geometry      = import_cached_airfoil_geometry(airfoil.coordinate_file,airfoil_points)
+                        if settings.use_airfoil_analysis_memoization: 
+                            airfoil_properties = memoized_airfoil_analysis(airfoil_geometry,alpha_azi,Re_azi)
+                        else:
+                            airfoil_properties = airfoil_analysis(airfoil_geometry,alpha_azi,Re_azi)
+                        fL[:,locs,:,:]        = airfoil_properties.fL.reshape(chord_coord,num_chk, len(locs), num_az).transpose(1,2,3,0)
+                        fD[:,locs,:,:]        = airfoil_properties.fD.reshape(chord_coord,num_chk, len(locs), num_az).transpose(1,2,3,0)
+                        CL[:,locs,:]          = airfoil_properties.cl_invisc.reshape(num_chk, len(locs), num_az) 
+                        CD[:,locs,:]          = airfoil_properties.cd_visc.reshape(num_chk, len(locs), num_az) 
                         
-                aeroacoustic_data.disc_lift_distribution = fL
-                aeroacoustic_data.disc_drag_distribution = fD
-                aeroacoustic_data.disc_lift_coefficient  = CL
-                aeroacoustic_data.disc_drag_coefficient  = CD 
-                aeroacoustic_data.blade_upper_surface    = y_up
-                aeroacoustic_data.blade_lower_surface    = y_low                        
+                    y_up[:,locs,:,:]      = airfoil.geometry.y_upper_surface
+                    y_low[:,locs,:,:]     = airfoil.geometry.y_lower_surface   
                         
             harmonic_noise_plane(harmonics_blade,harmonics_load,conditions,propulsor_conditions,coordinates,rotor,settings,Noise,cpt)
         elif settings.fidelity == 'line_source': 
@@ -172,11 +200,6 @@ def compute_rotor_noise(microphone_locations,propulsor,rotor,segment,settings, r
         # ---------------------------------------------------------------------------------- 
         broadband_noise(conditions,propulsor_conditions,coordinates,rotor,settings,Noise,cpt)  
     
-        # ----------------------------------------------------------------------------------    
-        # Atmospheric attenuation 
-        # ----------------------------------------------------------------------------------
-        delta_atmo = atmospheric_attenuation(np.linalg.norm(coordinates.X_r[:,0,0,0,:],axis=1),settings.center_frequencies)
-    
         # ----------------------------------------------------------------------------------    
         # Combine Harmonic (periodic/tonal) and Broadband Noise
         # ----------------------------------------------------------------------------------
@@ -187,13 +210,13 @@ def compute_rotor_noise(microphone_locations,propulsor,rotor,segment,settings, r
         # ----------------------------------------------------------------------------------
         # Summation of spectra from propellers into one SPL and store results
         # ----------------------------------------------------------------------------------
-        Results.SPL[cpt,:]                                 = SPL_arithmetic(SPL_total_1_3_spectrum[0], sum_axis=1) 
-        Results.SPL_dBA[cpt,:]                             = SPL_arithmetic(A_weighting_metric(SPL_total_1_3_spectrum[0],settings.center_frequencies), sum_axis=1) 
-        Results.SPL_harmonic[cpt,:]                        = SPL_arithmetic(Noise.SPL_prop_harmonic_1_3_spectrum[0], sum_axis=1)
-        Results.SPL_broadband[cpt,:]                       = SPL_arithmetic(Noise.SPL_prop_broadband_1_3_spectrum[0], sum_axis=1) 
+        Results.SPL[cpt,:]                                 = SPL_arithmetic(SPL_total_1_3_spectrum, sum_axis=2) 
+        Results.SPL_dBA[cpt,:]                             = SPL_arithmetic(A_weighting_metric(SPL_total_1_3_spectrum,settings.center_frequencies), sum_axis=2) 
+        Results.SPL_harmonic[cpt,:]                        = SPL_arithmetic(Noise.SPL_prop_harmonic_1_3_spectrum, sum_axis=2)
+        Results.SPL_broadband[cpt,:]                       = SPL_arithmetic(Noise.SPL_prop_broadband_1_3_spectrum, sum_axis=2) 
           
         # blade passing frequency   
-        Results.blade_passing_frequencies                  = Noise.f          
+        Results.blade_passing_frequencies                  = Noise.f[-1:]          
         Results.SPL_harmonic_bpf_spectrum[cpt,:,:]         = Noise.SPL_prop_harmonic_bpf_spectrum 
         Results.SPL_harmonic_bpf_spectrum_dBA[cpt,:,:]     = A_weighting_metric(Results.SPL_harmonic_bpf_spectrum[cpt,:,:],Noise.f) 
           
@@ -207,4 +230,50 @@ def compute_rotor_noise(microphone_locations,propulsor,rotor,segment,settings, r
     
     # A-weighted
     conditions.noise[propulsor.tag][rotor.tag] = Results 
-    return rotor.tag 
+    return rotor.tag
+
+# ----------------------------------------------------------------------------------------------------------------------    
+#  Control Point Chunk Size 
+# ----------------------------------------------------------------------------------------------------------------------    
+## @ingroup Methods-Noise-Frequency_Domain_Buildup-Rotor
+def control_point_chunk_size(aeroacoustic_data,rotor,coordinates,settings,num_h_b,num_h_l):
+    ''' Estimates how many control points can be evaluated together by the harmonic and broadband
+    noise functions without the intermediate arrays exceeding the noise memory budget
+    
+    Assumptions:
+    The largest broadband arrays are [control point, microphones, blades, blade sections, center frequencies,
+    azimuthal stations] floats and the largest harmonic arrays are [control point, microphones, blade sections,
+    blade harmonics, loading harmonics, chordwise coordinates] complex numbers. The number of simultaneously
+    allocated arrays of each kind is a conservative estimate.
+
+    Source:
+    None
+    
+    Inputs:
+        aeroacoustic_data        - rotor operating conditions                                  [None]
+        rotor                    - rotor data structure                                        [None]
+        coordinates              - rotor noise source coordinates                              [None]
+        settings.noise_memory_budget - maximum memory allocated to a chunk of control points  [bytes]
+        num_h_b                  - number of blade harmonics                                   [Unitless]
+        num_h_l                  - number of loading harmonics                                 [Unitless]
+                               
+    Outputs:
+        chunk_size               - number of control points evaluated together                 [Unitless]
+     
+    Properties Used:
+        N/A   
+    '''
+    num_mic       = len(coordinates.X[0,:,0,0,0])
+    num_blades    = len(coordinates.X[0,0,:,0,0])
+    num_sec       = len(rotor.radius_distribution)
+    num_cf        = len(settings.center_frequencies)
+    num_az        = aeroacoustic_data.number_azimuthal_stations 
+    chord_coord   = 1
+    for airfoil in rotor.Airfoils:
+        chord_coord = max(chord_coord,int(np.floor(airfoil.number_of_points/2)))
+        
+    broadband_bytes = 64*8*num_mic*num_blades*num_sec*num_cf*num_az
+    harmonic_bytes  = 12*16*num_mic*num_sec*num_h_b*num_h_l*chord_coord 
+    chunk_size      = int(settings.noise_memory_budget // max(broadband_bytes,harmonic_bytes))
+    
+    return max(chunk_size,1) 
@@ -55,6 +55,7 @@ def harmonic_noise_plane(harmonics_blade,harmonics_load,conditions,propulsor_con
         aeroacoustic_data             - data structure of acoustic data                                            [None]
         settings                      - accoustic settings                                                         [None] 
         res                           - results data structure                                                     [None] 
+        cpt                           - control point index or slice of control point indices                      [None] 
 
     Outputs 
         res.                                    *acoustic data is stored and passed in data structures*                                                                            
@@ -74,8 +75,9 @@ def harmonic_noise_plane(harmonics_blade,harmonics_load,conditions,propulsor_con
     '''     
 
     aeroacoustic_data       = propulsor_conditions[rotor.tag] 
-    angle_of_attack         = np.atleast_2d(conditions.aerodynamics.angles.alpha[cpt]) 
-    velocity_vector         = np.atleast_2d(conditions.frames.inertial.velocity_vector[cpt])  
+    ctrl_pts                = np.atleast_1d(np.arange(conditions._size)[cpt])
+    angle_of_attack         = conditions.aerodynamics.angles.alpha[ctrl_pts] 
+    velocity_vector         = conditions.frames.inertial.velocity_vector[ctrl_pts]  
     freestream              = conditions.freestream       
     num_h_b                 = len(harmonics_blade)
     num_h_l                 = len(harmonics_load)
@@ -86,19 +88,19 @@ def harmonic_noise_plane(harmonics_blade,harmonics_load,conditions,propulsor_con
     num_sec                 = len(rotor.radius_distribution) 
     orientation             = np.array(rotor.orientation_euler_angles) * 1 
     body2thrust             = sp.spatial.transform.Rotation.from_rotvec(orientation).as_matrix() 
-    commanded_thrust_vector =  np.atleast_2d(propulsor_conditions.commanded_thrust_vector_angle[cpt]) 
+    commanded_thrust_vector =  propulsor_conditions.commanded_thrust_vector_angle[ctrl_pts] 
     for jj,airfoil in enumerate(airfoils):
         airfoil_points      = airfoil.number_of_points
     chord_coord             = int(np.floor(airfoil_points/2))
  
     # Lift and Drag - coefficients and distributions 
-    fL      = aeroacoustic_data.disc_lift_distribution[cpt][None,:, :]
-    fD      = aeroacoustic_data.disc_lift_distribution[cpt][None,:, :]
-    CL      = aeroacoustic_data.disc_lift_coefficient[cpt][None,:, :]
-    CD      = aeroacoustic_data.disc_drag_coefficient[cpt][None,:, :]
+    fL      = aeroacoustic_data.disc_lift_distribution[ctrl_pts]
+    fD      = aeroacoustic_data.disc_lift_distribution[ctrl_pts]
+    CL      = aeroacoustic_data.disc_lift_coefficient[ctrl_pts]
+    CD      = aeroacoustic_data.disc_drag_coefficient[ctrl_pts]
                 
-    y_u_6   = np.tile(aeroacoustic_data.blade_upper_surface[cpt][None, None, :, 0,None, None, :],(1,num_mic,1,num_h_b,num_h_l,1))
-    y_l_6   = np.tile(aeroacoustic_data.blade_lower_surface[cpt][None, None, :, 0,None, None, :],(1,num_mic,1,num_h_b,num_h_l,1))
+    y_u_6   = np.tile(aeroacoustic_data.blade_upper_surface[ctrl_pts][:, None, :, 0,None, None, :],(1,num_mic,1,num_h_b,num_h_l,1))
+    y_l_6   = np.tile(aeroacoustic_data.blade_lower_surface[ctrl_pts][:, None, :, 0,None, None, :],(1,num_mic,1,num_h_b,num_h_l,1))
     
     # DFT to get loading modes
     CL_k           = sp.fft.rfft(CL, axis=2)
@@ -112,8 +114,8 @@ def harmonic_noise_plane(harmonics_blade,harmonics_load,conditions,propulsor_con
     # [control point, microphones, rotors, radial distribution, blade harmonics, load harmonics]  
     
     # freestream density and speed of sound
-    rho_3          = np.tile(freestream.density[cpt,:,None],(1,num_mic,num_h_b))
-    a_3            = np.tile(freestream.speed_of_sound[cpt,:,None],(1,num_mic,num_h_b))
+    rho_3          = np.tile(freestream.density[ctrl_pts,:,None],(1,num_mic,num_h_b))
+    a_3            = np.tile(freestream.speed_of_sound[ctrl_pts,:,None],(1,num_mic,num_h_b))
     
     B              = rotor.number_of_blades
     
@@ -137,7 +139,7 @@ def harmonic_noise_plane(harmonics_blade,harmonics_load,conditions,propulsor_con
     alpha_6        = np.tile((angle_of_attack + np.arccos(body2thrust[0,0]))[:,:,None,None,None,None],(1,num_mic,num_sec,num_h_b,num_h_l,chord_coord))
     
     # rotor angular speed
-    omega_3        = np.tile(aeroacoustic_data.omega[cpt,:,None],(1,num_mic,num_h_b))   
+    omega_3        = np.tile(aeroacoustic_data.omega[ctrl_pts,:,None],(1,num_mic,num_h_b))   
     
     R              = rotor.radius_distribution
     
@@ -181,20 +183,20 @@ def harmonic_noise_plane(harmonics_blade,harmonics_load,conditions,propulsor_con
     M_r_5          = np.sqrt(M_5**2 + (z_5**2)*(M_t_5**2))
     
     # retarded theta
-    theta_r        = coordinates.theta_hub_r[cpt,:,0,0]
-    theta_r_3      = np.tile(theta_r[None,:,None],(1,1,num_h_b))
-    theta_r_4      = np.tile(theta_r[None,:,None,None],(1,1,num_h_b,num_h_l))
-    theta_r_5      = np.tile(theta_r[None,:,None,None,None],(1,1,num_sec,num_h_b,num_h_l))
-    theta_r_6      = np.tile(theta_r[None,:,None,None,None,None],(1,1,num_sec,num_h_b,num_h_l,chord_coord))
+    theta_r        = coordinates.theta_hub_r[ctrl_pts,:,0,0]
+    theta_r_3      = np.tile(theta_r[:,:,None],(1,1,num_h_b))
+    theta_r_4      = np.tile(theta_r[:,:,None,None],(1,1,num_h_b,num_h_l))
+    theta_r_5      = np.tile(theta_r[:,:,None,None,None],(1,1,num_sec,num_h_b,num_h_l))
+    theta_r_6      = np.tile(theta_r[:,:,None,None,None,None],(1,1,num_sec,num_h_b,num_h_l,chord_coord))
     
     # retarded distance to source
-    Y              = np.sqrt(coordinates.X_hub[cpt,:,0,0,1]**2 +  coordinates.X_hub[cpt,:,0,0,2] **2)
-    Y_3            = np.tile(Y[None,:,None],(1,1,num_h_b))
+    Y              = np.sqrt(coordinates.X_hub[ctrl_pts,:,0,0,1]**2 +  coordinates.X_hub[ctrl_pts,:,0,0,2] **2)
+    Y_3            = np.tile(Y[:,:,None],(1,1,num_h_b))
     r_3            = Y_3/np.sin(theta_r_3)
     
     # phase angles
     phi_0_vec      = np.tile(phi_0[:,None,None,None],(num_cpt,num_mic,num_h_b,num_h_l))
-    phi_4          = np.tile(coordinates.phi_hub_r[cpt,:,0,0,None,None],(1,1,num_h_b,num_h_l)) + phi_0_vec
+    phi_4          = np.tile(coordinates.phi_hub_r[ctrl_pts,:,0,0,None,None],(1,1,num_h_b,num_h_l)) + phi_0_vec
     phi_5          = np.tile(phi_4[:,:,None,:,:],(1,1,num_sec,1,1))
     phi_6          = np.tile(phi_4[:,:,None,:,:,None],(1,1,num_sec,1,1,chord_coord))
     
@@ -206,13 +208,13 @@ def harmonic_noise_plane(harmonics_blade,harmonics_load,conditions,propulsor_con
     phi_prime_4    = np.arccos((np.sin(theta_r_4)*np.cos(phi_4))/np.sin(theta_r_prime_4))
     
     # Velocity in the rotor frame
-    T_body2inertial = conditions.frames.body.transform_to_inertial
+    T_body2inertial = conditions.frames.body.transform_to_inertial[ctrl_pts]
     T_inertial2body = orientation_transpose(T_body2inertial)
     V_body          = orientation_product(T_inertial2body,velocity_vector)
     body2thrust,_   = rotor.body_to_prop_vel(commanded_thrust_vector)
     T_body2thrust   = orientation_transpose(body2thrust)
     V_thrust        = orientation_product(T_body2thrust,V_body)
-    V_thrust_perp   = np.atleast_2d(V_thrust[cpt,0,None])
+    V_thrust_perp   = V_thrust[:,0,None]
     V_thrust_perp_3 = np.tile(V_thrust_perp[:,:,None],(1,num_mic,num_h_b))
     M_thrust_3      = V_thrust_perp_3/a_3
     M_thrust_5      = np.tile(M_thrust_3[:,:,None,:,None],(1,1,num_sec,1,num_h_l))
@@ -33,37 +33,31 @@ def EPNL_noise_metric(PNLT):
         N/A  
     """           
     # Maximum PNLT on the time history data    
-    n_mic    = len(PNLT[0,:])
-    PNLT_max = np.max(PNLT,axis=0)
+    PNLT      = np.asarray(PNLT,dtype=float)
+    PNLT_max  = np.max(PNLT,axis=0)
+    threshold = PNLT_max-10
     
     # Calculates the number of discrete points on the trajectory
-    nsteps   = len(PNLT)    
-    EPNL     = np.zeros(n_mic)
-    for j in range(n_mic):
-        # Finding the time duration for the noise history where PNL is higher than the maximum PNLT - 10 dB
-        i = 0
-        while PNLT[i][j]<=(PNLT_max[j]-10) and i<=nsteps:
-            i = i+1
-        t1 = i #t1 is the first time interval
-        i  = i+1
+    nsteps    = len(PNLT)    
+    steps     = np.arange(nsteps)[:,None]
     
-        # Correction for PNLTM-10 when it falls outside the limit of the data
-        if PNLT[nsteps-1][j]>=(PNLT_max[j]-10):
-            t2=nsteps-2
-        else:
-            while i<=nsteps and PNLT[i][j]>=(PNLT_max[j]-10):
-                i = i+1
-            t2 = i-1 #t2 is the last time interval 
-        
-        # Calculates the integral of the PNLT which between t1 and t2 points
-        sumation = 0
-        for i in range (t1-1,t2+1):
-            sumation = 10**(PNLT[i][j]/10)+sumation
-            
-        # Duration Correction calculation
-        duration_correction = 10*np.log10(sumation)-PNLT_max[j]-13
-                    
-        # Final EPNL calculation
-        EPNL[j] = PNLT_max[j]+duration_correction
+    # Finding the time duration for the noise history where PNL is higher than the maximum PNLT - 10 dB
+    t1        = np.argmax(PNLT > threshold,axis=0) # t1 is the first time interval 
     
-    return EPNL   
\ No newline at end of file
+    # t2 is the last time interval of the first window after t1, or the second to last point when PNLTM-10 falls outside the limit of the data
+    after_t1  = (PNLT < threshold) & (steps > t1) 
+    t2        = np.argmax(after_t1,axis=0) - 1
+    t2[PNLT[-1] >= threshold] = nsteps-2
+    
+    # Calculates the integral of the PNLT which between t1 and t2 points, a window starting before the first point wraps to the last point
+    noy_energy = 10**(PNLT/10)
+    window     = (steps >= t1 - 1) & (steps <= t2)
+    sumation   = np.sum(noy_energy*window,axis=0) + np.where(t1 == 0,noy_energy[-1],0)
+    
+    # Duration Correction calculation
+    duration_correction = 10*np.log10(sumation)-PNLT_max-13
+    
+    # Final EPNL calculation
+    EPNL = PNLT_max+duration_correction
+    
+    return EPNL   
@@ -60,41 +60,37 @@ def PNL_noise_metric(SPL):
             [24, 10000, 50.7, 41, 37, 21, 29, 0.042285,	0.02996, 0.05964, 0.043573]]
 
     
-    # Defining the necessary arrays for the calculation
-    n_cpts  = len(SPL[:,0,0])
-    n_mic   = len(SPL[0,:,0])
-    SPL_noy = np.zeros((n_cpts,n_mic,24))
-    PNL     = np.zeros((n_cpts,n_mic))
+    noy     = np.array(noy)
     
     #-------------------------------------------
     # STEP 1 - Convert SPL to Perceived Noisiness
     #-------------------------------------------  
-    for k in range(n_mic):
-        for j in range(n_cpts):
-            for i in range(24):
-                if SPL[j][k][i]>=noy[1][2]:
-                    SPL_noy[j][k][i] = 10**(noy[i][8]*(SPL[j][k][i]-noy[i][4]))
-                    
-                if SPL[j][k][i]>=noy[i][3] and SPL[j][k][i]<noy[i][2]:
-                    SPL_noy[j][k][i] = 10**(noy[i][7]*(SPL[j][k][i]-noy[i][3]))
-                    
-                if SPL[j][k][i]>=noy[i][6] and SPL[j][k][i]<noy[i][3]:
-                    SPL_noy[j][k][i] = 0.3*(10**(noy[i][10]*(SPL[j][k][i]-noy[i][6])))
-                    
-                if SPL[j][k][i]>=noy[i][5] and SPL[j][k][i]<noy[i][6]:
-                    SPL_noy[j][k][i] = 0.1*(10**(noy[i][9]*(SPL[j][k][i]-noy[i][5])))
+    # the band constants are broadcast over all control points and microphones, later conditions take precedence
+    SPL     = np.asarray(SPL,dtype=float)
+    SPL_noy = np.zeros(SPL.shape)
+    
+    band    = SPL >= noy[1,2]
+    SPL_noy = np.where(band,10**(noy[:,8]*(SPL-noy[:,4])),SPL_noy)
+    
+    band    = (SPL >= noy[:,3]) & (SPL < noy[:,2])
+    SPL_noy = np.where(band,10**(noy[:,7]*(SPL-noy[:,3])),SPL_noy)
+    
+    band    = (SPL >= noy[:,6]) & (SPL < noy[:,3])
+    SPL_noy = np.where(band,0.3*(10**(noy[:,10]*(SPL-noy[:,6]))),SPL_noy)
+    
+    band    = (SPL >= noy[:,5]) & (SPL < noy[:,6])
+    SPL_noy = np.where(band,0.1*(10**(noy[:,9]*(SPL-noy[:,5]))),SPL_noy)
                 
-            #-------------------------------------------  
-            # STEP 2 - Combine perceived noiseness values  
-            #-------------------------------------------
-            max_noy = np.max(SPL_noy[j][k][:])            
-            Perceived_noisinees = 0.85*max_noy+0.15*np.sum(SPL_noy[j][k][:])
-            
-            #-----------------------------------------------------------------
-            # STEP 3 - Convert Perceived Noiseness into Perceived Noise Level
-            #------------------------------------------------------------------    
-            if Perceived_noisinees==0:
-                Perceived_noisinees = 0.0625
-            PNL[j,k] = 40+(10/np.log10(2))*np.log10(Perceived_noisinees)
+    #-------------------------------------------  
+    # STEP 2 - Combine perceived noiseness values  
+    #-------------------------------------------
+    max_noy             = np.max(SPL_noy,axis=2)
+    Perceived_noisinees = 0.85*max_noy+0.15*np.sum(SPL_noy,axis=2)
+    
+    #-----------------------------------------------------------------
+    # STEP 3 - Convert Perceived Noiseness into Perceived Noise Level
+    #------------------------------------------------------------------    
+    Perceived_noisinees[Perceived_noisinees==0] = 0.0625
+    PNL = 40+(10/np.log10(2))*np.log10(Perceived_noisinees)
         
-    return PNL
\ No newline at end of file
+    return PNL
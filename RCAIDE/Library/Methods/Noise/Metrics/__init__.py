@@ -9,6 +9,7 @@
 # ----------------------------------------------------------------------------------------------------------------------
 
 from .compute_noise_metrics             import compute_noise_metrics 
+from .aggregate_noise_exposure          import aggregate_noise_exposure, initialize_noise_exposure, accumulate_noise_exposure, compute_noise_exposure_levels
 from .PNL_noise_metric	                import PNL_noise_metric
 from .EPNL_noise_metric                 import EPNL_noise_metric 
 from .A_weighting_metric                import A_weighting_metric   
\ No newline at end of file
@@ -0,0 +1,201 @@
+# RCAIDE/Methods/Noise/Metrics/aggregate_noise_exposure.py
+#
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+from RCAIDE.Framework.Core import Units, Data
+from RCAIDE.Library.Methods.Noise.Common.background_noise     import background_noise
+
+# Python package imports
+import numpy as np
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  aggregate_noise_exposure
+# ----------------------------------------------------------------------------------------------------------------------
+def aggregate_noise_exposure(noise_data_list, flight_schedules, time_period = ['06:00:00','20:00:00'],
+                             DNL_time_period = ['07:00:00','20:00:00']):
+    """This computes the community noise levels (L_eq, L_eq_24hr and L_dn) of many flights flown along
+    one or more routes, each route being described by its post-processed noise data and the times of day
+    at which it is flown
+
+    Assumptions:
+        All routes share the same ground microphone grid. The remainder of each time period is filled with
+        background noise. See initialize_noise_exposure and accumulate_noise_exposure.
+
+    Source:
+        None
+
+    Inputs:
+       noise_data_list   - list of post-processed noise data structures, one per route
+       flight_schedules  - list of flight start times (hh:mm:ss) for each route
+       time_period       - start and end of the period over which L_eq and L_dn are averaged  (hh:mm:ss)
+       DNL_time_period   - start and end of the day, flights outside it carry a 10 dB penalty  (hh:mm:ss)
+
+    Outputs:
+       exposure          - noise exposure data structure with L_eq, L_eq_24hr and L_dn        [dB]
+
+    Properties Used:
+        N/A
+    """
+
+    if len(noise_data_list) != len(flight_schedules):
+        raise ValueError('a flight schedule is required for each route')
+
+    first_route = noise_data_list[0]
+    exposure    = initialize_noise_exposure(first_route.microphone_x_resolution,first_route.microphone_y_resolution,time_period,DNL_time_period)
+    for noise_data, flight_times in zip(noise_data_list,flight_schedules):
+        accumulate_noise_exposure(exposure,noise_data,flight_times)
+    compute_noise_exposure_levels(exposure)
+
+    return exposure
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  initialize_noise_exposure
+# ----------------------------------------------------------------------------------------------------------------------
+def initialize_noise_exposure(N_gm_x, N_gm_y, time_period = ['06:00:00','20:00:00'], DNL_time_period = ['07:00:00','20:00:00']):
+    """This creates an empty noise exposure data structure to which flights are added one route at a time
+
+    Assumptions:
+        None
+
+    Source:
+        None
+
+    Inputs:
+       N_gm_x            - number of microphones in the x-direction                                [unitless]
+       N_gm_y            - number of microphones in the y-direction                                [unitless]
+       time_period       - start and end of the period over which L_eq and L_dn are averaged  (hh:mm:ss)
+       DNL_time_period   - start and end of the day, flights outside it carry a 10 dB penalty  (hh:mm:ss)
+
+    Outputs:
+       exposure          - noise exposure data structure                                           [None]
+
+    Properties Used:
+        N/A
+    """
+    exposure                               = Data()
+    exposure.microphone_x_resolution       = N_gm_x
+    exposure.microphone_y_resolution       = N_gm_y
+    exposure.time_period_start             = time_of_day(time_period[0])
+    exposure.time_period_end               = time_of_day(time_period[1])
+    exposure.day_start                     = time_of_day(DNL_time_period[0])
+    exposure.day_end                       = time_of_day(DNL_time_period[1])
+    exposure.number_of_flights             = 0
+    exposure.total_flight_duration         = 0.
+    exposure.p_div_p_ref_sq_L_eq           = np.zeros((N_gm_x,N_gm_y))
+    exposure.p_div_p_ref_sq_L_dn           = np.zeros((N_gm_x,N_gm_y))
+
+    return exposure
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  accumulate_noise_exposure
+# ----------------------------------------------------------------------------------------------------------------------
+def accumulate_noise_exposure(exposure, noise_data, flight_times):
+    """This adds the sound exposure of all flights of one route to a noise exposure data structure
+
+    Assumptions:
+        The noise time steps of the route are uniformly spaced. The energy dose of the route is computed once
+        and its cumulative sum over time is used to find the portion of each flight that falls outside the
+        day, which carries a 10 dB (i.e. ten-fold energy) penalty.
+
+    Source:
+        None
+
+    Inputs:
+       exposure          - noise exposure data structure, see initialize_noise_exposure
+       noise_data        - post-processed noise data structure of the route
+       flight_times      - flight start times of the route (hh:mm:ss)
+
+    Outputs:
+       exposure          - noise exposure data structure
+
+    Properties Used:
+        N/A
+    """
+    SPL          = noise_data.SPL_dBA
+    flight_time  = noise_data.time
+    if SPL.shape[1:] != exposure.p_div_p_ref_sq_L_eq.shape:
+        raise ValueError('noise data of all routes must share the same microphone grid')
+
+    # energy dose of one flight, accumulated over time
+    time_step          = flight_time[1]-flight_time[0]
+    p_sq_ref_flight_sq = np.nancumsum(time_step * (10**(SPL/10)), axis=0)
+    total_dose         = p_sq_ref_flight_sq[-1]
+
+    # portion of each flight before the start and after the end of the day
+    start_times  = np.array([time_of_day(t) for t in np.atleast_1d(flight_times)])
+    n_morning    = np.searchsorted(flight_time, exposure.day_start - start_times, side='left')
+    n_evening    = np.searchsorted(flight_time, exposure.day_end - start_times, side='right')
+    dose_cum     = np.concatenate((np.zeros((1,) + total_dose.shape),p_sq_ref_flight_sq),axis=0)
+    night_dose   = np.sum(dose_cum[n_morning],axis=0) + np.sum(total_dose - dose_cum[n_evening],axis=0)
+
+    # add to current
+    number_of_flights                   = len(start_times)
+    exposure.p_div_p_ref_sq_L_eq       += number_of_flights*total_dose
+    exposure.p_div_p_ref_sq_L_dn       += number_of_flights*total_dose + 9*night_dose
+    exposure.number_of_flights         += number_of_flights
+    exposure.total_flight_duration     += number_of_flights*flight_time[-1]
+
+    return exposure
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  compute_noise_exposure_levels
+# ----------------------------------------------------------------------------------------------------------------------
+def compute_noise_exposure_levels(exposure):
+    """This computes L_eq, L_eq_24hr and L_dn from the accumulated sound exposure, filling the time not
+    occupied by flights with background noise
+
+    Assumptions:
+        None
+
+    Source:
+        None
+
+    Inputs:
+       exposure            - noise exposure data structure, see accumulate_noise_exposure
+
+    Outputs:
+       exposure.L_eq       - average A-weighted sound level over the time period          [dB]
+       exposure.L_eq_24hr  - average A-weighted sound level over 24 hours                 [dB]
+       exposure.L_dn       - day-night average sound level over the time period          [dB]
+
+    Properties Used:
+        N/A
+    """
+    duration                    = exposure.time_period_end - exposure.time_period_start
+    ambient_noise_duration      = np.maximum(duration - exposure.total_flight_duration,0)
+    ambient_noise_duration_24hr = np.maximum(24 * Units.hrs - exposure.total_flight_duration,0)
+    background_dose             = 10**(background_noise()/10)
+
+    exposure.L_eq      = 10*np.log10((1/duration)*(exposure.p_div_p_ref_sq_L_eq + ambient_noise_duration*background_dose))
+    exposure.L_eq_24hr = 10*np.log10((1/(24*Units.hours))*(exposure.p_div_p_ref_sq_L_eq + ambient_noise_duration_24hr*background_dose))
+    exposure.L_dn      = 10*np.log10((1/duration)*(exposure.p_div_p_ref_sq_L_dn + ambient_noise_duration*background_dose))
+
+    return exposure
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  time_of_day
+# ----------------------------------------------------------------------------------------------------------------------
+def time_of_day(clock_time):
+    """This converts a clock time (hh:mm:ss) into seconds after midnight
+
+    Assumptions:
+        None
+
+    Source:
+        None
+
+    Inputs:
+       clock_time  - time of day (hh:mm:ss)
+
+    Outputs:
+       seconds     - time after midnight       [s]
+
+    Properties Used:
+        N/A
+    """
+    hours, minutes, seconds = str(clock_time).split(':')
+
+    return float(hours)*60*60 + float(minutes)*60 + float(seconds)
@@ -10,4 +10,7 @@
 
 from .compute_static_sea_level_performance   import compute_static_sea_level_performance
 from .append_avionics_conditions             import append_avionics_conditions
-from .append_payload_conditions              import append_payload_conditions 
\ No newline at end of file
+from .append_payload_conditions              import append_payload_conditions
+from .generate_engine_deck                   import generate_engine_deck
+from .load_engine_deck                       import load_engine_deck
+from .evaluate_engine_deck                   import evaluate_engine_deck
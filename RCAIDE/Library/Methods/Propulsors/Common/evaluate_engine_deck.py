@@ -0,0 +1,95 @@
+# RCAIDE/Library/Methods/Propulsors/Common/evaluate_engine_deck.py
+#
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+from RCAIDE.Library.Methods.Propulsors.Common.generate_engine_deck import generate_engine_deck
+
+# package imports
+from scipy.interpolate import RegularGridInterpolator
+import numpy as np
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  evaluate_engine_deck
+# ----------------------------------------------------------------------------------------------------------------------
+def evaluate_engine_deck(propulsor,state,center_of_gravity= [[0.0, 0.0,0.0]]):
+    """Computes the performance of a gas turbine propulsor by linear interpolation of its engine deck, see
+    generate_engine_deck. A deck over the default grid is generated on the first call if the propulsor has none.
+    If any control point lies outside the deck, nothing is computed and the thermodynamic cycle of the propulsor
+    is run instead.
+
+    Assumptions:
+        Only the thrust, power and fuel flow rate of the propulsor are computed: the conditions of the individual
+        components, used by the noise and emissions analyses, are not available with the engine deck. The mission
+        atmosphere has the ISA deviation the deck was generated for.
+
+    Source:
+        None
+
+    Inputs:
+        conditions.freestream.
+          mach_number                    [-]
+          altitude                       [m]
+        conditions.energy[propulsor.tag].
+          throttle                       [-]
+        center_of_gravity                [m]
+
+    Outputs:
+        deck_results                     - (thrust, moment, power) of the propulsor, None outside the deck   [N,Nm,W]
+        conditions.energy[propulsor.tag].
+          thrust                         [N]
+          power                          [W]
+          fuel_flow_rate                 [kg/s]
+          moment                         [Nm]
+
+    Properties Used:
+        propulsor.
+          engine_deck                    [-]
+          origin                         [m]
+    """
+    if 'thrust' not in propulsor.engine_deck:
+        generate_engine_deck(propulsor)
+    deck                 = propulsor.engine_deck
+    conditions           = state.conditions
+    propulsor_conditions = conditions.energy[propulsor.tag]
+
+    M       = conditions.freestream.mach_number[:,0]
+    h       = conditions.freestream.altitude[:,0]
+    eta     = propulsor_conditions.throttle[:,0]
+    points  = np.vstack([M,h,eta]).T
+
+    # outside the deck the thermodynamic cycle is used
+    axes         = [deck.mach_number,deck.altitude,deck.throttle]
+    lower_bounds = np.array([axis[0]  for axis in axes])
+    upper_bounds = np.array([axis[-1] for axis in axes])
+    tol          = 1E-9*np.maximum(1.,np.maximum(np.abs(lower_bounds),np.abs(upper_bounds)))
+    if np.any(points < lower_bounds - tol) or np.any(points > upper_bounds + tol):
+        return None
+
+    # axes with a single value are not interpolated
+    active_axes  = [i for i in range(3) if len(axes[i]) > 1]
+    index        = tuple(slice(None) if len(axes[i]) > 1 else 0 for i in range(3))
+    values       = np.stack([deck.thrust[index],deck.fuel_flow_rate[index],deck.power[index]],axis=-1)
+    if len(active_axes) == 0:
+        outputs  = np.repeat(values[None,:],len(points),axis=0)
+    else:
+        deck_map = RegularGridInterpolator(tuple(axes[i] for i in active_axes),values,method = 'linear', bounds_error=False, fill_value=None)
+        outputs  = deck_map(points[:,active_axes])
+
+    thrust_vector      = 0*state.ones_row(3)
+    moment_vector      = 0*state.ones_row(3)
+    thrust_vector[:,0] = outputs[:,0]
+    moment_vector[:,0] = propulsor.origin[0][0] -  center_of_gravity[0][0]
+    moment_vector[:,1] = propulsor.origin[0][1] -  center_of_gravity[0][1]
+    moment_vector[:,2] = propulsor.origin[0][2] -  center_of_gravity[0][2]
+    moment             = np.cross(moment_vector,thrust_vector)
+    power              = outputs[:,2,None]
+
+    propulsor_conditions.thrust         = outputs[:,0,None]
+    propulsor_conditions.fuel_flow_rate = outputs[:,1,None]
+    propulsor_conditions.power          = power
+    propulsor_conditions.moment         = moment
+
+    return thrust_vector,moment,power
@@ -0,0 +1,152 @@
+# RCAIDE/Library/Methods/Propulsors/Common/generate_engine_deck.py
+#
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+import RCAIDE
+from RCAIDE.Framework.Core                import Data
+
+# package imports
+from copy import deepcopy
+import numpy as np
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  generate_engine_deck
+# ----------------------------------------------------------------------------------------------------------------------
+def generate_engine_deck(propulsor,mach_number = None,altitude = None,throttle = None,isa_deviation = 0.0,filename = None):
+    """Computes the engine deck of a gas turbine propulsor (turbofan, turbojet, turboprop or turboshaft) by running
+    its thermodynamic cycle over a full factorial grid of Mach number, altitude and throttle. All points of the grid
+    are evaluated in a single vectorized call, with one control point per point of the grid. The deck is stored on
+    the propulsor and is interpolated in missions when propulsor.use_engine_deck is True, see evaluate_engine_deck.
+
+    Assumptions:
+        The freestream conditions of the grid follow the US Standard 1976 atmosphere offset by a constant ISA
+        deviation. The propulsor must be designed before its deck is generated, and the deck must be generated
+        again after the propulsor is modified.
+
+    Source:
+        None
+
+    Inputs:
+        propulsor          - designed gas turbine propulsor                                     [-]
+        mach_number        - increasing Mach numbers of the deck                                [-]
+        altitude           - increasing altitudes of the deck                                   [m]
+        throttle           - increasing throttle settings of the deck                           [-]
+        isa_deviation      - temperature deviation from the standard atmosphere                 [K]
+        filename           - if not None, path of the .npz file the deck is saved to            <string>
+
+    Outputs:
+        deck.
+          mach_number      - Mach numbers of the deck                                           [-]
+          altitude         - altitudes of the deck                                              [m]
+          throttle         - throttle settings of the deck                                      [-]
+          isa_deviation    - temperature deviation from the standard atmosphere                 [K]
+          thrust           - thrust, indexed by (Mach number, altitude, throttle)               [N]
+          fuel_flow_rate   - fuel flow rate, indexed by (Mach number, altitude, throttle)       [kg/s]
+          power            - power, indexed by (Mach number, altitude, throttle)                [W]
+
+    Properties Used:
+        propulsor.working_fluid
+    """
+    if mach_number is None:
+        mach_number = np.hstack([0.01,np.linspace(0.05,0.9,18)])
+    if altitude is None:
+        altitude    = np.linspace(0.,13000.,27)
+    if throttle is None:
+        throttle    = np.linspace(0.,1.2,13)
+    M_data   = np.asarray(mach_number,dtype=float)
+    h_data   = np.asarray(altitude,dtype=float)
+    eta_data = np.asarray(throttle,dtype=float)
+
+    # full factorial grid, one control point per point of the deck
+    M,h,eta  = [g.ravel()[:,None] for g in np.meshgrid(M_data,h_data,eta_data,indexing='ij')]
+    n_pts    = len(M)
+
+    planet     = RCAIDE.Library.Attributes.Planets.Earth()
+    atmosphere = RCAIDE.Framework.Analyses.Atmospheric.US_Standard_1976()
+    atmo_data  = atmosphere.compute_values(h,isa_deviation)
+    p          = atmo_data.pressure
+    T          = atmo_data.temperature
+    a          = atmo_data.speed_of_sound
+
+    deck_propulsor                 = deepcopy(propulsor)
+    deck_propulsor.use_engine_deck = False
+    deck_propulsor.engine_deck     = Data()
+    working_fluid                  = deck_propulsor.working_fluid
+
+    conditions                                        = RCAIDE.Framework.Mission.Common.Results()
+    conditions.freestream.altitude                    = h
+    conditions.freestream.mach_number                 = M
+    conditions.freestream.pressure                    = p
+    conditions.freestream.temperature                 = T
+    conditions.freestream.density                     = atmo_data.density
+    conditions.freestream.dynamic_viscosity           = atmo_data.dynamic_viscosity
+    conditions.freestream.gravity                     = planet.sea_level_gravity * np.ones((n_pts,1))
+    conditions.freestream.isentropic_expansion_factor = working_fluid.compute_gamma(T,p)
+    conditions.freestream.Cp                          = working_fluid.compute_cp(T,p)
+    conditions.freestream.R                           = working_fluid.gas_specific_constant * np.ones((n_pts,1))
+    conditions.freestream.speed_of_sound              = a
+    conditions.freestream.velocity                    = a*M
+
+    segment                  = RCAIDE.Framework.Mission.Segments.Segment()
+    segment.state.conditions = conditions
+    deck_propulsor.append_operating_conditions(segment)
+    for tag, item in  deck_propulsor.items():
+        if issubclass(type(item), RCAIDE.Library.Components.Component):
+            item.append_operating_conditions(segment,deck_propulsor)
+    segment.state.expand_rows(n_pts)
+    segment.state.conditions.energy[deck_propulsor.tag].throttle[:,0] = eta[:,0]
+
+    thrust,_,power,_,_ = deck_propulsor.compute_performance(segment.state)
+    propulsor_conditions = segment.state.conditions.energy[deck_propulsor.tag]
+
+    shape                = (len(M_data),len(h_data),len(eta_data))
+    deck                 = Data()
+    deck.mach_number     = M_data
+    deck.altitude        = h_data
+    deck.throttle        = eta_data
+    deck.isa_deviation   = float(isa_deviation)
+    deck.thrust          = np.reshape(thrust[:,0],shape)
+    deck.fuel_flow_rate  = np.reshape(propulsor_conditions.fuel_flow_rate*np.ones((n_pts,1)),shape)
+    deck.power           = np.reshape(power*np.ones((n_pts,1)),shape)
+    propulsor.engine_deck = deck
+
+    if filename is not None:
+        save_engine_deck(deck,filename)
+
+    return deck
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  save_engine_deck
+# ----------------------------------------------------------------------------------------------------------------------
+def save_engine_deck(deck,filename):
+    """Saves an engine deck to a compressed numpy .npz file, see load_engine_deck
+
+    Assumptions:
+        None
+
+    Source:
+        None
+
+    Inputs:
+        deck         - engine deck, see generate_engine_deck       [-]
+        filename     - path of the .npz file                       <string>
+
+    Outputs:
+        None
+
+    Properties Used:
+        N/A
+    """
+    np.savez_compressed(filename,
+                        mach_number    = deck.mach_number,
+                        altitude       = deck.altitude,
+                        throttle       = deck.throttle,
+                        isa_deviation  = deck.isa_deviation,
+                        thrust         = deck.thrust,
+                        fuel_flow_rate = deck.fuel_flow_rate,
+                        power          = deck.power)
+
+    return
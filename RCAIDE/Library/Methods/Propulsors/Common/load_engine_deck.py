@@ -0,0 +1,46 @@
+# RCAIDE/Library/Methods/Propulsors/Common/load_engine_deck.py
+#
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+from RCAIDE.Framework.Core                import Data
+
+# package imports
+import numpy as np
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  load_engine_deck
+# ----------------------------------------------------------------------------------------------------------------------
+def load_engine_deck(propulsor,filename):
+    """Loads an engine deck saved by generate_engine_deck and assigns it to a propulsor
+
+    Assumptions:
+        The deck was generated for the same propulsor
+
+    Source:
+        None
+
+    Inputs:
+        propulsor    - gas turbine propulsor                        [-]
+        filename     - path of the .npz file                        <string>
+
+    Outputs:
+        deck         - engine deck, see generate_engine_deck        [-]
+
+    Properties Used:
+        N/A
+    """
+    deck = Data()
+    with np.load(filename) as deck_file:
+        deck.mach_number    = deck_file['mach_number']
+        deck.altitude       = deck_file['altitude']
+        deck.throttle       = deck_file['throttle']
+        deck.isa_deviation  = float(deck_file['isa_deviation'])
+        deck.thrust         = deck_file['thrust']
+        deck.fuel_flow_rate = deck_file['fuel_flow_rate']
+        deck.power          = deck_file['power']
+    propulsor.engine_deck = deck
+
+    return deck
@@ -53,9 +53,7 @@ def compute_compressor_performance(compressor,compressor_conditions,conditions):
     working_fluid           = compressor.working_fluid
  
     # Compute the working fluid properties 
-    gamma  = working_fluid.compute_gamma(T0,P0) 
-    Cp     = working_fluid.compute_cp(T0,P0)    
-    R      = working_fluid.compute_R(T0,P0)
+    Cp,gamma,R = working_fluid.compute_thermodynamic_properties(T0,P0)
         
     # Compute the output properties based on the pressure ratio of the component
     ht_in     = Tt_in*Cp 
@@ -233,7 +233,7 @@ def run_rotor_hover(nexus):
     conditions.noise.number_of_microphones           = num_mic   
     
     if alpha != 1: 
-        compute_rotor_noise(bus,electric_rotor,segment,settings)    
+        compute_rotor_noise(mic_positions_hover,electric_rotor,rotor,segment,settings)    
         nexus.results.hover.mean_SPL   = np.mean(conditions.noise[electric_rotor.tag][rotor.tag].SPL_dBA) 
     else: 
         nexus.results.hover.mean_SPL   = 0  
@@ -364,7 +364,7 @@ def run_rotor_cruise(nexus):
         conditions.noise.number_of_microphones           = num_mic    
         
         if alpha != 1: 
-            compute_rotor_noise(bus,electric_rotor,segment,settings)      
+            compute_rotor_noise(mic_positions_cruise,electric_rotor,rotor,segment,settings)      
             nexus.results.cruise.mean_SPL   = np.mean(conditions.noise[electric_rotor.tag][rotor.tag].SPL_dBA)   
         else:
             nexus.results.cruise.mean_SPL   = 0  
@@ -440,7 +440,9 @@ def post_process(nexus):
     
     acoustic_objective     = ((nexus.results.hover.mean_SPL  - ideal_SPL)/ideal_SPL)*gamma  + ((nexus.results.cruise.mean_SPL - ideal_SPL)/ideal_SPL)*(1-gamma) 
  
-    summary.objective      = (performance_objective*alpha + acoustic_objective*(1-alpha))  
+    summary.objective              = (performance_objective*alpha + acoustic_objective*(1-alpha))  
+    summary.performance_objective  = performance_objective
+    summary.acoustic_objective     = acoustic_objective
     
 
     if nexus.prop_rotor_flag:  
@@ -4,9 +4,8 @@
 # Created:  Feb 2022, R. Erhard
 # Modified: 
 
-from RCAIDE.Library.Methods.Aerodynamics.Common.Lift.BET_calculations import compute_airfoil_aerodynamics,compute_inflow_and_tip_loss
+from RCAIDE.Library.Methods.Aerodynamics.Common.Lift.BET_calculations import compute_airfoil_aerodynamics,compute_inflow_and_tip_loss,build_airfoil_polar_table
 import numpy as np
-import scipy as sp
 
 ## @defgroup Methods-Propulsion-Rotor_Wake-Fidelity_Zero
 def fidelity_zero_wake_convergence(wake,rotor,wake_inputs):
@@ -28,6 +27,7 @@ def fidelity_zero_wake_convergence(wake,rotor,wake_inputs):
           Ua        - Axial velocity
           Ut        - Tangential velocity
           r         - radius distribution
+          airfoil_polar_table - airfoil polar table of the rotor, built here if not given
        
        
     Outputs:
@@ -44,14 +44,19 @@ def fidelity_zero_wake_convergence(wake,rotor,wake_inputs):
     Nr              = wake_inputs.Nr
     Na              = wake_inputs.Na    
 
+    # the airfoil polar table is built once for the whole solve
+    if 'airfoil_polar_table' not in wake_inputs:
+        wake_inputs.airfoil_polar_table = build_airfoil_polar_table(rotor.Airfoils,rotor.airfoil_polar_stations)
+
     if wake_inputs.use_2d_analysis:
         PSI    = np.ones((ctrl_pts,Nr,Na))
     else:
         PSI    = np.ones((ctrl_pts,Nr))
 
-    PSI_final,infodict,ier,msg = sp.optimize.fsolve(iteration,PSI,args=(wake_inputs,rotor),xtol=rotor.sol_tolerance,full_output = 1,band=(1,0))
+    # the residual of each blade station depends only on its own inflow angle, so all stations are solved at once
+    PSI_final, converged = solve_inflow_angle(PSI,wake_inputs,rotor,rotor.sol_tolerance)
     
-    if ier!=1:
+    if not np.all(converged):
         print("Rotor BEVW did not converge to a solution (Stall)")
     
     # Calculate the velocities given PSI
@@ -60,6 +65,151 @@ def fidelity_zero_wake_convergence(wake,rotor,wake_inputs):
     
     return va, vt
 
+## @defgroup Methods-Propulsion-Rotor_Wake-Fidelity_Zero
+def solve_inflow_angle(PSI, wake_inputs, rotor, tolerance, max_iterations = 50, max_step = 0.5):
+    """
+    Solves the BEVW residual for the inflow angle of every blade station simultaneously. Each station is
+    iterated independently with a safeguarded Newton-secant update: the first step uses the analytical
+    derivative, later steps use the secant slope of the last two iterates, steps are limited in size and
+    replaced by bisection once the root is bracketed. Stations are removed from the iteration as they
+    converge. Stations that do not converge are passed to a bracketing search.
+
+    Assumptions:
+    The residual of a blade station depends only on the inflow angle of that station.
+
+    Source:
+    N/A
+
+    Inputs:
+       PSI                        initial inflow angle                            [rad]
+       wake_inputs                wake inputs, see fidelity_zero_wake_convergence [-]
+       rotor                      rotor                                           [-]
+       tolerance                  relative tolerance on the inflow angle          [-]
+       max_iterations             maximum number of Newton-secant iterations      [-]
+       max_step                   maximum change of inflow angle per iteration    [rad]
+
+    Outputs:
+       PSI                        inflow angle                                    [rad]
+       converged                  flag of converged blade stations                [-]
+
+    """
+    shape     = np.shape(PSI)
+    PSI       = np.array(PSI,dtype=float)
+    R         = iteration(PSI,wake_inputs,rotor).reshape(shape)
+    slope     = compute_dR_dpsi(PSI,wake_inputs,rotor)
+    psi_neg   = np.where(R < 0,PSI,np.nan)
+    psi_pos   = np.where(R > 0,PSI,np.nan)
+    converged = R == 0
+    active    = ~converged
+
+    for _ in range(max_iterations):
+        if not np.any(active):
+            break
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            step = np.clip(-R/slope,-max_step,max_step)
+        step = np.where(np.isfinite(step),step,0.)
+
+        # bisect stations whose step leaves the bracket around their root
+        PSI_new   = PSI + step
+        bracketed = np.isfinite(psi_neg) & np.isfinite(psi_pos)
+        outside   = bracketed & ((PSI_new - psi_neg)*(PSI_new - psi_pos) >= 0)
+        PSI_new   = np.where(outside,0.5*(psi_neg + psi_pos),PSI_new)
+        PSI_new   = np.where(active,PSI_new,PSI)
+
+        R_new     = iteration(PSI_new,wake_inputs,rotor).reshape(shape)
+        dPSI      = PSI_new - PSI
+        with np.errstate(divide='ignore', invalid='ignore'):
+            secant = (R_new - R)/dPSI
+        stalled   = ~np.isfinite(secant) | (secant == 0)
+        if np.any(stalled & active):
+            secant = np.where(stalled,compute_dR_dpsi(PSI_new,wake_inputs,rotor),secant)
+
+        psi_neg   = np.where(active & (R_new < 0),PSI_new,psi_neg)
+        psi_pos   = np.where(active & (R_new > 0),PSI_new,psi_pos)
+        slope     = np.where(active,secant,slope)
+        converged = converged | (active & ((np.abs(dPSI) <= tolerance*np.abs(PSI_new)) | (R_new == 0)))
+        active    = ~converged
+        PSI       = PSI_new
+        R         = np.where(np.isfinite(R_new),R_new,R)
+
+    if np.any(active):
+        PSI, converged = bracket_inflow_angle(PSI,converged,wake_inputs,rotor,tolerance)
+
+    return PSI, converged
+
+## @defgroup Methods-Propulsion-Rotor_Wake-Fidelity_Zero
+def bracket_inflow_angle(PSI, converged, wake_inputs, rotor, tolerance, number_of_samples = 25, max_iterations = 100):
+    """
+    Fallback for the blade stations that the Newton-secant iteration did not converge, typically stalled
+    sections. The residual is sampled over the range of inflow angles, the sign change closest to the current
+    estimate brackets the root, and the bracket is reduced with the Illinois false position method. Stations
+    without a sign change keep the sampled inflow angle with the smallest residual.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+       PSI                        current inflow angle                            [rad]
+       converged                  flag of converged blade stations                [-]
+       wake_inputs                wake inputs, see fidelity_zero_wake_convergence [-]
+       rotor                      rotor                                           [-]
+       tolerance                  relative tolerance on the inflow angle          [-]
+       number_of_samples          number of sampled inflow angles                 [-]
+       max_iterations             maximum number of false position iterations     [-]
+
+    Outputs:
+       PSI                        inflow angle                                    [rad]
+       converged                  flag of converged blade stations                [-]
+
+    """
+    shape   = np.shape(PSI)
+    active  = ~converged
+    samples = np.linspace(-np.pi/2,np.pi,number_of_samples)
+    R_samp  = np.array([iteration(np.where(active,psi,PSI),wake_inputs,rotor).reshape(shape) for psi in samples])
+
+    # pick the sign change closest to the current estimate
+    change   = np.sign(R_samp[:-1])*np.sign(R_samp[1:]) < 0
+    distance = np.abs(0.5*(samples[:-1] + samples[1:])[:,None] - PSI.ravel()).reshape(change.shape)
+    distance = np.where(change,distance,np.inf)
+    k        = np.argmin(distance,axis=0)
+    found    = active & np.any(change,axis=0)
+
+    # stations without a root keep the smallest sampled residual
+    best     = np.take(samples,np.nanargmin(np.where(np.isfinite(R_samp),np.abs(R_samp),np.inf),axis=0))
+    PSI      = np.where(active & ~found,best,PSI)
+
+    a   = samples[k]
+    b   = samples[k + 1]
+    Ra  = np.take_along_axis(R_samp,k[None],axis=0)[0]
+    Rb  = np.take_along_axis(R_samp,k[None] + 1,axis=0)[0]
+    side = np.zeros(shape)
+    for _ in range(max_iterations):
+        if not np.any(found):
+            break
+        with np.errstate(divide='ignore', invalid='ignore'):
+            c = np.where(found,(a*Rb - b*Ra)/(Rb - Ra),PSI)
+        c    = np.where(np.isfinite(c),c,0.5*(a + b))
+        Rc   = iteration(c,wake_inputs,rotor).reshape(shape)
+        left = np.sign(Rc) == np.sign(Ra)
+
+        # Illinois modification: halve the residual of an end point that is retained twice
+        a    = np.where(found & left,c,a)
+        Ra   = np.where(found & left,Rc,np.where(found & (side == -1),0.5*Ra,Ra))
+        b    = np.where(found & ~left,c,b)
+        Rb   = np.where(found & ~left,Rc,np.where(found & (side == 1),0.5*Rb,Rb))
+        side = np.where(left,1,-1)
+
+        PSI       = np.where(found,c,PSI)
+        done      = found & ((np.abs(b - a) <= tolerance*np.abs(c)) | (Rc == 0))
+        converged = converged | done
+        found     = found & ~done
+
+    return PSI, converged
+
 
 ## @defgroup Methods-Propulsion-Rotor_Wake-Fidelity_Zero
 def iteration(PSI, wake_inputs, rotor):
@@ -104,13 +254,12 @@ def iteration(PSI, wake_inputs, rotor):
     ctrl_pts        = wake_inputs.ctrl_pts
     Nr              = wake_inputs.Nr
     Na              = wake_inputs.Na
+    polar_table     = wake_inputs.airfoil_polar_table
 
     # Unpack rotor data        
     R            = rotor.tip_radius
     B            = rotor.number_of_blades
     tc           = rotor.thickness_to_chord
-    airfoils     = rotor.Airfoils
-    a_loc        = rotor.airfoil_polar_stations
     
     # Reshape PSI because the solver gives it flat
     if wake_inputs.use_2d_analysis:
@@ -126,7 +275,7 @@ def iteration(PSI, wake_inputs, rotor):
     vt           = Ut - Wt
 
     # compute blade airfoil forces and properties
-    Cl, Cdval, alpha, alpha_disc,Ma,W,Re,Re_disc = compute_airfoil_aerodynamics(beta,c,r,R,B,Wa,Wt,a,nu,airfoils,a_loc,ctrl_pts,Nr,Na,tc,use_2d_analysis)
+    Cl, Cdval, alpha, alpha_disc,Ma,W,Re,Re_disc = compute_airfoil_aerodynamics(beta,c,r,R,B,Wa,Wt,a,nu,polar_table,ctrl_pts,Nr,Na,tc,use_2d_analysis)
 
     # compute inflow velocity and tip loss factor
     lamdaw, F, piece = compute_inflow_and_tip_loss(r,R,Wa,Wt,B)
@@ -197,7 +346,7 @@ def compute_dR_dpsi(PSI,wake_inputs,rotor):
     Computes the analytical derivative for the BEVW iteration.
 
     Assumptions:
-    N/A
+    Derived for a 2*pi lift curve slope, it approximates the derivative of the residual when airfoil polars are used
 
     Source:
     N/A
@@ -217,7 +366,7 @@ def compute_dR_dpsi(PSI,wake_inputs,rotor):
        piece                      output of a step in tip loss calculation        [-]
 
     Outputs:
-       dR_dpsi                    derivative of residual wrt inflow angle         [-]
+       dR_dpsi                    derivative of residual wrt inflow angle, same shape as PSI   [-]
 
     """
     # Unpack inputs to rotor wake fidelity zero
@@ -276,9 +425,5 @@ def compute_dR_dpsi(PSI,wake_inputs,rotor):
 
     dR_dpsi[np.isnan(dR_dpsi)] = 0.1
     
-    # This needs to be made into a jacobian
-    dR_dpsi = dR_dpsi.flatten()
-    L       = np.size(PSI)
-    jac     = np.eye(L)*dR_dpsi
-    
-    return jac
\ No newline at end of file
+    # the residual of a station depends only on its own inflow angle, the jacobian is the diagonal dR_dpsi
+    return dR_dpsi
\ No newline at end of file
@@ -13,5 +13,8 @@ from .                          import Wake
 from .design_propeller          import design_propeller 
 from .design_lift_rotor         import design_lift_rotor
 from .design_prop_rotor         import design_prop_rotor
+from .design_rotor_multistart   import design_rotor_multistart
 from .append_rotor_conditions   import append_rotor_conditions
-from .compute_rotor_performance import compute_rotor_performance
\ No newline at end of file
+from .compute_rotor_performance import compute_rotor_performance
+from .train_rotor_surrogate     import train_rotor_surrogate
+from .evaluate_rotor_surrogate  import evaluate_rotor_surrogate
\ No newline at end of file
@@ -9,6 +9,8 @@
  # RCAIDE imports 
 from RCAIDE.Framework.Core                              import Data , Units, orientation_product, orientation_transpose  
 from RCAIDE.Library.Methods.Aerodynamics.Common.Lift    import compute_airfoil_aerodynamics,compute_inflow_and_tip_loss  
+from RCAIDE.Library.Methods.Aerodynamics.Common.Lift.BET_calculations import build_airfoil_polar_table
+from RCAIDE.Library.Methods.Propulsors.Converters.Rotor.evaluate_rotor_surrogate import evaluate_rotor_surrogate
 
 # package imports
 import  numpy as  np 
@@ -29,6 +31,11 @@ def compute_rotor_performance(propulsor,state,center_of_gravity= [[0.0, 0.0,0.0]
     Leishman, Gordon J. Principles of helicopter aerodynamics
     Cambridge university press, 2006.
 
+    If rotor.use_surrogate is True, the performance is interpolated from the rotor operating map
+    (see evaluate_rotor_surrogate) and the analysis below only runs outside the trained envelope. The
+    operating map does not compute the blade and disc distributions, so rotor noise cannot be computed
+    with use_surrogate set.
+
     Inputs:
     rotor.inputs.omega                    [radian/s]
     conditions.freestream.
@@ -90,6 +97,10 @@ def compute_rotor_performance(propulsor,state,center_of_gravity= [[0.0, 0.0,0.0]
         rotor =  propulsor.rotor
     elif 'propeller' in  propulsor:
         rotor =  propulsor.propeller
+
+    # Interpolate the operating map if the rotor has one
+    if rotor.use_surrogate and evaluate_rotor_surrogate(propulsor,state,center_of_gravity):
+        return
      
     propulsor_conditions  = conditions.energy[propulsor.tag]
     rotor_conditions      = propulsor_conditions[rotor.tag]
@@ -104,8 +115,7 @@ def compute_rotor_performance(propulsor,state,center_of_gravity= [[0.0, 0.0,0.0]
     sweep                 = rotor.sweep_distribution     
     r_1d                  = rotor.radius_distribution
     tc                    = rotor.thickness_to_chord
-    a_loc                 = rotor.airfoil_polar_stations
-    airfoils              = rotor.Airfoils 
+    polar_table           = build_airfoil_polar_table(rotor.Airfoils,rotor.airfoil_polar_stations)
     Na                    = rotor.number_azimuthal_stations
     nonuniform_freestream = rotor.nonuniform_freestream
     use_2d_analysis       = rotor.use_2d_analysis 
@@ -277,6 +287,7 @@ def compute_rotor_performance(propulsor,state,center_of_gravity= [[0.0, 0.0,0.0]
     wake_inputs.radius_distribution   = r
     wake_inputs.speed_of_sounds       = a
     wake_inputs.dynamic_viscosities   = nu
+    wake_inputs.airfoil_polar_table   = polar_table
 
     va, vt = rotor.Wake.evaluate(rotor,wake_inputs,conditions)
     
@@ -287,7 +298,7 @@ def compute_rotor_performance(propulsor,state,center_of_gravity= [[0.0, 0.0,0.0]
     lamdaw, F, _ = compute_inflow_and_tip_loss(r,R,Wa,Wt,B)
 
     # Compute aerodynamic forces based on specified input airfoil or surrogate
-    Cl, Cdval, alpha, alpha_disc,Ma,W,Re,Re_disc = compute_airfoil_aerodynamics(beta,c,r,R,B,Wa,Wt,a,nu,airfoils,a_loc,ctrl_pts,Nr,Na,tc,use_2d_analysis) 
+    Cl, Cdval, alpha, alpha_disc,Ma,W,Re,Re_disc = compute_airfoil_aerodynamics(beta,c,r,R,B,Wa,Wt,a,nu,polar_table,ctrl_pts,Nr,Na,tc,use_2d_analysis) 
     
     # compute HFW circulation at the blade
     Gamma = 0.5*W*c*Cl  
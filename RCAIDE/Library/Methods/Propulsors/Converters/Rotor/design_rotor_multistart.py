@@ -0,0 +1,196 @@
+# RCAIDE/Library/Methods/Propulsors/Converters/Rotor/design_rotor_multistart.py
+# 
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------  
+
+# RCAIDE Imports    
+from RCAIDE.Framework.Core                                                              import Data
+from RCAIDE.Framework.Optimization.Packages.scipy                                       import scipy_setup 
+from RCAIDE.Library.Methods.Propulsors.Converters.Rotor.Design.optimization_setup       import optimization_setup
+from RCAIDE.Library.Methods.Propulsors.Converters.Rotor.Design.set_optimized_parameters import set_optimized_parameters
+from RCAIDE.Library.Methods.Utilities.latin_hypercube_sampling                          import latin_hypercube_sampling
+
+# Python package imports   
+from concurrent.futures import ProcessPoolExecutor
+from copy import deepcopy
+import numpy as np
+import time 
+
+# ----------------------------------------------------------------------------------------------------------------------  
+#  Design Rotor Multistart
+# ----------------------------------------------------------------------------------------------------------------------   
+def design_rotor_multistart(rotor,number_of_starts = 4,aeroacoustic_weights = None,number_of_stations = 20,solver_name = 'SLSQP',
+                            iterations = 200,solver_sense_step = 1E-5,solver_tolerance = 1E-4,number_of_processes = None,seed = None):  
+    """ Optimizes lift-rotor or prop-rotor chord and twist from several starting blade geometries and for several
+        aeroacoustic weights, running the independent optimizations across a process pool. The first start of every
+        weight is the default starting geometry of design_lift_rotor and design_prop_rotor, the others are Latin
+        hypercube samples of the design variable bounds. The best feasible design of each weight is returned along
+        with the Pareto set of all designs over the performance and acoustic objectives.
+          
+          Inputs: 
+          rotor                              - lift-rotor or prop-rotor, see design_lift_rotor  [None]
+          number_of_starts                   - starting geometries per aeroacoustic weight      [None]
+          aeroacoustic_weights               - list of multiobjective aeroacoustic weights,
+                                               defaults to the weight of the rotor              [None]
+          number_of_stations                 - number of radial blade stations                  [None]
+          solver_name, iterations, 
+          solver_sense_step,solver_tolerance - optimizer settings, see design_lift_rotor        [None]
+          number_of_processes                - size of the process pool, the optimizations run
+                                               in this process if 1                             [None]
+          seed                               - seed of the Latin hypercube samples              [None]
+            
+          Outputs:
+          results.designs[i].
+             aeroacoustic_weight             - aeroacoustic weight of the design                [None]
+             initial_values                  - starting values of the design variables          [None]
+             rotor                           - optimized rotor                                  [None]
+             objective                       - aeroacoustic objective                           [None]
+             performance_objective           - performance objective                            [None]
+             acoustic_objective              - acoustic objective                               [None]
+             feasible                        - flag indicating that all constraints are met     [Boolean]
+          results.best_designs               - index of the best design of each weight          [None]
+          results.pareto_set                 - indices of the non-dominated designs             [None]
+              
+          Assumptions: 
+             Designs are compared on the objectives evaluated at the optimizer solution. Only feasible designs enter
+             the Pareto set and best designs, unless no design is feasible. 
+        
+          Source:
+             None 
+    """    
+    if aeroacoustic_weights is None:
+        aeroacoustic_weights = [rotor.optimization_parameters.multiobjective_aeroacoustic_weight]
+    
+    # set up the blade geometry and airfoil polars once, on a copy of the rotor that is sent to every optimization
+    rotor_tag      = rotor.tag
+    rotor          = deepcopy(rotor)
+    rotor.tag      = 'rotor'
+    
+    # starting geometries, shared by all weights 
+    inputs         = optimization_setup(rotor,number_of_stations,False).optimization_problem.inputs
+    lower_bounds   = np.array(inputs[:,2],dtype=float)
+    upper_bounds   = np.array(inputs[:,3],dtype=float)
+    initial_values = [np.array(inputs[:,1],dtype=float)]
+    if number_of_starts > 1:
+        rng     = np.random.default_rng(seed)
+        samples = latin_hypercube_sampling(len(inputs),number_of_starts - 1,bounds=(lower_bounds,upper_bounds),criterion='random',rng=rng)
+        initial_values.extend(list(samples))
+    
+    jobs = []
+    for weight in aeroacoustic_weights:
+        for x0 in initial_values: 
+            jobs.append((rotor,rotor_tag,weight,x0,number_of_stations,solver_name,iterations,solver_sense_step,solver_tolerance))
+    
+    ti = time.time()
+    if number_of_processes == 1:
+        designs = [optimize_rotor_from_start(*job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=number_of_processes) as executor:
+            designs = list(executor.map(optimize_rotor_from_start,*zip(*jobs)))
+    tf           = time.time()
+    elapsed_time = round((tf-ti)/60,2)
+    print('Multistart Rotor Optimization Simulation Time: ' + str(elapsed_time) + ' mins')   
+    
+    results              = Data()
+    results.designs      = designs
+    results.best_designs = []
+    for weight in aeroacoustic_weights:
+        candidates = [i for i,design in enumerate(designs) if design.aeroacoustic_weight == weight]
+        feasible   = [i for i in candidates if designs[i].feasible]
+        candidates = feasible if len(feasible) > 0 else candidates
+        results.best_designs.append(min(candidates,key=lambda i: designs[i].objective))
+    
+    objectives         = np.array([[design.performance_objective,design.acoustic_objective] for design in designs])
+    feasible           = np.array([design.feasible for design in designs])
+    candidates         = feasible if np.any(feasible) else np.ones(len(designs),dtype=bool)
+    results.pareto_set = list(np.where(compute_pareto_set(objectives,candidates))[0])
+    
+    return results
+
+# ----------------------------------------------------------------------------------------------------------------------  
+#  Optimize Rotor From Start
+# ----------------------------------------------------------------------------------------------------------------------   
+def optimize_rotor_from_start(rotor,rotor_tag,aeroacoustic_weight,initial_values,number_of_stations,solver_name,iterations,solver_sense_step,solver_tolerance):
+    """ Runs one rotor optimization from a given start and aeroacoustic weight on a copy of the rotor
+          
+          Inputs: 
+          rotor                   - lift-rotor or prop-rotor                          [None]
+          rotor_tag               - tag of the optimized rotor                        [None]
+          aeroacoustic_weight     - multiobjective aeroacoustic weight                [None]
+          initial_values          - starting values of the design variables           [None]
+          number_of_stations, 
+          solver settings         - see design_rotor_multistart                       [None]
+            
+          Outputs:
+          design                  - see design_rotor_multistart                       [None]
+              
+          Assumptions: 
+             None
+        
+          Source:
+             None 
+    """    
+    rotor                                                    = deepcopy(rotor)
+    rotor.optimization_parameters.multiobjective_aeroacoustic_weight = aeroacoustic_weight 
+    
+    optimization_problem                                     = optimization_setup(rotor,number_of_stations,False)
+    optimization_problem.optimization_problem.inputs[:,1]    = initial_values
+    output                                                   = scipy_setup.SciPy_Solve(optimization_problem,solver=solver_name, iter = iterations , sense_step = solver_sense_step,tolerance = solver_tolerance)    
+    
+    # evaluate the problem at the solution before reading the objectives and constraints
+    objective          = optimization_problem.objective(output)
+    constraints        = optimization_problem.inequality_constraint(output)
+    acoustic_objective = optimization_problem.summary.acoustic_objective
+    
+    # noise is not computed for a pure performance objective, evaluate the solution with a problem that includes 
+    # noise so that every design can enter the Pareto set 
+    if aeroacoustic_weight == 1:
+        acoustic_rotor     = deepcopy(rotor)
+        acoustic_rotor.optimization_parameters.multiobjective_aeroacoustic_weight = 0.5
+        acoustic_problem   = optimization_setup(acoustic_rotor,number_of_stations,False)
+        acoustic_problem.evaluate(output)
+        acoustic_objective = acoustic_problem.summary.acoustic_objective
+    
+    design                       = Data()
+    design.aeroacoustic_weight   = aeroacoustic_weight
+    design.initial_values        = initial_values
+    design.objective             = float(np.squeeze(objective))
+    design.performance_objective = float(np.squeeze(optimization_problem.summary.performance_objective))
+    design.acoustic_objective    = float(np.squeeze(acoustic_objective))
+    design.feasible              = bool(np.all(np.asarray(constraints,dtype=float) >= -solver_tolerance))
+    design.rotor                 = set_optimized_parameters(rotor,optimization_problem)
+    design.rotor.tag             = rotor_tag
+    
+    return design
+
+# ----------------------------------------------------------------------------------------------------------------------  
+#  Compute Pareto Set
+# ----------------------------------------------------------------------------------------------------------------------   
+def compute_pareto_set(objectives,candidates = None):
+    """ Flags the designs that are not dominated by any other candidate design, with all objectives minimized 
+          
+          Inputs: 
+          objectives    - objective values, (number of designs, number of objectives)   [None]
+          candidates    - flags of the designs to consider, defaults to all designs     [Boolean]
+            
+          Outputs:
+          pareto        - flags of the non-dominated candidate designs                 [Boolean]
+              
+          Assumptions: 
+             None
+        
+          Source:
+             None 
+    """    
+    objectives = np.atleast_2d(objectives)
+    if candidates is None:
+        candidates = np.ones(len(objectives),dtype=bool)
+    
+    # design j dominates design i if it is no worse in every objective and better in at least one 
+    no_worse  = np.all(objectives[None,:,:] <= objectives[:,None,:],axis=2)
+    better    = np.any(objectives[None,:,:] <  objectives[:,None,:],axis=2)
+    dominated = np.any(no_worse & better & candidates[None,:],axis=1)
+    
+    return candidates & ~dominated
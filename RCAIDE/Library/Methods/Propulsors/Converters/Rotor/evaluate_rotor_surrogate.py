@@ -0,0 +1,200 @@
+# RCAIDE/Library/Methods/Propulsors/Converters/Rotor/evaluate_rotor_surrogate.py
+#
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+from RCAIDE.Framework.Core                                            import Data, Units, orientation_product, orientation_transpose
+from RCAIDE.Library.Methods.Propulsors.Converters.Rotor.train_rotor_surrogate import train_rotor_surrogate, rotor_geometry_key
+
+# package imports
+import numpy as np
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  evaluate_rotor_surrogate
+# ----------------------------------------------------------------------------------------------------------------------
+def evaluate_rotor_surrogate(propulsor,state,center_of_gravity= [[0.0, 0.0,0.0]]):
+    """Computes the performance of a rotor by interpolating its operating map, see train_rotor_surrogate. The
+    map is trained on the first call and again whenever the rotor geometry changes. If the rotor requires the
+    2D blade element analysis, or if any control point lies outside the trained envelope, nothing is computed
+    and compute_rotor_performance runs the full blade element analysis instead.
+
+    Assumptions:
+        Only the integrated loads are computed: the blade and disc distributions of compute_rotor_performance,
+        used by the noise analyses, are not available with the operating map.
+
+    Source:
+        None
+
+    Inputs:
+        rotor_conditions.
+          omega                          [radian/s]
+          pitch_command                  [radians]
+          throttle                       [-]
+        conditions.freestream.
+          density                        [kg/m^3]
+          speed_of_sound                 [m/s]
+        conditions.frames.
+          body.transform_to_inertial     (rotation matrix)
+          inertial.velocity_vector       [m/s]
+
+    Outputs:
+        evaluated                        - True if the operating map was used                     [boolean]
+        conditions.energy[propulsor.tag][rotor.tag]
+          thrust, torque, power, moment, efficiency, figure_of_merit and coefficients,
+          as computed by compute_rotor_performance
+
+    Properties Used:
+        rotor.
+          use_2d_analysis                [boolean]
+          nonuniform_freestream          [boolean]
+          sweep_distribution             [m]
+    """
+    conditions  = state.conditions
+    if 'rotor' in  propulsor:
+        rotor =  propulsor.rotor
+    elif 'propeller' in  propulsor:
+        rotor =  propulsor.propeller
+
+    if rotor.use_2d_analysis or rotor.nonuniform_freestream or np.any(np.array([rotor.sweep_distribution])!=0):
+        return False
+
+    if 'geometry_key' not in rotor.surrogates or rotor.surrogates.geometry_key != rotor_geometry_key(rotor):
+        train_rotor_surrogate(rotor)
+    surrogates  = rotor.surrogates
+
+    propulsor_conditions  = conditions.energy[propulsor.tag]
+    rotor_conditions      = propulsor_conditions[rotor.tag]
+    commanded_TV          = propulsor_conditions.commanded_thrust_vector_angle
+    eta                   = rotor_conditions.throttle
+    omega                 = rotor_conditions.omega
+    pitch_c               = rotor_conditions.pitch_command
+    B                     = rotor.number_of_blades
+    R                     = rotor.tip_radius
+    D                     = 2*R
+
+    rho     = conditions.freestream.density[:,0,None]
+    a       = conditions.freestream.speed_of_sound[:,0,None]
+    Vv      = conditions.frames.inertial.velocity_vector
+    rho_0   = rho
+    ctrl_pts= len(Vv)
+
+    # Velocity in the rotor frame
+    T_body2inertial         = conditions.frames.body.transform_to_inertial
+    T_inertial2body         = orientation_transpose(T_body2inertial)
+    V_body                  = orientation_product(T_inertial2body,Vv)
+    body2thrust,orientation = rotor.body_to_prop_vel(commanded_TV)
+    T_body2thrust           = orientation_transpose(np.ones_like(T_body2inertial[:])*body2thrust)
+    V_thrust                = orientation_product(T_body2thrust,V_body)
+
+    # Check and correct for hover
+    V         = V_thrust[:,0,None]
+    V[V==0.0] = 1E-6
+
+    # operating point on the map, stopped rotors are zeroed below as in compute_rotor_performance
+    n         = omega/(2.*np.pi)
+    spinning  = (omega > 0.0)[:,0]
+    if np.any(omega < 0.0):
+        return False
+    n_safe    = np.where(omega > 0.0,n,1.0)
+    J         = np.where(omega > 0.0,V/(n_safe*D),0.0)
+    M_tip     = omega*R/a
+    pitch     = np.ones_like(omega)*pitch_c
+    points    = np.hstack([J,M_tip,pitch,rho])[spinning]
+
+    # outside the trained envelope the full blade element analysis is used
+    tol = 1E-9*np.maximum(1.,np.maximum(np.abs(surrogates.lower_bounds),np.abs(surrogates.upper_bounds)))
+    if np.any(points < surrogates.lower_bounds - tol) or np.any(points > surrogates.upper_bounds + tol):
+        return False
+
+    Ct_raw  = np.zeros((ctrl_pts,1))
+    Cq_raw  = np.zeros((ctrl_pts,1))
+    Cp_raw  = np.zeros((ctrl_pts,1))
+    Crd     = np.zeros((ctrl_pts,1))
+    query   = points[:,surrogates.active_axes]
+    Ct_raw[spinning,0] = surrogates.thrust_coefficient(query)
+    Cq_raw[spinning,0] = surrogates.torque_coefficient(query)
+    Cp_raw[spinning,0] = surrogates.power_coefficient(query)
+    Crd[spinning,0]    = surrogates.rotor_drag_coefficient(query)
+
+    # forces
+    thrust     = Ct_raw*rho_0*(n*n)*(D*D*D*D)
+    torque     = Cq_raw*rho_0*(n*n)*(D*D*D*D*D)
+    power      = Cp_raw*rho_0*(n*n*n)*(D*D*D*D*D)
+    rotor_drag = Crd*rho_0*(n*n)*(D*D*D*D)
+
+    # calculate coefficients
+    Cq       = Cq_raw*1.
+    Ct       = Ct_raw*1.
+    Cp       = Cp_raw*1.
+    with np.errstate(divide='ignore', invalid='ignore'):
+        etap     = V*thrust/power
+        A        = np.pi*(R**2 - rotor.hub_radius**2)
+        FoM      = thrust*np.sqrt(thrust/(2*rho_0*A))/power
+
+    # prevent things from breaking
+    Cq[Cq<0]                   = 0.
+    Ct[Ct<0]                   = 0.
+    Cp[Cp<0]                   = 0.
+    thrust[omega==0.0]         = 0.0
+    power[omega==0.0]          = 0.0
+    torque[omega==0.0]         = 0.0
+    rotor_drag[omega==0.0]     = 0.0
+    Ct[omega==0.0]             = 0.0
+    Cp[omega==0.0]             = 0.0
+    etap[omega==0.0]           = 0.
+
+    thrust[eta[:,0]  <=0.0]    = 0.0
+    power[eta[:,0]  <=0.0]     = 0.0
+    torque[eta[:,0]  <=0.0]    = 0.0
+    power[eta>1.0]             = power[eta>1.0]*eta[eta>1.0]
+    thrust[eta[:,0]>1.0,:]     = thrust[eta[:,0]>1.0,:]*eta[eta[:,0]>1.0,:]
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        disc_loading           = thrust/(np.pi*(R**2))
+        power_loading          = thrust/(power)
+
+    # Make the thrust a 3D vector
+    thrust_prop_frame      = np.zeros((ctrl_pts,3))
+    thrust_prop_frame[:,0] = thrust[:,0]
+    thrust_vector          = orientation_product(orientation_transpose(T_body2thrust),thrust_prop_frame)
+
+    # Compute moment
+    moment_vector           = np.zeros((ctrl_pts,3))
+    moment_vector[:,0]      = rotor.origin[0][0]  -  center_of_gravity[0][0]
+    moment_vector[:,1]      = rotor.origin[0][1]  -  center_of_gravity[0][1]
+    moment_vector[:,2]      = rotor.origin[0][2]  -  center_of_gravity[0][2]
+    moment                  =  np.cross(moment_vector, thrust_vector)
+
+    outputs                                       = Data(
+                torque                            = torque,
+                thrust                            = thrust_vector,
+                power                             = power,
+                moment                            = moment,
+                rpm                               = omega /Units.rpm ,
+                tip_mach                          = omega * R / conditions.freestream.speed_of_sound,
+                efficiency                        = etap,
+                orientation                       = orientation,
+                number_radial_stations            = len(rotor.chord_distribution),
+                number_azimuthal_stations         = rotor.number_azimuthal_stations,
+                speed_of_sound                    = conditions.freestream.speed_of_sound,
+                density                           = conditions.freestream.density,
+                velocity                          = Vv,
+                disc_loading                      = disc_loading,
+                power_loading                     = power_loading,
+                omega                             = omega,
+                thrust_per_blade                  = thrust/B,
+                thrust_coefficient                = Ct,
+                torque_per_blade                  = torque/B,
+                torque_coefficient                = Cq,
+                power_coefficient                 = Cp,
+                rotor_drag                        = rotor_drag,
+                rotor_drag_coefficient            = Crd,
+                pitch_command                     = pitch_c,
+                figure_of_merit                   = FoM,
+        )
+
+    conditions.energy[propulsor.tag][rotor.tag] = outputs
+
+    return True
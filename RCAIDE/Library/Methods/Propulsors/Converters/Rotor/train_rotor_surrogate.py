@@ -0,0 +1,175 @@
+# RCAIDE/Library/Methods/Propulsors/Converters/Rotor/train_rotor_surrogate.py
+#
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+import RCAIDE
+from RCAIDE.Framework.Core                                          import Data, Units, hash_data
+from RCAIDE.Framework.Mission.Common                                import Results, Conditions
+
+# package imports
+from scipy.interpolate import RegularGridInterpolator
+from copy import deepcopy
+import numpy as np
+import hashlib
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  train_rotor_surrogate
+# ----------------------------------------------------------------------------------------------------------------------
+def train_rotor_surrogate(rotor):
+    """Computes the operating map of a rotor with the blade element momentum theory analysis of
+    compute_rotor_performance and builds linear interpolants of the thrust, torque, power and rotor drag
+    coefficients over advance ratio, tip Mach number, blade pitch command and freestream density. All training
+    points are evaluated in a single vectorized call, with one control point per point of the map.
+
+    Assumptions:
+        The rotor is analyzed with the axisymmetric (1D) blade element analysis, so the map only depends on the
+        axial velocity in the rotor frame. The density axis is sampled on the US Standard 1976 atmosphere at the
+        training altitudes, so viscosity and speed of sound follow the standard atmosphere. Axes with a single
+        training value are not interpolated, and queries must match that value.
+
+    Source:
+        None
+
+    Inputs:
+        rotor.training.
+          advance_ratio        - advance ratios of the map                                          [-]
+          tip_mach             - tip Mach numbers of the map                                        [-]
+          pitch_command        - blade pitch commands of the map, None for the rotor default        [radians]
+          altitude             - altitudes at which the densities of the map are sampled            [m]
+
+    Outputs:
+        rotor.surrogates.
+          lower_bounds         - lowest (advance ratio, tip Mach, pitch, density) of the map        [-,-,rad,kg/m^3]
+          upper_bounds         - highest (advance ratio, tip Mach, pitch, density) of the map       [-,-,rad,kg/m^3]
+          active_axes          - indices of the axes with more than one training value              [-]
+          thrust_coefficient   - interpolant of the thrust coefficient                              [-]
+          torque_coefficient   - interpolant of the torque coefficient                              [-]
+          power_coefficient    - interpolant of the power coefficient                               [-]
+          rotor_drag_coefficient - interpolant of the rotor drag coefficient                        [-]
+          geometry_key         - hash of the rotor geometry the map was trained for                 <string>
+
+    Properties Used:
+        rotor.
+          tip_radius           [m]
+          variable_pitch       [boolean]
+    """
+    training      = rotor.training
+    J_data        = np.asarray(training.advance_ratio,dtype=float)
+    M_data        = np.asarray(training.tip_mach,dtype=float)
+    pitch_data    = training.pitch_command
+    if pitch_data is None:
+        if rotor.variable_pitch:
+            pitch_data = np.linspace(-20.,20.,9) * Units.degrees
+        else:
+            pitch_data = np.array([0.])
+    pitch_data    = np.asarray(pitch_data,dtype=float)
+    altitude      = np.atleast_1d(np.asarray(training.altitude,dtype=float))
+
+    # sample the atmosphere, densities are stored in increasing order
+    atmosphere    = RCAIDE.Framework.Analyses.Atmospheric.US_Standard_1976()
+    atmo_data     = atmosphere.compute_values(altitude)
+    order         = np.argsort(atmo_data.density[:,0])
+    rho_data      = atmo_data.density[order,0]
+    mu_data       = atmo_data.dynamic_viscosity[order,0]
+    a_data        = atmo_data.speed_of_sound[order,0]
+    T_data        = atmo_data.temperature[order,0]
+
+    # full factorial map, one control point per sample
+    J,M,pitch,k   = [g.ravel() for g in np.meshgrid(J_data,M_data,pitch_data,np.arange(len(rho_data)),indexing='ij')]
+    n_pts         = len(J)
+    R             = rotor.tip_radius
+    D             = 2*R
+    omega         = M*a_data[k]/R
+    V             = J*(omega/(2*np.pi))*D
+
+    # analyze an axially aligned copy of the rotor so that the rotor frame velocity is the freestream velocity
+    map_rotor                          = deepcopy(rotor)
+    map_rotor.use_surrogate            = False
+    map_rotor.surrogates               = Data()
+    map_rotor.use_2d_analysis          = False
+    map_rotor.variable_pitch           = True
+    map_rotor.orientation_euler_angles = [0.,0.,0.]
+    map_rotor.origin                   = [[0.,0.,0.]]
+    propulsor                          = Data(tag = 'rotor_map', rotor = map_rotor)
+
+    conditions                                   = Results()
+    conditions.freestream.density                = rho_data[k][:,None]
+    conditions.freestream.dynamic_viscosity      = mu_data[k][:,None]
+    conditions.freestream.speed_of_sound         = a_data[k][:,None]
+    conditions.freestream.temperature            = T_data[k][:,None]
+    conditions.frames.inertial.velocity_vector   = np.zeros((n_pts,3))
+    conditions.frames.inertial.velocity_vector[:,0] = V
+    conditions.frames.body.transform_to_inertial = np.repeat(np.eye(3)[None,:,:],n_pts,axis=0)
+
+    propulsor_conditions                               = Conditions()
+    propulsor_conditions.commanded_thrust_vector_angle = np.zeros((n_pts,1))
+    propulsor_conditions[map_rotor.tag]                = Conditions()
+    propulsor_conditions[map_rotor.tag].throttle       = np.ones((n_pts,1))
+    propulsor_conditions[map_rotor.tag].omega          = omega[:,None]
+    propulsor_conditions[map_rotor.tag].pitch_command  = pitch[:,None]
+    conditions.energy[propulsor.tag]                   = propulsor_conditions
+
+    state            = Data()
+    state.conditions = conditions
+    RCAIDE.Library.Methods.Propulsors.Converters.Rotor.compute_rotor_performance(propulsor,state)
+    outputs          = conditions.energy[propulsor.tag][map_rotor.tag]
+
+    # signed coefficients, the clipping of negative coefficients is applied when the map is evaluated
+    rho   = rho_data[k][:,None]
+    n     = (omega/(2*np.pi))[:,None]
+    shape = (len(J_data),len(M_data),len(pitch_data),len(rho_data))
+    Ct    = (rotor.number_of_blades*outputs.thrust_per_blade/(rho*(n*n)*(D**4))).reshape(shape)
+    Cq    = (outputs.torque/(rho*(n*n)*(D**5))).reshape(shape)
+    Cp    = (outputs.power/(rho*(n*n*n)*(D**5))).reshape(shape)
+    Crd   = outputs.rotor_drag_coefficient.reshape(shape)
+
+    axes        = [J_data,M_data,pitch_data,rho_data]
+    active_axes = np.array([i for i in range(4) if len(axes[i]) > 1])
+    grid        = tuple(axes[i] for i in active_axes)
+    index       = tuple(slice(None) if len(axes[i]) > 1 else 0 for i in range(4))
+
+    surrogates                        = Data()
+    surrogates.lower_bounds           = np.array([axis[0]  for axis in axes])
+    surrogates.upper_bounds           = np.array([axis[-1] for axis in axes])
+    surrogates.active_axes            = active_axes
+    surrogates.thrust_coefficient     = RegularGridInterpolator(grid,Ct[index] ,method = 'linear', bounds_error=False, fill_value=None)
+    surrogates.torque_coefficient     = RegularGridInterpolator(grid,Cq[index] ,method = 'linear', bounds_error=False, fill_value=None)
+    surrogates.power_coefficient      = RegularGridInterpolator(grid,Cp[index] ,method = 'linear', bounds_error=False, fill_value=None)
+    surrogates.rotor_drag_coefficient = RegularGridInterpolator(grid,Crd[index],method = 'linear', bounds_error=False, fill_value=None)
+    surrogates.geometry_key           = rotor_geometry_key(rotor)
+    rotor.surrogates                  = surrogates
+
+    return
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  rotor_geometry_key
+# ----------------------------------------------------------------------------------------------------------------------
+def rotor_geometry_key(rotor):
+    """Returns a hash of the rotor properties that the operating map depends on, used to retrain the map when
+    the rotor is modified
+
+    Assumptions:
+        Airfoils are identified by their tags
+
+    Source:
+        None
+
+    Inputs:
+        rotor        - rotor component                  [-]
+
+    Outputs:
+        key          - hash of the rotor geometry        <string>
+
+    Properties Used:
+        N/A
+    """
+    key_hash = hashlib.sha1()
+    hash_data(key_hash,[rotor.number_of_blades,rotor.tip_radius,rotor.hub_radius,rotor.twist_distribution,
+                        rotor.chord_distribution,rotor.sweep_distribution,rotor.radius_distribution,
+                        rotor.thickness_to_chord,rotor.airfoil_polar_stations,rotor.variable_pitch,
+                        [airfoil.tag for airfoil in rotor.Airfoils],type(rotor.Wake).__name__,rotor.training])
+
+    return key_hash.hexdigest()
@@ -46,9 +46,7 @@ def compute_turbine_performance(turbine,turbine_conditions,conditions):
     T0              = turbine_conditions.inputs.static_temperature
     P0              = turbine_conditions.inputs.static_pressure  
     M0              = turbine_conditions.inputs.mach_number   
-    gamma           = working_fluid.compute_gamma(T0,P0) 
-    Cp              = working_fluid.compute_cp(T0,P0) 
-    R               = working_fluid.compute_R(T0,P0)    
+    Cp,gamma,R      = working_fluid.compute_thermodynamic_properties(T0,P0)
     
     #Unpack turbine entering properties 
     eta_mech        = turbine.mechanical_efficiency
@@ -16,6 +16,7 @@ from RCAIDE.Library.Methods.Propulsors.Converters.Turbine            import comp
 from RCAIDE.Library.Methods.Propulsors.Converters.Expansion_Nozzle   import compute_expansion_nozzle_performance 
 from RCAIDE.Library.Methods.Propulsors.Converters.Compression_Nozzle import compute_compression_nozzle_performance
 from RCAIDE.Library.Methods.Propulsors.Turbofan_Propulsor            import compute_thrust
+from RCAIDE.Library.Methods.Propulsors.Common.evaluate_engine_deck   import evaluate_engine_deck
 
 import  numpy as  np
 from copy import  deepcopy
@@ -48,6 +49,13 @@ def compute_turbofan_performance(turbofan,state,center_of_gravity= [[0.0, 0.0,0.
     Properties Used: 
     N.A.        
     ''' 
+    # interpolate the engine deck, the thermodynamic cycle is run outside the deck
+    if turbofan.use_engine_deck:
+        deck_results = evaluate_engine_deck(turbofan,state,center_of_gravity)
+        if deck_results is not None:
+            thrust,moment,power = deck_results
+            return thrust,moment,power,True,turbofan.tag
+
     conditions                = state.conditions   
     noise_conditions          = conditions.noise[turbofan.tag] 
     turbofan_conditions       = conditions.energy[turbofan.tag] 
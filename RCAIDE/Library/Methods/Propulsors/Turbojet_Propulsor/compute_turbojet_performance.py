@@ -15,6 +15,7 @@ from RCAIDE.Library.Methods.Propulsors.Converters.Turbine            import comp
 from RCAIDE.Library.Methods.Propulsors.Converters.Supersonic_Nozzle  import compute_supersonic_nozzle_performance
 from RCAIDE.Library.Methods.Propulsors.Converters.Compression_Nozzle import compute_compression_nozzle_performance
 from RCAIDE.Library.Methods.Propulsors.Turbojet_Propulsor            import compute_thrust
+from RCAIDE.Library.Methods.Propulsors.Common.evaluate_engine_deck   import evaluate_engine_deck
 
 # python imports 
 import  numpy as  np 
@@ -48,6 +49,13 @@ def compute_turbojet_performance(turbojet,state,center_of_gravity= [[0.0, 0.0,0.
     Properties Used: 
     N.A.          
     ''' 
+    # interpolate the engine deck, the thermodynamic cycle is run outside the deck
+    if turbojet.use_engine_deck:
+        deck_results = evaluate_engine_deck(turbojet,state,center_of_gravity)
+        if deck_results is not None:
+            thrust,moment,power = deck_results
+            return thrust,moment,power,True,turbojet.tag
+
     conditions                = state.conditions
     noise_conditions          = conditions.noise[turbojet.tag]  
     turbojet_conditions       = conditions.energy[turbojet.tag]
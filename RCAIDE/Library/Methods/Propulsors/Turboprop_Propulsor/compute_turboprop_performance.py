@@ -16,6 +16,7 @@ from RCAIDE.Library.Methods.Propulsors.Converters.Turbine            import comp
 from RCAIDE.Library.Methods.Propulsors.Converters.Expansion_Nozzle   import compute_expansion_nozzle_performance 
 from RCAIDE.Library.Methods.Propulsors.Converters.Compression_Nozzle import compute_compression_nozzle_performance
 from RCAIDE.Library.Methods.Propulsors.Turboprop_Propulsor           import compute_thrust
+from RCAIDE.Library.Methods.Propulsors.Common.evaluate_engine_deck   import evaluate_engine_deck
  
 # python imports 
 from   copy import deepcopy
@@ -49,6 +50,13 @@ def compute_turboprop_performance(turboprop,state,center_of_gravity= [[0.0, 0.0,
     Properties Used: 
     N.A.        
     ''' 
+    # interpolate the engine deck, the thermodynamic cycle is run outside the deck
+    if turboprop.use_engine_deck:
+        deck_results = evaluate_engine_deck(turboprop,state,center_of_gravity)
+        if deck_results is not None:
+            thrust,moment,power = deck_results
+            return thrust,moment,power,True,turboprop.tag
+
     conditions                                            = state.conditions 
     noise_conditions                                      = conditions.noise[turboprop.tag]  
     turboprop_conditions                                  = conditions.energy[turboprop.tag]
@@ -15,6 +15,7 @@ from RCAIDE.Library.Methods.Propulsors.Converters.Turbine            import comp
 from RCAIDE.Library.Methods.Propulsors.Converters.Expansion_Nozzle   import compute_expansion_nozzle_performance 
 from RCAIDE.Library.Methods.Propulsors.Converters.Compression_Nozzle import compute_compression_nozzle_performance
 from RCAIDE.Library.Methods.Propulsors.Turboshaft_Propulsor          import compute_power
+from RCAIDE.Library.Methods.Propulsors.Common.evaluate_engine_deck   import evaluate_engine_deck
  
 # python imports 
 from copy import deepcopy 
@@ -44,6 +45,13 @@ def compute_turboshaft_performance(turboshaft,state,center_of_gravity= [[0.0, 0.
     Properties Used: 
     N.A.        
     ''' 
+    # interpolate the engine deck, the thermodynamic cycle is run outside the deck
+    if turboshaft.use_engine_deck:
+        deck_results = evaluate_engine_deck(turboshaft,state,center_of_gravity)
+        if deck_results is not None:
+            thrust,moment,power = deck_results
+            return thrust,moment,power,True,turboshaft.tag
+
     conditions                = state.conditions 
     noise_conditions          = conditions.noise[turboshaft.tag]  
     turboshaft_conditions     = conditions.energy[turboshaft.tag]
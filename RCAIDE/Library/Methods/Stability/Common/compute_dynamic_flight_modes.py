@@ -9,6 +9,7 @@
 
 # RCAIDE imports
 import RCAIDE 
+from RCAIDE.Framework.Core import Data
 from RCAIDE.Library.Components.Wings.Control_Surfaces import Aileron , Elevator  
 
 # python imports 
@@ -82,7 +83,6 @@ def compute_dynamic_flight_modes(state,settings,aircraft):
         ## Build longitudinal EOM A Matrix (stability axis)
         ALon = np.zeros((num_cases,4,4))
         BLon = np.zeros((num_cases,4,1)) 
-        CLon = np.zeros((num_cases,4,4))
         
 
         # Elevator effectiveness
@@ -111,8 +111,6 @@ def compute_dynamic_flight_modes(state,settings,aircraft):
             SSD.CZ_alpha_dot =  a_t * dEpsilon_dalpha *  (l_t /u0) *  (S_t / S) 
             SSD.CM_alpha_dot =  -a_t * V_H * dEpsilon_dalpha*  (l_t /u0)        
                         
-        for i in range(num_cases): 
-            CLon[i,:,:] = np.eye(4)        
         Cw         = m * g / (qDyn0 * S_ref)  
         Xu         = rho * u0 * S_ref * Cw * np.sin(theta0) + 0.5 * rho * u0 * S_ref * SSD.CX_u  
         Xw         = 0.5 * rho * u0 * S_ref * SSD.CX_alpha     
@@ -141,71 +139,35 @@ def compute_dynamic_flight_modes(state,settings,aircraft):
         ALon[:,3,2] = 1
         ALon[:,3,3] = 0 
 
-        for wing in aircraft.wings: 
-            if wing.control_surfaces :
-                for ctrl_surf in wing.control_surfaces: 
-                    if (type(ctrl_surf) ==  Elevator):
-                        ele = conditions.control_surfaces.elevator.static_stability.coefficients 
-                        Xe  = 0 # Neglect
-                        Ze  = 0.5 * rho * u0 * u0 * S_ref * ele.lift
-                        Me  = 0.5 * rho * u0 * u0 * S_ref * c_ref * ele.M
-                        
-                        BLon[:,0,0] = Xe / m
-                        BLon[:,1,0] = (Ze / (m - ZwDot)).T[0]
-                        BLon[:,2,0] = (Me / Iyy + MwDot / Iyy * Ze / (m - ZwDot)).T[0]
-                        BLon[:,3,0] = 0        
+        control_surface_types = [type(ctrl_surf) for wing in aircraft.wings for ctrl_surf in wing.control_surfaces]
+        if Elevator in control_surface_types:
+            ele = conditions.control_surfaces.elevator.static_stability.coefficients 
+            Xe  = 0 # Neglect
+            Ze  = 0.5 * rho * u0 * u0 * S_ref * ele.lift
+            Me  = 0.5 * rho * u0 * u0 * S_ref * c_ref * ele.M
+            
+            BLon[:,0,0] = Xe / m
+            BLon[:,1,0] = (Ze / (m - ZwDot)).T[0]
+            BLon[:,2,0] = (Me / Iyy + MwDot / Iyy * Ze / (m - ZwDot)).T[0]
+            BLon[:,3,0] = 0        
          
-        # Look at eigenvalues and eigenvectors
-        LonModes                  = np.zeros((num_cases,4), dtype = complex)
-        phugoidFreqHz             = np.zeros((num_cases,1))
-        phugoidDamping            = np.zeros((num_cases,1))
-        phugoidTimeDoubleHalf     = np.zeros((num_cases,1))
-        shortPeriodFreqHz         = np.zeros((num_cases,1))
-        shortPeriodDamping        = np.zeros((num_cases,1))
-        shortPeriodTimeDoubleHalf = np.zeros((num_cases,1))
-        
-        if np.any(np.isnan(ALon)):
-            pass
-        else:
-            for i_long in range(num_cases):
-                D  , V = np.linalg.eig(ALon[i_long,:,:]) # State order: u, w, q, theta
-                LonModes[i_long,:] = D
-                
-                # Find phugoid
-                phugoidInd                    = np.argmax(D)  
-                phugoidFreqHz[i_long]         = abs(D[phugoidInd]) / (2 * np.pi)
-                phugoidDamping[i_long]        = np.sqrt(1/ (1 + ( D[phugoidInd].imag/ D[phugoidInd].real )**2 ))  
-                phugoidTimeDoubleHalf[i_long] = np.log(2) / abs(2 * np.pi * phugoidFreqHz[i_long] * phugoidDamping[i_long])
-                
-                # Find short period
-                shortPeriodInd                    = np.argmin(D)  
-                shortPeriodFreqHz[i_long]         = abs(D[shortPeriodInd]) / (2 * np.pi)
-                shortPeriodDamping[i_long]        = np.sqrt(1/ (1 + (D[shortPeriodInd].imag/D[shortPeriodInd].real)**2 ))  
-                shortPeriodTimeDoubleHalf[i_long] = np.log(2) / abs(2 * np.pi * shortPeriodFreqHz[i_long] * shortPeriodDamping[i_long]) 
+        # Look at eigenvalues
+        LonModes, phugoid, shortPeriod = compute_longitudinal_modes(ALon)
         
         ## Build lateral EOM A Matrix (stability axis)
         ALat = np.zeros((num_cases,4,4))
         BLat = np.zeros((num_cases,4,1))
-        CLat = np.zeros((num_cases,4,4))
-        for c_i1 in range(num_cases): 
-            CLat[c_i1,:,:] = np.eye(4) 
         DLat = np.zeros((num_cases,4,1))
         
         # Need to compute Ixx, Izz, and Ixz as a function of alpha
-        Ixp  = np.zeros((num_cases,1))
-        Izp  = np.zeros((num_cases,1))
-        Ixzp = np.zeros((num_cases,1))
-        
-        for c_i2 in range(num_cases): 
-            R       = np.array( [[np.cos(AoA[c_i2][0]) ,  - np.sin(AoA[c_i2][0]) ], [ np.sin( AoA[c_i2][0]) , np.cos(AoA[i][0])]])
-            modI    = np.array([[moments_of_inertia[0][0],moments_of_inertia[0][2]],[moments_of_inertia[2][0],moments_of_inertia[2][2]]] ) 
-            INew    = R * modI  * np.transpose(R)
-            IxxStab =  INew[0,0]
-            IxzStab = -INew[0,1]
-            IzzStab =  INew[1,1]
-            Ixp[c_i2]  = (IxxStab * IzzStab - IxzStab**2) / IzzStab
-            Izp[c_i2]  = (IxxStab * IzzStab - IxzStab**2) / IxxStab
-            Ixzp[c_i2] = IxzStab / (IxxStab * IzzStab - IxzStab**2) 
+        cos_AoA = np.cos(AoA[:,0])
+        sin_AoA = np.sin(AoA[:,0])
+        IxxStab =  cos_AoA * moments_of_inertia[0][0] * cos_AoA
+        IxzStab =  sin_AoA * moments_of_inertia[0][2] * sin_AoA
+        IzzStab =  cos_AoA * moments_of_inertia[2][2] * cos_AoA
+        Ixp     = ((IxxStab * IzzStab - IxzStab**2) / IzzStab)[:,None]
+        Izp     = ((IxxStab * IzzStab - IxzStab**2) / IxxStab)[:,None]
+        Ixzp    = (IxzStab / (IxxStab * IzzStab - IxzStab**2))[:,None]
             
         Yv = 0.5 * rho * u0 * S_ref * SSD.CY_beta 
         Yr = 0.25 * rho * u0 * b_ref * S_ref * SSD.CY_r
@@ -217,19 +179,16 @@ def compute_dynamic_flight_modes(state,settings,aircraft):
         Nr = 0.25 * rho * u0 * b_ref**2 * S_ref * SSD.CN_r
         
         # Aileron effectiveness 
-        for wing in aircraft.wings:
-            if wing.control_surfaces :
-                for ctrl_surf in wing.control_surfaces:
-                    if (type(ctrl_surf) ==  Aileron): 
-                        ail = conditions.control_surfaces.aileron.static_stability.coefficients                  
-                        Ya = 0.5 * rho * u0 * u0 * S_ref * ail.Y 
-                        La = 0.5 * rho * u0 * u0 * S_ref * b_ref * ail.L 
-                        Na = 0.5 * rho * u0 * u0 * S_ref * b_ref * ail.N 
-                        
-                        BLat[:,0,0] = (Ya / m).T[0]
-                        BLat[:,1,0] = (La / Ixp + Ixzp * Na).T[0]
-                        BLat[:,2,0] = (Ixzp * La + Na / Izp).T[0]
-                        BLat[:,3,0] = 0
+        if Aileron in control_surface_types:
+            ail = conditions.control_surfaces.aileron.static_stability.coefficients                  
+            Ya = 0.5 * rho * u0 * u0 * S_ref * ail.Y 
+            La = 0.5 * rho * u0 * u0 * S_ref * b_ref * ail.L 
+            Na = 0.5 * rho * u0 * u0 * S_ref * b_ref * ail.N 
+            
+            BLat[:,0,0] = (Ya / m).T[0]
+            BLat[:,1,0] = (La / Ixp + Ixzp * Na).T[0]
+            BLat[:,2,0] = (Ixzp * La + Na / Izp).T[0]
+            BLat[:,3,0] = 0
      
         ALat[:,0,0] = (Yv / m).T[0]  
         ALat[:,0,2] = (Yr/m - u0).T[0] 
@@ -250,47 +209,7 @@ def compute_dynamic_flight_modes(state,settings,aircraft):
         ALat[:,3,2] = (np.tan(theta0)).T[0] 
         ALat[:,3,3] = 0
                                     
-        LatModes                    = np.zeros((num_cases,4),dtype=complex)
-        dutchRollFreqHz             = np.zeros((num_cases,1))
-        dutchRollDamping            = np.zeros((num_cases,1))
-        dutchRollTimeDoubleHalf     = np.zeros((num_cases,1))
-        rollSubsistenceFreqHz       = np.zeros((num_cases,1))
-        rollSubsistenceTimeConstant = np.zeros((num_cases,1))
-        rollSubsistenceDamping      = np.zeros((num_cases,1))
-        spiralFreqHz                = np.zeros((num_cases,1))
-        spiralTimeDoubleHalf        = np.zeros((num_cases,1))
-        spiralDamping               = np.zeros((num_cases,1))
-        dutchRoll_mode_real         = np.zeros((num_cases,1))
-        
-        for i_lat in range(num_cases):
-            try: 
-                D  , V = np.linalg.eig(ALat[i_lat,:,:]) # State order: u, w, q, theta
-                LatModes[i_lat,:] = D  
-                
-                real_parts = LatModes[i_lat,:].real
-                unique_elements, counts = np.unique(real_parts, return_counts=True)
-                idx = np.where(counts==2)[0]
-    
-                dutchRollFreqHz[i_lat]         = abs(D[idx]) / (2 * np.pi)
-                dutchRollDamping[i_lat]        = np.sqrt(1/ (1 + ( D[idx].imag/ D[idx].real )**2 ))  
-                dutchRollTimeDoubleHalf[i_lat] = np.log(2) / abs(2 * np.pi * dutchRollFreqHz[i_lat] * dutchRollDamping[i_lat])
-                dutchRoll_mode_real[i_lat]     = D[idx].real / (2 * np.pi)
-                
-                dutch_roll_idx                 = np.where( unique_elements[idx] == D.real )[0]
-                
-                remaining_modes                    = np.delete(D, dutch_roll_idx)
-                rollInd                            = np.argmin(remaining_modes) 
-                rollSubsistenceFreqHz[i_lat]       = abs(remaining_modes[rollInd]) / 2 / np.pi
-                rollSubsistenceDamping[i_lat]      = - np.sign(remaining_modes[rollInd].real)
-                rollSubsistenceTimeConstant[i_lat] = 1 / (2 * np.pi * rollSubsistenceFreqHz[i_lat] * rollSubsistenceDamping[i_lat])
-                
-                # Find spiral mode 
-                sprial_mode                 = np.delete(remaining_modes,rollInd)             
-                spiralFreqHz[i_lat]         = abs(sprial_mode) / 2 / np.pi
-                spiralDamping[i_lat]        = - np.sign(sprial_mode.real)
-                spiralTimeDoubleHalf[i_lat] = np.log(2) / abs(2 * np.pi * spiralFreqHz[i_lat] * spiralDamping[i_lat])
-            except:
-                pass 
+        LatModes, dutchRoll, rollSubsistence, spiral = compute_lateral_modes(ALat)
         
         # Inertial coupling susceptibility
         # See Etkin & Reid pg. 118 
@@ -301,24 +220,153 @@ def compute_dynamic_flight_modes(state,settings,aircraft):
         # ------------------------------------------------------------------------------------------------------------------------  
         DS.LongModes.LongModes                    = LonModes
         #DS.LongModes.LongSys                      = LonSys    
-        DS.LongModes.phugoidFreqHz                = phugoidFreqHz
-        DS.LongModes.phugoidDamping               = phugoidDamping
-        DS.LongModes.phugoidTimeDoubleHalf        = phugoidTimeDoubleHalf
-        DS.LongModes.shortPeriodFreqHz            = shortPeriodFreqHz
-        DS.LongModes.shortPeriodDamping           = shortPeriodDamping
-        DS.LongModes.shortPeriodTimeDoubleHalf    = shortPeriodTimeDoubleHalf
+        DS.LongModes.phugoidFreqHz                = phugoid.frequency
+        DS.LongModes.phugoidDamping               = phugoid.damping
+        DS.LongModes.phugoidTimeDoubleHalf        = phugoid.time_double_half
+        DS.LongModes.shortPeriodFreqHz            = shortPeriod.frequency
+        DS.LongModes.shortPeriodDamping           = shortPeriod.damping
+        DS.LongModes.shortPeriodTimeDoubleHalf    = shortPeriod.time_double_half
                                                                         
         DS.LatModes.LatModes                      = LatModes  
         #DS.LatModes.Latsys                        = LatSys   
-        DS.LatModes.dutchRollFreqHz               = dutchRollFreqHz
-        DS.LatModes.dutchRollDamping              = dutchRollDamping
-        DS.LatModes.dutchRollTimeDoubleHalf       = dutchRollTimeDoubleHalf
-        DS.LatModes.dutchRoll_mode_real           = dutchRoll_mode_real 
-        DS.LatModes.rollSubsistenceFreqHz         = rollSubsistenceFreqHz
-        DS.LatModes.rollSubsistenceTimeConstant   = rollSubsistenceTimeConstant
-        DS.LatModes.rollSubsistenceDamping        = rollSubsistenceDamping
-        DS.LatModes.spiralFreqHz                  = spiralFreqHz
-        DS.LatModes.spiralTimeDoubleHalf          = spiralTimeDoubleHalf 
-        DS.LatModes.spiralDamping                 = spiralDamping
+        DS.LatModes.dutchRollFreqHz               = dutchRoll.frequency
+        DS.LatModes.dutchRollDamping              = dutchRoll.damping
+        DS.LatModes.dutchRollTimeDoubleHalf       = dutchRoll.time_double_half
+        DS.LatModes.dutchRoll_mode_real           = dutchRoll.mode_real 
+        DS.LatModes.rollSubsistenceFreqHz         = rollSubsistence.frequency
+        DS.LatModes.rollSubsistenceTimeConstant   = rollSubsistence.time_constant
+        DS.LatModes.rollSubsistenceDamping        = rollSubsistence.damping
+        DS.LatModes.spiralFreqHz                  = spiral.frequency
+        DS.LatModes.spiralTimeDoubleHalf          = spiral.time_double_half 
+        DS.LatModes.spiralDamping                 = spiral.damping
     
     return 
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Helper Functions
+# ---------------------------------------------------------------------------------------------------------------------- 
+def compute_longitudinal_modes(ALon):
+    """Computes the eigenvalues of the longitudinal state matrices of all the cases with a single stacked
+    eigen-decomposition and identifies the phugoid and short period modes.
+
+    Assumptions:
+       The phugoid is the largest eigenvalue and the short period the smallest, complex numbers being ordered by their
+       real part then their imaginary part. Cases with non-finite state matrices have no modes.
+
+    Source:
+       None
+
+    Inputs:
+       ALon          longitudinal state matrices, state order: u, w, q, theta   [-]
+
+    Outputs:
+       LonModes      eigenvalues                                                 [-]
+       phugoid       frequency [Hz], damping [-] and time to double or half [s]
+       shortPeriod   frequency [Hz], damping [-] and time to double or half [s]
+
+    Properties Used:
+       N/A
+    """
+    num_cases = len(ALon)
+    LonModes  = np.zeros((num_cases,4), dtype = complex)
+    finite    = np.all(np.isfinite(ALon),axis=(1,2))
+    if np.any(finite):
+        LonModes[finite] = np.linalg.eigvals(ALon[finite])
+        
+    cases       = np.arange(num_cases)
+    phugoid     = oscillatory_mode(LonModes[cases,np.argmax(LonModes,axis=1)],finite)
+    shortPeriod = oscillatory_mode(LonModes[cases,np.argmin(LonModes,axis=1)],finite)
+    
+    return LonModes, phugoid, shortPeriod
+
+def compute_lateral_modes(ALat):
+    """Computes the eigenvalues of the lateral state matrices of all the cases with a single stacked
+    eigen-decomposition and identifies the dutch roll, roll subsistence and spiral modes.
+
+    Assumptions:
+       The dutch roll is the only pair of eigenvalues with the same real part, the roll subsistence is the smallest of
+       the two other eigenvalues and the spiral is the largest. The modes of the cases without a single pair of
+       eigenvalues, or with non-finite state matrices, are not identified.
+
+    Source:
+       None
+
+    Inputs:
+       ALat             lateral state matrices, state order: v, p, r, phi                        [-]
+
+    Outputs:
+       LatModes         eigenvalues                                                              [-]
+       dutchRoll        frequency [Hz], damping [-], time to double or half [s], real part [Hz]
+       rollSubsistence  frequency [Hz], damping [-] and time constant [s]
+       spiral           frequency [Hz], damping [-] and time to double or half [s]
+
+    Properties Used:
+       N/A
+    """
+    num_cases = len(ALat)
+    LatModes  = np.zeros((num_cases,4), dtype = complex)
+    finite    = np.all(np.isfinite(ALat),axis=(1,2))
+    if np.any(finite):
+        LatModes[finite] = np.linalg.eigvals(ALat[finite])
+        
+    # the dutch roll is the pair of eigenvalues with the same real part
+    real_parts = LatModes.real
+    pairs      = np.sum(real_parts[:,:,None] == real_parts[:,None,:],axis=2) == 2
+    identified = finite & (np.sum(pairs,axis=1) == 2)
+    cases      = np.arange(num_cases)
+    dutch_roll = LatModes[cases,np.argmax(np.where(pairs,LatModes.imag,-np.inf),axis=1)]
+    
+    # the roll subsistence is the smallest of the two other modes and the spiral the largest
+    roll       = LatModes[cases,np.argmin(np.where(pairs,np.inf,real_parts),axis=1)]
+    spiral     = LatModes[cases,np.argmax(np.where(pairs,-np.inf,real_parts),axis=1)]
+    
+    dutchRoll           = oscillatory_mode(dutch_roll,identified)
+    dutchRoll.mode_real = np.where(identified,dutch_roll.real / (2 * np.pi),0.)[:,None]
+    
+    with np.errstate(divide='ignore',invalid='ignore'):
+        rollSubsistence               = Data()
+        rollSubsistence.frequency     = np.where(identified,abs(roll) / 2 / np.pi,0.)[:,None]
+        rollSubsistence.damping       = np.where(identified,- np.sign(roll.real),0.)[:,None]
+        rollSubsistence.time_constant = np.where(identified,1 / (2 * np.pi * rollSubsistence.frequency[:,0] * rollSubsistence.damping[:,0]),0.)[:,None]
+        
+        spiral_mode                   = spiral
+        spiral                        = Data()
+        spiral.frequency              = np.where(identified,abs(spiral_mode) / 2 / np.pi,0.)[:,None]
+        spiral.damping                = np.where(identified,- np.sign(spiral_mode.real),0.)[:,None]
+        spiral.time_double_half       = np.where(identified,np.log(2) / abs(2 * np.pi * spiral.frequency[:,0] * spiral.damping[:,0]),0.)[:,None]
+    
+    return LatModes, dutchRoll, rollSubsistence, spiral
+
+def oscillatory_mode(modes,identified):
+    """Computes the frequency, damping ratio and time to double or half of one eigenvalue per case.
+
+    Assumptions:
+       The properties of the cases where the mode is not identified are zero.
+
+    Source:
+       None
+
+    Inputs:
+       modes        eigenvalues                           [-]
+       identified   flags of the identified modes         [-]
+
+    Outputs:
+       mode.frequency          [Hz]
+       mode.damping            [-]
+       mode.time_double_half   [s]
+
+    Properties Used:
+       N/A
+    """
+    with np.errstate(divide='ignore',invalid='ignore'):
+        frequency        = abs(modes) / (2 * np.pi)
+        damping          = np.sqrt(1/ (1 + ( modes.imag/ modes.real )**2 ))
+        time_double_half = np.log(2) / abs(2 * np.pi * frequency * damping)
+    
+    mode                  = Data()
+    mode.frequency        = np.where(identified,frequency,0.)[:,None]
+    mode.damping          = np.where(identified,damping,0.)[:,None]
+    mode.time_double_half = np.where(identified,time_double_half,0.)[:,None]
+    
+    return mode
@@ -0,0 +1,12 @@
+# RCAIDE/Library/Methods/Topography/__init__.py
+# 
+
+""" RCAIDE Package Setup
+"""
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+
+from .load_topography          import load_topography
+from .interpolate_topography   import interpolate_topography
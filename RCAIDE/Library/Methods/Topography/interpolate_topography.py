@@ -0,0 +1,106 @@
+# RCAIDE/Library/Methods/Topography/interpolate_topography.py
+#
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# package imports
+from scipy.interpolate import griddata
+import numpy as np
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  interpolate_topography
+# ----------------------------------------------------------------------------------------------------------------------
+def interpolate_topography(topography, latitude, longitude, method = 'linear'):
+    """This returns the elevation of a loaded topography at arbitrary latitude-longitude locations, using
+    bilinear or nearest-neighbour lookup of the regular grid cell containing each location
+
+    Assumptions:
+        Linear interpolation is bilinear in the grid cell containing each location. It replaces the linear
+        interpolation of scipy.interpolate.griddata on the Delaunay triangulation of the grid points, which
+        splits each cell in two triangles: both are exact at the grid points and along the grid lines, and differ
+        inside the cells by less than the elevation range of the four corners of the cell. Nearest lookup is
+        unchanged. Locations outside the grid return NaN for linear interpolation and the closest grid point for
+        nearest lookup, as with griddata. Topographies that are not regular grids are interpolated with griddata.
+
+    Source:
+        None
+
+    Inputs:
+        topography   - topography data structure, see load_topography                        [None]
+        latitude     - latitudes of the locations                                              [degrees]
+        longitude    - longitudes of the locations                                             [degrees]
+        method       - 'linear' or 'nearest'                                                   <string>
+
+    Outputs:
+        elevation    - elevation at the locations, same size as latitude                       [meters]
+
+    Properties Used:
+        N/A
+    """
+    latitude  = np.asarray(latitude,dtype=float)
+    longitude = np.asarray(longitude,dtype=float)
+
+    if not topography.regular_grid:
+        points = topography.points
+        return griddata((points[:,1],points[:,0]), points[:,2], (latitude, longitude), method=method)
+
+    lat_grid  = np.asarray(topography.latitude)
+    long_grid = np.asarray(topography.longitude)
+    elevation = topography.elevation
+
+    if method == 'nearest':
+        # closest grid point in (latitude, longitude) space, the closest grid line is the closest of the two neighbours
+        i = nearest_grid_index(lat_grid,latitude)
+        j = nearest_grid_index(long_grid,longitude)
+        return np.asarray(elevation[i.ravel(),j.ravel()]).reshape(latitude.shape)
+
+    elif method == 'linear':
+        i  = np.clip(np.searchsorted(lat_grid,latitude,side='right') - 1,0,max(len(lat_grid) - 2,0))
+        j  = np.clip(np.searchsorted(long_grid,longitude,side='right') - 1,0,max(len(long_grid) - 2,0))
+        i1 = np.minimum(i + 1,len(lat_grid) - 1)
+        j1 = np.minimum(j + 1,len(long_grid) - 1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            u  = np.nan_to_num((latitude  - lat_grid[i]) /(lat_grid[i1]  - lat_grid[i]))
+            v  = np.nan_to_num((longitude - long_grid[j])/(long_grid[j1] - long_grid[j]))
+        z00 = np.asarray(elevation[i.ravel() ,j.ravel() ]).reshape(latitude.shape)
+        z01 = np.asarray(elevation[i.ravel() ,j1.ravel()]).reshape(latitude.shape)
+        z10 = np.asarray(elevation[i1.ravel(),j.ravel() ]).reshape(latitude.shape)
+        z11 = np.asarray(elevation[i1.ravel(),j1.ravel()]).reshape(latitude.shape)
+        z   = (1 - u)*(1 - v)*z00 + (1 - u)*v*z01 + u*(1 - v)*z10 + u*v*z11
+
+        outside = ((latitude < lat_grid[0]) | (latitude > lat_grid[-1]) |
+                   (longitude < long_grid[0]) | (longitude > long_grid[-1]))
+        return np.where(outside,np.nan,z)
+
+    else:
+        raise ValueError("interpolation method must be 'linear' or 'nearest'")
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  nearest_grid_index
+# ----------------------------------------------------------------------------------------------------------------------
+def nearest_grid_index(axis, values):
+    """This returns the index of the closest grid line of a sorted grid axis for each value
+
+    Assumptions:
+        None
+
+    Source:
+        None
+
+    Inputs:
+        axis      - sorted grid coordinates                  [degrees]
+        values    - coordinates to locate                    [degrees]
+
+    Outputs:
+        index     - index of the closest grid coordinate     [unitless]
+
+    Properties Used:
+        N/A
+    """
+    upper = np.clip(np.searchsorted(axis,values),1,max(len(axis) - 1,1))
+    lower = upper - 1
+    if len(axis) == 1:
+        return np.zeros(np.shape(values),dtype=int)
+
+    return np.where(np.abs(values - axis[lower]) <= np.abs(axis[upper] - values),lower,upper)
@@ -0,0 +1,168 @@
+# RCAIDE/Library/Methods/Topography/load_topography.py
+#
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+from RCAIDE.Framework.Core import Data
+
+# package imports
+import numpy as np
+import hashlib
+import tempfile
+import os
+
+# process-wide store of memory-mapped topography grids, keyed by source file, size and modification time
+topography_cache = {}
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  load_topography
+# ----------------------------------------------------------------------------------------------------------------------
+def load_topography(topography_file, bounding_box = None, cache_directory = None):
+    """This loads a text topography file (longitude, latitude, elevation per line) as a regular latitude-longitude
+    grid. The text file is parsed only once: the grid is written to a binary file in cache_directory that is
+    memory-mapped by later calls, in this and in other processes, for as long as the text file is unchanged.
+
+    Assumptions:
+        topography_file is a text file obtained from https://topex.ucsd.edu/cgi-bin/get_data.cgi. If its points
+        do not form a complete regular grid, the scattered points are returned instead and no binary file is written.
+        The binary file stores the grid as a (number of latitudes + 1, number of longitudes + 1) array whose first
+        row holds the longitudes and first column holds the latitudes.
+
+    Source:
+        None
+
+    Inputs:
+        topography_file   - file of longitude, latitude and elevation points                                 <string>
+        bounding_box      - optional [minimum latitude, maximum latitude, minimum longitude, maximum longitude],
+                            only the grid cells covering this window are loaded                                [degrees]
+        cache_directory   - directory of binary topography files, defaults to the temporary directory          <string>
+
+    Outputs:
+        topography.regular_grid  - flag indicating if the points form a regular grid                          [boolean]
+        topography.latitude      - grid latitudes, size (number of latitudes)                                 [degrees]
+        topography.longitude     - grid longitudes, size (number of longitudes)                               [degrees]
+        topography.elevation     - grid elevations, size (number of latitudes, number of longitudes)           [meters]
+        topography.points        - scattered (longitude, latitude, elevation) points, irregular files only   [deg,deg,m]
+
+    Properties Used:
+        N/A
+    """
+    file_path = os.path.abspath(topography_file)
+    file_stat = os.stat(file_path)
+    key       = (file_path,file_stat.st_size,file_stat.st_mtime)
+
+    if key not in topography_cache:
+        topography_cache[key] = read_topography_grid(file_path,key,cache_directory)
+    grid = topography_cache[key]
+
+    topography              = Data()
+    topography.regular_grid = grid.ndim == 2
+    if not topography.regular_grid:
+        topography.points   = grid
+        return topography
+
+    latitude  = grid[1:,0]
+    longitude = grid[0,1:]
+    lat_slice = slice(0,len(latitude))
+    lon_slice = slice(0,len(longitude))
+    if bounding_box is not None:
+        # keep one extra grid line on each side so that the window can be interpolated up to its edges
+        lat_slice = window_slice(latitude ,bounding_box[0],bounding_box[1])
+        lon_slice = window_slice(longitude,bounding_box[2],bounding_box[3])
+
+    # slices of the memory map, only the pages that are used are read from disk
+    topography.latitude  = latitude[lat_slice]
+    topography.longitude = longitude[lon_slice]
+    topography.elevation = grid[1:,1:][lat_slice,lon_slice]
+
+    return topography
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  read_topography_grid
+# ----------------------------------------------------------------------------------------------------------------------
+def read_topography_grid(file_path, key, cache_directory = None):
+    """This returns the memory-mapped binary grid of a topography file, parsing the text file and writing the
+    binary file if it does not exist yet. Irregular files are returned as their (N,3) array of points.
+
+    Assumptions:
+        See load_topography
+
+    Source:
+        None
+
+    Inputs:
+        file_path        - absolute path of the text topography file                    <string>
+        key              - (path, size, modification time) of the text topography file
+        cache_directory  - directory of binary topography files                          <string>
+
+    Outputs:
+        grid             - memory-mapped grid, or array of scattered points              [None]
+
+    Properties Used:
+        N/A
+    """
+    if cache_directory is None:
+        cache_directory = os.path.join(tempfile.gettempdir(),'RCAIDE_topography')
+    tag         = hashlib.sha1(repr(key).encode()).hexdigest()
+    binary_file = os.path.join(cache_directory,os.path.splitext(os.path.basename(file_path))[0] + '_' + tag + '.npy')
+
+    if os.path.isfile(binary_file):
+        return np.load(binary_file,mmap_mode='r')
+
+    data      = np.loadtxt(file_path)
+    Long      = data[:,0]
+    Lat       = data[:,1]
+    Elev      = data[:,2]
+    latitude  = np.unique(Lat)
+    longitude = np.unique(Long)
+    if len(latitude)*len(longitude) != len(data):
+        return data
+
+    grid          = np.full((len(latitude) + 1,len(longitude) + 1),np.nan)
+    grid[0,1:]    = longitude
+    grid[1:,0]    = latitude
+    grid[1 + np.searchsorted(latitude,Lat),1 + np.searchsorted(longitude,Long)] = Elev
+    if np.any(np.isnan(grid[1:,1:])):
+        return data
+
+    # write to a temporary name first so that other processes never map a partial file
+    try:
+        os.makedirs(cache_directory,exist_ok=True)
+        partial_file = binary_file + '.' + str(os.getpid()) + '.tmp'
+        with open(partial_file,'wb') as f:
+            np.save(f,grid)
+        os.replace(partial_file,binary_file)
+        grid = np.load(binary_file,mmap_mode='r')
+    except OSError:
+        pass
+
+    return grid
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  window_slice
+# ----------------------------------------------------------------------------------------------------------------------
+def window_slice(axis, lower, upper):
+    """This returns the slice of a sorted grid axis that covers [lower, upper], with one extra grid line on each side
+
+    Assumptions:
+        None
+
+    Source:
+        None
+
+    Inputs:
+        axis          - sorted grid coordinates          [degrees]
+        lower, upper  - bounds of the window             [degrees]
+
+    Outputs:
+        window        - slice of the axis                [None]
+
+    Properties Used:
+        N/A
+    """
+    start = max(np.searchsorted(axis,lower,side='right') - 1,0)
+    stop  = min(np.searchsorted(axis,upper,side='left') + 1,len(axis))
+
+    return slice(start,stop)
@@ -8,5 +8,6 @@
 #  IMPORT
 # ---------------------------------------------------------------------------------------------------------------------- 
 
-from RCAIDE.Library.Methods.Utilities.Chebyshev.chebyshev_data import chebyshev_data
-from RCAIDE.Library.Methods.Utilities.Chebyshev.linear_data    import linear_data
\ No newline at end of file
+from RCAIDE.Library.Methods.Utilities.Chebyshev.chebyshev_data         import chebyshev_data
+from RCAIDE.Library.Methods.Utilities.Chebyshev.linear_data            import linear_data
+from RCAIDE.Library.Methods.Utilities.Chebyshev.finite_difference_data import finite_difference_data
@@ -5,6 +5,9 @@
 
 import numpy as np
 
+# operators computed so far, indexed by number of points
+chebyshev_cache = {}
+
 # ----------------------------------------------------------------------
 #  Method
 # ----------------------------------------------------------------------
@@ -23,14 +26,15 @@ def chebyshev_data(N = 16, integration = True, **options):
     A full example is available in the function code.
 
     Assumptions:
-    None
+    The operators are computed once for each number of points and shared
+    by all the segments that use them, so the returned arrays are read-only
 
     Source:
     N/A
 
     Inputs:
     N                      [-]        Number of points
-    integration (optional) <boolean>  Determines if the integration operator is calculated
+    integration (optional) <boolean>  Determines if the integration operator is returned
 
     Outputs:
     x                      [-]        N-number of cosine spaced control points, in range [0,1]
@@ -45,6 +49,39 @@ def chebyshev_data(N = 16, integration = True, **options):
     N = int(N)
     if N <= 0: raise RuntimeError("N = %i, must be > 0" % N)
     
+    if N not in chebyshev_cache:
+        chebyshev_cache[N] = chebyshev_operators(N)
+    x, D, I = chebyshev_cache[N]
+    
+    if not integration:
+        I = None
+        
+    # done!
+    return x, D, I
+
+
+## @ingroup Methods-Utilities-Chebyshev
+def chebyshev_operators(N):
+    """Computes the control points, differentiation and integration
+    operators of chebyshev_data for N points
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    N                      [-]        Number of points
+
+    Outputs:
+    x                      [-]        N-number of cosine spaced control points, in range [0,1]
+    D                      [-]        Differentiation operation matrix
+    I                      [-]        Integration operation matrix
+
+    Properties Used:
+    N/A
+    """       
     
     # --- X vector
     
@@ -75,18 +112,17 @@ def chebyshev_data(N = 16, integration = True, **options):
 
     # --- Integration operator
     
-    if integration:
-        # invert D except first row and column
-        I = np.linalg.inv(D[1:,1:]); 
-        
-        # repack missing columns with zeros
-        I = np.append(np.zeros((1,N-1)),I,axis=0)
-        I = np.append(np.zeros((N,1)),I,axis=1)
-        
-    else:
-        I = None
+    # invert D except first row and column
+    I = np.linalg.inv(D[1:,1:]); 
+    
+    # repack missing columns with zeros
+    I = np.append(np.zeros((1,N-1)),I,axis=0)
+    I = np.append(np.zeros((N,1)),I,axis=1)
+    
+    # the operators are shared, protect them from changes
+    for operator in (x, D, I):
+        operator.flags.writeable = False
         
-    # done!
     return x, D, I
 
 
@@ -0,0 +1,130 @@
+## @ingroup Methods-Utilities-Chebyshev
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+# operators computed so far, indexed by number of points
+finite_difference_cache = {}
+
+# ----------------------------------------------------------------------
+#  Method
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Utilities-Chebyshev
+def finite_difference_data(N = 16, integration = True, **options):
+    """Calculates the differentiation and integration matricies
+    using second order finite differences and the trapezoidal rule,
+    based on linearly spaced samples in x.
+
+    Unlike the pseudospectral operators of chebyshev_data, whose
+    conditioning degrades as the number of points grows, these low
+    order operators let long segments use many control points: the
+    differentiation matrix is banded and both operators are built
+    without a matrix inversion.
+
+    get derivatives with df_dy = np.dot(D,f)
+    get integral with    int_f = np.dot(I,f)
+        where f is either a 1-d vector or 2-d column array
+
+    A full example of how these operators are used is available in
+    the chebyshev_data.py (same folder)
+
+    Assumptions:
+    Central differences at the interior points and one-sided three point
+    differences at the end points. The operators are computed once for
+    each number of points and shared by all the segments that use them,
+    so the returned arrays are read-only
+
+    Source:
+    N/A
+
+    Inputs:
+    N                      [-]        Number of points
+    integration (optional) <boolean>  Determines if the integration operator is returned
+
+    Outputs:
+    x                      [-]        N-number of linearly spaced control points, in range [0,1]
+    D                      [-]        Differentiation operation matrix
+    I                      [-]        Integration operation matrix, or None if integration = False
+
+    Properties Used:
+    N/A
+    """
+
+    # setup
+    N = int(N)
+    if N <= 1: raise RuntimeError("N = %i, must be > 1" % N)
+
+    if N not in finite_difference_cache:
+        finite_difference_cache[N] = finite_difference_operators(N)
+    x, D, I = finite_difference_cache[N]
+
+    if not integration:
+        I = None
+
+    # done!
+    return x, D, I
+
+
+## @ingroup Methods-Utilities-Chebyshev
+def finite_difference_operators(N):
+    """Computes the control points, differentiation and integration
+    operators of finite_difference_data for N points
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    N                      [-]        Number of points
+
+    Outputs:
+    x                      [-]        N-number of linearly spaced control points, in range [0,1]
+    D                      [-]        Differentiation operation matrix
+    I                      [-]        Integration operation matrix
+
+    Properties Used:
+    N/A
+    """
+
+    # --- X vector
+
+    # linear spaced in range [0,1]
+    x = np.linspace(0,1,N)
+    h = 1./(N-1)
+
+
+    # --- Differentiation Operator
+
+    D   = np.zeros((N,N))
+    if N == 2:
+        D[:,0] = -1./h
+        D[:,1] =  1./h
+    else:
+        # central differences
+        idx = np.arange(1,N-1)
+        D[idx,idx-1] = -0.5/h
+        D[idx,idx+1] =  0.5/h
+
+        # one-sided differences at the ends
+        D[0,:3]      = np.array([-1.5, 2.0,-0.5])/h
+        D[-1,-3:]    = np.array([ 0.5,-2.0, 1.5])/h
+
+
+    # --- Integration operator
+
+    # trapezoidal rule from the first point
+    I       = np.tril(np.ones((N,N)))*h
+    I[:,0]  = 0.5*h
+    I[np.arange(N),np.arange(N)] = 0.5*h
+    I[0,:]  = 0.
+
+    # the operators are shared, protect them from changes
+    for operator in (x, D, I):
+        operator.flags.writeable = False
+
+    return x, D, I
@@ -5,6 +5,9 @@
 
 import numpy as np
 
+# operators computed so far, indexed by number of points
+linear_cache = {}
+
 # ----------------------------------------------------------------------
 #  Method
 # ----------------------------------------------------------------------
@@ -24,14 +27,15 @@ def linear_data(N = 16, integration = True, **options):
     the chebyshev_data.py (same folder)
 
     Assumptions:
-    None
+    The operators are computed once for each number of points and shared
+    by all the segments that use them, so the returned arrays are read-only
 
     Source:
     N/A
 
     Inputs:
     N                      [-]        Number of points
-    integration (optional) <boolean>  Determines if the integration operator is calculated
+    integration (optional) <boolean>  Determines if the integration operator is returned
 
     Outputs:
     x                      [-]        N-number of cosine spaced control points, in range [0,1]
@@ -46,6 +50,39 @@ def linear_data(N = 16, integration = True, **options):
     N = int(N)
     if N <= 0: raise RuntimeError("N = %i, must be > 0" % N)
     
+    if N not in linear_cache:
+        linear_cache[N] = linear_operators(N)
+    x, D, I = linear_cache[N]
+    
+    if not integration:
+        I = None
+        
+    # done!
+    return x, D, I
+
+
+## @ingroup Methods-Utilities-Chebyshev
+def linear_operators(N):
+    """Computes the control points, differentiation and integration
+    operators of linear_data for N points
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    N                      [-]        Number of points
+
+    Outputs:
+    x                      [-]        N-number of linearly spaced control points, in range [0,1]
+    D                      [-]        Differentiation operation matrix
+    I                      [-]        Integration operation matrix
+
+    Properties Used:
+    N/A
+    """           
     
     # --- X vector
     
@@ -76,16 +113,15 @@ def linear_data(N = 16, integration = True, **options):
 
     # --- Integration operator
     
-    if integration:
-        # invert D except first row and column
-        I = np.linalg.inv(D[1:,1:]); 
-        
-        # repack missing columns with zeros
-        I = np.append(np.zeros((1,N-1)),I,axis=0)
-        I = np.append(np.zeros((N,1)),I,axis=1)
-        
-    else:
-        I = None
+    # invert D except first row and column
+    I = np.linalg.inv(D[1:,1:]); 
+    
+    # repack missing columns with zeros
+    I = np.append(np.zeros((1,N-1)),I,axis=0)
+    I = np.append(np.zeros((N,1)),I,axis=1)
+    
+    # the operators are shared, protect them from changes
+    for operator in (x, D, I):
+        operator.flags.writeable = False
         
-    # done!
     return x, D, I
\ No newline at end of file
@@ -19,7 +19,7 @@ import numpy as np
 #   Latin Hypercube Sampling
 # ----------------------------------------------------------------------
 ## @ingroup Methods-Utilities
-def latin_hypercube_sampling(num_dimensions,num_samples,bounds=None,criterion='random'):
+def latin_hypercube_sampling(num_dimensions,num_samples,bounds=None,criterion='random',rng=None):
     """Provides an array of chosen dimensionality and number of samples taken according
     to latin hypercube sampling. Bounds can be optionally specified.
 
@@ -36,6 +36,7 @@ def latin_hypercube_sampling(num_dimensions,num_samples,bounds=None,criterion='r
                                   (array([low_bnd_1,low_bnd_2,..]), array([up_bnd_1,up_bnd_2,..]))
     criterion            <string> Possible values: random and center. Determines if samples are 
                                   taken at the center of a bucket or randomly from within it.
+    rng (optional)       <numpy Generator> Random number generator, defaults to the global numpy random state
                          
     Outputs:             
     lhd                  [-]      Array of samples
@@ -46,6 +47,8 @@ def latin_hypercube_sampling(num_dimensions,num_samples,bounds=None,criterion='r
     
     n = num_dimensions
     samples = num_samples
+    if rng is None:
+        rng = np.random
     
     segsize = 1./samples
     lhd = np.zeros((samples,n))
@@ -53,7 +56,7 @@ def latin_hypercube_sampling(num_dimensions,num_samples,bounds=None,criterion='r
     if( criterion == "random" ): # sample is randomly chosen from within segment
         segment_starts = np.arange(samples)*segsize
         lhd_base       = np.transpose(np.tile(segment_starts,(n,1)))
-        lhd            = lhd_base + np.random.rand(samples,n)*segsize
+        lhd            = lhd_base + rng.random((samples,n))*segsize
     elif( criterion == "center" ): # sample is chosen as center of segment
         segment_starts = np.arange(samples)*segsize
         lhd_base       = np.transpose(np.tile(segment_starts,(n,1)))
@@ -63,7 +66,7 @@ def latin_hypercube_sampling(num_dimensions,num_samples,bounds=None,criterion='r
         
     # Randomly switch values around to create Latin Hypercube
     for jj in range(n):
-        np.random.shuffle(lhd[:,jj])
+        rng.shuffle(lhd[:,jj])
         
     ## Map samples to the standard normal distribution (if needed for future functionality)
     #lhd = norm(loc=0,scale=1).ppf(lhd)
@@ -15,6 +15,10 @@ from RCAIDE.Framework.Core    import Units
 import  numpy as  np
 import  copy 
  
+# planform values of the wing used by the spanwise integration of the complex method
+planform_keys = ['spans.projected','chords.root','chords.tip','sweeps.quarter_chord','thickness_to_chord',
+                 'twists.root','twists.tip']
+
 # ----------------------------------------------------------------------------------------------------------------------
 # Main Wing Weight 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -68,7 +72,6 @@ def compute_wing_weight(vehicle, wing, WPOD, complexity, settings, num_main_wing
     GLOV        = 0 
     SX          = SW - GLOV  # Wing trapezoidal area
     SPAN        = wing.spans.projected / Units.ft  # Wing span, ft
-    SEMISPAN    = SPAN / 2
     AR          = SPAN ** 2 / SX  # Aspect ratio
     TR          = wing.taper  # Taper
     
@@ -76,10 +79,7 @@ def compute_wing_weight(vehicle, wing, WPOD, complexity, settings, num_main_wing
     strut_braced_wing_factor     = settings.FLOPS.strut_braced_wing_factor
     composite_utilization_factor = settings.FLOPS.composite_utilization_factor
     
-    if AR <= 5:
-        CAYA = 0
-    else:
-        CAYA = AR - 5
+    CAYA = np.maximum(AR - 5, 0)
     # Aeroelastic tailoring factor [0 no aeroelastic tailoring, 1 maximum aeroelastic tailoring]
     FAERT           = aeroelastic_tailoring_factor  
     # Wing strut bracing factor [0 for no struts, 1 for struts]
@@ -110,115 +110,26 @@ def compute_wing_weight(vehicle, wing, WPOD, complexity, settings, num_main_wing
         CAYE = 1 - 0.03 * NEW
 
     else:
-        NSD             = 500
         N2              = int(NEW / 2) 
         L_fus           = 0
         for fuselage in vehicle.fuselages:
             if L_fus < fuselage.lengths.total:
                 ref_fuselage = fuselage 
-        ETA, C, T, SWP  = generate_wing_stations(ref_fuselage.width, copy.deepcopy(wing))
-        NS, Y           = generate_int_stations(NSD, ETA)
-        EETA            = get_spanwise_engine(vehicle.networks,SEMISPAN)
-        P0              = calculate_load(ETA[-1])
-        ASW             = 0
-        EM              = 0
-        EL              = 0
-        C0              = C[-1]
-        S               = 0
-        EEL             = 0
-        EEM             = 0
-        EA0             = 0
-        EW              = 0
-        
-        
-        # Replaced FOR LOOP
-        # Reverse Order
-        Y  = np.flip(Y)
-        
-        # DY distance
-        DY = np.diff(Y)
-        
-        # Trim the vectors away from the tip and center
-        Y  = Y[1:-2]
-        DY = -DY[0:-2]
-        
-        # Get normalized pressure loading across the wing
-        P1     = calculate_load(Y)
-        P0     = np.zeros_like(P1)
-        P0[1:] = P1[0:-1]
-        
-        # Get local chord length
-        C1     = np.interp(Y, ETA, C)
-        C0     = np.zeros_like(C1)
-        C0[0]  = C[-1]
-        C0[1:] = C1[0:-1]
-        
-        # Calculate local pressure load and moments (DELP and DELM)
-        T1   = np.interp(Y, ETA, T)
-        SWP1 = find_sweep(Y,ETA,SWP)
-        DELP = DY / 6 * (C0 * (2 * P0 + P1) + C1 * (2 * P1 + P0))
-        DELM = DY ** 2 * (C0 * (3.0 * P0 + P1) + C1 * (P1 + P0)) / 12.
-        
-        # Sum loads
-        EL     = np.zeros_like(DELP) 
-        EL[1:] = np.cumsum(DELP[0:-1])
-        
-        # Sum moments
-        EM     = np.cumsum((DELM + DY * EL) * 1 / np.cos(SWP1))
-        
-        # Calculate required bending material area
-        BMA1     = EM * 1 / np.cos(SWP1) * 1 / (C1 * T1)
-        
-        BMA0     = np.zeros_like(BMA1)
-        BMA0[1:] = BMA1[0:-1]
-        
-        # Compute segment values
-        ASW  = np.cumsum((DY + 2 * Y) * DY * SWP1)
-        PM   = np.cumsum((BMA0 + BMA1) * DY / 2.)
-        S    = np.cumsum((C0 + C1) * DY / 2.)
 
-
-        # Adjust for engine loads
-        if N2>0: # If there are engines
-            EEL   = np.zeros_like(Y)
-            DELM2 = np.zeros_like(Y)
-            
-            # Do a for loop over engine stations
-            for ii in range(len(EETA)):
-                # Find the station closest to the engine but inboard
-                distances              = EETA[ii]-Y
-                distances[distances<0] = np.inf
-                distance               = np.min(distances)
-                loc                    = np.argmin(distances)
-                DELM2[loc]             = DELM2[loc] + distance
-                EEL[loc+1:]            = EEL[loc+1:] + 1
-
-            DELM2 = DELM2 + EEL*DY
-
-            EEM = np.cumsum(DELM2/np.cos(SWP1))
-            EA1 = EEM * 1 / np.cos(SWP1) * 1 / (C1 * T1)
-            
-            EA0 = np.zeros_like(Y)
-            EA0[1:] = EA1[0:-1]
-            
-            EW  = np.sum((EA0 + EA1) * DY / 2)
-            
-        # Finalize properties
-        EL = EL[-1] + DELP[-1]    
-        EM = EM[-1] / EL
-        PM = 4. * PM[-1] / EL
-        EW = 8. * EW
-        SA = np.sin(ASW[-1])
-        AR = 2 / S[-1]       
-                
-        if AR <= 5:
-            CAYA = 0
+        # the integration stations depend on the planform, they are laid out for one design point at a time
+        planform = [wing.deep_get(key) for key in planform_keys] + [ref_fuselage.width]
+        if all([np.ndim(value) == 0 for value in planform]):
+            BT, BTE = compute_bending_factors(vehicle, copy.deepcopy(wing), ref_fuselage.width, N2, FSTRT, FAERT)
         else:
-            CAYA = AR - 5
-        DEN = AR ** (.25 * FSTRT) * (1.0 + (.50 * FAERT - .160 * FSTRT) * SA ** 2 /
-                                     + .03 * CAYA * (1.0 - .50 * FAERT) * SA)
-        BT = PM / DEN
-        BTE = EW
+            shape   = np.broadcast(*planform).shape
+            BT      = np.zeros(shape)
+            BTE     = np.zeros(shape)
+            for i in np.ndindex(shape):
+                point_wing    = copy.deepcopy(wing)
+                for key, value in zip(planform_keys, planform):
+                    point_wing.deep_set(key, np.broadcast_to(value, shape)[i])
+                width         = np.broadcast_to(ref_fuselage.width, shape)[i]
+                BT[i], BTE[i] = compute_bending_factors(vehicle, point_wing, width, N2, FSTRT, FAERT)
         CAYE = 1
         if NEW > 0:
             CAYE = 1 - BTE / BT * WPOD / DG
@@ -247,6 +158,140 @@ def compute_wing_weight(vehicle, wing, WPOD, complexity, settings, num_main_wing
     return WWING * Units.lbs
 
 
+def compute_bending_factors(vehicle, wing, fuselage_width, N2, FSTRT, FAERT):
+    """ Integrates the bending material of the wing and of its engines along the span of one wing planform
+
+        Assumptions:
+            Wing is elliptically loaded
+
+        Source:
+            The Flight Optimization System Weight Estimation Method
+
+        Inputs:
+            vehicle - data dictionary with vehicle properties
+                -.networks: data dictionary containing all propulsion properties
+            wing: data dictionary with wing properties, of scalar planform
+                    -.spans.projected: wing span                                [m]
+            fuselage_width: width of the widest fuselage                        [m]
+            N2 - number of pairs of wing mounted engines
+            FSTRT - wing strut bracing factor
+            FAERT - aeroelastic tailoring factor
+
+        Outputs:
+            BT - wing bending factor
+            BTE - engine inertia relief factor
+
+        Properties Used:
+            N/A
+    """
+    NSD             = 500
+    SEMISPAN        = wing.spans.projected / Units.ft / 2
+    ETA, C, T, SWP  = generate_wing_stations(fuselage_width, wing)
+    NS, Y           = generate_int_stations(NSD, ETA)
+    EETA            = get_spanwise_engine(vehicle.networks,SEMISPAN)
+    P0              = calculate_load(ETA[-1])
+    ASW             = 0
+    EM              = 0
+    EL              = 0
+    C0              = C[-1]
+    S               = 0
+    EEL             = 0
+    EEM             = 0
+    EA0             = 0
+    EW              = 0
+    
+    
+    # Replaced FOR LOOP
+    # Reverse Order
+    Y  = np.flip(Y)
+    
+    # DY distance
+    DY = np.diff(Y)
+    
+    # Trim the vectors away from the tip and center
+    Y  = Y[1:-2]
+    DY = -DY[0:-2]
+    
+    # Get normalized pressure loading across the wing
+    P1     = calculate_load(Y)
+    P0     = np.zeros_like(P1)
+    P0[1:] = P1[0:-1]
+    
+    # Get local chord length
+    C1     = np.interp(Y, ETA, C)
+    C0     = np.zeros_like(C1)
+    C0[0]  = C[-1]
+    C0[1:] = C1[0:-1]
+    
+    # Calculate local pressure load and moments (DELP and DELM)
+    T1   = np.interp(Y, ETA, T)
+    SWP1 = find_sweep(Y,ETA,SWP)
+    DELP = DY / 6 * (C0 * (2 * P0 + P1) + C1 * (2 * P1 + P0))
+    DELM = DY ** 2 * (C0 * (3.0 * P0 + P1) + C1 * (P1 + P0)) / 12.
+    
+    # Sum loads
+    EL     = np.zeros_like(DELP) 
+    EL[1:] = np.cumsum(DELP[0:-1])
+    
+    # Sum moments
+    EM     = np.cumsum((DELM + DY * EL) * 1 / np.cos(SWP1))
+    
+    # Calculate required bending material area
+    BMA1     = EM * 1 / np.cos(SWP1) * 1 / (C1 * T1)
+    
+    BMA0     = np.zeros_like(BMA1)
+    BMA0[1:] = BMA1[0:-1]
+    
+    # Compute segment values
+    ASW  = np.cumsum((DY + 2 * Y) * DY * SWP1)
+    PM   = np.cumsum((BMA0 + BMA1) * DY / 2.)
+    S    = np.cumsum((C0 + C1) * DY / 2.)
+
+
+    # Adjust for engine loads
+    if N2>0: # If there are engines
+        EEL   = np.zeros_like(Y)
+        DELM2 = np.zeros_like(Y)
+        
+        # Do a for loop over engine stations
+        for ii in range(len(EETA)):
+            # Find the station closest to the engine but inboard
+            distances              = EETA[ii]-Y
+            distances[distances<0] = np.inf
+            distance               = np.min(distances)
+            loc                    = np.argmin(distances)
+            DELM2[loc]             = DELM2[loc] + distance
+            EEL[loc+1:]            = EEL[loc+1:] + 1
+
+        DELM2 = DELM2 + EEL*DY
+
+        EEM = np.cumsum(DELM2/np.cos(SWP1))
+        EA1 = EEM * 1 / np.cos(SWP1) * 1 / (C1 * T1)
+        
+        EA0 = np.zeros_like(Y)
+        EA0[1:] = EA1[0:-1]
+        
+        EW  = np.sum((EA0 + EA1) * DY / 2)
+        
+    # Finalize properties
+    EL = EL[-1] + DELP[-1]    
+    EM = EM[-1] / EL
+    PM = 4. * PM[-1] / EL
+    EW = 8. * EW
+    SA = np.sin(ASW[-1])
+    AR = 2 / S[-1]       
+            
+    if AR <= 5:
+        CAYA = 0
+    else:
+        CAYA = AR - 5
+    DEN = AR ** (.25 * FSTRT) * (1.0 + (.50 * FAERT - .160 * FSTRT) * SA ** 2 /
+                                 + .03 * CAYA * (1.0 - .50 * FAERT) * SA)
+    BT  = PM / DEN
+    BTE = EW
+
+    return BT, BTE
+
 def generate_wing_stations(fuselage_width, wing):
     """ Divides half the wing in sections, using the defined sections
         and adding a section at the intersection of wing and fuselage
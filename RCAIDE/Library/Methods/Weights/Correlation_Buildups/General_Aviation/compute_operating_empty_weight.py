@@ -195,7 +195,7 @@ def compute_operating_empty_weight(vehicle, settings=None):
             for fuel_tank in fuel_line.fuel_tanks: 
                 m_fuel_tank     = fuel_tank.fuel.mass_properties.mass
                 m_fuel          += m_fuel_tank   
-                landing_weight  -= m_fuel_tank   
+                landing_weight   = landing_weight - m_fuel_tank   
                 number_of_tanks += 1
                 V_fuel_int      += m_fuel_tank/fuel_tank.fuel.density  #assume all fuel is in integral tanks 
                 V_fuel          += m_fuel_tank/fuel_tank.fuel.density #total fuel  
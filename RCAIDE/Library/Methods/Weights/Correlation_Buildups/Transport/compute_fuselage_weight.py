@@ -11,6 +11,7 @@
 from RCAIDE.Framework.Core    import Units
 
 # python imports 
+import numpy as np
  
 # ----------------------------------------------------------------------------------------------------------------------
 # fuselage Weight 
@@ -60,10 +61,7 @@ def compute_fuselage_weight(vehicle, fuselage, W_wing, W_propulsion):
     I_p = 1.5 * 10 ** -3. * differential_pressure * width
     I_b = 1.91 * 10 ** -4. * vehicle.flight_envelope.limit_load * weight * length / height ** 2.
 
-    if I_p > I_b:
-        I_f = I_p
-    else:
-        I_f = (I_p ** 2. + I_b ** 2.) / (2. * I_b)
+    I_f = np.where(I_p > I_b, I_p, (I_p ** 2. + I_b ** 2.) / (2. * I_b))[()]
 
     # Calculate weight of wing for traditional aircraft vertical tail without rudder
     fuselage_weight = ((1.051 + 0.102 * I_f) * area) * Units.lb  # Convert from lbs to kg
@@ -50,8 +50,8 @@ def compute_horizontal_tail_weight(vehicle, wing):
     exposed    = wing.areas.exposed / wing.areas.wetted
     
     # Compute length between the main wing's aerodynamic center and the horizontal tail
-    l_w2h      = np.array([wing.origin[0][0] + wing.aerodynamic_center[0] - vehicle.wings['main_wing'].origin[0][0] -  vehicle.wings['main_wing'].aerodynamic_center[0]])
-    l_w        = np.array([vehicle.wings['main_wing'].chords.mean_aerodynamic / Units.ft])   # Convert from meters to ft
+    l_w2h      = wing.origin[0][0] + wing.aerodynamic_center[0] - vehicle.wings['main_wing'].origin[0][0] -  vehicle.wings['main_wing'].aerodynamic_center[0]
+    l_w        = vehicle.wings['main_wing'].chords.mean_aerodynamic / Units.ft   # Convert from meters to ft
     length_w_h = l_w2h / Units.ft  # Distance from mean aerodynamic center of wing to mean aerodynamic center of
      
     # Calculate weight of wing for traditional aircraft horizontal tail
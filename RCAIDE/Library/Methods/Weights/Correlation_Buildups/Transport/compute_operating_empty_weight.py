@@ -328,8 +328,7 @@ def compute_operating_empty_weight(vehicle, settings=None, method_type='RCAIDE')
                 W_wing = Common.compute_main_wing_weight(vehicle, wing, Al_rho, Al_sigma) 
             # Apply weight factor
             W_wing = W_wing * (1. - W_factors.main_wing) * (1. - W_factors.structural)
-            if np.isnan(W_wing):
-                W_wing = 0.
+            W_wing = np.nan_to_num(W_wing, nan = 0., posinf = np.inf, neginf = -np.inf)
             wing.mass_properties.mass = W_wing
             W_main_wing += W_wing
         if isinstance(wing, Wings.Horizontal_Tail):
@@ -339,8 +338,6 @@ def compute_operating_empty_weight(vehicle, settings=None, method_type='RCAIDE')
                 W_tail = Raymer.compute_horizontal_tail_weight(vehicle, wing)
             else:
                 W_tail = Transport.compute_horizontal_tail_weight(vehicle, wing)
-            if type(W_tail) == np.ndarray:
-                W_tail = sum(W_tail)
             # Apply weight factor
             W_tail = W_tail * (1. - W_factors.empennage) * (1. - W_factors.structural)
             # Pack and sum
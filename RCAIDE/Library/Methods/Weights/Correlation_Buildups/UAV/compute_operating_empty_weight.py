@@ -10,6 +10,9 @@
 # RCAIDE
 import RCAIDE
 from RCAIDE.Framework.Core    import  Data  
+
+# python imports 
+import numpy as np
  
  # ----------------------------------------------------------------------------------------------------------------------
 # Compute Operating Empty Weight 
@@ -43,14 +46,15 @@ def compute_operating_empty_weight(vehicle):
     # ----------------------------------------------------------------------------------------------------------------------
     #  find max wing area and aspect ratio 
     # ----------------------------------------------------------------------------------------------------------------------    
-    S_max = 0
-    for wing in vehicle.wings:
-        if S_max < wing.areas.reference:
-            AR    = wing.aspect_ratio 
-            S_max = wing.areas.reference 
-        if isinstance(wing,RCAIDE.Library.Components.Wings.Main_Wing):
-            AR = wing.aspect_ratio
-            break 
+    main_wings = [wing for wing in vehicle.wings if isinstance(wing,RCAIDE.Library.Components.Wings.Main_Wing)]
+    if len(main_wings) > 0:
+        AR    = main_wings[0].aspect_ratio
+    else:
+        AR    = 0
+        S_max = 0
+        for wing in vehicle.wings:
+            AR    = np.where(S_max < wing.areas.reference, wing.aspect_ratio, AR)[()]
+            S_max = np.maximum(S_max, wing.areas.reference)
             
     Earth = RCAIDE.Library.Attributes.Planets.Earth()
     g     = Earth.sea_level_gravity 
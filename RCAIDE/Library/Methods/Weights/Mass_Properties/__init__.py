@@ -0,0 +1,12 @@
+# RCAIDE/Library/Methods/Weights/Mass_Properties/__init__.py
+# 
+
+""" RCAIDE Package Setup
+"""
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+
+from .build_mass_properties_model import build_mass_properties_model
+from .evaluate_mass_properties    import evaluate_mass_properties
@@ -0,0 +1,261 @@
+# RCAIDE/Library/Methods/Weights/Mass_Properties/build_mass_properties_model.py
+#
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+
+# RCAIDE imports
+import RCAIDE
+from RCAIDE.Framework.Core                                   import Data
+from RCAIDE.Library.Components                               import Component
+from RCAIDE.Library.Methods.Weights.Center_of_Gravity        import compute_component_centers_of_gravity
+from RCAIDE.Library.Methods.Weights.Moment_of_Inertia        import compute_cuboid_moment_of_inertia, compute_cylinder_moment_of_inertia, compute_wing_moment_of_inertia
+
+# package imports
+import numpy as np
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  build_mass_properties_model
+# ----------------------------------------------------------------------------------------------------------------------
+def build_mass_properties_model(vehicle):
+    ''' Flattens the components of a vehicle into arrays of masses, centers of gravity and inertia terms, so that the
+    mass, center of gravity and moment of inertia of the vehicle can be computed for many fuel and payload states at
+    once with evaluate_mass_properties.
+
+    The inertia models of Moment_of_Inertia move the tensor of a component to the center of gravity c of the vehicle
+    with the parallel axis theorem, so the tensor of each component is the quadratic function of c
+
+        I(c) = I_0 + sum_k c_k dI_k + m_I (|c|^2 E - c c^T)
+
+    whose terms are found by evaluating the model at the origin and at unit distances from it. The fuel of the tanks
+    and the payload change from one state to the other: their terms are stored per unit mass. The terms of all the
+    other components are summed once.
+
+    Assumptions:
+    The components, centers of gravity and inertia models are those of compute_vehicle_center_of_gravity and
+    compute_aircraft_moment_of_inertia, to which the fuel of the tanks is added in the center of gravity, at the
+    origin of the tank plus the center of gravity of the fuel. The payload only changes the mass and center of
+    gravity, as in compute_aircraft_moment_of_inertia.
+
+    Source:
+    None
+
+    Inputs:
+    vehicle                              - vehicle data structure
+
+    Outputs:
+    model.
+      tags                               - component of each element                                 [list]
+      masses                             - mass of each element                                      [kg]
+      centers_of_gravity                 - center of gravity of each element, shape (n,3)            [m]
+      inertia.constant                   - I_0 of each element, shape (n,3,3)                        [kg-m^2]
+      inertia.gradient                   - dI_k of each element, shape (n,3,3,3)                     [kg-m]
+      inertia.mass                       - m_I of each element                                       [kg]
+      variable                           - elements of the fuel and payload, changed by the states
+      fixed                              - sums of the elements that are the same in all the states
+      fuel_tanks.tags, fuel_lines        - tags of the fuel tanks and of their fuel lines            [list]
+      fuel_tanks.masses                  - fuel mass of each tank                                    [kg]
+      fuel_tanks.columns                 - variable element of the fuel of each tank                 [-]
+      payloads.tags                      - tags of the payload components                            [list]
+      payloads.masses                    - mass of each payload component                            [kg]
+      payloads.columns                   - variable element of each payload component                [-]
+
+    Properties Used:
+    N/A
+    '''
+
+    # place the components as in compute_vehicle_center_of_gravity
+    compute_component_centers_of_gravity(vehicle)
+
+    elements = []
+
+    # ------------------------------------------------------------------
+    #  Center of gravity: every component of the vehicle, networks included as a whole
+    # ------------------------------------------------------------------
+    for key in vehicle.keys():
+        item = vehicle[key]
+        if isinstance(item,Component.Container):
+            append_components(elements,item,key,payload = (key == 'payload'))
+
+    # ------------------------------------------------------------------
+    #  Moment of inertia: the components of compute_aircraft_moment_of_inertia
+    # ------------------------------------------------------------------
+    for fuselage in vehicle.fuselages:
+        elements.append(inertia_element('fuselages.' + fuselage.tag,lambda CG: fuselage.compute_moment_of_inertia(center_of_gravity = CG)[0]))
+
+    for wing in vehicle.wings:
+        elements.append(inertia_element('wings.' + wing.tag,lambda CG: wing.compute_moment_of_inertia(mass=wing.mass_properties.mass, center_of_gravity = CG)[0]))
+
+    fuel_tanks            = Data()
+    fuel_tanks.tags       = []
+    fuel_tanks.fuel_lines = []
+    for network in vehicle.networks:
+        for propulsor in network.propulsors:
+            tag = 'networks.' + network.tag + '.' + propulsor.tag
+            if isinstance(propulsor,RCAIDE.Library.Components.Propulsors.Electric_Rotor):
+                motor = propulsor.motor
+                elements.append(inertia_element(tag,lambda CG: compute_cylinder_moment_of_inertia(motor.origin,motor.mass_properties.mass, 0, 0, 0,0, CG)[0]))
+            if isinstance(propulsor,RCAIDE.Library.Components.Propulsors.Turbofan):
+                elements.append(inertia_element(tag,lambda CG: compute_cylinder_moment_of_inertia(propulsor.origin, propulsor.mass_properties.mass, propulsor.engine_length, propulsor.nacelle.diameter/2, 0, 0, CG)[0]))
+            if isinstance(propulsor,RCAIDE.Library.Components.Propulsors.Turboprop):
+                elements.append(inertia_element(tag,lambda CG: compute_cylinder_moment_of_inertia(propulsor.origin, propulsor.mass_properties.mass, propulsor.engine_length, propulsor.engine_diameter/2, 0, 0, CG)[0]))
+            if isinstance(propulsor,RCAIDE.Library.Components.Propulsors.ICE_Propeller):
+                elements.append(inertia_element(tag,lambda CG: compute_cylinder_moment_of_inertia(propulsor.origin, propulsor.mass_properties.mass, propulsor.engine_length, propulsor.engine_diameter/2, 0, 0, CG)[0]))
+
+        for bus in network.busses:
+            for battery in bus.battery_modules:
+                tag = 'networks.' + network.tag + '.' + bus.tag + '.' + battery.tag
+                elements.append(inertia_element(tag,lambda CG: compute_cuboid_moment_of_inertia(battery.origin, battery.mass_properties.mass, battery.length, battery.width, battery.height, 0, 0, 0, CG)[0]))
+
+        for fuel_line in network.fuel_lines:
+            for fuel_tank in fuel_line.fuel_tanks:
+                # fuel elements are per unit mass of fuel, the inertia models are linear in the mass
+                tag     = 'networks.' + network.tag + '.' + fuel_line.tag + '.' + fuel_tank.tag + '.fuel'
+                element = inertia_element(tag,lambda CG: np.zeros((3,3)))
+                if isinstance(fuel_tank,RCAIDE.Library.Components.Energy.Sources.Fuel_Tanks.Central_Fuel_Tank):
+                    element = inertia_element(tag,lambda CG: compute_cuboid_moment_of_inertia(fuel_tank.origin, 1., fuel_tank.length, fuel_tank.width, fuel_tank.height, 0, 0, 0, CG)[0])
+                if isinstance(fuel_tank,RCAIDE.Library.Components.Energy.Sources.Fuel_Tanks.Wing_Fuel_Tank):
+                    element = inertia_element(tag,lambda CG: compute_wing_moment_of_inertia(vehicle.wings["main_wing"], mass=1., center_of_gravity = CG, fuel_flag=True)[0])
+                element.mass              = fuel_tank.fuel.mass_properties.mass
+                element.center_of_gravity = np.array(fuel_tank.origin,dtype=float).reshape(3) + np.array(fuel_tank.fuel.mass_properties.center_of_gravity,dtype=float).reshape(3)
+                element.fuel              = True
+                elements.append(element)
+                fuel_tanks.tags.append(fuel_tank.tag)
+                fuel_tanks.fuel_lines.append(fuel_line.tag)
+
+    # ------------------------------------------------------------------
+    #  Pack the elements
+    # ------------------------------------------------------------------
+    model                    = Data()
+    model.tags               = [element.tag for element in elements]
+    fuel                     = np.array([element.fuel for element in elements],dtype=bool)
+    payload                  = np.array([element.payload for element in elements],dtype=bool)
+    variable                 = fuel | payload
+    model.masses             = np.array([element.mass for element in elements],dtype=float)
+    model.centers_of_gravity = np.array([element.center_of_gravity for element in elements]).reshape(-1,3)
+    model.inertia            = Data()
+    model.inertia.constant   = np.array([element.inertia.constant for element in elements]).reshape(-1,3,3)
+    model.inertia.gradient   = np.array([element.inertia.gradient for element in elements]).reshape(-1,3,3,3)
+    model.inertia.mass       = np.array([element.inertia.mass for element in elements]).reshape(-1)
+
+    # the states change the mass of the fuel and of the payload, the inertia terms of the fuel are per unit mass
+    variable_elements                = np.where(variable)[0]
+    model.variable                   = Data()
+    model.variable.elements          = variable_elements
+    model.variable.centers_of_gravity = model.centers_of_gravity[variable_elements]
+    model.variable.inertia           = Data()
+    model.variable.inertia.constant  = model.inertia.constant[variable_elements]
+    model.variable.inertia.gradient  = model.inertia.gradient[variable_elements]
+    model.variable.inertia.mass      = model.inertia.mass[variable_elements]
+    scale                            = np.where(fuel,model.masses,1.)
+    model.inertia.constant           = model.inertia.constant*scale[:,None,None]
+    model.inertia.gradient           = model.inertia.gradient*scale[:,None,None,None]
+    model.inertia.mass               = model.inertia.mass*scale
+
+    # sum the elements that are the same in all the states
+    fixed                            = ~variable
+    model.fixed                      = Data()
+    model.fixed.mass                 = np.sum(model.masses[fixed])
+    model.fixed.moment               = np.sum(model.masses[fixed,None]*model.centers_of_gravity[fixed],axis=0)
+    model.fixed.inertia              = Data()
+    model.fixed.inertia.constant     = np.sum(model.inertia.constant[fixed],axis=0)
+    model.fixed.inertia.gradient     = np.sum(model.inertia.gradient[fixed],axis=0)
+    model.fixed.inertia.mass         = np.sum(model.inertia.mass[fixed])
+
+    # columns of the fuel tanks and of the payload components in the variable elements
+    model.fuel_tanks                 = fuel_tanks
+    model.fuel_tanks.masses          = model.masses[fuel]
+    model.fuel_tanks.columns         = np.where(fuel[variable_elements])[0]
+    model.payloads                   = Data()
+    model.payloads.tags              = [model.tags[i].split('.')[-1] for i in np.where(payload)[0]]
+    model.payloads.masses            = model.masses[payload]
+    model.payloads.columns           = np.where(payload[variable_elements])[0]
+
+    return model
+
+def append_components(elements,container,path,payload = False):
+    ''' Recursively adds the mass and center of gravity of the components of a container to the elements, as
+    sum_moment does
+
+    Assumptions:
+    Components with a center of gravity at x = 0 are not placed and only add mass, as in sum_moment
+
+    Source:
+    None
+
+    Inputs:
+    elements      - list of elements                   [list]
+    container     - component container
+    path          - tag of the container               [string]
+    payload       - flag of payload components         [Boolean]
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    '''
+    for key,Comp in container.items():
+        if isinstance(Comp,Component.Container):
+            append_components(elements,Comp,path + '.' + key,payload)
+        elif isinstance(Comp,Component):
+            global_cg_loc = (np.array(Comp.mass_properties.center_of_gravity,dtype=float) + np.array(Comp.origin,dtype=float)).reshape(3)
+            if global_cg_loc[0] == 0:
+                global_cg_loc = np.zeros(3)
+            element                   = inertia_element(path + '.' + key,lambda CG: np.zeros((3,3)))
+            element.mass              = Comp.mass_properties.mass
+            element.center_of_gravity = global_cg_loc
+            element.payload           = payload
+            elements.append(element)
+
+    return
+
+def inertia_element(tag,compute_inertia):
+    ''' Finds the terms of the moment of inertia tensor of a component about a center of gravity c,
+    I(c) = I_0 + sum_k c_k dI_k + m_I (|c|^2 E - c c^T), by evaluating its inertia model at the origin and at
+    unit distances from it along each axis
+
+    Assumptions:
+    The inertia model is a fixed tensor moved to c with the parallel axis theorem
+
+    Source:
+    None
+
+    Inputs:
+    tag               - tag of the component                                              [string]
+    compute_inertia   - inertia model, tensor about the center of gravity given as (1,3)  [function]
+
+    Outputs:
+    element.
+      inertia.constant    - I_0               [kg-m^2]
+      inertia.gradient    - dI_k              [kg-m]
+      inertia.mass        - m_I               [kg]
+
+    Properties Used:
+    N/A
+    '''
+    E        = np.identity(3)
+    I_0      = np.array(compute_inertia(np.zeros((1,3))),dtype=float)
+    gradient = np.zeros((3,3,3))
+    mass     = 0.
+    for k in range(3):
+        I_plus      = np.array(compute_inertia(E[k:k+1]),dtype=float)
+        I_minus     = np.array(compute_inertia(-E[k:k+1]),dtype=float)
+        gradient[k] = (I_plus - I_minus)/2
+
+        # the quadratic part is m_I (E - e_k e_k^T), whose diagonal is m_I off the k-th axis
+        mass       += (I_plus + I_minus - 2*I_0)[(k+1)%3,(k+1)%3]/2/3
+
+    element                   = Data()
+    element.tag               = tag
+    element.mass              = 0.
+    element.center_of_gravity = np.zeros(3)
+    element.fuel              = False
+    element.payload           = False
+    element.inertia           = Data()
+    element.inertia.constant  = I_0
+    element.inertia.gradient  = gradient
+    element.inertia.mass      = mass
+
+    return element
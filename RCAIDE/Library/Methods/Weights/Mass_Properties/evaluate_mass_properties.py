@@ -0,0 +1,74 @@
+# RCAIDE/Library/Methods/Weights/Mass_Properties/evaluate_mass_properties.py
+#
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+
+# RCAIDE imports
+from RCAIDE.Framework.Core import Data
+
+# package imports
+import numpy as np
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  evaluate_mass_properties
+# ----------------------------------------------------------------------------------------------------------------------
+def evaluate_mass_properties(model, fuel_masses = None, payload_masses = None):
+    ''' Computes the mass, center of gravity and moment of inertia of a vehicle for many fuel and payload states at
+    once, from the flattened model of build_mass_properties_model. Only the fuel and payload elements are added to
+    the sums of the other components in each state.
+
+    Assumptions:
+    The inertia tensor is about the center of gravity of each state. A vehicle without mass has its center of
+    gravity at the origin.
+
+    Source:
+    None
+
+    Inputs:
+    model                - flattened vehicle of build_mass_properties_model
+    fuel_masses          - fuel mass of each tank in each state, shape (n_states,n_tanks),
+                           in the order of model.fuel_tanks.tags, those of the model if None                  [kg]
+    payload_masses       - mass of each payload component in each state, shape (n_states,n_payloads),
+                           in the order of model.payloads.tags, those of the model if None                    [kg]
+
+    Outputs:
+    mass_properties.
+      mass               - total mass, shape (n_states,1)                                                     [kg]
+      center_of_gravity  - center of gravity, shape (n_states,3)                                              [m]
+      moment_of_inertia  - inertia tensor about the center of gravity, shape (n_states,3,3)                   [kg-m^2]
+
+    Properties Used:
+    N/A
+    '''
+
+    # masses of the variable elements in each state
+    n_variable = len(model.variable.elements)
+    states     = [np.atleast_2d(masses).shape[0] for masses in [fuel_masses,payload_masses] if masses is not None]
+    n_states   = max(states) if len(states) > 0 else 1
+    masses     = np.tile(model.masses[model.variable.elements],(n_states,1)).reshape(n_states,n_variable)
+    if fuel_masses is not None:
+        masses[:,model.fuel_tanks.columns] = np.atleast_2d(fuel_masses)
+    if payload_masses is not None:
+        masses[:,model.payloads.columns]   = np.atleast_2d(payload_masses)
+
+    # mass and center of gravity
+    mass   = model.fixed.mass + np.sum(masses,axis=1)
+    moment = model.fixed.moment + np.dot(masses,model.variable.centers_of_gravity)
+    CG     = moment/np.where(mass == 0,1.,mass)[:,None]
+
+    # inertia terms, then the tensor about the center of gravity
+    variable        = model.variable.inertia
+    I_0             = model.fixed.inertia.constant + np.einsum('sv,vij->sij',masses,variable.constant)
+    gradient        = model.fixed.inertia.gradient + np.einsum('sv,vkij->skij',masses,variable.gradient)
+    m_I             = model.fixed.inertia.mass     + np.dot(masses,variable.mass)
+    parallel_axis   = np.sum(CG**2,axis=1)[:,None,None]*np.identity(3) - CG[:,:,None]*CG[:,None,:]
+    I               = I_0 + np.einsum('sk,skij->sij',CG,gradient) + m_I[:,None,None]*parallel_axis
+
+    mass_properties                   = Data()
+    mass_properties.mass              = mass[:,None]
+    mass_properties.center_of_gravity = CG
+    mass_properties.moment_of_inertia = I
+
+    return mass_properties
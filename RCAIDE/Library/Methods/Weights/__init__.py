@@ -10,6 +10,7 @@
 
 from . import Center_of_Gravity 
 from . import Moment_of_Inertia
+from . import Mass_Properties
 from . import Physics_Based_Buildups 
 from . import Correlation_Buildups 
 from . import Center_of_Gravity 
@@ -20,6 +20,7 @@ from . import Stability
 from . import Utilities
 from . import Weights
 from . import Geodesics
+from . import Topography
 
 from .skip import skip
 
@@ -9,6 +9,9 @@
 # RCAIDE Imports 
 from RCAIDE.Framework.Core.Arrays  import atleast_2d_col 
 
+# package imports
+import numpy as np
+
 # ----------------------------------------------------------------------------------------------------------------------
 #  Initialize Differentials
 # ----------------------------------------------------------------------------------------------------------------------
@@ -28,6 +31,8 @@ def differentials_dimensionless(segment):
                 control_points           [array]
                 differentiate            [array]
                 integrate                [array]
+            numerics.time:
+                duration                 [array]
 
         Properties Used:
         N/A
@@ -48,5 +53,8 @@ def differentials_dimensionless(segment):
     numerics.dimensionless.differentiate  = D
     numerics.dimensionless.integrate      = I    
     
+    # the dimensional operators are rescaled on the next update
+    numerics.time.duration                = np.empty([0,0])
+    
     return
  
\ No newline at end of file
@@ -53,4 +53,9 @@ def atmosphere(segment):
     conditions.freestream.prandtl_number         = atmosphere_data.prandtl_number
     
     return
+
+# dependencies of the step, used when it is memoized with Process.memoize
+atmosphere.inputs  = ['state.conditions.freestream.altitude','temperature_deviation']
+atmosphere.outputs = ['state.conditions.freestream.' + tag for tag in ['pressure','temperature','thermal_conductivity','density','speed_of_sound',
+                                                                        'dynamic_viscosity','kinematic_viscosity','prandtl_number']]
      
\ No newline at end of file
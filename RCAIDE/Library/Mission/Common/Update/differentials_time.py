@@ -3,6 +3,12 @@
 # 
 # Created:  Jul 2023, M. Clarke
  
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# package imports
+import numpy as np
+
 # ----------------------------------------------------------------------------------------------------------------------
 #  Update Differentials Time
 # ----------------------------------------------------------------------------------------------------------------------
@@ -11,7 +17,7 @@ def differentials_time(segment):
     """ Updates the time descretization 
         
         Assumptions:
-        N/A
+        The dimensional operators are only rescaled when the duration of the segment changes
         
         Inputs:
             segment.state.conditions:
@@ -21,6 +27,7 @@ def differentials_time(segment):
                 .control_points               [s]
                 .differentiate                [-]
                 .integrate                    [-]
+                .duration                     [s]
 
       
         Properties Used:
@@ -37,6 +44,10 @@ def differentials_time(segment):
     # rescale time
     time = segment.state.conditions.frames.inertial.time
     T    = time[-1] - time[0]
+    
+    # the operators of the previous iteration are kept if the duration is unchanged
+    if np.array_equal(numerics.time.duration,T):
+        return
     t    = x * T
     
     # rescale operators
@@ -47,5 +58,6 @@ def differentials_time(segment):
     numerics.time.control_points = t
     numerics.time.differentiate  = D
     numerics.time.integrate      = I
+    numerics.time.duration       = T
 
     return
@@ -34,4 +34,8 @@ def gravity(segment):
     # pack
     segment.state.conditions.freestream.gravity[:,0] = g[:,0]
 
-    return 
\ No newline at end of file
+    return 
+
+# dependencies of the step, used when it is memoized with Process.memoize
+gravity.inputs  = ['state.conditions.freestream.altitude']
+gravity.outputs = ['state.conditions.freestream.gravity']
@@ -29,8 +29,10 @@ def converge_root(segment):
     state.numerics.tolerance_solution  [Unitless]
 
     Outputs:
-    state.unknowns                     [Any]
-    segment.state.numerics.converged   [Unitless]
+    state.unknowns                                         [Any]
+    segment.state.numerics.converged                       [Unitless]
+    segment.state.numerics.number_of_function_evaluations  [Unitless]
+    segment.state.numerics.residual_norm                   [Unitless]
 
     Properties Used:
     N/A
@@ -51,6 +53,10 @@ def converge_root(segment):
                                          epsfcn = segment.state.numerics.step_size,
                                          full_output = 1)
     
+    segment.state.numerics.number_of_function_evaluations = infodict.get('nfev',0)
+    if 'fvec' in infodict:
+        segment.state.numerics.residual_norm = float(np.linalg.norm(infodict['fvec']))
+    
     if ier!=1:
         print("Segment did not converge. Segment Tag: " + segment.tag)
         print("Error Message:\n" + msg)
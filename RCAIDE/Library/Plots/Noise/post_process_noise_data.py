@@ -14,6 +14,7 @@ from RCAIDE.Library.Methods.Noise.Metrics import *
 from RCAIDE.Library.Methods.Noise.Common.generate_zero_elevation_microphone_locations import generate_zero_elevation_microphone_locations 
 from RCAIDE.Library.Methods.Noise.Common.generate_terrain_microphone_locations        import generate_terrain_microphone_locations     
 from RCAIDE.Library.Methods.Noise.Common.compute_relative_noise_evaluation_locations  import compute_relative_noise_evaluation_locations
+from RCAIDE.Library.Methods.Noise.Common.compute_nearest_microphones                  import generate_microphone_spatial_index, compute_nearest_microphones
 from RCAIDE.Library.Methods.Geodesics.compute_point_to_point_geospacial_data          import compute_point_to_point_geospacial_data
 
 # package imports
@@ -79,6 +80,8 @@ def post_process_noise_data(results,
     Aircraft_pos          = np.empty((0,3))
     Time                  = np.empty((0))
     mic_locs              = np.zeros((N_ctrl_pts,n))   
+    SPL_dBA_flat          = SPL_dBA.reshape(N_ctrl_pts,num_gm_mic)
+    microphone_indices    = {}
  
     idx =  0
     
@@ -104,35 +107,38 @@ def post_process_noise_data(results,
         Aircraft_pos = np.vstack((Aircraft_pos,noise_pos))
         Time         = np.hstack((Time,noise_time_))
         
-        for i in range(len(noise_time_)):
-            # Step 5.2.1 :Noise interpolation 
-            delta_t         = (noise_time[i] -time[cpt]) / (time[cpt+1] - time[cpt])
-            SPL_lower       = conditions.noise.hemisphere_SPL_dBA[cpt].reshape(len(phi),len(theta))
-            SPL_uppper      = conditions.noise.hemisphere_SPL_dBA[cpt+1].reshape(len(phi),len(theta))
-            SPL_gradient    = SPL_uppper -  SPL_lower
-            SPL_interp      = SPL_lower + SPL_gradient *delta_t
-     
-            #  Step 5.2.2 Create surrogate   
-            SPL_dBA_surrogate = RegularGridInterpolator((phi, theta),SPL_interp  ,method = 'linear',   bounds_error=False, fill_value=None)       
-            
-            #  Step 5.2.3 Query surrogate
-            R                 = np.linalg.norm(RML[i], axis=1) 
-            locs              = np.argsort(R)[:n]
-            pts               = (PHI[i][locs],THETA[i][locs]) 
-            SPL_dBA_unscaled  = SPL_dBA_surrogate(pts) 
-            
-            #  Step 5.2.4 Scale data using radius  
-            R_ref                = settings.noise_hemisphere_radius  
-            SPL_dBA_scaled       = SPL_dBA_unscaled - 20*np.log10(R[locs]/R_ref)
-            
-            SPL_dBA_temp         = SPL_dBA[idx].flatten()
-            SPL_dBA_temp[locs]   = SPL_dBA_scaled
-            SPL_dBA[idx]         = SPL_dBA_temp.reshape(N_gm_x,N_gm_y) 
-            mic_locs[idx]        = locs 
-            idx += 1
-            
+        num_t = len(noise_time_)
+        cpts  = np.zeros(num_t,dtype=int)
+        for i in range(num_t):
+            cpts[i] = cpt 
             if noise_time[i] >= time[cpt+1]:
-                cpt += 1             
+                cpt += 1       
+                
+        # Step 5.2.1 : Find closest microphones with the spatial index 
+        MSL_altitude = settings.mean_sea_level_altitude
+        if MSL_altitude not in microphone_indices:
+            microphone_indices[MSL_altitude] = generate_microphone_spatial_index(microphone_locations,MSL_altitude)
+        locs         = compute_nearest_microphones(microphone_indices[MSL_altitude],settings,noise_pos[:num_t],n)
+        steps        = np.arange(num_t)[:,None]
+        R            = np.linalg.norm(RML[steps,locs], axis=2) 
+        
+        # Step 5.2.2 : Create one surrogate over the hemisphere holding every control point 
+        SPL_hemisphere    = conditions.noise.hemisphere_SPL_dBA.reshape(len(time),len(phi),len(theta))
+        SPL_dBA_surrogate = RegularGridInterpolator((phi, theta),np.moveaxis(SPL_hemisphere,0,2),method = 'linear',   bounds_error=False, fill_value=None)  
+        
+        # Step 5.2.3 : Query surrogate and interpolate in time 
+        SPL_cpts          = SPL_dBA_surrogate((PHI[steps,locs],THETA[steps,locs])) 
+        delta_t           = (noise_time_ -time[cpts]) / (time[cpts+1] - time[cpts])
+        SPL_lower         = np.take_along_axis(SPL_cpts,np.tile(cpts[:,None,None],(1,locs.shape[1],1)),axis=2)[:,:,0]
+        SPL_uppper        = np.take_along_axis(SPL_cpts,np.tile(cpts[:,None,None]+1,(1,locs.shape[1],1)),axis=2)[:,:,0]
+        SPL_dBA_unscaled  = SPL_lower + (SPL_uppper - SPL_lower)*delta_t[:,None]
+        
+        # Step 5.2.4 : Scale data using radius  
+        R_ref                              = settings.noise_hemisphere_radius  
+        SPL_dBA_scaled                     = SPL_dBA_unscaled - 20*np.log10(R/R_ref)
+        SPL_dBA_flat[idx + steps,locs]     = SPL_dBA_scaled
+        mic_locs[idx:idx + num_t]          = locs 
+        idx += num_t
                 
     # Step 6: Make any readings less that background noise equal to background noise
     SPL_dBA                             = np.nan_to_num(SPL_dBA) 
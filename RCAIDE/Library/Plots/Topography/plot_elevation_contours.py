@@ -7,12 +7,12 @@
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------   
 from RCAIDE.Framework.Core                             import Units
-from RCAIDE.Framework.Analyses.Geodesics.Geodesics import Calculate_Distance
+from RCAIDE.Framework.Analyses.Geodesics.Geodesics import Calculate_Distances
+from RCAIDE.Library.Methods.Topography             import load_topography, interpolate_topography
 from RCAIDE.Library.Plots.Common import plot_style
 
 # python imports 
 import matplotlib.pyplot as plt
-from scipy.interpolate import griddata
 import matplotlib.colors 
 import numpy as np 
 
@@ -65,10 +65,13 @@ def plot_elevation_contours(topography_file,
     colors          = np.vstack((colors_undersea, colors_land))
     cut_terrain_map = matplotlib.colors.LinearSegmentedColormap.from_list('cut_terrain', colors) 
     
-    data = np.loadtxt(topography_file)
-    Long = data[:,0]
-    Lat  = data[:,1]
-    Elev = data[:,2]    
+    topography = load_topography(topography_file)
+    if topography.regular_grid:
+        Lat    = topography.latitude
+        Long   = topography.longitude 
+    else:
+        Lat    = topography.points[:,1]
+        Long   = topography.points[:,0]
 
     x_min_coord = np.min(Lat)
     x_max_coord = np.max(Lat)
@@ -84,12 +87,11 @@ def plot_elevation_contours(topography_file,
     top_right_map_coords     = np.array([x_max_coord,y_max_coord])
     bottom_right_map_coords  = np.array([x_min_coord,y_max_coord]) 
     
-    x_dist_max = Calculate_Distance(top_left_map_coords,bottom_left_map_coords) * Units.kilometers
-    y_dist_max = Calculate_Distance(bottom_right_map_coords,bottom_left_map_coords) * Units.kilometers
+    x_dist_max, y_dist_max = Calculate_Distances(np.array([top_left_map_coords,bottom_right_map_coords]),bottom_left_map_coords) * Units.kilometers
     
     [long_dist,lat_dist]  = np.meshgrid(np.linspace(0,y_dist_max,number_of_longitudinal_points),np.linspace(0,x_dist_max,number_of_latitudinal_points))
     [long_deg,lat_deg]    = np.meshgrid(np.linspace(np.min(Long),np.max(Long),number_of_longitudinal_points),np.linspace(np.min(Lat),np.max(Lat),number_of_latitudinal_points)) 
-    elevation             = griddata((Lat,Long), Elev, (lat_deg, long_deg), method='linear')     
+    elevation             = interpolate_topography(topography, lat_deg, long_deg, method='linear')     
     elevation             = elevation/Units.feet
     norm                  = FixPointNormalize(sealevel=0,vmax=np.max(elevation),vmin=np.min(elevation)) 
     
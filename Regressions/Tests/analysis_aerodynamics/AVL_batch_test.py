@@ -0,0 +1,146 @@
+# Regressions/Tests/analysis_aerodynamics/AVL_batch_test.py
+#
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+import RCAIDE
+from   RCAIDE.Framework.Core import Units
+from   RCAIDE.Library.Methods.Aerodynamics.Athena_Vortex_Lattice import train_AVL_surrogates
+
+# python imports
+import numpy as np
+import tempfile
+import sys
+import os
+from   shutil import rmtree
+
+# local imports
+sys.path.append(os.path.join( os.path.split(os.path.split(sys.path[0])[0])[0], 'Vehicles'))
+from   Navion    import vehicle_setup
+
+# stand-in for the AVL binary: reads the input deck, records its folder and run time, and writes result files
+# whose fields are all made of the digit (batch + case) % 9 + 1, except for the names of the control surfaces
+stub_text = '''
+import sys, os, time
+record = sys.argv[1]
+start  = time.time()
+batch  = 0
+case   = 0
+lines  = sys.stdin.read().split('\\n')
+for i,line in enumerate(lines):
+    if line.startswith('CASE '):
+        batch = int(line.split('_')[1].split('.')[0])
+    if line.strip() == 'st':
+        case += 1
+    if line.strip() in ['st','fn','fs','sb']:
+        digit = str((batch + case) % 9 + 1)
+        text  = [digit*100]*400
+        for k in range(10):
+            text[29+k] = '  ' + 'cs{}'.format(k).ljust(9) + digit*89
+        with open(lines[i+1].strip(),'w') as f:
+            f.write('\\n'.join(text))
+time.sleep(0.5)
+with open(record,'a') as f:
+    f.write('{} {} {}\\n'.format(os.getcwd(),start,time.time()))
+'''
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  main
+# ----------------------------------------------------------------------------------------------------------------------
+def main():
+    '''Trains the AVL surrogates with a script standing in for the AVL binary, and checks that the Mach numbers are
+    run at the same time in their own folders, that their results are read back in the right place, and that AVL is
+    only run again for new inputs'''
+
+    stub_folder = tempfile.mkdtemp()
+    stub        = os.path.join(stub_folder,'avl_stub.py')
+    record      = os.path.join(stub_folder,'record.txt')
+    with open(stub,'w') as f:
+        f.write(stub_text)
+
+    vehicle      = vehicle_setup()
+    aerodynamics = analysis_setup(vehicle,stub_folder,[0.1,0.2,0.3,0.4])
+    train_AVL_surrogates(aerodynamics)
+
+    # the results of AoA j and Mach i are those of case j+1 of batch i+1
+    CL = aerodynamics.training.coefficients[0]
+    for i in range(4):
+        for j in range(3):
+            assert CL[j,i] == float(str((i + j + 2) % 9 + 1)*10)
+
+    # each Mach number is run in its own folder, two at a time
+    runs    = read_record(record)
+    folders = [run[0] for run in runs]
+    times   = np.array([[float(run[1]),float(run[2])] for run in runs])
+    print(folders)
+    assert len(set(folders)) == 4
+    assert all([os.path.dirname(folder) == aerodynamics.settings.filenames.run_folder for folder in folders])
+    overlaps = [(times[a,0] < times[b,1]) and (times[b,0] < times[a,1]) for a in range(4) for b in range(a+1,4)]
+    assert any(overlaps)
+
+    # the run folder is removed
+    assert not os.path.exists(aerodynamics.settings.filenames.run_folder)
+
+    # a new analysis of the same vehicle only runs the new Mach number
+    cached_aerodynamics = analysis_setup(vehicle,stub_folder,[0.1,0.2,0.3,0.4,0.5])
+    train_AVL_surrogates(cached_aerodynamics)
+    assert len(read_record(record)) == 5
+    assert np.all(cached_aerodynamics.training.coefficients[:,:,:4] == aerodynamics.training.coefficients)
+
+    # and all of them after a change of the vehicle
+    vehicle.mass_properties.center_of_gravity[0][0] += 0.1
+    moved_aerodynamics = analysis_setup(vehicle,stub_folder,[0.1,0.2,0.3,0.4,0.5])
+    train_AVL_surrogates(moved_aerodynamics)
+    assert len(read_record(record)) == 10
+
+    # and all of them with another AVL executable
+    interpreter = os.path.join(stub_folder,'python')
+    os.symlink(sys.executable,interpreter)
+    moved_aerodynamics = analysis_setup(vehicle,stub_folder,[0.1,0.2,0.3,0.4,0.5])
+    moved_aerodynamics.settings.filenames.avl_bin_name[0] = interpreter
+    train_AVL_surrogates(moved_aerodynamics)
+    assert len(read_record(record)) == 15
+
+    # the cache is only used when asked for, in a given folder
+    uncached_aerodynamics = analysis_setup(vehicle,stub_folder,[0.1])
+    uncached_aerodynamics.settings.use_training_cache = False
+    train_AVL_surrogates(uncached_aerodynamics)
+    assert len(read_record(record)) == 16
+    assert not RCAIDE.Framework.Analyses.Aerodynamics.Athena_Vortex_Lattice().settings.use_training_cache
+    uncached_aerodynamics.settings.use_training_cache       = True
+    uncached_aerodynamics.settings.training_cache_directory = None
+    try:
+        train_AVL_surrogates(uncached_aerodynamics)
+        assert False
+    except ValueError:
+        pass
+
+    rmtree(stub_folder)
+
+    return
+
+def analysis_setup(vehicle,stub_folder,Mach):
+    '''Sets up an AVL analysis running the stand-in script with a cache in the folder of the script'''
+
+    aerodynamics                                    = RCAIDE.Framework.Analyses.Aerodynamics.Athena_Vortex_Lattice()
+    aerodynamics.vehicle                            = vehicle
+    aerodynamics.settings.filenames.run_folder      = os.path.join(stub_folder,'avl_files')
+    aerodynamics.settings.filenames.avl_bin_name    = [sys.executable,os.path.join(stub_folder,'avl_stub.py'),os.path.join(stub_folder,'record.txt')]
+    aerodynamics.settings.number_of_processes       = 2
+    aerodynamics.settings.use_training_cache        = True
+    aerodynamics.settings.training_cache_directory  = os.path.join(stub_folder,'cache')
+    aerodynamics.training.angle_of_attack           = np.array([0.,2.,5.])*Units.degrees
+    aerodynamics.training.Mach                      = np.array(Mach)
+
+    return aerodynamics
+
+def read_record(record):
+    '''Reads the folder, start and end time of each run of the stand-in script'''
+    with open(record) as f:
+        runs = [line.split() for line in f.readlines()]
+    return runs
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,123 @@
+# VLM_fused_surrogate_test.py
+#
+
+""" Checks the fused surrogates of the VLM, which interpolate all the coefficients of a set of perturbations at once
+and only evaluate the Mach regimes of nonzero weight, against the blend of the surrogates of the individual
+coefficients over the subsonic, transonic and supersonic regions
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+import RCAIDE
+from RCAIDE.Framework.Core                                        import Data
+from RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method    import build_VLM_surrogates
+from RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method.evaluate_VLM import compute_coefficients, compute_stability_derivative
+from RCAIDE.Library.Methods.Utilities                             import Cubic_Spline_Blender
+
+import numpy as np
+
+coefficients  = ['Clift','Cdrag','CX','CY','CZ','CL','CM','CN']
+perturbations = {'alpha'  :'angle_of_attack',
+                 'beta'   :'sideslip_angle',
+                 'u'      :'u',
+                 'v'      :'v',
+                 'w'      :'w',
+                 'p'      :'roll_rate',
+                 'q'      :'pitch_rate',
+                 'r'      :'yaw_rate',
+                 'delta_a':'aileron_deflection',
+                 'delta_e':'elevator_deflection',
+                 'delta_r':'rudder_deflection',
+                 'delta_f':'flap_deflection',
+                 'delta_s':'slat_deflection'}
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+
+    aerodynamics = vlm_surrogates()
+    surrogates   = aerodynamics.surrogates
+    sub_sur      = surrogates.subsonic
+    trans_sur    = surrogates.transonic
+    sup_sur      = surrogates.supersonic
+    h_sub        = lambda M:Cubic_Spline_Blender(aerodynamics.hsub_min,aerodynamics.hsub_max).compute(M)
+    h_sup        = lambda M:Cubic_Spline_Blender(aerodynamics.hsup_max,aerodynamics.hsup_min).compute(M)
+
+    rng          = np.random.default_rng(11)
+    mach_regions = {'subsonic'           : np.array([0.1,0.42,0.7,0.84]),
+                    'subsonic-transonic' : np.array([0.86,0.9,0.94]),
+                    'transonic'          : np.array([0.96,1.0,1.04]),
+                    'transonic-supersonic': np.array([1.06,1.1,1.14]),
+                    'supersonic'         : np.array([1.16,1.8,3.0,3.8]),
+                    'all'                : np.linspace(0.05,3.8,40)}
+
+    for region, mach in mach_regions.items():
+        Mach    = mach[:,None]
+        w_sub   = h_sub(Mach)
+        w_sup   = h_sup(Mach)
+        w_trans = 1 - (w_sub + w_sup)
+
+        # the regions skip the regimes of zero weight
+        if region == 'subsonic':
+            assert np.all(w_sub == 1) and np.all(w_trans == 0) and np.all(w_sup == 0)
+        if region == 'transonic':
+            assert np.all(w_sub == 0) and np.all(w_trans == 1) and np.all(w_sup == 0)
+        if region == 'supersonic':
+            assert np.all(w_sub == 0) and np.all(w_trans == 0) and np.all(w_sup == 1)
+
+        for perturbation, training_values in perturbations.items():
+            values  = aerodynamics.training[training_values]
+            x       = rng.uniform(1.2*np.min(values) - 0.1,1.2*np.max(values) + 0.1,(len(Mach),1))
+            pts     = np.hstack((x,Mach))
+            results = compute_coefficients(sub_sur.fused[perturbation],trans_sur.fused[perturbation],sup_sur.fused[perturbation],h_sub,h_sup,Mach,pts)
+            for coefficient in coefficients:
+                tag       = coefficient + '_' + perturbation
+                reference = w_sub*sub_sur[tag](pts)[:,None] + w_trans*trans_sur[tag](pts)[:,None] + w_sup*sup_sur[tag](pts)[:,None]
+                assert results[coefficient].shape == (len(Mach),1)
+                assert np.allclose(results[coefficient],reference,rtol=1e-14,atol=1e-14), (region,tag)
+
+                tag        = 'd' + coefficient + '_d' + perturbation
+                derivative = compute_stability_derivative(sub_sur[tag],trans_sur[tag],sup_sur[tag],h_sub,h_sup,Mach)
+                reference  = w_sub*sub_sur[tag](Mach) + w_trans*trans_sur[tag](Mach) + w_sup*sup_sur[tag](Mach)
+                assert np.allclose(derivative,reference,rtol=1e-14,atol=1e-14), (region,tag)
+
+        print(region,' Mach regions match')
+
+    return
+
+def vlm_surrogates():
+    '''VLM analysis with all the control surfaces and random training data on the default training grids, with the
+    surrogates built from them'''
+
+    rng                        = np.random.default_rng(7)
+    aerodynamics               = RCAIDE.Framework.Analyses.Aerodynamics.Vortex_Lattice_Method()
+    aerodynamics.vehicle       = RCAIDE.Vehicle()
+    aerodynamics.aileron_flag  = True
+    aerodynamics.elevator_flag = True
+    aerodynamics.rudder_flag   = True
+    aerodynamics.flap_flag     = True
+    aerodynamics.slat_flag     = True
+
+    Mach     = aerodynamics.training.Mach
+    sub_Mach = Mach[Mach < 1.]
+    sup_Mach = Mach[Mach >= 1.]
+    for regime, regime_Mach in [('subsonic',sub_Mach),('transonic',np.array([sub_Mach[-1],sup_Mach[0]])),('supersonic',sup_Mach)]:
+        training                  = Data()
+        training.Mach             = regime_Mach
+        training.Clift_wing_alpha = Data()
+        training.Cdrag_wing_alpha = Data()
+        for perturbation, training_values in perturbations.items():
+            n_values = len(aerodynamics.training[training_values])
+            for coefficient in coefficients:
+                training[coefficient + '_' + perturbation]          = rng.normal(0.,1.,(n_values,len(regime_Mach)))
+                training['d' + coefficient + '_d' + perturbation]   = rng.normal(0.,1.,len(regime_Mach))
+        aerodynamics.training[regime] = training
+
+    build_VLM_surrogates(aerodynamics)
+
+    return aerodynamics
+
+if __name__ == '__main__':
+    main()
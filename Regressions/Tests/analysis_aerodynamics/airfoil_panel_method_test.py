@@ -8,6 +8,7 @@
 # RCAIDE Imports 
 from RCAIDE.Framework.Core import Units
 from RCAIDE.Library.Methods.Aerodynamics.Airfoil_Panel_Method     import airfoil_analysis 
+from RCAIDE.Library.Methods.Aerodynamics.Airfoil_Panel_Method     import memoized_airfoil_analysis, clear_airfoil_analysis_cache
 from RCAIDE.Library.Methods.Geometry.Airfoil                      import compute_naca_4series
 from RCAIDE.Library.Methods.Geometry.Airfoil                      import import_airfoil_geometry
 from RCAIDE.Library.Plots import * 
@@ -94,6 +95,17 @@ def single_airfoil():
     print(diff_CM)
     assert diff_CM < 1e-6
     
+    # memoized analysis, the second call is served entirely from the cache 
+    clear_airfoil_analysis_cache()
+    memoized_properties_1 = memoized_airfoil_analysis(airfoil_geometry_1,AoA_rad,Re_vals)
+    memoized_properties_2 = memoized_airfoil_analysis(airfoil_geometry_1,AoA_rad[:,::-1],Re_vals)
+    diff_CL_memoized      = np.max(np.abs(memoized_properties_1.cl_invisc - airfoil_properties_1.cl_invisc))
+    print('\nmemoized cl_invisc difference')
+    print(diff_CL_memoized)
+    assert diff_CL_memoized < 1e-3
+    assert np.all(memoized_properties_2.cl_invisc[:,::-1] == memoized_properties_1.cl_invisc)
+    assert np.all(memoized_properties_2.fL[:,::-1] == memoized_properties_1.fL)
+    
     
     # Abbot Validation
     Cl_abbot = 0.906
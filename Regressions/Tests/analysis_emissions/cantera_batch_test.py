@@ -0,0 +1,52 @@
+# Regressions/Tests/analysis_emissions/cantera_batch_test.py
+#
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+from RCAIDE.Library.Methods.Emissions.Chemical_Reactor_Network_Method.evaluate_cantera       import evaluate_cantera
+from RCAIDE.Library.Methods.Emissions.Chemical_Reactor_Network_Method.evaluate_cantera_batch import evaluate_cantera_batch
+
+# python imports
+import numpy as np
+import sys
+import os
+
+sys.path.append(os.path.join( os.path.split(os.path.split(sys.path[0])[0])[0], 'Vehicles'))
+from Boeing_737    import vehicle_setup
+
+# ----------------------------------------------------------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------------------------------------------------------
+def main():
+    '''Compares the emission indices of the batch evaluation of the chemical reactor network, in this process and
+    across a pool of two processes, with the evaluation of each operating point'''
+
+    try:
+        import cantera as ct
+    except ImportError:
+        print('Cantera is not installed, the batch evaluation of the chemical reactor network is not tested')
+        return
+
+    combustor = vehicle_setup().networks.fuel.propulsors['starboard_propulsor'].combustor
+
+    # operating points within the training envelope of the CRN surrogates
+    T    = np.array([720.,810.,880.])
+    P    = np.array([12.,20.,27.]) * 1E6
+    mdot = np.array([15.,35.,55.])
+    FAR  = np.array([0.015,0.03,0.045])
+
+    serial = [evaluate_cantera(combustor,T[i],P[i],mdot[i],FAR[i]) for i in range(len(T))]
+
+    for number_of_processes in [1,2]:
+        results = evaluate_cantera_batch(combustor,T,P,mdot,FAR,number_of_processes)
+        for key in ['EI_CO2','EI_CO','EI_H2O','EI_NO','EI_NO2']:
+            print(number_of_processes,key,results[key])
+            assert results[key].shape == (len(T),)
+            assert np.allclose(results[key],[point[key] for point in serial],rtol=1E-10,atol=0), key
+
+    return
+
+if __name__ == '__main__':
+    main()
@@ -56,6 +56,12 @@ def main():
     X57_diff_SPL   = np.abs(X57_SPL - X57_SPL_true)
     print('Error: ',X57_diff_SPL)
     assert np.abs((X57_SPL - X57_SPL_true)/X57_SPL_true) < 1e-3 
+    
+    # community noise of the same flights split across two routes  
+    exposure       = RCAIDE.Library.Methods.Noise.Metrics.aggregate_noise_exposure([noise_data,noise_data],[flight_times[:12],flight_times[12:]])
+    L_dn_diff      = np.nanmax(np.abs(exposure.L_dn - noise_data.L_dn))
+    print('L_dn difference: ',L_dn_diff)
+    assert L_dn_diff < 1e-6
      
     return      
 
@@ -194,6 +194,12 @@ def Harmonic_Noise_Validation(PP):
         
         for k,v in list(error.items()):
             assert(np.abs(v)<1E0)
+            
+        # control points evaluated one at a time must match the vectorized evaluation 
+        settings.noise_memory_budget = 0 
+        compute_rotor_noise(mic_positions,electric_rotor,rotor,segment,settings)
+        assert(np.allclose(conditions.noise[electric_rotor.tag][rotor.tag].SPL,F8745D4_SPL))
+        assert(np.allclose(conditions.noise[electric_rotor.tag][rotor.tag].SPL_harmonic_bpf_spectrum,F8745D4_SPL_harmonic_bpf_spectrum))
         
     axes_1_5.legend(loc='upper center', prop={'size': PP.lf} , bbox_to_anchor=(0.5, -0.4), ncol= 3 )  
     axes_2_1.legend(loc='upper right', prop={'size': PP.lf} , bbox_to_anchor=(1.2,1.5))    
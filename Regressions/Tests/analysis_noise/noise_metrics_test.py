@@ -0,0 +1,214 @@
+# noise_metrics_test.py
+#
+
+""" Checks the perceived noise level, tone correction and effective perceived noise level against the loop
+implementations they replaced, on broadband, tonal and flat one-third octave band spectra
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+from RCAIDE.Library.Methods.Noise.Metrics import PNL_noise_metric, EPNL_noise_metric
+from RCAIDE.Library.Methods.Noise.Common  import noise_tone_correction
+
+import numpy as np
+
+# noisiness table of PNL_noise_metric
+noy = np.array([[1, 50, 91, 64, 52, 49, 55, 0.043478, 0.030103, 0.07952, 0.058098],
+                [2, 63, 85.9, 60, 51, 44, 51, 0.04057, 0.030103, 0.06816, 0.058098],
+                [3, 80, 87.3, 56, 49, 39, 46, 0.036831, 0.030103, 0.06816, 0.052288],
+                [4, 100, 79.9, 53, 47, 34, 42, 0.036831, 0.030103, 0.05964, 0.047534],
+                [5, 125, 79.8, 51, 46, 30, 39, 0.035336, 0.030103, 0.053013, 0.043573],
+                [6, 160, 76, 48, 45, 27, 36, 0.033333, 0.030103, 0.053013, 0.043573],
+                [7, 200, 74, 46, 43, 24, 33, 0.033333, 0.030103, 0.053013, 0.040221],
+                [8, 250, 74.9, 44, 42, 21, 30, 0.032051, 0.030103, 0.053013, 0.037349],
+                [9, 315, 94.6, 42, 41, 18, 27, 0.030675, 0.030103, 0.053013, 0.034859],
+                [10, 400, 9999999, 40, 40, 16, 25, 0.030103, 0, 0.053013, 0.034859],
+                [11, 500, 9999999, 40, 40, 16, 25, 0.030103, 0, 0.053013, 0.034859],
+                [12, 630, 9999999, 40, 40, 16, 25, 0.030103, 0, 0.053013, 0.034859],
+                [13, 800, 9999999, 40, 40, 16, 25, 0.030103, 0, 0.053013, 0.034859],
+                [14, 1000, 9999999, 40, 40, 16, 25, 0.030103, 0, 0.053013, 0.034859],
+                [15, 1250, 9999999, 38, 38, 15, 23, 0.030103, 0, 0.05964, 0.034859],
+                [16, 1600, 9999999, 34, 34, 12, 21, 0.02996, 0, 0.053013, 0.040221],
+                [17, 2000, 9999999, 32, 32, 9, 18, 0.02996, 0, 0.053013, 0.037349],
+                [18, 2500, 9999999, 30, 30, 5, 15, 0.02996, 0, 0.047712, 0.034859],
+                [19, 3150, 9999999, 29, 29, 4, 14, 0.02996, 0, 0.047712, 0.034859],
+                [20, 4000, 9999999, 29, 29, 5, 14, 0.02996, 0, 0.053013, 0.034859],
+                [21, 5000, 9999999, 30, 30, 6, 15, 0.02996, 0, 0.053013, 0.034859],
+                [22, 6300, 9999999, 31, 31, 10, 17, 0.02996, 0, 0.06816, 0.037349],
+                [23, 8000, 44.3, 37, 34, 17, 23, 0.042285, 0.02996, 0.07952, 0.037349],
+                [24, 10000, 50.7, 41, 37, 21, 29, 0.042285, 0.02996, 0.05964, 0.043573]])
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+
+    SPL = noise_spectra()
+
+    # reference values of the loop implementations
+    n_cpts, n_mic, _ = SPL.shape
+    PNL_loop  = np.zeros((n_cpts,n_mic))
+    tone_loop = np.zeros((n_cpts,n_mic))
+    for j in range(n_cpts):
+        for k in range(n_mic):
+            PNL_loop[j,k]  = loop_PNL(SPL[j,k])
+            tone_loop[j,k] = loop_tone_correction(SPL[j,k])
+    PNLT_loop = PNL_loop + tone_loop
+    EPNL_loop = loop_EPNL(PNLT_loop)
+
+    PNL  = PNL_noise_metric(SPL)
+    PNLT = PNL + noise_tone_correction(SPL)
+    EPNL = EPNL_noise_metric(PNLT)
+    print('EPNL: ',EPNL)
+
+    # the pure tones are corrected, the flat spectra are not
+    assert np.all(tone_loop[:,1] > 0)
+    assert np.all(tone_loop[:,2] == 0) and np.all(tone_loop[:,3] == 0)
+
+    assert np.allclose(PNL,PNL_loop,rtol=1e-13,atol=1e-11)
+    assert np.allclose(PNLT,PNLT_loop,rtol=1e-13,atol=1e-11)
+    assert np.allclose(EPNL,EPNL_loop,rtol=1e-13,atol=1e-11)
+
+    return
+
+def noise_spectra():
+    '''One-third octave band spectra of a flyover at 6 microphones over 21 time steps:
+    0 - broadband
+    1 - broadband with pure tones in a low and a mid frequency band
+    2 - flat spectrum of constant level, whose PNLT stays within 10 dB of its maximum
+    3 - flat spectrum below the noisiness threshold
+    4 - random spectra over the range of the noisiness table
+    5 - broadband of rising level, whose PNLT is within 10 dB of its maximum at the last time step'''
+
+    rng       = np.random.default_rng(17)
+    n_cpts    = 21
+    bands     = np.arange(24)
+    time      = np.arange(n_cpts)[:,None]
+    level     = 95 - 2.5*np.abs(time - 10)
+    broadband = level - 0.08*(bands - 12)**2 + rng.uniform(-1.,1.,(n_cpts,24))
+
+    SPL        = np.zeros((n_cpts,6,24))
+    SPL[:,0]   = broadband
+    SPL[:,1]   = broadband
+    SPL[:,1,5] = SPL[:,1,5] + 8.
+    SPL[:,1,13]= SPL[:,1,13] + 15.
+    SPL[:,2]   = 85.
+    SPL[:,3]   = 10.
+    SPL[:,4]   = rng.uniform(0.,130.,(n_cpts,24))
+    SPL[:,5]   = 70 + 1.5*time - 0.08*(bands - 12)**2
+
+    return SPL
+
+def loop_PNL(SPL):
+    '''Perceived noise level of one spectrum, loop implementation of PNL_noise_metric'''
+    SPL_noy = np.zeros(24)
+    for i in range(24):
+        if SPL[i]>=noy[1][2]:
+            SPL_noy[i] = 10**(noy[i][8]*(SPL[i]-noy[i][4]))
+        if SPL[i]>=noy[i][3] and SPL[i]<noy[i][2]:
+            SPL_noy[i] = 10**(noy[i][7]*(SPL[i]-noy[i][3]))
+        if SPL[i]>=noy[i][6] and SPL[i]<noy[i][3]:
+            SPL_noy[i] = 0.3*(10**(noy[i][10]*(SPL[i]-noy[i][6])))
+        if SPL[i]>=noy[i][5] and SPL[i]<noy[i][6]:
+            SPL_noy[i] = 0.1*(10**(noy[i][9]*(SPL[i]-noy[i][5])))
+
+    Perceived_noisinees = 0.85*np.max(SPL_noy)+0.15*np.sum(SPL_noy)
+    if Perceived_noisinees==0:
+        Perceived_noisinees = 0.0625
+
+    return 40+(10/np.log10(2))*np.log10(Perceived_noisinees)
+
+def loop_tone_correction(SPL):
+    '''Largest tone correction of one spectrum, loop implementation of noise_tone_correction'''
+    slope       = np.zeros(23)
+    delta_slope = np.zeros(23)
+    for i in range(3,23):
+        slope[i] = SPL[i]-SPL[i-1]
+    for i in range(3,23):
+        delta_slope[i] = 1 if np.abs(slope[i]-slope[i-1])>5 else 0
+
+    step3a = np.zeros(23)
+    step3b = np.zeros(23)
+    for i in range(3,23):
+        if delta_slope[i]==1 and slope[i]>0 and slope[i]>slope[i-1]:
+            step3a[i]   = 1
+        if delta_slope[i]==1 and slope[i]<=0 and slope[i-1]>0:
+            step3b[i-1] = 1
+    step3 = step3a + step3b
+
+    step4 = np.zeros(23)
+    for i in range(1,23):
+        if step3[i]!=0 and i<23:
+            step4[i] = (SPL[i-1]+SPL[i+1])/2
+        if step3[i]!=0 and i==22:
+            step4[i] = SPL[i-1]+slope[i-1]
+        if step3[i]==0:
+            step4[i] = SPL[i]
+
+    step5 = np.zeros(25)
+    for i in range(3,23):
+        step5[i] = step4[i]-step4[i-1]
+    step5[2]  = step5[3]
+    step5[24] = step5[23]
+
+    step6 = np.zeros(23)
+    for i in range(2,22):
+        step6[i] = (step5[i]+step5[i+1]+step5[i+2])/3.
+
+    step7    = np.zeros(24)
+    step7[2] = SPL[2]
+    for i in range(3,23):
+        step7[i] = step7[i-1]+step6[i-1]
+
+    step8 = np.zeros(24)
+    for i in range(2,16):
+        if SPL[i]-step7[i]>=1.5:
+            step8[i] = SPL[i]-step7[i]
+    for i in range(17,22):
+        if SPL[i]-step7[i]>=1.5 and SPL[i]>0 and SPL[i+1]>0 and SPL[i-1]>0:
+            step8[i] = SPL[i]-step7[i]
+    if SPL[23]-step7[23]>=1.5 and SPL[23]>0 and SPL[22]>0:
+        step8[23] = SPL[23]-step7[23]
+
+    tone_correction = np.zeros(23)
+    for bands, low, mid, high in [(range(2,9),lambda F: F/3-0.5,lambda F: F/6.,3+(1/3)),
+                                  (range(10,20),lambda F: (2/3)*F-1,lambda F: F/3.,6+(2/3)),
+                                  (range(21,23),lambda F: F/3-(1/2),lambda F: F/6.,3+(1/3))]:
+        for i in bands:
+            if step8[i]>=1.5 and step8[i]<3:
+                tone_correction[i] = low(step8[i])
+            if step8[i]>=3 and step8[i]<20:
+                tone_correction[i] = mid(step8[i])
+            if step8[i]>20:
+                tone_correction[i] = high
+
+    return np.max(tone_correction)
+
+def loop_EPNL(PNLT):
+    '''Effective perceived noise level, loop implementation of EPNL_noise_metric'''
+    n_mic    = len(PNLT[0,:])
+    PNLT_max = np.max(PNLT,axis=0)
+    nsteps   = len(PNLT)
+    EPNL     = np.zeros(n_mic)
+    for j in range(n_mic):
+        i = 0
+        while PNLT[i][j]<=(PNLT_max[j]-10) and i<=nsteps:
+            i = i+1
+        t1 = i
+        i  = i+1
+        if PNLT[nsteps-1][j]>=(PNLT_max[j]-10):
+            t2 = nsteps-2
+        else:
+            while i<=nsteps and PNLT[i][j]>=(PNLT_max[j]-10):
+                i = i+1
+            t2 = i-1
+        sumation = 0
+        for i in range(t1-1,t2+1):
+            sumation = 10**(PNLT[i][j]/10)+sumation
+        EPNL[j] = PNLT_max[j]+10*np.log10(sumation)-PNLT_max[j]-13
+
+    return EPNL
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,130 @@
+# noise_post_processing_test.py
+#
+
+""" Checks the ground noise of post_process_noise_data, which finds the closest microphones with a KD-tree and
+interpolates every noise time step at once, against the former per time step implementation on a small grid
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+import RCAIDE
+from RCAIDE.Framework.Core                import Data, DataOrdered
+from RCAIDE.Library.Plots                 import post_process_noise_data
+from RCAIDE.Library.Methods.Noise.Common  import background_noise, generate_zero_elevation_microphone_locations, compute_relative_noise_evaluation_locations
+
+import numpy as np
+from scipy.interpolate import RegularGridInterpolator
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+
+    for MSL_altitude in [True,False]:
+        results    = noise_results(MSL_altitude)
+        noise_data = post_process_noise_data(results,evalaute_noise_metrics = False)
+        SPL_dBA, mic_locs = loop_post_process_noise_data(results)
+
+        # the stencils are the same microphones in the same order, and their noise is the same
+        assert np.all(noise_data.microhpone_locations == mic_locs)
+        assert np.allclose(noise_data.SPL_dBA,SPL_dBA,rtol=1e-12,atol=1e-10)
+        assert np.any(noise_data.SPL_dBA > background_noise())
+        print('maximum SPL_dBA: ',np.max(noise_data.SPL_dBA))
+
+    return
+
+def noise_results(MSL_altitude):
+    '''Two segments of an aircraft climbing over a 7 by 5 grid of microphones, with random hemisphere noise'''
+
+    rng      = np.random.default_rng(3)
+    settings = RCAIDE.Framework.Analyses.Noise.Frequency_Domain_Buildup().settings
+    settings.mean_sea_level_altitude          = MSL_altitude
+    settings.microphone_x_resolution          = 7
+    settings.microphone_y_resolution          = 5
+    settings.microphone_min_x                 = 0.
+    settings.microphone_max_x                 = 600.
+    settings.microphone_min_y                 = -120.
+    settings.microphone_max_y                 = 80.
+    settings.noise_times_steps                = 15
+    settings.number_of_microphone_in_stencil  = 6
+    settings.aircraft_origin_location         = np.array([13.1,7.3,0.])
+    n_hemisphere = len(settings.noise_hemisphere_phi_angles)*len(settings.noise_hemisphere_theta_angles)
+
+    results          = Data()
+    results.segments = DataOrdered()
+    for tag, time in [('climb_1',np.array([0.,10.,25.,40.])),('climb_2',np.array([40.,55.,70.,90.]))]:
+        segment                          = Data()
+        segment.analyses                 = Data()
+        segment.analyses.noise           = Data()
+        segment.analyses.noise.settings  = settings
+        conditions                       = Data()
+        conditions.frames                = Data()
+        conditions.frames.inertial       = Data()
+        conditions.frames.inertial.time  = time[:,None]
+        conditions.frames.inertial.position_vector = np.stack((5.*time + 3.3,0.37*time - 11.9,150. + 2.*time),axis=1)
+        conditions.noise                 = Data()
+        conditions.noise.hemisphere_SPL_dBA = rng.uniform(60.,90.,(len(time),n_hemisphere))
+        segment.state                    = Data()
+        segment.state.conditions         = conditions
+        results.segments[tag]            = segment
+
+    return results
+
+def loop_post_process_noise_data(results):
+    '''Ground noise and microphone stencils of the former per time step implementation of post_process_noise_data'''
+
+    settings             = results.segments[0].analyses.noise.settings
+    n                    = settings.number_of_microphone_in_stencil
+    N_gm_x               = settings.microphone_x_resolution
+    N_gm_y               = settings.microphone_y_resolution
+    microphone_locations = generate_zero_elevation_microphone_locations(settings)
+    N_segs               = len(results.segments)
+    num_noise_time       = settings.noise_times_steps
+    N_ctrl_pts           = (N_segs-1)*(num_noise_time-1) + num_noise_time
+    SPL_dBA              = np.ones((N_ctrl_pts,N_gm_x,N_gm_y))*background_noise()
+    mic_locs             = np.zeros((N_ctrl_pts,n))
+
+    idx = 0
+    for seg in range(N_segs):
+        segment    = results.segments[seg]
+        settings   = segment.analyses.noise.settings
+        phi        = settings.noise_hemisphere_phi_angles
+        theta      = settings.noise_hemisphere_theta_angles
+        conditions = segment.state.conditions
+        time       = conditions.frames.inertial.time[:,0]
+        noise_time,noise_pos,RML,PHI,THETA,num_gm_mic = compute_relative_noise_evaluation_locations(settings,microphone_locations,segment)
+
+        cpt = 0
+        if seg == (N_segs - 1):
+            noise_time_ = noise_time
+        else:
+            noise_time_ = noise_time[:-1]
+
+        for i in range(len(noise_time_)):
+            delta_t           = (noise_time[i] - time[cpt])/(time[cpt+1] - time[cpt])
+            SPL_lower         = conditions.noise.hemisphere_SPL_dBA[cpt].reshape(len(phi),len(theta))
+            SPL_uppper        = conditions.noise.hemisphere_SPL_dBA[cpt+1].reshape(len(phi),len(theta))
+            SPL_interp        = SPL_lower + (SPL_uppper - SPL_lower)*delta_t
+            SPL_dBA_surrogate = RegularGridInterpolator((phi,theta),SPL_interp,method = 'linear',bounds_error=False,fill_value=None)
+
+            R                  = np.linalg.norm(RML[i],axis=1)
+            locs               = np.argsort(R)[:n]
+            SPL_dBA_unscaled   = SPL_dBA_surrogate((PHI[i][locs],THETA[i][locs]))
+            SPL_dBA_scaled     = SPL_dBA_unscaled - 20*np.log10(R[locs]/settings.noise_hemisphere_radius)
+            SPL_dBA_temp       = SPL_dBA[idx].flatten()
+            SPL_dBA_temp[locs] = SPL_dBA_scaled
+            SPL_dBA[idx]       = SPL_dBA_temp.reshape(N_gm_x,N_gm_y)
+            mic_locs[idx]      = locs
+            idx += 1
+
+            if noise_time[i] >= time[cpt+1]:
+                cpt += 1
+
+    SPL_dBA                             = np.nan_to_num(SPL_dBA)
+    SPL_dBA[SPL_dBA<background_noise()] = background_noise()
+
+    return SPL_dBA, mic_locs
+
+if __name__ == '__main__':
+    main()
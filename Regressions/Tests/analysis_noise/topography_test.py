@@ -0,0 +1,95 @@
+# topography_test.py
+#
+
+""" Checks the topography loader and its grid interpolation against the interpolation of the text topography file
+with scipy.interpolate.griddata that it replaced
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+import RCAIDE
+from RCAIDE.Library.Methods.Topography import load_topography, interpolate_topography
+from RCAIDE.Library.Methods.Geodesics  import compute_point_to_point_geospacial_data
+
+import numpy as np
+from scipy.interpolate import griddata
+import tempfile
+import os
+from shutil import rmtree
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+
+    topography_file = os.path.join(os.path.dirname(os.path.abspath(__file__)),'LA_Metropolitan_Area.txt')
+    cache_directory = tempfile.mkdtemp()
+    data            = np.loadtxt(topography_file)
+    Long            = data[:,0]
+    Lat             = data[:,1]
+    Elev            = data[:,2]
+
+    topography = load_topography(topography_file, cache_directory = cache_directory)
+    assert topography.regular_grid
+    assert isinstance(topography.elevation,np.memmap)
+    lat_grid   = np.asarray(topography.latitude)
+    long_grid  = np.asarray(topography.longitude)
+
+    # grid points, points on the grid lines and points inside the grid cells
+    rng            = np.random.default_rng(5)
+    [long_n,lat_n] = np.meshgrid(long_grid,lat_grid)
+    lat_line       = np.concatenate((rng.uniform(lat_grid[0],lat_grid[-1],50),lat_grid[rng.integers(0,len(lat_grid),50)]))
+    long_line      = np.concatenate((long_grid[rng.integers(0,len(long_grid),50)],rng.uniform(long_grid[0],long_grid[-1],50)))
+    lat_cell       = rng.uniform(lat_grid[0],lat_grid[-1],500)
+    long_cell      = rng.uniform(long_grid[0],long_grid[-1],500)
+
+    # linear interpolation is the same as the triangulated interpolation at the grid points and along the grid lines
+    for lat, long in [(lat_n,long_n),(lat_line,long_line)]:
+        z_grid      = interpolate_topography(topography,lat,long,method='linear')
+        z_triangles = griddata((Lat,Long),Elev,(lat,long),method='linear')
+        assert np.allclose(z_grid,z_triangles,rtol=0,atol=1e-9)
+
+    # inside the grid cells, both are within the elevations of the corners of the cell
+    z_grid      = interpolate_topography(topography,lat_cell,long_cell,method='linear')
+    z_triangles = griddata((Lat,Long),Elev,(lat_cell,long_cell),method='linear')
+    i           = np.searchsorted(lat_grid,lat_cell) - 1
+    j           = np.searchsorted(long_grid,long_cell) - 1
+    corners     = np.stack((topography.elevation[i,j],topography.elevation[i+1,j],
+                            topography.elevation[i,j+1],topography.elevation[i+1,j+1]))
+    print('largest difference with the triangulated interpolation: ',np.max(np.abs(z_grid - z_triangles)),' m')
+    assert np.all(np.abs(z_grid - z_triangles) <= np.ptp(corners,axis=0) + 1e-9)
+
+    # nearest lookup is unchanged, and the locations outside the map are the same
+    lat_all  = np.concatenate((lat_line,lat_cell,[lat_grid[0] - 0.1,lat_grid[-1] + 0.1]))
+    long_all = np.concatenate((long_line,long_cell,[long_grid[0] - 0.1,long_grid[-1] + 0.1]))
+    assert np.all(interpolate_topography(topography,lat_all,long_all,method='nearest') ==
+                  griddata((Lat,Long),Elev,(lat_all,long_all),method='nearest'))
+    assert np.all(np.isnan(interpolate_topography(topography,lat_all[-2:],long_all[-2:],method='linear')))
+
+    # a window of the map gives the same elevations inside the window
+    bounding_box = [33.9,34.0,241.6,241.8]
+    window       = load_topography(topography_file, bounding_box = bounding_box)
+    lat_box      = rng.uniform(bounding_box[0],bounding_box[1],100)
+    long_box     = rng.uniform(bounding_box[2],bounding_box[3],100)
+    assert len(window.latitude) < len(lat_grid) and len(window.longitude) < len(long_grid)
+    for method in ['linear','nearest']:
+        assert np.all(interpolate_topography(window,lat_box,long_box,method=method) ==
+                      interpolate_topography(topography,lat_box,long_box,method=method))
+
+    # the elevations of the origin and destination of a route only load the window of the route
+    settings                                  = RCAIDE.Framework.Analyses.Noise.Frequency_Domain_Buildup().settings
+    settings.topography_file                  = topography_file
+    settings.aircraft_origin_coordinates      = [33.94067953101678, -118.40513722978149]
+    settings.aircraft_destination_coordinates = [33.8146, -118.1459]
+    compute_point_to_point_geospacial_data(settings)
+    z_route = griddata((Lat,Long),Elev,(np.array([33.94067953101678,33.8146]),np.array([-118.40513722978149,-118.1459]) + 360),method='nearest')
+    assert settings.aircraft_origin_location[2] == z_route[0]
+    assert settings.aircraft_destination_location[2] == z_route[1]
+
+    rmtree(cache_directory)
+
+    return
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+# Regressions/Tests/analysis_stability/dynamic_modes_test.py
+#
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+from RCAIDE.Library.Methods.Stability.Common.compute_dynamic_flight_modes import compute_longitudinal_modes, compute_lateral_modes
+
+# python imports
+import numpy as np
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  main
+# ----------------------------------------------------------------------------------------------------------------------
+def main():
+    '''Identifies the modes of stacks of state matrices built from known eigenvalues'''
+
+    np.random.seed(0)
+    P = np.random.rand(4,4) + 4*np.eye(4)
+
+    # longitudinal: a lightly damped phugoid and a heavily damped short period
+    phugoid      = -0.01 + 0.2j
+    short_period = -2.0  + 3.0j
+    ALon         = np.array([similar(P,[phugoid,short_period]),
+                             similar(P,[phugoid*2,short_period*2]),
+                             np.full((4,4),np.nan)])
+
+    LonModes, phugoid_mode, short_period_mode = compute_longitudinal_modes(ALon)
+    assert np.allclose(phugoid_mode.frequency[:2,0],np.array([1,2])*abs(phugoid)/(2*np.pi))
+    assert np.allclose(phugoid_mode.damping[:2,0],-phugoid.real/abs(phugoid))
+    assert np.allclose(short_period_mode.frequency[:2,0],np.array([1,2])*abs(short_period)/(2*np.pi))
+    assert np.allclose(short_period_mode.damping[:2,0],-short_period.real/abs(short_period))
+
+    # no modes for non-finite state matrices
+    assert np.all(LonModes[2] == 0) and phugoid_mode.frequency[2,0] == 0 and short_period_mode.damping[2,0] == 0
+
+    # lateral: a dutch roll pair, a fast stable roll and a slow unstable spiral
+    dutch_roll = -0.2 + 2.0j
+    roll       = -5.0
+    spiral     = 0.05
+    ALat       = np.array([similar(P,[dutch_roll],[roll,spiral]),
+                           similar(P,[dutch_roll],[spiral,roll]),
+                           similar(P,[],[-1.,-2.,-3.,-4.]),
+                           np.full((4,4),np.nan)])
+    LatModes, dutch_roll_mode, roll_mode, spiral_mode = compute_lateral_modes(ALat)
+    for i in range(2):
+        print(LatModes[i])
+        assert np.isclose(dutch_roll_mode.frequency[i,0],abs(dutch_roll)/(2*np.pi))
+        assert np.isclose(dutch_roll_mode.damping[i,0],-dutch_roll.real/abs(dutch_roll))
+        assert np.isclose(dutch_roll_mode.mode_real[i,0],dutch_roll.real/(2*np.pi))
+        assert np.isclose(roll_mode.frequency[i,0],abs(roll)/(2*np.pi))
+        assert roll_mode.damping[i,0] == 1.
+        assert np.isclose(roll_mode.time_constant[i,0],1/abs(roll))
+        assert np.isclose(spiral_mode.frequency[i,0],spiral/(2*np.pi))
+        assert spiral_mode.damping[i,0] == -1.
+        assert np.isclose(spiral_mode.time_double_half[i,0],np.log(2)/spiral)
+
+    # the modes are not identified without a complex pair or with non-finite state matrices
+    assert np.allclose(np.sort(LatModes[2].real),[-4.,-3.,-2.,-1.])
+    assert np.all(LatModes[3] == 0)
+    for mode in [dutch_roll_mode,roll_mode,spiral_mode]:
+        for value in mode.values():
+            assert np.all(value[2:] == 0)
+
+    return
+
+def similar(P,pairs,reals=[]):
+    '''Builds a state matrix with the given complex pairs and real eigenvalues'''
+    D = np.zeros((4,4))
+    i = 0
+    for pair in pairs:
+        D[i:i+2,i:i+2] = [[pair.real,pair.imag],[-pair.imag,pair.real]]
+        i += 2
+    for real in reals:
+        D[i,i] = real
+        i += 1
+    return P @ D @ np.linalg.inv(P)
+
+if __name__ == '__main__':
+    main()
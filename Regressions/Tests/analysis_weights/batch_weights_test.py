@@ -0,0 +1,88 @@
+# Regressions/Tests/analysis_weights/batch_weights_test.py
+#
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+import RCAIDE
+
+# python imports
+import numpy as np
+import copy
+import sys
+import os
+
+# local imports
+sys.path.append(os.path.join( os.path.split(os.path.split(sys.path[0])[0])[0], 'Vehicles'))
+from   Boeing_737          import vehicle_setup as transport_setup
+from   Cessna_172          import vehicle_setup as general_aviation_setup
+from   Solar_UAV           import vehicle_setup as uav_setup
+from   Stopped_Rotor_EVTOL import vehicle_setup as EVTOL_setup
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  main
+# ----------------------------------------------------------------------------------------------------------------------
+def main():
+    '''Evaluates the weight breakdown of a transport, a general aviation aircraft and a UAV over a sweep of wing area,
+    aspect ratio and takeoff weight at once, and compares it with the evaluation of each design point'''
+
+    for method in ['RCAIDE', 'FLOPS Simple', 'FLOPS Complex', 'Raymer']:
+        weight_analysis         = RCAIDE.Framework.Analyses.Weights.Weights_Transport()
+        weight_analysis.method  = method
+        batch_test(weight_analysis,transport_setup())
+
+    batch_test(RCAIDE.Framework.Analyses.Weights.Weights_General_Aviation(),general_aviation_setup())
+
+    vehicle           = uav_setup()
+    design_variables  = batch_test(RCAIDE.Framework.Analyses.Weights.Weights_UAV(),vehicle,['reference_area'])
+
+    # the vehicle of the analysis is not changed
+    assert vehicle.reference_area == design_variables['reference_area'][2]
+
+    # the physics based buildup of the EVTOL is evaluated one design point at a time
+    weight_analysis          = RCAIDE.Framework.Analyses.Weights.Weights_EVTOL()
+    weight_analysis.vehicle  = EVTOL_setup(False)
+    try:
+        weight_analysis.evaluate_batch({'mass_properties.max_takeoff': np.array([2000.,2200.])})
+        assert False
+    except NotImplementedError:
+        pass
+
+    return
+
+def batch_test(weight_analysis,vehicle,reference_area = ()):
+    '''Sweeps the main wing of a vehicle with evaluate_batch and checks each design point against evaluate'''
+
+    n_points = 5
+    wing     = vehicle.wings.main_wing
+    S        = wing.areas.reference*np.linspace(0.8,1.2,n_points)
+    AR       = wing.aspect_ratio*np.linspace(0.9,1.1,n_points)[::-1]
+    design_variables = {'wings.main_wing.areas.reference': S,
+                        'wings.main_wing.aspect_ratio'   : AR,
+                        'wings.main_wing.spans.projected': np.sqrt(S*AR),
+                        'mass_properties.max_takeoff'    : vehicle.mass_properties.max_takeoff*np.linspace(0.9,1.1,n_points)}
+    for key in reference_area:
+        design_variables[key] = S
+
+    weight_analysis.vehicle = vehicle
+    weights                 = weight_analysis.evaluate_batch(design_variables)
+    assert weights.shape == (n_points,)
+    print(weight_analysis.method,weights['empty.total'])
+
+    for i in range(n_points):
+        point                   = copy.deepcopy(vehicle)
+        for key, values in design_variables.items():
+            point.deep_set(key,values[i])
+        weight_analysis.vehicle = point
+        results                 = weight_analysis.evaluate()
+        for key in weights.dtype.names:
+            assert np.isclose(weights[key][i],results.deep_get(key),rtol=1e-12,atol=1e-12), key
+
+    # the empty weight grows with the wing area
+    assert np.all(np.diff(weights['empty.total']) > 0)
+
+    return design_variables
+
+if __name__ == '__main__':
+    main()
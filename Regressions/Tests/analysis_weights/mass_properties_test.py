@@ -0,0 +1,84 @@
+# Regressions/Tests/analysis_weights/mass_properties_test.py
+#
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+import RCAIDE
+from   RCAIDE.Library.Methods.Weights.Mass_Properties   import build_mass_properties_model, evaluate_mass_properties
+from   RCAIDE.Library.Methods.Weights.Center_of_Gravity import compute_vehicle_center_of_gravity
+from   RCAIDE.Library.Methods.Weights.Moment_of_Inertia import compute_aircraft_moment_of_inertia
+
+# python imports
+import numpy as np
+import sys
+import os
+
+# local imports
+sys.path.append(os.path.join( os.path.split(os.path.split(sys.path[0])[0])[0], 'Vehicles'))
+from   Lockheed_C5a        import vehicle_setup as transport_setup
+from   Stopped_Rotor_EVTOL import vehicle_setup as EVTOL_setup
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  main
+# ----------------------------------------------------------------------------------------------------------------------
+def main():
+    '''Computes the mass, center of gravity and moment of inertia of a transport over a range of fuel and payload
+    states at once, and of an EVTOL, and compares them with the component by component methods'''
+
+    vehicle                  = transport_setup()
+    weight_analysis          = RCAIDE.Framework.Analyses.Weights.Weights_Transport()
+    weight_analysis.vehicle  = vehicle
+    weight_analysis.method   = 'Raymer'
+    weight_analysis.evaluate()
+    model = build_mass_properties_model(vehicle)
+    assert model.fuel_tanks.tags == ['wing_fuel_tank']
+    assert model.payloads.tags   == ['passengers','baggage','cargo']
+
+    # without fuel, the center of gravity is that of compute_vehicle_center_of_gravity
+    empty   = evaluate_mass_properties(model,fuel_masses = np.zeros((1,1)))
+    CG,mass = compute_vehicle_center_of_gravity(vehicle)
+    assert np.allclose(empty.center_of_gravity,CG,rtol=1e-12,atol=0)
+    assert np.isclose(empty.mass[0,0],mass,rtol=1e-12)
+
+    # burn the fuel and unload the cargo over 50 states
+    fuel      = np.linspace(1.,0.2,50)[:,None]*model.fuel_tanks.masses
+    payload   = np.tile(model.payloads.masses,(50,1))
+    payload[:,2] = np.linspace(1.,0.,50)*model.payloads.masses[2]
+    states    = evaluate_mass_properties(model,fuel_masses = fuel,payload_masses = payload)
+    print(states.center_of_gravity[[0,-1]])
+    print(states.moment_of_inertia[0])
+    assert states.center_of_gravity.shape == (50,3) and states.moment_of_inertia.shape == (50,3,3)
+    assert np.allclose(states.mass[:,0],mass + fuel[:,0] - (model.payloads.masses[2] - payload[:,2]),rtol=1e-12)
+
+    # each state is the same as moving the masses in the vehicle and calling the scalar methods
+    fuel_tank = vehicle.networks.fuel.fuel_lines.fuel_line.fuel_tanks.wing_fuel_tank
+    cargo     = vehicle.payload.cargo
+    for i in [0,17,49]:
+        fuel_tank.fuel.mass_properties.mass = fuel[i,0]
+        cargo.mass_properties.mass          = payload[i,2]
+        CG,mass   = compute_vehicle_center_of_gravity(vehicle)
+        fuel_cg   = np.array(fuel_tank.origin) + np.array(fuel_tank.fuel.mass_properties.center_of_gravity)
+        CG        = (CG*mass + fuel[i,0]*fuel_cg)/(mass + fuel[i,0])
+        I,_       = compute_aircraft_moment_of_inertia(vehicle,CG,update_MOI=False)
+        assert np.allclose(states.center_of_gravity[i],CG[0],rtol=1e-12,atol=0)
+        assert np.allclose(states.moment_of_inertia[i],I,rtol=0,atol=1e-10*np.max(np.abs(I)))
+
+    # an EVTOL has neither fuel nor payload inertia, only its battery modules and motors are added to its structure
+    vehicle                  = EVTOL_setup(False)
+    weight_analysis          = RCAIDE.Framework.Analyses.Weights.Weights_EVTOL()
+    weight_analysis.vehicle  = vehicle
+    weight_analysis.evaluate()
+    model   = build_mass_properties_model(vehicle)
+    single  = evaluate_mass_properties(model)
+    CG,mass = compute_vehicle_center_of_gravity(vehicle)
+    I,_     = compute_aircraft_moment_of_inertia(vehicle,CG,update_MOI=False)
+    assert len(model.fuel_tanks.tags) == 0
+    assert np.allclose(single.center_of_gravity,CG,rtol=1e-12,atol=0)
+    assert np.allclose(single.moment_of_inertia[0],I,rtol=0,atol=1e-10*np.max(np.abs(I)))
+
+    return
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+# geodesic_batch_test.py
+# 
+
+""" Checks the batch geodesic solvers against the per-pair geodesic calculation and reports the speed-up
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+from RCAIDE.Framework.Analyses.Geodesics import Calculate_Distance, Calculate_Distances
+from RCAIDE.Library.Methods.Geodesics    import compute_geodesic_inverse, compute_geodesic_direct
+
+import numpy as np
+import time 
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+
+    # random coordinate pairs over the whole globe plus nearly antipodal, equatorial and meridional pairs 
+    np.random.seed(0)
+    n_pairs = 2000
+    coords1 = np.stack((np.random.uniform(-90,90,n_pairs),np.random.uniform(-180,180,n_pairs)),axis=1)
+    coords2 = np.stack((np.random.uniform(-90,90,n_pairs),np.random.uniform(-180,180,n_pairs)),axis=1)
+    coords1[:4] = [[0,0],[0,0],[30,0],[88.202499451857,0]]
+    coords2[:4] = [[0,179.5],[0,90],[-20,0],[-88.202499451857,179.981022032992859592]]
+
+    # per-pair path 
+    ti            = time.time()
+    distance_pair = np.array([Calculate_Distance(c1,c2) for c1,c2 in zip(coords1,coords2)])
+    pair_time     = time.time() - ti 
+    
+    # batch path 
+    ti             = time.time()
+    distance_batch = Calculate_Distances(coords1,coords2)
+    batch_time     = time.time() - ti
+    
+    print('Per-pair time  : %.4f s' % pair_time)
+    print('Batch time     : %.4f s' % batch_time)
+    print('Speed-up       : %.1f' % (pair_time/batch_time))
+    
+    # distances agree to within a micrometer 
+    distance_error = np.max(np.abs(distance_batch - distance_pair))
+    print('Max distance difference [km] = %.4e' % distance_error)
+    assert distance_error < 1e-9
+    
+    # the direct problem returns to the second point 
+    inverse   = compute_geodesic_inverse(coords1[:,0],coords1[:,1],coords2[:,0],coords2[:,1])
+    direct    = compute_geodesic_direct(coords1[:,0],coords1[:,1],inverse.initial_azimuth,inverse.distance)
+    lat_error = np.max(np.abs(direct.latitude - coords2[:,0]))
+    lon_error = np.max(np.abs(np.mod(direct.longitude - coords2[:,1] + 180,360) - 180)*np.cos(np.radians(coords2[:,0])))
+    print('Max direct latitude difference  [deg] = %.4e' % lat_error)
+    print('Max direct longitude difference [deg] = %.4e' % lon_error)
+    assert lat_error < 1e-9
+    assert lon_error < 1e-9
+    
+    return 
+
+if __name__ == '__main__':
+    main()
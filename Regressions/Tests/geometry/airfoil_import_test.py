@@ -14,6 +14,8 @@ from RCAIDE.Library.Plots import *
 
 import os
 import sys
+import shutil
+import tempfile
 import numpy as np
 import matplotlib.pyplot as plt
 
@@ -50,6 +52,15 @@ def main():
     airfoil_polar_data_1 = compute_airfoil_properties(airfoil_geometry_1,airfoil_polar_files) 
     plot_airfoil_polar_files(airfoil_polar_data_1) 
 
+    # properties loaded from the on-disk cache match a fresh computation 
+    cache_directory      = tempfile.mkdtemp()
+    airfoil_polar_data_2 = compute_airfoil_properties(airfoil_geometry_1,airfoil_polar_files,cache_directory=cache_directory) 
+    airfoil_polar_data_3 = compute_airfoil_properties(airfoil_geometry_1,airfoil_polar_files,cache_directory=cache_directory) 
+    shutil.rmtree(cache_directory)
+    assert(np.array_equal(airfoil_polar_data_1.lift_coefficients,airfoil_polar_data_3.lift_coefficients))
+    assert(np.array_equal(airfoil_polar_data_1.drag_coefficients,airfoil_polar_data_3.drag_coefficients))
+    assert(np.array_equal(airfoil_polar_data_2.lift_distribution_func((0.1,2E5)),airfoil_polar_data_3.lift_distribution_func((0.1,2E5))))
+
     # ----------------------------------------------------------------------------------------------------------------
     #  
     # ----------------------------------------------------------------------------------------------------------------
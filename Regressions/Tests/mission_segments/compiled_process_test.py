@@ -0,0 +1,128 @@
+# Regressions/Tests/mission_segments/compiled_process_test.py
+#
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+import RCAIDE
+from   RCAIDE.Framework.Core     import Units
+from   RCAIDE.Framework.Analyses import Process
+
+# python imports
+import numpy as np
+import sys
+import os
+
+# local imports
+sys.path.append(os.path.join( os.path.split(os.path.split(sys.path[0])[0])[0], 'Vehicles'))
+from   ATR_72    import vehicle_setup as vehicle_setup
+from   ATR_72    import configs_setup as configs_setup
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  main
+# ----------------------------------------------------------------------------------------------------------------------
+def main():
+    '''Checks the order of the steps of a compiled process, then runs the same mission with the processes and with
+    profiled execution plans of their iterate steps'''
+
+    # the plan runs the steps of the nested processes in order
+    calls                  = []
+    process                = Process()
+    process.first          = lambda x: calls.append('first')
+    process.nested         = Process()
+    process.nested.second  = lambda x: calls.append('second')
+    process.nested.third   = lambda x: calls.append('third')
+    process.fourth         = lambda x: calls.append('fourth')
+    plan                   = process.compile()
+    assert plan(None) is None
+    assert [tag for tag,step in plan.steps] == ['first','nested.second','nested.third','fourth']
+    assert calls == ['first','second','third','fourth']
+    assert plan.nested is process.nested
+
+    vehicle  = vehicle_setup()
+    configs  = configs_setup(vehicle)
+    analyses = analyses_setup(configs)
+
+    results           = mission_setup(analyses,compile = False).evaluate()
+    compiled_mission  = mission_setup(analyses,compile = True)
+    compiled_results  = compiled_mission.evaluate()
+
+    # the plans compute the same results
+    conditions          = results.segments.cruise.conditions
+    compiled_conditions = compiled_results.segments.cruise.conditions
+    assert np.all(conditions.energy['starboard_propulsor'].throttle == compiled_conditions.energy['starboard_propulsor'].throttle)
+    assert np.all(conditions.frames.body.inertial_rotations == compiled_conditions.frames.body.inertial_rotations)
+
+    # and record the time spent in each step
+    report = compiled_mission.segments.cruise.process.iterate.profiling_report()
+    for tag in list(report.keys())[:5]:
+        print(tag,report[tag].calls,report[tag].total_time,report[tag].fraction)
+    assert 'conditions.aerodynamics' in report
+    assert report['conditions.aerodynamics'].calls > 1
+    assert all([report[tag].calls == report['conditions.aerodynamics'].calls for tag in report.keys()])
+    assert np.isclose(np.sum([report[tag].fraction for tag in report.keys()]),1.0)
+
+    return
+
+def analyses_setup(configs):
+
+    analyses = RCAIDE.Framework.Analyses.Analysis.Container()
+    for tag,config in list(configs.items()):
+        analyses[tag] = base_analysis(config)
+
+    return analyses
+
+def base_analysis(vehicle):
+
+    analyses = RCAIDE.Framework.Analyses.Vehicle()
+
+    weights         = RCAIDE.Framework.Analyses.Weights.Weights_Transport()
+    weights.vehicle = vehicle
+    analyses.append(weights)
+
+    aerodynamics          = RCAIDE.Framework.Analyses.Aerodynamics.Vortex_Lattice_Method()
+    aerodynamics.vehicle  = vehicle
+    analyses.append(aerodynamics)
+
+    energy          = RCAIDE.Framework.Analyses.Energy.Energy()
+    energy.vehicle  = vehicle
+    analyses.append(energy)
+
+    planet = RCAIDE.Framework.Analyses.Planets.Earth()
+    analyses.append(planet)
+
+    atmosphere = RCAIDE.Framework.Analyses.Atmospheric.US_Standard_1976()
+    atmosphere.features.planet = planet.features
+    analyses.append(atmosphere)
+
+    return analyses
+
+def mission_setup(analyses,compile):
+
+    mission      = RCAIDE.Framework.Mission.Sequential_Segments()
+    mission.tag  = 'the_mission'
+    Segments     = RCAIDE.Framework.Mission.Segments
+    base_segment = Segments.Segment()
+
+    segment = Segments.Cruise.Constant_Speed_Constant_Altitude(base_segment)
+    segment.tag = "cruise"
+    segment.analyses.extend( analyses.base )
+    segment.altitude                                                = 5000.0 * Units.feet
+    segment.air_speed                                               = 150 * Units.knots
+    segment.distance                                                = 20 * Units.nmi
+    segment.flight_dynamics.force_x                                 = True
+    segment.flight_dynamics.force_z                                 = True
+    segment.assigned_control_variables.throttle.active              = True
+    segment.assigned_control_variables.throttle.assigned_propulsors = [['starboard_propulsor','port_propulsor']]
+    segment.assigned_control_variables.body_angle.active            = True
+    mission.append_segment(segment)
+
+    if compile:
+        for segment in mission.segments:
+            segment.process.iterate = segment.process.iterate.compile(profile = True)
+
+    return mission
+
+if __name__ == '__main__':
+    main()
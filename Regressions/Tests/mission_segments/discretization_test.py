@@ -0,0 +1,73 @@
+# Regressions/Tests/mission_segments/discretization_test.py
+#
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+import RCAIDE
+from RCAIDE.Library.Methods.Utilities.Chebyshev import chebyshev_data, linear_data, finite_difference_data
+from RCAIDE.Library.Mission.Common.Initialize   import differentials_dimensionless
+from RCAIDE.Library.Mission.Common.Update       import differentials_time
+
+# python imports
+import numpy as np
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  main
+# ----------------------------------------------------------------------------------------------------------------------
+def main():
+    '''Checks the differentiation and integration operators of the segment discretization methods, their reuse
+    between segments and the rescaling of the operators to the segment duration'''
+
+    # the operators differentiate and integrate f = x^2 + 1
+    for discretization_method, integration_tolerance in [(chebyshev_data,1E-12),(linear_data,1E-2),(finite_difference_data,1E-3)]:
+        x, D, I = discretization_method(21)
+        f       = x**2 + 1.
+        print(discretization_method.__name__,np.max(np.abs(np.dot(D,f) - 2*x)),np.max(np.abs(np.dot(I,f) - (x**3/3 + x))))
+        assert np.max(np.abs(np.dot(D,f) - 2*x)) < 1E-9
+        assert np.max(np.abs(np.dot(I,f) - (x**3/3 + x))) < integration_tolerance
+
+        # the operators are computed once and shared
+        x_2, D_2, I_2 = discretization_method(21)
+        assert D_2 is D and I_2 is I
+        assert discretization_method(21,integration = False)[2] is None
+        assert not D.flags.writeable
+
+    # the finite difference operators converge at second order
+    errors = []
+    for N in [101,201]:
+        x, D, I = finite_difference_data(N)
+        f       = np.sin(3*x)
+        errors.append(np.max(np.abs(np.dot(I,f) - (1 - np.cos(3*x))/3)))
+    assert 3.9 < errors[0]/errors[1] < 4.1
+
+    # the time operators are rescaled when the segment duration changes
+    segment                                          = RCAIDE.Framework.Mission.Segments.Segment()
+    segment.state.conditions                         = RCAIDE.Framework.Mission.Common.Results()
+    segment.state.numerics.number_of_control_points  = 8
+    segment.state.numerics.discretization_method     = finite_difference_data
+    differentials_dimensionless(segment)
+    segment.state.conditions.frames.inertial.time    = 100. * segment.state.numerics.dimensionless.control_points
+    differentials_time(segment)
+    D_time = segment.state.numerics.time.differentiate
+    assert np.allclose(D_time,segment.state.numerics.dimensionless.differentiate/100.)
+
+    differentials_time(segment)
+    assert segment.state.numerics.time.differentiate is D_time
+
+    segment.state.conditions.frames.inertial.time    = 50. * segment.state.numerics.dimensionless.control_points
+    differentials_time(segment)
+    assert np.allclose(segment.state.numerics.time.integrate,segment.state.numerics.dimensionless.integrate*50.)
+
+    # and after the segment is initialized again
+    segment.state.numerics.number_of_control_points  = 10
+    differentials_dimensionless(segment)
+    segment.state.conditions.frames.inertial.time    = 50. * segment.state.numerics.dimensionless.control_points
+    differentials_time(segment)
+    assert segment.state.numerics.time.differentiate.shape == (10,10)
+
+    return
+
+if __name__ == '__main__':
+    main()
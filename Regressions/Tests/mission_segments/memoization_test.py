@@ -0,0 +1,133 @@
+# Regressions/Tests/mission_segments/memoization_test.py
+#
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+import RCAIDE
+from   RCAIDE.Framework.Core import Units
+
+# python imports
+import numpy as np
+import sys
+import os
+
+# local imports
+sys.path.append(os.path.join( os.path.split(os.path.split(sys.path[0])[0])[0], 'Vehicles'))
+from   ATR_72    import vehicle_setup as vehicle_setup
+from   ATR_72    import configs_setup as configs_setup
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  main
+# ----------------------------------------------------------------------------------------------------------------------
+def main():
+    '''Runs the same constant throttle climb and cruise mission with and without memoized atmosphere and gravity
+    updates, and checks that the skipped updates do not change the results'''
+
+    vehicle  = vehicle_setup()
+    configs  = configs_setup(vehicle)
+    analyses = analyses_setup(configs)
+
+    results            = mission_setup(analyses,memoize = False).evaluate()
+    memoized_mission   = mission_setup(analyses,memoize = True)
+    memoized_results   = memoized_mission.evaluate()
+
+    for tag in results.segments.keys():
+        conditions          = results.segments[tag].conditions
+        memoized_conditions = memoized_results.segments[tag].conditions
+        assert np.allclose(conditions.energy['starboard_propulsor'].throttle,memoized_conditions.energy['starboard_propulsor'].throttle,rtol=1E-9,atol=0)
+        assert np.allclose(conditions.freestream.density,memoized_conditions.freestream.density,rtol=1E-12,atol=0)
+        assert np.allclose(conditions.freestream.gravity,memoized_conditions.freestream.gravity,rtol=1E-12,atol=0)
+
+    # the altitude is fixed in the cruise: the atmosphere and gravity are only computed once
+    report = memoized_mission.segments.cruise.process.iterate.memoization_report()
+    print(report)
+    assert report.conditions.atmosphere.calls > 1
+    assert report.conditions.atmosphere.skips == report.conditions.atmosphere.calls - 1
+    assert report.conditions.gravity.skips    == report.conditions.gravity.calls - 1
+
+    # while it changes in the constant throttle climb
+    report = memoized_mission.segments.climb.process.iterate.memoization_report()
+    print(report)
+    assert report.conditions.atmosphere.skips < report.conditions.atmosphere.calls - 1
+
+    return
+
+def analyses_setup(configs):
+
+    analyses = RCAIDE.Framework.Analyses.Analysis.Container()
+    for tag,config in list(configs.items()):
+        analyses[tag] = base_analysis(config)
+
+    return analyses
+
+def base_analysis(vehicle):
+
+    analyses = RCAIDE.Framework.Analyses.Vehicle()
+
+    weights         = RCAIDE.Framework.Analyses.Weights.Weights_Transport()
+    weights.vehicle = vehicle
+    analyses.append(weights)
+
+    aerodynamics          = RCAIDE.Framework.Analyses.Aerodynamics.Vortex_Lattice_Method()
+    aerodynamics.vehicle  = vehicle
+    analyses.append(aerodynamics)
+
+    energy          = RCAIDE.Framework.Analyses.Energy.Energy()
+    energy.vehicle  = vehicle
+    analyses.append(energy)
+
+    planet = RCAIDE.Framework.Analyses.Planets.Earth()
+    analyses.append(planet)
+
+    atmosphere = RCAIDE.Framework.Analyses.Atmospheric.US_Standard_1976()
+    atmosphere.features.planet = planet.features
+    analyses.append(atmosphere)
+
+    return analyses
+
+def mission_setup(analyses,memoize):
+
+    mission      = RCAIDE.Framework.Mission.Sequential_Segments()
+    mission.tag  = 'the_mission'
+    Segments     = RCAIDE.Framework.Mission.Segments
+    base_segment = Segments.Segment()
+
+    segment = Segments.Climb.Constant_Throttle_Constant_Speed(base_segment)
+    segment.tag = "climb"
+    segment.analyses.extend( analyses.base )
+    segment.altitude_start                                          = 3000.0 * Units.feet
+    segment.altitude_end                                            = 5000.0 * Units.feet
+    segment.air_speed                                               = 130 * Units.knots
+    segment.throttle                                                = 0.9
+    segment.flight_dynamics.force_x                                 = True
+    segment.flight_dynamics.force_z                                 = True
+    segment.assigned_control_variables.wind_angle.active            = True
+    segment.assigned_control_variables.wind_angle.initial_guess     = True
+    segment.assigned_control_variables.wind_angle.initial_guess_values = [[ 1.0 * Units.deg]]
+    segment.assigned_control_variables.body_angle.active            = True
+    mission.append_segment(segment)
+
+    segment = Segments.Cruise.Constant_Speed_Constant_Altitude(base_segment)
+    segment.tag = "cruise"
+    segment.analyses.extend( analyses.base )
+    segment.altitude                                                = 5000.0 * Units.feet
+    segment.air_speed                                               = 150 * Units.knots
+    segment.distance                                                = 20 * Units.nmi
+    segment.flight_dynamics.force_x                                 = True
+    segment.flight_dynamics.force_z                                 = True
+    segment.assigned_control_variables.throttle.active              = True
+    segment.assigned_control_variables.throttle.assigned_propulsors = [['starboard_propulsor','port_propulsor']]
+    segment.assigned_control_variables.body_angle.active            = True
+    mission.append_segment(segment)
+
+    if memoize:
+        for segment in mission.segments:
+            segment.process.iterate.conditions.memoize('atmosphere')
+            segment.process.iterate.conditions.memoize('gravity')
+
+    return mission
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,162 @@
+# Regressions/Tests/mission_segments/mission_profiler_test.py
+#
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+import RCAIDE
+from   RCAIDE.Framework.Core import Units
+
+# python imports
+import numpy as np
+import json
+import sys
+import os
+
+# local imports
+sys.path.append(os.path.join( os.path.split(os.path.split(sys.path[0])[0])[0], 'Vehicles'))
+from   ATR_72    import vehicle_setup as vehicle_setup
+from   ATR_72    import configs_setup as configs_setup
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  main
+# ----------------------------------------------------------------------------------------------------------------------
+def main():
+    '''Profiles a climb, cruise and untrimmed mission and checks the timings, solver evaluations and convergence of
+    the report'''
+
+    vehicle  = vehicle_setup()
+    configs  = configs_setup(vehicle)
+    analyses = analyses_setup(configs)
+    mission  = mission_setup(analyses)
+    evaluate = RCAIDE.Framework.Analyses.Aerodynamics.Vortex_Lattice_Method.evaluate
+
+    profiler = RCAIDE.Framework.Mission.Mission_Profiler()
+    results  = profiler.evaluate(mission)
+    report   = profiler.report
+
+    # the untrimmed segment has no solve, its convergence is unknown and does not count for the mission
+    assert report.mission.converged
+    assert list(report.segments.keys()) == ['climb','cruise','untrimmed']
+    assert report.segments.untrimmed.converged is None
+    assert report.segments.untrimmed.number_of_function_evaluations == 0
+    for tag in ['climb','cruise']:
+        segment_report = report.segments[tag]
+        print(tag,segment_report.wall_time,segment_report.number_of_function_evaluations,segment_report.iterations)
+        assert segment_report.converged
+        assert segment_report.number_of_function_evaluations > 0
+        assert segment_report.iterations >= segment_report.number_of_function_evaluations
+        assert segment_report.number_of_function_evaluations == results.segments[tag].state.numerics.number_of_function_evaluations
+        assert 0. < segment_report.wall_time < report.mission.wall_time
+        assert segment_report.stages.converge.total_time < segment_report.wall_time
+
+        # the aerodynamics are evaluated once per iteration
+        assert segment_report.analyses.aerodynamics.evaluate.calls == segment_report.iterations
+        assert segment_report.iterate['conditions.aerodynamics'].calls == segment_report.iterations
+
+    # the surrogates of the aerodynamics are built in the pre-processing of the mission
+    assert report.mission.analyses.aerodynamics.initialize.calls == 1
+    assert report.analyses.aerodynamics.evaluate.calls == np.sum([report.segments[tag].analyses.aerodynamics.evaluate.calls for tag in report.segments.keys()])
+
+    # the mission is restored, and the classes of the analyses are not modified
+    for segment in mission.segments:
+        assert type(segment.process.iterate) == RCAIDE.Framework.Analyses.Process
+        assert 'evaluate' not in vars(segment.analyses.aerodynamics)
+        assert 'initialize' not in vars(segment.analyses.aerodynamics)
+    assert RCAIDE.Framework.Analyses.Aerodynamics.Vortex_Lattice_Method.evaluate is evaluate
+
+    # the report is written as JSON
+    profiler.save('mission_profile.json')
+    with open('mission_profile.json') as f:
+        saved_report = json.load(f)
+    assert saved_report['segments']['cruise']['number_of_function_evaluations'] == report.segments.cruise.number_of_function_evaluations
+    os.remove('mission_profile.json')
+
+    return
+
+def analyses_setup(configs):
+
+    analyses = RCAIDE.Framework.Analyses.Analysis.Container()
+    for tag,config in list(configs.items()):
+        analyses[tag] = base_analysis(config)
+
+    return analyses
+
+def base_analysis(vehicle):
+
+    analyses = RCAIDE.Framework.Analyses.Vehicle()
+
+    weights         = RCAIDE.Framework.Analyses.Weights.Weights_Transport()
+    weights.vehicle = vehicle
+    analyses.append(weights)
+
+    aerodynamics          = RCAIDE.Framework.Analyses.Aerodynamics.Vortex_Lattice_Method()
+    aerodynamics.vehicle  = vehicle
+    analyses.append(aerodynamics)
+
+    energy          = RCAIDE.Framework.Analyses.Energy.Energy()
+    energy.vehicle  = vehicle
+    analyses.append(energy)
+
+    planet = RCAIDE.Framework.Analyses.Planets.Earth()
+    analyses.append(planet)
+
+    atmosphere = RCAIDE.Framework.Analyses.Atmospheric.US_Standard_1976()
+    atmosphere.features.planet = planet.features
+    analyses.append(atmosphere)
+
+    return analyses
+
+def mission_setup(analyses):
+
+    mission      = RCAIDE.Framework.Mission.Sequential_Segments()
+    mission.tag  = 'the_mission'
+    Segments     = RCAIDE.Framework.Mission.Segments
+    base_segment = Segments.Segment()
+
+    segment = Segments.Climb.Constant_Throttle_Constant_Speed(base_segment)
+    segment.tag = "climb"
+    segment.analyses.extend( analyses.base )
+    segment.altitude_start                                          = 3000.0 * Units.feet
+    segment.altitude_end                                            = 5000.0 * Units.feet
+    segment.air_speed                                               = 130 * Units.knots
+    segment.throttle                                                = 0.9
+    segment.flight_dynamics.force_x                                 = True
+    segment.flight_dynamics.force_z                                 = True
+    segment.assigned_control_variables.wind_angle.active            = True
+    segment.assigned_control_variables.wind_angle.initial_guess     = True
+    segment.assigned_control_variables.wind_angle.initial_guess_values = [[ 1.0 * Units.deg]]
+    segment.assigned_control_variables.body_angle.active            = True
+    mission.append_segment(segment)
+
+    segment = Segments.Cruise.Constant_Speed_Constant_Altitude(base_segment)
+    segment.tag = "cruise"
+    segment.analyses.extend( analyses.base )
+    segment.altitude                                                = 5000.0 * Units.feet
+    segment.air_speed                                               = 150 * Units.knots
+    segment.distance                                                = 20 * Units.nmi
+    segment.flight_dynamics.force_x                                 = True
+    segment.flight_dynamics.force_z                                 = True
+    segment.assigned_control_variables.throttle.active              = True
+    segment.assigned_control_variables.throttle.assigned_propulsors = [['starboard_propulsor','port_propulsor']]
+    segment.assigned_control_variables.body_angle.active            = True
+    mission.append_segment(segment)
+
+    segment = Segments.Untrimmed.Untrimmed()
+    segment.tag = "untrimmed"
+    segment.analyses.extend( analyses.base )
+    segment.angle_of_attack                                         = 2.0 * Units.degrees
+    segment.altitude                                                = 5000.0 * Units.feet
+    segment.air_speed                                               = 150 * Units.knots
+    segment.flight_dynamics.force_x                                 = True
+    segment.flight_dynamics.force_z                                 = True
+    segment.assigned_control_variables.throttle.active              = True
+    segment.assigned_control_variables.throttle.initial_guess_values = [[0.5]]
+    segment.assigned_control_variables.throttle.assigned_propulsors = [['starboard_propulsor','port_propulsor']]
+    mission.append_segment(segment)
+
+    return mission
+
+if __name__ == '__main__':
+    main()
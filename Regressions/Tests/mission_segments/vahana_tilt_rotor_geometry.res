@@ -1 +1 @@
-{"tag": "prop_rotor", "mass_properties": {"mass": 0.0, "volume": 0.0, "center_of_gravity": [[0.0, 0.0, 0.0]], "moments_of_inertia": {"center": [0.0, 0.0, 0.0], "tensor": [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]}}, "origin": [[0.0, 0.0, 0.0]], "number_of_blades": 3, "tip_radius": 0.8875, "hub_radius": 0.08875, "twist_distribution": [0.35621958995198943, 0.3455794307693645, 0.33399357946023, 0.3220512159981807, 0.30914886727676516, 0.29593533646484155, 0.2821568575335416, 0.26778756417611255, 0.25307875543603836, 0.23767159070712401, 0.2217661756623288, 0.20540797902215438, 0.1883387989929319, 0.17055826544447006, 0.15209048444800655, 0.13278816452261064, 0.1124459767942196, 0.09076298968724342, 0.0672727927112122, 0.04093178665538544], "sweep_distribution": 0.0, "chord_distribution": [0.0676931665774464, 0.06941792330868501, 0.0707342973409273, 0.07189442532866676, 0.07257595475307585, 0.07309829639848583, 0.07333163414837467, 0.07327749222049124, 0.07306372022568607, 0.0725462927900869, 0.07184673710166795, 0.07099237523817871, 0.06993417048650047, 0.06873005256785192, 0.0674241617873851, 0.0660379185641989, 0.06461255076437622, 0.06321287543174627, 0.06193172856710904, 0.06092427065492826], "thickness_to_chord": [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0], "max_thickness_distribution": [0.00814452120871081, 0.008352035770189751, 0.008510415659420189, 0.00864999676455512, 0.008731995157186227, 0.008794840830159249, 0.008822914923141563, 0.00881640082279404, 0.008790680788800251, 0.008728426370278037, 0.008644259142933397, 0.008541466369764177, 0.008414148185685113, 0.008269274420398895, 0.008112155826373549, 0.007945369606988249, 0.007773876103835494, 0.007605473796656203, 0.007451332273396636, 0.007330119708709587], "radius_distribution": [0.08875, 0.1286875, 0.168625, 0.2085625, 0.2485, 0.28843749999999996, 0.328375, 0.3683125, 0.40824999999999995, 0.44818749999999996, 0.4881249999999999, 0.5280625, 0.568, 0.6079374999999999, 0.647875, 0.6878124999999999, 0.7277499999999999, 0.7676875, 0.8076249999999999, 0.8475624999999999], "mid_chord_alignment": [0.0, 0.0004311891828096548, 0.0007602826908702266, 0.0010503146878050908, 0.0012206970439073636, 0.0013512824552598598, 0.0014096168927320678, 0.0013960814107612102, 0.0013426384120599176, 0.0012132815531601254, 0.0010383926310553876, 0.0008248021651830785, 0.0005602509772635184, 0.0002592214976013807, -6.725119751532435e-05, -0.0004138120033118746, -0.0007701539532675439, -0.0011200727864250325, -0.0014403595025843392, -0.0016922239806295338], "blade_solidity": 0.06386323120388372, "flap_angle": 0.0, "number_azimuthal_stations": 16, "vtk_airfoil_points": 40, "Airfoils": {"airfoil": {"tag": "Airfoil", "mass_properties": {"mass": 0.0, "volume": 0.0, "center_of_gravity": [[0.0, 0.0, 0.0]], "moments_of_inertia": {"center": [0.0, 0.0, 0.0], "tensor": [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]}}, "origin": [[0.0, 0.0, 0.0]], "coordinate_file": "/Users/matthewclarke/Documents/LEADS/CODES/RCAIDE/Regressions/Vehicles/Airfoils/NACA_4412.txt", "geometry": {"thickness_to_chord": 0.12031526401402463, "max_thickness": 0.12031526401402463, "x_coordinates": [1.0, 0.9814986041918321, 0.9627179125828096, 0.9439399294906926, 0.925166127050739, 0.9063979951973198, 0.8876370570644889, 0.8688849585974798, 0.8501434433355801, 0.8314143048152758, 0.8126993946862192, 0.7940006322429313, 0.7753200050008656, 0.756659574822571, 0.7380215049082569, 0.7194080751470893, 0.7008216977172956, 0.6822649200925803, 0.6637403963528624, 0.645250955842517, 0.626799645772505, 0.6083897600856984, 0.5900248658119063, 0.571708729724946, 0.5534453814827941, 0.535239264316922, 0.5170952982448289, 0.49901895013235004, 0.48101643938803296, 0.46309510629202194, 0.4452631963781565, 0.4275299115395387, 0.4099055688962534, 0.39240178150249916, 0.3750314325460706, 0.357808928370942, 0.34075082080467095, 0.32387621751014195, 0.30720724855378506, 0.2907696368921567, 0.2745936850479651, 0.25871484137809875, 0.2431740309303782, 0.22801724442061427, 0.21329603594425958, 0.1990687049367147, 0.1853997496370617, 0.17235801737867823, 0.16001078976617483, 0.1484169477183293, 0.1376194134058754, 0.12763845294525444, 0.11846796489977444, 0.11007670049089632, 0.1024137182167369, 0.0954160659771718, 0.08901711107700098, 0.08315099268701516, 0.07775548663074952, 0.07277400767035845, 0.06815571418013859, 0.06385579097428683, 0.05983566008186675, 0.05606222004199868, 0.05250706653476362, 0.0491458183572621, 0.04595930785055342, 0.042933270255651794, 0.04005493749787476, 0.037312709084026195, 0.034696070445075014, 0.03219550170016633, 0.0298023853906419, 0.02750891790918816, 0.025308027034296163, 0.023192935808851622, 0.02115608201712639, 0.019190358145905088, 0.017289413487845455, 0.015447549057252933, 0.013659629176746041, 0.011921538211868638, 0.010241509544193898, 0.008638453084516204, 0.007129684138173528, 0.005730775074766114, 0.00445590503966137, 0.0033181570291437672, 0.0023297725998544455, 0.0015023725325003807, 0.000847150244475165, 0.0003750435511636885, 9.509610563002236e-05, 0.0, 7.452001018022221e-05, 0.00030452347237569575, 0.000676914321409992, 0.0011794915261896218, 0.0018008204127729721, 0.0025301145243810616, 0.0033571259261699605, 0.004272042061421051, 0.005265387412293136, 0.006327928317567679, 0.0074505793552065115, 0.008624309710555625, 0.009840047921614168, 0.011088583319122047, 0.01236046235776236, 0.01364655057113249, 0.014945039096245016, 0.016259016038259397, 0.017591824949329357, 0.01894702157978385, 0.020328411630572713, 0.021740093543628998, 0.0231865073605088, 0.024672490890805244, 0.026203221053714757, 0.027782487236306667, 0.029412931963032407, 0.03109738619483352, 0.03283892449750685, 0.03464088602719837, 0.036506897406641925, 0.038440897432663844, 0.04044716342366599, 0.042530338808020283, 0.04469546123204342, 0.046947989971229266, 0.049293830672406766, 0.05173948490954553, 0.05429411634253652, 0.05696980059975158, 0.05978044316179767, 0.06274208283139807, 0.06587331118102385, 0.0691957837270325, 0.07273484085473012, 0.07652023982094654, 0.08058583014904505, 0.08496906148422065, 0.089712805806937, 0.09486582584922006, 0.10048259915310902, 0.10662336682668508, 0.11335580363417899, 0.12074993170533967, 0.1288720199331354, 0.13777743006425117, 0.14750304006375375, 0.15806139200497055, 0.16943786265293181, 0.1815934222119159, 0.19447112364529714, 0.208003472982633, 0.22212174784617358, 0.23676094425459845, 0.2518603787802792, 0.26736486724739394, 0.2832251009720127, 0.299397256762339, 0.3158426761256465, 0.3325281696925176, 0.34942470654161184, 0.36650653142338824, 0.3837506629710889, 0.4011364641352233, 0.41864598663077307, 0.43626545690558494, 0.45398318187240944, 0.47178880195424955, 0.48967309748227106, 0.5076278171140842, 0.5256451983061614, 0.5437177470751237, 0.561838553623006, 0.5800012410127093, 0.5981998972115157, 0.6164291550142874, 0.6346847885225873, 0.6529631737513845, 0.67126097844783, 0.6895751277335864, 0.7079027582787132, 0.7262406360647307, 0.7445849862001512, 0.7629321371831269, 0.7812785489577723, 0.7996207982694651, 0.8179555977495703, 0.8362798957017255, 0.8545907625570829, 0.8728853412047842, 0.8911608379734586, 0.9094145277711615, 0.9276440415599844, 0.9458473593930258, 0.9640225088883382, 0.9821675448872287, 1.0], "y_coordinates": [-0.003899557014304108, -0.003965450288149787, -0.004089785075419923, -0.004262840238633295, -0.004474885763102654, -0.004716190465313486, -0.004977700900684799, -0.005257969835374713, -0.0055603467171377674, -0.005888236905053348, -0.006245022025924555, -0.006634032213701064, -0.00705716068060325, -0.007514113484612934, -0.008004396547600223, -0.008527499531081744, -0.009082894725243514, -0.009669764011902459, -0.01028608853516519, -0.010929521393664241, -0.011597713534716756, -0.01228831450580067, -0.012998847135051207, -0.013724612801888237, -0.014459054164914338, -0.015195633371582015, -0.015927906504120987, -0.01664953818435914, -0.017357279349697073, -0.018057496381499314, -0.018758272413468363, -0.01946739513737556, -0.020192310484602672, -0.020939850435522333, -0.021710094131471416, -0.022495834932805332, -0.023289617373986875, -0.024084157926099147, -0.02487237392941989, -0.02564801501660149, -0.02641447208591279, -0.02718183482954174, -0.02795774059718128, -0.028722689603506327, -0.02943236145279451, -0.03004843386043372, -0.030548243258206785, -0.03093703612204972, -0.031225993980944448, -0.03142733957182306, -0.03154849251401395, -0.031587316973441436, -0.03154672379907596, -0.0314345385791228, -0.0312609850909314, -0.03103682859636295, -0.030772791208272705, -0.03047826324983898, -0.030160740466022865, -0.029825794211040025, -0.029472391463777222, -0.029095957464163383, -0.0286941177384919, -0.028266015948487398, -0.02781170554798779, -0.027331770656851048, -0.02682752646749548, -0.02630091878864877, -0.025753698873117813, -0.02518737604178764, -0.024603239977866776, -0.024002383115249656, -0.023385721771080347, -0.022754015392798553, -0.022107883697649995, -0.021444841874105357, -0.020750950783107774, -0.020011571688111036, -0.019214318300964397, -0.01834859390179029, -0.01740521934856992, -0.016376539237984114, -0.015264905036656874, -0.014081233517464695, -0.012835473433447944, -0.01153638265051692, -0.010191704284991457, -0.008808316041135439, -0.0073923575098291455, -0.005949339296477094, -0.004484237139173562, -0.0030015736162306503, -0.0015055042653778843, 0.0, 0.00151116470561765, 0.003024434321032745, 0.0045364249693986, 0.006043880163895953, 0.007543629436265651, 0.009032549066208179, 0.010507524185682942, 0.011965411576297852, 0.013403002502951716, 0.014816984933787171, 0.01620390448576055, 0.01756012340638186, 0.018881776854469606, 0.020164725674259285, 0.02140450476531517, 0.022596783781377444, 0.023742788438980582, 0.02484746124843818, 0.025915920916832664, 0.02695346335161884, 0.027965628432981678, 0.0289582751167327, 0.029937666890962847, 0.03091057003318596, 0.031884109771249516, 0.03286214476169529, 0.03384574186594778, 0.03483593092172032, 0.03583378635317488, 0.03684043425125774, 0.037857060232974485, 0.038884918212483216, 0.039925340236404636, 0.040979747557494034, 0.04204966314426527, 0.04313672584805332, 0.04424270647095047, 0.04536952940885742, 0.04651934711092833, 0.047694570177395895, 0.04889786622353596, 0.05013219903990042, 0.051400875267589276, 0.052707598222880896, 0.05405652929830145, 0.055452358806650746, 0.05690052720187732, 0.058407487139250445, 0.05998069968882116, 0.06162878880057992, 0.06336173992867573, 0.06518947002390746, 0.06711593127660478, 0.0691400726394503, 0.0712549228235825, 0.07344564670357719, 0.07568824816321433, 0.07795009667946298, 0.08019650393779813, 0.08239384182621884, 0.0845111752483459, 0.08652267855731853, 0.08840124510902292, 0.09011823856487722, 0.09164943724696237, 0.09297546468702177, 0.09408223342067987, 0.09495964933503866, 0.09560153149150259, 0.09600759325468042, 0.09618111755204445, 0.09612770520407414, 0.09585492271456166, 0.09537200736825038, 0.09468927789691249, 0.09381706055586757, 0.09276640938941323, 0.09154922113152997, 0.09017812144285317, 0.08866618545185483, 0.08702022885609838, 0.08523869941268786, 0.08331957523689061, 0.08126090752084213, 0.07906081388457424, 0.07671833927533663, 0.07423750988437107, 0.07162421090488018, 0.06888446791792896, 0.06602443029541259, 0.06305023994699901, 0.059963934729950714, 0.05676235665660661, 0.053442023641031046, 0.049999459621278365, 0.046431197646000455, 0.042734289382326804, 0.03890806393091963, 0.03495251090313596, 0.03086765362385812, 0.026653549191735383, 0.02231031746698798, 0.017838771375195156, 0.013240418157354838, 0.008516831495265543, 0.003669623092761436, -0.001299557014304108], "x_upper_surface": [0.0, 0.002983568463323366, 0.005495398864107563, 0.007633290556781445, 0.009495042895773863, 0.011178455235513671, 0.012781326930429715, 0.014401457334950855, 0.016136645803505933, 0.018084691690523808, 0.02034339435043333, 0.023010553137663356, 0.02618245030633179, 0.02987598021789672, 0.03399124860432431, 0.03841901276927576, 0.04305003001641233, 0.04777505764939527, 0.05248655095606091, 0.05711111124345979, 0.061606963318156155, 0.06593352453527067, 0.07005021224992403, 0.0739164438172369, 0.07750993516859131, 0.08099347412039164, 0.08463731026676209, 0.08871301688355863, 0.09349216724663728, 0.09924633463185403, 0.10618323138176163, 0.11414598540546432, 0.12284854577009242, 0.1320047101687122, 0.14132827629439002, 0.1505330554072626, 0.15941192765493456, 0.16802305011648855, 0.17648015059219266, 0.1848969568823147, 0.1933871967871227, 0.20206398490556696, 0.21095415649494886, 0.21991005271261319, 0.22876296466442167, 0.23734418345623623, 0.2454850001939189, 0.2530251979813624, 0.26011284668479406, 0.26728429606874665, 0.27510065390950467, 0.2841230279833525, 0.2949125260665745, 0.3079923356666425, 0.3232909407152382, 0.34026464195678596, 0.3583567334835082, 0.37701050938762737, 0.39566926376136546, 0.41382871561702983, 0.4314191595903167, 0.4485857680617406, 0.46547524058290646, 0.48223427670541846, 0.4990095759808816, 0.5159232725419912, 0.5329802330322019, 0.5501503711502892, 0.5674035945976118, 0.584709811075529, 0.6020389293063492, 0.6193617292646799, 0.636651449880647, 0.65388176079721, 0.671026331657328, 0.6880588321039602, 0.7049536176478475, 0.721740725289753, 0.7385460873202617, 0.7555051174661778, 0.772753229454305, 0.7904258370114485, 0.8086470512659382, 0.8272412658080572, 0.8457092490452215, 0.8635356764272545, 0.8802052234039801, 0.8952025654252215, 0.9080540170788527, 0.9188060849794258, 0.9278588799318661, 0.9356192701068533, 0.9424941236750667, 0.9488903088071868, 0.9552146936738926, 0.9618741464458638, 0.9692755352937806, 0.9778257283883225, 0.987931593900169, 1.0], "x_lower_surface": [0.0, 0.002983568463323366, 0.005495398864107563, 0.007633290556781445, 0.009495042895773863, 0.011178455235513671, 0.012781326930429715, 0.014401457334950855, 0.016136645803505933, 0.018084691690523808, 0.02034339435043333, 0.023010553137663356, 0.02618245030633179, 0.02987598021789672, 0.03399124860432431, 0.03841901276927576, 0.04305003001641233, 0.04777505764939527, 0.05248655095606091, 0.05711111124345979, 0.061606963318156155, 0.06593352453527067, 0.07005021224992403, 0.0739164438172369, 0.07750993516859131, 0.08099347412039164, 0.08463731026676209, 0.08871301688355863, 0.09349216724663728, 0.09924633463185403, 0.10618323138176163, 0.11414598540546432, 0.12284854577009242, 0.1320047101687122, 0.14132827629439002, 0.1505330554072626, 0.15941192765493456, 0.16802305011648855, 0.17648015059219266, 0.1848969568823147, 0.1933871967871227, 0.20206398490556696, 0.21095415649494886, 0.21991005271261319, 0.22876296466442167, 0.23734418345623623, 0.2454850001939189, 0.2530251979813624, 0.26011284668479406, 0.26728429606874665, 0.27510065390950467, 0.2841230279833525, 0.2949125260665745, 0.3079923356666425, 0.3232909407152382, 0.34026464195678596, 0.3583567334835082, 0.37701050938762737, 0.39566926376136546, 0.41382871561702983, 0.4314191595903167, 0.4485857680617406, 0.46547524058290646, 0.48223427670541846, 0.4990095759808816, 0.5159232725419912, 0.5329802330322019, 0.5501503711502892, 0.5674035945976118, 0.584709811075529, 0.6020389293063492, 0.6193617292646799, 0.636651449880647, 0.65388176079721, 0.671026331657328, 0.6880588321039602, 0.7049536176478475, 0.721740725289753, 0.7385460873202617, 0.7555051174661778, 0.772753229454305, 0.7904258370114485, 0.8086470512659382, 0.8272412658080572, 0.8457092490452215, 0.8635356764272545, 0.8802052234039801, 0.8952025654252215, 0.9080540170788527, 0.9188060849794258, 0.9278588799318661, 0.9356192701068533, 0.9424941236750667, 0.9488903088071868, 0.9552146936738926, 0.9618741464458638, 0.9692755352937806, 0.9778257283883225, 0.987931593900169, 1.0], "y_upper_surface": [0.0, 0.006380448434411382, 0.011684222338048238, 0.01604344931896208, 0.019590256985204432, 0.022456772944826807, 0.024775124805880726, 0.0266774401764177, 0.028295846664489248, 0.029762471878146894, 0.03120944342544214, 0.032768888914426524, 0.034571312065779534, 0.03666224067904225, 0.03896219329809893, 0.041381682012703425, 0.043831218912609625, 0.04622131608757143, 0.048465024185001655, 0.050526443585207935, 0.052416953128491914, 0.05414971456533544, 0.05573788964622039, 0.0571946401216286, 0.05853647479776234, 0.059813754617875345, 0.061096496729764464, 0.06245496040041921, 0.06395940489682915, 0.0656800894859838, 0.06766885051217811, 0.06987234717171274, 0.0721999724999295, 0.07456107586302006, 0.07686500662717619, 0.07902111828787567, 0.08096282982043052, 0.08270430013275304, 0.0842766016889327, 0.085710806953059, 0.08703798838922139, 0.08828913732842156, 0.08948382942265995, 0.09061855288962625, 0.09168701080022883, 0.09268290622537607, 0.09359994223597637, 0.09443196809870935, 0.09517814045560116, 0.09584430046261619, 0.09643671550245721, 0.09696165295782698, 0.0974253802114283, 0.09783279989437103, 0.09816741123853424, 0.09839571958896255, 0.09848376218090428, 0.09839757624960772, 0.09810319903032119, 0.09757115844868458, 0.09680920794395251, 0.09584350726715765, 0.09470034698598487, 0.0934060176681191, 0.09198680988124525, 0.09046433273809579, 0.08883784757584529, 0.08709995471617446, 0.08524325333783067, 0.08326034261956128, 0.08114382794560088, 0.07889161030783352, 0.07651653661409302, 0.07403407171213082, 0.07145968044969825, 0.06880882767454666, 0.0660967461407709, 0.06331982631104899, 0.060442008241368986, 0.057424023525010276, 0.05422660375525216, 0.050810480525374006, 0.047139368762024875, 0.043256094167558316, 0.03928890366932827, 0.035370291948646625, 0.031632753686825256, 0.028208783565176167, 0.02522084411119842, 0.022666067534134495, 0.02045639187752719, 0.01850212712690006, 0.016713583267776725, 0.015001070285680764, 0.013274898166135717, 0.01144537689466523, 0.009422816456792805, 0.007117526838042063, 0.004439818023936638, 0.0013], "y_lower_surface": [0.0, -0.0036652232238845632, -0.006745116792398609, -0.009305400195575348, -0.011411792923447985, -0.013130014466049736, -0.014525784313413804, -0.0156648219555734, -0.01661284688256173, -0.017435578584412005, -0.018198736551157432, -0.01896804027283123, -0.01980839017236283, -0.020741825952895296, -0.021727334318491106, -0.022718854851383495, -0.02367032713380571, -0.02453569074799101, -0.02527062637854228, -0.025865827824930854, -0.02634441542554817, -0.02673073235062825, -0.02704912177040515, -0.027323926855112892, -0.027577905285351957, -0.027817779092228736, -0.02804095922536732, -0.028244741943301406, -0.028426423504564723, -0.028583300167690947, -0.0287124723678148, -0.02880992257703332, -0.028871237152970974, -0.028892001989078226, -0.02886780297880557, -0.028794226237670043, -0.02866815208520311, -0.02849080290872854, -0.02826431068027207, -0.02799080737185942, -0.02767242495551634, -0.027311321418476222, -0.02691331516898971, -0.02649162756784114, -0.026060373029115777, -0.02563366596689888, -0.025225620795275707, -0.024849859458193766, -0.0245021256542495, -0.024155645854136956, -0.02378221075555379, -0.023353611056197657, -0.02284163745376622, -0.022220119297835975, -0.02149485811539941, -0.020697040726644425, -0.019858553209353348, -0.019011281641308535, -0.018187112100292314, -0.017414490637169912, -0.01669334724899932, -0.016009512050094463, -0.015348714944608753, -0.01469668583669561, -0.014039154630508432, -0.013364802023979242, -0.012676394865126254, -0.01198089854350618, -0.01128527916908439, -0.010596502851826234, -0.009921534244260078, -0.009266094258623172, -0.008632393570162943, -0.008022027997896768, -0.00743659336084203, -0.0068776854780161, -0.00634688832454166, -0.0058448243407931005, -0.00537046000116181, -0.004922598050038695, -0.00450004123181465, -0.004101592290880574, -0.003726130229006508, -0.0033745562089715457, -0.003049954856793557, -0.002755519375891563, -0.002494442969684588, -0.0022699188415916645, -0.0020847476996542613, -0.0019368268611264893, -0.0018207205288729047, -0.001730929210039391, -0.0016619534117718344, -0.001608293641216119, -0.0015644504055181278, -0.0015249242118237465, -0.001484215567278858, -0.0014368249790293478, -0.0013772529542211013, -0.0013], "camber_coordinates": [0.0, 0.001357612605263409, 0.0024695527728248144, 0.0033690245616933654, 0.0040892320308782235, 0.0046633792393885355, 0.00512467024623346, 0.0055063091104221515, 0.005841499890963758, 0.0061634466468674445, 0.0065053534371423555, 0.006900424320797648, 0.0073814609467083535, 0.007960207363073478, 0.008617429489803912, 0.009331413580659968, 0.010080445889401959, 0.01084281266979021, 0.011597198903229688, 0.012330307880138544, 0.013036268851471876, 0.013709491107353595, 0.014344383937907618, 0.014935356633257856, 0.015479284756205192, 0.015997987762823306, 0.016527768752198572, 0.0171051092285589, 0.01776649069613221, 0.01854839465914643, 0.019478189072181653, 0.02053121229733971, 0.021664367673479266, 0.022834536936970917, 0.023998601824185305, 0.025113446025102813, 0.026147338867613702, 0.027106748612012253, 0.028006145504330317, 0.028859999790599788, 0.02968278171685252, 0.03048890795497267, 0.031285257126835116, 0.03206346266089256, 0.032813318885556525, 0.0335246201292386, 0.03418716072035033, 0.034791054320257794, 0.03533800740067583, 0.035844327304239615, 0.03632725237345171, 0.036804020950814656, 0.03729187137883104, 0.03780634029826753, 0.03833627656156741, 0.03884933943115906, 0.03931260448577547, 0.03969314730414959, 0.039958043465014435, 0.04007833390575733, 0.040057930347476595, 0.039916997608531596, 0.03967581602068806, 0.039354665915711746, 0.03897382762536841, 0.03854976535705827, 0.038080726355359515, 0.037559528086334136, 0.036978987084373145, 0.03633191988386752, 0.0356111468506704, 0.03481275802460517, 0.033942071521965045, 0.03300602185711703, 0.03201154354442811, 0.030965571098265275, 0.029874928908114627, 0.028737500985127944, 0.02753577412010359, 0.02625071273748579, 0.024863281261718752, 0.023354444117246718, 0.021706619266509183, 0.019940768979293384, 0.01811947440626736, 0.016307386286377533, 0.014569155358570333, 0.012969432361792252, 0.011568048205772079, 0.010364620336504003, 0.009317835674327143, 0.008385598958430334, 0.007525814928002446, 0.0066963883222323235, 0.005855223880308794, 0.004960226341420741, 0.003969300444756974, 0.0028403509295063575, 0.0015312825348577684, 0.0]}, "polar_files": ["/Users/matthewclarke/Documents/LEADS/CODES/RCAIDE/Regressions/Vehicles/Airfoils/Polars/NACA_4412_polar_Re_50000.txt", "/Users/matthewclarke/Documents/LEADS/CODES/RCAIDE/Regressions/Vehicles/Airfoils/Polars/NACA_4412_polar_Re_100000.txt", "/Users/matthewclarke/Documents/LEADS/CODES/RCAIDE/Regressions/Vehicles/Airfoils/Polars/NACA_4412_polar_Re_200000.txt", "/Users/matthewclarke/Documents/LEADS/CODES/RCAIDE/Regressions/Vehicles/Airfoils/Polars/NACA_4412_polar_Re_500000.txt", "/Users/matthewclarke/Documents/LEADS/CODES/RCAIDE/Regressions/Vehicles/Airfoils/Polars/NACA_4412_polar_Re_1000000.txt", "/Users/matthewclarke/Documents/LEADS/CODES/RCAIDE/Regressions/Vehicles/Airfoils/Polars/NACA_4412_polar_Re_3500000.txt", "/Users/matthewclarke/Documents/LEADS/CODES/RCAIDE/Regressions/Vehicles/Airfoils/Polars/NACA_4412_polar_Re_5000000.txt", "/Users/matthewclarke/Documents/LEADS/CODES/RCAIDE/Regressions/Vehicles/Airfoils/Polars/NACA_4412_polar_Re_7500000.txt"], "polars": {"aoa_from_polar": [[-0.10471975511965978, -0.10035643198967395, -0.09599310885968812, -0.0916297857297023, -0.08726646259971647, -0.08290313946973066, -0.07853981633974483, -0.07417649320975901, -0.06981317007977318, -0.06544984694978735, -0.061086523819801536, -0.05672320068981571, -0.05235987755982989, -0.04799655442984406, -0.04363323129985824, -0.039269908169872414, -0.03490658503988659, -0.030543261909900768, -0.026179938779914945, -0.02181661564992912, -0.017453292519943295, -0.013089969389957472, -0.008726646259971648, -0.004363323129985824, 0.0, 0.004363323129985824, 0.008726646259971648, 0.013089969389957472, 0.017453292519943295, 0.02181661564992912, 0.026179938779914945, 0.030543261909900768, 0.03490658503988659, 0.039269908169872414, 0.04363323129985824, 0.04799655442984406, 0.05235987755982989, 0.05672320068981571, 0.061086523819801536, 0.06544984694978735, 0.06981317007977318, 0.07417649320975901, 0.07853981633974483, 0.08290313946973066, 0.08726646259971647, 0.0916297857297023, 0.09599310885968812, 0.10035643198967395, 0.10471975511965978, 0.1090830782496456, 0.11344640137963143, 0.11780972450961724, 0.12217304763960307, 0.1265363707695889, 0.1308996938995747, 0.13526301702956053, 0.13962634015954636, 0.1439896632895322, 0.14835298641951802, 0.15271630954950383, 0.15707963267948966, 0.16144295580947549, 0.16580627893946132, 0.17016960206944712, 0.17453292519943295, 0.17889624832941878, 0.1832595714594046, 0.18762289458939044, 0.19198621771937624, 0.19634954084936207, 0.2007128639793479, 0.20507618710933373, 0.20943951023931956, 0.21380283336930536, 0.2181661564992912, 0.22252947962927702, 0.22689280275926285, 0.23125612588924865, 0.23561944901923448, 0.2399827721492203, 0.24434609527920614, 0.24870941840919197, 0.2530727415391778, 0.25743606466916363, 0.2617993877991494, 0.26616271092913524, 0.27052603405912107, 0.2748893571891069, 0.2792526803190927], [-0.10471975511965978, -0.10035643198967395, -0.09599310885968812, -0.0916297857297023, -0.08726646259971647, -0.08290313946973066, -0.07853981633974483, -0.07417649320975901, -0.06981317007977318, -0.06544984694978735, -0.061086523819801536, -0.05672320068981571, -0.05235987755982989, -0.04799655442984406, -0.04363323129985824, -0.039269908169872414, -0.03490658503988659, -0.030543261909900768, -0.026179938779914945, -0.02181661564992912, -0.017453292519943295, -0.013089969389957472, -0.008726646259971648, -0.004363323129985824, 0.0, 0.004363323129985824, 0.008726646259971648, 0.013089969389957472, 0.017453292519943295, 0.02181661564992912, 0.026179938779914945, 0.030543261909900768, 0.03490658503988659, 0.039269908169872414, 0.04363323129985824, 0.04799655442984406, 0.05235987755982989, 0.05672320068981571, 0.061086523819801536, 0.06544984694978735, 0.06981317007977318, 0.07417649320975901, 0.07853981633974483, 0.08290313946973066, 0.08726646259971647, 0.0916297857297023, 0.09599310885968812, 0.10035643198967395, 0.10471975511965978, 0.1090830782496456, 0.11344640137963143, 0.11780972450961724, 0.12217304763960307, 0.1265363707695889, 0.1308996938995747, 0.13526301702956053, 0.13962634015954636, 0.1439896632895322, 0.14835298641951802, 0.15271630954950383, 0.15707963267948966, 0.16144295580947549, 0.16580627893946132, 0.17016960206944712, 0.17453292519943295, 0.17889624832941878, 0.1832595714594046, 0.18762289458939044, 0.19198621771937624, 0.19634954084936207, 0.2007128639793479, 0.20507618710933373, 0.20943951023931956, 0.21380283336930536, 0.2181661564992912, 0.22252947962927702, 0.22689280275926285, 0.23125612588924865, 0.23561944901923448, 0.2399827721492203, 0.24434609527920614, 0.24870941840919197, 0.2530727415391778, 0.25743606466916363, 0.2617993877991494, 0.26616271092913524, 0.27052603405912107, 0.2748893571891069, 0.2792526803190927], [-0.10471975511965978, -0.10035643198967395, -0.09599310885968812, -0.0916297857297023, -0.08726646259971647, -0.08290313946973066, -0.07853981633974483, -0.07417649320975901, -0.06981317007977318, -0.06544984694978735, -0.061086523819801536, -0.05672320068981571, -0.05235987755982989, -0.04799655442984406, -0.04363323129985824, -0.039269908169872414, -0.03490658503988659, -0.030543261909900768, -0.026179938779914945, -0.02181661564992912, -0.017453292519943295, -0.013089969389957472, -0.008726646259971648, -0.004363323129985824, 0.0, 0.004363323129985824, 0.008726646259971648, 0.013089969389957472, 0.017453292519943295, 0.02181661564992912, 0.026179938779914945, 0.030543261909900768, 0.03490658503988659, 0.039269908169872414, 0.04363323129985824, 0.04799655442984406, 0.05235987755982989, 0.05672320068981571, 0.061086523819801536, 0.06544984694978735, 0.06981317007977318, 0.07417649320975901, 0.07853981633974483, 0.08290313946973066, 0.08726646259971647, 0.0916297857297023, 0.09599310885968812, 0.10035643198967395, 0.10471975511965978, 0.1090830782496456, 0.11344640137963143, 0.11780972450961724, 0.12217304763960307, 0.1265363707695889, 0.1308996938995747, 0.13526301702956053, 0.13962634015954636, 0.1439896632895322, 0.14835298641951802, 0.15271630954950383, 0.15707963267948966, 0.16144295580947549, 0.16580627893946132, 0.17016960206944712, 0.17453292519943295, 0.17889624832941878, 0.1832595714594046, 0.18762289458939044, 0.19198621771937624, 0.19634954084936207, 0.2007128639793479, 0.20507618710933373, 0.20943951023931956, 0.21380283336930536, 0.2181661564992912, 0.22252947962927702, 0.22689280275926285, 0.23125612588924865, 0.23561944901923448, 0.2399827721492203, 0.24434609527920614, 0.24870941840919197, 0.2530727415391778, 0.25743606466916363, 0.2617993877991494, 0.26616271092913524, 0.27052603405912107, 0.2748893571891069, 0.2792526803190927], [-0.10471975511965978, -0.10035643198967395, -0.09599310885968812, -0.0916297857297023, -0.08726646259971647, -0.08290313946973066, -0.07853981633974483, -0.07417649320975901, -0.06981317007977318, -0.06544984694978735, -0.061086523819801536, -0.05672320068981571, -0.05235987755982989, -0.04799655442984406, -0.04363323129985824, -0.039269908169872414, -0.03490658503988659, -0.030543261909900768, -0.026179938779914945, -0.02181661564992912, -0.017453292519943295, -0.013089969389957472, -0.008726646259971648, -0.004363323129985824, 0.0, 0.004363323129985824, 0.008726646259971648, 0.013089969389957472, 0.017453292519943295, 0.02181661564992912, 0.026179938779914945, 0.030543261909900768, 0.03490658503988659, 0.039269908169872414, 0.04363323129985824, 0.04799655442984406, 0.05235987755982989, 0.05672320068981571, 0.061086523819801536, 0.06544984694978735, 0.06981317007977318, 0.07417649320975901, 0.07853981633974483, 0.08290313946973066, 0.08726646259971647, 0.0916297857297023, 0.09599310885968812, 0.10035643198967395, 0.10471975511965978, 0.1090830782496456, 0.11344640137963143, 0.11780972450961724, 0.12217304763960307, 0.1265363707695889, 0.1308996938995747, 0.13526301702956053, 0.13962634015954636, 0.1439896632895322, 0.14835298641951802, 0.15271630954950383, 0.15707963267948966, 0.16144295580947549, 0.16580627893946132, 0.17016960206944712, 0.17453292519943295, 0.17889624832941878, 0.1832595714594046, 0.18762289458939044, 0.19198621771937624, 0.19634954084936207, 0.2007128639793479, 0.20507618710933373, 0.20943951023931956, 0.21380283336930536, 0.2181661564992912, 0.22252947962927702, 0.22689280275926285, 0.23125612588924865, 0.23561944901923448, 0.2399827721492203, 0.24434609527920614, 0.24870941840919197, 0.2530727415391778, 0.25743606466916363, 0.2617993877991494, 0.26616271092913524, 0.27052603405912107, 0.2748893571891069, 0.2792526803190927], [-0.10471975511965978, -0.10035643198967395, -0.09599310885968812, -0.0916297857297023, -0.08726646259971647, -0.08290313946973066, -0.07853981633974483, -0.07417649320975901, -0.06981317007977318, -0.06544984694978735, -0.061086523819801536, -0.05672320068981571, -0.05235987755982989, -0.04799655442984406, -0.04363323129985824, -0.039269908169872414, -0.03490658503988659, -0.030543261909900768, -0.026179938779914945, -0.02181661564992912, -0.017453292519943295, -0.013089969389957472, -0.008726646259971648, -0.004363323129985824, 0.0, 0.004363323129985824, 0.008726646259971648, 0.013089969389957472, 0.017453292519943295, 0.02181661564992912, 0.026179938779914945, 0.030543261909900768, 0.03490658503988659, 0.039269908169872414, 0.04363323129985824, 0.04799655442984406, 0.05235987755982989, 0.05672320068981571, 0.061086523819801536, 0.06544984694978735, 0.06981317007977318, 0.07417649320975901, 0.07853981633974483, 0.08290313946973066, 0.08726646259971647, 0.0916297857297023, 0.09599310885968812, 0.10035643198967395, 0.10471975511965978, 0.1090830782496456, 0.11344640137963143, 0.11780972450961724, 0.12217304763960307, 0.1265363707695889, 0.1308996938995747, 0.13526301702956053, 0.13962634015954636, 0.1439896632895322, 0.14835298641951802, 0.15271630954950383, 0.15707963267948966, 0.16144295580947549, 0.16580627893946132, 0.17016960206944712, 0.17453292519943295, 0.17889624832941878, 0.1832595714594046, 0.18762289458939044, 0.19198621771937624, 0.19634954084936207, 0.2007128639793479, 0.20507618710933373, 0.20943951023931956, 0.21380283336930536, 0.2181661564992912, 0.22252947962927702, 0.22689280275926285, 0.23125612588924865, 0.23561944901923448, 0.2399827721492203, 0.24434609527920614, 0.24870941840919197, 0.2530727415391778, 0.25743606466916363, 0.2617993877991494, 0.26616271092913524, 0.27052603405912107, 0.2748893571891069, 0.2792526803190927], [-0.10471975511965978, -0.10035643198967395, -0.09599310885968812, -0.0916297857297023, -0.08726646259971647, -0.08290313946973066, -0.07853981633974483, -0.07417649320975901, -0.06981317007977318, -0.06544984694978735, -0.061086523819801536, -0.05672320068981571, -0.05235987755982989, -0.04799655442984406, -0.04363323129985824, -0.039269908169872414, -0.03490658503988659, -0.030543261909900768, -0.026179938779914945, -0.02181661564992912, -0.017453292519943295, -0.013089969389957472, -0.008726646259971648, -0.004363323129985824, 0.0, 0.004363323129985824, 0.008726646259971648, 0.013089969389957472, 0.017453292519943295, 0.02181661564992912, 0.026179938779914945, 0.030543261909900768, 0.03490658503988659, 0.039269908169872414, 0.04363323129985824, 0.04799655442984406, 0.05235987755982989, 0.05672320068981571, 0.061086523819801536, 0.06544984694978735, 0.06981317007977318, 0.07417649320975901, 0.07853981633974483, 0.08290313946973066, 0.08726646259971647, 0.0916297857297023, 0.09599310885968812, 0.10035643198967395, 0.10471975511965978, 0.1090830782496456, 0.11344640137963143, 0.11780972450961724, 0.12217304763960307, 0.1265363707695889, 0.1308996938995747, 0.13526301702956053, 0.13962634015954636, 0.1439896632895322, 0.14835298641951802, 0.15271630954950383, 0.15707963267948966, 0.16144295580947549, 0.16580627893946132, 0.17016960206944712, 0.17453292519943295, 0.17889624832941878, 0.1832595714594046, 0.18762289458939044, 0.19198621771937624, 0.19634954084936207, 0.2007128639793479, 0.20507618710933373, 0.20943951023931956, 0.21380283336930536, 0.2181661564992912, 0.22252947962927702, 0.22689280275926285, 0.23125612588924865, 0.23561944901923448, 0.2399827721492203, 0.24434609527920614, 0.24870941840919197, 0.2530727415391778, 0.25743606466916363, 0.2617993877991494, 0.26616271092913524, 0.27052603405912107, 0.2748893571891069, 0.2792526803190927], [-0.10471975511965978, -0.10035643198967395, -0.09599310885968812, -0.0916297857297023, -0.08726646259971647, -0.08290313946973066, -0.07853981633974483, -0.07417649320975901, -0.06981317007977318, -0.06544984694978735, -0.061086523819801536, -0.05672320068981571, -0.05235987755982989, -0.04799655442984406, -0.04363323129985824, -0.039269908169872414, -0.03490658503988659, -0.030543261909900768, -0.026179938779914945, -0.02181661564992912, -0.017453292519943295, -0.013089969389957472, -0.008726646259971648, -0.004363323129985824, 0.0, 0.004363323129985824, 0.008726646259971648, 0.013089969389957472, 0.017453292519943295, 0.02181661564992912, 0.026179938779914945, 0.030543261909900768, 0.03490658503988659, 0.039269908169872414, 0.04363323129985824, 0.04799655442984406, 0.05235987755982989, 0.05672320068981571, 0.061086523819801536, 0.06544984694978735, 0.06981317007977318, 0.07417649320975901, 0.07853981633974483, 0.08290313946973066, 0.08726646259971647, 0.0916297857297023, 0.09599310885968812, 0.10035643198967395, 0.10471975511965978, 0.1090830782496456, 0.11344640137963143, 0.11780972450961724, 0.12217304763960307, 0.1265363707695889, 0.1308996938995747, 0.13526301702956053, 0.13962634015954636, 0.1439896632895322, 0.14835298641951802, 0.15271630954950383, 0.15707963267948966, 0.16144295580947549, 0.16580627893946132, 0.17016960206944712, 0.17453292519943295, 0.17889624832941878, 0.1832595714594046, 0.18762289458939044, 0.19198621771937624, 0.19634954084936207, 0.2007128639793479, 0.20507618710933373, 0.20943951023931956, 0.21380283336930536, 0.2181661564992912, 0.22252947962927702, 0.22689280275926285, 0.23125612588924865, 0.23561944901923448, 0.2399827721492203, 0.24434609527920614, 0.24870941840919197, 0.2530727415391778, 0.25743606466916363, 0.2617993877991494, 0.26616271092913524, 0.27052603405912107, 0.2748893571891069, 0.2792526803190927], [-0.10471975511965978, -0.10035643198967395, -0.09599310885968812, -0.0916297857297023, -0.08726646259971647, -0.08290313946973066, -0.07853981633974483, -0.07417649320975901, -0.06981317007977318, -0.06544984694978735, -0.061086523819801536, -0.05672320068981571, -0.05235987755982989, -0.04799655442984406, -0.04363323129985824, -0.039269908169872414, -0.03490658503988659, -0.030543261909900768, -0.026179938779914945, -0.02181661564992912, -0.017453292519943295, -0.013089969389957472, -0.008726646259971648, -0.004363323129985824, 0.0, 0.004363323129985824, 0.008726646259971648, 0.013089969389957472, 0.017453292519943295, 0.02181661564992912, 0.026179938779914945, 0.030543261909900768, 0.03490658503988659, 0.039269908169872414, 0.04363323129985824, 0.04799655442984406, 0.05235987755982989, 0.05672320068981571, 0.061086523819801536, 0.06544984694978735, 0.06981317007977318, 0.07417649320975901, 0.07853981633974483, 0.08290313946973066, 0.08726646259971647, 0.0916297857297023, 0.09599310885968812, 0.10035643198967395, 0.10471975511965978, 0.1090830782496456, 0.11344640137963143, 0.11780972450961724, 0.12217304763960307, 0.1265363707695889, 0.1308996938995747, 0.13526301702956053, 0.13962634015954636, 0.1439896632895322, 0.14835298641951802, 0.15271630954950383, 0.15707963267948966, 0.16144295580947549, 0.16580627893946132, 0.17016960206944712, 0.17453292519943295, 0.17889624832941878, 0.1832595714594046, 0.18762289458939044, 0.19198621771937624, 0.19634954084936207, 0.2007128639793479, 0.20507618710933373, 0.20943951023931956, 0.21380283336930536, 0.2181661564992912, 0.22252947962927702, 0.22689280275926285, 0.23125612588924865, 0.23561944901923448, 0.2399827721492203, 0.24434609527920614, 0.24870941840919197, 0.2530727415391778, 0.25743606466916363, 0.2617993877991494, 0.26616271092913524, 0.27052603405912107, 0.2748893571891069, 0.2792526803190927]], "re_from_polar": [50000.0, 100000.0, 200000.0, 500000.0, 1000000.0, 3500000.0, 5000000.0, 7500000.0], "lift_coefficients": [[-0.8668389012070687, -0.9628795671610489, -0.9789613216382629, -0.9437247187342035, -0.876931904863378, -0.7917162610101387, -0.6964139738440771, -0.5960208838257406, -0.4078, -0.4453, -0.4519, -0.2525, -0.1457, 0.042949999999999995, 0.1943, 0.3281, 0.4286, 0.5265, 0.6102, 0.6895, 0.7592, 0.8095, 0.8781, 0.9207, 0.9807, 0.9807, 0.9807, 0.9807, 0.9807, 0.9807, 0.9807, 0.564092063115252, 0.6208651346861369, 0.6744664974274013, 0.7249683439283658, 0.7724421853437302, 0.8169588484951222, 0.8585884729194884, 0.897400507862631, 0.9334637092160134, 0.9668461363949694, 0.9976151491562684, 1.0258374043529437, 1.0515788526241736, 1.0749047350178667, 1.095879579543516, 1.1145671976527294, 1.1310306806447277, 1.145332395993917, 1.1575339835965335, 1.1676963519331338, 1.1758796741435562, 1.1821433840107622, 1.186546171849761, 1.1891459802975801, 1.1900000000000002, 1.189164665190508, 1.1866956491566083, 1.1826478595883416, 1.1770754338034886, 1.1700317338435728, 1.1615693414343655, 1.151740052804134, 1.1405948733523983, 1.128184012161403, 1.114556876341934, 1.0997620652044378, 1.0838473642456912, 1.0668597389404633, 1.048845328326717, 1.0298494383719237, 1.0099165351069441, 0.9890902375127129, 0.9674133101435616, 0.9449276554694761, 0.9216743059178069, 0.8976934155929732, 0.8730242516504152, 0.8477051852984732, 0.8217736823988906, 0.7952662936332109, 0.7682186441983773, 0.7406654229902223, 0.7126403712281303, 0.6841762704677934, 0.6553049299414383, 0.6260571731558979, 0.5964628236680811, 0.566550689944257, 0.5363485491935105, 0.5058831300458653, 0.47518009392073884, 0.44426401489999784, 0.4131583578795709, 0.3818854547210808, 0.35046647805532516, 0.3189214122952245, 0.2872690212853754, 0.2555268118296233, 0.22371099206501363, 0.19183642323292582, 0.1599165627279245, 0.1279633951602268, 0.09598734604598294, 0.06399716832672771], [-1.1908932203108227, -1.1034999307696685, -1.0090137319431105, -0.9087271851510879, -0.803806877682798, -0.6952924031788213, -0.5840951957297257, -0.4709971702917467, -0.4744, -0.339, -0.1732, -0.0135, 0.1378, 0.3011, 0.4335, 0.5631, 0.6774, 0.7929, 0.8957, 0.9995, 1.1016, 1.1987, 1.2769, 1.3281, 1.3127, 1.3189, 1.3787, 1.4319, 1.4512, 1.4201, 1.3171, 1.3956729083522146, 1.3189900988029921, 1.2133829765808906, 1.0761215426599506, 0.9043572397947015, 0.8169588484951222, 0.8585884729194884, 0.897400507862631, 0.9334637092160134, 0.9668461363949694, 0.9976151491562684, 1.0258374043529437, 1.0515788526241736, 1.0749047350178667, 1.095879579543516, 1.1145671976527294, 1.1310306806447277, 1.145332395993917, 1.1575339835965335, 1.1676963519331338, 1.1758796741435562, 1.1821433840107622, 1.186546171849761, 1.1891459802975801, 1.1900000000000002, 1.189164665190508, 1.1866956491566083, 1.1826478595883416, 1.1770754338034886, 1.1700317338435728, 1.1615693414343655, 1.151740052804134, 1.1405948733523983, 1.128184012161403, 1.114556876341934, 1.0997620652044378, 1.0838473642456912, 1.0668597389404633, 1.048845328326717, 1.0298494383719237, 1.0099165351069441, 0.9890902375127129, 0.9674133101435616, 0.9449276554694761, 0.9216743059178069, 0.8976934155929732, 0.8730242516504152, 0.8477051852984732, 0.8217736823988906, 0.7952662936332109, 0.7682186441983773, 0.7406654229902223, 0.7126403712281303, 0.6841762704677934, 0.6553049299414383, 0.6260571731558979, 0.5964628236680811, 0.566550689944257, 0.5363485491935105, 0.5058831300458653, 0.47518009392073884, 0.44426401489999784, 0.4131583578795709, 0.3818854547210808, 0.35046647805532516, 0.3189214122952245, 0.2872690212853754, 0.2555268118296233, 0.22371099206501363, 0.19183642323292582, 0.1599165627279245, 0.1279633951602268, 0.09598734604598294, 0.06399716832672771], [-0.9892621516469651, -0.9019462782843927, -0.8103549182974268, -0.7151947443190507, -0.6171266974117984, -0.5167630039127251, -0.4146634754774159, -0.3113307408167738, -0.293, -0.1466, 0.003, 0.1342, 0.2541, 0.3583, 0.4938, 0.5988, 0.7038, 0.8084, 0.9127, 1.0156, 1.1122, 1.2002, 1.2799, 1.3267, 1.3275, 1.3429, 1.3641, 1.3923, 1.418, 1.4342, 1.4362, 1.4246380419144926, 1.3907990750802153, 1.3400748158881686, 1.2712764344832739, 1.183187284374868, 1.0745634507802917, 0.9441342664028092, 0.897400507862631, 0.9334637092160134, 0.9668461363949694, 0.9976151491562684, 1.0258374043529437, 1.0515788526241736, 1.0749047350178667, 1.095879579543516, 1.1145671976527294, 1.1310306806447277, 1.145332395993917, 1.1575339835965335, 1.1676963519331338, 1.1758796741435562, 1.1821433840107622, 1.186546171849761, 1.1891459802975801, 1.1900000000000002, 1.189164665190508, 1.1866956491566083, 1.1826478595883416, 1.1770754338034886, 1.1700317338435728, 1.1615693414343655, 1.151740052804134, 1.1405948733523983, 1.128184012161403, 1.114556876341934, 1.0997620652044378, 1.0838473642456912, 1.0668597389404633, 1.048845328326717, 1.0298494383719237, 1.0099165351069441, 0.9890902375127129, 0.9674133101435616, 0.9449276554694761, 0.9216743059178069, 0.8976934155929732, 0.8730242516504152, 0.8477051852984732, 0.8217736823988906, 0.7952662936332109, 0.7682186441983773, 0.7406654229902223, 0.7126403712281303, 0.6841762704677934, 0.6553049299414383, 0.6260571731558979, 0.5964628236680811, 0.566550689944257, 0.5363485491935105, 0.5058831300458653, 0.47518009392073884, 0.44426401489999784, 0.4131583578795709, 0.3818854547210808, 0.35046647805532516, 0.3189214122952245, 0.2872690212853754, 0.2555268118296233, 0.22371099206501363, 0.19183642323292582, 0.1599165627279245, 0.1279633951602268, 0.09598734604598294, 0.06399716832672771], [-0.992446947221973, -0.9012266559399362, -0.8057119708761068, -0.7065322056252733, -0.6042935254653763, -0.4995764576963993, -0.39293263829048397, -0.2848803353942884, -0.1743, -0.0666, 0.0434, 0.1541, 0.2641, 0.3734, 0.4741, 0.5983, 0.7023, 0.8073, 0.9127, 1.0155, 1.1155, 1.2103, 1.2891, 1.3388, 1.3845, 1.427, 1.4602, 1.4938, 1.5091, 1.5124, 1.5055, 1.5024801888012511, 1.475631538512678, 1.434129150608317, 1.3771278221584196, 1.3037720318370243, 1.21319624498583, 1.104525197911813, 0.9768741635716025, 0.9334637092160134, 0.9668461363949694, 0.9976151491562684, 1.0258374043529437, 1.0515788526241736, 1.0749047350178667, 1.095879579543516, 1.1145671976527294, 1.1310306806447277, 1.145332395993917, 1.1575339835965335, 1.1676963519331338, 1.1758796741435562, 1.1821433840107622, 1.186546171849761, 1.1891459802975801, 1.1900000000000002, 1.189164665190508, 1.1866956491566083, 1.1826478595883416, 1.1770754338034886, 1.1700317338435728, 1.1615693414343655, 1.151740052804134, 1.1405948733523983, 1.128184012161403, 1.114556876341934, 1.0997620652044378, 1.0838473642456912, 1.0668597389404633, 1.048845328326717, 1.0298494383719237, 1.0099165351069441, 0.9890902375127129, 0.9674133101435616, 0.9449276554694761, 0.9216743059178069, 0.8976934155929732, 0.8730242516504152, 0.8477051852984732, 0.8217736823988906, 0.7952662936332109, 0.7682186441983773, 0.7406654229902223, 0.7126403712281303, 0.6841762704677934, 0.6553049299414383, 0.6260571731558979, 0.5964628236680811, 0.566550689944257, 0.5363485491935105, 0.5058831300458653, 0.47518009392073884, 0.44426401489999784, 0.4131583578795709, 0.3818854547210808, 0.35046647805532516, 0.3189214122952245, 0.2872690212853754, 0.2555268118296233, 0.22371099206501363, 0.19183642323292582, 0.1599165627279245, 0.1279633951602268, 0.09598734604598294, 0.06399716832672771], [-1.027208451114869, -0.9277768697802068, -0.8254219774461379, -0.7207781366894633, -0.6144021905760322, -0.5067734079985751, -0.3982934198786351, -0.2892861425147429, -0.1825, -0.0718, 0.0394, 0.1512, 0.2625, 0.3734, 0.4833, 0.5842, 0.7055, 0.8135, 0.921, 1.0254, 1.128, 1.2208, 1.2973, 1.3676, 1.4317, 1.4938, 1.55, 1.5959, 1.6325, 1.6585, 1.6698, 1.6614833943075813, 1.635442973016239, 1.5899849911538615, 1.5233385995476214, 1.4336558616859691, 1.3190117698692427, 1.1774042607063917, 1.0067542300086276, 0.9334637092160134, 0.9668461363949694, 0.9976151491562684, 1.0258374043529437, 1.0515788526241736, 1.0749047350178667, 1.095879579543516, 1.1145671976527294, 1.1310306806447277, 1.145332395993917, 1.1575339835965335, 1.1676963519331338, 1.1758796741435562, 1.1821433840107622, 1.186546171849761, 1.1891459802975801, 1.1900000000000002, 1.189164665190508, 1.1866956491566083, 1.1826478595883416, 1.1770754338034886, 1.1700317338435728, 1.1615693414343655, 1.151740052804134, 1.1405948733523983, 1.128184012161403, 1.114556876341934, 1.0997620652044378, 1.0838473642456912, 1.0668597389404633, 1.048845328326717, 1.0298494383719237, 1.0099165351069441, 0.9890902375127129, 0.9674133101435616, 0.9449276554694761, 0.9216743059178069, 0.8976934155929732, 0.8730242516504152, 0.8477051852984732, 0.8217736823988906, 0.7952662936332109, 0.7682186441983773, 0.7406654229902223, 0.7126403712281303, 0.6841762704677934, 0.6553049299414383, 0.6260571731558979, 0.5964628236680811, 0.566550689944257, 0.5363485491935105, 0.5058831300458653, 0.47518009392073884, 0.44426401489999784, 0.4131583578795709, 0.3818854547210808, 0.35046647805532516, 0.3189214122952245, 0.2872690212853754, 0.2555268118296233, 0.22371099206501363, 0.19183642323292582, 0.1599165627279245, 0.1279633951602268, 0.09598734604598294, 0.06399716832672771], [-1.087134885160501, -0.9795048637915695, -0.8701386679948996, -0.7595754135497517, -0.6482275339213107, -0.5363984179468942, -0.42429981193874156, -0.3120689483583656, -0.2022, -0.0886, 0.0251, 0.1389, 0.2524, 0.3661, 0.4798, 0.5935, 0.7056, 0.8099, 0.929, 1.0353, 1.1366, 1.2308, 1.3225, 1.414, 1.5015, 1.575, 1.6417, 1.7004, 1.7521, 1.7955, 1.8247, 1.8127484882372966, 1.7743956989694207, 1.705607654231657, 1.601952658442782, 1.458581747359764, 1.2702090608565502, 1.0310921423984265, 0.897400507862631, 0.9334637092160134, 0.9668461363949694, 0.9976151491562684, 1.0258374043529437, 1.0515788526241736, 1.0749047350178667, 1.095879579543516, 1.1145671976527294, 1.1310306806447277, 1.145332395993917, 1.1575339835965335, 1.1676963519331338, 1.1758796741435562, 1.1821433840107622, 1.186546171849761, 1.1891459802975801, 1.1900000000000002, 1.189164665190508, 1.1866956491566083, 1.1826478595883416, 1.1770754338034886, 1.1700317338435728, 1.1615693414343655, 1.151740052804134, 1.1405948733523983, 1.128184012161403, 1.114556876341934, 1.0997620652044378, 1.0838473642456912, 1.0668597389404633, 1.048845328326717, 1.0298494383719237, 1.0099165351069441, 0.9890902375127129, 0.9674133101435616, 0.9449276554694761, 0.9216743059178069, 0.8976934155929732, 0.8730242516504152, 0.8477051852984732, 0.8217736823988906, 0.7952662936332109, 0.7682186441983773, 0.7406654229902223, 0.7126403712281303, 0.6841762704677934, 0.6553049299414383, 0.6260571731558979, 0.5964628236680811, 0.566550689944257, 0.5363485491935105, 0.5058831300458653, 0.47518009392073884, 0.44426401489999784, 0.4131583578795709, 0.3818854547210808, 0.35046647805532516, 0.3189214122952245, 0.2872690212853754, 0.2555268118296233, 0.22371099206501363, 0.19183642323292582, 0.1599165627279245, 0.1279633951602268, 0.09598734604598294, 0.06399716832672771], [-1.0933090757116088, -0.9840210870838201, -0.8734707290931002, -0.762104285261265, -0.6502405387035232, -0.5380963313858868, -0.4258098305873951, -0.31346136261766194, -0.20425, -0.0902, 0.024, 0.1383, 0.2525, 0.3669, 0.4813, 0.5958, 0.7093, 0.8212, 0.9308, 1.0365, 1.1371, 1.2336, 1.3299, 1.4246, 1.5155, 1.597, 1.6652, 1.7284, 1.7845, 1.8284, 1.8681, 1.8544166426133375, 1.8099630651544494, 1.7291358974873132, 1.6056265051204497, 1.4323683623792094, 1.2014829656993908, 0.9042243093847673, 0.897400507862631, 0.9334637092160134, 0.9668461363949694, 0.9976151491562684, 1.0258374043529437, 1.0515788526241736, 1.0749047350178667, 1.095879579543516, 1.1145671976527294, 1.1310306806447277, 1.145332395993917, 1.1575339835965335, 1.1676963519331338, 1.1758796741435562, 1.1821433840107622, 1.186546171849761, 1.1891459802975801, 1.1900000000000002, 1.189164665190508, 1.1866956491566083, 1.1826478595883416, 1.1770754338034886, 1.1700317338435728, 1.1615693414343655, 1.151740052804134, 1.1405948733523983, 1.128184012161403, 1.114556876341934, 1.0997620652044378, 1.0838473642456912, 1.0668597389404633, 1.048845328326717, 1.0298494383719237, 1.0099165351069441, 0.9890902375127129, 0.9674133101435616, 0.9449276554694761, 0.9216743059178069, 0.8976934155929732, 0.8730242516504152, 0.8477051852984732, 0.8217736823988906, 0.7952662936332109, 0.7682186441983773, 0.7406654229902223, 0.7126403712281303, 0.6841762704677934, 0.6553049299414383, 0.6260571731558979, 0.5964628236680811, 0.566550689944257, 0.5363485491935105, 0.5058831300458653, 0.47518009392073884, 0.44426401489999784, 0.4131583578795709, 0.3818854547210808, 0.35046647805532516, 0.3189214122952245, 0.2872690212853754, 0.2555268118296233, 0.22371099206501363, 0.19183642323292582, 0.1599165627279245, 0.1279633951602268, 0.09598734604598294, 0.06399716832672771], [-1.0965082200600442, -0.986122589954553, -0.8748866537218764, -0.7631412658924641, -0.6511110068171198, -0.5389352079198726, -0.4266936554536957, -0.3144272071666496, -0.2062, -0.0918, 0.0229, 0.1377, 0.2527, 0.3678, 0.483, 0.598, 0.7127, 0.8247, 0.9321, 1.0369, 1.1384, 1.2383, 1.3374, 1.4355, 1.5295, 1.618, 1.6917, 1.7572, 1.8143, 1.868, 1.9068, 1.891044716200477, 1.8390999124402823, 1.74308232590407, 1.593854576970384, 1.3808927157763653, 1.0921462524308685, 0.8585884729194884, 0.897400507862631, 0.9334637092160134, 0.9668461363949694, 0.9976151491562684, 1.0258374043529437, 1.0515788526241736, 1.0749047350178667, 1.095879579543516, 1.1145671976527294, 1.1310306806447277, 1.145332395993917, 1.1575339835965335, 1.1676963519331338, 1.1758796741435562, 1.1821433840107622, 1.186546171849761, 1.1891459802975801, 1.1900000000000002, 1.189164665190508, 1.1866956491566083, 1.1826478595883416, 1.1770754338034886, 1.1700317338435728, 1.1615693414343655, 1.151740052804134, 1.1405948733523983, 1.128184012161403, 1.114556876341934, 1.0997620652044378, 1.0838473642456912, 1.0668597389404633, 1.048845328326717, 1.0298494383719237, 1.0099165351069441, 0.9890902375127129, 0.9674133101435616, 0.9449276554694761, 0.9216743059178069, 0.8976934155929732, 0.8730242516504152, 0.8477051852984732, 0.8217736823988906, 0.7952662936332109, 0.7682186441983773, 0.7406654229902223, 0.7126403712281303, 0.6841762704677934, 0.6553049299414383, 0.6260571731558979, 0.5964628236680811, 0.566550689944257, 0.5363485491935105, 0.5058831300458653, 0.47518009392073884, 0.44426401489999784, 0.4131583578795709, 0.3818854547210808, 0.35046647805532516, 0.3189214122952245, 0.2872690212853754, 0.2555268118296233, 0.22371099206501363, 0.19183642323292582, 0.1599165627279245, 0.1279633951602268, 0.09598734604598294, 0.06399716832672771]], "drag_coefficients": [[0.49027715986783027, 0.46761244875208674, 0.44490672320157065, 0.4221624469229053, 0.39938208780569795, 0.37656811765475895, 0.35372301192189626, 0.3308492494373141, 0.08962, 0.08207, 0.07317, 0.03925, 0.03529, 0.0335, 0.03343, 0.03667, 0.04038, 0.04459, 0.04955, 0.05512, 0.06142, 0.06914, 0.07561, 0.08352, 0.08551, 0.08551, 0.08551, 0.08551, 0.08551, 0.08551, 0.08551, 0.6141384916387614, 0.6364767634570125, 0.6587556980553567, 0.6809728780365341, 0.7031258927040289, 0.7252123383236447, 0.7472298183843238, 0.7691759438581823, 0.7910483334597351, 0.812844613904279, 0.8345624201654078, 0.8561993957316324, 0.877753192862076, 0.8992214728412178, 0.9206019062326588, 0.9418921731318779, 0.9630899634179564, 0.9841929770042389, 1.005198924087908, 1.0261055253984406, 1.0469105124449216, 1.0676116277621903, 1.0882066251557878, 1.1086932699456828, 1.1290693392087476, 1.1493326220199584, 1.1694809196922937, 1.1895120460153061, 1.2094238274923381, 1.2292141035763593, 1.2488807269043989, 1.2684215635305482, 1.2878344931575054, 1.3071174093666402, 1.326268219846555, 1.3452848466201097, 1.364165226269898, 1.3829073101621387, 1.4015090646689645, 1.4199684713890834, 1.4382835273667878, 1.4564522453092854, 1.474472653802334, 1.4923427975241508, 1.5100607374575776, 1.5276245511004731, 1.5450323326743203, 1.5622821933310092, 1.5793722613577927, 1.5963006823803771, 1.6130656195641322, 1.6296652538133987, 1.6460977839688722, 1.6623614270030385, 1.6784544182136434, 1.6943750114151737, 1.710121479128327, 1.7256921127674563, 1.7410852228259586, 1.7562991390595992, 1.7713322106677416, 1.7861828064724694, 1.800849315095579, 1.8153301451334245, 1.8296237253295933, 1.8437285047453964, 1.8576429529281568, 1.8713655600772705, 1.8848948372080296, 1.8982293163131865, 1.9113675505222403, 1.9243081142584326, 1.9370496033934295, 1.9495906353996781], [0.1118217122473246, 0.10006000000000001, 0.08908240190249703, 0.07888891795481569, 0.07516, 0.07516, 0.07516, 0.07516, 0.07516, 0.03524, 0.02773, 0.02457, 0.02248, 0.01877, 0.01835, 0.01782, 0.01798, 0.01834, 0.01941, 0.02057, 0.02159, 0.02216, 0.02285, 0.02421, 0.02965, 0.03755, 0.0443, 0.05205, 0.06218, 0.07667, 0.10006, 0.129788014102524, 0.15951059950495539, 0.189222328498549, 0.21891777535707285, 0.24859151732761287, 0.27823813562083355, 0.3078522164005158, 0.33742835177218966, 0.3669611407706819, 0.39644519034639947, 0.4258751163501653, 0.4552455445164308, 0.4845511114446825, 0.5137864655788643, 0.5429462681846388, 0.5720251943243032, 0.6010179338291907, 0.6299191922693708, 0.6587236919204777, 0.6874261727274883, 0.7160213932652715, 0.744504131695737, 0.7728691867214077, 0.8011113785352402, 0.8292255497665203, 0.8572065664226636, 0.8850493188267439, 0.9127487225505839, 0.940299719343235, 0.9676972780546732, 0.9949363955545519, 1.0220120976458333, 1.0489194399731376, 1.0756535089256443, 1.102209422534376, 1.1285823313637071, 1.1547674193969304, 1.1807599049157194, 1.2065550413733306, 1.2321481182613796, 1.2575344619700388, 1.282709436641495, 1.3076684450165148, 1.33240692927396, 1.3569203718631015, 1.3812042963285802, 1.405254268127862, 1.4290658954410396, 1.452634829972833, 1.4759567677466428, 1.4990274498905058, 1.5218426634148212, 1.5443982419816904, 1.5666900666657462, 1.5887140667063133, 1.6104662202507845, 1.6319425550890556, 1.6531391493789038, 1.6740521323621618, 1.6946776850715668, 1.7150120410281497, 1.7350514869290408, 1.7547923633255658, 1.7742310652915043, 1.793364043081394, 1.812187802778757, 1.8306989069341353, 1.848893975192806, 1.8667696849120798, 1.884322771768054, 1.9015500303517192, 1.9184483147543057, 1.935014539141766, 1.9512456783182837], [0.05351578512396693, 0.04730634527089072, 0.0415745546372819, 0.03632041322314049, 0.031543921028466475, 0.02724507805325986, 0.02357, 0.02357, 0.02357, 0.01934, 0.01638, 0.01437, 0.01274, 0.0107, 0.01005, 0.01039, 0.01097, 0.01171, 0.01256, 0.01352, 0.01444, 0.01536, 0.0167, 0.01944, 0.02555, 0.03209, 0.03917, 0.04629, 0.05407, 0.06336, 0.07501, 0.10507651731318803, 0.13513754411144424, 0.1651875908824725, 0.19522117011906398, 0.22523279732118395, 0.2552169919975083, 0.28516827866622896, 0.31508118785494343, 0.34495025709944804, 0.3747700319412509, 0.4045350669236226, 0.43423992658600385, 0.4638791864565871, 0.49344743404289093, 0.5229392698201494, 0.5523493082173293, 0.5816721786006032, 0.610902526254092, 0.6400350133577025, 0.6690643199618782, 0.6979851449590881, 0.7267922070518733, 0.7554802457172763, 0.7840440221674791, 0.8124783203064676, 0.8407779476825561, 0.8689377364365924, 0.8969525442456722, 0.924817255262191, 0.9525267810480593, 0.980076061503915, 1.0074600657931594, 1.0346737932606487, 1.0617122743458773, 1.0885705714904776, 1.1152437800398807, 1.1417270291389656, 1.168015482621538, 1.194104339893473, 1.2199888368093619, 1.2456642465425045, 1.2711258804480852, 1.2963690889193775, 1.3213892622368193, 1.3461818314098033, 1.3707422690110311, 1.395066090003278, 1.4191488525584146, 1.442986158868539, 1.4665736559490727, 1.489907036433665, 1.512982039360775, 1.5357944509517722, 1.5583401053804282, 1.5806148855336422, 1.6026147237632813, 1.62433560262898, 1.6457735556317752, 1.6669246679384377, 1.6877850770963687, 1.7083509737389306, 1.7286186022810834, 1.7485842616052034, 1.7682443057369495, 1.7875951445110643, 1.8066332442269821, 1.8253551282941272, 1.843757377866779, 1.8618366324683986, 1.8795895906052906, 1.8970130103694973, 1.9141037100308114, 1.930858568617798, 1.9472745264877216], [0.056809727891156486, 0.05003845049130766, 0.04375962962962965, 0.03797326530612245, 0.0326793575207861, 0.027877906273620565, 0.023568911564625854, 0.019752373393801967, 0.01225, 0.01079, 0.00973, 0.00898, 0.00844, 0.00807, 0.00703, 0.00705, 0.00759, 0.0082, 0.00884, 0.00957, 0.01038, 0.01152, 0.01362, 0.01711, 0.0206, 0.02457, 0.02976, 0.03568, 0.0441, 0.05486, 0.06789, 0.09805273060100951, 0.12820995311736044, 0.15835616047023837, 0.1884858475923325, 0.21859351243312908, 0.24867365696365298, 0.2787207881804755, 0.30872941910880397, 0.3386940698044705, 0.36860926835463775, 0.39846955187703637, 0.4282694675175552, 0.4580035734459986, 0.4876664398498317, 0.5172526499257315, 0.5467568008687602, 0.5761735048589846, 0.6054973900453581, 0.634723101526686, 0.663845302329497, 0.6928586743826399, 0.7217579194884276, 0.7505377602901538, 0.779192941235804, 0.8077182295377817, 0.8361084161284814, 0.8643583166115272, 0.8924627722085073, 0.9204166507010318, 0.9482148473679357, 0.9758522859174663, 1.0033239194142753, 1.0306247312010508, 1.057749735814622, 1.0846939798963633, 1.1114525430967408, 1.1380205389738274, 1.1643931158856269, 1.1905654578760443, 1.2165327855543369, 1.2422903569678916, 1.2678334684681616, 1.2931574555696121, 1.318257693801512, 1.3431295995524184, 1.3677686309072006, 1.39217028847645, 1.4163301162181234, 1.4402437022512704, 1.4639066796616993, 1.487314727299425, 1.5104635705677683, 1.5333489822039468, 1.555966783051028, 1.57831284282109, 1.6003830808494677, 1.6221734668399281, 1.6436800216006549, 1.6648988177708959, 1.6858259805381486, 1.7064576883457472, 1.7267901735907256, 1.7468197233118306, 1.7665426798675505, 1.7859554416040482, 1.8050544635128645, 1.823836257878284, 1.8422973949142312, 1.8604345033905934, 1.878244271248848, 1.8957234462068855, 1.9128688363529154, 1.9296773107283502, 1.9461457998995535], [0.051192608445848886, 0.0454448118356794, 0.04008669635162308, 0.03511826199367997, 0.03053950876185003, 0.026350436656133288, 0.02255104567652973, 0.019141335823039354, 0.00935, 0.00845, 0.0078, 0.00745, 0.00715, 0.00697, 0.00678, 0.00594, 0.00622, 0.006685, 0.00722, 0.00797, 0.00884, 0.01036, 0.01288, 0.01527, 0.01746, 0.01986, 0.02282, 0.02683, 0.03209, 0.03899, 0.04827, 0.07869785766660745, 0.10912015883310144, 0.13953134801405392, 0.16992587175322132, 0.20029817963767457, 0.23064272531137192, 0.26095396748799216, 0.2912263709628411, 0.32145440762364774, 0.3516325574600662, 0.38175530957169634, 0.41181716317444234, 0.4418126286050233, 0.4717362283234525, 0.5015824979133051, 0.5313459870795855, 0.5610212606440191, 0.5906028995375829, 0.6200855017900931, 0.6494636835166719, 0.6787320799009108, 0.7078853461745511, 0.736918158593505, 0.7658252154100368, 0.7946012378409261, 0.8232409710314391, 0.8517391850149295, 0.8800906756678939, 0.9082902656603101, 0.9363328054010788, 0.9642131739784046, 0.9919262800949354, 1.0194670629974967, 1.0468304934012478, 1.0740115744080885, 1.101005342419157, 1.1278068680412419, 1.154411256986951, 1.1808136509684672, 1.2070092285847325, 1.2329932062018945, 1.258760838826856, 1.2843074209737706, 1.3096282875233205, 1.3347188145746256, 1.3595744202896234, 1.3841905657297702, 1.4085627556849059, 1.432686539494135, 1.4565575118585725, 1.4801713136458035, 1.5035236326859165, 1.526610204558957, 1.549426813373665, 1.5719692925373452, 1.5942335255167408, 1.6162154465897611, 1.6379110415879339, 1.6593163486294402, 1.6804274588426042, 1.7012405170797003, 1.7217517226209482, 1.7419573298685767, 1.7618536490308094, 1.7814370467956704, 1.8007039469944683, 1.8196508312548527, 1.8382742396433072, 1.8565707712969797, 1.8745370850447196, 1.8921699000172172, 1.9094659962461307, 1.9264222152520927, 1.9430354606214846], [0.05132130177514794, 0.046035443786982246, 0.041069940828402374, 0.03642479289940829, 0.032100000000000004, 0.028095562130177523, 0.02441147928994083, 0.021047751479289944, 0.00697, 0.00658, 0.00632, 0.00616, 0.00605, 0.00599, 0.00595, 0.0059, 0.00549, 0.00503, 0.00548, 0.00624, 0.00735, 0.00895, 0.01056, 0.01194, 0.0133, 0.01483, 0.01664, 0.01905, 0.02218, 0.0263, 0.0321, 0.06274636452953906, 0.09338713265693077, 0.12401670900199974, 0.15462950022832694, 0.18521991606466234, 0.21578237032577635, 0.2463112819325663, 0.2768010759312295, 0.30724618451131835, 0.3376410480224913, 0.3679801159897724, 0.3982578481271369, 0.4284687153492348, 0.4586072007810697, 0.4886678007654492, 0.5186450258680179, 0.5485334018796975, 0.5783274708163432, 0.6080217919154394, 0.6376109426296493, 0.6670895196170392, 0.6964521397277935, 0.7256934409872453, 0.7548080835750389, 0.7837907508002453, 0.812636150072256, 0.8413390138672748, 0.8698941006902322, 0.8982961960319477, 0.9265401133213604, 0.9546206948726641, 0.9825328128271615, 1.0102713700896746, 1.0378313012593383, 1.065207573554602, 1.0923951877322797, 1.119389179000472, 1.146184617925198, 1.172776611330571, 1.1991603031923521, 1.2253308755247196, 1.251283549260092, 1.277013585121846, 1.302516284489765, 1.3277869902580655, 1.3528210876858402, 1.3776140052397694, 1.4021612154289362, 1.426458235631603, 1.4505006289137938, 1.4742840048395314, 1.4978040202725862, 1.5210563801695847, 1.5440368383643401, 1.5667411983432495, 1.5891653140116342, 1.6113050904508621, 1.6331564846661346, 1.654715506324785, 1.6759782184849616, 1.6969407383145636, 1.717599237800291, 1.73794994444669, 1.757989141965055, 1.7777131709520684, 1.7971184295580531, 1.8162013741447158, 1.834958519932255, 1.8533864416357293, 1.8714817740905525, 1.8892412128670166, 1.9066615148737194, 1.9237394989497947, 1.9404720464458285], [0.050893999999999995, 0.04580216, 0.04100984000000001, 0.03651704000000001, 0.03232376000000001, 0.02843, 0.024835760000000002, 0.021541040000000004, 0.006574999999999999, 0.00628, 0.00607, 0.00592, 0.00583, 0.00576, 0.00572, 0.00566, 0.00551, 0.00517, 0.00527, 0.00611, 0.00732, 0.00878, 0.01007, 0.01128, 0.01251, 0.01385, 0.01544, 0.01745, 0.02009, 0.02385, 0.02843, 0.05912595761469423, 0.08981630977093533, 0.1204954520338959, 0.15115778201581226, 0.1817977003990498, 0.21240961195860653, 0.24298792658387036, 0.27352706029944124, 0.30402143628483413, 0.33446548589287467, 0.3648536496666022, 0.39518037835449543, 0.4254401339238331, 0.45562739057200685, 0.4857366357356018, 0.5157623710970559, 0.5456991135887226, 0.5755413963941445, 0.6052837699463619, 0.6349208029230707, 0.6644470832384485, 0.6938572190314668, 0.7231458396505122, 0.7523075966341333, 0.7813371646877344, 0.8102292426560405, 0.8389785544911527, 0.8675798502160194, 0.8960279068831477, 0.9243175295283752, 0.9524435521195366, 0.9804008384998434, 1.008184283325809, 1.0357888129995478, 1.0632093865952763, 1.0904409967798467, 1.1174786707271491, 1.1443174710262098, 1.1709524965828233, 1.1973788835145514, 1.2235918060389288, 1.24958647735471, 1.2753581505159977, 1.300902119299094, 1.3262137190619132, 1.3512883275958039, 1.3761213659696205, 1.4007082993658926, 1.4250446379089374, 1.4491259374847683, 1.4729478005526406, 1.4965058769481008, 1.5197958646773766, 1.5428135107029777, 1.565554611720347, 1.5880150149254406, 1.6101906187730781, 1.6320773737259362, 1.6536712829940434, 1.6749684032646428, 1.6959648454222904, 1.716656775259053, 1.7370404141746845, 1.7571120398666427, 1.7768679870098283, 1.7963046479259166, 1.8154184732421672, 1.8342059725395792, 1.8526637149902874, 1.8707883299840713, 1.8885765077438723, 1.906024999930197, 1.9231306202343068, 1.9398902449600732], [0.039740591715976346, 0.03580792899408285, 0.03211360946745563, 0.028657633136094682, 0.02544000000000001, 0.022460710059171607, 0.019719763313609473, 0.017217159763313616, 0.00623, 0.00596, 0.0058, 0.00568, 0.0056, 0.00553, 0.00546, 0.00544, 0.00541, 0.0053, 0.00544, 0.00606, 0.00724, 0.00845, 0.00958, 0.01059, 0.01169, 0.01288, 0.01422, 0.01595, 0.01831, 0.02117, 0.02544, 0.05617636179033837, 0.08690711074392542, 0.11762663504898299, 0.14832932494349102, 0.17900957373959978, 0.20966177884747905, 0.24028034279842053, 0.2708596742670035, 0.30139418909213994, 0.33187831129681106, 0.36230647410630834, 0.3926731209647958, 0.4229727065500046, 0.4531996977858767, 0.4833485748529741, 0.5134138321964631, 0.543389979531498, 0.5732715428458139, 0.6030530653993481, 0.6327291087207085, 0.6622942536003054, 0.6917431010799637, 0.7210702734388414, 0.7502704151754664, 0.7793381939857161, 0.8082683017365626, 0.8370554554354022, 0.8656943981947944, 0.8941799001924364, 0.9225067596261887, 0.9506698036639916, 0.9786638893884864, 1.0064839047361744, 1.034124769430945, 1.061581435911793, 1.0888488902545674, 1.1159221530875758, 1.1427962805008764, 1.1694663649490997, 1.1959275361476238, 1.2221749619619495, 1.2482038492901073, 1.2740094449379362, 1.2995870364870759, 1.3249319531555115, 1.3500395666505154, 1.3749052920138318, 1.3995245884589445, 1.4238929602002812, 1.4480059572742, 1.4718591763516045, 1.495448261542049, 1.5187689051891748, 1.541816848657345, 1.5645878831093174, 1.5870778502748366, 1.6092826432099794, 1.6311982070471371, 1.652820539735483, 1.6741456927717948, 1.6951697719215013, 1.7158889379298154, 1.7362994072228328, 1.7563974525984543, 1.7761794039070224, 1.795641648721533, 1.814780632997312, 1.8335928617210235, 1.8520748995489058, 1.8702233714341048, 1.8880349632430002, 1.9055064223604068, 1.9226345582835418, 1.9394162432046487]], "cm": [[-0.09994117752385666, -0.09711004127918228, -0.09581086054830663, -0.09459784035861396, -0.09245347189548452, -0.0915325707696483, -0.09001574556005655], [-0.09994117752385666, -0.09711004127918228, -0.09581086054830663, -0.09459784035861396, -0.09245347189548452, -0.0915325707696483, -0.09001574556005655], [-0.09994117752385666, -0.09711004127918228, -0.09581086054830663, -0.09459784035861396, -0.09245347189548452, -0.0915325707696483, -0.09001574556005655], [-0.09994117752385666, -0.09711004127918228, -0.09581086054830663, -0.09459784035861396, -0.09245347189548452, -0.0915325707696483, -0.09001574556005655], [-0.09994117752385666, -0.09711004127918228, -0.09581086054830663, -0.09459784035861396, -0.09245347189548452, -0.0915325707696483, -0.09001574556005655], [-0.09994117752385666, -0.09711004127918228, -0.09581086054830663, -0.09459784035861396, -0.09245347189548452, -0.0915325707696483, -0.09001574556005655], [-0.09994117752385666, -0.09711004127918228, -0.09581086054830663, -0.09459784035861396, -0.09245347189548452, -0.0915325707696483, -0.09001574556005655]], "boundary_layer": {"angle_of_attacks": [-0.06981317007977318, 0.0, 0.03490658503988659, 0.06981317007977318, 0.13962634015954636, 0.17453292519943295, 0.24434609527920614], "reynolds_numbers": [10000.0, 50000.0, 100000.0, 300000.0, 500000.0, 750000.0, 1000000.0]}, "lift_distribution_func": null, "drag_distribution_func": null, "lift_distribution": [[[-1.6470045744562156, 1.632468543501904, 0.5984913458180319, 0.0444724156761201, 0.005752833132020132, 0.002239388179487446, 0.00014972371545380012, -0.001877182960336885, -0.004555800736470037, -0.008093622361508523, -0.012114355480663624, -0.01629190108027065, -0.020439762425065625, -0.024437973806805385, -0.02821633304315741, -0.031731502578140836, -0.03494448187634518, -0.037797374713294495, -0.04018148763411063, -0.0419391293110606, -0.044671710532950486, -0.045139224563695714, -0.045133917889598155, -0.04472768294806398, -0.044058906497370244, -0.043374218155987875, -0.0430183402052433, -0.04301204935110583, -0.043207670122607136, -0.043514726239824275, -0.043885659472880346, -0.044287300888710676, -0.04469828938296503, -0.045099894361134006, -0.04546735656437493, -0.04576920660704257, -0.0460153149523773, -0.046224040240563764, -0.04636516663328926, -0.04645605314918993, -0.04653288006898422, -0.04671797254318882, -0.04708306592894181, -0.0474990862765269, -0.04775948592382186, -0.047608163837321756, -0.04684604980216425, -0.04528031292097456, -0.042713584121938646, -0.03901834478488912, -0.034370404601265094, -0.029007852787020567, -0.02306373019222634, -0.01647716888009829, -0.009110509560628824, -0.0006961191116058376, 0.008415882155061286, 0.017493788088880337, 0.025688226305247863, 0.03262292188114922, 0.038527456799913117, 0.0436734538224481, 0.04820084039085389, 0.052103418303398645, 0.05536649359694473, 0.057994258878665134, 0.05999204270504079, 0.0613350235009933, 0.06208147687741888, 0.06237721760317139, 0.06237415287184809, 0.062228417557696175, 0.0621526427594597, 0.062380710298769175, 0.06286144243604991, 0.06339111033180043, 0.06384324092559789, 0.0641187614920164, 0.06410768091414074, 0.0637633125132864, 0.06315447942297726, 0.06234827266574985, 0.06139278392606373, 0.06034474670808643, 0.059241546973632375, 0.05805094145920634, 0.05670370870088431, 0.05514342384033431, 0.05331838468269448, 0.05116499737970462, 0.04880750528421797, 0.04591444955915679, 0.04268068219345529, 0.03908522064104884, 0.03509466926634412, 0.03060415960493014, 0.025333642582485646, 0.018772596766888743, 0.009759473873717117, -0.004046966000430003], [-1.0546139637201826, 0.8610460920260818, 0.31333322151896753, 0.03397673714180152, -0.01293868770886055, -0.015546259166158193, -0.01700341795515041, -0.01961151354938597, -0.024770739835784834, -0.03281058292115555, -0.042595905446542265, -0.053173350520733895, -0.0639249383603445, -0.07444700231806109, -0.08449666457825035, -0.09391945593442014, -0.10258172789508893, -0.11030495148130053, -0.1167580649199761, -0.1214493822730632, -0.126415892816851, -0.1277634445635273, -0.12778351425063741, -0.12667840071076683, -0.12483821514807993, -0.12295961897805045, -0.12201220550434232, -0.12205343067768623, -0.12266298347332956, -0.12358699744244185, -0.12469213643098906, -0.12588665128426568, -0.12711059525736107, -0.12831151596237117, -0.1294203296947987, -0.13034947378887365, -0.1311217832918012, -0.1317753834330088, -0.1322630482759557, -0.13261962130841937, -0.13294750310024964, -0.13359309035906458, -0.13475951684198978, -0.13608363562817702, -0.13698379279429548, -0.13673309345237286, -0.1347652001386832, -0.1305294490825334, -0.12345943171744307, -0.11318323594304801, -0.10000554196812997, -0.08477592706239266, -0.06787325234635858, -0.04913092875314789, -0.028167748297421705, -0.004230034194598689, 0.02169199352097559, 0.047525844782112026, 0.07086742988499434, 0.09064961251379657, 0.10751765227425099, 0.1222363024343161, 0.13519636202174956, 0.1463780962063055, 0.15573925358826166, 0.16329141522125887, 0.16904974087375596, 0.1729447196492256, 0.1751421861646952, 0.17605491281781024, 0.1761127012226197, 0.1757571002245935, 0.17558891590786765, 0.17627132496603515, 0.17766300413678934, 0.17918900470173652, 0.18049236800151047, 0.1812934505914229, 0.18128162211246623, 0.1803239396570884, 0.17861465194557133, 0.17634344034353894, 0.1736467475678775, 0.17068849069558836, 0.16758311217117122, 0.1642332541869771, 0.16043084503082275, 0.15602375495590112, 0.15086670897863722, 0.1447808387841104, 0.13788376888766696, 0.12978675803779607, 0.12074482551991354, 0.11070867627291865, 0.09960070219903745, 0.08715911224938418, 0.07266406902812964, 0.05458703563515415, 0.03059077553923988, -0.0050793396340033485], [-0.5797499211983317, 0.47677506545965537, 0.15953590139042895, 0.014095916042346706, -0.02281118166485653, -0.023816038981365414, -0.02428048584965385, -0.02642889908038943, -0.031701979995852315, -0.04040848181702573, -0.051224422447640305, -0.06304558023509396, -0.07513705145447584, -0.08701736851700412, -0.09839532124004131, -0.10908469360224841, -0.11892552595034918, -0.1277086006507782, -0.13504697088917636, -0.14036307785711855, -0.14532078410294286, -0.14687652231213286, -0.1469091251269393, -0.1456508321590963, -0.1435496842942892, -0.14140617962632607, -0.14033329804856268, -0.14039672380666715, -0.14111263672101312, -0.1421897956638958, -0.14347526380367243, -0.1448641459526607, -0.1462876671999996, -0.14768568140473448, -0.14897904055183103, -0.15006749275602932, -0.15097590320716134, -0.15174434213198712, -0.15232892080710714, -0.1527658139061492, -0.15317273944300658, -0.15394795867244154, -0.1553250185661519, -0.15688704063884223, -0.1579661623577027, -0.15772290961195856, -0.15550864168614695, -0.1506891455919038, -0.14261140231796815, -0.13084491146726346, -0.11568750034998371, -0.09816349022468471, -0.07870945680086473, -0.05713582735490527, -0.033006849737673344, -0.005457052717306847, 0.024376865427537902, 0.05411320556803848, 0.0809891137358691, 0.10377607697750005, 0.12321287368587383, 0.14017569457596893, 0.15511435874484278, 0.16800631791600984, 0.17880290025248247, 0.1875173720425033, 0.19416720784695207, 0.19867269314953495, 0.20122418360765618, 0.20229572487807565, 0.20238133344014483, 0.2019884900223293, 0.2018075827247337, 0.20260145223288112, 0.20420930723477512, 0.20596840543749934, 0.20747099609391426, 0.20839577487897726, 0.20838584825542053, 0.20728795997322047, 0.20532509328145604, 0.2027152182066231, 0.19961525505248937, 0.19621452095023403, 0.19264687851973283, 0.1887986955572978, 0.1844274724190589, 0.17936039293474304, 0.17343075207499495, 0.16643323893051912, 0.1585574763847662, 0.14927078161274931, 0.1388986738736382, 0.12738554754548656, 0.11464421828368122, 0.10038201403698516, 0.08378698675847517, 0.0634227110010402, 0.039373501792148886, 0.0028635117421086115], [-0.23448954344955256, 0.1658387892939905, 0.005260103947653614, -0.036601879056487915, -0.039052972117777016, -0.037755985240828877, -0.03678344857875181, -0.03840397003639133, -0.04422070781251988, -0.05453367440660374, -0.0676450732457101, -0.08214874030566618, -0.09708435798108977, -0.11182100476722363, -0.12597518642581362, -0.1393004308855136, -0.15158643915837988, -0.162563668454253, -0.171734894340631, -0.1783543163920912, -0.18365161314629325, -0.18562629143335482, -0.18567977238375, -0.1841051507939342, -0.18146811834567303, -0.17877987280319307, -0.177439593028859, -0.17753574094469787, -0.17845574212151236, -0.17983197477612353, -0.1814714840733825, -0.18324291232159148, -0.1850593591521141, -0.18684493978636074, -0.1885000181318206, -0.18989847143735467, -0.19106991904355938, -0.19206012824555763, -0.1928270195386005, -0.19341123674981398, -0.19396136039036274, -0.1949803790965214, -0.19676337599399604, -0.19878461227849012, -0.2002012909060947, -0.19995623424324638, -0.1972249051114321, -0.19120405023538867, -0.1810655910410467, -0.16626151437050513, -0.14710041190140435, -0.12493799689474726, -0.10032788084627713, -0.07303300124444623, -0.04250551555316012, -0.00765239019679466, 0.030090549957271638, 0.0677168081326422, 0.1017342393442098, 0.13058696751468268, 0.15520512843473908, 0.17669519339036785, 0.1956240713738032, 0.21196296777817933, 0.22565011570843957, 0.23670212023945225, 0.24514102495172657, 0.2508662809780395, 0.25411864186810434, 0.2554972554325002, 0.2556265559784282, 0.2551478104451239, 0.2549330512401661, 0.25594676178730913, 0.25798700760830096, 0.26021990674622036, 0.2621275126545426, 0.26330401399018766, 0.2632985596080206, 0.26191722423175096, 0.25944166018154996, 0.256147270731495, 0.25223248979745944, 0.2479377532686477, 0.24343526664717516, 0.23857929661239402, 0.233059113523641, 0.22665895022690982, 0.2191684847920885, 0.21032862937602845, 0.2002804885851517, 0.18857868092995628, 0.17514480492390513, 0.1607071574801747, 0.14476818213720657, 0.12698989239365518, 0.10641358267750346, 0.08139984863875858, 0.04924686705552894, 0.003259078601665086], [-0.15246479161774631, 0.08068596310856466, -0.010583111823344296, -0.04342116144973548, -0.044186152302805044, -0.04200108177137487, -0.040480308770008085, -0.04182448040019884, -0.04764214949591135, -0.05821840054586552, -0.07176757100626835, -0.08681384324705882, -0.10234151035539375, -0.11768270725729775, -0.13243089742864894, -0.14632441472577282, -0.15914043304651013, -0.17059506166334684, -0.18016501733547008, -0.18706425973101484, -0.19229908332087806, -0.1943619720224725, -0.1944158460816795, -0.19276701587521206, -0.19000711320587435, -0.18719428616124414, -0.18579872459978042, -0.18590687638451933, -0.1868772404668628, -0.18832522427790227, -0.1900489610689515, -0.19191104191464003, -0.19382057681432965, -0.19569819574614555, -0.19743968205166001, -0.1989131383451941, -0.20014897048274663, -0.2011935023008379, -0.2020069530488555, -0.20263022644789638, -0.20321884503960147, -0.20429946564424656, -0.20618123741164773, -0.2083141123082432, -0.20981595877853287, -0.20957959544997154, -0.20674133581616616, -0.2004595336287391, -0.18986620754631467, -0.17438627006648177, -0.1543210238921822, -0.13111438047634072, -0.10534109494985783, -0.076753482897778, -0.04477866979291914, -0.008272426402147245, 0.03126396751945789, 0.07067859574464849, 0.10631483355973205, 0.13654363297572517, 0.16233875799067904, 0.18485841700738467, 0.204695443538627, 0.22181934625210964, 0.23616536964682833, 0.24775086993190215, 0.25659893912531406, 0.26260437672558695, 0.2660194196290136, 0.2674714700078001, 0.26761433923079414, 0.2671194694515096, 0.26689990605179753, 0.2679657111611999, 0.2701057615464957, 0.27244705626498383, 0.2744473620384235, 0.2756818403483661, 0.2756784717884602, 0.2742341268752069, 0.2716436777853555, 0.26819547702348534, 0.2640973423914319, 0.25960141289075195, 0.25488898105678914, 0.2498067668924332, 0.2440280351477364, 0.23732770699208822, 0.2294856714146769, 0.22021104704954178, 0.2091048830622873, 0.1968898152187948, 0.18326050264645727, 0.16815476702472276, 0.1514759144330972, 0.13287019903126618, 0.11133395560320304, 0.08515105326545926, 0.05149220084544671, 0.0033327673969897544], [-0.11377021131834898, 0.03474718408165161, -0.02142015609446322, -0.04817954888128644, -0.047796488669755895, -0.04500032392184125, -0.04310188155842501, -0.044260910170653575, -0.05009362663669692, -0.06087564065246546, -0.07475694067886691, -0.09021054866398115, -0.10618046548655495, -0.12197197572964295, -0.13716182071368813, -0.15147732357804275, -0.164686562610871, -0.1764951583816571, -0.18636075898155802, -0.19346793284815636, -0.19864924424068453, -0.20078493208443532, -0.200845297820348, -0.19914677909990247, -0.19630056105568985, -0.193399803117017, -0.1919629411380524, -0.19207944415490252, -0.19308649102481584, -0.19458693820435316, -0.196372338675965, -0.1983008143014382, -0.20027852712077798, -0.20222352945025548, -0.20402821840744367, -0.2055564315264249, -0.20683918963457323, -0.2079233143021012, -0.20877049619186322, -0.2094219217174721, -0.21003824798601808, -0.21116358710991306, -0.2131174363645966, -0.21533178429713887, -0.2168954810558375, -0.21666449153744038, -0.21374628292447367, -0.2072709377929562, -0.19634637707964261, -0.18037182098413343, -0.15964432785665775, -0.13566380387673774, -0.10902958711814154, -0.0794861252235794, -0.04644214866534881, -0.008715805019927005, 0.032141635120145076, 0.0728735560824155, 0.10970208344949352, 0.14094422230620093, 0.16760591557670612, 0.19088354347562872, 0.2113890723378425, 0.22909077078479015, 0.24392168215517293, 0.2558997177116538, 0.2650487412783625, 0.2712601189085035, 0.2747945478938862, 0.27630025844193506, 0.27645272433923285, 0.2759456314433068, 0.2757222578751146, 0.27682625078443784, 0.2790396899518921, 0.28146072921845844, 0.28352922759291455, 0.28480631787970656, 0.28480437496968436, 0.2833134899065856, 0.28063828248609246, 0.2770766514528725, 0.27284332965525326, 0.26819906262829246, 0.26333178981253336, 0.25808270508801856, 0.2521133480535512, 0.24518473024849993, 0.23707298174330863, 0.2274990275308253, 0.21622629518493486, 0.20358522586520209, 0.18948761482363866, 0.17386776251237057, 0.15662480148683802, 0.1373924575547995, 0.11513304871621936, 0.08807255190392153, 0.0532869994126023, 0.0035313240125198556], [-0.0961101549807431, 0.010402771649444422, -0.028324089867259882, -0.051336193190318076, -0.05022831935974322, -0.047037863776297234, -0.0448951838034926, -0.04594132046424175, -0.05180261062661076, -0.06274959460145732, -0.07688565025255592, -0.09264655823013795, -0.10894746923723099, -0.1250744718066571, -0.14059238290759027, -0.15522069377764072, -0.16872099117868855, -0.1807913217435842, -0.19087554054949857, -0.19813702350558599, -0.20331786572525004, -0.2055062100116236, -0.20557047189586278, -0.20383465164169934, -0.2009243716880569, -0.19795853136109326, -0.196490967666719, -0.1966131525632105, -0.19764659998991538, -0.19918498183650302, -0.2010150240898492, -0.20299156873989607, -0.20501861300698995, -0.20701231119240907, -0.20886257878862913, -0.2104301187287751, -0.21174646094863792, -0.21285891657511477, -0.21372999552164532, -0.21440122294673614, -0.2150370537735237, -0.21619443603141766, -0.2182003736249852, -0.22047355107966343, -0.22208151690002717, -0.22185323135213925, -0.2188765595485983, -0.2122605324401789, -0.20108561749764756, -0.18474203416175228, -0.16352506836174438, -0.13897766243838747, -0.11171314941332008, -0.08147012704144271, -0.04764377848789821, -0.009024670518705247, 0.032799297043385085, 0.07449485935590262, 0.11219537147260934, 0.14417839790137635, 0.17147350209047157, 0.19530504986609415, 0.216299044456944, 0.23442285315030312, 0.2496079163628456, 0.2618725548330675, 0.2712411980590322, 0.2776026942859181, 0.2812239345680359, 0.28276840366778566, 0.28292743572312523, 0.28241100486196463, 0.28218452947850314, 0.28331623698218367, 0.28558320340097687, 0.28806245014614446, 0.29018071754121144, 0.29148886132795915, 0.2914878258339701, 0.28996274387487886, 0.28722537694789874, 0.2835806155521183, 0.279248253735747, 0.27449531487517526, 0.2695145429781437, 0.2641431297241189, 0.2580276197988024, 0.25093391022933265, 0.24263026712413016, 0.23283055659265123, 0.2212747969194731, 0.20834179316059306, 0.19391685675802595, 0.17793365649574136, 0.16028919048832943, 0.140608813860348, 0.11783005431332544, 0.09013515546243198, 0.0545328283271284, 0.0036058201717353933]], [[-0.0036907414544401075, -0.004100105932992492, -0.004569346405350787, -0.005428022783000738, -0.008375018434909332, -0.11458658707506583, -0.692923712808609, 0.21416582836999754, 0.090938447018388, 0.01096080745557829, 0.004582627122575226, 0.004042539646003244, 0.0036787695744407174, 0.003326009742512029, 0.0029409142528213556, 0.002517826109941725, 0.002066964536071801, 0.0016091546978041743, 0.0011698548098809647, 0.000773761187797604, 0.00010357433812924076, -7.14518706809897e-05, -0.0001504777346126702, -0.00013801783817905138, -4.959375956337953e-05, 8.223010342656427e-05, 0.00020482126744319058, 0.0002925636504763933, 0.0003657064923851789, 0.00044041810244302367, 0.0005269852604069914, 0.0006367754942445127, 0.0007774302943134979, 0.0009536859439037282, 0.0011726688967136642, 0.001443842406931185, 0.0017750410926620317, 0.002173710365786015, 0.0026477399955112946, 0.0032014056308329645, 0.0038354431252528355, 0.0045409560409533575, 0.005310266268814193, 0.006175777728373154, 0.007204191198929424, 0.00846135060999959, 0.009978695165428772, 0.011774071875624344, 0.013847338066793119, 0.0161646728267533, 0.01862238651903102, 0.021088668435881246, 0.023469579158879605, 0.025757078464327007, 0.02800248584196081, 0.030293510519059996, 0.03259494656507882, 0.034753268722211204, 0.036587981096701784, 0.03799192523781832, 0.03900492838520147, 0.039713171544508444, 0.040180729359202895, 0.040436665673340644, 0.040488902175601686, 0.04035057375145432, 0.040034889853776935, 0.03954883348478871, 0.03890731986920499, 0.038147798487537465, 0.03731879394784194, 0.03646888899005648, 0.03566610043909228, 0.034969917335882214, 0.03436238659635242, 0.033784512194613675, 0.03319521428480225, 0.03255850667972706, 0.031849215957785344, 0.031055973763783308, 0.030197880512465414, 0.0292948153589907, 0.028361661810425806, 0.027418875237894443, 0.026473315047386488, 0.025501971265385174, 0.0244809871657097, 0.023392666697409588, 0.02221866861602733, 0.020937460655826173, 0.01948881067114842, 0.01794225264914735, 0.016265781357082867, 0.014442171357269114, 0.012441919391093207, 0.010220852102328228, 0.007687185921645539, 0.0046725623083615974, 0.000976956609576274, -0.002403738739617765], [-0.0025971715306504334, -0.002684961931473692, -0.002745367888232267, -0.0028842297440259666, -0.003654859708994467, -0.03807461582495981, -0.10185376791910983, 0.03128426942431402, 0.01368880138534346, 0.004057572245684987, 0.002170209930169026, 0.002108832531964223, 0.0020336891266844173, 0.0019015661636865716, 0.0017098598647544436, 0.0014680468996572853, 0.0011907958612672096, 0.0008975243347243904, 0.0006105920938885077, 0.00035192551684041763, 3.142517575374974e-05, -9.204856131428003e-05, -0.00014672572249350242, -0.00013575227226199954, -7.031514060523803e-05, 2.5948280719206933e-05, 0.00011485897607007386, 0.000178215526602784, 0.0002308647974322927, 0.0002844926122392443, 0.00034657755532529664, 0.0004254254265734836, 0.0005266260509897093, 0.0006536377579186492, 0.0008116486286851104, 0.0010075451368571737, 0.0012470116635434846, 0.0015354490478967785, 0.001878588173005612, 0.00227951391393585, 0.002738709157956482, 0.003249616675032476, 0.0038066235189591936, 0.004433362491554045, 0.005178471918539488, 0.006090228707609888, 0.007191801651892764, 0.00849649221285542, 0.010004584818896578, 0.011691868495529353, 0.013488507661607802, 0.015292854291522433, 0.01703622595595868, 0.01871252542388256, 0.02035886590664278, 0.022039188002150333, 0.02372763644196656, 0.025311873415413914, 0.026659862972788193, 0.027693240694915196, 0.028441083679209892, 0.028966042448626855, 0.02931478807231665, 0.029508381120941063, 0.02955255613489792, 0.0294568749531434, 0.029230974489049887, 0.028879972989709225, 0.028414838897755805, 0.027862964631037507, 0.027259794286765778, 0.026640820507658616, 0.0260557433945373, 0.025548128443853062, 0.025104958159768504, 0.024683176479911802, 0.024253213433142802, 0.02379052656470092, 0.023272973042180244, 0.022693751480069947, 0.02206691749703386, 0.021407037989978957, 0.020725008374151067, 0.020035818859390958, 0.01934460580977469, 0.01863465013014047, 0.017888597045997417, 0.017093596232034623, 0.01623633440522109, 0.015301177334201792, 0.014264388917214934, 0.01314859013384498, 0.011941639662403924, 0.010632772189908254, 0.009204300729680988, 0.007629167992179062, 0.005850508513539034, 0.004063192400133832, 0.0018795180884597317, 0.00040637621135306543], [-0.002490480135133758, -0.002527054146284851, -0.002520842698237152, -0.0025433689315160044, -0.002972554667734484, -0.026392100948678363, -0.049725527446272205, 0.015128368847584584, 0.0037689462460346796, 0.0019259079638502387, 0.0018303649093980793, 0.0018472653938581217, 0.001818198142181652, 0.0017191051425954201, 0.0015541216121395876, 0.0013355340125232216, 0.0010791858521634104, 0.0008048292810532554, 0.00053496215904745, 0.0002916911800763069, 2.027843806924635e-05, -9.819622206573233e-05, -0.00015040539880719855, -0.0001393584647930629, -7.584564753417932e-05, 1.7295083786967252e-05, 0.00010318172632397645, 0.00016431887582588775, 0.0002150855254536653, 0.0002667607115235996, 0.0003265728008726463, 0.0004025592484159586, 0.000500130768704422, 0.0006226334359262744, 0.0007750833791409261, 0.0009641381838466729, 0.0011952894072398237, 0.0014737544165664685, 0.0018050711892843565, 0.0021922159657326848, 0.0026356434922282465, 0.003128995350485308, 0.0036668392839028377, 0.0042720346143077, 0.0049916259822644325, 0.0058723688772892866, 0.006936728750273907, 0.00819763715506044, 0.009655458316360237, 0.011286878086252252, 0.013025673948663583, 0.014772259547477911, 0.016460161235356326, 0.018083427817172572, 0.019677885553785145, 0.02130537603456994, 0.022940849175140797, 0.024475559267936948, 0.025781700760965406, 0.026783425473770498, 0.027508865792633938, 0.02801857519785442, 0.028357683540808473, 0.028546530847655516, 0.02859065413277348, 0.02849929822835699, 0.02828178532973522, 0.027943071996509583, 0.02749378843792569, 0.026960448844588526, 0.02637734968500955, 0.025778835794692968, 0.025213002224158076, 0.02472202966653971, 0.02429334411639389, 0.023885292016363458, 0.02346936072715651, 0.0230222016505969, 0.02252152888652259, 0.02196110535837848, 0.021354555401337044, 0.020715984896403826, 0.02005594197124344, 0.019388942668745544, 0.018719985903427737, 0.018032914121135366, 0.017310950735998788, 0.01654167878820018, 0.015712235254273222, 0.014807513575664195, 0.013809185982134342, 0.012732689814291329, 0.01159087010511763, 0.010340313101751347, 0.00898213527554059, 0.007494408150370251, 0.005830999711856204, 0.003922906640781175, 0.0018183723965481168, 0.0003950191150990134], [-0.002395156698854379, -0.0023827676629113574, -0.0023127210680736867, -0.0022238626594233857, -0.0023271388727930655, -0.01527104006485918, -0.01669517453198228, 0.004874128669816541, 0.002261987375494286, 0.0014246211861394954, 0.0015098606058136566, 0.001601796396140189, 0.001616788728131933, 0.0015490637678613227, 0.0014092239799392608, 0.0012122815092154163, 0.0009752492039510074, 0.0007182543214259875, 0.00046398919644050865, 0.00023479437178395044, 9.656170357046951e-06, -0.00010435699014231836, -0.0001543462169438589, -0.00014319834968820041, -8.135341164031955e-05, 9.053325068533987e-06, 9.228041246968734e-05, 0.00015146042925777642, 0.0002005639061381491, 0.0002505113653150457, 0.00030831145254883345, 0.00038176677252827287, 0.00047613141304404046, 0.0005946531600390404, 0.0007421972824306137, 0.0009252204998903004, 0.0011490448291465586, 0.0014187262980358858, 0.0017396333935848886, 0.0021146465138330013, 0.0025441947037687387, 0.003022092425492725, 0.0035430655024035343, 0.004129295470715471, 0.004826430303599004, 0.005679897254007895, 0.006711550088822103, 0.007934001745845258, 0.009347693899701512, 0.010930107094036731, 0.012618296986655116, 0.014314376964389053, 0.015953805587928242, 0.01753075511016437, 0.01907985881905937, 0.020661123445229152, 0.022250209930199615, 0.023741535745776764, 0.025011024297137054, 0.02598503130583839, 0.02669084055402205, 0.027187338134602987, 0.027518134768614713, 0.027702949339284758, 0.027747146054916624, 0.027659691886846027, 0.02744963353724231, 0.027121786041496898, 0.026686475229105822, 0.026169438230448074, 0.025603966097276838, 0.025023398575101944, 0.024474425668007626, 0.023998020356534946, 0.02358201159161253, 0.02318597836791724, 0.02278234227298232, 0.022348833978690946, 0.021862968949554726, 0.02131903097677516, 0.02073026592652673, 0.020110376860834243, 0.019468477702723034, 0.01881974743116175, 0.018169164212497146, 0.01750101585822354, 0.01679902886216982, 0.016051172567966232, 0.015244992345114276, 0.014365865474404674, 0.013386193690116977, 0.012348664144242094, 0.011228486626509606, 0.010016973520838036, 0.00870029480058636, 0.007257197469363763, 0.005642266484606953, 0.003789936803020938, 0.001745882697869696, 0.000370459220890322], [-0.002372363621990575, -0.00234541347309996, -0.0022562592012497096, -0.0021341368088140375, -0.002140917311484431, -0.012003727957971921, -0.010317348432434918, 0.0028883042265917674, 0.0018192863855739725, 0.0012791039694306859, 0.0014181989392589383, 0.0015326170612835735, 0.0015607211028245069, 0.0015021509458234866, 0.0013694529432342602, 0.001178482718768241, 0.0009466392562652914, 0.0006942073644694288, 0.00044398920625518355, 0.00021844603121149282, 6.525559906000931e-06, -0.00010642518521733727, -0.0001558702965745536, -0.00014466687369408586, -8.317496851885711e-05, 6.627886478098154e-06, 8.9256700542587e-05, 0.00014799171226583546, 0.00019671429623495124, 0.0002462636402126597, 0.00030359926806227544, 0.0003764719951995481, 0.0004701014856508403, 0.0005877138101089565, 0.0007341406325037998, 0.0009157938796813395, 0.0011379574676816408, 0.0014056511470353843, 0.0017242054256372745, 0.00209653497271023, 0.0025230116411920664, 0.0029974821198470404, 0.0035147040656934767, 0.004096701531831839, 0.00478880576764549, 0.005636144468381109, 0.006660428589391526, 0.007874195630504366, 0.009277903147102366, 0.010849213476923424, 0.012526018479881041, 0.014210724795559956, 0.01583918644217467, 0.017405576222073747, 0.01894432468611587, 0.020515041648307485, 0.02209364979228294, 0.023575323368747306, 0.024836827570039525, 0.025804905762185405, 0.026506549285645945, 0.027000232206861565, 0.027329275789936394, 0.027513294826748566, 0.02755761757315365, 0.027471149847908813, 0.027262877981432503, 0.02693758515671106, 0.02650550412869219, 0.025992281667374818, 0.02543090107532105, 0.024854472100865412, 0.02430937445742387, 0.023836325299857502, 0.02342327331802163, 0.023030074276552362, 0.022629356369359185, 0.0221991124265498, 0.021716740505386998, 0.02117631583165239, 0.02059115235578253, 0.019974917788093793, 0.019337814761111693, 0.01869388024710738, 0.018047997725818908, 0.017384615987445774, 0.01668758914928094, 0.01594497827211236, 0.015144419523943098, 0.014271393077989449, 0.01330267768355307, 0.012271704510921121, 0.011158613051072963, 0.009954755699671358, 0.008646586999716096, 0.0072129054189469174, 0.005608507204273382, 0.0037682423264629914, 0.0017374264016884336, 0.00037049258381936816], [-0.002359496550003587, -0.0023234437637467673, -0.002222313866693324, -0.002079362396875456, -0.0020259262708858475, -0.009970533221106795, -0.007159831638114877, 0.0019029800671490162, 0.0015436481991141697, 0.0011890209610977288, 0.0013618066988945077, 0.0014903209947720625, 0.0015266238053086975, 0.0014737334122225517, 0.001345416482818917, 0.0011580641078223434, 0.0009293262044757401, 0.0006795975126513335, 0.0004317617838467834, 0.00020836845032114762, 4.5755604595938875e-06, -0.00010777679061549277, -0.00015691062673178505, -0.00014566612225258614, -8.435934924833038e-05, 5.118025207086e-06, 8.742075368189619e-05, 0.00014591165821976424, 0.00019442441649243427, 0.00024375365987087334, 0.00030083223884688244, 0.00037338308361253234, 0.00046660736197611495, 0.00058381647324128, 0.0007297365992704351, 0.0009107423878881932, 0.0011320909945659657, 0.0013987800796208024, 0.0017161179431839008, 0.0020869519758597126, 0.0025117045978867783, 0.0029842539127779796, 0.003499374603580995, 0.004079000729136511, 0.004768293720466927, 0.005612223728524382, 0.006632431030768293, 0.007841420212451761, 0.009239665771934118, 0.010804936779567405, 0.012475614994939105, 0.014154234144554084, 0.015776861951840908, 0.017337675250913485, 0.018870966138977565, 0.02043613335139924, 0.02200922394266568, 0.023485805527497683, 0.02474308770642296, 0.025708035235544723, 0.026407499870730138, 0.026899718249134313, 0.02722786911825306, 0.02741164994269313, 0.027456250380874937, 0.02737052283797656, 0.0271634084372183, 0.026839665139426327, 0.02640948267219218, 0.025898311230849475, 0.025339104190144904, 0.024764865536825772, 0.024221814368738808, 0.023750528533525706, 0.023339004111550786, 0.0229472433189729, 0.02254764222518058, 0.02211897137377869, 0.021637841063555572, 0.0210990658708248, 0.020515790714615036, 0.019901593104399436, 0.019266625775616407, 0.018624868250596897, 0.0179811813215862, 0.017320066601392042, 0.016625435880043136, 0.015885393461993903, 0.015087620564346756, 0.014217650733040493, 0.01325470540550707, 0.012227623483793366, 0.01111872187064984, 0.009919381512489124, 0.008615961253061619, 0.007187440307175439, 0.005588757957179833, 0.0037549677930453825, 0.0017311415397535405, 0.00036835936919930694], [-0.002352331333764439, -0.002310875777421718, -0.002202627367591777, -0.002047301193227459, -0.001958160369072178, -0.00876660207891762, -0.005589399655787699, 0.0014118971834445548, 0.0013802975933516475, 0.0011358548824598042, 0.0013286459866383195, 0.0014655411786382668, 0.001506711032458871, 0.0014571770432821184, 0.0013314319343889253, 0.0011461874112093859, 0.0009192455905871402, 0.0006710703682500763, 0.0004245983383956108, 0.0002024356192375857, 3.420567523275054e-06, -0.00010859907241989032, -0.00015755801477309204, -0.00014628695729516575, -8.50779219534253e-05, 4.224036357276982e-06, 8.634958546551195e-05, 0.00014470724284011552, 0.00019310512135920215, 0.00024231355423794457, 0.00029936409443061707, 0.0003718604807622065, 0.00046498435274600053, 0.0005819396405956528, 0.0007275258355611817, 0.0009081132330631882, 0.0011289519234460239, 0.0013950306757851995, 0.001711648338236864, 0.002081647378036543, 0.002505449620197388, 0.002976945562967819, 0.0034909173179373874, 0.00406925012104954, 0.0047570137681884105, 0.005599094174606215, 0.006617094073359249, 0.007823500902234822, 0.00921879909907843, 0.010780816001470128, 0.012448210391925677, 0.014123570847002406, 0.015743081582549747, 0.017300921923295583, 0.01883130836404554, 0.020393524583507676, 0.021963679133833226, 0.023437547918805927, 0.024692578042469795, 0.025655857777622606, 0.02635431729323772, 0.026845940233371227, 0.027173821375768393, 0.02735746615800037, 0.027402162763498755, 0.027316756484559848, 0.027110175288624836, 0.026787169668683188, 0.02635791444760669, 0.025847813653656605, 0.02528975702284487, 0.024716684559664057, 0.024174725691611686, 0.023704381551330367, 0.023293672517542677, 0.022902255761565453, 0.022503313792971817, 0.022075389018873705, 0.0215951169798303, 0.021057317798334994, 0.020475110889128723, 0.019862049533321532, 0.019228265235943516, 0.018587708992747972, 0.017945230723342143, 0.01728536152279693, 0.016592044866387327, 0.015853408690239174, 0.015057158616992737, 0.014188856894664583, 0.01322935997337129, 0.012204300500498652, 0.01109756719427972, 0.00990056543292325, 0.008599830828282647, 0.00717411942833707, 0.005578496989203007, 0.0037481743386540184, 0.0017280913841280542, 0.00036752421646819237]], [[-0.0001664148926006849, -0.00022174771059010429, -0.00026020245796267187, -0.0002854183801816921, -0.00030501786065183223, -0.00034173869263343277, -0.00047243633136250727, -0.004065985749198589, -0.03731288854001387, -0.09837215139062158, 0.18024521275813546, 0.05096778458549438, 0.013186096516882892, 0.003666827315585288, 0.0033787786404071143, 0.0032129189437068327, 0.0030787107620361314, 0.002954292544742776, 0.0028349922131574437, 0.002719868146504511, 0.002468561494953608, 0.002429900089495983, 0.002420292679878548, 0.0024404247238083766, 0.002487958542812528, 0.002556030848871332, 0.002631392574321536, 0.0027028943452633695, 0.0027755634291731553, 0.002854499330881324, 0.002943711147151162, 0.003048705079852492, 0.0031731677262872493, 0.003319038795717536, 0.0034893526102128653, 0.0036881839610148352, 0.003920527267571617, 0.004191331909538019, 0.004505002626138378, 0.0048644896494692905, 0.005272201363804971, 0.00572949451150363, 0.006236385007599061, 0.006806196539794414, 0.007467940742869201, 0.008246020616259453, 0.009147195338045732, 0.010169930919168988, 0.01130117186967767, 0.012511108323130045, 0.013743010616140233, 0.014931698508837696, 0.016028873426946366, 0.01702682383142692, 0.017949772336440538, 0.01883550459933151, 0.019681935314414898, 0.020439492295844595, 0.02104923301779036, 0.021470265124298293, 0.021714854264746147, 0.021819695593343683, 0.02181554655420848, 0.02172039386805771, 0.021540180780528773, 0.021282804183401637, 0.020956087470305442, 0.020565807658710963, 0.0201173820488448, 0.019616994131056255, 0.01909991080532498, 0.01857997947221161, 0.018085785555801807, 0.01763921009233394, 0.017231721001851715, 0.01683964933781099, 0.016446171234443637, 0.01603786578145529, 0.015600277546392828, 0.015131743617363714, 0.01463980428819756, 0.014132541314676044, 0.013616129118853999, 0.013099590473330192, 0.012584560576964452, 0.012059097216014746, 0.01151333891276725, 0.010939628603460242, 0.010329876726769318, 0.009674772174575762, 0.008940021943296609, 0.008167960104667903, 0.007337158547318837, 0.006438086396990977, 0.00545558834614356, 0.004368018659725156, 0.003133440454235694, 0.0016817941526504959, -4.9253266905918385e-05, -0.0013009792985009324], [-0.00015041418499362253, -0.00016315858718768348, -0.00015202914907205839, -0.00011556211505607929, -5.288074161585012e-05, 3.025320665433572e-05, 0.000101152408373721, -0.0014697471893526, -0.007061890922151514, -0.020015839263408837, 0.04075650774732195, 0.011155533559345114, 0.0036079229196669194, 0.003269121687062714, 0.0031824264101789354, 0.0031233914325381473, 0.0030542619151856967, 0.0029722385375789942, 0.002882255730981632, 0.0027892770685706467, 0.0026354677312244025, 0.0025986810175085864, 0.002592180983699729, 0.0026168737418514943, 0.0026703597116783913, 0.002745308627557977, 0.002827549978355184, 0.002905435361159344, 0.0029845106342160114, 0.00307027108981853, 0.0031670426451108212, 0.0032807929513780326, 0.0034155267204410674, 0.0035733519563002, 0.003757555670621428, 0.003972548028745971, 0.004223724228336412, 0.004516431893283018, 0.004855433965885434, 0.005243911175057463, 0.005684444007405137, 0.006178465801478961, 0.0067260176824480485, 0.007341563286235776, 0.008056515585548856, 0.008897422450284789, 0.009871716803321487, 0.010977862109788888, 0.012201886252089445, 0.013511695491951541, 0.014848004793009097, 0.01613812285975994, 0.017329705037036323, 0.018414301811110933, 0.01941798659449049, 0.02038164304832939, 0.021302851923268442, 0.022127739322748877, 0.022792314602518706, 0.023252316723025416, 0.023521108458353812, 0.023638143983826174, 0.023636844010709545, 0.02353659435397766, 0.023343808673236485, 0.023067024155689515, 0.022714703937232354, 0.022293092311441352, 0.021808315907128128, 0.021271926419396053, 0.020713222371044997, 0.020151033079177264, 0.019616474172705043, 0.019133339381274036, 0.018692395943259908, 0.018267981654324524, 0.017841886537430005, 0.01739958291852306, 0.01692541337123519, 0.01641759884693122, 0.01588441775057447, 0.015334645408563885, 0.014774976984797142, 0.014215180569945036, 0.013657058085890187, 0.013087737780954395, 0.01249658525686308, 0.011875360094156868, 0.011215360263496309, 0.010506565735556028, 0.009729611494736123, 0.00890424662762956, 0.008018342934876953, 0.00706315226941325, 0.006024856898628732, 0.0050053907691283055, 0.003773399661830746, 0.0023845196197089706, 0.0009128752147099173, 0.00029687132294272414], [-0.00014393324305956708, -0.00014550409043954186, -0.00012177276620750452, -6.998357118085357e-05, 1.2916464612029476e-05, 0.00012563012014455834, 0.0002473633364174344, 0.0002586004019029491, -0.00142161024015851, -0.009245034900556065, 0.02153114356025338, 0.00859818228858636, 0.0033085670858459355, 0.0031153949280509044, 0.0030819415215631992, 0.0030513575691630953, 0.003000080618678472, 0.0029302670012272304, 0.002849249101528317, 0.002763434270894584, 0.00263715833969291, 0.002601431382034967, 0.002595833926860377, 0.0026213147371619873, 0.0026754959005464572, 0.002751041741550978, 0.0028337664712308583, 0.00291207571343644, 0.002991562009516774, 0.003077736484849548, 0.00317493887446156, 0.0032891621766881676, 0.0034244302902187804, 0.003582861536468464, 0.003767756507286417, 0.003983542645879197, 0.004235633838141262, 0.004529396489076553, 0.004869611170722106, 0.005259468139950414, 0.005701551774791637, 0.006197292679945078, 0.00674673783175999, 0.007364417850801806, 0.00808187200265352, 0.008925784636142747, 0.009903645752356574, 0.011013942248650257, 0.012242684860302224, 0.01355769449600379, 0.014899957085675791, 0.0161959855383399, 0.017393213250143976, 0.018483133016089413, 0.019491886392074706, 0.020460514370436805, 0.021386549581007146, 0.022215854284246873, 0.0228841402658852, 0.023346972356145523, 0.02361778653758935, 0.023736129381017494, 0.02373558390665255, 0.023635592523461754, 0.02344258955594137, 0.023165143339086553, 0.022811749174952326, 0.022388673868617353, 0.02190213077470791, 0.021364873718637222, 0.020804204038937384, 0.020239939557067824, 0.019703360061411986, 0.0192183791120243, 0.018775728144255738, 0.018349633656340056, 0.01792181398900219, 0.01747768403811374, 0.017001522120355897, 0.016491547152212446, 0.015956097947542235, 0.015403990974660164, 0.014841950617209304, 0.014279783878016488, 0.013719307389833985, 0.013147611676864892, 0.01255402989741735, 0.011930206963571185, 0.011267576553836275, 0.010556136101948313, 0.009787435227925426, 0.008967313133756306, 0.00808925986116659, 0.0071458213084603425, 0.006125364509136548, 0.005012810017211894, 0.003779777613199896, 0.002388699935562398, 0.0009208899561922798, 0.00030753367960857474], [-0.00013773691041461496, -0.00012777836294435843, -9.095627138712066e-05, -2.317176472949754e-05, 8.088519089864822e-05, 0.00022452180354221404, 0.0003991504265859922, 0.0005364161974425161, -0.0002846546560216442, -0.0020306410532408806, 0.008664198133694203, 0.005986794794908227, 0.0030108917127333406, 0.002967393671150587, 0.0029887885615704664, 0.002987470438596498, 0.002954447177882661, 0.0028969983779008647, 0.0028249570735556736, 0.002746243067498915, 0.002647957162681911, 0.002613201568945254, 0.002608516655634024, 0.0026348984727268643, 0.0026899833126816175, 0.002766404731385967, 0.0028499124673092486, 0.0029289281133628785, 0.003009111602835298, 0.003096009326158973, 0.003193990181594861, 0.0033090939083837635, 0.0034453780267208875, 0.00360497878134362, 0.0037912221144960957, 0.004008568505568812, 0.004262469719133061, 0.004558329971748834, 0.00490096444720215, 0.005293584190742395, 0.005738786469990458, 0.006238003978782101, 0.006791289895084333, 0.007413293874357194, 0.008135793834632497, 0.008985706625262116, 0.00997060688456307, 0.011089000505069984, 0.012326832494409442, 0.013651725175649332, 0.015004741605498736, 0.01631132088343605, 0.017518486816472608, 0.018617643437362125, 0.01963509239430325, 0.020612177993959892, 0.021546374718980615, 0.022383086598158228, 0.023057497520818808, 0.023524840008255974, 0.023798671744999774, 0.023918770450691417, 0.02391900199481485, 0.023818933957191892, 0.02362504408479865, 0.023345962283130926, 0.02299024622530777, 0.022564207470092874, 0.022074170232612114, 0.02153417311739707, 0.020969549438715804, 0.020401205516040983, 0.019860697990194756, 0.019372146222678452, 0.01892621286866925, 0.01849692104848303, 0.018065665976503494, 0.01761779170289602, 0.017137492859748332, 0.01662301276664769, 0.0160828256656136, 0.015525829892386753, 0.014958809644836221, 0.01439165010250321, 0.013826191911276386, 0.01324944698356846, 0.012650689344161407, 0.012021620489361156, 0.011353481846522587, 0.010636188464802116, 0.009860145792772442, 0.009033992311371362, 0.008149284153959728, 0.007198499678578745, 0.006169866241971558, 0.005048073109036033, 0.0038043199941469982, 0.002400778694707097, 0.0009217030139154258, 0.0003167021279673779], [-0.00013572573659774458, -0.00012219014651942818, -8.13224129651135e-05, -8.60876262434046e-06, 0.00010195901819270615, 0.0002551170984558731, 0.00044607680949550725, 0.0006224266451537395, 6.93347939503613e-05, -0.0005761950685617119, 0.00606683618145477, 0.005170926798886071, 0.0029165099648739623, 0.002919556173690514, 0.0029579840899381406, 0.0029657623059106512, 0.0029384325850308627, 0.0028848622707760836, 0.0028156554767424934, 0.0027391971486120993, 0.002649671209974467, 0.0026152390597353097, 0.002610840660451301, 0.00263748614071876, 0.002692817673559214, 0.0027694638205395957, 0.0028531631199320813, 0.0029323493079577777, 0.0030126997526545335, 0.003099768364909196, 0.0031979303972690925, 0.003313236370059062, 0.003449751736445499, 0.003609616986770579, 0.003796163879356968, 0.004013860394761258, 0.004268166688977933, 0.004564495378616369, 0.0049076694183301526, 0.0053009043228712995, 0.005746799755132128, 0.006246788169753139, 0.006800924639122846, 0.007423886728625356, 0.008147506820130108, 0.008998757329437416, 0.00998523450187983, 0.011105451060062858, 0.012345340300259118, 0.013672482905996848, 0.01502800245364032, 0.0163370505521664, 0.01754655656536888, 0.01864790227034429, 0.01966742275951604, 0.020646530967092097, 0.021582684870356025, 0.022421179941777364, 0.023097076201235776, 0.023565530654116207, 0.023840130400952224, 0.023960700332142666, 0.023961173222095487, 0.023861143417725345, 0.023667098144131406, 0.023387681090502377, 0.023031464007251725, 0.02260476844805189, 0.022113949160412375, 0.02157343533914183, 0.021007932946321136, 0.020438673630557406, 0.01989728050590148, 0.019407751752376988, 0.01896079611157332, 0.018530408281780368, 0.018098148398304547, 0.01764930129935315, 0.01716799974394227, 0.016652472200433945, 0.016111203718876106, 0.015553106375039686, 0.014984974772890446, 0.014416709816169795, 0.013850153826673003, 0.013272295170933961, 0.012672389348826309, 0.012042123937466478, 0.011372725461590216, 0.010654091707808887, 0.009877910398755976, 0.009050311285288031, 0.008164021255793788, 0.007211498512102275, 0.006180933729511085, 0.005056957681553269, 0.0038106712469817236, 0.0024042329381896684, 0.0009228873178897285, 0.00032349370090873264], [-0.0001344383063520109, -0.00011864246488502115, -7.522134548358768e-05, 6.006512440594943e-07, 0.00011527251286521903, 0.00027443341536076085, 0.00047569741464974707, 0.0006767407778072732, 0.0002934604207876691, 0.00015243124501734595, 0.004764612503895905, 0.004654070211978226, 0.0028564927567959, 0.002888969333083541, 0.0029381630471173137, 0.0029516921200766623, 0.0029279656822541657, 0.0028768540055294114, 0.002809447539494917, 0.0027344243751212414, 0.002650447879003445, 0.0026162242385624314, 0.002612007516475851, 0.0026388166263776698, 0.0026942977329819863, 0.0027710770943657156, 0.0028548878199295812, 0.0029341726650629445, 0.003014619363949533, 0.0031017859389682457, 0.0032000511534022178, 0.0033154716432488513, 0.003452117406549606, 0.0036121313700836714, 0.003798848583554148, 0.004016741252694524, 0.004271274206586709, 0.004567864745892763, 0.004911340179831031, 0.0053049184765477635, 0.005751200512150037, 0.006251618423981167, 0.006806228475918239, 0.0074297241798057115, 0.008153968665843747, 0.009005966358729236, 0.009993326285693814, 0.011114565660509763, 0.012355612004789374, 0.01368402343077337, 0.015040968607317202, 0.01635142603505412, 0.017562271511795246, 0.01866487374105939, 0.019685585909814434, 0.020665859545955515, 0.021603142484835292, 0.02244266789840224, 0.023119425009780398, 0.023588528272658872, 0.0238635818127561, 0.023984435730780088, 0.023985061172686808, 0.023885067139267406, 0.02369094609678798, 0.023411349448106404, 0.023054856851293277, 0.022627795447164402, 0.022136538552693777, 0.021595760666443847, 0.021029768201904855, 0.020459822135848516, 0.019917666868718233, 0.019427529352214774, 0.01898004456476859, 0.018549159210625867, 0.01811640585885309, 0.017667051896765575, 0.0171852134739952, 0.016669116940738127, 0.01612725632683192, 0.01556855300869513, 0.014999808370582807, 0.014430932747359713, 0.013863769792228036, 0.013285294965668822, 0.012684753723496481, 0.012053826241428037, 0.01138373111223844, 0.010664356907546033, 0.009888610988649498, 0.009056241838910578, 0.008168866569175337, 0.007215211520366868, 0.006183385490817425, 0.005057982685980093, 0.0038100258698757503, 0.0024020004974091565, 0.0009226297073097571, 0.00032248540772282427], [-0.00013366353345770475, -0.00011651899777577713, -7.157544063119142e-05, 6.098834515629113e-06, 0.00012321567148849394, 0.00028595310316922396, 0.000493359781581849, 0.000709136829999282, 0.0004274539610136123, 0.0005171115110838051, 0.004112371304434677, 0.004345035571890342, 0.002820530520696957, 0.0028705761881679366, 0.002926195056795817, 0.0029431568915304295, 0.0029215827737186567, 0.002871941292770754, 0.002805612743567493, 0.002731449833871525, 0.002650790311576966, 0.002616692721490982, 0.002612584657360082, 0.0026394902310533457, 0.0026950580980931492, 0.0027719134786653183, 0.00285578689371564, 0.0029351270119940074, 0.003015627496280481, 0.0031028485693267265, 0.003201170890074462, 0.0033166544686200937, 0.0034533718301918486, 0.0036134672581358135, 0.0038002776146026664, 0.004018277423245702, 0.004272934053067143, 0.004569667353370204, 0.0049133070122947065, 0.005307072315495723, 0.00575356474440758, 0.006254216181421995, 0.0068090835991853815, 0.007432869357697869, 0.008157453486848099, 0.009009858285885446, 0.009997700064995604, 0.011119498787106084, 0.012361179170036991, 0.013690287334682034, 0.015048021562511716, 0.016359260437043013, 0.017570850206457586, 0.01867403168456909, 0.01969524197045333, 0.020675951525324525, 0.02161361886725669, 0.02245346735721826, 0.02313047289426781, 0.023599722422528644, 0.02387480601409567, 0.0239958007601617, 0.023996491108610025, 0.0238965059121793, 0.023702341363814963, 0.02342265319645394, 0.023066025501345202, 0.022638788055723443, 0.022147315682539782, 0.02160710918098071, 0.02104072699233789, 0.020470444329093118, 0.019927980953117236, 0.019437564070373822, 0.0189898333336706, 0.018558722567773724, 0.01812575548048656, 0.017676190865791246, 0.017194135221407506, 0.016677809243318575, 0.016135708166959913, 0.015576758082764807, 0.015007763876819314, 0.01443881713607829, 0.013871588552582208, 0.013293043227721905, 0.012692416746947086, 0.012061382734693746, 0.01139115372221625, 0.010671611642064848, 0.00988976490409635, 0.009061081063351024, 0.008173575204592779, 0.007219606639519938, 0.006187337666863366, 0.0050613696943390095, 0.0038127163021716335, 0.0024038330882223398, 0.0009234526213307299, 0.000322525566404832]], [[-0.004086899341397466, -0.003972271729580904, -0.003833422684789436, -0.0036795577263566475, -0.0035275055000259306, -0.003401208739967073, -0.003327238239807419, -0.003320314628048128, -0.0033722314273745787, -0.0034090320321460885, -0.00296772273204245, 0.00047903794753153465, 1.645775752315937, 2.023609640817852, -0.16859653371615255, -0.015883545045919555, -0.012008180016020921, -0.011152596563019215, -0.010774480473180238, -0.01053424745351127, -0.009912099446112146, -0.009941976495249687, -0.01001319557326553, -0.010130520794721362, -0.010295216072763076, -0.010503274722323066, -0.010741094552687068, -0.010987580411266221, -0.011248795014460217, -0.011533387614443499, -0.011850123255127926, -0.012212977863689231, -0.012631241333154877, -0.013109209950353234, -0.013653725620025006, -0.014274005120010142, -0.014984032449697735, -0.015797960775115052, -0.016727443717104627, -0.017780997458988024, -0.018967803313323633, -0.020300276319514553, -0.021785552873689835, -0.023453665472273105, -0.025370226476776933, -0.02758064238641204, -0.030085771033838266, -0.0328628634297621, -0.03585593594659087, -0.03896705594847415, -0.042043144548764476, -0.04492356530559347, -0.0474878597236704, -0.04971193616103948, -0.05165516634257739, -0.05340142390981405, -0.05496936700038023, -0.05628222859615852, -0.05724720621669983, -0.05778741508465208, -0.05792283048248751, -0.057734138942937406, -0.05729556591504421, -0.05665740657534614, -0.05583793847115603, -0.05485362962674956, -0.053734747444755385, -0.052496330278005494, -0.05114969691086739, -0.04972259574711817, -0.048258797371193624, -0.04680141155219457, -0.045413052766681734, -0.044134390520591614, -0.042944005003814525, -0.04179303920229962, -0.040644994451249035, -0.03947065096082599, -0.03823879034276374, -0.036949367833210796, -0.03561814833495229, -0.03426188679615199, -0.03289367252799681, -0.031533706803469105, -0.030182738896189963, -0.028810377236015212, -0.02739573151326387, -0.025921846874422047, -0.024370497350387012, -0.022721057212043552, -0.020771275526720638, -0.01885386396261502, -0.01680047543453126, -0.01458529018377824, -0.012167221629942179, -0.009491652512207117, -0.0064604663575915135, -0.002815858362501976, 0.0011823715394685245, 0.0035772976731857195], [0.00289481244577755, 0.0028494181728731596, 0.002789655656596307, 0.0027241031485528496, 0.002667261399760401, 0.002639742292529439, 0.002666330034428731, 0.002769058315992968, 0.0029598632481937196, 0.0032195784403315072, 0.0033686612165054496, 0.002576970077061026, -0.5129967559904482, -0.2796135820647374, 0.028600968631907968, 0.008509780309922632, 0.007390113204661287, 0.007186689689472238, 0.007109689315875802, 0.007055436566932556, 0.006875313262243085, 0.006908807931492488, 0.006968364067041506, 0.007057904531022373, 0.007178714967144568, 0.007328261506477863, 0.007497389974325155, 0.007672165401108531, 0.007857068789373148, 0.008058155979308873, 0.008281567873513612, 0.008537120992561934, 0.008831356104383108, 0.009167306111676035, 0.009549780579253571, 0.009985248773942888, 0.010483504403753474, 0.01105446192887451, 0.011706291558012593, 0.012444952768472774, 0.013276850744730052, 0.014210644435968534, 0.015251409690293325, 0.0164203007502888, 0.017763322165250093, 0.019312443442300025, 0.02106838662411562, 0.02301531816821574, 0.02511413354705105, 0.027296322066462188, 0.029456194184334254, 0.031479392247540365, 0.033281467340459205, 0.03484544287913157, 0.03621277667641237, 0.037442217604842315, 0.038546559502095, 0.039471741974125285, 0.040152528544528825, 0.04053516898249202, 0.040633863546025946, 0.040504515837501316, 0.04019960643760154, 0.039754246635574225, 0.03918127990687237, 0.03849437881738757, 0.03771136441307954, 0.03684394362963048, 0.035900256110059044, 0.034899850869911535, 0.03387344679527362, 0.032851299474749504, 0.031877336105107235, 0.03098011502836591, 0.03014460427701293, 0.02933653051616695, 0.028530449370707315, 0.027705928331687227, 0.02684112640490742, 0.025936027149973638, 0.02500172064454747, 0.02404998255882309, 0.02308999329590226, 0.02213589824481109, 0.021188242080346503, 0.020225794120814575, 0.019233990760978495, 0.018201041231475215, 0.01711427750878877, 0.015959362023213308, 0.014668788304772553, 0.013428097397378267, 0.012036282805461112, 0.010548799346646652, 0.008946298066825766, 0.007197794046785517, 0.005276020049727484, 0.003100848201690726, 0.0009474869747643536, 0.00048495949184287234], [0.0022607431226519072, 0.0022318328512775463, 0.002192210954753089, 0.002148952741938668, 0.0021138543261480618, 0.002103680287330848, 0.0021388758718425033, 0.002238769378996836, 0.0024159255314391975, 0.002661445663459952, 0.002862229455202491, 0.002545378969217598, -0.2813626632559915, -0.10691422299535001, 0.0135540349774404, 0.006144916542446752, 0.005567592276260351, 0.005482289483079243, 0.005457022378320575, 0.005435831524421709, 0.005342769810675739, 0.005371181271826971, 0.005419357121115221, 0.005490461168185493, 0.005585568786471175, 0.005702756686231722, 0.005834963579792259, 0.00597149076936012, 0.006115871866378214, 0.00627282336971607, 0.006447128765333892, 0.006646439262066387, 0.006875855761777122, 0.007137744983285791, 0.007435856323217487, 0.007775231241831755, 0.008163497919170091, 0.008608379008057028, 0.009116239754219681, 0.00969172101541345, 0.01033980708686824, 0.011067235660223048, 0.011877974630816381, 0.012788523089492734, 0.013834723095633997, 0.015041506478474749, 0.016409458034996532, 0.01792626348978163, 0.01956148403825944, 0.02126177181567848, 0.022945087520850276, 0.024522016664191553, 0.025926767350222854, 0.027146097544021686, 0.028212275373808705, 0.029171060958677525, 0.03003236871222467, 0.030754036962681898, 0.03128520919384681, 0.031584037873488686, 0.03166162228956358, 0.0315613931079352, 0.03132431849823219, 0.030977725265045192, 0.030531624913968637, 0.029997062123418555, 0.029387293439198044, 0.028711654328128715, 0.027976523915690346, 0.027197149976636806, 0.02639747086288186, 0.025601063979075335, 0.024842157470260254, 0.024143008959354825, 0.023491904608954367, 0.022862139005776574, 0.022233915601357308, 0.02159132564434613, 0.02091736171452624, 0.020212013762027973, 0.019483928766561034, 0.018742286267155937, 0.017994089279171156, 0.01725049072692998, 0.01651193877294419, 0.015761937144078843, 0.01498918662828747, 0.014184554655472907, 0.013338236030143532, 0.012439135611670168, 0.011467432731633408, 0.010449312662111993, 0.009365577025100961, 0.008206480709269012, 0.006956806925147927, 0.005599278217538572, 0.004105221189955376, 0.0024236698657847276, 0.0007437551692425343, 0.00039620803217078025], [0.0019058793914306603, 0.001887106275591446, 0.00185973900918293, 0.0018300641719993002, 0.0018084299245514758, 0.0018095406939635107, 0.0018515652637071977, 0.0019526134342811503, 0.0021260537651855175, 0.002369580032654361, 0.0026110566106090274, 0.002601970319051964, -0.1350967642418938, -0.027722452083235375, 0.0065031165991185635, 0.004751357112840688, 0.004519187880133085, 0.004510248211009982, 0.004518794256555849, 0.004519058806852443, 0.004481357820237334, 0.004507238487720276, 0.004549277265129049, 0.004610227116038642, 0.004691055676423767, 0.004790189119250446, 0.004901749700009684, 0.005016875582668187, 0.0051385749156140905, 0.005270812824005049, 0.005417611381602496, 0.005585407847436159, 0.005778496283281758, 0.005998870310635417, 0.006249685057926203, 0.006535181392516721, 0.006861772697022547, 0.007235952142951861, 0.007663072663963811, 0.008147035287572279, 0.008692026595188432, 0.00930370559261142, 0.009985420633090084, 0.010751062490606375, 0.01163077371584039, 0.012645542520583669, 0.013795879805001972, 0.015071448018149362, 0.016446672215878415, 0.017876712386856383, 0.019292835087191228, 0.02061957085693192, 0.021801591653180095, 0.022827747759998396, 0.023725149018733304, 0.024532269441401012, 0.025257401193336915, 0.025865049869347324, 0.026312419508492932, 0.026564342094017594, 0.026630182733247337, 0.026546359697600986, 0.02634739570697441, 0.02605624781633038, 0.025681339971033373, 0.025232297263985713, 0.024719729531047015, 0.024151671890719775, 0.023533521292565897, 0.02287811558621927, 0.0222055910794612, 0.021535193795310645, 0.020896259002025006, 0.02030751779018368, 0.019759109110421426, 0.019228564925618457, 0.018699285092311526, 0.018157905975271758, 0.017590140051932986, 0.01699599334088092, 0.016382751374810753, 0.015758143473327536, 0.015128189003680665, 0.01450215191053468, 0.013880392067773428, 0.01324902193391457, 0.0125985360568621, 0.01192125445656633, 0.011208931338435044, 0.010452236945083569, 0.00964334458907398, 0.008787098646367699, 0.007875521234667952, 0.006900384944556016, 0.0058488137350886935, 0.004706119232469256, 0.0034478487885612114, 0.002037107692216915, 0.0006245969471531792, 0.00035092451368123916], [0.001828944663320986, 0.001812578473188792, 0.0017880934949050743, 0.001761617335971926, 0.0017431993200446789, 0.0017471185767411004, 0.0017910851989174957, 0.001893012638880243, 0.002066547442135196, 0.002311006738045056, 0.002564003251920881, 0.002631280314180709, -0.09956851479332418, -0.014656840526960304, 0.0052964962381846885, 0.004433070783316036, 0.004285373439230497, 0.004295343277891128, 0.00431233519722811, 0.004317928603774964, 0.004293752384038697, 0.004319156435982042, 0.0043599179282177375, 0.004418703956924067, 0.004496461081747189, 0.004591693016566025, 0.004698781417460969, 0.0048092685659855035, 0.004926049780632397, 0.005052926875881055, 0.005193756456258281, 0.005354712111485652, 0.005539912749541932, 0.0057512710444069465, 0.005991813072495106, 0.00626560578657998, 0.006578798549490954, 0.006937617334899236, 0.007347195114264947, 0.007811272094737724, 0.008333861339657474, 0.008920387207159378, 0.009574063856186558, 0.010308215884782451, 0.011151747441287328, 0.01212479063277481, 0.013227841007164799, 0.014450991204507997, 0.01576972398037231, 0.01714104883722571, 0.01849913305356342, 0.019771527094162984, 0.020905176592455773, 0.021889385962431004, 0.022750143241800837, 0.023524338951822474, 0.024219911087244615, 0.0248028125511095, 0.025231997820715002, 0.025473751142915602, 0.025537061954076377, 0.02545682094126443, 0.025266152894189816, 0.024987064501927708, 0.024627634924947534, 0.02419719322253826, 0.023705754281552343, 0.02316107746900907, 0.022568180359677885, 0.021939441729910508, 0.021294198977575552, 0.020651487581277075, 0.0200389292280462, 0.01947448654247054, 0.018948704402186444, 0.018440039973615856, 0.017932577811373973, 0.017413505437000043, 0.016869123860163253, 0.016299438699533337, 0.015711437609787604, 0.015112533148851972, 0.014508497314385109, 0.01390821273380999, 0.013312025180866128, 0.012706621028250945, 0.012082887851996444, 0.01143346269916556, 0.010750439738441201, 0.010024873312305256, 0.009249502638742349, 0.008428321575542044, 0.007554060810832393, 0.006618823686950969, 0.0056102466695617526, 0.004514214747063038, 0.0033072225842564703, 0.001955776288133395, 0.0005996649957544333, 0.0003391062784370292], [0.0017861351184649014, 0.001771166354351023, 0.0017483478391120946, 0.0017237220625556352, 0.0017071762533759866, 0.0017127588190212074, 0.0017579343004530716, 0.0018605257372228013, 0.0020343631718258747, 0.002279720960151365, 0.0025398771234109887, 0.0026523240111364405, -0.07873721237984418, -0.008485840031340057, 0.0047113566073960335, 0.00425142024867063, 0.004153457906828438, 0.004174604246865166, 0.0041966056427768655, 0.004205352417139635, 0.004189124915719508, 0.004214283780782026, 0.004254349331353013, 0.004311941773837239, 0.004387996573965699, 0.0044810610862048815, 0.004585662087457091, 0.004693568361278539, 0.004807612746198858, 0.0049315060695922985, 0.005069012752717815, 0.0052261595347133614, 0.005406967797043985, 0.005613305154674551, 0.005848125814826951, 0.006115399861303279, 0.006421129565011779, 0.006771392040816599, 0.007171197727717187, 0.007624197228045185, 0.00813430689355463, 0.008706820296222334, 0.009344876958081576, 0.010061486242411625, 0.010884862438702491, 0.011834660970609033, 0.012911369029217367, 0.014105319084391959, 0.015392583330042026, 0.01673120180216685, 0.01805696030255161, 0.01929908876646916, 0.020405799409694045, 0.02136664948486628, 0.022207001845804646, 0.02296286482485139, 0.0236419786570419, 0.024211102096459318, 0.024630164440634757, 0.02486625918378079, 0.02492816680753721, 0.024849925964350938, 0.024663883426642864, 0.024391516228368305, 0.024040711511088022, 0.023620636869129245, 0.023140873076522878, 0.022609014991379663, 0.022030161992222158, 0.021416350758968927, 0.020786441602878937, 0.02015901047553093, 0.019561016117367613, 0.01900999070361437, 0.018496702156500396, 0.018000121351738497, 0.017504713163865468, 0.01699797137495802, 0.016466524567016992, 0.015910379541704593, 0.015336358159400649, 0.01475169677007616, 0.014162029798335035, 0.013576027521108383, 0.012994026570400108, 0.012403030700782974, 0.011794145714412431, 0.011160185369994541, 0.010493432289625263, 0.009785154371243889, 0.009029969672586414, 0.008228350085535822, 0.007374898854661806, 0.006461903050304676, 0.005477283307117301, 0.004407241464788935, 0.0032287952959151067, 0.0019104061879785883, 0.0005856162702074572, 0.00033218919375056685], [0.001762481396702215, 0.0017483070729915674, 0.0017264333882508133, 0.0017028570846642744, 0.0016873774367305362, 0.0016939176471639098, 0.001739810298753384, 0.0018428357102184744, 0.0020169363763380866, 0.0022629362600149754, 0.0025273361588213283, 0.0026657692653220184, -0.06681881636922947, -0.005499595939453285, 0.0044212869545779045, 0.004149282587763649, 0.0040798741367252, 0.004107447428171949, 0.004132335722382504, 0.004142897097606844, 0.004131223953123849, 0.004156255031659765, 0.0041959417301264, 0.004252878688583028, 0.004327995486357645, 0.004419863780399883, 0.00452309083127812, 0.004629571200322063, 0.004742103320143119, 0.004864347700680234, 0.005000017786735044, 0.00515505912589117, 0.005333439188352942, 0.005537000686083085, 0.005768658093291159, 0.006032327933544823, 0.006333931135066144, 0.006679462494347892, 0.007073864694555994, 0.00752073878303297, 0.008023947613971986, 0.008588712411537105, 0.009218131471453988, 0.009925039905431761, 0.010737270539829586, 0.011674215294527114, 0.012736356814506519, 0.013914160258202971, 0.0151840238467001, 0.01650455755452643, 0.017812443179443506, 0.019037838261658478, 0.02012965539114133, 0.021077591577227047, 0.021906663866912503, 0.022652392741843212, 0.023322408905062167, 0.02388391656687541, 0.024297383955732187, 0.024530352143987324, 0.02459148619080685, 0.024514353192800823, 0.024330869982657172, 0.024062220621836085, 0.023716028962750674, 0.023301686514888984, 0.022828316880374185, 0.022303574644169082, 0.021732480087454317, 0.021126904993034646, 0.020505453595117084, 0.019886450462696048, 0.019296490511339387, 0.018752867218104638, 0.018246470896287302, 0.01775655629793868, 0.017267798467788715, 0.016767860400332464, 0.016243551749275, 0.015694880186987534, 0.015128576082440857, 0.01455177818944093, 0.013970044704839387, 0.01339192835802788, 0.01281776023437116, 0.012234719004361407, 0.011634030975702854, 0.011008607419630143, 0.010350836667790402, 0.009652105842314556, 0.008908654711105338, 0.008117850822902182, 0.00727590447202455, 0.006375204134839995, 0.005403827235036645, 0.004348150263844662, 0.003185479416026863, 0.0018853828090308, 0.0005778895727219975, 0.00032842356824436654]], [[0.005092432041770859, 0.005015474603446942, 0.00487337503305631, 0.004667440324167135, 0.004402233817446122, 0.004088423609406679, 0.003746132257769623, 0.0034072308403314214, 0.0031186283143886727, 0.002956398411487668, 0.002946426952795972, 0.0030454499638579552, 0.0032057782301575665, 0.003388910249281443, 0.003566985611790813, 0.0037198234884796614, 0.003830985157445557, 0.003867250074079707, 0.002105254566244977, -0.018131754854054827, -0.0008558972489753209, 0.008261517318214687, 0.0058934533259985865, 0.005323058976841172, 0.005371897675487477, 0.005482246286552558, 0.00560483891303794, 0.005736158334171619, 0.005876588896513849, 0.006027946412413911, 0.006193272907264409, 0.00637803071866761, 0.006585772708924769, 0.006817898090706954, 0.007076632174150858, 0.007364956943904716, 0.007688264761805093, 0.008052156766515824, 0.008460971227704894, 0.008918061944230962, 0.009427862606522126, 0.009998085782859996, 0.010634799941530684, 0.011348669312311849, 0.012160643315207024, 0.01307922686518392, 0.014097024511604692, 0.015196652365459033, 0.01634674186606711, 0.01750066331136874, 0.018596553882577485, 0.019578138519886, 0.020404370739291664, 0.021065744073188352, 0.02158419126623856, 0.021985045669785964, 0.02228341768252757, 0.02247307981804703, 0.02254451798168576, 0.022485688186777156, 0.022300538265107625, 0.022013060979561818, 0.02164834541108075, 0.0212262488763406, 0.020754961953831568, 0.020243335680937773, 0.01969985575398999, 0.019132415720131017, 0.01854404803626042, 0.017941294541965788, 0.01733632519850842, 0.016741048244661477, 0.016173539932826563, 0.015641586635546226, 0.01513681242762679, 0.014646533872433228, 0.014160588185968017, 0.013670610395163933, 0.01316779275991339, 0.012654122002286569, 0.012133645389756921, 0.011610656080745657, 0.011088681454489198, 0.01057380174379695, 0.010064698402023476, 0.00955027089471213, 0.009024766361588972, 0.008483676291413746, 0.007928456021923514, 0.0073395218223199134, 0.006593824098871926, 0.005917203717253934, 0.005196013629033744, 0.0044193116709164175, 0.0035696106322716825, 0.002624871309319514, 0.0015483388355091647, 0.0002935859083308922, -0.0010982097641232633, -0.0016576128999000288], [0.004952353714001228, 0.004884131332892885, 0.004753071665169223, 0.004560729755718732, 0.004311808293138643, 0.004016916944082373, 0.003695826348726991, 0.0033798007938348716, 0.003113744381775354, 0.0029695309785887337, 0.002972126251082145, 0.0030804860487672857, 0.003249397772259021, 0.003442758374555182, 0.0036354218253846996, 0.0038111775086599304, 0.003960029844275689, 0.0040688897665567695, 0.003388370024285313, 0.0001606066445863909, 0.0035702347575168455, 0.0055096281341340805, 0.0051322400631453125, 0.005105295536421781, 0.0051889719372190425, 0.005302442966063699, 0.005425333803250633, 0.005555732055983948, 0.005694483424790772, 0.005843483453110949, 0.006005764925383868, 0.00618669326703332, 0.006389767495435421, 0.006616382648305876, 0.0068687266393732795, 0.007149715733261522, 0.007464596077215024, 0.007818815601285518, 0.008216597969492341, 0.0086612054233776, 0.009156938022514717, 0.00971127020176677, 0.010330151686352903, 0.01102400692114338, 0.011813184338162874, 0.012705972697794353, 0.01369520959090278, 0.014764016493678568, 0.015881928106599892, 0.01700364434632149, 0.018069126729943895, 0.019023578081425546, 0.019827186961472603, 0.020470721930129786, 0.02097545118051444, 0.021365948687794713, 0.021656722075075508, 0.021841667097804218, 0.02191205396632694, 0.021855507295848873, 0.021676247034189453, 0.021397050294526244, 0.021042755873721224, 0.020632601793750337, 0.020174605443581364, 0.01967737918629748, 0.019149181167651103, 0.018597699764634983, 0.018025937780496014, 0.017440290623544314, 0.01685258099873936, 0.016274359267717687, 0.01572312684438053, 0.015206378798301418, 0.014715958932772702, 0.014239595318775078, 0.013767462355842157, 0.013291473724491746, 0.012803110072884503, 0.012304320200618796, 0.011799536262540652, 0.011292517599756127, 0.010786700333342635, 0.010287969815250016, 0.00979504562591697, 0.009297235139103258, 0.008789086767727848, 0.00826606011777115, 0.0077259361054290345, 0.007157084423933154, 0.0065503375529573265, 0.0059212917489730845, 0.0052575400986377046, 0.004548511852919052, 0.0037890202259481254, 0.002967965761395596, 0.002072564435658989, 0.0010944370618394788, 0.0001542954765312626, 0.00025717152573558066], [0.004930723171364597, 0.0048643571178524974, 0.004735549020760776, 0.004545914005798954, 0.0043001965897511065, 0.0040090154379559435, 0.003692102306820823, 0.0033806484792711033, 0.0031191936833853814, 0.0029788016652073997, 0.0029842800458179312, 0.003095006416011088, 0.0032662399275484124, 0.0034623506012377986, 0.003658760928540496, 0.003840135233376438, 0.003997932256453088, 0.00412364519772162, 0.004167407168371293, 0.003400432166038998, 0.004171472722649536, 0.005109053351786001, 0.004980355709099403, 0.005052394106885518, 0.005158028927095269, 0.005272454291754095, 0.0053956726231764425, 0.005526134981647323, 0.0056647944961357045, 0.0058135689657408925, 0.005975495455732577, 0.00615592851680524, 0.006358362216780627, 0.0065841935798417375, 0.006835606571235081, 0.007115508557600574, 0.007429123270191406, 0.007781875047129881, 0.008177970217848813, 0.008620656939221248, 0.009114213740822361, 0.009666076293206254, 0.010282179680279615, 0.01097291542674033, 0.011758537265342603, 0.01264730194267154, 0.013632085306052324, 0.014696088953354692, 0.01580899016233845, 0.016925697767553892, 0.017986464401459498, 0.018936715725125387, 0.01973683913773685, 0.020377646706031285, 0.02088029930855039, 0.02126924886487889, 0.021558895569783364, 0.02174315052427548, 0.021813445122040247, 0.021757301989220067, 0.02157901228593847, 0.02130112279847186, 0.020948467402792586, 0.020540182887449392, 0.020084263893717397, 0.019589286296690017, 0.01906347355419904, 0.0185144832783875, 0.017945317815825954, 0.017362352533293626, 0.016777316916169394, 0.016201714183373447, 0.015652954796360773, 0.015138487991816597, 0.014650201576144663, 0.014175901947556847, 0.013705830266600562, 0.013231959510565886, 0.012745830653752767, 0.01224939386029405, 0.011746598258282738, 0.011241619056760648, 0.010737868886067098, 0.010241196759403473, 0.009750315906969464, 0.009254582097337625, 0.008748580486298068, 0.008227729700923465, 0.007688934260180577, 0.007122324713189231, 0.00651824173624927, 0.005891569346094335, 0.00523001299741235, 0.004527231038108246, 0.003773386080528168, 0.002959194206894218, 0.0020660553754672435, 0.0010915701695563482, 0.00015713104134138035, 0.000272867578428701], [0.00492626545421516, 0.004861546865471104, 0.004734565728504044, 0.0045470038310549245, 0.004303664934015943, 0.004015214475446604, 0.003701414728776715, 0.0033934935152604225, 0.0031357789073373724, 0.0029987649397357516, 0.00300718688776908, 0.003120706069323203, 0.0032949014839904816, 0.0034944966362334224, 0.0036954034976521668, 0.0038831194167559856, 0.004050547874483605, 0.004193799402296947, 0.004283255163308988, 0.003896579284983975, 0.004499489760133568, 0.004921708120656226, 0.004948866784234306, 0.00503654762451167, 0.005144932050954428, 0.005260731003005915, 0.005384718331370768, 0.005515708231290909, 0.005654766168365322, 0.005803839313231848, 0.0059659798401146295, 0.006146550253477968, 0.006349051988525501, 0.006574889036999011, 0.006826249102191015, 0.007106040833483888, 0.007419483746575747, 0.007771997482561751, 0.008167785702094924, 0.00861009379247116, 0.009103193615326747, 0.00965450788655213, 0.010269977881770991, 0.010959998577614953, 0.011744799464447286, 0.012632634091714383, 0.013616391850740338, 0.014679296046755755, 0.015791061062192215, 0.01690664776314944, 0.01796639222098582, 0.018915752625322083, 0.019715177606957738, 0.020355490784948162, 0.02085781921664733, 0.02124657771722992, 0.021536108576496873, 0.021720316872703906, 0.02179076709913907, 0.021734823181861648, 0.021556812777944336, 0.02127913417203908, 0.020926704678389713, 0.020518627163746826, 0.02006292233771717, 0.019568166783081084, 0.019042584458098397, 0.01849383499819975, 0.017924936052587385, 0.017342270170663886, 0.01675759574253218, 0.016182389464108476, 0.015634022913599478, 0.015119911208825963, 0.014631933495436584, 0.0141579162364377, 0.01368811802384998, 0.0132145248438616, 0.012728691732745172, 0.012232573848468216, 0.011730122715104947, 0.011225511958301279, 0.010722151059947437, 0.01022587784213532, 0.009735394598696967, 0.009240067273782073, 0.008734501325078263, 0.008214059814767019, 0.007674749665624544, 0.007108516904489148, 0.006512860148910811, 0.0058866541137839205, 0.005225474163114086, 0.004522919159632626, 0.0037689944871794803, 0.0029542183720167596, 0.0020661514550948533, 0.0010926636266340255, 0.00016069156268650362, 0.00028987624526409365], [0.004925024162572233, 0.0048608103081991035, 0.004734387451813485, 0.0045474579170467055, 0.004304843802175081, 0.0040172252024516745, 0.003704374289736213, 0.0033975309349110238, 0.003140959308504164, 0.003004980162560272, 0.0030143071811241985, 0.003128687843165436, 0.003303798305937127, 0.0035044698106568416, 0.003706764163877243, 0.0038964344053463093, 0.004066827942139719, 0.004215474569079914, 0.004318978966923597, 0.004049266677052329, 0.004567992047908485, 0.004880657645027692, 0.00493931523798518, 0.005031808324056716, 0.005141040815907636, 0.005257265039997149, 0.0053814920042525635, 0.005512647500239439, 0.00565183155363943, 0.005801000414866758, 0.005963210982553481, 0.0061438283465762395, 0.006346356298559101, 0.006572201008832201, 0.006823551387050541, 0.007103316553080639, 0.007416714863448869, 0.007769164657315349, 0.008164868885035976, 0.008607072167529718, 0.009100044428583835, 0.009651204596219222, 0.010266496004974986, 0.010956314964822588, 0.011740884043795996, 0.012628456024683907, 0.013611924276014402, 0.01467451833650153, 0.015785963201414857, 0.01690123455184309, 0.01796069254573801, 0.01890980394365363, 0.019709035163180937, 0.020349213134240967, 0.020851462525913408, 0.021240149176678397, 0.021529585712206107, 0.021713672876423933, 0.02178415016041104, 0.021728136157390603, 0.021550099807991132, 0.0212723911784486, 0.020919956279176657, 0.02051188990216433, 0.020056211878511164, 0.019561497214709813, 0.01903596852975141, 0.01848728446927772, 0.017918465403059834, 0.017335894772452433, 0.01675132685918688, 0.016176233905326694, 0.015627978444759133, 0.015113965495033289, 0.014626070849707237, 0.014152127351753488, 0.013682399124310388, 0.013208876247085157, 0.012723118190750633, 0.012227082468677717, 0.011724721733798217, 0.011220209274270991, 0.010716953716004757, 0.010220789590621098, 0.009730800368316464, 0.009236066168143549, 0.008731176047000648, 0.008211396060192607, 0.007671496508176301, 0.007105739170544262, 0.0065117189317621255, 0.005885641278621096, 0.005224568124170776, 0.004522087585250461, 0.0037681765198484376, 0.0029532812815638255, 0.0020647856090328094, 0.001093682898881479, 0.0001618348913014832, 0.00029515490653722896], [0.0049242659304625375, 0.0048603698623443745, 0.004734298234746409, 0.004547766322008973, 0.004305607802794404, 0.004018512061995693, 0.0037062576064205463, 0.003400092053701647, 0.003144239517630068, 0.0030089118855253756, 0.0030188093546944946, 0.003133733508907906, 0.0033094215207239604, 0.0035107723587009753, 0.0037139421432814514, 0.003904844989567282, 0.004077108048961677, 0.004229155571456204, 0.004341514427610654, 0.004145561355778746, 0.004603334921774377, 0.004858780946229751, 0.0049333187055576036, 0.00502884605397654, 0.005138613558618497, 0.005255106371087708, 0.005379484968856706, 0.005510745469901999, 0.005650009686175892, 0.005799239600025468, 0.005961495102499278, 0.006142142939106511, 0.00634468840368874, 0.006570539046466143, 0.0068218845480808, 0.00710163433913167, 0.007415006071101289, 0.007767417289109227, 0.008163070516400323, 0.00860520990675544, 0.00909810418353479, 0.009649169923779196, 0.010264351788670844, 0.010954046979306197, 0.011738473799876395, 0.012625884590331852, 0.01360917519103178, 0.014671578987271628, 0.01578282751491291, 0.016897960376877803, 0.01795729691081336, 0.01890629317210153, 0.019705414863227907, 0.020345482365309208, 0.020847601494120935, 0.02123616391944274, 0.021525476483160395, 0.02170944228875553, 0.021779804510398074, 0.02172369440084694, 0.021545588779344902, 0.021267809924269954, 0.020915323293253792, 0.02050721901611477, 0.020051516414312718, 0.019556789494939972, 0.019031259995044233, 0.018482585786377705, 0.017913788553208437, 0.01733125216656436, 0.016746729208562315, 0.016171689262344923, 0.015623489210577437, 0.015109526421131688, 0.014621672702052913, 0.014147764552776405, 0.013678069570372415, 0.01320458040576883, 0.012718859449416203, 0.012223182311635971, 0.011721279297471559, 0.01121729498097456, 0.010714622133858953, 0.010219083163983535, 0.009729359725283628, 0.009234819671359201, 0.008730090133177762, 0.008210453255959685, 0.007670688060370864, 0.007105061346325302, 0.006511561612152716, 0.005885571857048698, 0.005224576741918378, 0.004522160502498258, 0.0037682884033670722, 0.0029533779100565875, 0.0020647489854598022, 0.0010931792568662807, 0.00016258198169832806, 0.0002985077164710359], [0.004923779287374615, 0.004860073039272406, 0.00473421159961045, 0.004547917947907413, 0.0043060326293841815, 0.004019250489041617, 0.003707353668840633, 0.0034015941817726733, 0.0031461719592301186, 0.0030112335198427967, 0.003021470849566836, 0.0031367180573273357, 0.0033127489875296604, 0.003514503215497091, 0.0037181932317302165, 0.003909829235448367, 0.004083205122327772, 0.00423727815852648, 0.004354912605248355, 0.004202944839107608, 0.0046214749530892815, 0.004847170790443402, 0.004929709850853522, 0.005027045288827469, 0.005137130830894114, 0.0052537828711356985, 0.005378250947714601, 0.005509573093099009, 0.005648884093711906, 0.005798149333678422, 0.005960430465589946, 0.006141095183602089, 0.006343649651943293, 0.006569502233156637, 0.006820843051833329, 0.007100581703167974, 0.007413935381620626, 0.007766321120842163, 0.008161941159851414, 0.008604039351126745, 0.009096883672516662, 0.009647889247682855, 0.010263001486323888, 0.010952618047049275, 0.011736954550292958, 0.01262432110884407, 0.013607569549471937, 0.01466992676353761, 0.015781120221836552, 0.016896131637327113, 0.01795533452649393, 0.01890419467781888, 0.019703188983483097, 0.020343142511989324, 0.02084516103092537, 0.021233632680004846, 0.021522857812558624, 0.021706740072277075, 0.021777024498077956, 0.02172084977525344, 0.0215426970071611, 0.021264871673347716, 0.02091235068226019, 0.020504221239933187, 0.020048502281343004, 0.019553767138270776, 0.019028236948310993, 0.018479569041489206, 0.017910785809754037, 0.017328271315226036, 0.01674377669391126, 0.016168769787248852, 0.015620603951732957, 0.01510667180176452, 0.014618843010359366, 0.014145221396608664, 0.01367588552048749, 0.013202807861763918, 0.012717543077876904, 0.012222050136326407, 0.011720281145752463, 0.011216405044496733, 0.010713824729634723, 0.010218364442158108, 0.009728710173010658, 0.00923423468005847, 0.008729567521378311, 0.008209992572116893, 0.007670290259482351, 0.007104728524285851, 0.006511460359377946, 0.005885524910346309, 0.005224577941519166, 0.004522201269748855, 0.003768353121198582, 0.0029534336040290344, 0.002064724875161173, 0.0010928573560599864, 0.00016303353957390333, 0.0003005107209001369]], [[0.007565001767915869, 0.007459153052535023, 0.0072550870420514104, 0.006951084575739159, 0.006547988645033869, 0.0060534688172613855, 0.005487766018617681, 0.004889293169425806, 0.0043215083931292635, 0.003903362209450278, 0.003703368975986304, 0.003679618776010318, 0.0037741016869146794, 0.00394567017022141, 0.0041502777095284785, 0.004354979221771632, 0.004562612267829578, 0.0047686328480639, 0.0049643283278292495, 0.005137454609005741, -0.03918003698820004, -0.03280161991152892, -0.027018099347032754, -0.02191910575358659, -0.017610442306705193, 0.02631626619598944, 0.013012201558123992, 0.006707216451294312, 0.006866416634351052, 0.007045409225014137, 0.007242127256516745, 0.007461292450090142, 0.007706036622209987, 0.007978043457726638, 0.008279635134806621, 0.008613962762727335, 0.008987313599664095, 0.009404636956094739, 0.009870587127120075, 0.0103889894788179, 0.010964874673885445, 0.011607203608922461, 0.012323758894958986, 0.01312647705556904, 0.014037086315720725, 0.01506467384887866, 0.01619176974963176, 0.01739953874122383, 0.01865030215885873, 0.019890060507243974, 0.02104916955278263, 0.0220685822591451, 0.022906511630792686, 0.02355329050428949, 0.024033187935331667, 0.02437155034633939, 0.02458622075319934, 0.024678083166875794, 0.024646812104307792, 0.024484179759907323, 0.024195742900595077, 0.02380479209023076, 0.02333584460887682, 0.02281138400611291, 0.022241106814854774, 0.02163518129109517, 0.021005851075159284, 0.020357056171283805, 0.019691671813603068, 0.019016727714841083, 0.018344028769673865, 0.017684953841431476, 0.017057080390073465, 0.016466029915210987, 0.015902703428324675, 0.01537741700759895, 0.014835713594548475, 0.014291290935304863, 0.013736243109991653, 0.013175369305082625, 0.012609941491324814, 0.012043404223792492, 0.011479869693745473, 0.010925480005211402, 0.010378218485031461, 0.00982623088678116, 0.009264140984789776, 0.008687023394169697, 0.008089359621962255, 0.007465163412456079, 0.006648034423500499, 0.005932464732760224, 0.0051699927505478435, 0.0043477070374586336, 0.003444877386102597, 0.0024351347767757594, 0.0012749152199464425, -8.86190145389356e-05, -0.001566940817883898, 0.00020849006649319935], [0.006819294902223943, 0.006728688285763602, 0.00654992779543804, 0.006281661485618577, 0.005924812084458755, 0.005486409324451659, 0.004984756014617857, 0.004454552702555182, 0.003952309046251627, 0.003583557189347505, 0.003409745700888875, 0.003393727573295054, 0.0034840220547550428, 0.003639737119304178, 0.003825402805340717, 0.0040164867442746615, 0.0042084605344166895, 0.004399001258286049, 0.004581243782130684, 0.004745217432580554, -0.006613595217641614, -0.0048514981417892185, -0.003247689291221846, -0.0018235560318987719, -0.0006033209443016247, 0.010937020235690969, 0.008474696425173027, 0.006018506800024993, 0.006170419589355868, 0.0063358124242704275, 0.006515688104404702, 0.006715098710258069, 0.006937339812980131, 0.007183882227433875, 0.007456863653907649, 0.007759133528899881, 0.00809609474062841, 0.008472749878565345, 0.00889328448234795, 0.009361028579192323, 0.009880489739966544, 0.010459722950276681, 0.011105810324223545, 0.011829585450913503, 0.012650597107500782, 0.013575495915134789, 0.014591881976078138, 0.015681177074639504, 0.016809415124499245, 0.017927866072649342, 0.018973983852936, 0.01989439464243617, 0.020651434303225625, 0.02123635941961848, 0.02167097051040499, 0.02197807853332906, 0.022173596812636344, 0.02225822715496088, 0.022231613469283033, 0.022086423082735732, 0.02182740291796016, 0.021475209661617593, 0.021053273553743517, 0.020581328288571277, 0.020068005575166633, 0.019522277375280037, 0.018953708470657894, 0.018368299819310107, 0.017768717619369323, 0.017160732768968918, 0.016554869873295654, 0.01596132994628674, 0.015395890526724179, 0.01486355917657332, 0.01435625041011168, 0.013872038236560674, 0.013384211150250631, 0.01289430971020806, 0.012394979701451724, 0.011889627430840415, 0.011380661222369918, 0.01087143865579595, 0.010365264176031874, 0.00986757970965008, 0.009376572937275418, 0.008881670725145268, 0.00837814759736823, 0.007861691054484813, 0.007327475931034869, 0.006770278474226945, 0.006180565265852763, 0.005566634111468784, 0.004922345786888436, 0.004239306718226732, 0.0035074890460032385, 0.0027179435938922674, 0.0018600235576585072, 0.0009292693908302237, 5.910967939332996e-05, 0.0002664132337252567], [0.006722634823241729, 0.006634434522941573, 0.0064594189846208325, 0.006196301571544054, 0.005846029930059869, 0.005415561260406906, 0.004922952262136355, 0.004402428914642639, 0.003909538122417503, 0.0035479210910232236, 0.0033780825566162753, 0.0033635494629465157, 0.003453760007178312, 0.003607514925749722, 0.003790835211571191, 0.003980741541151694, 0.004171116110310548, 0.004360082699066239, 0.004541104190979969, 0.00470460010800892, -0.002109695561763244, -0.0009855767119499844, 4.055855662117555e-05, 0.000956686950745556, 0.0017494318579186936, 0.008804639790553731, 0.0075950423390025775, 0.005926766903026403, 0.00607848784034454, 0.006242480019204372, 0.0064204008156815845, 0.006617416399696679, 0.006836885880595693, 0.00708024828012028, 0.007349621364801906, 0.007647816268516257, 0.007980097548000846, 0.008351523161544102, 0.008766216995176383, 0.00922743427845222, 0.009739612341813687, 0.010310686720289215, 0.010947654697892257, 0.011661213498166912, 0.01247062602410111, 0.013382089079179193, 0.014384159776303631, 0.015458149968638013, 0.016570574664985568, 0.017673382060468572, 0.018704967044279135, 0.01961267798066266, 0.020359385483378026, 0.020936463261982674, 0.021365385029150523, 0.021668629778184238, 0.021861845402395764, 0.021945701577193333, 0.021919832629704924, 0.0217770294468318, 0.021521910505478102, 0.02117476080947004, 0.020758988776741167, 0.020293923874793326, 0.019788050026037007, 0.019250165296438904, 0.018689336625665517, 0.018112065673636907, 0.01752100700161563, 0.016921723255288883, 0.01632456511073942, 0.015739573327843, 0.01518227928227302, 0.014657606190855158, 0.014157224689791215, 0.013677005067866472, 0.013195818737409552, 0.012712646624529238, 0.012220172429110672, 0.011721535767776625, 0.01121940285622097, 0.01071714010345109, 0.010217911552188428, 0.009727061714946904, 0.009242793335737493, 0.008754684425886986, 0.008258082334389509, 0.007748737736310465, 0.007221892101440423, 0.006672390836815024, 0.006091063068543936, 0.0054890783124594035, 0.004855722711811639, 0.004184648766932992, 0.0034616179545901376, 0.0026833185265448993, 0.0018374830509758561, 0.0009191328975273432, 6.138882556482705e-05, 0.00028093207579664], [0.0066473666119318065, 0.006561285409953169, 0.0063894508331588116, 0.006130637189801199, 0.005785819837785618, 0.005361905424892669, 0.004876761920931151, 0.004364249545322539, 0.003879130148522425, 0.0035234861005474633, 0.0033570712604533907, 0.0033439696019650473, 0.003434376274065257, 0.0035866588609175963, 0.0037682154101192503, 0.003957539475977719, 0.004146914050533807, 0.004334901222379245, 0.004515269742290993, 0.004678797387234687, 0.0014684548367725847, 0.002085710668818578, 0.002652870347418505, 0.003165308710506049, 0.0036180088590921583, 0.007104611855658785, 0.00674398650715079, 0.005853923959083134, 0.006005924364965163, 0.0061690322053367195, 0.006345560797215843, 0.006540805753538328, 0.006758199766286828, 0.006999154707122529, 0.0072657750870927665, 0.007560842670466256, 0.00788950079561307, 0.008256878146244135, 0.008667050090855085, 0.009123207581006158, 0.009629731863697864, 0.010194464305613077, 0.01082433953556966, 0.01152995235030764, 0.012330341125800639, 0.01323127066822552, 0.01422221412236026, 0.015284316125223666, 0.016384466231377313, 0.01747513805298652, 0.01849547108509067, 0.019393374026493305, 0.02013212134672931, 0.020703162501751263, 0.0211277061552136, 0.021427965849606476, 0.021619367711963752, 0.021702546532934224, 0.021677122281493023, 0.021535984267188165, 0.021283647570330386, 0.0209400980567004, 0.020528803006730566, 0.02006875725979702, 0.019568330975401307, 0.019036186111777074, 0.01848096631348369, 0.01790966795686498, 0.017324928223919865, 0.016732112506976492, 0.01614142836430612, 0.01556279337964692, 0.015011553293744814, 0.014492555113476744, 0.013997499484767485, 0.013519729552372848, 0.01304360974621137, 0.012565577591272649, 0.012078335736218894, 0.01158477548693357, 0.0110878307667049, 0.010591024254426434, 0.010097401984519248, 0.009612158229045618, 0.009133468262913868, 0.008651015685584452, 0.008160212008460243, 0.007656861596019171, 0.0071362598866811875, 0.006593308929535396, 0.006024539327617976, 0.005428869974845105, 0.004801918365003516, 0.0041375140914087765, 0.003426071902563391, 0.0026573260289424077, 0.0018208821330665563, 0.0009120156884810199, 6.395374065473228e-05, 0.00029634125393910996], [0.006628138560046758, 0.006542653677145452, 0.006371691048913197, 0.006114042813556983, 0.0057706932698794395, 0.005348537479799741, 0.004865395852934888, 0.004355036018848962, 0.0038720113523920707, 0.003517986646056694, 0.0033525203711540913, 0.0033398460229820026, 0.003430361393398564, 0.0035822799613313117, 0.0037633999737529612, 0.00395265030146881, 0.0041418243852014034, 0.004329616556864414, 0.004509885007791808, 0.004673511228267277, 0.0023740845042799505, 0.002862979186497628, 0.003313898341909493, 0.0037240794618416512, 0.004090556681920357, 0.006672166835668914, 0.006489355568989855, 0.005835000399223255, 0.005987168299193722, 0.006150096463027475, 0.006326298542247112, 0.006521112315775207, 0.006737994674831139, 0.006978350019048672, 0.007244279981159764, 0.0075385589248984875, 0.007866296196766986, 0.008232644735041341, 0.008641667399958015, 0.009096537370509994, 0.009601621255580674, 0.010164736107104394, 0.010792801310110013, 0.01149638633781741, 0.01229447636533695, 0.013192313943519062, 0.014180459784276327, 0.015239589662009778, 0.01633667623112567, 0.017424301914051022, 0.01844183198957905, 0.01933730118142288, 0.020074083802711695, 0.020643657114800307, 0.021067164529517984, 0.02136675477961056, 0.021557798931742426, 0.021640923628233576, 0.021615745772785678, 0.021475181462213968, 0.02122371151474423, 0.020881238003249456, 0.020471254780752436, 0.02001266205787601, 0.019513796835330697, 0.018983280846142512, 0.01842962561576562, 0.01785998364830393, 0.017276989631482335, 0.016685952255922926, 0.01609704106143018, 0.015520141419971177, 0.014970550920298255, 0.014453099653108713, 0.013959528333684466, 0.013479686041727362, 0.013005100705418375, 0.012528726709379814, 0.012043191909239451, 0.01155107814752519, 0.011055708952124984, 0.010560535298388797, 0.010068451429920966, 0.00958467700232843, 0.009107409555687803, 0.008626372509137118, 0.008136996577521212, 0.007635101499930222, 0.007115998368578208, 0.006574605127938949, 0.006008219723167232, 0.005414180493677088, 0.004788903703706432, 0.00412620891142467, 0.0034164661566113237, 0.0026511790606731037, 0.0018168864695857856, 0.0009104027383436215, 6.48163528612996e-05, 0.0003012260489145925], [0.006617206508347047, 0.006532081259421383, 0.006361636609217022, 0.0061046756802778405, 0.00576218855230456, 0.005341064197822127, 0.0048590962308450196, 0.004349999956753677, 0.0038682072525787784, 0.003515138245383942, 0.003350238982300349, 0.0033378306749275045, 0.003428429801212488, 0.003580145942511243, 0.0037610230196235997, 0.003950259529027998, 0.004139340220969566, 0.004327042210156689, 0.004507278774555126, 0.004670994939229508, 0.0028991741707801045, 0.0033136559010101888, 0.0036971870129085932, 0.004048081824310227, 0.004364544364230867, 0.006421117622715707, 0.006330637495961177, 0.0058241234092577384, 0.00597642254661921, 0.006139265880941107, 0.006315293241363624, 0.0065098697893420845, 0.006726468198554021, 0.006966488419498737, 0.007232030638774996, 0.007525865050873876, 0.007853080542713251, 0.00821884616071213, 0.008627217610877208, 0.009081376683842728, 0.009585676520909968, 0.010147913616546614, 0.010774995451171753, 0.011477473903580523, 0.012274288295488397, 0.013170673938427987, 0.014157212361519468, 0.015214612374118957, 0.01630990110810498, 0.017395738610418723, 0.018411591987096756, 0.019305576592336275, 0.020041132317753008, 0.020609752768246458, 0.02103254680072902, 0.02133162474170786, 0.021522324040371122, 0.021605268332424477, 0.021580074713663897, 0.021439677305112762, 0.021188537871862378, 0.02084651096960219, 0.02043711397233856, 0.019979192476716, 0.01948106527241573, 0.018951331669740695, 0.018398422603229176, 0.01782959028671462, 0.017247467653514672, 0.01665743830948102, 0.016069633230356428, 0.015493886421610864, 0.01494544776452858, 0.01442911134107435, 0.013936534658365671, 0.01345759110293893, 0.012983858951584241, 0.012508318096638632, 0.012023615839523804, 0.011532335318626921, 0.011037796987042324, 0.01054344748511937, 0.010052177329398969, 0.009569198206957544, 0.009092711688508856, 0.008612459244905392, 0.008123878912776475, 0.00762279781120501, 0.0071045351174691745, 0.0065640173097429476, 0.005998945507756622, 0.005405818032848416, 0.004781474257496468, 0.004119726800839676, 0.003410917639827761, 0.002646462867721109, 0.0018146903200271542, 0.0009095466678011434, 6.536908559935697e-05, 0.00030434398361097527], [0.006610996102554609, 0.006526080950694191, 0.006355936811414127, 0.006099373285580439, 0.005757383933123216, 0.0053368544071849535, 0.004855563168205115, 0.004347195885917801, 0.0038661145804489783, 0.003513598347062593, 0.003349028989702632, 0.00333677831182122, 0.003427431192795323, 0.00357903361249503, 0.003759774158149038, 0.0039490107203505155, 0.004138044148739564, 0.004325700722200251, 0.004505926203912814, 0.004669702997247767, 0.0031954021580347753, 0.003567892665881129, 0.003913395912804876, 0.004230832598723084, 0.004519059128871158, 0.0062792124546261555, 0.006236547313631433, 0.005817911087587938, 0.005970294905121041, 0.006133094920108144, 0.006309026094554625, 0.0065034701043215765, 0.006719909158106228, 0.006959740622391747, 0.0072250639157578145, 0.0075186468749559475, 0.007845519748636653, 0.008210951389294998, 0.008618984591998304, 0.009072751690137755, 0.009576600845272907, 0.010138325017953314, 0.010764828864873479, 0.011466657561560206, 0.012262733067349095, 0.013158286661198662, 0.01414390960516522, 0.015200329161682779, 0.016294603724194705, 0.01737943772165527, 0.018394356779309055, 0.019287521579399152, 0.020022408620946622, 0.020590519947055658, 0.02101294367412832, 0.021311768393873384, 0.021502312524027244, 0.021585197319813676, 0.0215600393181466, 0.021419782327293625, 0.021168876457130944, 0.020827148360223483, 0.020418129580367508, 0.019960633566559707, 0.01946296821893559, 0.0189337193907917, 0.018381040270853466, 0.017812671538615987, 0.01723123379061976, 0.016641869208416035, 0.01605468759134632, 0.015479532043285003, 0.014931645093502213, 0.014415820157393594, 0.01392372492536465, 0.013445244089503856, 0.012971966572112456, 0.012496879826069214, 0.012012638553692525, 0.011521821759113541, 0.011027746958629939, 0.010533858053403605, 0.010043043296408233, 0.009560509725520396, 0.009084461147769951, 0.008604649317429228, 0.008116516640887838, 0.007615894234371158, 0.007098105722253263, 0.00655808231562305, 0.005993742874026933, 0.005401131902455721, 0.004777317010600708, 0.004116108045461549, 0.003407834513043631, 0.002643864624113047, 0.0018140562160904917, 0.0009090908805401709, 6.571356566327692e-05, 0.00030622338176565283]], [[0.010238406229458746, 0.010109771299184054, 0.00985872622942083, 0.009477097273251987, 0.00895331699647623, 0.00828134744420269, 0.007465712847447402, 0.006540046306596315, 0.005585312399180706, 0.004754163814431309, 0.004172350474288597, 0.0038438485642743807, 0.0037037161553515195, 0.0036972196772255776, 0.0037774511004826116, 0.003911742882033785, 0.004080588504950589, 0.004276720535506751, 0.004487214503227423, 0.0046981525308506834, -0.002405747858746697, -0.0008647881591815372, 0.000552446697734269, 0.001827721644360257, 0.002937774770285581, 0.0038527641679075124, 0.004586385930230009, 0.005311694530510779, 0.0060782857632832536, 0.006893044045668438, 0.007764810260318409, 0.008705049478346672, 0.009723101300402872, 0.010823743497840956, 0.011747804912328711, 0.0068042139755135666, 0.007920860948771005, 0.008773849234068954, 0.009215882029827, 0.009692078066757688, 0.010216411954721605, 0.010797068187927295, 0.011442321603190525, 0.012163726643276784, 0.012979071153041206, 0.013889179012103698, 0.014881361330488507, 0.01593268283182625, 0.01700626846741631, 0.018051269649328495, 0.01900535346798316, 0.019819903361038924, 0.02046341809839061, 0.020929189329815003, 0.021239280530084743, 0.02141303003765638, 0.02146575009123337, 0.02140666960605384, 0.021245422212878014, 0.02098364910284621, 0.020626730699362567, 0.020192747720814797, 0.019702447757175078, 0.01917383603139406, 0.018615598657648294, 0.018036253419207993, 0.017443753555451767, 0.01684582519699072, 0.016244679832932207, 0.015643948119084497, 0.015051485504296764, 0.014474947677763956, 0.013926803096304074, 0.013408172725921238, 0.012909911555699932, 0.012424611758934544, 0.011945642520501547, 0.011467290093614795, 0.010983637513919151, 0.010498229984298573, 0.010013606850355548, 0.009532202604856533, 0.009056186412025873, 0.008589906792301566, 0.00813077216535989, 0.007668906299279446, 0.00720078676767417, 0.006722880809958467, 0.006231094227795471, 0.005721063993816541, 0.004981540154329511, 0.0043876341219594465, 0.004131932033224373, 0.003528759446790926, 0.0028845151714737257, 0.002192004990278185, 0.0014444418123188694, 0.000645368797049345, -5.640676884797893e-05, 0.00019134222131280456], [0.010065763379763979, 0.009943447032571415, 0.009698998213117524, 0.009324380174455953, 0.008809746885645798, 0.008150273649596916, 0.007352899301258564, 0.006450160598010889, 0.005514697614001055, 0.004700989014713367, 0.004137932858763939, 0.0038171371866021426, 0.0036802380660254626, 0.0036730519211711603, 0.0037505401343551174, 0.0038810301348153066, 0.004045451127012922, 0.004236699078986567, 0.004441864995584614, 0.004646938578950461, 0.003279336087089732, 0.0037600840821192237, 0.004208925588747736, 0.004622447122376734, 0.0049962401316657285, 0.0053243535881432715, 0.0056109928252417165, 0.005898628766370512, 0.00620003936170254, 0.006518426037221976, 0.0068585351157002036, 0.00722732976856972, 0.007629490376590426, 0.008066274681503798, 0.008423132813119856, 0.007685439908671902, 0.008178803518104431, 0.008650024599350556, 0.009078094695374184, 0.00954543500958594, 0.010060522193774643, 0.010631169190510156, 0.011265524884855473, 0.011974998019386129, 0.01277703184408482, 0.013672424664545216, 0.014648683849479009, 0.015683229464253535, 0.016739769038455074, 0.017768256083783972, 0.018707321722750796, 0.019509108539511932, 0.02014271974647819, 0.02060156805692822, 0.02090732178449286, 0.02107896857741598, 0.0211314095481545, 0.02107368480409669, 0.020915274503730055, 0.020657984720000227, 0.02030726996036632, 0.019880140460458943, 0.019397719919260575, 0.01887792714400146, 0.018329103033380947, 0.01775962554159724, 0.01717731330765419, 0.01658975939793112, 0.015999162621860106, 0.015409101167424367, 0.014827287986201605, 0.014261230724319755, 0.013723158510219588, 0.013214221188839652, 0.012725510794735042, 0.012249773279849024, 0.011780511812782828, 0.011312148950466741, 0.010838902019785027, 0.01036422638403607, 0.009890539301198606, 0.00942026215609039, 0.008955525159614532, 0.008500601328340764, 0.008053043730421795, 0.007603294949098332, 0.007147983751610738, 0.006683761478853143, 0.006206774406587309, 0.005712938724343829, 0.005183164799347131, 0.004647206169880986, 0.004085756381114564, 0.003492977774779453, 0.0028598297045038723, 0.002178999809171735, 0.0014434833922540421, 0.0006542901306428582, -4.7222215663295676e-05, 0.00027144960329746846], [0.010043912698102507, 0.009922842603300657, 0.009679482936641856, 0.009305814201586897, 0.00879237249129388, 0.008134606270156403, 0.007340028028936371, 0.006440978815972304, 0.005508296209662839, 0.004697163478877233, 0.004137444088777011, 0.0038178569519945428, 0.0036814607136929113, 0.003674101275934893, 0.003751092677054122, 0.003880936068666053, 0.00404462729529034, 0.004235087402660591, 0.004439387567107915, 0.004643470592831332, 0.0040112108278509565, 0.004355424460551468, 0.004679562810168932, 0.004982122856580217, 0.005261123039103561, 0.005513684825589545, 0.005742788113302995, 0.00597410228422066, 0.006215674140666581, 0.006470240311169878, 0.006742034577338308, 0.007037466368554782, 0.007360674409696797, 0.007712687260282321, 0.008012989752886756, 0.007794723860448175, 0.008212082436776126, 0.008636948596435157, 0.00906255094334877, 0.009528681541363323, 0.01004255480038668, 0.010611911505290294, 0.01124488606140645, 0.01195287405805053, 0.012753270326269769, 0.01364686867778872, 0.014621199415701712, 0.015653724200557783, 0.016708220076003408, 0.017734736118676098, 0.018672016097757656, 0.01947229215386876, 0.020104751884820145, 0.020562823505449555, 0.020868112289491376, 0.021039557527648505, 0.021091993181418096, 0.02103443477251245, 0.02087634825517575, 0.020619586628265425, 0.020269638414844235, 0.01984330372989248, 0.01936183861959051, 0.018842864714259996, 0.0182949193230586, 0.017726357733313887, 0.01714497871906936, 0.016558356620033094, 0.015968689480360506, 0.015379549835798962, 0.014798634008491922, 0.014233436011732145, 0.0136961623101399, 0.013187967674710602, 0.012699965824958212, 0.012224915622073836, 0.011756328442961433, 0.011288633350374973, 0.01081605441234315, 0.010342032173881802, 0.009869030204898164, 0.00939943883086371, 0.008935389642433856, 0.008481158663352866, 0.008034369304059678, 0.007585463977747728, 0.007130981205289303, 0.006667599770864909, 0.00619145817179495, 0.005698468424237666, 0.005177374646573782, 0.004642617778024921, 0.004082426513511723, 0.003491721860313528, 0.002859273981759754, 0.0021799229001582834, 0.0014458712632173937, 0.0006575419061777873, -4.5181884835429814e-05, 0.000290548496250554], [0.010027941578325787, 0.009908062960877807, 0.009665659155054619, 0.009292723217014118, 0.008780173745323944, 0.008123734013211294, 0.007331504228162026, 0.006435646608422742, 0.005505210706097579, 0.004696192305106464, 0.004139516736317384, 0.003820959459694431, 0.0036849896356713516, 0.003677449496424933, 0.0037539837614871184, 0.003883250588816587, 0.004046301752542681, 0.004236079390674577, 0.004439626497249813, 0.0046428294806563734, 0.004522953374695439, 0.004771562694329707, 0.005008385121891753, 0.005233256308585432, 0.005445893058645661, 0.005645564836948331, 0.005834391188253577, 0.006026288969366728, 0.006225999798631316, 0.0064359414529952695, 0.006659999041860133, 0.006904212284502851, 0.0071723818797193, 0.007465535302004171, 0.0077379518085519865, 0.00786749688199197, 0.008234645502290468, 0.008629039540449272, 0.009052413724177578, 0.009517618346298995, 0.010030588983148356, 0.010598997742149634, 0.011230969326712909, 0.011937893209195612, 0.012737125205851527, 0.013629451257879618, 0.01460241284101798, 0.015633494848315856, 0.01668651659300592, 0.01771158710667544, 0.018647521481327603, 0.01944661263287358, 0.020078116726317076, 0.020535477755675408, 0.02084027508696631, 0.021011412083392043, 0.021063659884298466, 0.021006012815824718, 0.020847924877662405, 0.020591293532733493, 0.020241637921665747, 0.019815546632070958, 0.019334418555796887, 0.018815838649806363, 0.018268332703849817, 0.017700241835846717, 0.017119351634760582, 0.01653340923984312, 0.01594444036426529, 0.015356009542873207, 0.014775800258580553, 0.01421129807818219, 0.013674697720652634, 0.013167166670342258, 0.012679841551163903, 0.01220548700365218, 0.01173761398082767, 0.011270651144755365, 0.010798822607302758, 0.010325551602157682, 0.009853283722476337, 0.009384399949510987, 0.00892102947005884, 0.00846744144045353, 0.008021213520245759, 0.007572822880239681, 0.007118897665539934, 0.006656092949236167, 0.006180564447890274, 0.00568824311054352, 0.0051747891855403565, 0.004640921182294093, 0.004081660511880177, 0.0034912150822323075, 0.0028605563172199658, 0.002182285134622376, 0.0014492648035616014, 0.0006613218595552343, -4.307228852963657e-05, 0.00031020093268705335], [0.010024007735246476, 0.009904483579788945, 0.009662349944096829, 0.009289602964009892, 0.008777277887224903, 0.00812118201108836, 0.007329596914627681, 0.0064346329901210425, 0.005504797094097987, 0.004696349812830535, 0.004140555462536775, 0.0038222837003583175, 0.003686431698560847, 0.003678835303943224, 0.003755236536905875, 0.0038843387553315657, 0.004047209079064147, 0.004236795441852563, 0.004440130920390896, 0.004643083224395379, 0.004632937619377273, 0.004860927307531793, 0.005078918590599616, 0.005287036015678344, 0.005485362249644217, 0.005673628876307561, 0.005853769214290219, 0.0060371694819318054, 0.006227860821252873, 0.0064281941444096725, 0.006642007144842442, 0.006875240577446725, 0.007131633866370293, 0.007412260824355798, 0.00768213870596442, 0.007881997779256498, 0.008239219762983167, 0.008627611292304514, 0.009050336290589473, 0.009515294727631135, 0.010028029803669552, 0.01059619317333552, 0.011227907184837798, 0.011934560355465286, 0.012733497738891236, 0.013625500991516243, 0.014598112937204947, 0.01562882296464393, 0.016681459570368, 0.01770614533937508, 0.018641711700403206, 0.019440467568800655, 0.02007168943391573, 0.020528827432031504, 0.02083345420047846, 0.021004463438105813, 0.021056607753693078, 0.02099887643031167, 0.020840721319230274, 0.02058405438719671, 0.020234556783244956, 0.019808637440109102, 0.019327739727117193, 0.01880943623900487, 0.018262246651109443, 0.017694504573182484, 0.017113987727224514, 0.016528248427863795, 0.015939479640067592, 0.015351245914745414, 0.014771227582474166, 0.014206907503466626, 0.013670475470903554, 0.013163098457376824, 0.012675915626649692, 0.012201694806115698, 0.011733949476400744, 0.011267110472005638, 0.010795404297385982, 0.010322252781336203, 0.00985010056673611, 0.009381327714148244, 0.008918062740238234, 0.008464573047596588, 0.00801843731679383, 0.007570136342257563, 0.0071162986672583676, 0.00665357942079272, 0.006178133700376236, 0.005685891231614124, 0.005174702142946649, 0.004640874832500466, 0.004081845617745946, 0.003491647881781084, 0.0028621697625269013, 0.0021832674730149467, 0.0014504918405014913, 0.0006625898124183231, -4.2387659368200664e-05, 0.0003163078776206822], [0.010021762731331854, 0.009902459164921171, 0.009660490134726446, 0.009287853530478372, 0.008775657902239963, 0.00811976340104008, 0.007328566098766229, 0.006434144477078406, 0.005504664988190549, 0.004696558744595422, 0.004141306754773574, 0.0038232074899943805, 0.003687426566717763, 0.003679794542844023, 0.0037561137237774184, 0.0038851152213209574, 0.004047875383984602, 0.004237345633281511, 0.004440552493234941, 0.004643351559725687, 0.00469081469501894, 0.00490792854789028, 0.005115987633801036, 0.005315268938193892, 0.005506047951733111, 0.005688299604482224, 0.00586385875967359, 0.006042805149551104, 0.006228768596042117, 0.0064240656937231185, 0.006632472503526336, 0.006859916534703664, 0.007110109326766178, 0.007384165615029691, 0.007653881929206807, 0.007889186629427801, 0.008241464829440156, 0.008626885569449088, 0.009049209865264068, 0.009514023332033092, 0.010026621862235206, 0.01059464437462451, 0.011226211907283798, 0.011932712615151567, 0.012731485267778045, 0.01362330946071543, 0.014595729051451138, 0.015626236176059873, 0.016678664735927357, 0.017703145111056074, 0.018638517847724016, 0.01943710044492953, 0.02006818086878334, 0.020525212342774407, 0.020829763074650093, 0.021000721188722864, 0.021052828173809202, 0.02099518330895037, 0.0208371545632893, 0.020580664282987375, 0.020231250249021365, 0.019805398440080117, 0.019324580968147625, 0.018806364410896434, 0.0182592667135995, 0.017691619330572242, 0.01711119808766217, 0.016525553607985848, 0.01593687970906482, 0.015348740802312815, 0.01476881522535036, 0.014204584171823072, 0.013668234511656897, 0.01316093293101333, 0.012673819989422828, 0.012199665222662106, 0.011731983396446457, 0.011265206422606805, 0.01079356201806744, 0.010320471031703731, 0.009848377442369471, 0.00937966069858051, 0.008916448881359066, 0.0084630083493257, 0.00801691837654345, 0.007568661855583312, 0.007114867565241659, 0.006652190760328326, 0.006176786433004961, 0.005684583569350733, 0.005173538252421822, 0.004640996569354622, 0.004082065808405367, 0.0034920103014006412, 0.0028617671598283427, 0.002183912870029237, 0.0014512749012077632, 0.0006633809900196715, -4.1979614310186276e-05, 0.0003201426829763056], [0.010020495623608051, 0.009901322663823816, 0.00965945001478806, 0.00928687655493108, 0.008774754452162425, 0.008118975323588897, 0.007328003526100281, 0.0064338987521995504, 0.005504625089433877, 0.004696716369371219, 0.004141783653742073, 0.00382378493595, 0.003688045410431136, 0.003680392101415564, 0.0037566629261623612, 0.003885605314383476, 0.0040483009804478725, 0.004237703374500661, 0.00444083502436001, 0.004643544207570132, 0.004721090027658129, 0.004932501989815319, 0.005135354024309774, 0.005330003056957519, 0.005516825597878119, 0.00569595352300673, 0.005869139388881939, 0.006045737800911038, 0.006229210501573302, 0.006421856224289132, 0.006627432000413547, 0.0068518464055479815, 0.007098798171499168, 0.007369430603114606, 0.007639584589146335, 0.007892754229878169, 0.008242573217937931, 0.008626522050830048, 0.009048609945984934, 0.00951333974624522, 0.01002585995464929, 0.01059380195230848, 0.01122528605278444, 0.01193170027808954, 0.012730379758863795, 0.013622102773914214, 0.014594413656609365, 0.015624805985882777, 0.01667711659919099, 0.01770148015424106, 0.01863674221030324, 0.019435225131776025, 0.020066223607561745, 0.0205231927424013, 0.02082769833773343, 0.020998715115163824, 0.021050918417387838, 0.020993293507986146, 0.020835290759319478, 0.02057883703851352, 0.020229473238201186, 0.019803661341481864, 0.01932289069815068, 0.018804724414280046, 0.018257679468002067, 0.01769008609331129, 0.01710971904786358, 0.01652412801493859, 0.015935507367124093, 0.015347421472041933, 0.014767547544251376, 0.01420336584797575, 0.013667061610090098, 0.013159801437299109, 0.012672726754267125, 0.01219860806784763, 0.011730960861969003, 0.011264217650658409, 0.010792606825747883, 0.010319548635273417, 0.009847486672452744, 0.009378800050301091, 0.00891561662002465, 0.008462202165577786, 0.008016136350995755, 0.007567903317638275, 0.007114132002303431, 0.0066514777834540345, 0.006176095700682825, 0.005683914542151357, 0.005173013502489468, 0.004640356370827623, 0.0040826397577977324, 0.0034922585363023183, 0.002862101169160434, 0.0021843321633337642, 0.0014517706175528951, 0.0006638754150316546, -4.171920470707708e-05, 0.0003224466463242157]]], "drag_distribution": [[[-9.726830162035244, 5.775514037867957, 2.6775466792163063, 0.3835654672210781, 0.20610172772903604, 0.17364844338725804, 0.13930131964933015, 0.10162571302082232, 0.06263634722873838, 0.027041820347895703, -0.0019750292885799747, -0.02471411434510696, -0.04187098136460078, -0.054240313162420103, -0.06255728945185343, -0.06739936188435387, -0.06915463549964856, -0.06801430633813015, -0.06419916042619497, -0.057771208361129645, -0.06486789926330659, -0.05480352362922222, -0.04475398871694319, -0.03541863768523622, -0.02743923693895489, -0.02142164171472867, -0.01761804260107246, -0.01467992053640815, -0.012045074558256602, -0.009545230742422774, -0.007107688719160998, -0.004687551740305053, -0.0022514561475671926, 0.0002400359993352485, 0.002814995836092438, 0.005499054376612334, 0.008129771815286896, 0.010298030429043842, 0.012753074881530525, 0.015127103725619715, 0.01729698992090791, 0.01909820678652724, 0.020719875614231553, 0.022440702632871384, 0.024141951977472015, 0.025656112864283223, 0.026972813407049056, 0.02802565455312673, 0.028760251301890832, 0.02915564091171983, 0.026726599957119523, 0.02406591541017037, 0.02175211616063915, 0.019915857875244972, 0.01831253153373124, 0.01657850181063036, 0.014303298219209677, 0.011910701945690216, 0.01018648566477293, 0.009978470024394259, 0.01141548135107231, 0.01391267472769405, 0.016969439644984572, 0.02023858783095808, 0.023560365116796815, 0.02680166750968706, 0.029863956111479083, 0.032716627937594694, 0.0353637993848842, 0.03770754896410383, 0.03962705059069329, 0.04106442543415128, 0.042031124146572875, 0.042677542984498794, 0.04319015473600855, 0.043583936772563135, 0.04387203258682499, 0.04404972332639909, 0.04406214754319488, 0.043784931958800656, 0.0431806834229971, 0.042249901976277565, 0.04102740355403368, 0.03970971314885183, 0.03872678316146311, 0.037759858186389286, 0.03622412777823672, 0.03435781879357012, 0.03210780081181397, 0.02939684979103247, 0.02091058293798812, 0.020625375674566404, 0.02028679776307594, 0.02013474680003895, 0.020572945815057333, 0.02212888644099688, 0.026306610637585062, 0.03856414675366932, 0.09437843299303467, 0.20238146874757965], [-1.6171088162099019, 1.3323154208742123, 0.6725554228542302, 0.26942411482327056, 0.18093615724019083, 0.15279686378190863, 0.12060777434704692, 0.08437150538140466, 0.04656592106903558, 0.012067013579467774, -0.01584393305382735, -0.03754404508697166, -0.05377024264476105, -0.06533082409525912, -0.07296416584082807, -0.0772463203788586, -0.07856270707935309, -0.07711056074624813, -0.07308755169185195, -0.06643756019965133, -0.06461784130276371, -0.05489960447443903, -0.04521614186040373, -0.036257083908209, -0.028655058797273075, -0.023010958600760557, -0.019555098244229605, -0.01696639297865379, -0.014673644388868257, -0.012519737568416895, -0.010437911724562998, -0.008398733818898505, -0.006374642973964416, -0.004332199040175277, -0.0022530975202466135, -0.00012756298241827315, 0.0019388883972013679, 0.003724547642072107, 0.005520709096765594, 0.007121576018401036, 0.008406492531895782, 0.00920767680069295, 0.009713436377347985, 0.010194865318919817, 0.010513840123925701, 0.010472650705519516, 0.010041949222096775, 0.00915471470779845, 0.007771763744167886, 0.005914163334350709, 0.0026066329707767877, -0.0007872262411900158, -0.003651148162793746, -0.005840827553096161, -0.00760880549036142, -0.009346796813520158, -0.011427922535617266, -0.013464328037894966, -0.014728084071010956, -0.01443337975230947, -0.012478513912585793, -0.009381304221325017, -0.005676794341507879, -0.001728123747905668, 0.002298986401008732, 0.006267860560606594, 0.010076888655652011, 0.013693663734462982, 0.017122370966196593, 0.020268953021856384, 0.02301407893253853, 0.025285887923487443, 0.02705530089312595, 0.028449049240249078, 0.029663593240862755, 0.03073090978776979, 0.0316693880303246, 0.03247849349631736, 0.03311770252820253, 0.0334621508561275, 0.03347309187552271, 0.03315540321308283, 0.03253546600791851, 0.031724171000240685, 0.030975701520158792, 0.03018018396286032, 0.02903506363572566, 0.02760030687753637, 0.025804823650665512, 0.023556355371195395, 0.01844254503555852, 0.016526792521353507, 0.014110015065345987, 0.011194320156322084, 0.007807148353252556, 0.003995315384088147, 0.00017318528598964415, -0.011386496199516795, -0.009427230345737059, -0.004219849490137187], [-1.1050894214701505, 1.0852268787762902, 0.6144428545368387, 0.34802996604785613, 0.2507972855655678, 0.21192582634585394, 0.16653948062644555, 0.11511844973822184, 0.06136510271249488, 0.012318406108372176, -0.027289496900715318, -0.05802432906495397, -0.08095523475185219, -0.0972443855880509, -0.10795035595897368, -0.11389771378862784, -0.11563757265744253, -0.11345441731339555, -0.10762369150160157, -0.09802585930868368, -0.09246382757570422, -0.07865995634554585, -0.0649124972871998, -0.052205930555730605, -0.04144328717446295, -0.03348352923791523, -0.028649265715115283, -0.025057512074355318, -0.021887205999160362, -0.018917024196057463, -0.016053319750143652, -0.013259064424360137, -0.010496708711205574, -0.0077203473601345765, -0.004907002025351063, -0.002047928319571989, 0.0007246220284399835, 0.0031552400495370187, 0.005509311144896491, 0.007545794633805365, 0.009092704406123506, 0.009908661501652509, 0.010263093300867688, 0.010541741672215808, 0.010540356867677092, 0.010055835342210797, 0.008970799075252892, 0.007190662570176233, 0.004661943606921903, 0.001430341918258627, -0.00340073651228313, -0.008288449536066665, -0.012341260085789839, -0.015351622601022099, -0.01768703132385074, -0.01992052517252843, -0.02257693901618877, -0.025115258011737612, -0.02651408911550975, -0.02566971929008901, -0.022446593391783776, -0.01775773149716949, -0.012189461219313198, -0.0062663594406891805, -0.00022702397483408994, 0.0057322325353748, 0.01146538887643361, 0.016925879213942185, 0.022120139502616067, 0.026915099518811374, 0.031140623191666265, 0.03468939018654616, 0.03750651872152874, 0.03976583253028856, 0.041752108547321816, 0.04328135773894894, 0.04460683010446348, 0.045733598426943356, 0.04661851212348936, 0.04708008714417686, 0.04706131801339711, 0.04657126917937155, 0.045645503601773045, 0.04441447809182828, 0.043183573856824885, 0.04186444904302111, 0.0401180808933422, 0.03797233566122172, 0.03532033193908901, 0.03202547134084123, 0.03209323685775749, 0.028440613065645482, 0.023733367243777514, 0.017818821185938354, 0.010491992067032562, 0.0016002311628588721, -0.008792443058260392, -0.020179726969954147, -0.06835220735862814, -0.1186099675100887], [-0.3978295541530249, 0.8566485207415608, 0.5498697715772428, 0.4321460038234523, 0.38030216181888443, 0.3215760786603778, 0.251493025897441, 0.17156255719878308, 0.08783789143365389, 0.011452317018727157, -0.05011691149436111, -0.09779811773260998, -0.13329071933044295, -0.15842550665084465, -0.17486522923689807, -0.18390302652157248, -0.18640226876149055, -0.1828125333738323, -0.17355387493995186, -0.15837658305665336, -0.14495860107903488, -0.12348025733301206, -0.10210091865711868, -0.08236027849705067, -0.06567052612816279, -0.05337689601941398, -0.04592475414165995, -0.0404240447672261, -0.03557892806491547, -0.031044335257948804, -0.026674318185220952, -0.02242344993615253, -0.01823340633073036, -0.014033522095591527, -0.009792327760091488, -0.005503930965370818, -0.0013446215142004256, 0.002384634240417911, 0.0058598595703942035, 0.008788767874205938, 0.010904486022200127, 0.011831474838446088, 0.01200320714445825, 0.012030961935715189, 0.011589008639729633, 0.010204450797441991, 0.007794046280412116, 0.004207747972428795, -0.0006322133641081973, -0.00663976870776627, -0.014436649276129379, -0.022257148035071186, -0.028689242655103937, -0.0334047790770179, -0.0369870324594793, -0.04035019797803881, -0.04463466457924652, -0.048654875108876346, -0.05084863464824874, -0.049532405896410496, -0.04451213908246539, -0.03711220674713115, -0.02831674364078017, -0.01896114438226492, -0.009419020171286034, 3.992134192536999e-06, 0.009080999720285749, 0.017743343005284774, 0.026008804912316445, 0.033676999767777674, 0.04048405678391615, 0.04624518697330065, 0.050825998722713046, 0.05447197159481782, 0.05764087418374312, 0.06043202191646331, 0.06289895961859834, 0.06504908677085493, 0.06681560119408758, 0.06791516012594168, 0.06825830239707846, 0.06786114294310525, 0.06677467408095261, 0.06515855302161878, 0.0633997878193287, 0.06146979213114744, 0.05898457508759536, 0.05589338189813952, 0.0520184719165931, 0.047137263918496514, 0.04788617259494979, 0.04152552349175121, 0.04186157252461886, 0.030056304581053687, 0.015232534145956165, -0.003377408970132465, -0.026799903411060682, -0.05720302667414752, -0.09968843409345696, -0.180541002519846], [-0.11412385445095637, 0.7323213499746865, 0.5552358149326028, 0.4514890428853864, 0.3987693325171084, 0.3372645870408023, 0.2633552228445261, 0.17888641351889764, 0.09035270775364129, 0.009582304571360242, -0.05548321630418209, -0.10584091662345958, -0.1432989872311322, -0.1698001176555646, -0.18710712111955194, -0.19659029471094552, -0.19916422443891912, -0.1953064261485929, -0.18545815064818244, -0.16933458303151544, -0.15359192801885885, -0.13083991473302634, -0.1081961811920199, -0.08728995561766396, -0.06961464255661631, -0.05659327660418459, -0.04875083193806098, -0.04297510274587698, -0.037891764866861855, -0.033137848150190725, -0.028560017027138535, -0.024111462299585582, -0.019731727341591333, -0.015347139095872481, -0.010925893902014712, -0.0064642596589658, -0.002138832516907682, 0.0017640408760299807, 0.005353479672726477, 0.008348170294487457, 0.010466572408450392, 0.011310298237053118, 0.011337413101165796, 0.011193592103087251, 0.010530592824934919, 0.008842485205599436, 0.006037855889713305, 0.0019571701848924727, -0.003479758035099606, -0.010176612878117018, -0.01853699574310724, -0.027209095564898592, -0.03440166619665681, -0.03976358998284941, -0.04391836769488573, -0.04784441754425684, -0.052347245498243315, -0.056548267597426455, -0.05879748541328229, -0.057315493858484765, -0.05189920535781209, -0.04393105130257517, -0.034475624114251265, -0.02441972235968033, -0.014160904556763039, -0.004024442276747308, 0.005747969044824008, 0.015082137977867479, 0.02399520796965565, 0.03227394324269769, 0.039637915582789944, 0.04589110672692577, 0.05089075018929598, 0.05489669968402498, 0.05839468820652961, 0.061490907353313404, 0.06424167628041749, 0.06665464585636119, 0.06865931995013515, 0.06995594224769087, 0.07044976126712535, 0.07015847400887844, 0.06913457169986888, 0.06753266443220274, 0.06573302958071543, 0.06374107494174257, 0.06119784081597336, 0.05801889137185872, 0.05401260815433689, 0.04947150743921498, 0.06432759896961812, 0.05602218595272306, 0.04570308641028953, 0.03290792546463248, 0.016972298096222516, -0.002926404720431291, -0.027882823796653917, -0.06019157944764385, -0.10519553257019988, -0.19047991861657837], [0.05466542861507543, 0.7217601562365465, 0.6011944557627789, 0.5000359708201044, 0.44267814654359505, 0.3744529743004945, 0.29210462609771204, 0.19786790530622347, 0.09905724589188522, 0.00891292678179931, -0.06367706014327118, -0.11983638107535562, -0.16159098733654162, -0.19111382617360778, -0.21037554961342686, -0.22090754909100005, -0.22373172060053953, -0.21938250072195262, -0.2083502944725773, -0.19030259242583908, -0.17149174618005472, -0.14610530556345427, -0.12084123165168298, -0.09751948139739003, -0.07780843214847241, -0.06329833334809679, -0.05457237811507451, -0.04815555737956503, -0.04251130105108689, -0.037235640627770746, -0.032158147583033314, -0.02722745264016402, -0.02237694842190936, -0.017525125524937644, -0.012637492087244247, -0.007711665682460383, -0.002937878574013987, 0.0013867165575623063, 0.005329590123476031, 0.008596292875904249, 0.010872796221324532, 0.01171345722086817, 0.011629191089616419, 0.011340016710193844, 0.010454500634560323, 0.008403815091830703, 0.005083552660159027, 0.00031507034275872616, -0.006257420575081203, -0.014291607077109235, -0.024056980000637766, -0.03384029501947717, -0.041949768987313736, -0.047990571369898594, -0.05265867479781566, -0.05704894416814708, -0.06206391460660327, -0.06672509267344497, -0.06919134728625617, -0.06747883544345297, -0.06136241768329019, -0.05237001156017077, -0.041708970451747006, -0.030371717599442936, -0.01880401443070804, -0.007370337285036596, 0.0036582977643669764, 0.014197929798261734, 0.024266460246803987, 0.033624944423075176, 0.04196025576706623, 0.049053181958990444, 0.05474386470379162, 0.05932242437785706, 0.06333203015253643, 0.06689183100437204, 0.070064318427902, 0.07285789450638311, 0.07519396966046264, 0.0767378549352874, 0.07738367063441286, 0.07715164727093624, 0.07609937151893545, 0.07438938338104206, 0.07242569325605529, 0.07023945851537011, 0.06746324729175028, 0.06420902304061263, 0.06011629823468437, 0.05487302587973111, 0.06517137796339123, 0.056781662383552256, 0.045953639064188964, 0.03223236669885875, 0.014916151921067067, -0.006883379350017533, -0.034362197167060016, -0.07006234998681583, -0.11997592988403893, -0.21495875363212685], [0.1607309895265016, 0.7191937386588269, 0.6291804490457068, 0.5306488023476877, 0.47044014257406214, 0.39796951483525494, 0.31026444625288624, 0.20981913866394353, 0.10447374237606186, 0.00836901946420665, -0.06900361931833789, -0.12884906459056902, -0.17333225575764646, -0.20477286788068497, -0.22527392327685886, -0.23646938216786778, -0.23944945104618406, -0.2347848592651175, -0.22299713004826074, -0.20372245536623435, -0.18298181115361056, -0.15593068259322332, -0.12901010480048347, -0.10416180641010787, -0.0831658287396517, -0.0677191010418749, -0.05844179908692365, -0.05162815337883715, -0.04563819980999542, -0.04004229850509801, -0.03465929318237887, -0.029435069269345974, -0.024299267382974134, -0.019165476011799597, -0.013997761730256807, -0.008794850241225746, -0.003755583963940751, 0.000817076611342788, 0.004960169908683866, 0.008371790533896016, 0.01071688627185715, 0.01151919696223067, 0.011322701219247128, 0.010894132088857663, 0.009813922286279043, 0.007472643596946633, 0.0036925226621212855, -0.001720862408669362, -0.008844444179703124, -0.017550902723036742, -0.02800883534208855, -0.0384816906486712, -0.047160255420837564, -0.05362050720859131, -0.05860359826506987, -0.06327805127648696, -0.06860805591493543, -0.07355181925706542, -0.07614746347842788, -0.0742796099165027, -0.06770908960984011, -0.058053129575961746, -0.046613101023561504, -0.03444909973542223, -0.02203706230365649, -0.009766457582923034, 0.0020730181055750784, 0.013391171421311724, 0.024206373394864318, 0.03426333251052514, 0.04322784639497753, 0.0508659521176552, 0.05700691179936486, 0.061960117337635304, 0.06630534545048734, 0.07017003807435444, 0.07362059618566819, 0.07666589770866718, 0.07922221885685192, 0.08093265455751085, 0.08168424543152882, 0.0814988694333469, 0.08043729117489831, 0.07866643169418078, 0.07660404077159046, 0.07429931962553776, 0.07161516085879309, 0.06827315232255775, 0.06399577592440166, 0.05847203377803739, 0.06941449031992802, 0.060332907837400536, 0.04869831765816517, 0.033997457811536624, 0.015475182724762001, -0.007821181172710525, -0.037156300869997376, -0.07519516655417255, -0.1283538890345463, -0.22955450764634822]], [[0.036908031936817846, 0.03714493247001663, 0.037639451242642376, 0.03854142819831398, 0.04105233788874934, 0.11926694047306786, 0.20358786735603068, 0.09778599283897842, 0.11203195011235136, 0.03885766859782934, 0.025881381458308244, 0.02142375509148366, 0.01727504120970769, 0.013448851212377098, 0.009976705955271758, 0.006871929281080797, 0.0041339284980055156, 0.0017519358696524642, -0.000287055445352155, -0.001968673897276696, -0.006424340969376711, -0.007075688100457656, -0.0074287701505641145, -0.007584705637854712, -0.007645134809078348, -0.007714353450228548, -0.007884616983229707, -0.00813707252743544, -0.008423978544563846, -0.00872231442058641, -0.009029055632490875, -0.009347922566943992, -0.009675885187425551, -0.010006973413211655, -0.01033810968362733, -0.010667130525402035, -0.01099668862668975, -0.01133142204748604, -0.0116743811039729, -0.012031831069380133, -0.012423451372406275, -0.012883262272160325, -0.013422376445016194, -0.014045645863467515, -0.014785257696299604, -0.015606480185999833, -0.01644103975851916, -0.0172157892821414, -0.01783818029343754, -0.018194301175249606, -0.01847270319411745, -0.018343156323754255, -0.017785246289750905, -0.016838891781945003, -0.015607741557994716, -0.014124236412682801, -0.012381475027790656, -0.010373779113852287, -0.008098517055861303, -0.0055948665683933675, -0.002938496324087585, -0.00026123862155751467, 0.0023594124916006334, 0.004854832458786737, 0.007182008166576941, 0.009307108963973158, 0.0112077893359007, 0.012876898935793113, 0.014315702651924521, 0.015514116891727348, 0.01647086315064888, 0.017196560400289346, 0.017719294675049985, 0.018124034119382692, 0.018487312082189174, 0.018804653198176986, 0.019110738156404624, 0.019561509470874695, 0.01972724874964011, 0.01973757270274833, 0.01959952582629941, 0.019328448889977947, 0.018938969768618478, 0.018456584986917317, 0.017923222770970745, 0.017347047063663617, 0.016702157783198567, 0.01596490525791825, 0.015109207203429913, 0.014102013901602862, 0.01521143678979458, 0.01443693767927499, 0.01345880000679832, 0.012234040097053462, 0.01141758078509497, 0.010888809823492569, 0.009650967193891184, 0.012276195089667234, 0.0257341515836054, 0.05315344861547669], [0.10162214187120767, 0.10213042219282985, 0.10311058156384457, 0.1046336971937527, 0.10814828753424036, 0.21608102462154394, 0.19977587833781907, 0.13007242966993213, 0.13284681998995965, 0.09094354340300306, 0.06682683638968029, 0.05431118727172348, 0.04237490491687154, 0.03126160091906615, 0.02113318185249824, 0.012056040420563479, 0.004036245432423339, -0.00295743115914662, -0.008931101750367104, -0.013760237523888708, -0.021703112108311492, -0.02372020300545618, -0.02483155302688051, -0.025351160670424394, -0.025593292431610012, -0.025878588404780956, -0.026486729626998346, -0.027350847245514058, -0.02832339400734724, -0.029341771093457196, -0.030399592783539535, -0.03150905777889577, -0.03266141275902253, -0.033839293002758085, -0.03503580886289694, -0.03624802849982114, -0.03748973163132776, -0.038781589752172316, -0.04013959754474792, -0.04158925778021444, -0.043196672575133994, -0.04507267429491819, -0.04725547889324615, -0.04976500984352479, -0.052710120635432185, -0.055994557246535716, -0.05941253109608801, -0.06273669364845574, -0.06567052221604382, -0.06784133284692258, -0.06926737005278381, -0.0693615456887753, -0.0680344898070465, -0.06539958297282945, -0.06178412029163102, -0.0573069178591468, -0.05196931227983733, -0.045769428397913654, -0.03868713644871963, -0.030810472940225046, -0.022377046175988017, -0.013754039820417539, -0.005263082453626196, 0.0028684916076208143, 0.01050106621347981, 0.017526806549111342, 0.023873727922539424, 0.02951778670357605, 0.03446134997809278, 0.03867115560898365, 0.042139650376833954, 0.04489434328669891, 0.04701242793774216, 0.04875225806667178, 0.05035788569906986, 0.05181456402995706, 0.05315319403656068, 0.05456779645575006, 0.055420219222143616, 0.055815638841350726, 0.055754774299557365, 0.0552780642735044, 0.05442817150776212, 0.053278596248637664, 0.05195053643651839, 0.05046863896526582, 0.04874794816447514, 0.046709495059910004, 0.04426696387378076, 0.04131248778022548, 0.040922463333749215, 0.03749546016855427, 0.033298656922419234, 0.02818503743986065, 0.02293610788729698, 0.01722255328050828, 0.00942797712881938, -0.018359901729071683, -0.027301826873728147, -0.03737245935036675], [0.15898977521693178, 0.15972302530218474, 0.16109236459016033, 0.16306204797681534, 0.16709810206892328, 0.2897296619539153, 0.23442605860200708, 0.17413330476714897, 0.14966354717519378, 0.12290503657018349, 0.10264357916215668, 0.08295844241753929, 0.06406303968239213, 0.04642720826309539, 0.030336577950561935, 0.01590780462896556, 0.0031536967678363966, -0.007975282519713753, -0.017475915772681528, -0.025116816843046216, -0.03568237199997016, -0.03893440059127741, -0.0407330185766561, -0.04158479299823814, -0.04199620735805639, -0.04248331308722062, -0.04349472084901798, -0.04491937580367909, -0.04651951108107857, -0.04819752780488304, -0.049944271041696624, -0.05177966716209497, -0.05368984480723727, -0.055647237741414335, -0.05764174862275287, -0.05967009223868577, -0.06175661383836522, -0.06393705429848073, -0.06623970623014375, -0.06870802014119906, -0.07145054206062335, -0.07464805605064864, -0.07836362999048836, -0.08263125913618907, -0.08762995189626056, -0.09320884850312793, -0.09903832716647393, -0.10475153191331332, -0.10986660306357394, -0.1137750635226068, -0.11628991038949629, -0.11663126323054882, -0.11464503132167904, -0.11051009342374293, -0.10475654318434553, -0.0975829622101281, -0.0890001935552863, -0.07901122430329868, -0.06757901697869755, -0.05483277119348237, -0.04115682185581464, -0.02712744130874724, -0.013294407833850415, -2.9907435926050374e-05, 0.012438511921650101, 0.023935821128181354, 0.034344898229780485, 0.04362625210004235, 0.05178310601753992, 0.05876105485114766, 0.06454654600460329, 0.06918187377059144, 0.0727877495533987, 0.07577887374108383, 0.07855141088857152, 0.08108124610063558, 0.08338893149123715, 0.08567674290208276, 0.08718081099618472, 0.08795737365024403, 0.08799951872351501, 0.08736973855718853, 0.08613580677335614, 0.08441413524751198, 0.08239681614805693, 0.08012334308945437, 0.07745493072104317, 0.07426206981790102, 0.0704034777231093, 0.06570313621172248, 0.0636106478081096, 0.05769199691612411, 0.046954314590130546, 0.036669181053831656, 0.02483170285674752, 0.010553373069331582, -0.009037445234445116, -0.029492676133044866, -0.04918986044930562, -0.07424977099738413], [0.23848759443864162, 0.23948655130501634, 0.24127322425718595, 0.24355463725974794, 0.2472264187771799, 0.3558500594407232, 0.27154928237322107, 0.23203180966890677, 0.2149579602112566, 0.18068068659198963, 0.15085891290678116, 0.12116117570751714, 0.09245796769702816, 0.06559854083990474, 0.04106399689270001, 0.019050144166903416, -0.00041840677993360215, -0.017417069841526744, -0.031920201072581214, -0.04352116789552977, -0.05633799764388069, -0.06137288202024518, -0.06416839496182503, -0.0655093351066221, -0.06617955673831413, -0.0669766086544935, -0.06859140498590975, -0.0708468759626973, -0.07337508468965809, -0.07603018188491234, -0.07879979614394321, -0.08171518771298628, -0.08475526160257099, -0.08787801835772287, -0.09106942208872411, -0.09432666523140487, -0.09769080515792924, -0.10122099189858445, -0.1049649890709327, -0.1089937572659191, -0.11347847040846593, -0.11870233669705839, -0.1247652990376837, -0.13172295186241917, -0.1398579905154976, -0.1489436851829142, -0.15847311725896662, -0.1678778098695902, -0.1764057356244523, -0.1831027845633181, -0.18733735038335156, -0.1881654090557863, -0.18533257804889344, -0.17910961023597155, -0.17022878802990657, -0.159058289650687, -0.14564169027784718, -0.12999998961097328, -0.11207328039176735, -0.09204513671449119, -0.0705155041441431, -0.048574027684027965, -0.026912697536988828, -0.00611635455009837, 0.013459100671760529, 0.03154105815063354, 0.04794669697053017, 0.06261389020812363, 0.0755468070591719, 0.08666008199018557, 0.09593065790482327, 0.10342085010332334, 0.10931170403685046, 0.11424245187637957, 0.11883079215567291, 0.12303891019256538, 0.12685240487924368, 0.13040976866963075, 0.1329472375791317, 0.134372761688944, 0.13466289662629305, 0.13391014093716708, 0.13263078085088703, 0.13057656187210068, 0.12790544050514466, 0.12475608490731217, 0.12092807186435661, 0.11622387694578568, 0.11042331519834767, 0.10325000826836848, 0.10845269013493546, 0.0975946483995556, 0.08447875143582173, 0.06870396877024817, 0.04975557504199868, 0.02682866413731906, -0.0011879929790558866, -0.036369300571412626, -0.08233606793103673, -0.15508130098166323], [0.2595908404360472, 0.26064291563342346, 0.2624942405908372, 0.26474225532412304, 0.2679062687364288, 0.35979936366765386, 0.2781300466823564, 0.2465412586606194, 0.23063742458529177, 0.19538277076708768, 0.1631216709523001, 0.13073674632338994, 0.09936791454960411, 0.06999007827639618, 0.043145313709573835, 0.01905403356972709, -0.0022550872922292263, -0.02086452311765284, -0.036739084685446906, -0.04941534408561642, -0.06230668302278555, -0.06784189081873945, -0.07091886876368476, -0.07240057707521678, -0.0731486617850162, -0.07403944541051238, -0.07583126729231826, -0.0783277243165144, -0.08112437835527608, -0.08406266676670365, -0.08712959917519443, -0.09035968092636923, -0.09372984982735463, -0.09719416294061685, -0.10073773044105491, -0.10435823741141106, -0.10810196076718015, -0.11203522022964614, -0.11621186679535088, -0.12067070317925319, -0.12562519011181286, -0.1313887957426927, -0.1380708545304601, -0.14573074021243348, -0.154677092447066, -0.1646590869341725, -0.1751180148059458, -0.18542660204753253, -0.19475536041502303, -0.20205288105095298, -0.2065126965379011, -0.20719119887691986, -0.2038091418965341, -0.1966680796964391, -0.1866811464642108, -0.17420646198793763, -0.15928448576900422, -0.1419350651229775, -0.12208534848435382, -0.0999270042084366, -0.07611758433944553, -0.05186103637703256, -0.027911341916829306, -0.004913325182874879, 0.016741349566015792, 0.036753124988001734, 0.054921094261483165, 0.07117711463765941, 0.08552584052210054, 0.09770647535434053, 0.10781869965634969, 0.11594669759239777, 0.12229472359345184, 0.12756738106226234, 0.13244537511744917, 0.13688859375389645, 0.14087028148050854, 0.14448713831707638, 0.14704411831761277, 0.1485404651546678, 0.1488551058051466, 0.14805752356632373, 0.14624715357880005, 0.1436061474851598, 0.14044225625813297, 0.13681827122223583, 0.13248967698161773, 0.12722686451069348, 0.12078019378267378, 0.11284078810769377, 0.11738703293255086, 0.10548930239333924, 0.09113119938525432, 0.07387007227061361, 0.05306398055364628, 0.027885966788746993, -0.0028628549597939936, -0.041458451720370916, -0.09186355597409387, -0.1716045391683706], [0.2846880896955384, 0.2858170788226205, 0.28778169453110647, 0.2900816428787167, 0.2929661610882352, 0.37521329489979127, 0.29557017645898787, 0.2672575051138377, 0.25058091590927684, 0.21336829344430364, 0.17812849802922212, 0.14257091068554034, 0.1080809416294702, 0.07576325269903939, 0.04622526582104328, 0.01971381969765136, -0.003738312229761143, -0.024221849978799507, -0.04169308695528253, -0.05562915875944782, -0.0690218908012279, -0.0751307666312714, -0.07852919733610575, -0.0801697020387555, -0.08100315736751312, -0.08199637378625499, -0.0839854273313079, -0.08675235016659286, -0.08985083083756268, -0.09310711221118416, -0.096507282464213, -0.10008951963262339, -0.10382846117826305, -0.10763456850217284, -0.11151868808804356, -0.11548150427916173, -0.11957546324902786, -0.12387395507001095, -0.12843661574071305, -0.1333503038660751, -0.1388220133244367, -0.14519409843063588, -0.15258550591338318, -0.16106109259317808, -0.1709622086446186, -0.1820135084358059, -0.19359881958955164, -0.20502602956432558, -0.2153795812370899, -0.2234984132633061, -0.22841461692382053, -0.229151850031534, -0.22540071636803824, -0.21749420510555495, -0.20644169309662927, -0.19264094511184898, -0.1761391777063377, -0.15695973228086063, -0.13501963734923986, -0.1105249313689029, -0.08420109953517779, -0.057355805942577436, -0.030846183653529993, -0.005602968275747428, 0.01811118052448346, 0.039988423001518926, 0.05981782926772899, 0.0775292137952407, 0.09313294931467644, 0.10652783689189733, 0.11768444472652329, 0.1266755888092929, 0.13371667306948176, 0.1395802232322022, 0.1450169561408695, 0.14998148939876732, 0.1546476719134487, 0.15867935646592227, 0.16182380556902487, 0.16366418130487748, 0.16414755725898936, 0.163377717696241, 0.16147398972879926, 0.1586424320650844, 0.15522580562531982, 0.1512953096417363, 0.14658203318310375, 0.1408330868236773, 0.13377333765340652, 0.12506216855228766, 0.12861547447266455, 0.1154410721327374, 0.09955627583115209, 0.08047360541355414, 0.05752735627039662, 0.029771178305817724, -0.004113100352305486, -0.04662814443733226, -0.10212443122066893, -0.18985767722749447], [0.3057411345093361, 0.3069375734495118, 0.30900498517802205, 0.31136803896569665, 0.3140872567844199, 0.3904241051301273, 0.3124332491193877, 0.28544592500700494, 0.26758510678588654, 0.2285623894631054, 0.1908073344939174, 0.15259325764643153, 0.11549553884501927, 0.08072349592283347, 0.048937838302848466, 0.02040696792413029, -0.004833060314783496, -0.026879851317675545, -0.04568315792403639, -0.06067198554015551, -0.07457332114258805, -0.0811588722381782, -0.08482412456291115, -0.08659600056912123, -0.08749952858528967, -0.0885767446021389, -0.09072841253756422, -0.0937187791787733, -0.09706673477400937, -0.10058576016997978, -0.1042228396495154, -0.10804799792738705, -0.11203549559699043, -0.11613078939012755, -0.12031667905578641, -0.1245913315052067, -0.12901034302253547, -0.1336529178024664, -0.13858333722676308, -0.14389522751042055, -0.14981179600126862, -0.15670225293883697, -0.16469488362926682, -0.17385986729435615, -0.18456592078747283, -0.19651720539178638, -0.2090500159340808, -0.22141844392725368, -0.2326353143783774, -0.24144822308402217, -0.24676324388672616, -0.2475691538835743, -0.24353117457844703, -0.23500805070668188, -0.22308875362331726, -0.20820365111349565, -0.19040535672782277, -0.1697200670291716, -0.14605681308999013, -0.11963428837325508, -0.0914712671624467, -0.06276783343257454, -0.03444971018762729, -0.00728122062211618, 0.01827651954141962, 0.04187332646837633, 0.06327405220129823, 0.0824009525466539, 0.09926244437862755, 0.11374726554394028, 0.12582243729465256, 0.13556547263705468, 0.1432073820930147, 0.14958046233751596, 0.15549468630621288, 0.16120314264043598, 0.16634583771109646, 0.17077414183085587, 0.17423329107125712, 0.17627897777274765, 0.1768555581534138, 0.1760747447133494, 0.17406677945979487, 0.1710549521082375, 0.16740965370814784, 0.1632082006098494, 0.15816091281254818, 0.15199527190669615, 0.14441479807461405, 0.13505242418177707, 0.13780840196210523, 0.12361553747971726, 0.10650653667870352, 0.08595328350422121, 0.06119069055756891, 0.031284114290309806, -0.0052022155886969415, -0.05097577480825993, -0.11071272656472074, -0.2051179332138425]], [[0.0041017335632438714, 0.0043666244789597195, 0.004901110356256715, 0.005667889000074652, 0.006592289664196153, 0.0075296760432449795, 0.008180083346880132, 0.005351993450648997, -0.057019248545399616, -0.26736818768070714, 0.6887323338671358, 0.2444646672219139, 0.07103006135982892, 0.014443716992468445, 0.011247560983068658, 0.008806166033531026, 0.006691192128911788, 0.004761499380636783, 0.002971927646100521, 0.0013216130621226815, -0.002506412645574322, -0.003442359705046013, -0.004163068606812764, -0.0047071879911712786, -0.0051169173193442155, -0.005437458793675776, -0.0057247113594095095, -0.006032825087766696, -0.006356027801790355, -0.006686226372296905, -0.007024794109646689, -0.00737468699509346, -0.007733428679931665, -0.008097157623872498, -0.008463824114774523, -0.008831552238540648, -0.009197942886580856, -0.009561554069939015, -0.009920657005585962, -0.010275722638977183, -0.01063645301668987, -0.011019726844549289, -0.01144665085404885, -0.011941401785708433, -0.012524072026302744, -0.01314616516907153, -0.013744394413198581, -0.014250486365711348, -0.014582268960612942, -0.014644094956252683, -0.01448446816054419, -0.013957187575548884, -0.013095886010555542, -0.011954568759897876, -0.01061469338107114, -0.009080390293109862, -0.007316273715503034, -0.005339788455196415, -0.0031820424142816207, -0.0009186800730680377, 0.0013656520816944095, 0.0035712851174574557, 0.00566870911955295, 0.007623448506943965, 0.009408914381341444, 0.01100512864519717, 0.012399620874619205, 0.013587564043955638, 0.014602737351721878, 0.016093993033932573, 0.016772159438643963, 0.01724730879034345, 0.017568039491899366, 0.01780514026189857, 0.018013481236115524, 0.01818422197787534, 0.018307564156188103, 0.018371782167117108, 0.018356238843323623, 0.01823525339730781, 0.018014625653836772, 0.017704199029029494, 0.017314086275701628, 0.016860984300137022, 0.01636860140412581, 0.015838574644870047, 0.01525195750442632, 0.014591323646934114, 0.013837360845970006, 0.012965748612406762, 0.01388517737135232, 0.013191378280720503, 0.012389588967035724, 0.011502367224486972, 0.010562466772889698, 0.009644021199833918, 0.008965005179528918, 0.009574212876880048, 0.018408454951610455, 0.03670112926472989], [0.011302209984928957, 0.01252006299644602, 0.014945509820824649, 0.018459094645536026, 0.022821157000691233, 0.027582316794242154, 0.031894661092667996, 0.02929763800812301, -0.01700557283752034, -0.19548797493392073, 0.6198909650130735, 0.20448970879411185, 0.056543667810195854, 0.041832620660501404, 0.03249728563521433, 0.024470837680486194, 0.017023844613547754, 0.009922522675009818, 0.0031674817324109225, -0.0030963914610968677, -0.013068437850768081, -0.01698455139633035, -0.020008889194648657, -0.022304484312846352, -0.0240489864863622, -0.025431972968515265, -0.026686326989117565, -0.028035324771375002, -0.02945240294305032, -0.030906967811752683, -0.03240789263913195, -0.03396894683894177, -0.035579935424417036, -0.03722501487887733, -0.038897103992164395, -0.04059077014829858, -0.0423003459889283, -0.04402459480165853, -0.04576077327571753, -0.04751540087686941, -0.0493337582764761, -0.051291916632707386, -0.053482803644760414, -0.056012864626332114, -0.058974104607569126, -0.06216748918505079, -0.06532688416858895, -0.06816014099088284, -0.07030877209249264, -0.071349267356344, -0.07112507955286071, -0.06928486577619988, -0.0659523765623933, -0.06134899620589299, -0.055825561462389026, -0.049411710090921705, -0.041970408030852537, -0.03358289203176885, -0.024378541600494876, -0.014670270803444106, -0.004814302725906423, 0.004844587608382028, 0.014080271234511442, 0.022734822114023303, 0.03069027338234835, 0.03786036804738208, 0.044192574874521925, 0.04967236521957915, 0.054364282145274216, 0.0594936826664552, 0.06262063832130409, 0.06493980927529022, 0.06660678854484373, 0.06791573851876781, 0.06911271241451275, 0.07016280888642584, 0.07102030702588437, 0.07163280390219041, 0.07191069669556654, 0.07173366628634863, 0.07110781531581073, 0.07007541566177498, 0.06868163548396557, 0.06700139785904743, 0.06513838820642194, 0.06309815934238105, 0.060795311963163304, 0.05815004054564063, 0.055074479859843685, 0.05145934084460815, 0.050875558663973156, 0.046788521446897116, 0.04200591952838508, 0.03648679948951563, 0.03017174116248969, 0.009978947393450862, -0.0023293197059633336, -0.017109587536881632, -0.02703834370109505, -0.03510093469841456], [0.015187644197572151, 0.017099957619734738, 0.02089767386012784, 0.026410848745899218, 0.033298267746409996, 0.04092733034283302, 0.04814655361160694, 0.052378749584032, 0.03255632643817545, -0.12014609869208813, 0.5100337116532596, 0.23928482828693196, 0.07584556929243016, 0.05736295229770892, 0.04451968681789802, 0.0329995970912699, 0.022077307589544137, 0.011526340744251415, 0.0014181927863842307, -0.007969205573319734, -0.02104386956228258, -0.027062000728024827, -0.03171296338294754, -0.03524779269159688, -0.03793989667067522, -0.04008077623999229, -0.04202794337708323, -0.0441232941952007, -0.046325109391143475, -0.04858759050769341, -0.05092553760713821, -0.05336063255104747, -0.05587726999776606, -0.05845121898262064, -0.06107215384881548, -0.06373262539477084, -0.06642555111983392, -0.06915081591057214, -0.0719058752439358, -0.07470244117744655, -0.07761184354525891, -0.0807530136167589, -0.08427047670409799, -0.08832978171641218, -0.09307527234427332, -0.0982025245599811, -0.1033020568810174, -0.10792249307735576, -0.11150746304438906, -0.11339745629376555, -0.11321808851554205, -0.11052634667108652, -0.10550608812596836, -0.09849582282106145, -0.09003842842930293, -0.08018405004388295, -0.06872620243118628, -0.055792796209863556, -0.041582366583941356, -0.02657445095696008, -0.011317242965627776, 0.003686313652866978, 0.018050502607387588, 0.03152753884298561, 0.04393363575940007, 0.05513524453982076, 0.06505150564512288, 0.0736622018090756, 0.08103793676510296, 0.08850737092634423, 0.09342048391827464, 0.09710773225236367, 0.0997904525423573, 0.10191994800932722, 0.10388047408020454, 0.10561917294107658, 0.1070640243079088, 0.10813325359462835, 0.10868795130910036, 0.10853842616876162, 0.10768729537356234, 0.10619992487525855, 0.10414679009571477, 0.1016449137772547, 0.09885530579932565, 0.09578601681664196, 0.09230352874590117, 0.08830224721498271, 0.08361079199251364, 0.07805115062866443, 0.07417525862799865, 0.0663702708941691, 0.057084302711281766, 0.0460637824409426, 0.03290549147435719, 0.01705061076258131, -0.0023188044652509903, -0.025545994550330717, -0.04553082163111434, -0.06536284157890493], [0.024125814750288545, 0.027768606204222994, 0.034982647611949684, 0.045477308694663016, 0.0586685203958087, 0.07348834767248488, 0.0880811452270294, 0.09881343558542872, 0.08196957489075538, 0.0011002669681655793, 0.3968695069172689, 0.30216972945807985, 0.12018245976431487, 0.09364329428806244, 0.07258633671373661, 0.05267544643563811, 0.033317392404075184, 0.014344760552890017, -0.003973820411010974, -0.02101424535474169, -0.04106936878398369, -0.052287286019963866, -0.0609630617829073, -0.06756557503211258, -0.07260523652429814, -0.07662572819801859, -0.08029274222931726, -0.08424122769461419, -0.08839169676921028, -0.09266111436905825, -0.09707930104870484, -0.10168767278094654, -0.10645725967739948, -0.11134311867714973, -0.11632707006778575, -0.12139695383080688, -0.1265426889921817, -0.13176748607089012, -0.1370698081783656, -0.14247473500097332, -0.14811857291197825, -0.15422690276994086, -0.16107241771408748, -0.16896747936645506, -0.17818681400164937, -0.18816573984827267, -0.19814002216560095, -0.20726365630970378, -0.21448908227173402, -0.21857031435361732, -0.2185527982582216, -0.21379667163959803, -0.20463252872364315, -0.19168808831266462, -0.1759824319305738, -0.15761785349923543, -0.13621733221595253, -0.11202518378217592, -0.08541092509815054, -0.057265859070588315, -0.028613294960032853, -0.0003391390156383032, 0.026764324778350567, 0.052225454733358, 0.07569687357889747, 0.09692773980794285, 0.11576707720101943, 0.13218124772579662, 0.14624702435376088, 0.15937747277514344, 0.1687422780857709, 0.17585179618435745, 0.18108450836383533, 0.1852802062197029, 0.1891669099548216, 0.19264758253581246, 0.19569387057673576, 0.19811351737989216, 0.19961558240235597, 0.1998160499088389, 0.19868396924447249, 0.19633916016610767, 0.19291377694030074, 0.1886293661410644, 0.18378759717267132, 0.17839860893519188, 0.17220495850366985, 0.16496398286630184, 0.1564089237838922, 0.14621033912696363, 0.1378916635562159, 0.12318497431732672, 0.10581414625655468, 0.0853146261356812, 0.060978759631099506, 0.031863566969312106, -0.0034024650957808107, -0.04605626582911447, -0.08946369822064879, -0.14294979598858262], [0.030159486892087563, 0.0350037494506823, 0.04458901954286007, 0.05854205992316969, 0.07611254832123292, 0.09593520754772601, 0.1156775915678531, 0.1310185436256239, 0.11700360819349019, 0.06102795919595334, 0.37713500127585975, 0.3402876661637944, 0.15009538242629006, 0.11827302441913515, 0.09163536819911391, 0.0659715866948487, 0.040808438414448665, 0.0160289723632345, -0.007956570563934956, -0.03028034568540237, -0.05500826737188738, -0.0698275826923794, -0.08129120019679574, -0.09001891397968641, -0.09668531307679513, -0.10200875321559408, -0.10686834682702723, -0.11210192472156415, -0.11760377580654219, -0.12326516227556691, -0.12912639170871903, -0.13524258555401958, -0.14157552202599605, -0.14806592116133743, -0.15469020353128007, -0.1614330111024198, -0.16828230320850945, -0.17524372219221454, -0.18231654931925817, -0.18953524460104762, -0.19708124300195784, -0.2052541373588226, -0.21441551409130868, -0.22497955965142039, -0.23731151650690477, -0.25066655098788065, -0.264034688707716, -0.2762964297100865, -0.2860636204665188, -0.2916834552434612, -0.2917899225739603, -0.28561379518110824, -0.2735868433799392, -0.2565369708144359, -0.23581334826794412, -0.21155471913145002, -0.18326624407484005, -0.1512730823945043, -0.11606315289500431, -0.07881285315850292, -0.04087461488903728, -0.0033976509480379917, 0.0325414143486089, 0.06631552878230534, 0.09746383148635904, 0.1256541720322893, 0.15068700156577727, 0.1725195385789293, 0.19123077209415595, 0.2082523327053059, 0.22070815448141556, 0.23019682166445243, 0.23720437587059937, 0.2429944537357923, 0.24845530913230446, 0.2534317577554374, 0.2577252286570529, 0.26112164365072704, 0.2632696183091536, 0.26367353333786836, 0.26229843892579807, 0.2593063056130707, 0.25487451729038163, 0.24929835989968885, 0.24297885651551118, 0.23593066383558178, 0.2278135356986073, 0.2183064680313478, 0.20705672136728093, 0.19362874560767862, 0.18140638272381923, 0.1619691075620375, 0.1390394139337424, 0.11200958200872603, 0.07996376518791433, 0.04169564697364681, -0.004548757913698872, -0.0606638289634824, -0.12063231742539189, -0.21568478502537924], [0.03214038156419263, 0.037517219817120306, 0.048150656363521366, 0.06363561458041156, 0.08315759201881438, 0.10523930113371326, 0.12738571036880253, 0.14515501309649007, 0.13542610419125306, 0.10037411480412405, 0.3353312455430747, 0.3349613948839855, 0.1598476275087511, 0.12693471290391548, 0.09831529760945447, 0.07039502474445868, 0.04286766737103917, 0.01567675251360174, -0.01068558962556034, -0.035229806238558224, -0.06132879934620485, -0.07770898047738718, -0.09038181694957427, -0.1000326534319613, -0.10740735184111422, -0.1133000207392846, -0.11868216136242524, -0.12447917811362516, -0.13057373358754934, -0.1368463040221676, -0.14334208053872655, -0.15012227624873808, -0.15714467754502195, -0.1643438247106579, -0.17169395983448582, -0.1791786003398149, -0.18678532920459978, -0.19452136181644214, -0.2023868199321257, -0.2104207213148079, -0.2188245670217508, -0.22793061671527579, -0.23813948302559496, -0.24991005597664867, -0.2636476670587854, -0.27852982368315665, -0.29343990210878895, -0.307139166271413, -0.3180902600297256, -0.3244615370332885, -0.3246697554912558, -0.3179177976021418, -0.3046794472099486, -0.28586887352092055, -0.26297939291359573, -0.23616688324050794, -0.20488663495954101, -0.16949973772558335, -0.1305453420127285, -0.08932301836450314, -0.04732806404125112, -0.005815991737304, 0.034002230648233475, 0.07143071515455716, 0.10595868975221379, 0.13721847574789575, 0.16498943438505817, 0.18922543470753223, 0.2099981160221789, 0.22858596694006142, 0.24241277264478456, 0.25316639931283, 0.26124818403490513, 0.26784235126890166, 0.27401754308734033, 0.2796302846995687, 0.2844729709667056, 0.288313370205893, 0.29076496933545165, 0.2912807663257995, 0.28982281529279896, 0.28657082190090183, 0.2817216610832067, 0.2756028021370614, 0.26865876729333155, 0.2609062926387862, 0.25196888693949676, 0.2414911510935328, 0.22908268370719606, 0.21426153837102965, 0.1996686533300168, 0.1878721737925585, 0.1632593895833841, 0.13402696300752467, 0.0993191471325215, 0.05789682443397026, 0.00804656764519005, -0.053368188434450625, -0.13039167954166656, -0.2370973126984825], [0.032405227495747535, 0.03796324854465877, 0.048951546118569056, 0.06495702934451295, 0.08514897266199263, 0.10802365439088035, 0.13105948922599542, 0.14988224055279956, 0.14340291715433204, 0.12046144481510801, 0.303661252857745, 0.32003235849094525, 0.16109706747284333, 0.12855107229508267, 0.09954759846229264, 0.0710328003250395, 0.042824395101824606, 0.014908958178180927, -0.01218224785015634, -0.03741020600905374, -0.06356269682964819, -0.0804529365922126, -0.09352149555899601, -0.10347522529218207, -0.11108334884274042, -0.11716475833264446, -0.12272108017839617, -0.12870612101878767, -0.13499858678893428, -0.1414756424576731, -0.1481842790922904, -0.15518779189061765, -0.16244267365821982, -0.16988146573257437, -0.17747779589800527, -0.18521497181744226, -0.19308073875934265, -0.2010831392263707, -0.20922286269440785, -0.217540713210701, -0.22624505487516572, -0.23567917781816292, -0.24625674881799853, -0.2584516111730684, -0.27268271461446775, -0.28810244248928135, -0.3035592331411234, -0.31777496337410543, -0.3291625632391532, -0.3358304235174508, -0.33610085244569227, -0.32918461277683897, -0.3155681096939611, -0.2959492198968117, -0.27207473971151563, -0.24411307611203995, -0.21151184966823142, -0.17465020539706658, -0.13408840264398517, -0.09116978676088965, -0.04743966203815204, -0.004537475848186134, 0.03661677086836885, 0.07530462064585922, 0.11099915525759181, 0.14332141565596412, 0.17204427411467416, 0.1971212302952852, 0.21861672048777486, 0.2367035615416529, 0.2512620304883891, 0.2625225161384591, 0.27097323466271567, 0.27786553172620626, 0.28431185063278647, 0.2901686950977957, 0.29522237633850185, 0.29923521460015634, 0.3018100172004897, 0.30238340173752165, 0.3009167896434846, 0.29759601898589816, 0.2926246793672848, 0.28599374385812504, 0.2784881570689326, 0.27013095004938736, 0.2605406556234586, 0.24935444774496715, 0.23617202306235044, 0.22049796160415766, 0.21730998004627208, 0.19515244972094026, 0.1690746250778185, 0.13844311717532135, 0.1022698288792308, 0.05930244146518258, 0.007736078235560269, -0.055682019486252066, -0.1351165353388079, -0.24499557997731364]], [[0.0018560861304150803, 0.0018188940167542511, 0.0017417534602855273, 0.001623669632033802, 0.001464454688675848, 0.0012667344010960505, 0.0010391268701847253, 0.0008008363648040861, 0.0005865670677214676, 0.00046325398918358645, 0.0005607847024940449, 0.0015125028356651345, 0.4473342672498148, 0.6447417065056664, -0.05869070442410467, -0.0030297896926656798, -0.0013821516244060428, -0.0008976526954049615, -0.0006004443929244934, -0.00036627418557928646, 0.00017263462262064573, 0.00028016510105337614, 0.00036922492999721815, 0.00044098300284307353, 0.000497102249474988, 0.0005395732000756346, 0.0005726472462269952, 0.0006056436813864272, 0.0006398162326696066, 0.0006748259809877491, 0.00071104260468333, 0.0007486943683766827, 0.0007874088363798141, 0.0008267776280430733, 0.0008665538774676732, 0.0009064712909377208, 0.0009458643673152932, 0.000984119646258038, 0.0010206743790910381, 0.0010552091661329822, 0.0010883122842844954, 0.0011209310857053468, 0.001155990020571817, 0.0011974292508898754, 0.0012469515255704494, 0.0012976211851837374, 0.001342033149725683, 0.0013723523140061684, 0.0013795422094810819, 0.0013535316691177276, 0.0012941706741378112, 0.0011936211192121271, 0.0010597309550627913, 0.0009003594441709649, 0.0007243463710485353, 0.0005304725297755553, 0.00031208128819687334, 7.182156985664206e-05, -0.00018501562318229257, -0.0004464821493433971, -0.0007015898423450926, -0.0009402575333796228, -0.0011615767643673458, -0.001363364820604989, -0.0015442393383680285, -0.0017241282041772536, -0.0018643290466089305, -0.0019797400445821242, -0.002071818933669583, -0.002140744004776433, -0.002188160923294908, -0.0022164007765928186, -0.002229263515691046, -0.0022341754549700427, -0.0022372081265630453, -0.0022372903810822585, -0.0022335744384341413, -0.0022246196137782857, -0.002208067279845099, -0.002181039877598473, -0.002143480920757907, -0.0020965593796342065, -0.002041452158350942, -0.001980094429179478, -0.0019147307105442405, -0.0018450556070172116, -0.001769114237917288, -0.0016850844500147968, -0.001590934489761128, -0.0014841297894287355, -0.0016951881902540088, -0.0016073130396550004, -0.001510512396515716, -0.00140837863010733, -0.0013065873658654507, -0.0012176158442180386, -0.0011691283616163683, -0.0016817615893265727, -0.0019473664503799545, -0.0037227772239297094], [0.006306148364733571, 0.0061786990346124945, 0.005917684981703194, 0.005518141907408298, 0.004976490890668084, 0.004296314673865671, 0.0034971477824183627, 0.0026256479356328855, 0.0017639271391200796, 0.0010768246752087568, 0.0008232312047244466, 0.0019381973514185004, 0.6495383742714332, 0.4190326894051636, -0.03887025774586609, -0.004761822760831834, -0.0022374852518811297, -0.001360132081954384, -0.0007256252377075416, -0.00016914092819054016, 0.000820254975870518, 0.001154488429390513, 0.0014325054343719867, 0.0016573707924810463, 0.0018339547139790368, 0.0019682839804909106, 0.002073662612171995, 0.0021796538634037523, 0.002289998890828712, 0.002403771147647364, 0.002522348734056531, 0.0026465243032119785, 0.002775066451588727, 0.0029066464462825406, 0.0030405259564294084, 0.003175968122067035, 0.0033111145905756418, 0.0034442822612846297, 0.003573897257916191, 0.0036991840962511194, 0.003822296054934649, 0.003946566004786129, 0.004081669021592445, 0.004240578464079107, 0.0044291759934994976, 0.004625291602007547, 0.00480498729794262, 0.004942651333167008, 0.005008319760524041, 0.004968205497387731, 0.004803755287484595, 0.004502418715259625, 0.004088517107147651, 0.003587040459688804, 0.0030269803125576727, 0.002405095739621703, 0.0017005837814854587, 0.0009225132642184799, 8.791778782111415e-05, -0.0007649609827481694, -0.0016009062804235726, -0.0023949549407059605, -0.0031354782974774755, -0.0038149990805385154, -0.004427284201253968, -0.0049985544151936, -0.005471326917669319, -0.005867673323768588, -0.0061897323223773625, -0.0064374189981364575, -0.0066156818412394115, -0.006731735908799183, -0.006797665537822574, -0.006837702288647312, -0.0068718853322678585, -0.006896725410808025, -0.0069082448031537284, -0.0069014816144028265, -0.006868550263851278, -0.0068000092793090005, -0.006695624677105536, -0.006559203322594158, -0.00639471657983709, -0.006208727262585766, -0.006008696052178055, -0.005793464212201559, -0.005556295881889594, -0.005290820244197036, -0.004989965677385863, -0.004645005703788248, -0.004731337485791615, -0.003903567106459242, -0.0033679763794580266, -0.0027391018405489255, -0.0019964574961998426, -0.0011571788794905707, -0.00013257870051658314, 0.00045196421802520305, 0.002157149303696074, 0.002625453863915436], [0.010138450696977124, 0.00993315728085364, 0.00951391025539678, 0.008872157241446358, 0.00800108408822846, 0.006904526000305238, 0.005610374873150735, 0.004186940108841094, 0.002753327048825892, 0.001551987258245146, 0.0009333731352649947, 0.0019620630130881955, 0.7304695578443025, 0.33348910352309524, -0.03164007443486437, -0.005660544763029667, -0.0027108155743005608, -0.0015774708619942538, -0.0006926755765145897, 0.00011577295158359914, 0.0014029999876350953, 0.0019291343459884593, 0.0023672465198910806, 0.002721936948761109, 0.0030007543957523966, 0.0032131227499072523, 0.003380019861449185, 0.0035482178433013595, 0.0037235444581867425, 0.0039045911947132037, 0.0040936176601305985, 0.004291904379881954, 0.004497483862162048, 0.004708241077982043, 0.004923025209091433, 0.005140712131488064, 0.00535845935834613, 0.005573705594727608, 0.005784042406145085, 0.005988334700830568, 0.006190100057602174, 0.006394737935257435, 0.006617708972308267, 0.00687972144723156, 0.007190266146770798, 0.007514202856696309, 0.007813486546365588, 0.00804730457349026, 0.008167749694968418, 0.008120657238413223, 0.007869693281950873, 0.007399757001343437, 0.006749105413261478, 0.005957297796336065, 0.005070568378062013, 0.004084031692564588, 0.0029648964279101364, 0.0017277674843195867, 0.000399689981992852, -0.000958702914000034, -0.002291555862173602, -0.003562084237431412, -0.004748512625370452, -0.00583879761989827, -0.006822364259934339, -0.00772641018632508, -0.008485204603827439, -0.009123939956788398, -0.009645040018409488, -0.010048119246076164, -0.010340901627547684, -0.01053473270759647, -0.010648742694609277, -0.010721528427544843, -0.010785094630625866, -0.010833885686059957, -0.010861110923776974, -0.010858768870312934, -0.010814227950303611, -0.0107124298768784, -0.010552983304382696, -0.010341949154897194, -0.010087783810242671, -0.009799032667984918, -0.009487360402436936, -0.009150482302533524, -0.008777176767738913, -0.008356772446898217, -0.007877421207196917, -0.007324588593363729, -0.007015456545476476, -0.006271672383223242, -0.005409598092618539, -0.004409365738547489, -0.003239955946431852, -0.001861377044436654, -0.0002114416162675138, 0.0010591543686968114, 0.003653162645736092, 0.004960214213617679], [0.020417817591475047, 0.02000358835008974, 0.01916004722345326, 0.01786882082526278, 0.01611405203186972, 0.013899590382098457, 0.011274534613482311, 0.00836296215412709, 0.005378760666498556, 0.0027647911071970984, 0.0010944528399814372, 0.0016286769753597065, 0.8394560115755019, 0.22184710455817253, -0.022896046696625465, -0.007382092984874855, -0.00367515124256924, -0.0019506367832681627, -0.0004410912216949923, 0.001013509238025424, 0.0029951138810624498, 0.00403212079139322, 0.004896604990560231, 0.005597173387664054, 0.006148462607540555, 0.00656891718166593, 0.0068999568546900016, 0.007234252295758639, 0.007583163789089286, 0.007944017982382985, 0.008321454105504498, 0.008718063426222125, 0.009129908263876177, 0.009552771807170396, 0.009984409292001787, 0.010422678683317706, 0.010862147759243075, 0.01129794945838623, 0.011725478793434059, 0.012142674551663481, 0.012556732960944983, 0.012978610858163264, 0.013439255076341194, 0.013980069886138691, 0.014620238794828605, 0.015290004779504965, 0.015913635186800973, 0.016409669296369507, 0.016682162268326348, 0.016622344133861367, 0.016143947611019196, 0.015226779150836383, 0.013946184554400172, 0.012380589618194859, 0.010622349162378862, 0.008662278499853153, 0.006435655161648556, 0.003971941997993356, 0.0013249209151699392, -0.0013850064327900447, -0.004046888694314969, -0.006593385847011465, -0.008974445273904617, -0.011165768221886703, -0.013144942775126097, -0.014936635887886558, -0.01646218266594379, -0.01775160218598075, -0.018807733498395894, -0.019629298933302584, -0.02023138737719811, -0.020666277639683248, -0.020940965850011324, -0.021132528190649362, -0.021305327485302172, -0.02144857029031832, -0.021546744432946803, -0.021583538316445335, -0.02153349263184803, -0.02136656220785437, -0.02108200550366024, -0.020691973256847268, -0.02020938408985387, -0.019655594824120645, -0.019054458967844013, -0.018401804139761425, -0.017675426638947958, -0.01685410795279712, -0.01591429231620366, -0.01482707715673922, -0.013843584213140497, -0.012359854784021695, -0.010646276869168676, -0.008664113104650433, -0.006354739922492398, -0.0036444600467739445, -0.0004226024077357638, 0.0026264966449628256, 0.007605555610883624, 0.011518597758749917], [0.027696190470461783, 0.027133975165411203, 0.025990056979652034, 0.024239039206313723, 0.021858532798210165, 0.018852163285038647, 0.015283617565557718, 0.011315644586058587, 0.007227673088200278, 0.0036017204634408227, 0.0011610441841452001, 0.0012522335906301218, 0.8784201859497732, 0.18022790264688182, -0.02008773185392492, -0.008356450796565768, -0.004250098997741276, -0.0021407432108146687, -0.00020530117295111018, 0.0016963226513717873, 0.004132672104087843, 0.0055300412299100965, 0.0066953432928330975, 0.007639982243857048, 0.00838357911561882, 0.00895093327496272, 0.00939788846671936, 0.009849522041800625, 0.010321088881986552, 0.010809029922937169, 0.011319674657437067, 0.011856543183511382, 0.012414304305247172, 0.012987255608087011, 0.01357238215661567, 0.014166828541167275, 0.014763346525497559, 0.015355454031268099, 0.015937005617175055, 0.016505297908447212, 0.017070138604628617, 0.017646424489270056, 0.018276056053052703, 0.019015073359917107, 0.019889527143268807, 0.02080521087832153, 0.021659760507114975, 0.02234297840434171, 0.02272493876308236, 0.02265822684858148, 0.022020428298586005, 0.02078836121123597, 0.019063529595824087, 0.016951803836719345, 0.014578149032413617, 0.011930375941447953, 0.008921232566321062, 0.0055907050511046245, 0.002011465102109257, -0.0016538693560015484, -0.005255428699340805, -0.008704645358782443, -0.01193107017868853, -0.01490172423495641, -0.017585746986425246, -0.020004193864088863, -0.022072488197694935, -0.023822814501468538, -0.02527297423642254, -0.026412403559727897, -0.027258325099488497, -0.027839452725576936, -0.028206118181972165, -0.02846209229618645, -0.028694081474591807, -0.02888716518559161, -0.02902011523987088, -0.029070692679719862, -0.029004328253420888, -0.028780282298965496, -0.028397432628857418, -0.027872144444823665, -0.027221865024870274, -0.026475489474028672, -0.02566531478953747, -0.024785656800079506, -0.023806391278818964, -0.02269876386825556, -0.021430880099673855, -0.01996362992605945, -0.018566547724707377, -0.016566078235971397, -0.014256164423185167, -0.011584790105984111, -0.008473866099096134, -0.004825772057099157, -0.0004951198312795775, 0.0038514677352417927, 0.010449712366513174, 0.016176203923897455], [0.035086709401614506, 0.03437421283258418, 0.032925304185628695, 0.030707433339501943, 0.027691538070838018, 0.02388094273061919, 0.019354012574757825, 0.014312507219143527, 0.009101912029541942, 0.004444680868643237, 0.0012137194837805742, 0.0008257930835651929, 0.9059413916142894, 0.15216506711842856, -0.01851989142580814, -0.009267830882802404, -0.004799938575923633, -0.0023104445381759583, 5.227285266961059e-05, 0.0024045056321102916, 0.005290985375551857, 0.00705383966919338, 0.00852425537201016, 0.009716464054966366, 0.01065513719224016, 0.01137151673670023, 0.011936076933784515, 0.012506772150137357, 0.013102804714368458, 0.013719719309219244, 0.014365563420218538, 0.0150448005234786, 0.015750684905412062, 0.016476006469274104, 0.01721696962797675, 0.01796999692380553, 0.018726001685915775, 0.019476867474251126, 0.020214889326679225, 0.020936716088379888, 0.0216548093029861, 0.022388067984768507, 0.023189511454690337, 0.024130035369457282, 0.025242664831997066, 0.02640838634782677, 0.02749781097719268, 0.028371575333345018, 0.028865259249329863, 0.028792213722157393, 0.02799307118926793, 0.026441809779409787, 0.02426646241174204, 0.021600743283753897, 0.018602715845376226, 0.015257152453425776, 0.01145394948369426, 0.007243779470706879, 0.0027184819573936284, -0.0019164908765520682, -0.00647178069837135, -0.010837393574245938, -0.01492205158021604, -0.018683961028406346, -0.022083661358409466, -0.025137967965952232, -0.02777096041882554, -0.030013994023874, -0.031863792947175534, -0.03331569665690814, -0.03439421397110352, -0.03513662273038332, -0.03560712760197588, -0.03593718182937248, -0.036236565890028945, -0.03648645166514913, -0.036660014609333096, -0.03672915266574756, -0.03665016564027265, -0.03637153018135366, -0.03589183389459493, -0.03523176353041112, -0.03441339880710819, -0.03347332158290393, -0.03245242781917261, -0.03134355699756821, -0.030108596044601553, -0.028711150362215734, -0.02711092387035185, -0.025258486012262226, -0.023363309333729335, -0.020836891682732846, -0.017920661122010198, -0.01454912974757613, -0.010624518476802628, -0.006025064600404642, -0.0005704298525530408, 0.005102683668433096, 0.013336415380261802, 0.020914676584869573], [0.04140474944115306, 0.04056377292846477, 0.038854139409803055, 0.03623717348065889, 0.03267808967235029, 0.028179921368624804, 0.022833520978006866, 0.016873881097949166, 0.010702733280713162, 0.005162195740456532, 0.0012519617529585638, 0.0004411546125016795, 0.9239884438915392, 0.13473640312304083, -0.017773008129377748, -0.010011003096463295, -0.0052545485806758715, -0.0024449169828068755, 0.00028071595425325455, 0.0030166669002766396, 0.006282675825901846, 0.008357782552451185, 0.010088881029204392, 0.011492614427355854, 0.012597966873332445, 0.013441683368166053, 0.01410673839096942, 0.0147791791866147, 0.015481579441988027, 0.0162087190584636, 0.016970114972993996, 0.017771037248354896, 0.01860353113483875, 0.019459098010253688, 0.02033327555048029, 0.02122187008346873, 0.022114225815876586, 0.02300083163410918, 0.02387265148709434, 0.02472578238594974, 0.025574955574312642, 0.026442492227902646, 0.02739091534639573, 0.02850381780776519, 0.02982018760065604, 0.03119981288458747, 0.032490209229071525, 0.03352708621714786, 0.03411653961815021, 0.03403838236083423, 0.033101542956723094, 0.0312776600284628, 0.028717430951775536, 0.025578362425322083, 0.022046806628277477, 0.01810494409038368, 0.013623147062949405, 0.008661224142737909, 0.003327395243400316, -0.0021362838764954722, -0.007506709875963844, -0.012655630029317794, -0.017473906626919153, -0.02191220999088705, -0.025959011091367057, -0.029551857809525715, -0.03267433543095963, -0.03533068996759604, -0.037520649973840386, -0.03923995190468761, -0.04051805782863774, -0.041399191282890005, -0.04195912041713621, -0.04235299710787533, -0.042710351942790735, -0.04300904490556971, -0.04321749366346373, -0.043302607327539926, -0.04321290202282675, -0.04288766620138147, -0.04232524154589444, -0.04155002205904968, -0.04058805817271183, -0.039482508700826834, -0.038281622224264705, -0.03697697851440897, -0.0355236432444472, -0.033878701956417755, -0.031994582563627826, -0.029812973478237477, -0.02745685828926793, -0.024481109033440876, -0.021046924995387486, -0.01707731492837137, -0.012457701036657515, -0.007045735596636574, -0.0006313016433268671, 0.006179995661392393, 0.015808526698172152, 0.024978227182932713]], [[0.17221343574864087, 0.17140652742166404, 0.16961858389506448, 0.16658843000905607, 0.161926339826379, 0.15514148864349547, 0.14571772725253793, 0.13325228068840667, 0.11754540536722967, 0.09968251936272705, 0.08224511178452178, 0.06700693614634302, 0.05470760768150972, 0.04554426316194585, 0.039537380952813, 0.03682116088177836, 0.037904449155738096, 0.04500154794972178, 0.1578019826813523, 1.5123639258780757, 0.44832248953436576, -0.2734857328521522, -0.06591392276817166, 0.0035694316236353834, 0.011415527166721586, 0.01267006676781435, 0.013366534534203616, 0.013919853150086748, 0.014459533560973804, 0.015009496514967538, 0.015593414501233702, 0.01621251875181335, 0.0168496410886929, 0.017493093912914526, 0.01813367406974157, 0.018759649190695792, 0.01933395637345483, 0.019818452385251744, 0.020179903605105735, 0.020394501070858082, 0.020461473323771535, 0.020368265700132653, 0.02020326703035223, 0.0201107487763601, 0.02011304320484374, 0.019941209873641095, 0.019373298947958098, 0.018192631995150043, 0.016173378439725786, 0.013089328365940681, 0.008819649392863869, 0.0034646472534159162, -0.0025595985211196645, -0.00893118321209834, -0.015398824526892075, -0.02206457873618858, -0.029244727082848466, -0.03690743880650516, -0.04536267793298734, -0.05320610874488742, -0.06043773686718311, -0.06683210914470299, -0.0724702530318936, -0.0773823926296921, -0.08156681598469316, -0.08501861820301132, -0.08775303830141462, -0.08980840458395692, -0.09118956090366154, -0.09190142357437804, -0.09201391795802268, -0.09161085379412394, -0.0908203636747178, -0.0898433374155854, -0.08884490399984135, -0.08779883970653624, -0.08665713296863661, -0.0853696533277327, -0.08386148115016523, -0.08206983517974221, -0.08000001775880876, -0.0776907189846499, -0.07518051539306062, -0.0725316760490422, -0.06978826174319046, -0.06691439637417082, -0.06386397557486077, -0.06054475513411225, -0.05634603280047705, -0.05227968085636983, -0.06004326616617771, -0.056744834176733996, -0.053333334680062815, -0.04997834325791014, -0.0469553557572622, -0.04480584264042191, -0.044686103313031585, -0.04786964426991751, -0.06312943216651558, -0.10882813191537027], [0.7002516780033172, 0.6968532886498291, 0.6894375628035491, 0.6769183838442465, 0.6576737892710919, 0.6296530663979423, 0.5906781347153988, 0.5389944484680809, 0.4736486176209473, 0.39904117270177364, 0.3257541048730967, 0.26093346124274375, 0.2074344879393799, 0.1657949919876308, 0.13562192919089539, 0.11653640923183027, 0.10887283319587888, 0.11619441770869295, 0.3179718615003745, 1.2719297194547194, 0.42559326839981354, -0.182617773280795, -0.011979190106469995, 0.046508555510746896, 0.06214727716586576, 0.0652876090709669, 0.06686333301118051, 0.06820458749960559, 0.06967964016707967, 0.07133220446880291, 0.07323193886097809, 0.07536340169570857, 0.07763998782353931, 0.0800020883806068, 0.08240437376742236, 0.084795045259419, 0.08702887457797714, 0.08895568613413965, 0.09044115050576353, 0.09138993292893056, 0.09180075965513276, 0.09162609589350104, 0.09122687810167185, 0.09119143097298481, 0.09161454958226402, 0.09140654103004121, 0.08966458146580313, 0.08550353447785944, 0.07799153020938092, 0.06618579548377379, 0.04944786236497316, 0.028247356495220203, 0.004242245522354334, -0.021275973904000076, -0.047274339811246055, -0.07414878401547928, -0.10317154699871085, -0.13412329242609777, -0.16717134017714855, -0.19875690119663264, -0.22803897760986616, -0.2543594168548372, -0.27769557968102015, -0.29814109977753694, -0.31562812035982973, -0.3301307691184695, -0.34170633938791084, -0.35050470594364125, -0.3565396488026386, -0.359828620875686, -0.36065528641581895, -0.35936627482762784, -0.35650418469841494, -0.35291317241179126, -0.3492609853819429, -0.34541520746970705, -0.3411642998129786, -0.33629319431637295, -0.3304885131646009, -0.32349027267446745, -0.31512740396786326, -0.30573079351913834, -0.2954555350651438, -0.284563446057271, -0.2732406141805193, -0.26132256051336694, -0.248583114930594, -0.2347124763124172, -0.21844325854027496, -0.201411147466214, -0.1901001319133392, -0.1689360142720368, -0.14508839648757485, -0.11936706624820186, -0.08962895297746193, -0.055531260296459786, -0.01596147465299345, 0.031974005047749256, 0.07926824919416942, 0.08339272937575352], [8.899830913923875, 8.85628801575645, 8.76160229985454, 8.601897588831472, 8.356448082220728, 7.999025933361506, 7.50171152294838, 6.841856024795338, 6.006919845413759, 5.052792574774144, 4.11422064633474, 3.28182798376988, 2.5914479305583686, 2.0491263864647316, 1.6484426704820099, 1.3818146427881557, 1.248301648454906, 1.2769102731089401, 1.6193642532342152, 4.872283817022738, 2.9162140271026717, -0.5619545698518597, 0.5500643113230885, 0.7762572335876214, 0.8369278236737486, 0.8709722162159336, 0.8872397200945499, 0.9015673860704477, 0.9181618699491422, 0.9374184982067721, 0.9601430018826591, 0.9860779379553293, 1.014072340462161, 1.0433324497234704, 1.0732584872216182, 1.103179871453733, 1.1312672144230298, 1.155626591198006, 1.174553153126068, 1.1868396647883122, 1.1924755126955437, 1.1908670721270647, 1.1866062374923523, 1.1871753643533025, 1.1937911816473117, 1.1926158415819699, 1.1721739255952035, 1.1212036006687591, 1.0278205916423073, 0.8799740369339142, 0.6691090466117138, 0.40137913536523717, 0.09775479408927253, -0.22540188245610118, -0.5549289709003367, -0.8958015587353959, -1.2641478071108954, -1.656911034409085, -2.0729469955304447, -2.473463393776874, -2.845254958681951, -3.1807306840899607, -3.478549194701305, -3.7398129600561303, -3.9634773348645673, -4.149195756699301, -4.297682415491976, -4.41082426100727, -4.488778727316181, -4.531760037964286, -4.543636945625485, -4.528732107219267, -4.4939678437668, -4.4501130698025975, -4.4055682707537365, -4.358513429665897, -4.306156998443914, -4.245672042482637, -4.172999253761962, -4.084812132626031, -3.981287475033513, -3.8643614895834477, -3.7360613515513434, -3.599769164651747, -3.457922017064846, -3.308454506100689, -3.148451962242628, -2.9742560296376648, -2.7734986863277524, -2.559668153455615, -2.3991427530954854, -2.1322377391475595, -1.8326078533488332, -1.494647497158592, -1.109443287888272, -0.6662594661775975, -0.17244856204965012, 0.4268979712953816, 1.0399388729029482, 1.2272425947479655], [-1143.3860186552913, -1137.7460224190395, -1125.5245058304215, -1104.9293157581249, -1073.2831694026065, -1027.195008958611, -963.0468846988047, -877.8833400468518, -770.0381290990852, -646.6864637768263, -525.1729232896855, -417.1142475042218, -327.0545034753831, -255.66720543713663, -201.94109072320742, -164.54027849501094, -142.66515192571097, -137.91339640004907, -160.4650797257712, -401.4705019202774, -201.9239494582137, -36.826308623662925, -88.32515586701379, -107.38264469527826, -113.67740459889087, -117.28390410665155, -118.8822713184457, -120.36743763096992, -122.2178827533182, -124.46344034535075, -127.19721708902081, -130.37813729401248, -133.85176087285478, -137.5113825161277, -141.2768526831711, -145.06041842481568, -148.62919605434033, -151.74179367644476, -154.17949949350506, -155.78779451386416, -156.56604423654142, -156.43935937213274, -155.9982724863309, -156.2047239881502, -157.21659089950185, -157.2576002473045, -154.85334211082738, -148.55538028511322, -136.8315868805779, -118.12476931217861, -91.27828118356138, -57.10684970364149, -18.291351593173864, 23.072948666579297, 65.29071899735678, 108.9936693486718, 156.24842265385325, 206.62709834077, 259.55498425097454, 310.91949877339766, 358.78984364626, 402.22612728854557, 440.89712549144645, 474.9224654541569, 504.1129822256864, 528.417981759873, 547.9256362428141, 562.8749624264707, 573.2832879547909, 579.1770773145195, 581.0197931745416, 579.3844354150674, 575.1774778946352, 569.7987960924219, 564.3322684437279, 558.5387643995386, 552.0572891961671, 544.5242970761233, 535.4182009491404, 524.3109461644659, 511.22326245786707, 496.4026266603824, 480.1095423039649, 462.78127394198833, 444.73739585817276, 425.7136591552424, 405.3287219405948, 383.1476967520028, 358.06938175290236, 330.8380391485515, 303.90884044256063, 269.79322695423133, 231.55212366521872, 188.49334796250102, 139.55991675511876, 83.49110506757401, 18.464321110583523, -57.58756838783339, -137.90731596023727, -179.6048553662797], [-23.130926122652834, -23.016542314960112, -22.768944261098856, -22.351817628691844, -21.7109097743267, -20.77748526079102, -19.47815922205263, -17.75285798969634, -15.567529489547745, -13.067298097024375, -10.603255369086725, -8.410248770666797, -6.579835395624185, -5.1249986639808185, -4.024121460299922, -3.247928776219484, -2.776023037948911, -2.6274865704234625, -2.95035176626324, -6.725150220570807, -3.349974252204684, -1.2229714899825324, -1.8966621672343267, -2.2199758710000848, -2.3379933069860077, -2.4061819104353726, -2.4354602265025997, -2.463294327301032, -2.4989786250665937, -2.542986344217079, -2.5971363265900465, -2.660547844029012, -2.7300556707429036, -2.803471729409098, -2.879155335718429, -2.955321270712101, -3.0272715774213848, -3.0901348268279016, -3.1394883938480347, -3.1722099224798535, -3.1882911104629548, -3.1862254855856373, -3.1779633647535217, -3.1829691064775125, -3.2044462986144087, -3.2064700004450084, -3.159211791946972, -3.0333595883497217, -2.797885041398314, -2.421229960162683, -1.8796371018756515, -1.1897388575786918, -0.405687430023846, 0.4301719728137836, 1.2870534919879484, 2.1752031403403373, 3.136154080884146, 4.160213993561658, 5.223790137012152, 6.265958885231365, 7.236370478759948, 8.11743025096013, 8.901844054705501, 9.592089951212964, 10.184381360572843, 10.677725426281143, 11.073922701683758, 11.377814757174276, 11.58975641238666, 11.710287521144458, 11.748796528980543, 11.716885449168704, 11.632933429018998, 11.525327173268975, 11.416001284601967, 11.300071468540802, 11.170210751333768, 11.019055705428746, 10.836049410376011, 10.61252513747069, 10.348887575715965, 10.050133376489939, 9.72153150226057, 9.371943860633932, 9.003288742531348, 8.613870168673971, 8.19625666910095, 7.742812317292766, 7.244789907783275, 6.691597265911361, 6.117712191767743, 5.428692868368463, 4.656631891012519, 3.7876290544671343, 2.800665263532731, 1.6710941671296895, 0.36398149418461306, -1.187997860673842, -2.8170519455277065, -3.770236717246881], [-12.362818400760625, -12.301587340324856, -12.169133907375913, -11.946029351640563, -11.603246642839933, -11.104003633395322, -10.40901319464971, -9.48607194332817, -8.316864288378774, -6.97894441831837, -5.660030545311181, -4.485587527683422, -3.504425289905396, -2.7232668844910064, -2.1301681703847746, -1.7087246654296384, -1.4466126293065669, -1.3495716511282325, -1.4772139418179835, -3.1237321522554153, -1.5867678667805196, -0.7887697476044522, -1.0507122022635005, -1.202548000477892, -1.262483382211643, -1.297321017718532, -1.311939757615373, -1.3260715182099305, -1.3445541067734719, -1.3675965535868904, -1.396149176254356, -1.429724490459566, -1.466617006535047, -1.5056473542981814, -1.5459321532083794, -1.5865139001662703, -1.624886160240121, -1.65844932816285, -1.6848402968415852, -1.7023914668295816, -1.7110999279378838, -1.7101633947681496, -1.7059702248846784, -1.708924946590506, -1.7207430546950606, -1.7222268669107184, -1.697433671515164, -1.6306936519246966, -1.505411895426695, -1.3034374717676929, -1.0126877657237308, -0.6421843936701023, -0.22090459041118757, 0.22847096410135975, 0.6874834422290084, 1.1628648583682641, 1.6769492637946732, 2.2246135448897317, 2.79329337739211, 3.3504753051477523, 3.8692831234035467, 4.340590893478429, 4.7602383659805065, 5.12954171924165, 5.446475860378224, 5.710512467845087, 5.922614108752343, 6.085367225496869, 6.198961316228742, 6.26368480600684, 6.284549539212174, 6.267758154216953, 6.223146859790733, 6.165909582441291, 6.107773735843972, 6.046114766347711, 5.977008176786483, 5.896515161604011, 5.798991475162876, 5.677546573097603, 5.534121602919706, 5.371607932309908, 5.1929339833045125, 5.002908655958173, 4.805118974983721, 4.5967381004820895, 4.373541721423329, 4.13134544845497, 3.865422799423801, 3.5700868956424, 3.2565289559299746, 2.888661985402488, 2.4765315394967726, 2.0127289361648684, 1.4861116991612544, 0.8837169335389732, 0.18729798067854977, -0.6371167870674851, -1.5149042121816074, -2.0612738920751013], [-9.742322137614456, -9.694024808166901, -9.589590943064808, -9.413700737589254, -9.143465559904909, -8.749878682795218, -8.201949979641208, -7.47425713620161, -6.552312497464513, -5.497226410538661, -4.456960007518868, -3.5303583291992924, -2.7558266914952667, -2.1385615589422655, -1.6689672119737493, -1.333760498708967, -1.122562232619899, -1.0378013714778076, -1.1172942346934973, -2.240472863005219, -1.1674909207185589, -0.6775325208499979, -0.8453756754137826, -0.9551782387610287, -1.0009341437703172, -1.0276326672076905, -1.0386692135540525, -1.049455792933417, -1.0637438153607446, -1.0816773917574507, -1.1039951672959547, -1.1303051174123846, -1.159256793416116, -1.1899161600183767, -1.2215840395717028, -1.253504311741036, -1.283703928200763, -1.3101362058084165, -1.3309392453517952, -1.344799490086975, -1.351715363797073, -1.3510559910705686, -1.3478562046580855, -1.3503157779398396, -1.3597881142101418, -1.3604877535155668, -1.340234198188872, -1.286692797952482, -1.1867752758840986, -1.027149342294603, -0.7976538028270638, -0.5053778564185152, -0.17313241049736539, 0.18121045871599925, 0.5431088629282271, 0.9178690086578979, 1.3230871946673277, 1.7547274472099081, 2.2028978282913996, 2.6419938474708498, 3.0508529273230156, 3.42240969706065, 3.753260165826647, 4.044435877225188, 4.294339196381803, 4.502554061755413, 4.669838535174521, 4.798229852481379, 4.887877068102899, 4.9390072040215545, 4.955569313466374, 4.942452110750714, 4.90741277902432, 4.8624344494305385, 4.816757704677058, 4.766626567167008, 4.710273119914503, 4.644755850363142, 4.565699436628755, 4.469464725617717, 4.3562255111456825, 4.228101539258126, 4.087332891414337, 3.937688832716214, 3.7819731650157697, 3.617942673367059, 3.4422595236724076, 3.251620474786802, 3.0422974697236125, 2.809807347964997, 2.5598812464366905, 2.270189013637589, 1.9456736374401526, 1.5805070037485416, 1.1659521599906748, 0.6918931026046414, 0.14414964047619092, -0.5030331575527237, -1.1981775517051274, -1.6460701933752673]], [[0.0179513183877276, 0.017919730298590314, 0.017839452351818812, 0.017681869186091912, 0.017402280780604372, 0.01694014846136378, 0.016223651912215892, 0.01518094335086136, 0.01374775929376683, 0.01198525821244835, 0.010146146256622784, 0.00843795515466902, 0.0069597471055759036, 0.005708070051786919, 0.004710187083451661, 0.003995994116243606, 0.0034852233103600393, 0.0031800232115746286, 0.0030635360833596147, 0.0031306172662034348, 0.2865567424514524, 0.29230766821901377, 0.299045076586484, 0.30684481470740993, 0.3156705804857611, -0.31308469034026837, -0.11811414188446988, 0.000538987554217502, 0.0007636084287133069, 0.0008464664433870223, 0.0008943134727516451, 0.0009293151211943708, 0.0009602946716669628, 0.000986611739340457, 0.0010084320725653566, 0.0010247009457323463, 0.0010263659068246692, 0.0010199956087260254, 0.0010024465673018576, 0.0009689706737178724, 0.0009185680822832583, 0.0008488084973110285, 0.0007660629445020726, 0.0006818412652860213, 0.0005955443446254951, 0.00042107287133166387, 0.00026336479894991044, 4.8796455294918945e-05, -0.00023940909960509763, -0.0006217236062055214, -0.0010906757245292492, -0.00163214642080853, -0.002209372554675605, -0.0027938170828431218, -0.0033656745799129943, -0.003935099664402564, -0.004531682009986574, -0.005151799246146892, -0.005782176365630043, -0.006382533311324682, -0.006908957924930628, -0.007357732565493513, -0.00775910927569207, -0.00810090379373336, -0.008379443305495352, -0.008591655661583979, -0.008711337191086506, -0.008794220205680606, -0.008838221289366071, -0.008831438501271105, -0.008778121946545646, -0.008685146423300798, -0.008563850591064875, -0.00842987873652099, -0.008292480236279239, -0.00799309801671553, -0.007850170124594902, -0.007699561087895761, -0.0075309843494551654, -0.007328178269715632, -0.0071080417655006245, -0.006876301525697891, -0.006630910206932069, -0.006376282478251806, -0.006115310067890404, -0.005844111981546858, -0.005558761631347976, -0.005255204565991237, -0.004928730019245645, -0.004573656768029779, -0.005222202509181537, -0.004935229501733705, -0.004646572447873966, -0.004373288980611831, -0.004143418478798086, -0.004010877215142836, -0.004088361426696748, -0.004505842751455705, -0.005664017919255863, 0.000587190837234619], [0.06623695090958884, 0.06611275989385319, 0.06580726837851335, 0.06521340784516427, 0.06416402379643057, 0.06243265479387009, 0.05975017023250833, 0.055845828868060964, 0.05047642560183341, 0.04386954077899519, 0.036965582940137826, 0.030530191926720292, 0.024922413257002684, 0.02019642360748542, 0.01638734868958769, 0.013505662354314643, 0.011375025462796649, 0.009961321432236518, 0.009162551162500856, 0.00889597367884774, 0.308533287776098, 0.3144417412227672, 0.3214522866267857, 0.32959202676832555, 0.33869553536559105, -0.3309200976667616, -0.19132369603292362, 0.003919434214985956, 0.004232655667821772, 0.00432865309783847, 0.0043842267160376265, 0.004432800857794279, 0.004483406484350083, 0.004531529125300554, 0.004574640253666294, 0.00460801294302047, 0.004609733518042061, 0.0045831773259547, 0.004516346173900172, 0.004396513630795018, 0.00422081750431226, 0.003980740704413981, 0.0036999163280749966, 0.0034209215452521134, 0.0031441142350860448, 0.002679655846758414, 0.0021643930678254715, 0.0014440641891967174, 0.00045846199579192484, -0.000856546874989417, -0.0025081066653976007, -0.004440294786183963, -0.006514457406367555, -0.008625802080684999, -0.010700500478216158, -0.012774793718017197, -0.014956320999259635, -0.017230693970619836, -0.019549594479256124, -0.02176895145995385, -0.023752642194994622, -0.02547978413589857, -0.026993997621176286, -0.028284089183485513, -0.029342395242149197, -0.03016544826406909, -0.030714849794674447, -0.03109055668261604, -0.03128979763685413, -0.03129408191251546, -0.031123512298914184, -0.03080504494741678, -0.030381999911308653, -0.02991411479782793, -0.029432038991309566, -0.028678277570699472, -0.028166689591357128, -0.0276168814163124, -0.026998081161873362, -0.02627442458405954, -0.025474375419028913, -0.02461348527724054, -0.023695045779798984, -0.02273780651223538, -0.021752916644733177, -0.020724542836428963, -0.01963610420426733, -0.01847052979843708, -0.017208077149081805, -0.01582511732945355, -0.014774257831034046, -0.013157325382903451, -0.011318983325195212, -0.009270443124566105, -0.006964862286645487, -0.004347510329159882, -0.0013445099020061003, 0.002223660940694586, 0.0059286028036631, 0.005791575149767959], [0.1119922390963145, 0.1117792086926867, 0.11125898193615812, 0.1102499368377922, 0.10846856487969049, 0.10553073679940099, 0.10097976284624662, 0.0943556271637632, 0.08524469237593739, 0.07403251302039872, 0.06231229872011126, 0.05137853443327426, 0.041835701422801526, 0.03380212851352095, 0.027311054610897244, 0.022340310502038586, 0.018639611096494292, 0.016134478698682463, 0.014636558631318485, 0.013980486667953897, 0.3246498911175748, 0.3306266271045345, 0.3378058846604539, 0.34617501164083764, 0.3554922954580292, -0.34126591256074884, -0.22582605653747911, 0.00739808792668453, 0.007721733343146164, 0.007800269277710262, 0.007845911293539095, 0.007895854935901754, 0.007955972758151164, 0.008017772360789691, 0.008075724285593113, 0.008121502726379782, 0.008122645213779716, 0.008076525804811508, 0.007962698663595563, 0.007761560740349378, 0.007468603044508601, 0.0070696048756538205, 0.006604574665717914, 0.006145544280529231, 0.005694144765923526, 0.004980468988175605, 0.004135894387022847, 0.002946490053239426, 0.0013111363597035697, -0.0008740472729741956, -0.0036350054358314566, -0.006875656969443091, -0.010360368245177125, -0.013912159333726791, -0.01740590302015032, -0.020902384829283846, -0.024582983615070667, -0.028422963393097342, -0.03234089396900359, -0.03609500189386231, -0.03946548063537887, -0.04241416033787725, -0.04498763028318483, -0.04718045135972845, -0.048982018162503554, -0.05038971917002551, -0.05136320669116058, -0.05202810614473361, -0.05238112129192415, -0.05240086672279142, -0.052123038884702745, -0.05159406892962763, -0.05088820684311276, -0.05010722290818796, -0.04932131620225247, -0.048204978510273375, -0.04736388850945299, -0.04645463060069453, -0.04542861368646333, -0.044235027596937766, -0.04290856706812006, -0.04147338420036465, -0.03993934502367445, -0.03833904824682585, -0.036691853102292275, -0.034971075224841386, -0.033148513482832924, -0.03119528215843786, -0.02907813379028564, -0.026757368586165287, -0.02482480853199408, -0.021976839467370397, -0.01880972363848063, -0.015273982257147618, -0.011436282735991973, -0.007019258694304669, -0.001960744585133828, 0.003997295091926372, 0.010254435286233326, 0.011239713285146391], [0.24571137004776844, 0.245237159456013, 0.24408749043631697, 0.24186255887902072, 0.2379383633182804, 0.23146936713550062, 0.2214499050114911, 0.20686566607987975, 0.18680369346022613, 0.16211160757999185, 0.13629203539612564, 0.1121849807796508, 0.09111089433935424, 0.07338915573651444, 0.05903421537210559, 0.04790826286193048, 0.039569204114033744, 0.033816082008023274, 0.030200099920554578, 0.028301501142727593, 0.3601443440837733, 0.3661043094395034, 0.3735303544382449, 0.38230074841241635, 0.39201402099452387, -0.3568408001462349, -0.27708313183813044, 0.017955853569636842, 0.018205425110422006, 0.018190405725384346, 0.018182494955442424, 0.01822010391043133, 0.018295104880647995, 0.018386943787817366, 0.0184806843259965, 0.01855731367913433, 0.018555869967018693, 0.01845195874962403, 0.018200365116391275, 0.01776236104656314, 0.01712879249491794, 0.016268861334926797, 0.015270458054582948, 0.01429171732501503, 0.013338511778122886, 0.011932857591489869, 0.010139387834933072, 0.007593591811712374, 0.004075127969549955, -0.0006337327965482825, -0.00662091685051906, -0.013680750924641199, -0.02129542199953167, -0.029073218478872374, -0.036736698379591086, -0.04441722943221697, -0.05251139041894109, -0.060963805105251186, -0.06959604276552692, -0.07788133567851979, -0.08535724240048886, -0.09193253848711506, -0.09764842979603802, -0.10252295544556805, -0.10653796162820425, -0.1096944240713496, -0.11195303052295232, -0.11349760547436054, -0.11432665492103508, -0.1144166915670907, -0.11385033786284914, -0.11273089637728508, -0.11122237532906606, -0.1095499642622966, -0.10787375562474606, -0.10576380787887915, -0.10395951764811313, -0.10199899652520623, -0.0997829361217625, -0.09722162087619592, -0.09436097355309714, -0.0912361296463522, -0.08787801461036703, -0.08436721750418862, -0.08075055609411114, -0.07697052839373007, -0.07296451868585575, -0.06866897499071077, -0.06401127471173881, -0.05890481668575111, -0.05383339811617725, -0.04762369922154499, -0.04073457634567387, -0.033048025199726105, -0.024380572925669346, -0.014650730290622792, -0.0035948961713676837, 0.009309117025761702, 0.02302102284858772, 0.02790339944373254], [0.3431948351130337, 0.34252955505491345, 0.34092020428475067, 0.3378077911920536, 0.33231989606507856, 0.3232743401058164, 0.30926488642839384, 0.28887264325913625, 0.2608201118275535, 0.22629193314912627, 0.19018342494110957, 0.1564612901883117, 0.12696736938858058, 0.10217343627281153, 0.08207454515017895, 0.0664398908434172, 0.05469797850205939, 0.04655198557429665, 0.041359784701965684, 0.03851061286537559, 0.37680736826254563, 0.38257510157288194, 0.3899735758648632, 0.39880283066966254, 0.4085700493863178, -0.3573011240557483, -0.29316501634160963, 0.02582069919375638, 0.025971389350531667, 0.025869909962418773, 0.025812427999522748, 0.02583403092432604, 0.025914336797989258, 0.0260238110903402, 0.026140386410427954, 0.026237186233934374, 0.02623347214661482, 0.026087164161251886, 0.025734955540034663, 0.025124593073746457, 0.024243608387326865, 0.023049157327519994, 0.021664048095978144, 0.020309195142377064, 0.01899201391796562, 0.017261429390825717, 0.014782849426942942, 0.011247665527926281, 0.006352673654180147, -0.00018412081208442262, -0.00852208653330894, -0.01836711509255951, -0.028984640890098307, -0.039831098789174034, -0.05052012134595713, -0.06123529942624941, -0.07253011522094352, -0.08432688687611146, -0.09637671275381426, -0.10794563371307025, -0.11839865552481567, -0.12760587786221195, -0.13559876422870412, -0.14241546775860903, -0.14803293267356268, -0.15245560537979583, -0.15565093324036933, -0.1578350783990874, -0.15900780451813537, -0.15914602389776153, -0.15836676162473295, -0.15681475930870076, -0.15471945025444706, -0.1523961339523624, -0.15006613716174497, -0.1476733658442146, -0.1451337420387735, -0.14236001874671647, -0.13922861269110112, -0.1356562843834405, -0.13165005420161932, -0.12726818472828372, -0.1225728167265015, -0.11767050722965036, -0.11262420988372732, -0.10735236187541863, -0.10176672297068991, -0.09577809744860055, -0.08928479535234092, -0.08216572402291587, -0.07485341451286492, -0.06619395099088368, -0.05659083117344158, -0.045881730729990126, -0.03381808976932225, -0.02011119512537693, -0.004712132934025613, 0.013239030603396307, 0.03238375103774776, 0.04037197495435394], [0.4492646152169837, 0.4483913007781485, 0.44628161486428936, 0.44220333084448427, 0.4350136907466839, 0.42316416747961294, 0.404812597096626, 0.37809977148807944, 0.3413514332283461, 0.29611896263003207, 0.24881317746451148, 0.2046267171563114, 0.16596862101386528, 0.13347766752352516, 0.10712664427730578, 0.08658178805280962, 0.071132932954621, 0.06037820082848578, 0.053464398583270734, 0.04957180126209929, 0.397053983482409, 0.4026581254839615, 0.4100803761706228, 0.41903758094511495, 0.42894472745096585, -0.35992419277885634, -0.3063208139004361, 0.034412551460616406, 0.03444649808044791, 0.03424722013455176, 0.0341336532502855, 0.03413640996417117, 0.03422135713810712, 0.03434915059969398, 0.034489908025846366, 0.03460818172455577, 0.034601918774141066, 0.03440942556442504, 0.033947702918511395, 0.03314323193100261, 0.031980383144141124, 0.030404461831678293, 0.028576679558086016, 0.026786967549973666, 0.025051502672648867, 0.022779923768279125, 0.019531929331226317, 0.014902660130294329, 0.008494646806376687, -6.18624013004504e-05, -0.010980412652271943, -0.02387251070882687, -0.037776719684666275, -0.05198153199996237, -0.0659809241958638, -0.08001480115050637, -0.09480707602401793, -0.11025582412740789, -0.12603562283035274, -0.1411873472542158, -0.15488894707690842, -0.16696851752036093, -0.17744594245687498, -0.18638203057078384, -0.1937485376867016, -0.1995537755679066, -0.20377364767066, -0.20665770516512863, -0.20820737645734472, -0.20837370657752302, -0.20731835148203026, -0.2052405495744113, -0.20244598270002984, -0.1993531256041164, -0.1962713882317306, -0.1931242448791693, -0.18979324655163093, -0.18616096789921682, -0.18206396742923903, -0.17739199000971567, -0.17215363953050083, -0.1664248100949237, -0.16028655672113784, -0.15387815976132685, -0.147281887896856, -0.14039093269874817, -0.13308984287142805, -0.12526178557694045, -0.11677360373518948, -0.10746677521157903, -0.0977182120059928, -0.0863950400162967, -0.07384110591470425, -0.05984590973311585, -0.04409019923933742, -0.026210322576060364, -0.005913461983146782, 0.01752605512187754, 0.042581775099992135, 0.054003464783356374], [0.5398534647607576, 0.5388023243680938, 0.536265139945292, 0.5313617036025728, 0.5227183302476394, 0.5084735508609144, 0.4864128147998824, 0.45430074810982024, 0.41012411887833905, 0.355747559686615, 0.29887636149539265, 0.2457501719339641, 0.19926231539757683, 0.1601955525044994, 0.12850233134917247, 0.10375894054924417, 0.08513920313833481, 0.07215066889474633, 0.06375908014748023, 0.05896496004211169, 0.41172527028079714, 0.4171379900019288, 0.42452079646387275, 0.4335195824161568, 0.443476264407888, -0.35911185669038737, -0.3126152013608904, 0.041789422434627826, 0.04171324844583943, 0.04142620867834251, 0.04126229860877872, 0.041247331949406885, 0.04133495610078287, 0.04147740550395424, 0.04163806006027541, 0.04177413500327419, 0.041781773883471617, 0.041551939555388696, 0.04098570123536759, 0.040011103341787674, 0.0386100836920629, 0.0367155646708338, 0.03452067671685751, 0.03237338264613323, 0.030292909259872602, 0.027569824693112425, 0.02367483193149272, 0.018121282050583106, 0.010431288744745193, 0.00016036856481036344, -0.012951774931349592, -0.028436108434022764, -0.045137724217245004, -0.062201897574305005, -0.07902051965704103, -0.0958816020379592, -0.11365459924147761, -0.1322168008936993, -0.15117737806425727, -0.169384926446318, -0.18585815165446712, -0.20038908567196992, -0.21298628608626943, -0.22373054570102024, -0.23258930951448673, -0.2395743853058073, -0.24474879051306433, -0.24823665413447496, -0.25005572595070974, -0.2502257455234422, -0.24894221612573023, -0.24643760110308993, -0.2430763249297405, -0.23935969085450576, -0.23565852532606285, -0.23188026959034097, -0.22788189887685148, -0.22352209453943975, -0.21860436248692644, -0.21299651949988171, -0.20670880809876166, -0.19983226073626661, -0.19246413225322023, -0.1847716882313751, -0.1768537314243794, -0.16858191656657773, -0.15981752345073294, -0.15042015950833998, -0.140229826211303, -0.129056060233977, -0.11722004027329325, -0.103622845595219, -0.0885497868308925, -0.07174908874138629, -0.05284078772852932, -0.03139748514027058, -0.0068305049919246815, 0.02120190690179585, 0.05130542982587132, 0.06572084017112392]], [[0.019634644642016485, 0.019686443658146438, 0.01976250078233116, 0.019827895099134928, 0.01983426019355469, 0.019708325942219707, 0.01936113351928592, 0.01867056070184093, 0.01746098313640255, 0.015745841347904545, 0.013813881103139258, 0.011847285439264292, 0.010026720660241989, 0.008411906841022066, 0.007028474868524365, 0.005874448274148982, 0.00493601060710776, 0.0041974442394528645, 0.00362151566138481, 0.003170004628833803, 0.05920011403194875, 0.05986028057647035, 0.06078761231957463, 0.061991532130818844, 0.06348901170980813, 0.0653054342737686, 0.06744060649801982, 0.06979092351075863, 0.0723411074193944, 0.07510725609515256, 0.07810673197681228, 0.08135342937771856, 0.08485208423969544, 0.08855081509301835, 0.0867134244482994, -0.023152005656040392, -0.007906754771409856, -0.00042990858353135237, -0.0003143293729687299, -0.0003791711128233066, -0.000480642434682114, -0.0006137481126474878, -0.0007714424701108214, -0.0009435783869151268, -0.0011302515941190086, -0.001351495105378727, -0.001619387120842588, -0.0019429756896602668, -0.002328799833733787, -0.002780173673266128, -0.003291953948310165, -0.003844136685971305, -0.004398776333735189, -0.004929480710152006, -0.005421615327191577, -0.005885584402239235, -0.0063490913575372995, -0.006813125265737825, -0.007271173164742862, -0.007693606695128922, -0.008055306676371322, -0.008343838540821857, -0.008569985787032237, -0.008741409454009934, -0.008859893573923578, -0.008928028413640866, -0.008949406169582728, -0.008928798783828332, -0.00886662220660381, -0.008763424520623392, -0.008625213714697577, -0.008458864630495905, -0.008275131558680428, -0.008086317088060959, -0.007901060350753044, -0.0077170996952285785, -0.00753030200212841, -0.0073366635108926, -0.007130824280038292, -0.006910405384543088, -0.006675582945153497, -0.006428687304455475, -0.006172334412131059, -0.00591122490132919, -0.005647228951892777, -0.005375772563169425, -0.005093640602347615, -0.004797547317047788, -0.004483788622319832, -0.004148083953330654, -0.004744559865172017, -0.004502193970237197, -0.0028358457923341146, -0.0023429301858050046, -0.001795870441834649, -0.0011822337341540546, -0.00048664622530302274, 0.00033750152588960235, 0.0012878199396726393, 0.0005100094260723892], [0.09118166848152585, 0.0914079992555127, 0.09176445133397992, 0.0920947064906503, 0.09215980836919097, 0.09160459753969191, 0.08997577686537958, 0.08670277425692184, 0.08106534781093555, 0.07304632292247505, 0.06388990218875781, 0.054668009442039735, 0.046133255890924846, 0.038577606625670384, 0.03210198366239004, 0.02668823207762708, 0.022268602145321795, 0.018766623196273764, 0.01601136939562018, 0.013829353348809685, 0.06920243954407326, 0.06877352190464822, 0.06883568273426653, 0.06934007543969534, 0.07025475772107949, 0.07156456670431006, 0.07324136244899268, 0.07517700827849892, 0.07735319725101408, 0.0797794463957159, 0.08246703151502155, 0.08541206967224362, 0.08858764637617488, 0.09185047533184724, 0.08325536437608552, -0.020488974536191935, -0.006676692414951224, -0.00011785781171146648, -0.00014127255186937397, -0.0005778590731587374, -0.0011320070892838405, -0.001801689590483421, -0.0025641442872621017, -0.0033790123126541806, -0.004250742461257275, -0.005274165525724669, -0.006506768778343339, -0.007991926819653373, -0.00976176582002149, -0.011833616778182347, -0.014191316061903188, -0.016738505630057805, -0.019300865320581898, -0.021757341820079462, -0.024040098754943423, -0.026196380602869673, -0.028352551838791307, -0.03051105293570253, -0.03264067617100203, -0.03460393308133051, -0.03628489541556673, -0.03764891248429806, -0.03872278716735614, -0.03953176338401382, -0.04009285711409785, -0.04041805861894133, -0.04052413430873593, -0.04043342644374737, -0.04014820496321846, -0.03967142766457861, -0.03903095220856626, -0.038258816307923424, -0.037405258604766005, -0.03652623554290995, -0.035659775486944524, -0.03479482264914201, -0.03391211378643879, -0.03299259239012082, -0.032010975462295525, -0.030956771841701116, -0.029832636796376034, -0.028648808563866736, -0.027417490740785647, -0.026160551831913733, -0.02488535025715262, -0.023568830255240463, -0.0221948333218738, -0.02074627284203563, -0.0192033887740321, -0.01754321292235152, -0.01634602369227285, -0.014430949391808928, -0.012341613288080946, -0.010048542368571419, -0.00750475150243329, -0.004659907663660109, -0.0014528601011193488, 0.0022469078901106187, 0.006253778235142559, 0.005308301108329319], [0.17394903387951463, 0.17437438490744353, 0.17505586340612517, 0.17569790189982581, 0.17583815670905503, 0.1747923517623908, 0.17167756968757567, 0.16540376186571853, 0.15463998598763692, 0.13931751746129267, 0.12176625146496495, 0.10413317341977654, 0.0878150231138903, 0.07337539800128394, 0.06099864859820738, 0.0506460847796879, 0.042186838312180105, 0.03547345263066702, 0.030180745384387985, 0.02597956048504008, 0.0805191453618115, 0.07883045166023214, 0.07789200831170594, 0.07758757009220796, 0.0778286504956216, 0.07855322279985347, 0.07970103728760093, 0.08115973042753835, 0.08290835374707953, 0.08494985636186422, 0.08729028583728078, 0.08990891512526392, 0.09275167161625054, 0.09561044781877102, 0.0823585141147122, -0.017987440521093644, -0.0051994304433600575, 0.0006239476608773355, 0.00032618125983157324, -0.0005679087851879446, -0.001662533512261131, -0.0029633909948072125, -0.004431555974130959, -0.0059930908956574965, -0.007658291967210911, -0.00960888259583039, -0.011955163593167836, -0.014780494274403248, -0.018146957315659247, -0.022088492138170795, -0.026577751614337432, -0.031429347814532396, -0.0363115833586596, -0.04099434660566015, -0.04535007253071495, -0.049467811760652805, -0.053586911140305366, -0.057710479840371774, -0.06177806382121388, -0.06552702262932734, -0.06873612182532736, -0.07134934518031219, -0.0734071543366453, -0.07497561194041252, -0.07606986989301112, -0.07671333793166972, -0.07693833783018099, -0.0767877576217628, -0.07626623824103959, -0.07537967088560506, -0.07418112938685988, -0.07273151666149445, -0.07112639639432723, -0.06947204124283453, -0.06784054129321666, -0.06621091164773191, -0.06454678296764112, -0.06281213796631287, -0.06095906829575307, -0.058967966412395566, -0.0568417891017533, -0.05460125090832992, -0.05226942162404073, -0.04988756612978305, -0.04746720617882478, -0.044965345087786546, -0.042355021557211575, -0.03960284463160854, -0.03667171185205883, -0.033518254016614527, -0.030813205119065767, -0.027158077663395924, -0.023170804706105705, -0.018769740704686688, -0.013939943403510548, -0.0085149534568718, -0.0024072787383213274, 0.004593244548253939, 0.012053658997496, 0.011454779680303406], [0.4743783199468579, 0.47552042562197705, 0.4773829771505788, 0.4791672846188096, 0.47959445190841904, 0.47677965439616005, 0.4682645731942602, 0.4510721924646536, 0.4216927295558755, 0.3798387199058402, 0.3317424847020106, 0.2835430200456647, 0.2389408017849377, 0.19949121238968687, 0.16567423759544744, 0.1373730819896464, 0.11422634423601774, 0.09582752048971553, 0.08129229563249521, 0.06972805777652702, 0.12093870685362978, 0.11467474892339763, 0.11010148017465839, 0.10685795678579028, 0.10465044111542116, 0.10324677602316039, 0.10247056786257601, 0.10219638835856507, 0.10239542924060209, 0.1030487927049324, 0.104147041290192, 0.10561553308014528, 0.10732007679088679, 0.10889739928314034, 0.0849255748140882, -0.00997245040472387, 0.0002924134918122905, 0.004056376036476406, 0.0025326305424921763, -8.425997601434546e-05, -0.003183022728648453, -0.006806101613435201, -0.010860341275711288, -0.015153451306315045, -0.019719506280198005, -0.02505681530407783, -0.03146822910467051, -0.03918295072579837, -0.04837236375709328, -0.05913081141855095, -0.07139228470684496, -0.08464575623759765, -0.09798808968566644, -0.11079263061147103, -0.12270652744940508, -0.13397235919297718, -0.1452409986693389, -0.1565190764157732, -0.16764127578124227, -0.17789214118432006, -0.1866698957376692, -0.19385138108581332, -0.19951808239318347, -0.20384952438587858, -0.20688693346920622, -0.2086945661622269, -0.20936090113634803, -0.20897338268359958, -0.2075754428132779, -0.20518419687300282, -0.2019439706999416, -0.19801985014507714, -0.1936708926234025, -0.1891840656174397, -0.18475344707246671, -0.18032268707020296, -0.17579446519442835, -0.17107209289490838, -0.16602634235275246, -0.16060548844407377, -0.1548193056727798, -0.1487246938799022, -0.14238420178075378, -0.13591014264154594, -0.1293390768238547, -0.12255137757846836, -0.1154645789522097, -0.10799078878750057, -0.10002777908222674, -0.09145619100232505, -0.08299232333222505, -0.07301983476716555, -0.06214238586635461, -0.05020269211850182, -0.036960417870171416, -0.022172134859197203, -0.005545205423230859, 0.013385486053204283, 0.03321983874840986, 0.03493813954402509], [0.7495328050725384, 0.751328673806289, 0.7542735509795343, 0.7571090591176489, 0.7578057295256466, 0.7533763695288487, 0.7399121895721503, 0.7127073027357901, 0.6662744380605221, 0.6001107267195003, 0.5240043018711537, 0.44779308594530093, 0.3772711266360413, 0.31490492305802475, 0.2614417972684984, 0.21669172025400804, 0.18008147301252983, 0.15096663916230071, 0.12795118555044083, 0.10962720544379473, 0.1574436843775042, 0.14698474079788965, 0.1390769256384731, 0.1331350656630962, 0.1286773275172165, 0.12531559438257292, 0.12276726645510043, 0.12089639633085422, 0.11966784816669279, 0.11904359578760212, 0.1189919128383181, 0.11940066251571801, 0.12007094420836067, 0.12053537712198999, 0.08966182984468352, -0.003127903017266908, 0.005318460449614614, 0.007453955610894443, 0.004693672380704984, 0.0004649269107022597, -0.004494300856171989, -0.01026421357803045, -0.016703867617359064, -0.0235136105887392, -0.030749728472341576, -0.0392008649297295, -0.04934648424766234, -0.061549458257763166, -0.07608133324147083, -0.09309186093773351, -0.11248083376196125, -0.13343791424605955, -0.15453650489361553, -0.17478674059450394, -0.1936306984538828, -0.21145096436851168, -0.22927483175663288, -0.24711180707544067, -0.26470046564803557, -0.28091078816138987, -0.29473447523488977, -0.30604607847192555, -0.31496151543242873, -0.32176515667145117, -0.3265229309062589, -0.3293373124474557, -0.3303489743318477, -0.32974430244152403, -0.32754551447724517, -0.3237794339492412, -0.31867375184305424, -0.3124889030422311, -0.3056339073234544, -0.29856192305936047, -0.2915792877347758, -0.28459674412972935, -0.2774605754188623, -0.27001806003082757, -0.2620650245109719, -0.25351976393846504, -0.24439776599549357, -0.23478891562131712, -0.22479198405160916, -0.2145844176171814, -0.20422400759933831, -0.1935218375577247, -0.1823477616900558, -0.17056308606985618, -0.15800659447089865, -0.14449009239966978, -0.13059386836965683, -0.11486250720084276, -0.09767407778541998, -0.07880671152687765, -0.05775081459753282, -0.034516093353237125, -0.008259551919861162, 0.021573185246787124, 0.05266319161927768, 0.057008030742259935], [1.0706249699233497, 1.0731823392003963, 1.0773905609195757, 1.0814554042892035, 1.082470095824504, 1.0761595547579412, 1.0569183778794964, 1.0180228264451592, 0.9516874475474829, 0.8571501149162903, 0.7483388367083978, 0.639430400569255, 0.538653387913325, 0.4495389780025265, 0.3731446665770559, 0.3091940745571461, 0.2568664461708141, 0.21523938750004712, 0.18231991149571053, 0.15609918390478938, 0.1995468862839548, 0.18418628556175368, 0.17237960978844832, 0.16327985648080734, 0.15618551158123448, 0.15052623832007528, 0.14589555521908484, 0.14213337512540114, 0.1392097595003192, 0.13706451237645764, 0.13566135644261026, 0.1348273778043989, 0.13429254770156612, 0.13348780022817439, 0.09608574599501381, 0.004735293490753492, 0.011269224011187887, 0.011612132915639325, 0.0073553339676715, 0.0012342806333621482, -0.005902130644397271, -0.014180216939502194, -0.023404202826937705, -0.0331497534441571, -0.04349940510713801, -0.05558075394567477, -0.07007949414504148, -0.08751463333462348, -0.10827483068542078, -0.13257479031279495, -0.1602752993616742, -0.1902165263131412, -0.2203613108380952, -0.24929614953315757, -0.2762238392832465, -0.3016902551889216, -0.32716174923020575, -0.35256802603106285, -0.3776147166661179, -0.40068807612808566, -0.42043145942788146, -0.4366011083788247, -0.44934960104057936, -0.4590825504511524, -0.46589384215767665, -0.4699298114853259, -0.47139133107734604, -0.4705445701693149, -0.4674212969421841, -0.4620599390127415, -0.4547856498350401, -0.4459702450222911, -0.43619783433638204, -0.42611558527318033, -0.4161608784796588, -0.4062060940782539, -0.3960317854739478, -0.3854199209456113, -0.37407893265608905, -0.3618921863021354, -0.3488818880695233, -0.33517644775990707, -0.3209169236247873, -0.3063567853556835, -0.2915786156047924, -0.2763126598086544, -0.26037314618438945, -0.24356209208158466, -0.2256494163606737, -0.20636664313311784, -0.18632447556450227, -0.1635988846457386, -0.13905297449034576, -0.11210102357325714, -0.08221034070789046, -0.04884208677405033, -0.01135041045832557, 0.03119200799199857, 0.07537671871283912, 0.08305122146700387], [1.374993201641413, 1.3782716107535125, 1.3836775587261014, 1.3889091996372185, 1.3902273437648405, 1.3821352648301337, 1.3574170575232245, 1.307436036634363, 1.2222336197627879, 1.100797458093233, 0.9609743819378368, 0.8210667377902972, 0.6916059892580484, 0.5771333637446647, 0.4789993589361863, 0.3968452392389312, 0.3296154035502729, 0.27612376340958744, 0.2338115812900177, 0.20010061925033204, 0.23921678536755864, 0.21920695118650418, 0.20370102431724033, 0.19160373573610032, 0.18200525168817033, 0.17414558709865713, 0.16751677505264254, 0.16196166656037708, 0.15743181950408722, 0.15384641470789534, 0.15115631679338626, 0.1491401348477955, 0.14746294379174904, 0.14547052830538332, 0.10274248265170113, 0.012088244127356977, 0.016934353684244518, 0.01564311307294683, 0.009935423957414667, 0.0020121001176737524, -0.007193808162283991, -0.017853533065973246, -0.029719892663137435, -0.04225074182272128, -0.05555371861408476, -0.07107782990278366, -0.08970433388101183, -0.11210029245808907, -0.1387654289958565, -0.1699760614853014, -0.20555636331965316, -0.24401493709786548, -0.28273589483536804, -0.31990419028665984, -0.3544957761835113, -0.38710297317080694, -0.419711188015535, -0.4523372437675482, -0.4845018579852185, -0.5141328033070518, -0.5394883388370932, -0.5602652237787061, -0.5766494616922996, -0.5891615366841811, -0.5979218090739783, -0.6031181895600913, -0.6050086106088057, -0.6039348634910934, -0.5999377703007014, -0.5930667700274015, -0.5837393948618319, -0.5724330211999454, -0.5598977164403426, -0.546964543474638, -0.5341950859755273, -0.5214253485316974, -0.5083735920844348, -0.49475988898116696, -0.48020983603348705, -0.4645736932549603, -0.4478800419748742, -0.43029381010527223, -0.4119961350128035, -0.3933125477196151, -0.374349132763397, -0.3547595144325917, -0.3343051950930911, -0.31273198490662707, -0.28974450806327173, -0.2649981495994108, -0.23909335994895042, -0.20995469040302678, -0.17811714905346354, -0.14361170916430885, -0.10522224494583335, -0.062370017541658704, -0.014229892140932187, 0.04035283776646372, 0.09692714076966803, 0.10790722590393632]]], "reynolds_numbers": [50000.0, 100000.0, 200000.0, 500000.0, 1000000.0, 3500000.0, 5000000.0, 7500000.0], "angle_of_attacks": [-0.24434609527920614, -0.22689280275926285, -0.20943951023931956, -0.19198621771937624, -0.17453292519943295, -0.15707963267948966, -0.13962634015954636, -0.12217304763960307, -0.10471975511965978, -0.08726646259971647, -0.06981317007977318, -0.05235987755982989, -0.03490658503988659, -0.017453292519943295, 0.0, 0.017453292519943295, 0.03490658503988659, 0.05235987755982989, 0.06981317007977318, 0.08726646259971647, 0.10471975511965978, 0.12217304763960307, 0.13962634015954636, 0.15707963267948966, 0.17453292519943295, 0.19198621771937624, 0.20943951023931956, 0.22689280275926285, 0.24434609527920614, 0.2617993877991494, 0.2792526803190927, 0.29670597283903605, 0.3141592653589793, 0.33161255787892263, 0.3490658503988659, 0.3665191429188092, 0.3839724354387525, 0.4014257279586958, 0.4188790204786391, 0.4363323129985824, 0.4537856055185257, 0.47123889803846897, 0.4886921905584123, 0.5061454830783556, 0.5235987755982988, 0.5410520681182421, 0.5585053606381855, 0.5759586531581288, 0.5934119456780721, 0.6108652381980153, 0.6283185307179586, 0.6457718232379019, 0.6632251157578453, 0.6806784082777885, 0.6981317007977318, 0.7155849933176751, 0.7330382858376184, 0.7504915783575618, 0.767944870877505, 0.7853981633974483, 0.8028514559173916, 0.8203047484373349, 0.8377580409572782, 0.8552113334772214, 0.8726646259971648, 0.8901179185171081, 0.9075712110370514, 0.9250245035569946, 0.9424777960769379, 0.9599310885968813, 0.9773843811168246, 0.9948376736367679, 1.0122909661567112, 1.0297442586766545, 1.0471975511965976, 1.064650843716541, 1.0821041362364843, 1.0995574287564276, 1.117010721276371, 1.1344640137963142, 1.1519173063162575, 1.1693705988362009, 1.1868238913561442, 1.2042771838760873, 1.2217304763960306, 1.239183768915974, 1.2566370614359172, 1.2740903539558606, 1.2915436464758039, 1.3089969389957472, 1.3264502315156905, 1.3439035240356338, 1.361356816555577, 1.3788101090755203, 1.3962634015954636, 1.413716694115407, 1.4311699866353502, 1.4486232791552935, 1.4660765716752369, 1.4835298641951802, 1.5009831567151235, 1.5184364492350666, 1.53588974175501, 1.5533430342749532, 1.5707963267948966]}, "prev": null, "next": null, "number_of_points": 201}}, "airfoil_polar_stations": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0], "cruise": {"design_thrust": 200, "design_torque": 107.93214760372817, "design_power": 13699.856787119088, "design_angular_velocity": 126.93027139067017, "design_tip_mach": null, "design_acoustics": null, "design_performance": null, "design_SPL_dBA": 0, "design_pitch_command": 0.5235987755982988, "design_Cl": -0.035497566166820614, "design_thrust_coefficient": 0.04212252028571272, "design_power_coefficient": 0.08046221757787539, "design_altitude": 457.20000000000005, "design_freestream_velocity": 58.1152}, "induced_power_factor": 1.48, "profile_drag_coefficient": 0.03, "clockwise_rotation": true, "phase_offset_angle": 0.0, "orientation_euler_angles": [0.0, 0.0, 0.0], "pitch_command": 0.0, "ducted": false, "sol_tolerance": 1e-08, "use_2d_analysis": false, "nonuniform_freestream": false, "axial_velocities_2d": null, "tangential_velocities_2d": null, "radial_velocities_2d": null, "start_angle": 0.0, "start_angle_idx": 0, "variable_pitch": true, "electric_propulsion_fraction": 1.0, "Wake": {"tag": "rotor_wake", "origin": [[0.0, 0.0, 0.0]], "generative_design_max_per_vehicle": 0, "generative_design_characteristics": [], "generative_design_special_parent": null, "mass_properties": {"mass": 0.0, "volume": 0.0, "center_of_gravity": [[0.0, 0.0, 0.0]], "moments_of_inertia": {"center": [0.0, 0.0, 0.0], "tensor": [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]}}, "symmetric": false, "inputs": {}, "outputs": {}, "wake_method": "Fidelity_Zero"}, "optimization_parameters": {"tip_mach_range": [0.3, 0.7], "multiobjective_aeroacoustic_weight": 1.0, "multiobjective_performance_weight": 0.5, "multiobjective_acoustic_weight": 1.0, "noise_evaluation_angle": 2.356194490192345, "tolerance": 0.0001, "ideal_SPL_dBA": 30, "ideal_efficiency": 1.0, "ideal_figure_of_merit": 1.0}, "hover": {"design_thrust": 991.4231250000001, "design_torque": 87.94524276184421, "design_power": 23601.335650515724, "design_angular_velocity": 268.3639831938171, "design_tip_mach": null, "design_acoustics": null, "design_performance": null, "design_freestream_velocity": 12.920538169696316, "design_SPL_dBA": 0, "design_pitch_command": 0.0, "design_Cl": 0.5485196648725132, "design_thrust_coefficient": 0.04474887207772273, "design_power_coefficient": 0.014050248937862823, "design_altitude": 12.192}, "oei": {"design_thrust": 1133.0589852596172, "design_torque": 121.32345069500374, "design_power": 28419.76514884707, "design_angular_velocity": 234.24791321087469, "design_tip_mach": null, "design_acoustics": null, "design_performance": null, "design_freestream_velocity": 13.81263630963968, "design_pitch_command": 0.07849405338995467, "design_altitude": 12.192, "design_SPL_dBA": null, "design_Cl": null, "design_thrust_coefficient": null, "design_power_coefficient": null}}
\ No newline at end of file
+{"tag": "prop_rotor", "mass_properties": {"mass": 0.0, "volume": 0.0, "center_of_gravity": [[0.0, 0.0, 0.0]], "moments_of_inertia": {"center": [0.0, 0.0, 0.0], "tensor": [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]}}, "origin": [[0.0, 0.0, 0.0]], "number_of_blades": 3, "tip_radius": 0.8875, "hub_radius": 0.08875, "twist_distribution": [0.35621958995198943, 0.3455794307693645, 0.33399357946023, 0.3220512159981807, 0.30914886727676516, 0.29593533646484155, 0.2821568575335416, 0.26778756417611255, 0.25307875543603836, 0.23767159070712401, 0.2217661756623288, 0.20540797902215438, 0.1883387989929319, 0.17055826544447006, 0.15209048444800655, 0.13278816452261064, 0.1124459767942196, 0.09076298968724342, 0.0672727927112122, 0.04093178665538544], "sweep_distribution": 0.0, "chord_distribution": [0.0676931665774464, 0.06941792330868501, 0.0707342973409273, 0.07189442532866676, 0.07257595475307585, 0.07309829639848583, 0.07333163414837467, 0.07327749222049124, 0.07306372022568607, 0.0725462927900869, 0.07184673710166795, 0.07099237523817871, 0.06993417048650047, 0.06873005256785192, 0.0674241617873851, 0.0660379185641989, 0.06461255076437622, 0.06321287543174627, 0.06193172856710904, 0.06092427065492826], "thickness_to_chord": [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0], "max_thickness_distribution": [0.00814452120871081, 0.008352035770189751, 0.008510415659420189, 0.00864999676455512, 0.008731995157186227, 0.008794840830159249, 0.008822914923141563, 0.00881640082279404, 0.008790680788800251, 0.008728426370278037, 0.008644259142933397, 0.008541466369764177, 0.008414148185685113, 0.008269274420398895, 0.008112155826373549, 0.007945369606988249, 0.007773876103835494, 0.007605473796656203, 0.007451332273396636, 0.007330119708709587], "radius_distribution": [0.08875, 0.1286875, 0.168625, 0.2085625, 0.2485, 0.28843749999999996, 0.328375, 0.3683125, 0.40824999999999995, 0.44818749999999996, 0.4881249999999999, 0.5280625, 0.568, 0.6079374999999999, 0.647875, 0.6878124999999999, 0.7277499999999999, 0.7676875, 0.8076249999999999, 0.8475624999999999], "mid_chord_alignment": [0.0, 0.0004311891828096548, 0.0007602826908702266, 0.0010503146878050908, 0.0012206970439073636, 0.0013512824552598598, 0.0014096168927320678, 0.0013960814107612102, 0.0013426384120599176, 0.0012132815531601254, 0.0010383926310553876, 0.0008248021651830785, 0.0005602509772635184, 0.0002592214976013807, -6.725119751532435e-05, -0.0004138120033118746, -0.0007701539532675439, -0.0011200727864250325, -0.0014403595025843392, -0.0016922239806295338], "blade_solidity": 0.06386323120388372, "flap_angle": 0.0, "number_azimuthal_stations": 16, "vtk_airfoil_points": 40, "Airfoils": {"airfoil": {"tag": "Airfoil", "mass_properties": {"mass": 0.0, "volume": 0.0, "center_of_gravity": [[0.0, 0.0, 0.0]], "moments_of_inertia": {"center": [0.0, 0.0, 0.0], "tensor": [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]}}, "origin": [[0.0, 0.0, 0.0]], "coordinate_file": "/Users/matthewclarke/Documents/LEADS/CODES/RCAIDE/Regressions/Vehicles/Airfoils/NACA_4412.txt", "geometry": {"thickness_to_chord": 0.12031526401402463, "max_thickness": 0.12031526401402463, "x_coordinates": [1.0, 0.9814986041918321, 0.9627179125828096, 0.9439399294906926, 0.925166127050739, 0.9063979951973198, 0.8876370570644889, 0.8688849585974798, 0.8501434433355801, 0.8314143048152758, 0.8126993946862192, 0.7940006322429313, 0.7753200050008656, 0.756659574822571, 0.7380215049082569, 0.7194080751470893, 0.7008216977172956, 0.6822649200925803, 0.6637403963528624, 0.645250955842517, 0.626799645772505, 0.6083897600856984, 0.5900248658119063, 0.571708729724946, 0.5534453814827941, 0.535239264316922, 0.5170952982448289, 0.49901895013235004, 0.48101643938803296, 0.46309510629202194, 0.4452631963781565, 0.4275299115395387, 0.4099055688962534, 0.39240178150249916, 0.3750314325460706, 0.357808928370942, 0.34075082080467095, 0.32387621751014195, 0.30720724855378506, 0.2907696368921567, 0.2745936850479651, 0.25871484137809875, 0.2431740309303782, 0.22801724442061427, 0.21329603594425958, 0.1990687049367147, 0.1853997496370617, 0.17235801737867823, 0.16001078976617483, 0.1484169477183293, 0.1376194134058754, 0.12763845294525444, 0.11846796489977444, 0.11007670049089632, 0.1024137182167369, 0.0954160659771718, 0.08901711107700098, 0.08315099268701516, 0.07775548663074952, 0.07277400767035845, 0.06815571418013859, 0.06385579097428683, 0.05983566008186675, 0.05606222004199868, 0.05250706653476362, 0.0491458183572621, 0.04595930785055342, 0.042933270255651794, 0.04005493749787476, 0.037312709084026195, 0.034696070445075014, 0.03219550170016633, 0.0298023853906419, 0.02750891790918816, 0.025308027034296163, 0.023192935808851622, 0.02115608201712639, 0.019190358145905088, 0.017289413487845455, 0.015447549057252933, 0.013659629176746041, 0.011921538211868638, 0.010241509544193898, 0.008638453084516204, 0.007129684138173528, 0.005730775074766114, 0.00445590503966137, 0.0033181570291437672, 0.0023297725998544455, 0.0015023725325003807, 0.000847150244475165, 0.0003750435511636885, 9.509610563002236e-05, 0.0, 7.452001018022221e-05, 0.00030452347237569575, 0.000676914321409992, 0.0011794915261896218, 0.0018008204127729721, 0.0025301145243810616, 0.0033571259261699605, 0.004272042061421051, 0.005265387412293136, 0.006327928317567679, 0.0074505793552065115, 0.008624309710555625, 0.009840047921614168, 0.011088583319122047, 0.01236046235776236, 0.01364655057113249, 0.014945039096245016, 0.016259016038259397, 0.017591824949329357, 0.01894702157978385, 0.020328411630572713, 0.021740093543628998, 0.0231865073605088, 0.024672490890805244, 0.026203221053714757, 0.027782487236306667, 0.029412931963032407, 0.03109738619483352, 0.03283892449750685, 0.03464088602719837, 0.036506897406641925, 0.038440897432663844, 0.04044716342366599, 0.042530338808020283, 0.04469546123204342, 0.046947989971229266, 0.049293830672406766, 0.05173948490954553, 0.05429411634253652, 0.05696980059975158, 0.05978044316179767, 0.06274208283139807, 0.06587331118102385, 0.0691957837270325, 0.07273484085473012, 0.07652023982094654, 0.08058583014904505, 0.08496906148422065, 0.089712805806937, 0.09486582584922006, 0.10048259915310902, 0.10662336682668508, 0.11335580363417899, 0.12074993170533967, 0.1288720199331354, 0.13777743006425117, 0.14750304006375375, 0.15806139200497055, 0.16943786265293181, 0.1815934222119159, 0.19447112364529714, 0.208003472982633, 0.22212174784617358, 0.23676094425459845, 0.2518603787802792, 0.26736486724739394, 0.2832251009720127, 0.299397256762339, 0.3158426761256465, 0.3325281696925176, 0.34942470654161184, 0.36650653142338824, 0.3837506629710889, 0.4011364641352233, 0.41864598663077307, 0.43626545690558494, 0.45398318187240944, 0.47178880195424955, 0.48967309748227106, 0.5076278171140842, 0.5256451983061614, 0.5437177470751237, 0.561838553623006, 0.5800012410127093, 0.5981998972115157, 0.6164291550142874, 0.6346847885225873, 0.6529631737513845, 0.67126097844783, 0.6895751277335864, 0.7079027582787132, 0.7262406360647307, 0.7445849862001512, 0.7629321371831269, 0.7812785489577723, 0.7996207982694651, 0.8179555977495703, 0.8362798957017255, 0.8545907625570829, 0.8728853412047842, 0.8911608379734586, 0.9094145277711615, 0.9276440415599844, 0.9458473593930258, 0.9640225088883382, 0.9821675448872287, 1.0], "y_coordinates": [-0.003899557014304108, -0.003965450288149787, -0.004089785075419923, -0.004262840238633295, -0.004474885763102654, -0.004716190465313486, -0.004977700900684799, -0.005257969835374713, -0.0055603467171377674, -0.005888236905053348, -0.006245022025924555, -0.006634032213701064, -0.00705716068060325, -0.007514113484612934, -0.008004396547600223, -0.008527499531081744, -0.009082894725243514, -0.009669764011902459, -0.01028608853516519, -0.010929521393664241, -0.011597713534716756, -0.01228831450580067, -0.012998847135051207, -0.013724612801888237, -0.014459054164914338, -0.015195633371582015, -0.015927906504120987, -0.01664953818435914, -0.017357279349697073, -0.018057496381499314, -0.018758272413468363, -0.01946739513737556, -0.020192310484602672, -0.020939850435522333, -0.021710094131471416, -0.022495834932805332, -0.023289617373986875, -0.024084157926099147, -0.02487237392941989, -0.02564801501660149, -0.02641447208591279, -0.02718183482954174, -0.02795774059718128, -0.028722689603506327, -0.02943236145279451, -0.03004843386043372, -0.030548243258206785, -0.03093703612204972, -0.031225993980944448, -0.03142733957182306, -0.03154849251401395, -0.031587316973441436, -0.03154672379907596, -0.0314345385791228, -0.0312609850909314, -0.03103682859636295, -0.030772791208272705, -0.03047826324983898, -0.030160740466022865, -0.029825794211040025, -0.029472391463777222, -0.029095957464163383, -0.0286941177384919, -0.028266015948487398, -0.02781170554798779, -0.027331770656851048, -0.02682752646749548, -0.02630091878864877, -0.025753698873117813, -0.02518737604178764, -0.024603239977866776, -0.024002383115249656, -0.023385721771080347, -0.022754015392798553, -0.022107883697649995, -0.021444841874105357, -0.020750950783107774, -0.020011571688111036, -0.019214318300964397, -0.01834859390179029, -0.01740521934856992, -0.016376539237984114, -0.015264905036656874, -0.014081233517464695, -0.012835473433447944, -0.01153638265051692, -0.010191704284991457, -0.008808316041135439, -0.0073923575098291455, -0.005949339296477094, -0.004484237139173562, -0.0030015736162306503, -0.0015055042653778843, 0.0, 0.00151116470561765, 0.003024434321032745, 0.0045364249693986, 0.006043880163895953, 0.007543629436265651, 0.009032549066208179, 0.010507524185682942, 0.011965411576297852, 0.013403002502951716, 0.014816984933787171, 0.01620390448576055, 0.01756012340638186, 0.018881776854469606, 0.020164725674259285, 0.02140450476531517, 0.022596783781377444, 0.023742788438980582, 0.02484746124843818, 0.025915920916832664, 0.02695346335161884, 0.027965628432981678, 0.0289582751167327, 0.029937666890962847, 0.03091057003318596, 0.031884109771249516, 0.03286214476169529, 0.03384574186594778, 0.03483593092172032, 0.03583378635317488, 0.03684043425125774, 0.037857060232974485, 0.038884918212483216, 0.039925340236404636, 0.040979747557494034, 0.04204966314426527, 0.04313672584805332, 0.04424270647095047, 0.04536952940885742, 0.04651934711092833, 0.047694570177395895, 0.04889786622353596, 0.05013219903990042, 0.051400875267589276, 0.052707598222880896, 0.05405652929830145, 0.055452358806650746, 0.05690052720187732, 0.058407487139250445, 0.05998069968882116, 0.06162878880057992, 0.06336173992867573, 0.06518947002390746, 0.06711593127660478, 0.0691400726394503, 0.0712549228235825, 0.07344564670357719, 0.07568824816321433, 0.07795009667946298, 0.08019650393779813, 0.08239384182621884, 0.0845111752483459, 0.08652267855731853, 0.08840124510902292, 0.09011823856487722, 0.09164943724696237, 0.09297546468702177, 0.09408223342067987, 0.09495964933503866, 0.09560153149150259, 0.09600759325468042, 0.09618111755204445, 0.09612770520407414, 0.09585492271456166, 0.09537200736825038, 0.09468927789691249, 0.09381706055586757, 0.09276640938941323, 0.09154922113152997, 0.09017812144285317, 0.08866618545185483, 0.08702022885609838, 0.08523869941268786, 0.08331957523689061, 0.08126090752084213, 0.07906081388457424, 0.07671833927533663, 0.07423750988437107, 0.07162421090488018, 0.06888446791792896, 0.06602443029541259, 0.06305023994699901, 0.059963934729950714, 0.05676235665660661, 0.053442023641031046, 0.049999459621278365, 0.046431197646000455, 0.042734289382326804, 0.03890806393091963, 0.03495251090313596, 0.03086765362385812, 0.026653549191735383, 0.02231031746698798, 0.017838771375195156, 0.013240418157354838, 0.008516831495265543, 0.003669623092761436, -0.001299557014304108], "x_upper_surface": [0.0, 0.002983568463323366, 0.005495398864107563, 0.007633290556781445, 0.009495042895773863, 0.011178455235513671, 0.012781326930429715, 0.014401457334950855, 0.016136645803505933, 0.018084691690523808, 0.02034339435043333, 0.023010553137663356, 0.02618245030633179, 0.02987598021789672, 0.03399124860432431, 0.03841901276927576, 0.04305003001641233, 0.04777505764939527, 0.05248655095606091, 0.05711111124345979, 0.061606963318156155, 0.06593352453527067, 0.07005021224992403, 0.0739164438172369, 0.07750993516859131, 0.08099347412039164, 0.08463731026676209, 0.08871301688355863, 0.09349216724663728, 0.09924633463185403, 0.10618323138176163, 0.11414598540546432, 0.12284854577009242, 0.1320047101687122, 0.14132827629439002, 0.1505330554072626, 0.15941192765493456, 0.16802305011648855, 0.17648015059219266, 0.1848969568823147, 0.1933871967871227, 0.20206398490556696, 0.21095415649494886, 0.21991005271261319, 0.22876296466442167, 0.23734418345623623, 0.2454850001939189, 0.2530251979813624, 0.26011284668479406, 0.26728429606874665, 0.27510065390950467, 0.2841230279833525, 0.2949125260665745, 0.3079923356666425, 0.3232909407152382, 0.34026464195678596, 0.3583567334835082, 0.37701050938762737, 0.39566926376136546, 0.41382871561702983, 0.4314191595903167, 0.4485857680617406, 0.46547524058290646, 0.48223427670541846, 0.4990095759808816, 0.5159232725419912, 0.5329802330322019, 0.5501503711502892, 0.5674035945976118, 0.584709811075529, 0.6020389293063492, 0.6193617292646799, 0.636651449880647, 0.65388176079721, 0.671026331657328, 0.6880588321039602, 0.7049536176478475, 0.721740725289753, 0.7385460873202617, 0.7555051174661778, 0.772753229454305, 0.7904258370114485, 0.8086470512659382, 0.8272412658080572, 0.8457092490452215, 0.8635356764272545, 0.8802052234039801, 0.8952025654252215, 0.9080540170788527, 0.9188060849794258, 0.9278588799318661, 0.9356192701068533, 0.9424941236750667, 0.9488903088071868, 0.9552146936738926, 0.9618741464458638, 0.9692755352937806, 0.9778257283883225, 0.987931593900169, 1.0], "x_lower_surface": [0.0, 0.002983568463323366, 0.005495398864107563, 0.007633290556781445, 0.009495042895773863, 0.011178455235513671, 0.012781326930429715, 0.014401457334950855, 0.016136645803505933, 0.018084691690523808, 0.02034339435043333, 0.023010553137663356, 0.02618245030633179, 0.02987598021789672, 0.03399124860432431, 0.03841901276927576, 0.04305003001641233, 0.04777505764939527, 0.05248655095606091, 0.05711111124345979, 0.061606963318156155, 0.06593352453527067, 0.07005021224992403, 0.0739164438172369, 0.07750993516859131, 0.08099347412039164, 0.08463731026676209, 0.08871301688355863, 0.09349216724663728, 0.09924633463185403, 0.10618323138176163, 0.11414598540546432, 0.12284854577009242, 0.1320047101687122, 0.14132827629439002, 0.1505330554072626, 0.15941192765493456, 0.16802305011648855, 0.17648015059219266, 0.1848969568823147, 0.1933871967871227, 0.20206398490556696, 0.21095415649494886, 0.21991005271261319, 0.22876296466442167, 0.23734418345623623, 0.2454850001939189, 0.2530251979813624, 0.26011284668479406, 0.26728429606874665, 0.27510065390950467, 0.2841230279833525, 0.2949125260665745, 0.3079923356666425, 0.3232909407152382, 0.34026464195678596, 0.3583567334835082, 0.37701050938762737, 0.39566926376136546, 0.41382871561702983, 0.4314191595903167, 0.4485857680617406, 0.46547524058290646, 0.48223427670541846, 0.4990095759808816, 0.5159232725419912, 0.5329802330322019, 0.5501503711502892, 0.5674035945976118, 0.584709811075529, 0.6020389293063492, 0.6193617292646799, 0.636651449880647, 0.65388176079721, 0.671026331657328, 0.6880588321039602, 0.7049536176478475, 0.721740725289753, 0.7385460873202617, 0.7555051174661778, 0.772753229454305, 0.7904258370114485, 0.8086470512659382, 0.8272412658080572, 0.8457092490452215, 0.8635356764272545, 0.8802052234039801, 0.8952025654252215, 0.9080540170788527, 0.9188060849794258, 0.9278588799318661, 0.9356192701068533, 0.9424941236750667, 0.9488903088071868, 0.9552146936738926, 0.9618741464458638, 0.9692755352937806, 0.9778257283883225, 0.987931593900169, 1.0], "y_upper_surface": [0.0, 0.006380448434411382, 0.011684222338048238, 0.01604344931896208, 0.019590256985204432, 0.022456772944826807, 0.024775124805880726, 0.0266774401764177, 0.028295846664489248, 0.029762471878146894, 0.03120944342544214, 0.032768888914426524, 0.034571312065779534, 0.03666224067904225, 0.03896219329809893, 0.041381682012703425, 0.043831218912609625, 0.04622131608757143, 0.048465024185001655, 0.050526443585207935, 0.052416953128491914, 0.05414971456533544, 0.05573788964622039, 0.0571946401216286, 0.05853647479776234, 0.059813754617875345, 0.061096496729764464, 0.06245496040041921, 0.06395940489682915, 0.0656800894859838, 0.06766885051217811, 0.06987234717171274, 0.0721999724999295, 0.07456107586302006, 0.07686500662717619, 0.07902111828787567, 0.08096282982043052, 0.08270430013275304, 0.0842766016889327, 0.085710806953059, 0.08703798838922139, 0.08828913732842156, 0.08948382942265995, 0.09061855288962625, 0.09168701080022883, 0.09268290622537607, 0.09359994223597637, 0.09443196809870935, 0.09517814045560116, 0.09584430046261619, 0.09643671550245721, 0.09696165295782698, 0.0974253802114283, 0.09783279989437103, 0.09816741123853424, 0.09839571958896255, 0.09848376218090428, 0.09839757624960772, 0.09810319903032119, 0.09757115844868458, 0.09680920794395251, 0.09584350726715765, 0.09470034698598487, 0.0934060176681191, 0.09198680988124525, 0.09046433273809579, 0.08883784757584529, 0.08709995471617446, 0.08524325333783067, 0.08326034261956128, 0.08114382794560088, 0.07889161030783352, 0.07651653661409302, 0.07403407171213082, 0.07145968044969825, 0.06880882767454666, 0.0660967461407709, 0.06331982631104899, 0.060442008241368986, 0.057424023525010276, 0.05422660375525216, 0.050810480525374006, 0.047139368762024875, 0.043256094167558316, 0.03928890366932827, 0.035370291948646625, 0.031632753686825256, 0.028208783565176167, 0.02522084411119842, 0.022666067534134495, 0.02045639187752719, 0.01850212712690006, 0.016713583267776725, 0.015001070285680764, 0.013274898166135717, 0.01144537689466523, 0.009422816456792805, 0.007117526838042063, 0.004439818023936638, 0.0013], "y_lower_surface": [0.0, -0.0036652232238845632, -0.006745116792398609, -0.009305400195575348, -0.011411792923447985, -0.013130014466049736, -0.014525784313413804, -0.0156648219555734, -0.01661284688256173, -0.017435578584412005, -0.018198736551157432, -0.01896804027283123, -0.01980839017236283, -0.020741825952895296, -0.021727334318491106, -0.022718854851383495, -0.02367032713380571, -0.02453569074799101, -0.02527062637854228, -0.025865827824930854, -0.02634441542554817, -0.02673073235062825, -0.02704912177040515, -0.027323926855112892, -0.027577905285351957, -0.027817779092228736, -0.02804095922536732, -0.028244741943301406, -0.028426423504564723, -0.028583300167690947, -0.0287124723678148, -0.02880992257703332, -0.028871237152970974, -0.028892001989078226, -0.02886780297880557, -0.028794226237670043, -0.02866815208520311, -0.02849080290872854, -0.02826431068027207, -0.02799080737185942, -0.02767242495551634, -0.027311321418476222, -0.02691331516898971, -0.02649162756784114, -0.026060373029115777, -0.02563366596689888, -0.025225620795275707, -0.024849859458193766, -0.0245021256542495, -0.024155645854136956, -0.02378221075555379, -0.023353611056197657, -0.02284163745376622, -0.022220119297835975, -0.02149485811539941, -0.020697040726644425, -0.019858553209353348, -0.019011281641308535, -0.018187112100292314, -0.017414490637169912, -0.01669334724899932, -0.016009512050094463, -0.015348714944608753, -0.01469668583669561, -0.014039154630508432, -0.013364802023979242, -0.012676394865126254, -0.01198089854350618, -0.01128527916908439, -0.010596502851826234, -0.009921534244260078, -0.009266094258623172, -0.008632393570162943, -0.008022027997896768, -0.00743659336084203, -0.0068776854780161, -0.00634688832454166, -0.0058448243407931005, -0.00537046000116181, -0.004922598050038695, -0.00450004123181465, -0.004101592290880574, -0.003726130229006508, -0.0033745562089715457, -0.003049954856793557, -0.002755519375891563, -0.002494442969684588, -0.0022699188415916645, -0.0020847476996542613, -0.0019368268611264893, -0.0018207205288729047, -0.001730929210039391, -0.0016619534117718344, -0.001608293641216119, -0.0015644504055181278, -0.0015249242118237465, -0.001484215567278858, -0.0014368249790293478, -0.0013772529542211013, -0.0013], "camber_coordinates": [0.0, 0.001357612605263409, 0.0024695527728248144, 0.0033690245616933654, 0.0040892320308782235, 0.0046633792393885355, 0.00512467024623346, 0.0055063091104221515, 0.005841499890963758, 0.0061634466468674445, 0.0065053534371423555, 0.006900424320797648, 0.0073814609467083535, 0.007960207363073478, 0.008617429489803912, 0.009331413580659968, 0.010080445889401959, 0.01084281266979021, 0.011597198903229688, 0.012330307880138544, 0.013036268851471876, 0.013709491107353595, 0.014344383937907618, 0.014935356633257856, 0.015479284756205192, 0.015997987762823306, 0.016527768752198572, 0.0171051092285589, 0.01776649069613221, 0.01854839465914643, 0.019478189072181653, 0.02053121229733971, 0.021664367673479266, 0.022834536936970917, 0.023998601824185305, 0.025113446025102813, 0.026147338867613702, 0.027106748612012253, 0.028006145504330317, 0.028859999790599788, 0.02968278171685252, 0.03048890795497267, 0.031285257126835116, 0.03206346266089256, 0.032813318885556525, 0.0335246201292386, 0.03418716072035033, 0.034791054320257794, 0.03533800740067583, 0.035844327304239615, 0.03632725237345171, 0.036804020950814656, 0.03729187137883104, 0.03780634029826753, 0.03833627656156741, 0.03884933943115906, 0.03931260448577547, 0.03969314730414959, 0.039958043465014435, 0.04007833390575733, 0.040057930347476595, 0.039916997608531596, 0.03967581602068806, 0.039354665915711746, 0.03897382762536841, 0.03854976535705827, 0.038080726355359515, 0.037559528086334136, 0.036978987084373145, 0.03633191988386752, 0.0356111468506704, 0.03481275802460517, 0.033942071521965045, 0.03300602185711703, 0.03201154354442811, 0.030965571098265275, 0.029874928908114627, 0.028737500985127944, 0.02753577412010359, 0.02625071273748579, 0.024863281261718752, 0.023354444117246718, 0.021706619266509183, 0.019940768979293384, 0.01811947440626736, 0.016307386286377533, 0.014569155358570333, 0.012969432361792252, 0.011568048205772079, 0.010364620336504003, 0.009317835674327143, 0.008385598958430334, 0.007525814928002446, 0.0066963883222323235, 0.005855223880308794, 0.004960226341420741, 0.003969300444756974, 0.0028403509295063575, 0.0015312825348577684, 0.0]}, "polar_files": ["/Users/matthewclarke/Documents/LEADS/CODES/RCAIDE/Regressions/Vehicles/Airfoils/Polars/NACA_4412_polar_Re_50000.txt", "/Users/matthewclarke/Documents/LEADS/CODES/RCAIDE/Regressions/Vehicles/Airfoils/Polars/NACA_4412_polar_Re_100000.txt", "/Users/matthewclarke/Documents/LEADS/CODES/RCAIDE/Regressions/Vehicles/Airfoils/Polars/NACA_4412_polar_Re_200000.txt", "/Users/matthewclarke/Documents/LEADS/CODES/RCAIDE/Regressions/Vehicles/Airfoils/Polars/NACA_4412_polar_Re_500000.txt", "/Users/matthewclarke/Documents/LEADS/CODES/RCAIDE/Regressions/Vehicles/Airfoils/Polars/NACA_4412_polar_Re_1000000.txt", "/Users/matthewclarke/Documents/LEADS/CODES/RCAIDE/Regressions/Vehicles/Airfoils/Polars/NACA_4412_polar_Re_3500000.txt", "/Users/matthewclarke/Documents/LEADS/CODES/RCAIDE/Regressions/Vehicles/Airfoils/Polars/NACA_4412_polar_Re_5000000.txt", "/Users/matthewclarke/Documents/LEADS/CODES/RCAIDE/Regressions/Vehicles/Airfoils/Polars/NACA_4412_polar_Re_7500000.txt"], "polars": {"aoa_from_polar": [[-0.10471975511965978, -0.10035643198967395, -0.09599310885968812, -0.0916297857297023, -0.08726646259971647, -0.08290313946973066, -0.07853981633974483, -0.07417649320975901, -0.06981317007977318, -0.06544984694978735, -0.061086523819801536, -0.05672320068981571, -0.05235987755982989, -0.04799655442984406, -0.04363323129985824, -0.039269908169872414, -0.03490658503988659, -0.030543261909900768, -0.026179938779914945, -0.02181661564992912, -0.017453292519943295, -0.013089969389957472, -0.008726646259971648, -0.004363323129985824, 0.0, 0.004363323129985824, 0.008726646259971648, 0.013089969389957472, 0.017453292519943295, 0.02181661564992912, 0.026179938779914945, 0.030543261909900768, 0.03490658503988659, 0.039269908169872414, 0.04363323129985824, 0.04799655442984406, 0.05235987755982989, 0.05672320068981571, 0.061086523819801536, 0.06544984694978735, 0.06981317007977318, 0.07417649320975901, 0.07853981633974483, 0.08290313946973066, 0.08726646259971647, 0.0916297857297023, 0.09599310885968812, 0.10035643198967395, 0.10471975511965978, 0.1090830782496456, 0.11344640137963143, 0.11780972450961724, 0.12217304763960307, 0.1265363707695889, 0.1308996938995747, 0.13526301702956053, 0.13962634015954636, 0.1439896632895322, 0.14835298641951802, 0.15271630954950383, 0.15707963267948966, 0.16144295580947549, 0.16580627893946132, 0.17016960206944712, 0.17453292519943295, 0.17889624832941878, 0.1832595714594046, 0.18762289458939044, 0.19198621771937624, 0.19634954084936207, 0.2007128639793479, 0.20507618710933373, 0.20943951023931956, 0.21380283336930536, 0.2181661564992912, 0.22252947962927702, 0.22689280275926285, 0.23125612588924865, 0.23561944901923448, 0.2399827721492203, 0.24434609527920614, 0.24870941840919197, 0.2530727415391778, 0.25743606466916363, 0.2617993877991494, 0.26616271092913524, 0.27052603405912107, 0.2748893571891069, 0.2792526803190927], [-0.10471975511965978, -0.10035643198967395, -0.09599310885968812, -0.0916297857297023, -0.08726646259971647, -0.08290313946973066, -0.07853981633974483, -0.07417649320975901, -0.06981317007977318, -0.06544984694978735, -0.061086523819801536, -0.05672320068981571, -0.05235987755982989, -0.04799655442984406, -0.04363323129985824, -0.039269908169872414, -0.03490658503988659, -0.030543261909900768, -0.026179938779914945, -0.02181661564992912, -0.017453292519943295, -0.013089969389957472, -0.008726646259971648, -0.004363323129985824, 0.0, 0.004363323129985824, 0.008726646259971648, 0.013089969389957472, 0.017453292519943295, 0.02181661564992912, 0.026179938779914945, 0.030543261909900768, 0.03490658503988659, 0.039269908169872414, 0.04363323129985824, 0.04799655442984406, 0.05235987755982989, 0.05672320068981571, 0.061086523819801536, 0.06544984694978735, 0.06981317007977318, 0.07417649320975901, 0.07853981633974483, 0.08290313946973066, 0.08726646259971647, 0.0916297857297023, 0.09599310885968812, 0.10035643198967395, 0.10471975511965978, 0.1090830782496456, 0.11344640137963143, 0.11780972450961724, 0.12217304763960307, 0.1265363707695889, 0.1308996938995747, 0.13526301702956053, 0.13962634015954636, 0.1439896632895322, 0.14835298641951802, 0.15271630954950383, 0.15707963267948966, 0.16144295580947549, 0.16580627893946132, 0.17016960206944712, 0.17453292519943295, 0.17889624832941878, 0.1832595714594046, 0.18762289458939044, 0.19198621771937624, 0.19634954084936207, 0.2007128639793479, 0.20507618710933373, 0.20943951023931956, 0.21380283336930536, 0.2181661564992912, 0.22252947962927702, 0.22689280275926285, 0.23125612588924865, 0.23561944901923448, 0.2399827721492203, 0.24434609527920614, 0.24870941840919197, 0.2530727415391778, 0.25743606466916363, 0.2617993877991494, 0.26616271092913524, 0.27052603405912107, 0.2748893571891069, 0.2792526803190927], [-0.10471975511965978, -0.10035643198967395, -0.09599310885968812, -0.0916297857297023, -0.08726646259971647, -0.08290313946973066, -0.07853981633974483, -0.07417649320975901, -0.06981317007977318, -0.06544984694978735, -0.061086523819801536, -0.05672320068981571, -0.05235987755982989, -0.04799655442984406, -0.04363323129985824, -0.039269908169872414, -0.03490658503988659, -0.030543261909900768, -0.026179938779914945, -0.02181661564992912, -0.017453292519943295, -0.013089969389957472, -0.008726646259971648, -0.004363323129985824, 0.0, 0.004363323129985824, 0.008726646259971648, 0.013089969389957472, 0.017453292519943295, 0.02181661564992912, 0.026179938779914945, 0.030543261909900768, 0.03490658503988659, 0.039269908169872414, 0.04363323129985824, 0.04799655442984406, 0.05235987755982989, 0.05672320068981571, 0.061086523819801536, 0.06544984694978735, 0.06981317007977318, 0.07417649320975901, 0.07853981633974483, 0.08290313946973066, 0.08726646259971647, 0.0916297857297023, 0.09599310885968812, 0.10035643198967395, 0.10471975511965978, 0.1090830782496456, 0.11344640137963143, 0.11780972450961724, 0.12217304763960307, 0.1265363707695889, 0.1308996938995747, 0.13526301702956053, 0.13962634015954636, 0.1439896632895322, 0.14835298641951802, 0.15271630954950383, 0.15707963267948966, 0.16144295580947549, 0.16580627893946132, 0.17016960206944712, 0.17453292519943295, 0.17889624832941878, 0.1832595714594046, 0.18762289458939044, 0.19198621771937624, 0.19634954084936207, 0.2007128639793479, 0.20507618710933373, 0.20943951023931956, 0.21380283336930536, 0.2181661564992912, 0.22252947962927702, 0.22689280275926285, 0.23125612588924865, 0.23561944901923448, 0.2399827721492203, 0.24434609527920614, 0.24870941840919197, 0.2530727415391778, 0.25743606466916363, 0.2617993877991494, 0.26616271092913524, 0.27052603405912107, 0.2748893571891069, 0.2792526803190927], [-0.10471975511965978, -0.10035643198967395, -0.09599310885968812, -0.0916297857297023, -0.08726646259971647, -0.08290313946973066, -0.07853981633974483, -0.07417649320975901, -0.06981317007977318, -0.06544984694978735, -0.061086523819801536, -0.05672320068981571, -0.05235987755982989, -0.04799655442984406, -0.04363323129985824, -0.039269908169872414, -0.03490658503988659, -0.030543261909900768, -0.026179938779914945, -0.02181661564992912, -0.017453292519943295, -0.013089969389957472, -0.008726646259971648, -0.004363323129985824, 0.0, 0.004363323129985824, 0.008726646259971648, 0.013089969389957472, 0.017453292519943295, 0.02181661564992912, 0.026179938779914945, 0.030543261909900768, 0.03490658503988659, 0.039269908169872414, 0.04363323129985824, 0.04799655442984406, 0.05235987755982989, 0.05672320068981571, 0.061086523819801536, 0.06544984694978735, 0.06981317007977318, 0.07417649320975901, 0.07853981633974483, 0.08290313946973066, 0.08726646259971647, 0.0916297857297023, 0.09599310885968812, 0.10035643198967395, 0.10471975511965978, 0.1090830782496456, 0.11344640137963143, 0.11780972450961724, 0.12217304763960307, 0.1265363707695889, 0.1308996938995747, 0.13526301702956053, 0.13962634015954636, 0.1439896632895322, 0.14835298641951802, 0.15271630954950383, 0.15707963267948966, 0.16144295580947549, 0.16580627893946132, 0.17016960206944712, 0.17453292519943295, 0.17889624832941878, 0.1832595714594046, 0.18762289458939044, 0.19198621771937624, 0.19634954084936207, 0.2007128639793479, 0.20507618710933373, 0.20943951023931956, 0.21380283336930536, 0.2181661564992912, 0.22252947962927702, 0.22689280275926285, 0.23125612588924865, 0.23561944901923448, 0.2399827721492203, 0.24434609527920614, 0.24870941840919197, 0.2530727415391778, 0.25743606466916363, 0.2617993877991494, 0.26616271092913524, 0.27052603405912107, 0.2748893571891069, 0.2792526803190927], [-0.10471975511965978, -0.10035643198967395, -0.09599310885968812, -0.0916297857297023, -0.08726646259971647, -0.08290313946973066, -0.07853981633974483, -0.07417649320975901, -0.06981317007977318, -0.06544984694978735, -0.061086523819801536, -0.05672320068981571, -0.05235987755982989, -0.04799655442984406, -0.04363323129985824, -0.039269908169872414, -0.03490658503988659, -0.030543261909900768, -0.026179938779914945, -0.02181661564992912, -0.017453292519943295, -0.013089969389957472, -0.008726646259971648, -0.004363323129985824, 0.0, 0.004363323129985824, 0.008726646259971648, 0.013089969389957472, 0.017453292519943295, 0.02181661564992912, 0.026179938779914945, 0.030543261909900768, 0.03490658503988659, 0.039269908169872414, 0.04363323129985824, 0.04799655442984406, 0.05235987755982989, 0.05672320068981571, 0.061086523819801536, 0.06544984694978735, 0.06981317007977318, 0.07417649320975901, 0.07853981633974483, 0.08290313946973066, 0.08726646259971647, 0.0916297857297023, 0.09599310885968812, 0.10035643198967395, 0.10471975511965978, 0.1090830782496456, 0.11344640137963143, 0.11780972450961724, 0.12217304763960307, 0.1265363707695889, 0.1308996938995747, 0.13526301702956053, 0.13962634015954636, 0.1439896632895322, 0.14835298641951802, 0.15271630954950383, 0.15707963267948966, 0.16144295580947549, 0.16580627893946132, 0.17016960206944712, 0.17453292519943295, 0.17889624832941878, 0.1832595714594046, 0.18762289458939044, 0.19198621771937624, 0.19634954084936207, 0.2007128639793479, 0.20507618710933373, 0.20943951023931956, 0.21380283336930536, 0.2181661564992912, 0.22252947962927702, 0.22689280275926285, 0.23125612588924865, 0.23561944901923448, 0.2399827721492203, 0.24434609527920614, 0.24870941840919197, 0.2530727415391778, 0.25743606466916363, 0.2617993877991494, 0.26616271092913524, 0.27052603405912107, 0.2748893571891069, 0.2792526803190927], [-0.10471975511965978, -0.10035643198967395, -0.09599310885968812, -0.0916297857297023, -0.08726646259971647, -0.08290313946973066, -0.07853981633974483, -0.07417649320975901, -0.06981317007977318, -0.06544984694978735, -0.061086523819801536, -0.05672320068981571, -0.05235987755982989, -0.04799655442984406, -0.04363323129985824, -0.039269908169872414, -0.03490658503988659, -0.030543261909900768, -0.026179938779914945, -0.02181661564992912, -0.017453292519943295, -0.013089969389957472, -0.008726646259971648, -0.004363323129985824, 0.0, 0.004363323129985824, 0.008726646259971648, 0.013089969389957472, 0.017453292519943295, 0.02181661564992912, 0.026179938779914945, 0.030543261909900768, 0.03490658503988659, 0.039269908169872414, 0.04363323129985824, 0.04799655442984406, 0.05235987755982989, 0.05672320068981571, 0.061086523819801536, 0.06544984694978735, 0.06981317007977318, 0.07417649320975901, 0.07853981633974483, 0.08290313946973066, 0.08726646259971647, 0.0916297857297023, 0.09599310885968812, 0.10035643198967395, 0.10471975511965978, 0.1090830782496456, 0.11344640137963143, 0.11780972450961724, 0.12217304763960307, 0.1265363707695889, 0.1308996938995747, 0.13526301702956053, 0.13962634015954636, 0.1439896632895322, 0.14835298641951802, 0.15271630954950383, 0.15707963267948966, 0.16144295580947549, 0.16580627893946132, 0.17016960206944712, 0.17453292519943295, 0.17889624832941878, 0.1832595714594046, 0.18762289458939044, 0.19198621771937624, 0.19634954084936207, 0.2007128639793479, 0.20507618710933373, 0.20943951023931956, 0.21380283336930536, 0.2181661564992912, 0.22252947962927702, 0.22689280275926285, 0.23125612588924865, 0.23561944901923448, 0.2399827721492203, 0.24434609527920614, 0.24870941840919197, 0.2530727415391778, 0.25743606466916363, 0.2617993877991494, 0.26616271092913524, 0.27052603405912107, 0.2748893571891069, 0.2792526803190927], [-0.10471975511965978, -0.10035643198967395, -0.09599310885968812, -0.0916297857297023, -0.08726646259971647, -0.08290313946973066, -0.07853981633974483, -0.07417649320975901, -0.06981317007977318, -0.06544984694978735, -0.061086523819801536, -0.05672320068981571, -0.05235987755982989, -0.04799655442984406, -0.04363323129985824, -0.039269908169872414, -0.03490658503988659, -0.030543261909900768, -0.026179938779914945, -0.02181661564992912, -0.017453292519943295, -0.013089969389957472, -0.008726646259971648, -0.004363323129985824, 0.0, 0.004363323129985824, 0.008726646259971648, 0.013089969389957472, 0.017453292519943295, 0.02181661564992912, 0.026179938779914945, 0.030543261909900768, 0.03490658503988659, 0.039269908169872414, 0.04363323129985824, 0.04799655442984406, 0.05235987755982989, 0.05672320068981571, 0.061086523819801536, 0.06544984694978735, 0.06981317007977318, 0.07417649320975901, 0.07853981633974483, 0.08290313946973066, 0.08726646259971647, 0.0916297857297023, 0.09599310885968812, 0.10035643198967395, 0.10471975511965978, 0.1090830782496456, 0.11344640137963143, 0.11780972450961724, 0.12217304763960307, 0.1265363707695889, 0.1308996938995747, 0.13526301702956053, 0.13962634015954636, 0.1439896632895322, 0.14835298641951802, 0.15271630954950383, 0.15707963267948966, 0.16144295580947549, 0.16580627893946132, 0.17016960206944712, 0.17453292519943295, 0.17889624832941878, 0.1832595714594046, 0.18762289458939044, 0.19198621771937624, 0.19634954084936207, 0.2007128639793479, 0.20507618710933373, 0.20943951023931956, 0.21380283336930536, 0.2181661564992912, 0.22252947962927702, 0.22689280275926285, 0.23125612588924865, 0.23561944901923448, 0.2399827721492203, 0.24434609527920614, 0.24870941840919197, 0.2530727415391778, 0.25743606466916363, 0.2617993877991494, 0.26616271092913524, 0.27052603405912107, 0.2748893571891069, 0.2792526803190927], [-0.10471975511965978, -0.10035643198967395, -0.09599310885968812, -0.0916297857297023, -0.08726646259971647, -0.08290313946973066, -0.07853981633974483, -0.07417649320975901, -0.06981317007977318, -0.06544984694978735, -0.061086523819801536, -0.05672320068981571, -0.05235987755982989, -0.04799655442984406, -0.04363323129985824, -0.039269908169872414, -0.03490658503988659, -0.030543261909900768, -0.026179938779914945, -0.02181661564992912, -0.017453292519943295, -0.013089969389957472, -0.008726646259971648, -0.004363323129985824, 0.0, 0.004363323129985824, 0.008726646259971648, 0.013089969389957472, 0.017453292519943295, 0.02181661564992912, 0.026179938779914945, 0.030543261909900768, 0.03490658503988659, 0.039269908169872414, 0.04363323129985824, 0.04799655442984406, 0.05235987755982989, 0.05672320068981571, 0.061086523819801536, 0.06544984694978735, 0.06981317007977318, 0.07417649320975901, 0.07853981633974483, 0.08290313946973066, 0.08726646259971647, 0.0916297857297023, 0.09599310885968812, 0.10035643198967395, 0.10471975511965978, 0.1090830782496456, 0.11344640137963143, 0.11780972450961724, 0.12217304763960307, 0.1265363707695889, 0.1308996938995747, 0.13526301702956053, 0.13962634015954636, 0.1439896632895322, 0.14835298641951802, 0.15271630954950383, 0.15707963267948966, 0.16144295580947549, 0.16580627893946132, 0.17016960206944712, 0.17453292519943295, 0.17889624832941878, 0.1832595714594046, 0.18762289458939044, 0.19198621771937624, 0.19634954084936207, 0.2007128639793479, 0.20507618710933373, 0.20943951023931956, 0.21380283336930536, 0.2181661564992912, 0.22252947962927702, 0.22689280275926285, 0.23125612588924865, 0.23561944901923448, 0.2399827721492203, 0.24434609527920614, 0.24870941840919197, 0.2530727415391778, 0.25743606466916363, 0.2617993877991494, 0.26616271092913524, 0.27052603405912107, 0.2748893571891069, 0.2792526803190927]], "re_from_polar": [50000.0, 100000.0, 200000.0, 500000.0, 1000000.0, 3500000.0, 5000000.0, 7500000.0], "lift_coefficients": [[-0.8668389012070687, -0.9628795671610489, -0.9789613216382629, -0.9437247187342035, -0.876931904863378, -0.7917162610101387, -0.6964139738440771, -0.5960208838257406, -0.4078, -0.4453, -0.4519, -0.2525, -0.1457, 0.042949999999999995, 0.1943, 0.3281, 0.4286, 0.5265, 0.6102, 0.6895, 0.7592, 0.8095, 0.8781, 0.9207, 0.9807, 0.9807, 0.9807, 0.9807, 0.9807, 0.9807, 0.9807, 0.564092063115252, 0.6208651346861369, 0.6744664974274013, 0.7249683439283658, 0.7724421853437302, 0.8169588484951222, 0.8585884729194884, 0.897400507862631, 0.9334637092160134, 0.9668461363949694, 0.9976151491562684, 1.0258374043529437, 1.0515788526241736, 1.0749047350178667, 1.095879579543516, 1.1145671976527294, 1.1310306806447277, 1.145332395993917, 1.1575339835965335, 1.1676963519331338, 1.1758796741435562, 1.1821433840107622, 1.186546171849761, 1.1891459802975801, 1.1900000000000002, 1.189164665190508, 1.1866956491566083, 1.1826478595883416, 1.1770754338034886, 1.1700317338435728, 1.1615693414343655, 1.151740052804134, 1.1405948733523983, 1.128184012161403, 1.114556876341934, 1.0997620652044378, 1.0838473642456912, 1.0668597389404633, 1.048845328326717, 1.0298494383719237, 1.0099165351069441, 0.9890902375127129, 0.9674133101435616, 0.9449276554694761, 0.9216743059178069, 0.8976934155929732, 0.8730242516504152, 0.8477051852984732, 0.8217736823988906, 0.7952662936332109, 0.7682186441983773, 0.7406654229902223, 0.7126403712281303, 0.6841762704677934, 0.6553049299414383, 0.6260571731558979, 0.5964628236680811, 0.566550689944257, 0.5363485491935105, 0.5058831300458653, 0.47518009392073884, 0.44426401489999784, 0.4131583578795709, 0.3818854547210808, 0.35046647805532516, 0.3189214122952245, 0.2872690212853754, 0.2555268118296233, 0.22371099206501363, 0.19183642323292582, 0.1599165627279245, 0.1279633951602268, 0.09598734604598294, 0.06399716832672771], [-1.1908932203108227, -1.1034999307696685, -1.0090137319431105, -0.9087271851510879, -0.803806877682798, -0.6952924031788213, -0.5840951957297257, -0.4709971702917467, -0.4744, -0.339, -0.1732, -0.0135, 0.1378, 0.3011, 0.4335, 0.5631, 0.6774, 0.7929, 0.8957, 0.9995, 1.1016, 1.1987, 1.2769, 1.3281, 1.3127, 1.3189, 1.3787, 1.4319, 1.4512, 1.4201, 1.3171, 1.3956729083522146, 1.3189900988029921, 1.2133829765808906, 1.0761215426599506, 0.9043572397947015, 0.8169588484951222, 0.8585884729194884, 0.897400507862631, 0.9334637092160134, 0.9668461363949694, 0.9976151491562684, 1.0258374043529437, 1.0515788526241736, 1.0749047350178667, 1.095879579543516, 1.1145671976527294, 1.1310306806447277, 1.145332395993917, 1.1575339835965335, 1.1676963519331338, 1.1758796741435562, 1.1821433840107622, 1.186546171849761, 1.1891459802975801, 1.1900000000000002, 1.189164665190508, 1.1866956491566083, 1.1826478595883416, 1.1770754338034886, 1.1700317338435728, 1.1615693414343655, 1.151740052804134, 1.1405948733523983, 1.128184012161403, 1.114556876341934, 1.0997620652044378, 1.0838473642456912, 1.0668597389404633, 1.048845328326717, 1.0298494383719237, 1.0099165351069441, 0.9890902375127129, 0.9674133101435616, 0.9449276554694761, 0.9216743059178069, 0.8976934155929732, 0.8730242516504152, 0.8477051852984732, 0.8217736823988906, 0.7952662936332109, 0.7682186441983773, 0.7406654229902223, 0.7126403712281303, 0.6841762704677934, 0.6553049299414383, 0.6260571731558979, 0.5964628236680811, 0.566550689944257, 0.5363485491935105, 0.5058831300458653, 0.47518009392073884, 0.44426401489999784, 0.4131583578795709, 0.3818854547210808, 0.35046647805532516, 0.3189214122952245, 0.2872690212853754, 0.2555268118296233, 0.22371099206501363, 0.19183642323292582, 0.1599165627279245, 0.1279633951602268, 0.09598734604598294, 0.06399716832672771], [-0.9892621516469651, -0.9019462782843927, -0.8103549182974268, -0.7151947443190507, -0.6171266974117984, -0.5167630039127251, -0.4146634754774159, -0.3113307408167738, -0.293, -0.1466, 0.003, 0.1342, 0.2541, 0.3583, 0.4938, 0.5988, 0.7038, 0.8084, 0.9127, 1.0156, 1.1122, 1.2002, 1.2799, 1.3267, 1.3275, 1.3429, 1.3641, 1.3923, 1.418, 1.4342, 1.4362, 1.4246380419144926, 1.3907990750802153, 1.3400748158881686, 1.2712764344832739, 1.183187284374868, 1.0745634507802917, 0.9441342664028092, 0.897400507862631, 0.9334637092160134, 0.9668461363949694, 0.9976151491562684, 1.0258374043529437, 1.0515788526241736, 1.0749047350178667, 1.095879579543516, 1.1145671976527294, 1.1310306806447277, 1.145332395993917, 1.1575339835965335, 1.1676963519331338, 1.1758796741435562, 1.1821433840107622, 1.186546171849761, 1.1891459802975801, 1.1900000000000002, 1.189164665190508, 1.1866956491566083, 1.1826478595883416, 1.1770754338034886, 1.1700317338435728, 1.1615693414343655, 1.151740052804134, 1.1405948733523983, 1.128184012161403, 1.114556876341934, 1.0997620652044378, 1.0838473642456912, 1.0668597389404633, 1.048845328326717, 1.0298494383719237, 1.0099165351069441, 0.9890902375127129, 0.9674133101435616, 0.9449276554694761, 0.9216743059178069, 0.8976934155929732, 0.8730242516504152, 0.8477051852984732, 0.8217736823988906, 0.7952662936332109, 0.7682186441983773, 0.7406654229902223, 0.7126403712281303, 0.6841762704677934, 0.6553049299414383, 0.6260571731558979, 0.5964628236680811, 0.566550689944257, 0.5363485491935105, 0.5058831300458653, 0.47518009392073884, 0.44426401489999784, 0.4131583578795709, 0.3818854547210808, 0.35046647805532516, 0.3189214122952245, 0.2872690212853754, 0.2555268118296233, 0.22371099206501363, 0.19183642323292582, 0.1599165627279245, 0.1279633951602268, 0.09598734604598294, 0.06399716832672771], [-0.992446947221973, -0.9012266559399362, -0.8057119708761068, -0.7065322056252733, -0.6042935254653763, -0.4995764576963993, -0.39293263829048397, -0.2848803353942884, -0.1743, -0.0666, 0.0434, 0.1541, 0.2641, 0.3734, 0.4741, 0.5983, 0.7023, 0.8073, 0.9127, 1.0155, 1.1155, 1.2103, 1.2891, 1.3388, 1.3845, 1.427, 1.4602, 1.4938, 1.5091, 1.5124, 1.5055, 1.5024801888012511, 1.475631538512678, 1.434129150608317, 1.3771278221584196, 1.3037720318370243, 1.21319624498583, 1.104525197911813, 0.9768741635716025, 0.9334637092160134, 0.9668461363949694, 0.9976151491562684, 1.0258374043529437, 1.0515788526241736, 1.0749047350178667, 1.095879579543516, 1.1145671976527294, 1.1310306806447277, 1.145332395993917, 1.1575339835965335, 1.1676963519331338, 1.1758796741435562, 1.1821433840107622, 1.186546171849761, 1.1891459802975801, 1.1900000000000002, 1.189164665190508, 1.1866956491566083, 1.1826478595883416, 1.1770754338034886, 1.1700317338435728, 1.1615693414343655, 1.151740052804134, 1.1405948733523983, 1.128184012161403, 1.114556876341934, 1.0997620652044378, 1.0838473642456912, 1.0668597389404633, 1.048845328326717, 1.0298494383719237, 1.0099165351069441, 0.9890902375127129, 0.9674133101435616, 0.9449276554694761, 0.9216743059178069, 0.8976934155929732, 0.8730242516504152, 0.8477051852984732, 0.8217736823988906, 0.7952662936332109, 0.7682186441983773, 0.7406654229902223, 0.7126403712281303, 0.6841762704677934, 0.6553049299414383, 0.6260571731558979, 0.5964628236680811, 0.566550689944257, 0.5363485491935105, 0.5058831300458653, 0.47518009392073884, 0.44426401489999784, 0.4131583578795709, 0.3818854547210808, 0.35046647805532516, 0.3189214122952245, 0.2872690212853754, 0.2555268118296233, 0.22371099206501363, 0.19183642323292582, 0.1599165627279245, 0.1279633951602268, 0.09598734604598294, 0.06399716832672771], [-1.027208451114869, -0.9277768697802068, -0.8254219774461379, -0.7207781366894633, -0.6144021905760322, -0.5067734079985751, -0.3982934198786351, -0.2892861425147429, -0.1825, -0.0718, 0.0394, 0.1512, 0.2625, 0.3734, 0.4833, 0.5842, 0.7055, 0.8135, 0.921, 1.0254, 1.128, 1.2208, 1.2973, 1.3676, 1.4317, 1.4938, 1.55, 1.5959, 1.6325, 1.6585, 1.6698, 1.6614833943075813, 1.635442973016239, 1.5899849911538615, 1.5233385995476214, 1.4336558616859691, 1.3190117698692427, 1.1774042607063917, 1.0067542300086276, 0.9334637092160134, 0.9668461363949694, 0.9976151491562684, 1.0258374043529437, 1.0515788526241736, 1.0749047350178667, 1.095879579543516, 1.1145671976527294, 1.1310306806447277, 1.145332395993917, 1.1575339835965335, 1.1676963519331338, 1.1758796741435562, 1.1821433840107622, 1.186546171849761, 1.1891459802975801, 1.1900000000000002, 1.189164665190508, 1.1866956491566083, 1.1826478595883416, 1.1770754338034886, 1.1700317338435728, 1.1615693414343655, 1.151740052804134, 1.1405948733523983, 1.128184012161403, 1.114556876341934, 1.0997620652044378, 1.0838473642456912, 1.0668597389404633, 1.048845328326717, 1.0298494383719237, 1.0099165351069441, 0.9890902375127129, 0.9674133101435616, 0.9449276554694761, 0.9216743059178069, 0.8976934155929732, 0.8730242516504152, 0.8477051852984732, 0.8217736823988906, 0.7952662936332109, 0.7682186441983773, 0.7406654229902223, 0.7126403712281303, 0.6841762704677934, 0.6553049299414383, 0.6260571731558979, 0.5964628236680811, 0.566550689944257, 0.5363485491935105, 0.5058831300458653, 0.47518009392073884, 0.44426401489999784, 0.4131583578795709, 0.3818854547210808, 0.35046647805532516, 0.3189214122952245, 0.2872690212853754, 0.2555268118296233, 0.22371099206501363, 0.19183642323292582, 0.1599165627279245, 0.1279633951602268, 0.09598734604598294, 0.06399716832672771], [-1.087134885160501, -0.9795048637915695, -0.8701386679948996, -0.7595754135497517, -0.6482275339213107, -0.5363984179468942, -0.42429981193874156, -0.3120689483583656, -0.2022, -0.0886, 0.0251, 0.1389, 0.2524, 0.3661, 0.4798, 0.5935, 0.7056, 0.8099, 0.929, 1.0353, 1.1366, 1.2308, 1.3225, 1.414, 1.5015, 1.575, 1.6417, 1.7004, 1.7521, 1.7955, 1.8247, 1.8127484882372966, 1.7743956989694207, 1.705607654231657, 1.601952658442782, 1.458581747359764, 1.2702090608565502, 1.0310921423984265, 0.897400507862631, 0.9334637092160134, 0.9668461363949694, 0.9976151491562684, 1.0258374043529437, 1.0515788526241736, 1.0749047350178667, 1.095879579543516, 1.1145671976527294, 1.1310306806447277, 1.145332395993917, 1.1575339835965335, 1.1676963519331338, 1.1758796741435562, 1.1821433840107622, 1.186546171849761, 1.1891459802975801, 1.1900000000000002, 1.189164665190508, 1.1866956491566083, 1.1826478595883416, 1.1770754338034886, 1.1700317338435728, 1.1615693414343655, 1.151740052804134, 1.1405948733523983, 1.128184012161403, 1.114556876341934, 1.0997620652044378, 1.0838473642456912, 1.0668597389404633, 1.048845328326717, 1.0298494383719237, 1.0099165351069441, 0.9890902375127129, 0.9674133101435616, 0.9449276554694761, 0.9216743059178069, 0.8976934155929732, 0.8730242516504152, 0.8477051852984732, 0.8217736823988906, 0.7952662936332109, 0.7682186441983773, 0.7406654229902223, 0.7126403712281303, 0.6841762704677934, 0.6553049299414383, 0.6260571731558979, 0.5964628236680811, 0.566550689944257, 0.5363485491935105, 0.5058831300458653, 0.47518009392073884, 0.44426401489999784, 0.4131583578795709, 0.3818854547210808, 0.35046647805532516, 0.3189214122952245, 0.2872690212853754, 0.2555268118296233, 0.22371099206501363, 0.19183642323292582, 0.1599165627279245, 0.1279633951602268, 0.09598734604598294, 0.06399716832672771], [-1.0933090757116088, -0.9840210870838201, -0.8734707290931002, -0.762104285261265, -0.6502405387035232, -0.5380963313858868, -0.4258098305873951, -0.31346136261766194, -0.20425, -0.0902, 0.024, 0.1383, 0.2525, 0.3669, 0.4813, 0.5958, 0.7093, 0.8212, 0.9308, 1.0365, 1.1371, 1.2336, 1.3299, 1.4246, 1.5155, 1.597, 1.6652, 1.7284, 1.7845, 1.8284, 1.8681, 1.8544166426133375, 1.8099630651544494, 1.7291358974873132, 1.6056265051204497, 1.4323683623792094, 1.2014829656993908, 0.9042243093847673, 0.897400507862631, 0.9334637092160134, 0.9668461363949694, 0.9976151491562684, 1.0258374043529437, 1.0515788526241736, 1.0749047350178667, 1.095879579543516, 1.1145671976527294, 1.1310306806447277, 1.145332395993917, 1.1575339835965335, 1.1676963519331338, 1.1758796741435562, 1.1821433840107622, 1.186546171849761, 1.1891459802975801, 1.1900000000000002, 1.189164665190508, 1.1866956491566083, 1.1826478595883416, 1.1770754338034886, 1.1700317338435728, 1.1615693414343655, 1.151740052804134, 1.1405948733523983, 1.128184012161403, 1.114556876341934, 1.0997620652044378, 1.0838473642456912, 1.0668597389404633, 1.048845328326717, 1.0298494383719237, 1.0099165351069441, 0.9890902375127129, 0.9674133101435616, 0.9449276554694761, 0.9216743059178069, 0.8976934155929732, 0.8730242516504152, 0.8477051852984732, 0.8217736823988906, 0.7952662936332109, 0.7682186441983773, 0.7406654229902223, 0.7126403712281303, 0.6841762704677934, 0.6553049299414383, 0.6260571731558979, 0.5964628236680811, 0.566550689944257, 0.5363485491935105, 0.5058831300458653, 0.47518009392073884, 0.44426401489999784, 0.4131583578795709, 0.3818854547210808, 0.35046647805532516, 0.3189214122952245, 0.2872690212853754, 0.2555268118296233, 0.22371099206501363, 0.19183642323292582, 0.1599165627279245, 0.1279633951602268, 0.09598734604598294, 0.06399716832672771], [-1.0965082200600442, -0.986122589954553, -0.8748866537218764, -0.7631412658924641, -0.6511110068171198, -0.5389352079198726, -0.4266936554536957, -0.3144272071666496, -0.2062, -0.0918, 0.0229, 0.1377, 0.2527, 0.3678, 0.483, 0.598, 0.7127, 0.8247, 0.9321, 1.0369, 1.1384, 1.2383, 1.3374, 1.4355, 1.5295, 1.618, 1.6917, 1.7572, 1.8143, 1.868, 1.9068, 1.891044716200477, 1.8390999124402823, 1.74308232590407, 1.593854576970384, 1.3808927157763653, 1.0921462524308685, 0.8585884729194884, 0.897400507862631, 0.9334637092160134, 0.9668461363949694, 0.9976151491562684, 1.0258374043529437, 1.0515788526241736, 1.0749047350178667, 1.095879579543516, 1.1145671976527294, 1.1310306806447277, 1.145332395993917, 1.1575339835965335, 1.1676963519331338, 1.1758796741435562, 1.1821433840107622, 1.186546171849761, 1.1891459802975801, 1.1900000000000002, 1.189164665190508, 1.1866956491566083, 1.1826478595883416, 1.1770754338034886, 1.1700317338435728, 1.1615693414343655, 1.151740052804134, 1.1405948733523983, 1.128184012161403, 1.114556876341934, 1.0997620652044378, 1.0838473642456912, 1.0668597389404633, 1.048845328326717, 1.0298494383719237, 1.0099165351069441, 0.9890902375127129, 0.9674133101435616, 0.9449276554694761, 0.9216743059178069, 0.8976934155929732, 0.8730242516504152, 0.8477051852984732, 0.8217736823988906, 0.7952662936332109, 0.7682186441983773, 0.7406654229902223, 0.7126403712281303, 0.6841762704677934, 0.6553049299414383, 0.6260571731558979, 0.5964628236680811, 0.566550689944257, 0.5363485491935105, 0.5058831300458653, 0.47518009392073884, 0.44426401489999784, 0.4131583578795709, 0.3818854547210808, 0.35046647805532516, 0.3189214122952245, 0.2872690212853754, 0.2555268118296233, 0.22371099206501363, 0.19183642323292582, 0.1599165627279245, 0.1279633951602268, 0.09598734604598294, 0.06399716832672771]], "drag_coefficients": [[0.49027715986783027, 0.46761244875208674, 0.44490672320157065, 0.4221624469229053, 0.39938208780569795, 0.37656811765475895, 0.35372301192189626, 0.3308492494373141, 0.08962, 0.08207, 0.07317, 0.03925, 0.03529, 0.0335, 0.03343, 0.03667, 0.04038, 0.04459, 0.04955, 0.05512, 0.06142, 0.06914, 0.07561, 0.08352, 0.08551, 0.08551, 0.08551, 0.08551, 0.08551, 0.08551, 0.08551, 0.6141384916387614, 0.6364767634570125, 0.6587556980553567, 0.6809728780365341, 0.7031258927040289, 0.7252123383236447, 0.7472298183843238, 0.7691759438581823, 0.7910483334597351, 0.812844613904279, 0.8345624201654078, 0.8561993957316324, 0.877753192862076, 0.8992214728412178, 0.9206019062326588, 0.9418921731318779, 0.9630899634179564, 0.9841929770042389, 1.005198924087908, 1.0261055253984406, 1.0469105124449216, 1.0676116277621903, 1.0882066251557878, 1.1086932699456828, 1.1290693392087476, 1.1493326220199584, 1.1694809196922937, 1.1895120460153061, 1.2094238274923381, 1.2292141035763593, 1.2488807269043989, 1.2684215635305482, 1.2878344931575054, 1.3071174093666402, 1.326268219846555, 1.3452848466201097, 1.364165226269898, 1.3829073101621387, 1.4015090646689645, 1.4199684713890834, 1.4382835273667878, 1.4564522453092854, 1.474472653802334, 1.4923427975241508, 1.5100607374575776, 1.5276245511004731, 1.5450323326743203, 1.5622821933310092, 1.5793722613577927, 1.5963006823803771, 1.6130656195641322, 1.6296652538133987, 1.6460977839688722, 1.6623614270030385, 1.6784544182136434, 1.6943750114151737, 1.710121479128327, 1.7256921127674563, 1.7410852228259586, 1.7562991390595992, 1.7713322106677416, 1.7861828064724694, 1.800849315095579, 1.8153301451334245, 1.8296237253295933, 1.8437285047453964, 1.8576429529281568, 1.8713655600772705, 1.8848948372080296, 1.8982293163131865, 1.9113675505222403, 1.9243081142584326, 1.9370496033934295, 1.9495906353996781], [0.1118217122473246, 0.10006000000000001, 0.08908240190249703, 0.07888891795481569, 0.07516, 0.07516, 0.07516, 0.07516, 0.07516, 0.03524, 0.02773, 0.02457, 0.02248, 0.01877, 0.01835, 0.01782, 0.01798, 0.01834, 0.01941, 0.02057, 0.02159, 0.02216, 0.02285, 0.02421, 0.02965, 0.03755, 0.0443, 0.05205, 0.06218, 0.07667, 0.10006, 0.129788014102524, 0.15951059950495539, 0.189222328498549, 0.21891777535707285, 0.24859151732761287, 0.27823813562083355, 0.3078522164005158, 0.33742835177218966, 0.3669611407706819, 0.39644519034639947, 0.4258751163501653, 0.4552455445164308, 0.4845511114446825, 0.5137864655788643, 0.5429462681846388, 0.5720251943243032, 0.6010179338291907, 0.6299191922693708, 0.6587236919204777, 0.6874261727274883, 0.7160213932652715, 0.744504131695737, 0.7728691867214077, 0.8011113785352402, 0.8292255497665203, 0.8572065664226636, 0.8850493188267439, 0.9127487225505839, 0.940299719343235, 0.9676972780546732, 0.9949363955545519, 1.0220120976458333, 1.0489194399731376, 1.0756535089256443, 1.102209422534376, 1.1285823313637071, 1.1547674193969304, 1.1807599049157194, 1.2065550413733306, 1.2321481182613796, 1.2575344619700388, 1.282709436641495, 1.3076684450165148, 1.33240692927396, 1.3569203718631015, 1.3812042963285802, 1.405254268127862, 1.4290658954410396, 1.452634829972833, 1.4759567677466428, 1.4990274498905058, 1.5218426634148212, 1.5443982419816904, 1.5666900666657462, 1.5887140667063133, 1.6104662202507845, 1.6319425550890556, 1.6531391493789038, 1.6740521323621618, 1.6946776850715668, 1.7150120410281497, 1.7350514869290408, 1.7547923633255658, 1.7742310652915043, 1.793364043081394, 1.812187802778757, 1.8306989069341353, 1.848893975192806, 1.8667696849120798, 1.884322771768054, 1.9015500303517192, 1.9184483147543057, 1.935014539141766, 1.9512456783182837], [0.05351578512396693, 0.04730634527089072, 0.0415745546372819, 0.03632041322314049, 0.031543921028466475, 0.02724507805325986, 0.02357, 0.02357, 0.02357, 0.01934, 0.01638, 0.01437, 0.01274, 0.0107, 0.01005, 0.01039, 0.01097, 0.01171, 0.01256, 0.01352, 0.01444, 0.01536, 0.0167, 0.01944, 0.02555, 0.03209, 0.03917, 0.04629, 0.05407, 0.06336, 0.07501, 0.10507651731318803, 0.13513754411144424, 0.1651875908824725, 0.19522117011906398, 0.22523279732118395, 0.2552169919975083, 0.28516827866622896, 0.31508118785494343, 0.34495025709944804, 0.3747700319412509, 0.4045350669236226, 0.43423992658600385, 0.4638791864565871, 0.49344743404289093, 0.5229392698201494, 0.5523493082173293, 0.5816721786006032, 0.610902526254092, 0.6400350133577025, 0.6690643199618782, 0.6979851449590881, 0.7267922070518733, 0.7554802457172763, 0.7840440221674791, 0.8124783203064676, 0.8407779476825561, 0.8689377364365924, 0.8969525442456722, 0.924817255262191, 0.9525267810480593, 0.980076061503915, 1.0074600657931594, 1.0346737932606487, 1.0617122743458773, 1.0885705714904776, 1.1152437800398807, 1.1417270291389656, 1.168015482621538, 1.194104339893473, 1.2199888368093619, 1.2456642465425045, 1.2711258804480852, 1.2963690889193775, 1.3213892622368193, 1.3461818314098033, 1.3707422690110311, 1.395066090003278, 1.4191488525584146, 1.442986158868539, 1.4665736559490727, 1.489907036433665, 1.512982039360775, 1.5357944509517722, 1.5583401053804282, 1.5806148855336422, 1.6026147237632813, 1.62433560262898, 1.6457735556317752, 1.6669246679384377, 1.6877850770963687, 1.7083509737389306, 1.7286186022810834, 1.7485842616052034, 1.7682443057369495, 1.7875951445110643, 1.8066332442269821, 1.8253551282941272, 1.843757377866779, 1.8618366324683986, 1.8795895906052906, 1.8970130103694973, 1.9141037100308114, 1.930858568617798, 1.9472745264877216], [0.056809727891156486, 0.05003845049130766, 0.04375962962962965, 0.03797326530612245, 0.0326793575207861, 0.027877906273620565, 0.023568911564625854, 0.019752373393801967, 0.01225, 0.01079, 0.00973, 0.00898, 0.00844, 0.00807, 0.00703, 0.00705, 0.00759, 0.0082, 0.00884, 0.00957, 0.01038, 0.01152, 0.01362, 0.01711, 0.0206, 0.02457, 0.02976, 0.03568, 0.0441, 0.05486, 0.06789, 0.09805273060100951, 0.12820995311736044, 0.15835616047023837, 0.1884858475923325, 0.21859351243312908, 0.24867365696365298, 0.2787207881804755, 0.30872941910880397, 0.3386940698044705, 0.36860926835463775, 0.39846955187703637, 0.4282694675175552, 0.4580035734459986, 0.4876664398498317, 0.5172526499257315, 0.5467568008687602, 0.5761735048589846, 0.6054973900453581, 0.634723101526686, 0.663845302329497, 0.6928586743826399, 0.7217579194884276, 0.7505377602901538, 0.779192941235804, 0.8077182295377817, 0.8361084161284814, 0.8643583166115272, 0.8924627722085073, 0.9204166507010318, 0.9482148473679357, 0.9758522859174663, 1.0033239194142753, 1.0306247312010508, 1.057749735814622, 1.0846939798963633, 1.1114525430967408, 1.1380205389738274, 1.1643931158856269, 1.1905654578760443, 1.2165327855543369, 1.2422903569678916, 1.2678334684681616, 1.2931574555696121, 1.318257693801512, 1.3431295995524184, 1.3677686309072006, 1.39217028847645, 1.4163301162181234, 1.4402437022512704, 1.4639066796616993, 1.487314727299425, 1.5104635705677683, 1.5333489822039468, 1.555966783051028, 1.57831284282109, 1.6003830808494677, 1.6221734668399281, 1.6436800216006549, 1.6648988177708959, 1.6858259805381486, 1.7064576883457472, 1.7267901735907256, 1.7468197233118306, 1.7665426798675505, 1.7859554416040482, 1.8050544635128645, 1.823836257878284, 1.8422973949142312, 1.8604345033905934, 1.878244271248848, 1.8957234462068855, 1.9128688363529154, 1.9296773107283502, 1.9461457998995535], [0.051192608445848886, 0.0454448118356794, 0.04008669635162308, 0.03511826199367997, 0.03053950876185003, 0.026350436656133288, 0.02255104567652973, 0.019141335823039354, 0.00935, 0.00845, 0.0078, 0.00745, 0.00715, 0.00697, 0.00678, 0.00594, 0.00622, 0.006685, 0.00722, 0.00797, 0.00884, 0.01036, 0.01288, 0.01527, 0.01746, 0.01986, 0.02282, 0.02683, 0.03209, 0.03899, 0.04827, 0.07869785766660745, 0.10912015883310144, 0.13953134801405392, 0.16992587175322132, 0.20029817963767457, 0.23064272531137192, 0.26095396748799216, 0.2912263709628411, 0.32145440762364774, 0.3516325574600662, 0.38175530957169634, 0.41181716317444234, 0.4418126286050233, 0.4717362283234525, 0.5015824979133051, 0.5313459870795855, 0.5610212606440191, 0.5906028995375829, 0.6200855017900931, 0.6494636835166719, 0.6787320799009108, 0.7078853461745511, 0.736918158593505, 0.7658252154100368, 0.7946012378409261, 0.8232409710314391, 0.8517391850149295, 0.8800906756678939, 0.9082902656603101, 0.9363328054010788, 0.9642131739784046, 0.9919262800949354, 1.0194670629974967, 1.0468304934012478, 1.0740115744080885, 1.101005342419157, 1.1278068680412419, 1.154411256986951, 1.1808136509684672, 1.2070092285847325, 1.2329932062018945, 1.258760838826856, 1.2843074209737706, 1.3096282875233205, 1.3347188145746256, 1.3595744202896234, 1.3841905657297702, 1.4085627556849059, 1.432686539494135, 1.4565575118585725, 1.4801713136458035, 1.5035236326859165, 1.526610204558957, 1.549426813373665, 1.5719692925373452, 1.5942335255167408, 1.6162154465897611, 1.6379110415879339, 1.6593163486294402, 1.6804274588426042, 1.7012405170797003, 1.7217517226209482, 1.7419573298685767, 1.7618536490308094, 1.7814370467956704, 1.8007039469944683, 1.8196508312548527, 1.8382742396433072, 1.8565707712969797, 1.8745370850447196, 1.8921699000172172, 1.9094659962461307, 1.9264222152520927, 1.9430354606214846], [0.05132130177514794, 0.046035443786982246, 0.041069940828402374, 0.03642479289940829, 0.032100000000000004, 0.028095562130177523, 0.02441147928994083, 0.021047751479289944, 0.00697, 0.00658, 0.00632, 0.00616, 0.00605, 0.00599, 0.00595, 0.0059, 0.00549, 0.00503, 0.00548, 0.00624, 0.00735, 0.00895, 0.01056, 0.01194, 0.0133, 0.01483, 0.01664, 0.01905, 0.02218, 0.0263, 0.0321, 0.06274636452953906, 0.09338713265693077, 0.12401670900199974, 0.15462950022832694, 0.18521991606466234, 0.21578237032577635, 0.2463112819325663, 0.2768010759312295, 0.30724618451131835, 0.3376410480224913, 0.3679801159897724, 0.3982578481271369, 0.4284687153492348, 0.4586072007810697, 0.4886678007654492, 0.5186450258680179, 0.5485334018796975, 0.5783274708163432, 0.6080217919154394, 0.6376109426296493, 0.6670895196170392, 0.6964521397277935, 0.7256934409872453, 0.7548080835750389, 0.7837907508002453, 0.812636150072256, 0.8413390138672748, 0.8698941006902322, 0.8982961960319477, 0.9265401133213604, 0.9546206948726641, 0.9825328128271615, 1.0102713700896746, 1.0378313012593383, 1.065207573554602, 1.0923951877322797, 1.119389179000472, 1.146184617925198, 1.172776611330571, 1.1991603031923521, 1.2253308755247196, 1.251283549260092, 1.277013585121846, 1.302516284489765, 1.3277869902580655, 1.3528210876858402, 1.3776140052397694, 1.4021612154289362, 1.426458235631603, 1.4505006289137938, 1.4742840048395314, 1.4978040202725862, 1.5210563801695847, 1.5440368383643401, 1.5667411983432495, 1.5891653140116342, 1.6113050904508621, 1.6331564846661346, 1.654715506324785, 1.6759782184849616, 1.6969407383145636, 1.717599237800291, 1.73794994444669, 1.757989141965055, 1.7777131709520684, 1.7971184295580531, 1.8162013741447158, 1.834958519932255, 1.8533864416357293, 1.8714817740905525, 1.8892412128670166, 1.9066615148737194, 1.9237394989497947, 1.9404720464458285], [0.050893999999999995, 0.04580216, 0.04100984000000001, 0.03651704000000001, 0.03232376000000001, 0.02843, 0.024835760000000002, 0.021541040000000004, 0.006574999999999999, 0.00628, 0.00607, 0.00592, 0.00583, 0.00576, 0.00572, 0.00566, 0.00551, 0.00517, 0.00527, 0.00611, 0.00732, 0.00878, 0.01007, 0.01128, 0.01251, 0.01385, 0.01544, 0.01745, 0.02009, 0.02385, 0.02843, 0.05912595761469423, 0.08981630977093533, 0.1204954520338959, 0.15115778201581226, 0.1817977003990498, 0.21240961195860653, 0.24298792658387036, 0.27352706029944124, 0.30402143628483413, 0.33446548589287467, 0.3648536496666022, 0.39518037835449543, 0.4254401339238331, 0.45562739057200685, 0.4857366357356018, 0.5157623710970559, 0.5456991135887226, 0.5755413963941445, 0.6052837699463619, 0.6349208029230707, 0.6644470832384485, 0.6938572190314668, 0.7231458396505122, 0.7523075966341333, 0.7813371646877344, 0.8102292426560405, 0.8389785544911527, 0.8675798502160194, 0.8960279068831477, 0.9243175295283752, 0.9524435521195366, 0.9804008384998434, 1.008184283325809, 1.0357888129995478, 1.0632093865952763, 1.0904409967798467, 1.1174786707271491, 1.1443174710262098, 1.1709524965828233, 1.1973788835145514, 1.2235918060389288, 1.24958647735471, 1.2753581505159977, 1.300902119299094, 1.3262137190619132, 1.3512883275958039, 1.3761213659696205, 1.4007082993658926, 1.4250446379089374, 1.4491259374847683, 1.4729478005526406, 1.4965058769481008, 1.5197958646773766, 1.5428135107029777, 1.565554611720347, 1.5880150149254406, 1.6101906187730781, 1.6320773737259362, 1.6536712829940434, 1.6749684032646428, 1.6959648454222904, 1.716656775259053, 1.7370404141746845, 1.7571120398666427, 1.7768679870098283, 1.7963046479259166, 1.8154184732421672, 1.8342059725395792, 1.8526637149902874, 1.8707883299840713, 1.8885765077438723, 1.906024999930197, 1.9231306202343068, 1.9398902449600732], [0.039740591715976346, 0.03580792899408285, 0.03211360946745563, 0.028657633136094682, 0.02544000000000001, 0.022460710059171607, 0.019719763313609473, 0.017217159763313616, 0.00623, 0.00596, 0.0058, 0.00568, 0.0056, 0.00553, 0.00546, 0.00544, 0.00541, 0.0053, 0.00544, 0.00606, 0.00724, 0.00845, 0.00958, 0.01059, 0.01169, 0.01288, 0.01422, 0.01595, 0.01831, 0.02117, 0.02544, 0.05617636179033837, 0.08690711074392542, 0.11762663504898299, 0.14832932494349102, 0.17900957373959978, 0.20966177884747905, 0.24028034279842053, 0.2708596742670035, 0.30139418909213994, 0.33187831129681106, 0.36230647410630834, 0.3926731209647958, 0.4229727065500046, 0.4531996977858767, 0.4833485748529741, 0.5134138321964631, 0.543389979531498, 0.5732715428458139, 0.6030530653993481, 0.6327291087207085, 0.6622942536003054, 0.6917431010799637, 0.7210702734388414, 0.7502704151754664, 0.7793381939857161, 0.8082683017365626, 0.8370554554354022, 0.8656943981947944, 0.8941799001924364, 0.9225067596261887, 0.9506698036639916, 0.9786638893884864, 1.0064839047361744, 1.034124769430945, 1.061581435911793, 1.0888488902545674, 1.1159221530875758, 1.1427962805008764, 1.1694663649490997, 1.1959275361476238, 1.2221749619619495, 1.2482038492901073, 1.2740094449379362, 1.2995870364870759, 1.3249319531555115, 1.3500395666505154, 1.3749052920138318, 1.3995245884589445, 1.4238929602002812, 1.4480059572742, 1.4718591763516045, 1.495448261542049, 1.5187689051891748, 1.541816848657345, 1.5645878831093174, 1.5870778502748366, 1.6092826432099794, 1.6311982070471371, 1.652820539735483, 1.6741456927717948, 1.6951697719215013, 1.7158889379298154, 1.7362994072228328, 1.7563974525984543, 1.7761794039070224, 1.795641648721533, 1.814780632997312, 1.8335928617210235, 1.8520748995489058, 1.8702233714341048, 1.8880349632430002, 1.9055064223604068, 1.9226345582835418, 1.9394162432046487]], "cm": [[-0.09994117752385666, -0.09711004127918228, -0.09581086054830663, -0.09459784035861396, -0.09245347189548452, -0.0915325707696483, -0.09001574556005655], [-0.09994117752385666, -0.09711004127918228, -0.09581086054830663, -0.09459784035861396, -0.09245347189548452, -0.0915325707696483, -0.09001574556005655], [-0.09994117752385666, -0.09711004127918228, -0.09581086054830663, -0.09459784035861396, -0.09245347189548452, -0.0915325707696483, -0.09001574556005655], [-0.09994117752385666, -0.09711004127918228, -0.09581086054830663, -0.09459784035861396, -0.09245347189548452, -0.0915325707696483, -0.09001574556005655], [-0.09994117752385666, -0.09711004127918228, -0.09581086054830663, -0.09459784035861396, -0.09245347189548452, -0.0915325707696483, -0.09001574556005655], [-0.09994117752385666, -0.09711004127918228, -0.09581086054830663, -0.09459784035861396, -0.09245347189548452, -0.0915325707696483, -0.09001574556005655], [-0.09994117752385666, -0.09711004127918228, -0.09581086054830663, -0.09459784035861396, -0.09245347189548452, -0.0915325707696483, -0.09001574556005655]], "boundary_layer": {"angle_of_attacks": [-0.06981317007977318, 0.0, 0.03490658503988659, 0.06981317007977318, 0.13962634015954636, 0.17453292519943295, 0.24434609527920614], "reynolds_numbers": [10000.0, 50000.0, 100000.0, 300000.0, 500000.0, 750000.0, 1000000.0]}, "lift_distribution_func": null, "drag_distribution_func": null, "lift_distribution": [[[-1.6470045744562156, 1.632468543501904, 0.5984913458180319, 0.0444724156761201, 0.005752833132020132, 0.002239388179487446, 0.00014972371545380012, -0.001877182960336885, -0.004555800736470037, -0.008093622361508523, -0.012114355480663624, -0.01629190108027065, -0.020439762425065625, -0.024437973806805385, -0.02821633304315741, -0.031731502578140836, -0.03494448187634518, -0.037797374713294495, -0.04018148763411063, -0.0419391293110606, -0.044671710532950486, -0.045139224563695714, -0.045133917889598155, -0.04472768294806398, -0.044058906497370244, -0.043374218155987875, -0.0430183402052433, -0.04301204935110583, -0.043207670122607136, -0.043514726239824275, -0.043885659472880346, -0.044287300888710676, -0.04469828938296503, -0.045099894361134006, -0.04546735656437493, -0.04576920660704257, -0.0460153149523773, -0.046224040240563764, -0.04636516663328926, -0.04645605314918993, -0.04653288006898422, -0.04671797254318882, -0.04708306592894181, -0.0474990862765269, -0.04775948592382186, -0.047608163837321756, -0.04684604980216425, -0.04528031292097456, -0.042713584121938646, -0.03901834478488912, -0.034370404601265094, -0.029007852787020567, -0.02306373019222634, -0.01647716888009829, -0.009110509560628824, -0.0006961191116058376, 0.008415882155061286, 0.017493788088880337, 0.025688226305247863, 0.03262292188114922, 0.038527456799913117, 0.0436734538224481, 0.04820084039085389, 0.052103418303398645, 0.05536649359694473, 0.057994258878665134, 0.05999204270504079, 0.0613350235009933, 0.06208147687741888, 0.06237721760317139, 0.06237415287184809, 0.062228417557696175, 0.0621526427594597, 0.062380710298769175, 0.06286144243604991, 0.06339111033180043, 0.06384324092559789, 0.0641187614920164, 0.06410768091414074, 0.0637633125132864, 0.06315447942297726, 0.06234827266574985, 0.06139278392606373, 0.06034474670808643, 0.059241546973632375, 0.05805094145920634, 0.05670370870088431, 0.05514342384033431, 0.05331838468269448, 0.05116499737970462, 0.04880750528421797, 0.04591444955915679, 0.04268068219345529, 0.03908522064104884, 0.03509466926634412, 0.03060415960493014, 0.025333642582485646, 0.018772596766888743, 0.009759473873717117, -0.004046966000430003], [-1.0546139637201826, 0.8610460920260818, 0.31333322151896753, 0.03397673714180152, -0.01293868770886055, -0.015546259166158193, -0.01700341795515041, -0.01961151354938597, -0.024770739835784834, -0.03281058292115555, -0.042595905446542265, -0.053173350520733895, -0.0639249383603445, -0.07444700231806109, -0.08449666457825035, -0.09391945593442014, -0.10258172789508893, -0.11030495148130053, -0.1167580649199761, -0.1214493822730632, -0.126415892816851, -0.1277634445635273, -0.12778351425063741, -0.12667840071076683, -0.12483821514807993, -0.12295961897805045, -0.12201220550434232, -0.12205343067768623, -0.12266298347332956, -0.12358699744244185, -0.12469213643098906, -0.12588665128426568, -0.12711059525736107, -0.12831151596237117, -0.1294203296947987, -0.13034947378887365, -0.1311217832918012, -0.1317753834330088, -0.1322630482759557, -0.13261962130841937, -0.13294750310024964, -0.13359309035906458, -0.13475951684198978, -0.13608363562817702, -0.13698379279429548, -0.13673309345237286, -0.1347652001386832, -0.1305294490825334, -0.12345943171744307, -0.11318323594304801, -0.10000554196812997, -0.08477592706239266, -0.06787325234635858, -0.04913092875314789, -0.028167748297421705, -0.004230034194598689, 0.02169199352097559, 0.047525844782112026, 0.07086742988499434, 0.09064961251379657, 0.10751765227425099, 0.1222363024343161, 0.13519636202174956, 0.1463780962063055, 0.15573925358826166, 0.16329141522125887, 0.16904974087375596, 0.1729447196492256, 0.1751421861646952, 0.17605491281781024, 0.1761127012226197, 0.1757571002245935, 0.17558891590786765, 0.17627132496603515, 0.17766300413678934, 0.17918900470173652, 0.18049236800151047, 0.1812934505914229, 0.18128162211246623, 0.1803239396570884, 0.17861465194557133, 0.17634344034353894, 0.1736467475678775, 0.17068849069558836, 0.16758311217117122, 0.1642332541869771, 0.16043084503082275, 0.15602375495590112, 0.15086670897863722, 0.1447808387841104, 0.13788376888766696, 0.12978675803779607, 0.12074482551991354, 0.11070867627291865, 0.09960070219903745, 0.08715911224938418, 0.07266406902812964, 0.05458703563515415, 0.03059077553923988, -0.0050793396340033485], [-0.5797499211983317, 0.47677506545965537, 0.15953590139042895, 0.014095916042346706, -0.02281118166485653, -0.023816038981365414, -0.02428048584965385, -0.02642889908038943, -0.031701979995852315, -0.04040848181702573, -0.051224422447640305, -0.06304558023509396, -0.07513705145447584, -0.08701736851700412, -0.09839532124004131, -0.10908469360224841, -0.11892552595034918, -0.1277086006507782, -0.13504697088917636, -0.14036307785711855, -0.14532078410294286, -0.14687652231213286, -0.1469091251269393, -0.1456508321590963, -0.1435496842942892, -0.14140617962632607, -0.14033329804856268, -0.14039672380666715, -0.14111263672101312, -0.1421897956638958, -0.14347526380367243, -0.1448641459526607, -0.1462876671999996, -0.14768568140473448, -0.14897904055183103, -0.15006749275602932, -0.15097590320716134, -0.15174434213198712, -0.15232892080710714, -0.1527658139061492, -0.15317273944300658, -0.15394795867244154, -0.1553250185661519, -0.15688704063884223, -0.1579661623577027, -0.15772290961195856, -0.15550864168614695, -0.1506891455919038, -0.14261140231796815, -0.13084491146726346, -0.11568750034998371, -0.09816349022468471, -0.07870945680086473, -0.05713582735490527, -0.033006849737673344, -0.005457052717306847, 0.024376865427537902, 0.05411320556803848, 0.0809891137358691, 0.10377607697750005, 0.12321287368587383, 0.14017569457596893, 0.15511435874484278, 0.16800631791600984, 0.17880290025248247, 0.1875173720425033, 0.19416720784695207, 0.19867269314953495, 0.20122418360765618, 0.20229572487807565, 0.20238133344014483, 0.2019884900223293, 0.2018075827247337, 0.20260145223288112, 0.20420930723477512, 0.20596840543749934, 0.20747099609391426, 0.20839577487897726, 0.20838584825542053, 0.20728795997322047, 0.20532509328145604, 0.2027152182066231, 0.19961525505248937, 0.19621452095023403, 0.19264687851973283, 0.1887986955572978, 0.1844274724190589, 0.17936039293474304, 0.17343075207499495, 0.16643323893051912, 0.1585574763847662, 0.14927078161274931, 0.1388986738736382, 0.12738554754548656, 0.11464421828368122, 0.10038201403698516, 0.08378698675847517, 0.0634227110010402, 0.039373501792148886, 0.0028635117421086115], [-0.23448954344955256, 0.1658387892939905, 0.005260103947653614, -0.036601879056487915, -0.039052972117777016, -0.037755985240828877, -0.03678344857875181, -0.03840397003639133, -0.04422070781251988, -0.05453367440660374, -0.0676450732457101, -0.08214874030566618, -0.09708435798108977, -0.11182100476722363, -0.12597518642581362, -0.1393004308855136, -0.15158643915837988, -0.162563668454253, -0.171734894340631, -0.1783543163920912, -0.18365161314629325, -0.18562629143335482, -0.18567977238375, -0.1841051507939342, -0.18146811834567303, -0.17877987280319307, -0.177439593028859, -0.17753574094469787, -0.17845574212151236, -0.17983197477612353, -0.1814714840733825, -0.18324291232159148, -0.1850593591521141, -0.18684493978636074, -0.1885000181318206, -0.18989847143735467, -0.19106991904355938, -0.19206012824555763, -0.1928270195386005, -0.19341123674981398, -0.19396136039036274, -0.1949803790965214, -0.19676337599399604, -0.19878461227849012, -0.2002012909060947, -0.19995623424324638, -0.1972249051114321, -0.19120405023538867, -0.1810655910410467, -0.16626151437050513, -0.14710041190140435, -0.12493799689474726, -0.10032788084627713, -0.07303300124444623, -0.04250551555316012, -0.00765239019679466, 0.030090549957271638, 0.0677168081326422, 0.1017342393442098, 0.13058696751468268, 0.15520512843473908, 0.17669519339036785, 0.1956240713738032, 0.21196296777817933, 0.22565011570843957, 0.23670212023945225, 0.24514102495172657, 0.2508662809780395, 0.25411864186810434, 0.2554972554325002, 0.2556265559784282, 0.2551478104451239, 0.2549330512401661, 0.25594676178730913, 0.25798700760830096, 0.26021990674622036, 0.2621275126545426, 0.26330401399018766, 0.2632985596080206, 0.26191722423175096, 0.25944166018154996, 0.256147270731495, 0.25223248979745944, 0.2479377532686477, 0.24343526664717516, 0.23857929661239402, 0.233059113523641, 0.22665895022690982, 0.2191684847920885, 0.21032862937602845, 0.2002804885851517, 0.18857868092995628, 0.17514480492390513, 0.1607071574801747, 0.14476818213720657, 0.12698989239365518, 0.10641358267750346, 0.08139984863875858, 0.04924686705552894, 0.003259078601665086], [-0.15246479161774631, 0.08068596310856466, -0.010583111823344296, -0.04342116144973548, -0.044186152302805044, -0.04200108177137487, -0.040480308770008085, -0.04182448040019884, -0.04764214949591135, -0.05821840054586552, -0.07176757100626835, -0.08681384324705882, -0.10234151035539375, -0.11768270725729775, -0.13243089742864894, -0.14632441472577282, -0.15914043304651013, -0.17059506166334684, -0.18016501733547008, -0.18706425973101484, -0.19229908332087806, -0.1943619720224725, -0.1944158460816795, -0.19276701587521206, -0.19000711320587435, -0.18719428616124414, -0.18579872459978042, -0.18590687638451933, -0.1868772404668628, -0.18832522427790227, -0.1900489610689515, -0.19191104191464003, -0.19382057681432965, -0.19569819574614555, -0.19743968205166001, -0.1989131383451941, -0.20014897048274663, -0.2011935023008379, -0.2020069530488555, -0.20263022644789638, -0.20321884503960147, -0.20429946564424656, -0.20618123741164773, -0.2083141123082432, -0.20981595877853287, -0.20957959544997154, -0.20674133581616616, -0.2004595336287391, -0.18986620754631467, -0.17438627006648177, -0.1543210238921822, -0.13111438047634072, -0.10534109494985783, -0.076753482897778, -0.04477866979291914, -0.008272426402147245, 0.03126396751945789, 0.07067859574464849, 0.10631483355973205, 0.13654363297572517, 0.16233875799067904, 0.18485841700738467, 0.204695443538627, 0.22181934625210964, 0.23616536964682833, 0.24775086993190215, 0.25659893912531406, 0.26260437672558695, 0.2660194196290136, 0.2674714700078001, 0.26761433923079414, 0.2671194694515096, 0.26689990605179753, 0.2679657111611999, 0.2701057615464957, 0.27244705626498383, 0.2744473620384235, 0.2756818403483661, 0.2756784717884602, 0.2742341268752069, 0.2716436777853555, 0.26819547702348534, 0.2640973423914319, 0.25960141289075195, 0.25488898105678914, 0.2498067668924332, 0.2440280351477364, 0.23732770699208822, 0.2294856714146769, 0.22021104704954178, 0.2091048830622873, 0.1968898152187948, 0.18326050264645727, 0.16815476702472276, 0.1514759144330972, 0.13287019903126618, 0.11133395560320304, 0.08515105326545926, 0.05149220084544671, 0.0033327673969897544], [-0.11377021131834898, 0.03474718408165161, -0.02142015609446322, -0.04817954888128644, -0.047796488669755895, -0.04500032392184125, -0.04310188155842501, -0.044260910170653575, -0.05009362663669692, -0.06087564065246546, -0.07475694067886691, -0.09021054866398115, -0.10618046548655495, -0.12197197572964295, -0.13716182071368813, -0.15147732357804275, -0.164686562610871, -0.1764951583816571, -0.18636075898155802, -0.19346793284815636, -0.19864924424068453, -0.20078493208443532, -0.200845297820348, -0.19914677909990247, -0.19630056105568985, -0.193399803117017, -0.1919629411380524, -0.19207944415490252, -0.19308649102481584, -0.19458693820435316, -0.196372338675965, -0.1983008143014382, -0.20027852712077798, -0.20222352945025548, -0.20402821840744367, -0.2055564315264249, -0.20683918963457323, -0.2079233143021012, -0.20877049619186322, -0.2094219217174721, -0.21003824798601808, -0.21116358710991306, -0.2131174363645966, -0.21533178429713887, -0.2168954810558375, -0.21666449153744038, -0.21374628292447367, -0.2072709377929562, -0.19634637707964261, -0.18037182098413343, -0.15964432785665775, -0.13566380387673774, -0.10902958711814154, -0.0794861252235794, -0.04644214866534881, -0.008715805019927005, 0.032141635120145076, 0.0728735560824155, 0.10970208344949352, 0.14094422230620093, 0.16760591557670612, 0.19088354347562872, 0.2113890723378425, 0.22909077078479015, 0.24392168215517293, 0.2558997177116538, 0.2650487412783625, 0.2712601189085035, 0.2747945478938862, 0.27630025844193506, 0.27645272433923285, 0.2759456314433068, 0.2757222578751146, 0.27682625078443784, 0.2790396899518921, 0.28146072921845844, 0.28352922759291455, 0.28480631787970656, 0.28480437496968436, 0.2833134899065856, 0.28063828248609246, 0.2770766514528725, 0.27284332965525326, 0.26819906262829246, 0.26333178981253336, 0.25808270508801856, 0.2521133480535512, 0.24518473024849993, 0.23707298174330863, 0.2274990275308253, 0.21622629518493486, 0.20358522586520209, 0.18948761482363866, 0.17386776251237057, 0.15662480148683802, 0.1373924575547995, 0.11513304871621936, 0.08807255190392153, 0.0532869994126023, 0.0035313240125198556], [-0.0961101549807431, 0.010402771649444422, -0.028324089867259882, -0.051336193190318076, -0.05022831935974322, -0.047037863776297234, -0.0448951838034926, -0.04594132046424175, -0.05180261062661076, -0.06274959460145732, -0.07688565025255592, -0.09264655823013795, -0.10894746923723099, -0.1250744718066571, -0.14059238290759027, -0.15522069377764072, -0.16872099117868855, -0.1807913217435842, -0.19087554054949857, -0.19813702350558599, -0.20331786572525004, -0.2055062100116236, -0.20557047189586278, -0.20383465164169934, -0.2009243716880569, -0.19795853136109326, -0.196490967666719, -0.1966131525632105, -0.19764659998991538, -0.19918498183650302, -0.2010150240898492, -0.20299156873989607, -0.20501861300698995, -0.20701231119240907, -0.20886257878862913, -0.2104301187287751, -0.21174646094863792, -0.21285891657511477, -0.21372999552164532, -0.21440122294673614, -0.2150370537735237, -0.21619443603141766, -0.2182003736249852, -0.22047355107966343, -0.22208151690002717, -0.22185323135213925, -0.2188765595485983, -0.2122605324401789, -0.20108561749764756, -0.18474203416175228, -0.16352506836174438, -0.13897766243838747, -0.11171314941332008, -0.08147012704144271, -0.04764377848789821, -0.009024670518705247, 0.032799297043385085, 0.07449485935590262, 0.11219537147260934, 0.14417839790137635, 0.17147350209047157, 0.19530504986609415, 0.216299044456944, 0.23442285315030312, 0.2496079163628456, 0.2618725548330675, 0.2712411980590322, 0.2776026942859181, 0.2812239345680359, 0.28276840366778566, 0.28292743572312523, 0.28241100486196463, 0.28218452947850314, 0.28331623698218367, 0.28558320340097687, 0.28806245014614446, 0.29018071754121144, 0.29148886132795915, 0.2914878258339701, 0.28996274387487886, 0.28722537694789874, 0.2835806155521183, 0.279248253735747, 0.27449531487517526, 0.2695145429781437, 0.2641431297241189, 0.2580276197988024, 0.25093391022933265, 0.24263026712413016, 0.23283055659265123, 0.2212747969194731, 0.20834179316059306, 0.19391685675802595, 0.17793365649574136, 0.16028919048832943, 0.140608813860348, 0.11783005431332544, 0.09013515546243198, 0.0545328283271284, 0.0036058201717353933]], [[-0.0036907414544401075, -0.004100105932992492, -0.004569346405350787, -0.005428022783000738, -0.008375018434909332, -0.11458658707506583, -0.692923712808609, 0.21416582836999754, 0.090938447018388, 0.01096080745557829, 0.004582627122575226, 0.004042539646003244, 0.0036787695744407174, 0.003326009742512029, 0.0029409142528213556, 0.002517826109941725, 0.002066964536071801, 0.0016091546978041743, 0.0011698548098809647, 0.000773761187797604, 0.00010357433812924076, -7.14518706809897e-05, -0.0001504777346126702, -0.00013801783817905138, -4.959375956337953e-05, 8.223010342656427e-05, 0.00020482126744319058, 0.0002925636504763933, 0.0003657064923851789, 0.00044041810244302367, 0.0005269852604069914, 0.0006367754942445127, 0.0007774302943134979, 0.0009536859439037282, 0.0011726688967136642, 0.001443842406931185, 0.0017750410926620317, 0.002173710365786015, 0.0026477399955112946, 0.0032014056308329645, 0.0038354431252528355, 0.0045409560409533575, 0.005310266268814193, 0.006175777728373154, 0.007204191198929424, 0.00846135060999959, 0.009978695165428772, 0.011774071875624344, 0.013847338066793119, 0.0161646728267533, 0.01862238651903102, 0.021088668435881246, 0.023469579158879605, 0.025757078464327007, 0.02800248584196081, 0.030293510519059996, 0.03259494656507882, 0.034753268722211204, 0.036587981096701784, 0.03799192523781832, 0.03900492838520147, 0.039713171544508444, 0.040180729359202895, 0.040436665673340644, 0.040488902175601686, 0.04035057375145432, 0.040034889853776935, 0.03954883348478871, 0.03890731986920499, 0.038147798487537465, 0.03731879394784194, 0.03646888899005648, 0.03566610043909228, 0.034969917335882214, 0.03436238659635242, 0.033784512194613675, 0.03319521428480225, 0.03255850667972706, 0.031849215957785344, 0.031055973763783308, 0.030197880512465414, 0.0292948153589907, 0.028361661810425806, 0.027418875237894443, 0.026473315047386488, 0.025501971265385174, 0.0244809871657097, 0.023392666697409588, 0.02221866861602733, 0.020937460655826173, 0.01948881067114842, 0.01794225264914735, 0.016265781357082867, 0.014442171357269114, 0.012441919391093207, 0.010220852102328228, 0.007687185921645539, 0.0046725623083615974, 0.000976956609576274, -0.002403738739617765], [-0.0025971715306504334, -0.002684961931473692, -0.002745367888232267, -0.0028842297440259666, -0.003654859708994467, -0.03807461582495981, -0.10185376791910983, 0.03128426942431402, 0.01368880138534346, 0.004057572245684987, 0.002170209930169026, 0.002108832531964223, 0.0020336891266844173, 0.0019015661636865716, 0.0017098598647544436, 0.0014680468996572853, 0.0011907958612672096, 0.0008975243347243904, 0.0006105920938885077, 0.00035192551684041763, 3.142517575374974e-05, -9.204856131428003e-05, -0.00014672572249350242, -0.00013575227226199954, -7.031514060523803e-05, 2.5948280719206933e-05, 0.00011485897607007386, 0.000178215526602784, 0.0002308647974322927, 0.0002844926122392443, 0.00034657755532529664, 0.0004254254265734836, 0.0005266260509897093, 0.0006536377579186492, 0.0008116486286851104, 0.0010075451368571737, 0.0012470116635434846, 0.0015354490478967785, 0.001878588173005612, 0.00227951391393585, 0.002738709157956482, 0.003249616675032476, 0.0038066235189591936, 0.004433362491554045, 0.005178471918539488, 0.006090228707609888, 0.007191801651892764, 0.00849649221285542, 0.010004584818896578, 0.011691868495529353, 0.013488507661607802, 0.015292854291522433, 0.01703622595595868, 0.01871252542388256, 0.02035886590664278, 0.022039188002150333, 0.02372763644196656, 0.025311873415413914, 0.026659862972788193, 0.027693240694915196, 0.028441083679209892, 0.028966042448626855, 0.02931478807231665, 0.029508381120941063, 0.02955255613489792, 0.0294568749531434, 0.029230974489049887, 0.028879972989709225, 0.028414838897755805, 0.027862964631037507, 0.027259794286765778, 0.026640820507658616, 0.0260557433945373, 0.025548128443853062, 0.025104958159768504, 0.024683176479911802, 0.024253213433142802, 0.02379052656470092, 0.023272973042180244, 0.022693751480069947, 0.02206691749703386, 0.021407037989978957, 0.020725008374151067, 0.020035818859390958, 0.01934460580977469, 0.01863465013014047, 0.017888597045997417, 0.017093596232034623, 0.01623633440522109, 0.015301177334201792, 0.014264388917214934, 0.01314859013384498, 0.011941639662403924, 0.010632772189908254, 0.009204300729680988, 0.007629167992179062, 0.005850508513539034, 0.004063192400133832, 0.0018795180884597317, 0.00040637621135306543], [-0.002490480135133758, -0.002527054146284851, -0.002520842698237152, -0.0025433689315160044, -0.002972554667734484, -0.026392100948678363, -0.049725527446272205, 0.015128368847584584, 0.0037689462460346796, 0.0019259079638502387, 0.0018303649093980793, 0.0018472653938581217, 0.001818198142181652, 0.0017191051425954201, 0.0015541216121395876, 0.0013355340125232216, 0.0010791858521634104, 0.0008048292810532554, 0.00053496215904745, 0.0002916911800763069, 2.027843806924635e-05, -9.819622206573233e-05, -0.00015040539880719855, -0.0001393584647930629, -7.584564753417932e-05, 1.7295083786967252e-05, 0.00010318172632397645, 0.00016431887582588775, 0.0002150855254536653, 0.0002667607115235996, 0.0003265728008726463, 0.0004025592484159586, 0.000500130768704422, 0.0006226334359262744, 0.0007750833791409261, 0.0009641381838466729, 0.0011952894072398237, 0.0014737544165664685, 0.0018050711892843565, 0.0021922159657326848, 0.0026356434922282465, 0.003128995350485308, 0.0036668392839028377, 0.0042720346143077, 0.0049916259822644325, 0.0058723688772892866, 0.006936728750273907, 0.00819763715506044, 0.009655458316360237, 0.011286878086252252, 0.013025673948663583, 0.014772259547477911, 0.016460161235356326, 0.018083427817172572, 0.019677885553785145, 0.02130537603456994, 0.022940849175140797, 0.024475559267936948, 0.025781700760965406, 0.026783425473770498, 0.027508865792633938, 0.02801857519785442, 0.028357683540808473, 0.028546530847655516, 0.02859065413277348, 0.02849929822835699, 0.02828178532973522, 0.027943071996509583, 0.02749378843792569, 0.026960448844588526, 0.02637734968500955, 0.025778835794692968, 0.025213002224158076, 0.02472202966653971, 0.02429334411639389, 0.023885292016363458, 0.02346936072715651, 0.0230222016505969, 0.02252152888652259, 0.02196110535837848, 0.021354555401337044, 0.020715984896403826, 0.02005594197124344, 0.019388942668745544, 0.018719985903427737, 0.018032914121135366, 0.017310950735998788, 0.01654167878820018, 0.015712235254273222, 0.014807513575664195, 0.013809185982134342, 0.012732689814291329, 0.01159087010511763, 0.010340313101751347, 0.00898213527554059, 0.007494408150370251, 0.005830999711856204, 0.003922906640781175, 0.0018183723965481168, 0.0003950191150990134], [-0.002395156698854379, -0.0023827676629113574, -0.0023127210680736867, -0.0022238626594233857, -0.0023271388727930655, -0.01527104006485918, -0.01669517453198228, 0.004874128669816541, 0.002261987375494286, 0.0014246211861394954, 0.0015098606058136566, 0.001601796396140189, 0.001616788728131933, 0.0015490637678613227, 0.0014092239799392608, 0.0012122815092154163, 0.0009752492039510074, 0.0007182543214259875, 0.00046398919644050865, 0.00023479437178395044, 9.656170357046951e-06, -0.00010435699014231836, -0.0001543462169438589, -0.00014319834968820041, -8.135341164031955e-05, 9.053325068533987e-06, 9.228041246968734e-05, 0.00015146042925777642, 0.0002005639061381491, 0.0002505113653150457, 0.00030831145254883345, 0.00038176677252827287, 0.00047613141304404046, 0.0005946531600390404, 0.0007421972824306137, 0.0009252204998903004, 0.0011490448291465586, 0.0014187262980358858, 0.0017396333935848886, 0.0021146465138330013, 0.0025441947037687387, 0.003022092425492725, 0.0035430655024035343, 0.004129295470715471, 0.004826430303599004, 0.005679897254007895, 0.006711550088822103, 0.007934001745845258, 0.009347693899701512, 0.010930107094036731, 0.012618296986655116, 0.014314376964389053, 0.015953805587928242, 0.01753075511016437, 0.01907985881905937, 0.020661123445229152, 0.022250209930199615, 0.023741535745776764, 0.025011024297137054, 0.02598503130583839, 0.02669084055402205, 0.027187338134602987, 0.027518134768614713, 0.027702949339284758, 0.027747146054916624, 0.027659691886846027, 0.02744963353724231, 0.027121786041496898, 0.026686475229105822, 0.026169438230448074, 0.025603966097276838, 0.025023398575101944, 0.024474425668007626, 0.023998020356534946, 0.02358201159161253, 0.02318597836791724, 0.02278234227298232, 0.022348833978690946, 0.021862968949554726, 0.02131903097677516, 0.02073026592652673, 0.020110376860834243, 0.019468477702723034, 0.01881974743116175, 0.018169164212497146, 0.01750101585822354, 0.01679902886216982, 0.016051172567966232, 0.015244992345114276, 0.014365865474404674, 0.013386193690116977, 0.012348664144242094, 0.011228486626509606, 0.010016973520838036, 0.00870029480058636, 0.007257197469363763, 0.005642266484606953, 0.003789936803020938, 0.001745882697869696, 0.000370459220890322], [-0.002372363621990575, -0.00234541347309996, -0.0022562592012497096, -0.0021341368088140375, -0.002140917311484431, -0.012003727957971921, -0.010317348432434918, 0.0028883042265917674, 0.0018192863855739725, 0.0012791039694306859, 0.0014181989392589383, 0.0015326170612835735, 0.0015607211028245069, 0.0015021509458234866, 0.0013694529432342602, 0.001178482718768241, 0.0009466392562652914, 0.0006942073644694288, 0.00044398920625518355, 0.00021844603121149282, 6.525559906000931e-06, -0.00010642518521733727, -0.0001558702965745536, -0.00014466687369408586, -8.317496851885711e-05, 6.627886478098154e-06, 8.9256700542587e-05, 0.00014799171226583546, 0.00019671429623495124, 0.0002462636402126597, 0.00030359926806227544, 0.0003764719951995481, 0.0004701014856508403, 0.0005877138101089565, 0.0007341406325037998, 0.0009157938796813395, 0.0011379574676816408, 0.0014056511470353843, 0.0017242054256372745, 0.00209653497271023, 0.0025230116411920664, 0.0029974821198470404, 0.0035147040656934767, 0.004096701531831839, 0.00478880576764549, 0.005636144468381109, 0.006660428589391526, 0.007874195630504366, 0.009277903147102366, 0.010849213476923424, 0.012526018479881041, 0.014210724795559956, 0.01583918644217467, 0.017405576222073747, 0.01894432468611587, 0.020515041648307485, 0.02209364979228294, 0.023575323368747306, 0.024836827570039525, 0.025804905762185405, 0.026506549285645945, 0.027000232206861565, 0.027329275789936394, 0.027513294826748566, 0.02755761757315365, 0.027471149847908813, 0.027262877981432503, 0.02693758515671106, 0.02650550412869219, 0.025992281667374818, 0.02543090107532105, 0.024854472100865412, 0.02430937445742387, 0.023836325299857502, 0.02342327331802163, 0.023030074276552362, 0.022629356369359185, 0.0221991124265498, 0.021716740505386998, 0.02117631583165239, 0.02059115235578253, 0.019974917788093793, 0.019337814761111693, 0.01869388024710738, 0.018047997725818908, 0.017384615987445774, 0.01668758914928094, 0.01594497827211236, 0.015144419523943098, 0.014271393077989449, 0.01330267768355307, 0.012271704510921121, 0.011158613051072963, 0.009954755699671358, 0.008646586999716096, 0.0072129054189469174, 0.005608507204273382, 0.0037682423264629914, 0.0017374264016884336, 0.00037049258381936816], [-0.002359496550003587, -0.0023234437637467673, -0.002222313866693324, -0.002079362396875456, -0.0020259262708858475, -0.009970533221106795, -0.007159831638114877, 0.0019029800671490162, 0.0015436481991141697, 0.0011890209610977288, 0.0013618066988945077, 0.0014903209947720625, 0.0015266238053086975, 0.0014737334122225517, 0.001345416482818917, 0.0011580641078223434, 0.0009293262044757401, 0.0006795975126513335, 0.0004317617838467834, 0.00020836845032114762, 4.5755604595938875e-06, -0.00010777679061549277, -0.00015691062673178505, -0.00014566612225258614, -8.435934924833038e-05, 5.118025207086e-06, 8.742075368189619e-05, 0.00014591165821976424, 0.00019442441649243427, 0.00024375365987087334, 0.00030083223884688244, 0.00037338308361253234, 0.00046660736197611495, 0.00058381647324128, 0.0007297365992704351, 0.0009107423878881932, 0.0011320909945659657, 0.0013987800796208024, 0.0017161179431839008, 0.0020869519758597126, 0.0025117045978867783, 0.0029842539127779796, 0.003499374603580995, 0.004079000729136511, 0.004768293720466927, 0.005612223728524382, 0.006632431030768293, 0.007841420212451761, 0.009239665771934118, 0.010804936779567405, 0.012475614994939105, 0.014154234144554084, 0.015776861951840908, 0.017337675250913485, 0.018870966138977565, 0.02043613335139924, 0.02200922394266568, 0.023485805527497683, 0.02474308770642296, 0.025708035235544723, 0.026407499870730138, 0.026899718249134313, 0.02722786911825306, 0.02741164994269313, 0.027456250380874937, 0.02737052283797656, 0.0271634084372183, 0.026839665139426327, 0.02640948267219218, 0.025898311230849475, 0.025339104190144904, 0.024764865536825772, 0.024221814368738808, 0.023750528533525706, 0.023339004111550786, 0.0229472433189729, 0.02254764222518058, 0.02211897137377869, 0.021637841063555572, 0.0210990658708248, 0.020515790714615036, 0.019901593104399436, 0.019266625775616407, 0.018624868250596897, 0.0179811813215862, 0.017320066601392042, 0.016625435880043136, 0.015885393461993903, 0.015087620564346756, 0.014217650733040493, 0.01325470540550707, 0.012227623483793366, 0.01111872187064984, 0.009919381512489124, 0.008615961253061619, 0.007187440307175439, 0.005588757957179833, 0.0037549677930453825, 0.0017311415397535405, 0.00036835936919930694], [-0.002352331333764439, -0.002310875777421718, -0.002202627367591777, -0.002047301193227459, -0.001958160369072178, -0.00876660207891762, -0.005589399655787699, 0.0014118971834445548, 0.0013802975933516475, 0.0011358548824598042, 0.0013286459866383195, 0.0014655411786382668, 0.001506711032458871, 0.0014571770432821184, 0.0013314319343889253, 0.0011461874112093859, 0.0009192455905871402, 0.0006710703682500763, 0.0004245983383956108, 0.0002024356192375857, 3.420567523275054e-06, -0.00010859907241989032, -0.00015755801477309204, -0.00014628695729516575, -8.50779219534253e-05, 4.224036357276982e-06, 8.634958546551195e-05, 0.00014470724284011552, 0.00019310512135920215, 0.00024231355423794457, 0.00029936409443061707, 0.0003718604807622065, 0.00046498435274600053, 0.0005819396405956528, 0.0007275258355611817, 0.0009081132330631882, 0.0011289519234460239, 0.0013950306757851995, 0.001711648338236864, 0.002081647378036543, 0.002505449620197388, 0.002976945562967819, 0.0034909173179373874, 0.00406925012104954, 0.0047570137681884105, 0.005599094174606215, 0.006617094073359249, 0.007823500902234822, 0.00921879909907843, 0.010780816001470128, 0.012448210391925677, 0.014123570847002406, 0.015743081582549747, 0.017300921923295583, 0.01883130836404554, 0.020393524583507676, 0.021963679133833226, 0.023437547918805927, 0.024692578042469795, 0.025655857777622606, 0.02635431729323772, 0.026845940233371227, 0.027173821375768393, 0.02735746615800037, 0.027402162763498755, 0.027316756484559848, 0.027110175288624836, 0.026787169668683188, 0.02635791444760669, 0.025847813653656605, 0.02528975702284487, 0.024716684559664057, 0.024174725691611686, 0.023704381551330367, 0.023293672517542677, 0.022902255761565453, 0.022503313792971817, 0.022075389018873705, 0.0215951169798303, 0.021057317798334994, 0.020475110889128723, 0.019862049533321532, 0.019228265235943516, 0.018587708992747972, 0.017945230723342143, 0.01728536152279693, 0.016592044866387327, 0.015853408690239174, 0.015057158616992737, 0.014188856894664583, 0.01322935997337129, 0.012204300500498652, 0.01109756719427972, 0.00990056543292325, 0.008599830828282647, 0.00717411942833707, 0.005578496989203007, 0.0037481743386540184, 0.0017280913841280542, 0.00036752421646819237]], [[-0.0001664148926006849, -0.00022174771059010429, -0.00026020245796267187, -0.0002854183801816921, -0.00030501786065183223, -0.00034173869263343277, -0.00047243633136250727, -0.004065985749198589, -0.03731288854001387, -0.09837215139062158, 0.18024521275813546, 0.05096778458549438, 0.013186096516882892, 0.003666827315585288, 0.0033787786404071143, 0.0032129189437068327, 0.0030787107620361314, 0.002954292544742776, 0.0028349922131574437, 0.002719868146504511, 0.002468561494953608, 0.002429900089495983, 0.002420292679878548, 0.0024404247238083766, 0.002487958542812528, 0.002556030848871332, 0.002631392574321536, 0.0027028943452633695, 0.0027755634291731553, 0.002854499330881324, 0.002943711147151162, 0.003048705079852492, 0.0031731677262872493, 0.003319038795717536, 0.0034893526102128653, 0.0036881839610148352, 0.003920527267571617, 0.004191331909538019, 0.004505002626138378, 0.0048644896494692905, 0.005272201363804971, 0.00572949451150363, 0.006236385007599061, 0.006806196539794414, 0.007467940742869201, 0.008246020616259453, 0.009147195338045732, 0.010169930919168988, 0.01130117186967767, 0.012511108323130045, 0.013743010616140233, 0.014931698508837696, 0.016028873426946366, 0.01702682383142692, 0.017949772336440538, 0.01883550459933151, 0.019681935314414898, 0.020439492295844595, 0.02104923301779036, 0.021470265124298293, 0.021714854264746147, 0.021819695593343683, 0.02181554655420848, 0.02172039386805771, 0.021540180780528773, 0.021282804183401637, 0.020956087470305442, 0.020565807658710963, 0.0201173820488448, 0.019616994131056255, 0.01909991080532498, 0.01857997947221161, 0.018085785555801807, 0.01763921009233394, 0.017231721001851715, 0.01683964933781099, 0.016446171234443637, 0.01603786578145529, 0.015600277546392828, 0.015131743617363714, 0.01463980428819756, 0.014132541314676044, 0.013616129118853999, 0.013099590473330192, 0.012584560576964452, 0.012059097216014746, 0.01151333891276725, 0.010939628603460242, 0.010329876726769318, 0.009674772174575762, 0.008940021943296609, 0.008167960104667903, 0.007337158547318837, 0.006438086396990977, 0.00545558834614356, 0.004368018659725156, 0.003133440454235694, 0.0016817941526504959, -4.9253266905918385e-05, -0.0013009792985009324], [-0.00015041418499362253, -0.00016315858718768348, -0.00015202914907205839, -0.00011556211505607929, -5.288074161585012e-05, 3.025320665433572e-05, 0.000101152408373721, -0.0014697471893526, -0.007061890922151514, -0.020015839263408837, 0.04075650774732195, 0.011155533559345114, 0.0036079229196669194, 0.003269121687062714, 0.0031824264101789354, 0.0031233914325381473, 0.0030542619151856967, 0.0029722385375789942, 0.002882255730981632, 0.0027892770685706467, 0.0026354677312244025, 0.0025986810175085864, 0.002592180983699729, 0.0026168737418514943, 0.0026703597116783913, 0.002745308627557977, 0.002827549978355184, 0.002905435361159344, 0.0029845106342160114, 0.00307027108981853, 0.0031670426451108212, 0.0032807929513780326, 0.0034155267204410674, 0.0035733519563002, 0.003757555670621428, 0.003972548028745971, 0.004223724228336412, 0.004516431893283018, 0.004855433965885434, 0.005243911175057463, 0.005684444007405137, 0.006178465801478961, 0.0067260176824480485, 0.007341563286235776, 0.008056515585548856, 0.008897422450284789, 0.009871716803321487, 0.010977862109788888, 0.012201886252089445, 0.013511695491951541, 0.014848004793009097, 0.01613812285975994, 0.017329705037036323, 0.018414301811110933, 0.01941798659449049, 0.02038164304832939, 0.021302851923268442, 0.022127739322748877, 0.022792314602518706, 0.023252316723025416, 0.023521108458353812, 0.023638143983826174, 0.023636844010709545, 0.02353659435397766, 0.023343808673236485, 0.023067024155689515, 0.022714703937232354, 0.022293092311441352, 0.021808315907128128, 0.021271926419396053, 0.020713222371044997, 0.020151033079177264, 0.019616474172705043, 0.019133339381274036, 0.018692395943259908, 0.018267981654324524, 0.017841886537430005, 0.01739958291852306, 0.01692541337123519, 0.01641759884693122, 0.01588441775057447, 0.015334645408563885, 0.014774976984797142, 0.014215180569945036, 0.013657058085890187, 0.013087737780954395, 0.01249658525686308, 0.011875360094156868, 0.011215360263496309, 0.010506565735556028, 0.009729611494736123, 0.00890424662762956, 0.008018342934876953, 0.00706315226941325, 0.006024856898628732, 0.0050053907691283055, 0.003773399661830746, 0.0023845196197089706, 0.0009128752147099173, 0.00029687132294272414], [-0.00014393324305956708, -0.00014550409043954186, -0.00012177276620750452, -6.998357118085357e-05, 1.2916464612029476e-05, 0.00012563012014455834, 0.0002473633364174344, 0.0002586004019029491, -0.00142161024015851, -0.009245034900556065, 0.02153114356025338, 0.00859818228858636, 0.0033085670858459355, 0.0031153949280509044, 0.0030819415215631992, 0.0030513575691630953, 0.003000080618678472, 0.0029302670012272304, 0.002849249101528317, 0.002763434270894584, 0.00263715833969291, 0.002601431382034967, 0.002595833926860377, 0.0026213147371619873, 0.0026754959005464572, 0.002751041741550978, 0.0028337664712308583, 0.00291207571343644, 0.002991562009516774, 0.003077736484849548, 0.00317493887446156, 0.0032891621766881676, 0.0034244302902187804, 0.003582861536468464, 0.003767756507286417, 0.003983542645879197, 0.004235633838141262, 0.004529396489076553, 0.004869611170722106, 0.005259468139950414, 0.005701551774791637, 0.006197292679945078, 0.00674673783175999, 0.007364417850801806, 0.00808187200265352, 0.008925784636142747, 0.009903645752356574, 0.011013942248650257, 0.012242684860302224, 0.01355769449600379, 0.014899957085675791, 0.0161959855383399, 0.017393213250143976, 0.018483133016089413, 0.019491886392074706, 0.020460514370436805, 0.021386549581007146, 0.022215854284246873, 0.0228841402658852, 0.023346972356145523, 0.02361778653758935, 0.023736129381017494, 0.02373558390665255, 0.023635592523461754, 0.02344258955594137, 0.023165143339086553, 0.022811749174952326, 0.022388673868617353, 0.02190213077470791, 0.021364873718637222, 0.020804204038937384, 0.020239939557067824, 0.019703360061411986, 0.0192183791120243, 0.018775728144255738, 0.018349633656340056, 0.01792181398900219, 0.01747768403811374, 0.017001522120355897, 0.016491547152212446, 0.015956097947542235, 0.015403990974660164, 0.014841950617209304, 0.014279783878016488, 0.013719307389833985, 0.013147611676864892, 0.01255402989741735, 0.011930206963571185, 0.011267576553836275, 0.010556136101948313, 0.009787435227925426, 0.008967313133756306, 0.00808925986116659, 0.0071458213084603425, 0.006125364509136548, 0.005012810017211894, 0.003779777613199896, 0.002388699935562398, 0.0009208899561922798, 0.00030753367960857474], [-0.00013773691041461496, -0.00012777836294435843, -9.095627138712066e-05, -2.317176472949754e-05, 8.088519089864822e-05, 0.00022452180354221404, 0.0003991504265859922, 0.0005364161974425161, -0.0002846546560216442, -0.0020306410532408806, 0.008664198133694203, 0.005986794794908227, 0.0030108917127333406, 0.002967393671150587, 0.0029887885615704664, 0.002987470438596498, 0.002954447177882661, 0.0028969983779008647, 0.0028249570735556736, 0.002746243067498915, 0.002647957162681911, 0.002613201568945254, 0.002608516655634024, 0.0026348984727268643, 0.0026899833126816175, 0.002766404731385967, 0.0028499124673092486, 0.0029289281133628785, 0.003009111602835298, 0.003096009326158973, 0.003193990181594861, 0.0033090939083837635, 0.0034453780267208875, 0.00360497878134362, 0.0037912221144960957, 0.004008568505568812, 0.004262469719133061, 0.004558329971748834, 0.00490096444720215, 0.005293584190742395, 0.005738786469990458, 0.006238003978782101, 0.006791289895084333, 0.007413293874357194, 0.008135793834632497, 0.008985706625262116, 0.00997060688456307, 0.011089000505069984, 0.012326832494409442, 0.013651725175649332, 0.015004741605498736, 0.01631132088343605, 0.017518486816472608, 0.018617643437362125, 0.01963509239430325, 0.020612177993959892, 0.021546374718980615, 0.022383086598158228, 0.023057497520818808, 0.023524840008255974, 0.023798671744999774, 0.023918770450691417, 0.02391900199481485, 0.023818933957191892, 0.02362504408479865, 0.023345962283130926, 0.02299024622530777, 0.022564207470092874, 0.022074170232612114, 0.02153417311739707, 0.020969549438715804, 0.020401205516040983, 0.019860697990194756, 0.019372146222678452, 0.01892621286866925, 0.01849692104848303, 0.018065665976503494, 0.01761779170289602, 0.017137492859748332, 0.01662301276664769, 0.0160828256656136, 0.015525829892386753, 0.014958809644836221, 0.01439165010250321, 0.013826191911276386, 0.01324944698356846, 0.012650689344161407, 0.012021620489361156, 0.011353481846522587, 0.010636188464802116, 0.009860145792772442, 0.009033992311371362, 0.008149284153959728, 0.007198499678578745, 0.006169866241971558, 0.005048073109036033, 0.0038043199941469982, 0.002400778694707097, 0.0009217030139154258, 0.0003167021279673779], [-0.00013572573659774458, -0.00012219014651942818, -8.13224129651135e-05, -8.60876262434046e-06, 0.00010195901819270615, 0.0002551170984558731, 0.00044607680949550725, 0.0006224266451537395, 6.93347939503613e-05, -0.0005761950685617119, 0.00606683618145477, 0.005170926798886071, 0.0029165099648739623, 0.002919556173690514, 0.0029579840899381406, 0.0029657623059106512, 0.0029384325850308627, 0.0028848622707760836, 0.0028156554767424934, 0.0027391971486120993, 0.002649671209974467, 0.0026152390597353097, 0.002610840660451301, 0.00263748614071876, 0.002692817673559214, 0.0027694638205395957, 0.0028531631199320813, 0.0029323493079577777, 0.0030126997526545335, 0.003099768364909196, 0.0031979303972690925, 0.003313236370059062, 0.003449751736445499, 0.003609616986770579, 0.003796163879356968, 0.004013860394761258, 0.004268166688977933, 0.004564495378616369, 0.0049076694183301526, 0.0053009043228712995, 0.005746799755132128, 0.006246788169753139, 0.006800924639122846, 0.007423886728625356, 0.008147506820130108, 0.008998757329437416, 0.00998523450187983, 0.011105451060062858, 0.012345340300259118, 0.013672482905996848, 0.01502800245364032, 0.0163370505521664, 0.01754655656536888, 0.01864790227034429, 0.01966742275951604, 0.020646530967092097, 0.021582684870356025, 0.022421179941777364, 0.023097076201235776, 0.023565530654116207, 0.023840130400952224, 0.023960700332142666, 0.023961173222095487, 0.023861143417725345, 0.023667098144131406, 0.023387681090502377, 0.023031464007251725, 0.02260476844805189, 0.022113949160412375, 0.02157343533914183, 0.021007932946321136, 0.020438673630557406, 0.01989728050590148, 0.019407751752376988, 0.01896079611157332, 0.018530408281780368, 0.018098148398304547, 0.01764930129935315, 0.01716799974394227, 0.016652472200433945, 0.016111203718876106, 0.015553106375039686, 0.014984974772890446, 0.014416709816169795, 0.013850153826673003, 0.013272295170933961, 0.012672389348826309, 0.012042123937466478, 0.011372725461590216, 0.010654091707808887, 0.009877910398755976, 0.009050311285288031, 0.008164021255793788, 0.007211498512102275, 0.006180933729511085, 0.005056957681553269, 0.0038106712469817236, 0.0024042329381896684, 0.0009228873178897285, 0.00032349370090873264], [-0.0001344383063520109, -0.00011864246488502115, -7.522134548358768e-05, 6.006512440594943e-07, 0.00011527251286521903, 0.00027443341536076085, 0.00047569741464974707, 0.0006767407778072732, 0.0002934604207876691, 0.00015243124501734595, 0.004764612503895905, 0.004654070211978226, 0.0028564927567959, 0.002888969333083541, 0.0029381630471173137, 0.0029516921200766623, 0.0029279656822541657, 0.0028768540055294114, 0.002809447539494917, 0.0027344243751212414, 0.002650447879003445, 0.0026162242385624314, 0.002612007516475851, 0.0026388166263776698, 0.0026942977329819863, 0.0027710770943657156, 0.0028548878199295812, 0.0029341726650629445, 0.003014619363949533, 0.0031017859389682457, 0.0032000511534022178, 0.0033154716432488513, 0.003452117406549606, 0.0036121313700836714, 0.003798848583554148, 0.004016741252694524, 0.004271274206586709, 0.004567864745892763, 0.004911340179831031, 0.0053049184765477635, 0.005751200512150037, 0.006251618423981167, 0.006806228475918239, 0.0074297241798057115, 0.008153968665843747, 0.009005966358729236, 0.009993326285693814, 0.011114565660509763, 0.012355612004789374, 0.01368402343077337, 0.015040968607317202, 0.01635142603505412, 0.017562271511795246, 0.01866487374105939, 0.019685585909814434, 0.020665859545955515, 0.021603142484835292, 0.02244266789840224, 0.023119425009780398, 0.023588528272658872, 0.0238635818127561, 0.023984435730780088, 0.023985061172686808, 0.023885067139267406, 0.02369094609678798, 0.023411349448106404, 0.023054856851293277, 0.022627795447164402, 0.022136538552693777, 0.021595760666443847, 0.021029768201904855, 0.020459822135848516, 0.019917666868718233, 0.019427529352214774, 0.01898004456476859, 0.018549159210625867, 0.01811640585885309, 0.017667051896765575, 0.0171852134739952, 0.016669116940738127, 0.01612725632683192, 0.01556855300869513, 0.014999808370582807, 0.014430932747359713, 0.013863769792228036, 0.013285294965668822, 0.012684753723496481, 0.012053826241428037, 0.01138373111223844, 0.010664356907546033, 0.009888610988649498, 0.009056241838910578, 0.008168866569175337, 0.007215211520366868, 0.006183385490817425, 0.005057982685980093, 0.0038100258698757503, 0.0024020004974091565, 0.0009226297073097571, 0.00032248540772282427], [-0.00013366353345770475, -0.00011651899777577713, -7.157544063119142e-05, 6.098834515629113e-06, 0.00012321567148849394, 0.00028595310316922396, 0.000493359781581849, 0.000709136829999282, 0.0004274539610136123, 0.0005171115110838051, 0.004112371304434677, 0.004345035571890342, 0.002820530520696957, 0.0028705761881679366, 0.002926195056795817, 0.0029431568915304295, 0.0029215827737186567, 0.002871941292770754, 0.002805612743567493, 0.002731449833871525, 0.002650790311576966, 0.002616692721490982, 0.002612584657360082, 0.0026394902310533457, 0.0026950580980931492, 0.0027719134786653183, 0.00285578689371564, 0.0029351270119940074, 0.003015627496280481, 0.0031028485693267265, 0.003201170890074462, 0.0033166544686200937, 0.0034533718301918486, 0.0036134672581358135, 0.0038002776146026664, 0.004018277423245702, 0.004272934053067143, 0.004569667353370204, 0.0049133070122947065, 0.005307072315495723, 0.00575356474440758, 0.006254216181421995, 0.0068090835991853815, 0.007432869357697869, 0.008157453486848099, 0.009009858285885446, 0.009997700064995604, 0.011119498787106084, 0.012361179170036991, 0.013690287334682034, 0.015048021562511716, 0.016359260437043013, 0.017570850206457586, 0.01867403168456909, 0.01969524197045333, 0.020675951525324525, 0.02161361886725669, 0.02245346735721826, 0.02313047289426781, 0.023599722422528644, 0.02387480601409567, 0.0239958007601617, 0.023996491108610025, 0.0238965059121793, 0.023702341363814963, 0.02342265319645394, 0.023066025501345202, 0.022638788055723443, 0.022147315682539782, 0.02160710918098071, 0.02104072699233789, 0.020470444329093118, 0.019927980953117236, 0.019437564070373822, 0.0189898333336706, 0.018558722567773724, 0.01812575548048656, 0.017676190865791246, 0.017194135221407506, 0.016677809243318575, 0.016135708166959913, 0.015576758082764807, 0.015007763876819314, 0.01443881713607829, 0.013871588552582208, 0.013293043227721905, 0.012692416746947086, 0.012061382734693746, 0.01139115372221625, 0.010671611642064848, 0.00988976490409635, 0.009061081063351024, 0.008173575204592779, 0.007219606639519938, 0.006187337666863366, 0.0050613696943390095, 0.0038127163021716335, 0.0024038330882223398, 0.0009234526213307299, 0.000322525566404832]], [[-0.004086899341397466, -0.003972271729580904, -0.003833422684789436, -0.0036795577263566475, -0.0035275055000259306, -0.003401208739967073, -0.003327238239807419, -0.003320314628048128, -0.0033722314273745787, -0.0034090320321460885, -0.00296772273204245, 0.00047903794753153465, 1.645775752315937, 2.023609640817852, -0.16859653371615255, -0.015883545045919555, -0.012008180016020921, -0.011152596563019215, -0.010774480473180238, -0.01053424745351127, -0.009912099446112146, -0.009941976495249687, -0.01001319557326553, -0.010130520794721362, -0.010295216072763076, -0.010503274722323066, -0.010741094552687068, -0.010987580411266221, -0.011248795014460217, -0.011533387614443499, -0.011850123255127926, -0.012212977863689231, -0.012631241333154877, -0.013109209950353234, -0.013653725620025006, -0.014274005120010142, -0.014984032449697735, -0.015797960775115052, -0.016727443717104627, -0.017780997458988024, -0.018967803313323633, -0.020300276319514553, -0.021785552873689835, -0.023453665472273105, -0.025370226476776933, -0.02758064238641204, -0.030085771033838266, -0.0328628634297621, -0.03585593594659087, -0.03896705594847415, -0.042043144548764476, -0.04492356530559347, -0.0474878597236704, -0.04971193616103948, -0.05165516634257739, -0.05340142390981405, -0.05496936700038023, -0.05628222859615852, -0.05724720621669983, -0.05778741508465208, -0.05792283048248751, -0.057734138942937406, -0.05729556591504421, -0.05665740657534614, -0.05583793847115603, -0.05485362962674956, -0.053734747444755385, -0.052496330278005494, -0.05114969691086739, -0.04972259574711817, -0.048258797371193624, -0.04680141155219457, -0.045413052766681734, -0.044134390520591614, -0.042944005003814525, -0.04179303920229962, -0.040644994451249035, -0.03947065096082599, -0.03823879034276374, -0.036949367833210796, -0.03561814833495229, -0.03426188679615199, -0.03289367252799681, -0.031533706803469105, -0.030182738896189963, -0.028810377236015212, -0.02739573151326387, -0.025921846874422047, -0.024370497350387012, -0.022721057212043552, -0.020771275526720638, -0.01885386396261502, -0.01680047543453126, -0.01458529018377824, -0.012167221629942179, -0.009491652512207117, -0.0064604663575915135, -0.002815858362501976, 0.0011823715394685245, 0.0035772976731857195], [0.00289481244577755, 0.0028494181728731596, 0.002789655656596307, 0.0027241031485528496, 0.002667261399760401, 0.002639742292529439, 0.002666330034428731, 0.002769058315992968, 0.0029598632481937196, 0.0032195784403315072, 0.0033686612165054496, 0.002576970077061026, -0.5129967559904482, -0.2796135820647374, 0.028600968631907968, 0.008509780309922632, 0.007390113204661287, 0.007186689689472238, 0.007109689315875802, 0.007055436566932556, 0.006875313262243085, 0.006908807931492488, 0.006968364067041506, 0.007057904531022373, 0.007178714967144568, 0.007328261506477863, 0.007497389974325155, 0.007672165401108531, 0.007857068789373148, 0.008058155979308873, 0.008281567873513612, 0.008537120992561934, 0.008831356104383108, 0.009167306111676035, 0.009549780579253571, 0.009985248773942888, 0.010483504403753474, 0.01105446192887451, 0.011706291558012593, 0.012444952768472774, 0.013276850744730052, 0.014210644435968534, 0.015251409690293325, 0.0164203007502888, 0.017763322165250093, 0.019312443442300025, 0.02106838662411562, 0.02301531816821574, 0.02511413354705105, 0.027296322066462188, 0.029456194184334254, 0.031479392247540365, 0.033281467340459205, 0.03484544287913157, 0.03621277667641237, 0.037442217604842315, 0.038546559502095, 0.039471741974125285, 0.040152528544528825, 0.04053516898249202, 0.040633863546025946, 0.040504515837501316, 0.04019960643760154, 0.039754246635574225, 0.03918127990687237, 0.03849437881738757, 0.03771136441307954, 0.03684394362963048, 0.035900256110059044, 0.034899850869911535, 0.03387344679527362, 0.032851299474749504, 0.031877336105107235, 0.03098011502836591, 0.03014460427701293, 0.02933653051616695, 0.028530449370707315, 0.027705928331687227, 0.02684112640490742, 0.025936027149973638, 0.02500172064454747, 0.02404998255882309, 0.02308999329590226, 0.02213589824481109, 0.021188242080346503, 0.020225794120814575, 0.019233990760978495, 0.018201041231475215, 0.01711427750878877, 0.015959362023213308, 0.014668788304772553, 0.013428097397378267, 0.012036282805461112, 0.010548799346646652, 0.008946298066825766, 0.007197794046785517, 0.005276020049727484, 0.003100848201690726, 0.0009474869747643536, 0.00048495949184287234], [0.0022607431226519072, 0.0022318328512775463, 0.002192210954753089, 0.002148952741938668, 0.0021138543261480618, 0.002103680287330848, 0.0021388758718425033, 0.002238769378996836, 0.0024159255314391975, 0.002661445663459952, 0.002862229455202491, 0.002545378969217598, -0.2813626632559915, -0.10691422299535001, 0.0135540349774404, 0.006144916542446752, 0.005567592276260351, 0.005482289483079243, 0.005457022378320575, 0.005435831524421709, 0.005342769810675739, 0.005371181271826971, 0.005419357121115221, 0.005490461168185493, 0.005585568786471175, 0.005702756686231722, 0.005834963579792259, 0.00597149076936012, 0.006115871866378214, 0.00627282336971607, 0.006447128765333892, 0.006646439262066387, 0.006875855761777122, 0.007137744983285791, 0.007435856323217487, 0.007775231241831755, 0.008163497919170091, 0.008608379008057028, 0.009116239754219681, 0.00969172101541345, 0.01033980708686824, 0.011067235660223048, 0.011877974630816381, 0.012788523089492734, 0.013834723095633997, 0.015041506478474749, 0.016409458034996532, 0.01792626348978163, 0.01956148403825944, 0.02126177181567848, 0.022945087520850276, 0.024522016664191553, 0.025926767350222854, 0.027146097544021686, 0.028212275373808705, 0.029171060958677525, 0.03003236871222467, 0.030754036962681898, 0.03128520919384681, 0.031584037873488686, 0.03166162228956358, 0.0315613931079352, 0.03132431849823219, 0.030977725265045192, 0.030531624913968637, 0.029997062123418555, 0.029387293439198044, 0.028711654328128715, 0.027976523915690346, 0.027197149976636806, 0.02639747086288186, 0.025601063979075335, 0.024842157470260254, 0.024143008959354825, 0.023491904608954367, 0.022862139005776574, 0.022233915601357308, 0.02159132564434613, 0.02091736171452624, 0.020212013762027973, 0.019483928766561034, 0.018742286267155937, 0.017994089279171156, 0.01725049072692998, 0.01651193877294419, 0.015761937144078843, 0.01498918662828747, 0.014184554655472907, 0.013338236030143532, 0.012439135611670168, 0.011467432731633408, 0.010449312662111993, 0.009365577025100961, 0.008206480709269012, 0.006956806925147927, 0.005599278217538572, 0.004105221189955376, 0.0024236698657847276, 0.0007437551692425343, 0.00039620803217078025], [0.0019058793914306603, 0.001887106275591446, 0.00185973900918293, 0.0018300641719993002, 0.0018084299245514758, 0.0018095406939635107, 0.0018515652637071977, 0.0019526134342811503, 0.0021260537651855175, 0.002369580032654361, 0.0026110566106090274, 0.002601970319051964, -0.1350967642418938, -0.027722452083235375, 0.0065031165991185635, 0.004751357112840688, 0.004519187880133085, 0.004510248211009982, 0.004518794256555849, 0.004519058806852443, 0.004481357820237334, 0.004507238487720276, 0.004549277265129049, 0.004610227116038642, 0.004691055676423767, 0.004790189119250446, 0.004901749700009684, 0.005016875582668187, 0.0051385749156140905, 0.005270812824005049, 0.005417611381602496, 0.005585407847436159, 0.005778496283281758, 0.005998870310635417, 0.006249685057926203, 0.006535181392516721, 0.006861772697022547, 0.007235952142951861, 0.007663072663963811, 0.008147035287572279, 0.008692026595188432, 0.00930370559261142, 0.009985420633090084, 0.010751062490606375, 0.01163077371584039, 0.012645542520583669, 0.013795879805001972, 0.015071448018149362, 0.016446672215878415, 0.017876712386856383, 0.019292835087191228, 0.02061957085693192, 0.021801591653180095, 0.022827747759998396, 0.023725149018733304, 0.024532269441401012, 0.025257401193336915, 0.025865049869347324, 0.026312419508492932, 0.026564342094017594, 0.026630182733247337, 0.026546359697600986, 0.02634739570697441, 0.02605624781633038, 0.025681339971033373, 0.025232297263985713, 0.024719729531047015, 0.024151671890719775, 0.023533521292565897, 0.02287811558621927, 0.0222055910794612, 0.021535193795310645, 0.020896259002025006, 0.02030751779018368, 0.019759109110421426, 0.019228564925618457, 0.018699285092311526, 0.018157905975271758, 0.017590140051932986, 0.01699599334088092, 0.016382751374810753, 0.015758143473327536, 0.015128189003680665, 0.01450215191053468, 0.013880392067773428, 0.01324902193391457, 0.0125985360568621, 0.01192125445656633, 0.011208931338435044, 0.010452236945083569, 0.00964334458907398, 0.008787098646367699, 0.007875521234667952, 0.006900384944556016, 0.0058488137350886935, 0.004706119232469256, 0.0034478487885612114, 0.002037107692216915, 0.0006245969471531792, 0.00035092451368123916], [0.001828944663320986, 0.001812578473188792, 0.0017880934949050743, 0.001761617335971926, 0.0017431993200446789, 0.0017471185767411004, 0.0017910851989174957, 0.001893012638880243, 0.002066547442135196, 0.002311006738045056, 0.002564003251920881, 0.002631280314180709, -0.09956851479332418, -0.014656840526960304, 0.0052964962381846885, 0.004433070783316036, 0.004285373439230497, 0.004295343277891128, 0.00431233519722811, 0.004317928603774964, 0.004293752384038697, 0.004319156435982042, 0.0043599179282177375, 0.004418703956924067, 0.004496461081747189, 0.004591693016566025, 0.004698781417460969, 0.0048092685659855035, 0.004926049780632397, 0.005052926875881055, 0.005193756456258281, 0.005354712111485652, 0.005539912749541932, 0.0057512710444069465, 0.005991813072495106, 0.00626560578657998, 0.006578798549490954, 0.006937617334899236, 0.007347195114264947, 0.007811272094737724, 0.008333861339657474, 0.008920387207159378, 0.009574063856186558, 0.010308215884782451, 0.011151747441287328, 0.01212479063277481, 0.013227841007164799, 0.014450991204507997, 0.01576972398037231, 0.01714104883722571, 0.01849913305356342, 0.019771527094162984, 0.020905176592455773, 0.021889385962431004, 0.022750143241800837, 0.023524338951822474, 0.024219911087244615, 0.0248028125511095, 0.025231997820715002, 0.025473751142915602, 0.025537061954076377, 0.02545682094126443, 0.025266152894189816, 0.024987064501927708, 0.024627634924947534, 0.02419719322253826, 0.023705754281552343, 0.02316107746900907, 0.022568180359677885, 0.021939441729910508, 0.021294198977575552, 0.020651487581277075, 0.0200389292280462, 0.01947448654247054, 0.018948704402186444, 0.018440039973615856, 0.017932577811373973, 0.017413505437000043, 0.016869123860163253, 0.016299438699533337, 0.015711437609787604, 0.015112533148851972, 0.014508497314385109, 0.01390821273380999, 0.013312025180866128, 0.012706621028250945, 0.012082887851996444, 0.01143346269916556, 0.010750439738441201, 0.010024873312305256, 0.009249502638742349, 0.008428321575542044, 0.007554060810832393, 0.006618823686950969, 0.0056102466695617526, 0.004514214747063038, 0.0033072225842564703, 0.001955776288133395, 0.0005996649957544333, 0.0003391062784370292], [0.0017861351184649014, 0.001771166354351023, 0.0017483478391120946, 0.0017237220625556352, 0.0017071762533759866, 0.0017127588190212074, 0.0017579343004530716, 0.0018605257372228013, 0.0020343631718258747, 0.002279720960151365, 0.0025398771234109887, 0.0026523240111364405, -0.07873721237984418, -0.008485840031340057, 0.0047113566073960335, 0.00425142024867063, 0.004153457906828438, 0.004174604246865166, 0.0041966056427768655, 0.004205352417139635, 0.004189124915719508, 0.004214283780782026, 0.004254349331353013, 0.004311941773837239, 0.004387996573965699, 0.0044810610862048815, 0.004585662087457091, 0.004693568361278539, 0.004807612746198858, 0.0049315060695922985, 0.005069012752717815, 0.0052261595347133614, 0.005406967797043985, 0.005613305154674551, 0.005848125814826951, 0.006115399861303279, 0.006421129565011779, 0.006771392040816599, 0.007171197727717187, 0.007624197228045185, 0.00813430689355463, 0.008706820296222334, 0.009344876958081576, 0.010061486242411625, 0.010884862438702491, 0.011834660970609033, 0.012911369029217367, 0.014105319084391959, 0.015392583330042026, 0.01673120180216685, 0.01805696030255161, 0.01929908876646916, 0.020405799409694045, 0.02136664948486628, 0.022207001845804646, 0.02296286482485139, 0.0236419786570419, 0.024211102096459318, 0.024630164440634757, 0.02486625918378079, 0.02492816680753721, 0.024849925964350938, 0.024663883426642864, 0.024391516228368305, 0.024040711511088022, 0.023620636869129245, 0.023140873076522878, 0.022609014991379663, 0.022030161992222158, 0.021416350758968927, 0.020786441602878937, 0.02015901047553093, 0.019561016117367613, 0.01900999070361437, 0.018496702156500396, 0.018000121351738497, 0.017504713163865468, 0.01699797137495802, 0.016466524567016992, 0.015910379541704593, 0.015336358159400649, 0.01475169677007616, 0.014162029798335035, 0.013576027521108383, 0.012994026570400108, 0.012403030700782974, 0.011794145714412431, 0.011160185369994541, 0.010493432289625263, 0.009785154371243889, 0.009029969672586414, 0.008228350085535822, 0.007374898854661806, 0.006461903050304676, 0.005477283307117301, 0.004407241464788935, 0.0032287952959151067, 0.0019104061879785883, 0.0005856162702074572, 0.00033218919375056685], [0.001762481396702215, 0.0017483070729915674, 0.0017264333882508133, 0.0017028570846642744, 0.0016873774367305362, 0.0016939176471639098, 0.001739810298753384, 0.0018428357102184744, 0.0020169363763380866, 0.0022629362600149754, 0.0025273361588213283, 0.0026657692653220184, -0.06681881636922947, -0.005499595939453285, 0.0044212869545779045, 0.004149282587763649, 0.0040798741367252, 0.004107447428171949, 0.004132335722382504, 0.004142897097606844, 0.004131223953123849, 0.004156255031659765, 0.0041959417301264, 0.004252878688583028, 0.004327995486357645, 0.004419863780399883, 0.00452309083127812, 0.004629571200322063, 0.004742103320143119, 0.004864347700680234, 0.005000017786735044, 0.00515505912589117, 0.005333439188352942, 0.005537000686083085, 0.005768658093291159, 0.006032327933544823, 0.006333931135066144, 0.006679462494347892, 0.007073864694555994, 0.00752073878303297, 0.008023947613971986, 0.008588712411537105, 0.009218131471453988, 0.009925039905431761, 0.010737270539829586, 0.011674215294527114, 0.012736356814506519, 0.013914160258202971, 0.0151840238467001, 0.01650455755452643, 0.017812443179443506, 0.019037838261658478, 0.02012965539114133, 0.021077591577227047, 0.021906663866912503, 0.022652392741843212, 0.023322408905062167, 0.02388391656687541, 0.024297383955732187, 0.024530352143987324, 0.02459148619080685, 0.024514353192800823, 0.024330869982657172, 0.024062220621836085, 0.023716028962750674, 0.023301686514888984, 0.022828316880374185, 0.022303574644169082, 0.021732480087454317, 0.021126904993034646, 0.020505453595117084, 0.019886450462696048, 0.019296490511339387, 0.018752867218104638, 0.018246470896287302, 0.01775655629793868, 0.017267798467788715, 0.016767860400332464, 0.016243551749275, 0.015694880186987534, 0.015128576082440857, 0.01455177818944093, 0.013970044704839387, 0.01339192835802788, 0.01281776023437116, 0.012234719004361407, 0.011634030975702854, 0.011008607419630143, 0.010350836667790402, 0.009652105842314556, 0.008908654711105338, 0.008117850822902182, 0.00727590447202455, 0.006375204134839995, 0.005403827235036645, 0.004348150263844662, 0.003185479416026863, 0.0018853828090308, 0.0005778895727219975, 0.00032842356824436654]], [[0.005092432041770859, 0.005015474603446942, 0.00487337503305631, 0.004667440324167135, 0.004402233817446122, 0.004088423609406679, 0.003746132257769623, 0.0034072308403314214, 0.0031186283143886727, 0.002956398411487668, 0.002946426952795972, 0.0030454499638579552, 0.0032057782301575665, 0.003388910249281443, 0.003566985611790813, 0.0037198234884796614, 0.003830985157445557, 0.003867250074079707, 0.002105254566244977, -0.018131754854054827, -0.0008558972489753209, 0.008261517318214687, 0.0058934533259985865, 0.005323058976841172, 0.005371897675487477, 0.005482246286552558, 0.00560483891303794, 0.005736158334171619, 0.005876588896513849, 0.006027946412413911, 0.006193272907264409, 0.00637803071866761, 0.006585772708924769, 0.006817898090706954, 0.007076632174150858, 0.007364956943904716, 0.007688264761805093, 0.008052156766515824, 0.008460971227704894, 0.008918061944230962, 0.009427862606522126, 0.009998085782859996, 0.010634799941530684, 0.011348669312311849, 0.012160643315207024, 0.01307922686518392, 0.014097024511604692, 0.015196652365459033, 0.01634674186606711, 0.01750066331136874, 0.018596553882577485, 0.019578138519886, 0.020404370739291664, 0.021065744073188352, 0.02158419126623856, 0.021985045669785964, 0.02228341768252757, 0.02247307981804703, 0.02254451798168576, 0.022485688186777156, 0.022300538265107625, 0.022013060979561818, 0.02164834541108075, 0.0212262488763406, 0.020754961953831568, 0.020243335680937773, 0.01969985575398999, 0.019132415720131017, 0.01854404803626042, 0.017941294541965788, 0.01733632519850842, 0.016741048244661477, 0.016173539932826563, 0.015641586635546226, 0.01513681242762679, 0.014646533872433228, 0.014160588185968017, 0.013670610395163933, 0.01316779275991339, 0.012654122002286569, 0.012133645389756921, 0.011610656080745657, 0.011088681454489198, 0.01057380174379695, 0.010064698402023476, 0.00955027089471213, 0.009024766361588972, 0.008483676291413746, 0.007928456021923514, 0.0073395218223199134, 0.006593824098871926, 0.005917203717253934, 0.005196013629033744, 0.0044193116709164175, 0.0035696106322716825, 0.002624871309319514, 0.0015483388355091647, 0.0002935859083308922, -0.0010982097641232633, -0.0016576128999000288], [0.004952353714001228, 0.004884131332892885, 0.004753071665169223, 0.004560729755718732, 0.004311808293138643, 0.004016916944082373, 0.003695826348726991, 0.0033798007938348716, 0.003113744381775354, 0.0029695309785887337, 0.002972126251082145, 0.0030804860487672857, 0.003249397772259021, 0.003442758374555182, 0.0036354218253846996, 0.0038111775086599304, 0.003960029844275689, 0.0040688897665567695, 0.003388370024285313, 0.0001606066445863909, 0.0035702347575168455, 0.0055096281341340805, 0.0051322400631453125, 0.005105295536421781, 0.0051889719372190425, 0.005302442966063699, 0.005425333803250633, 0.005555732055983948, 0.005694483424790772, 0.005843483453110949, 0.006005764925383868, 0.00618669326703332, 0.006389767495435421, 0.006616382648305876, 0.0068687266393732795, 0.007149715733261522, 0.007464596077215024, 0.007818815601285518, 0.008216597969492341, 0.0086612054233776, 0.009156938022514717, 0.00971127020176677, 0.010330151686352903, 0.01102400692114338, 0.011813184338162874, 0.012705972697794353, 0.01369520959090278, 0.014764016493678568, 0.015881928106599892, 0.01700364434632149, 0.018069126729943895, 0.019023578081425546, 0.019827186961472603, 0.020470721930129786, 0.02097545118051444, 0.021365948687794713, 0.021656722075075508, 0.021841667097804218, 0.02191205396632694, 0.021855507295848873, 0.021676247034189453, 0.021397050294526244, 0.021042755873721224, 0.020632601793750337, 0.020174605443581364, 0.01967737918629748, 0.019149181167651103, 0.018597699764634983, 0.018025937780496014, 0.017440290623544314, 0.01685258099873936, 0.016274359267717687, 0.01572312684438053, 0.015206378798301418, 0.014715958932772702, 0.014239595318775078, 0.013767462355842157, 0.013291473724491746, 0.012803110072884503, 0.012304320200618796, 0.011799536262540652, 0.011292517599756127, 0.010786700333342635, 0.010287969815250016, 0.00979504562591697, 0.009297235139103258, 0.008789086767727848, 0.00826606011777115, 0.0077259361054290345, 0.007157084423933154, 0.0065503375529573265, 0.0059212917489730845, 0.0052575400986377046, 0.004548511852919052, 0.0037890202259481254, 0.002967965761395596, 0.002072564435658989, 0.0010944370618394788, 0.0001542954765312626, 0.00025717152573558066], [0.004930723171364597, 0.0048643571178524974, 0.004735549020760776, 0.004545914005798954, 0.0043001965897511065, 0.0040090154379559435, 0.003692102306820823, 0.0033806484792711033, 0.0031191936833853814, 0.0029788016652073997, 0.0029842800458179312, 0.003095006416011088, 0.0032662399275484124, 0.0034623506012377986, 0.003658760928540496, 0.003840135233376438, 0.003997932256453088, 0.00412364519772162, 0.004167407168371293, 0.003400432166038998, 0.004171472722649536, 0.005109053351786001, 0.004980355709099403, 0.005052394106885518, 0.005158028927095269, 0.005272454291754095, 0.0053956726231764425, 0.005526134981647323, 0.0056647944961357045, 0.0058135689657408925, 0.005975495455732577, 0.00615592851680524, 0.006358362216780627, 0.0065841935798417375, 0.006835606571235081, 0.007115508557600574, 0.007429123270191406, 0.007781875047129881, 0.008177970217848813, 0.008620656939221248, 0.009114213740822361, 0.009666076293206254, 0.010282179680279615, 0.01097291542674033, 0.011758537265342603, 0.01264730194267154, 0.013632085306052324, 0.014696088953354692, 0.01580899016233845, 0.016925697767553892, 0.017986464401459498, 0.018936715725125387, 0.01973683913773685, 0.020377646706031285, 0.02088029930855039, 0.02126924886487889, 0.021558895569783364, 0.02174315052427548, 0.021813445122040247, 0.021757301989220067, 0.02157901228593847, 0.02130112279847186, 0.020948467402792586, 0.020540182887449392, 0.020084263893717397, 0.019589286296690017, 0.01906347355419904, 0.0185144832783875, 0.017945317815825954, 0.017362352533293626, 0.016777316916169394, 0.016201714183373447, 0.015652954796360773, 0.015138487991816597, 0.014650201576144663, 0.014175901947556847, 0.013705830266600562, 0.013231959510565886, 0.012745830653752767, 0.01224939386029405, 0.011746598258282738, 0.011241619056760648, 0.010737868886067098, 0.010241196759403473, 0.009750315906969464, 0.009254582097337625, 0.008748580486298068, 0.008227729700923465, 0.007688934260180577, 0.007122324713189231, 0.00651824173624927, 0.005891569346094335, 0.00523001299741235, 0.004527231038108246, 0.003773386080528168, 0.002959194206894218, 0.0020660553754672435, 0.0010915701695563482, 0.00015713104134138035, 0.000272867578428701], [0.00492626545421516, 0.004861546865471104, 0.004734565728504044, 0.0045470038310549245, 0.004303664934015943, 0.004015214475446604, 0.003701414728776715, 0.0033934935152604225, 0.0031357789073373724, 0.0029987649397357516, 0.00300718688776908, 0.003120706069323203, 0.0032949014839904816, 0.0034944966362334224, 0.0036954034976521668, 0.0038831194167559856, 0.004050547874483605, 0.004193799402296947, 0.004283255163308988, 0.003896579284983975, 0.004499489760133568, 0.004921708120656226, 0.004948866784234306, 0.00503654762451167, 0.005144932050954428, 0.005260731003005915, 0.005384718331370768, 0.005515708231290909, 0.005654766168365322, 0.005803839313231848, 0.0059659798401146295, 0.006146550253477968, 0.006349051988525501, 0.006574889036999011, 0.006826249102191015, 0.007106040833483888, 0.007419483746575747, 0.007771997482561751, 0.008167785702094924, 0.00861009379247116, 0.009103193615326747, 0.00965450788655213, 0.010269977881770991, 0.010959998577614953, 0.011744799464447286, 0.012632634091714383, 0.013616391850740338, 0.014679296046755755, 0.015791061062192215, 0.01690664776314944, 0.01796639222098582, 0.018915752625322083, 0.019715177606957738, 0.020355490784948162, 0.02085781921664733, 0.02124657771722992, 0.021536108576496873, 0.021720316872703906, 0.02179076709913907, 0.021734823181861648, 0.021556812777944336, 0.02127913417203908, 0.020926704678389713, 0.020518627163746826, 0.02006292233771717, 0.019568166783081084, 0.019042584458098397, 0.01849383499819975, 0.017924936052587385, 0.017342270170663886, 0.01675759574253218, 0.016182389464108476, 0.015634022913599478, 0.015119911208825963, 0.014631933495436584, 0.0141579162364377, 0.01368811802384998, 0.0132145248438616, 0.012728691732745172, 0.012232573848468216, 0.011730122715104947, 0.011225511958301279, 0.010722151059947437, 0.01022587784213532, 0.009735394598696967, 0.009240067273782073, 0.008734501325078263, 0.008214059814767019, 0.007674749665624544, 0.007108516904489148, 0.006512860148910811, 0.0058866541137839205, 0.005225474163114086, 0.004522919159632626, 0.0037689944871794803, 0.0029542183720167596, 0.0020661514550948533, 0.0010926636266340255, 0.00016069156268650362, 0.00028987624526409365], [0.004925024162572233, 0.0048608103081991035, 0.004734387451813485, 0.0045474579170467055, 0.004304843802175081, 0.0040172252024516745, 0.003704374289736213, 0.0033975309349110238, 0.003140959308504164, 0.003004980162560272, 0.0030143071811241985, 0.003128687843165436, 0.003303798305937127, 0.0035044698106568416, 0.003706764163877243, 0.0038964344053463093, 0.004066827942139719, 0.004215474569079914, 0.004318978966923597, 0.004049266677052329, 0.004567992047908485, 0.004880657645027692, 0.00493931523798518, 0.005031808324056716, 0.005141040815907636, 0.005257265039997149, 0.0053814920042525635, 0.005512647500239439, 0.00565183155363943, 0.005801000414866758, 0.005963210982553481, 0.0061438283465762395, 0.006346356298559101, 0.006572201008832201, 0.006823551387050541, 0.007103316553080639, 0.007416714863448869, 0.007769164657315349, 0.008164868885035976, 0.008607072167529718, 0.009100044428583835, 0.009651204596219222, 0.010266496004974986, 0.010956314964822588, 0.011740884043795996, 0.012628456024683907, 0.013611924276014402, 0.01467451833650153, 0.015785963201414857, 0.01690123455184309, 0.01796069254573801, 0.01890980394365363, 0.019709035163180937, 0.020349213134240967, 0.020851462525913408, 0.021240149176678397, 0.021529585712206107, 0.021713672876423933, 0.02178415016041104, 0.021728136157390603, 0.021550099807991132, 0.0212723911784486, 0.020919956279176657, 0.02051188990216433, 0.020056211878511164, 0.019561497214709813, 0.01903596852975141, 0.01848728446927772, 0.017918465403059834, 0.017335894772452433, 0.01675132685918688, 0.016176233905326694, 0.015627978444759133, 0.015113965495033289, 0.014626070849707237, 0.014152127351753488, 0.013682399124310388, 0.013208876247085157, 0.012723118190750633, 0.012227082468677717, 0.011724721733798217, 0.011220209274270991, 0.010716953716004757, 0.010220789590621098, 0.009730800368316464, 0.009236066168143549, 0.008731176047000648, 0.008211396060192607, 0.007671496508176301, 0.007105739170544262, 0.0065117189317621255, 0.005885641278621096, 0.005224568124170776, 0.004522087585250461, 0.0037681765198484376, 0.0029532812815638255, 0.0020647856090328094, 0.001093682898881479, 0.0001618348913014832, 0.00029515490653722896], [0.0049242659304625375, 0.0048603698623443745, 0.004734298234746409, 0.004547766322008973, 0.004305607802794404, 0.004018512061995693, 0.0037062576064205463, 0.003400092053701647, 0.003144239517630068, 0.0030089118855253756, 0.0030188093546944946, 0.003133733508907906, 0.0033094215207239604, 0.0035107723587009753, 0.0037139421432814514, 0.003904844989567282, 0.004077108048961677, 0.004229155571456204, 0.004341514427610654, 0.004145561355778746, 0.004603334921774377, 0.004858780946229751, 0.0049333187055576036, 0.00502884605397654, 0.005138613558618497, 0.005255106371087708, 0.005379484968856706, 0.005510745469901999, 0.005650009686175892, 0.005799239600025468, 0.005961495102499278, 0.006142142939106511, 0.00634468840368874, 0.006570539046466143, 0.0068218845480808, 0.00710163433913167, 0.007415006071101289, 0.007767417289109227, 0.008163070516400323, 0.00860520990675544, 0.00909810418353479, 0.009649169923779196, 0.010264351788670844, 0.010954046979306197, 0.011738473799876395, 0.012625884590331852, 0.01360917519103178, 0.014671578987271628, 0.01578282751491291, 0.016897960376877803, 0.01795729691081336, 0.01890629317210153, 0.019705414863227907, 0.020345482365309208, 0.020847601494120935, 0.02123616391944274, 0.021525476483160395, 0.02170944228875553, 0.021779804510398074, 0.02172369440084694, 0.021545588779344902, 0.021267809924269954, 0.020915323293253792, 0.02050721901611477, 0.020051516414312718, 0.019556789494939972, 0.019031259995044233, 0.018482585786377705, 0.017913788553208437, 0.01733125216656436, 0.016746729208562315, 0.016171689262344923, 0.015623489210577437, 0.015109526421131688, 0.014621672702052913, 0.014147764552776405, 0.013678069570372415, 0.01320458040576883, 0.012718859449416203, 0.012223182311635971, 0.011721279297471559, 0.01121729498097456, 0.010714622133858953, 0.010219083163983535, 0.009729359725283628, 0.009234819671359201, 0.008730090133177762, 0.008210453255959685, 0.007670688060370864, 0.007105061346325302, 0.006511561612152716, 0.005885571857048698, 0.005224576741918378, 0.004522160502498258, 0.0037682884033670722, 0.0029533779100565875, 0.0020647489854598022, 0.0010931792568662807, 0.00016258198169832806, 0.0002985077164710359], [0.004923779287374615, 0.004860073039272406, 0.00473421159961045, 0.004547917947907413, 0.0043060326293841815, 0.004019250489041617, 0.003707353668840633, 0.0034015941817726733, 0.0031461719592301186, 0.0030112335198427967, 0.003021470849566836, 0.0031367180573273357, 0.0033127489875296604, 0.003514503215497091, 0.0037181932317302165, 0.003909829235448367, 0.004083205122327772, 0.00423727815852648, 0.004354912605248355, 0.004202944839107608, 0.0046214749530892815, 0.004847170790443402, 0.004929709850853522, 0.005027045288827469, 0.005137130830894114, 0.0052537828711356985, 0.005378250947714601, 0.005509573093099009, 0.005648884093711906, 0.005798149333678422, 0.005960430465589946, 0.006141095183602089, 0.006343649651943293, 0.006569502233156637, 0.006820843051833329, 0.007100581703167974, 0.007413935381620626, 0.007766321120842163, 0.008161941159851414, 0.008604039351126745, 0.009096883672516662, 0.009647889247682855, 0.010263001486323888, 0.010952618047049275, 0.011736954550292958, 0.01262432110884407, 0.013607569549471937, 0.01466992676353761, 0.015781120221836552, 0.016896131637327113, 0.01795533452649393, 0.01890419467781888, 0.019703188983483097, 0.020343142511989324, 0.02084516103092537, 0.021233632680004846, 0.021522857812558624, 0.021706740072277075, 0.021777024498077956, 0.02172084977525344, 0.0215426970071611, 0.021264871673347716, 0.02091235068226019, 0.020504221239933187, 0.020048502281343004, 0.019553767138270776, 0.019028236948310993, 0.018479569041489206, 0.017910785809754037, 0.017328271315226036, 0.01674377669391126, 0.016168769787248852, 0.015620603951732957, 0.01510667180176452, 0.014618843010359366, 0.014145221396608664, 0.01367588552048749, 0.013202807861763918, 0.012717543077876904, 0.012222050136326407, 0.011720281145752463, 0.011216405044496733, 0.010713824729634723, 0.010218364442158108, 0.009728710173010658, 0.00923423468005847, 0.008729567521378311, 0.008209992572116893, 0.007670290259482351, 0.007104728524285851, 0.006511460359377946, 0.005885524910346309, 0.005224577941519166, 0.004522201269748855, 0.003768353121198582, 0.0029534336040290344, 0.002064724875161173, 0.0010928573560599864, 0.00016303353957390333, 0.0003005107209001369]], [[0.007565001767915869, 0.007459153052535023, 0.0072550870420514104, 0.006951084575739159, 0.006547988645033869, 0.0060534688172613855, 0.005487766018617681, 0.004889293169425806, 0.0043215083931292635, 0.003903362209450278, 0.003703368975986304, 0.003679618776010318, 0.0037741016869146794, 0.00394567017022141, 0.0041502777095284785, 0.004354979221771632, 0.004562612267829578, 0.0047686328480639, 0.0049643283278292495, 0.005137454609005741, -0.03918003698820004, -0.03280161991152892, -0.027018099347032754, -0.02191910575358659, -0.017610442306705193, 0.02631626619598944, 0.013012201558123992, 0.006707216451294312, 0.006866416634351052, 0.007045409225014137, 0.007242127256516745, 0.007461292450090142, 0.007706036622209987, 0.007978043457726638, 0.008279635134806621, 0.008613962762727335, 0.008987313599664095, 0.009404636956094739, 0.009870587127120075, 0.0103889894788179, 0.010964874673885445, 0.011607203608922461, 0.012323758894958986, 0.01312647705556904, 0.014037086315720725, 0.01506467384887866, 0.01619176974963176, 0.01739953874122383, 0.01865030215885873, 0.019890060507243974, 0.02104916955278263, 0.0220685822591451, 0.022906511630792686, 0.02355329050428949, 0.024033187935331667, 0.02437155034633939, 0.02458622075319934, 0.024678083166875794, 0.024646812104307792, 0.024484179759907323, 0.024195742900595077, 0.02380479209023076, 0.02333584460887682, 0.02281138400611291, 0.022241106814854774, 0.02163518129109517, 0.021005851075159284, 0.020357056171283805, 0.019691671813603068, 0.019016727714841083, 0.018344028769673865, 0.017684953841431476, 0.017057080390073465, 0.016466029915210987, 0.015902703428324675, 0.01537741700759895, 0.014835713594548475, 0.014291290935304863, 0.013736243109991653, 0.013175369305082625, 0.012609941491324814, 0.012043404223792492, 0.011479869693745473, 0.010925480005211402, 0.010378218485031461, 0.00982623088678116, 0.009264140984789776, 0.008687023394169697, 0.008089359621962255, 0.007465163412456079, 0.006648034423500499, 0.005932464732760224, 0.0051699927505478435, 0.0043477070374586336, 0.003444877386102597, 0.0024351347767757594, 0.0012749152199464425, -8.86190145389356e-05, -0.001566940817883898, 0.00020849006649319935], [0.006819294902223943, 0.006728688285763602, 0.00654992779543804, 0.006281661485618577, 0.005924812084458755, 0.005486409324451659, 0.004984756014617857, 0.004454552702555182, 0.003952309046251627, 0.003583557189347505, 0.003409745700888875, 0.003393727573295054, 0.0034840220547550428, 0.003639737119304178, 0.003825402805340717, 0.0040164867442746615, 0.0042084605344166895, 0.004399001258286049, 0.004581243782130684, 0.004745217432580554, -0.006613595217641614, -0.0048514981417892185, -0.003247689291221846, -0.0018235560318987719, -0.0006033209443016247, 0.010937020235690969, 0.008474696425173027, 0.006018506800024993, 0.006170419589355868, 0.0063358124242704275, 0.006515688104404702, 0.006715098710258069, 0.006937339812980131, 0.007183882227433875, 0.007456863653907649, 0.007759133528899881, 0.00809609474062841, 0.008472749878565345, 0.00889328448234795, 0.009361028579192323, 0.009880489739966544, 0.010459722950276681, 0.011105810324223545, 0.011829585450913503, 0.012650597107500782, 0.013575495915134789, 0.014591881976078138, 0.015681177074639504, 0.016809415124499245, 0.017927866072649342, 0.018973983852936, 0.01989439464243617, 0.020651434303225625, 0.02123635941961848, 0.02167097051040499, 0.02197807853332906, 0.022173596812636344, 0.02225822715496088, 0.022231613469283033, 0.022086423082735732, 0.02182740291796016, 0.021475209661617593, 0.021053273553743517, 0.020581328288571277, 0.020068005575166633, 0.019522277375280037, 0.018953708470657894, 0.018368299819310107, 0.017768717619369323, 0.017160732768968918, 0.016554869873295654, 0.01596132994628674, 0.015395890526724179, 0.01486355917657332, 0.01435625041011168, 0.013872038236560674, 0.013384211150250631, 0.01289430971020806, 0.012394979701451724, 0.011889627430840415, 0.011380661222369918, 0.01087143865579595, 0.010365264176031874, 0.00986757970965008, 0.009376572937275418, 0.008881670725145268, 0.00837814759736823, 0.007861691054484813, 0.007327475931034869, 0.006770278474226945, 0.006180565265852763, 0.005566634111468784, 0.004922345786888436, 0.004239306718226732, 0.0035074890460032385, 0.0027179435938922674, 0.0018600235576585072, 0.0009292693908302237, 5.910967939332996e-05, 0.0002664132337252567], [0.006722634823241729, 0.006634434522941573, 0.0064594189846208325, 0.006196301571544054, 0.005846029930059869, 0.005415561260406906, 0.004922952262136355, 0.004402428914642639, 0.003909538122417503, 0.0035479210910232236, 0.0033780825566162753, 0.0033635494629465157, 0.003453760007178312, 0.003607514925749722, 0.003790835211571191, 0.003980741541151694, 0.004171116110310548, 0.004360082699066239, 0.004541104190979969, 0.00470460010800892, -0.002109695561763244, -0.0009855767119499844, 4.055855662117555e-05, 0.000956686950745556, 0.0017494318579186936, 0.008804639790553731, 0.0075950423390025775, 0.005926766903026403, 0.00607848784034454, 0.006242480019204372, 0.0064204008156815845, 0.006617416399696679, 0.006836885880595693, 0.00708024828012028, 0.007349621364801906, 0.007647816268516257, 0.007980097548000846, 0.008351523161544102, 0.008766216995176383, 0.00922743427845222, 0.009739612341813687, 0.010310686720289215, 0.010947654697892257, 0.011661213498166912, 0.01247062602410111, 0.013382089079179193, 0.014384159776303631, 0.015458149968638013, 0.016570574664985568, 0.017673382060468572, 0.018704967044279135, 0.01961267798066266, 0.020359385483378026, 0.020936463261982674, 0.021365385029150523, 0.021668629778184238, 0.021861845402395764, 0.021945701577193333, 0.021919832629704924, 0.0217770294468318, 0.021521910505478102, 0.02117476080947004, 0.020758988776741167, 0.020293923874793326, 0.019788050026037007, 0.019250165296438904, 0.018689336625665517, 0.018112065673636907, 0.01752100700161563, 0.016921723255288883, 0.01632456511073942, 0.015739573327843, 0.01518227928227302, 0.014657606190855158, 0.014157224689791215, 0.013677005067866472, 0.013195818737409552, 0.012712646624529238, 0.012220172429110672, 0.011721535767776625, 0.01121940285622097, 0.01071714010345109, 0.010217911552188428, 0.009727061714946904, 0.009242793335737493, 0.008754684425886986, 0.008258082334389509, 0.007748737736310465, 0.007221892101440423, 0.006672390836815024, 0.006091063068543936, 0.0054890783124594035, 0.004855722711811639, 0.004184648766932992, 0.0034616179545901376, 0.0026833185265448993, 0.0018374830509758561, 0.0009191328975273432, 6.138882556482705e-05, 0.00028093207579664], [0.0066473666119318065, 0.006561285409953169, 0.0063894508331588116, 0.006130637189801199, 0.005785819837785618, 0.005361905424892669, 0.004876761920931151, 0.004364249545322539, 0.003879130148522425, 0.0035234861005474633, 0.0033570712604533907, 0.0033439696019650473, 0.003434376274065257, 0.0035866588609175963, 0.0037682154101192503, 0.003957539475977719, 0.004146914050533807, 0.004334901222379245, 0.004515269742290993, 0.004678797387234687, 0.0014684548367725847, 0.002085710668818578, 0.002652870347418505, 0.003165308710506049, 0.0036180088590921583, 0.007104611855658785, 0.00674398650715079, 0.005853923959083134, 0.006005924364965163, 0.0061690322053367195, 0.006345560797215843, 0.006540805753538328, 0.006758199766286828, 0.006999154707122529, 0.0072657750870927665, 0.007560842670466256, 0.00788950079561307, 0.008256878146244135, 0.008667050090855085, 0.009123207581006158, 0.009629731863697864, 0.010194464305613077, 0.01082433953556966, 0.01152995235030764, 0.012330341125800639, 0.01323127066822552, 0.01422221412236026, 0.015284316125223666, 0.016384466231377313, 0.01747513805298652, 0.01849547108509067, 0.019393374026493305, 0.02013212134672931, 0.020703162501751263, 0.0211277061552136, 0.021427965849606476, 0.021619367711963752, 0.021702546532934224, 0.021677122281493023, 0.021535984267188165, 0.021283647570330386, 0.0209400980567004, 0.020528803006730566, 0.02006875725979702, 0.019568330975401307, 0.019036186111777074, 0.01848096631348369, 0.01790966795686498, 0.017324928223919865, 0.016732112506976492, 0.01614142836430612, 0.01556279337964692, 0.015011553293744814, 0.014492555113476744, 0.013997499484767485, 0.013519729552372848, 0.01304360974621137, 0.012565577591272649, 0.012078335736218894, 0.01158477548693357, 0.0110878307667049, 0.010591024254426434, 0.010097401984519248, 0.009612158229045618, 0.009133468262913868, 0.008651015685584452, 0.008160212008460243, 0.007656861596019171, 0.0071362598866811875, 0.006593308929535396, 0.006024539327617976, 0.005428869974845105, 0.004801918365003516, 0.0041375140914087765, 0.003426071902563391, 0.0026573260289424077, 0.0018208821330665563, 0.0009120156884810199, 6.395374065473228e-05, 0.00029634125393910996], [0.006628138560046758, 0.006542653677145452, 0.006371691048913197, 0.006114042813556983, 0.0057706932698794395, 0.005348537479799741, 0.004865395852934888, 0.004355036018848962, 0.0038720113523920707, 0.003517986646056694, 0.0033525203711540913, 0.0033398460229820026, 0.003430361393398564, 0.0035822799613313117, 0.0037633999737529612, 0.00395265030146881, 0.0041418243852014034, 0.004329616556864414, 0.004509885007791808, 0.004673511228267277, 0.0023740845042799505, 0.002862979186497628, 0.003313898341909493, 0.0037240794618416512, 0.004090556681920357, 0.006672166835668914, 0.006489355568989855, 0.005835000399223255, 0.005987168299193722, 0.006150096463027475, 0.006326298542247112, 0.006521112315775207, 0.006737994674831139, 0.006978350019048672, 0.007244279981159764, 0.0075385589248984875, 0.007866296196766986, 0.008232644735041341, 0.008641667399958015, 0.009096537370509994, 0.009601621255580674, 0.010164736107104394, 0.010792801310110013, 0.01149638633781741, 0.01229447636533695, 0.013192313943519062, 0.014180459784276327, 0.015239589662009778, 0.01633667623112567, 0.017424301914051022, 0.01844183198957905, 0.01933730118142288, 0.020074083802711695, 0.020643657114800307, 0.021067164529517984, 0.02136675477961056, 0.021557798931742426, 0.021640923628233576, 0.021615745772785678, 0.021475181462213968, 0.02122371151474423, 0.020881238003249456, 0.020471254780752436, 0.02001266205787601, 0.019513796835330697, 0.018983280846142512, 0.01842962561576562, 0.01785998364830393, 0.017276989631482335, 0.016685952255922926, 0.01609704106143018, 0.015520141419971177, 0.014970550920298255, 0.014453099653108713, 0.013959528333684466, 0.013479686041727362, 0.013005100705418375, 0.012528726709379814, 0.012043191909239451, 0.01155107814752519, 0.011055708952124984, 0.010560535298388797, 0.010068451429920966, 0.00958467700232843, 0.009107409555687803, 0.008626372509137118, 0.008136996577521212, 0.007635101499930222, 0.007115998368578208, 0.006574605127938949, 0.006008219723167232, 0.005414180493677088, 0.004788903703706432, 0.00412620891142467, 0.0034164661566113237, 0.0026511790606731037, 0.0018168864695857856, 0.0009104027383436215, 6.48163528612996e-05, 0.0003012260489145925], [0.006617206508347047, 0.006532081259421383, 0.006361636609217022, 0.0061046756802778405, 0.00576218855230456, 0.005341064197822127, 0.0048590962308450196, 0.004349999956753677, 0.0038682072525787784, 0.003515138245383942, 0.003350238982300349, 0.0033378306749275045, 0.003428429801212488, 0.003580145942511243, 0.0037610230196235997, 0.003950259529027998, 0.004139340220969566, 0.004327042210156689, 0.004507278774555126, 0.004670994939229508, 0.0028991741707801045, 0.0033136559010101888, 0.0036971870129085932, 0.004048081824310227, 0.004364544364230867, 0.006421117622715707, 0.006330637495961177, 0.0058241234092577384, 0.00597642254661921, 0.006139265880941107, 0.006315293241363624, 0.0065098697893420845, 0.006726468198554021, 0.006966488419498737, 0.007232030638774996, 0.007525865050873876, 0.007853080542713251, 0.00821884616071213, 0.008627217610877208, 0.009081376683842728, 0.009585676520909968, 0.010147913616546614, 0.010774995451171753, 0.011477473903580523, 0.012274288295488397, 0.013170673938427987, 0.014157212361519468, 0.015214612374118957, 0.01630990110810498, 0.017395738610418723, 0.018411591987096756, 0.019305576592336275, 0.020041132317753008, 0.020609752768246458, 0.02103254680072902, 0.02133162474170786, 0.021522324040371122, 0.021605268332424477, 0.021580074713663897, 0.021439677305112762, 0.021188537871862378, 0.02084651096960219, 0.02043711397233856, 0.019979192476716, 0.01948106527241573, 0.018951331669740695, 0.018398422603229176, 0.01782959028671462, 0.017247467653514672, 0.01665743830948102, 0.016069633230356428, 0.015493886421610864, 0.01494544776452858, 0.01442911134107435, 0.013936534658365671, 0.01345759110293893, 0.012983858951584241, 0.012508318096638632, 0.012023615839523804, 0.011532335318626921, 0.011037796987042324, 0.01054344748511937, 0.010052177329398969, 0.009569198206957544, 0.009092711688508856, 0.008612459244905392, 0.008123878912776475, 0.00762279781120501, 0.0071045351174691745, 0.0065640173097429476, 0.005998945507756622, 0.005405818032848416, 0.004781474257496468, 0.004119726800839676, 0.003410917639827761, 0.002646462867721109, 0.0018146903200271542, 0.0009095466678011434, 6.536908559935697e-05, 0.00030434398361097527], [0.006610996102554609, 0.006526080950694191, 0.006355936811414127, 0.006099373285580439, 0.005757383933123216, 0.0053368544071849535, 0.004855563168205115, 0.004347195885917801, 0.0038661145804489783, 0.003513598347062593, 0.003349028989702632, 0.00333677831182122, 0.003427431192795323, 0.00357903361249503, 0.003759774158149038, 0.0039490107203505155, 0.004138044148739564, 0.004325700722200251, 0.004505926203912814, 0.004669702997247767, 0.0031954021580347753, 0.003567892665881129, 0.003913395912804876, 0.004230832598723084, 0.004519059128871158, 0.0062792124546261555, 0.006236547313631433, 0.005817911087587938, 0.005970294905121041, 0.006133094920108144, 0.006309026094554625, 0.0065034701043215765, 0.006719909158106228, 0.006959740622391747, 0.0072250639157578145, 0.0075186468749559475, 0.007845519748636653, 0.008210951389294998, 0.008618984591998304, 0.009072751690137755, 0.009576600845272907, 0.010138325017953314, 0.010764828864873479, 0.011466657561560206, 0.012262733067349095, 0.013158286661198662, 0.01414390960516522, 0.015200329161682779, 0.016294603724194705, 0.01737943772165527, 0.018394356779309055, 0.019287521579399152, 0.020022408620946622, 0.020590519947055658, 0.02101294367412832, 0.021311768393873384, 0.021502312524027244, 0.021585197319813676, 0.0215600393181466, 0.021419782327293625, 0.021168876457130944, 0.020827148360223483, 0.020418129580367508, 0.019960633566559707, 0.01946296821893559, 0.0189337193907917, 0.018381040270853466, 0.017812671538615987, 0.01723123379061976, 0.016641869208416035, 0.01605468759134632, 0.015479532043285003, 0.014931645093502213, 0.014415820157393594, 0.01392372492536465, 0.013445244089503856, 0.012971966572112456, 0.012496879826069214, 0.012012638553692525, 0.011521821759113541, 0.011027746958629939, 0.010533858053403605, 0.010043043296408233, 0.009560509725520396, 0.009084461147769951, 0.008604649317429228, 0.008116516640887838, 0.007615894234371158, 0.007098105722253263, 0.00655808231562305, 0.005993742874026933, 0.005401131902455721, 0.004777317010600708, 0.004116108045461549, 0.003407834513043631, 0.002643864624113047, 0.0018140562160904917, 0.0009090908805401709, 6.571356566327692e-05, 0.00030622338176565283]], [[0.010238406229458746, 0.010109771299184054, 0.00985872622942083, 0.009477097273251987, 0.00895331699647623, 0.00828134744420269, 0.007465712847447402, 0.006540046306596315, 0.005585312399180706, 0.004754163814431309, 0.004172350474288597, 0.0038438485642743807, 0.0037037161553515195, 0.0036972196772255776, 0.0037774511004826116, 0.003911742882033785, 0.004080588504950589, 0.004276720535506751, 0.004487214503227423, 0.0046981525308506834, -0.002405747858746697, -0.0008647881591815372, 0.000552446697734269, 0.001827721644360257, 0.002937774770285581, 0.0038527641679075124, 0.004586385930230009, 0.005311694530510779, 0.0060782857632832536, 0.006893044045668438, 0.007764810260318409, 0.008705049478346672, 0.009723101300402872, 0.010823743497840956, 0.011747804912328711, 0.0068042139755135666, 0.007920860948771005, 0.008773849234068954, 0.009215882029827, 0.009692078066757688, 0.010216411954721605, 0.010797068187927295, 0.011442321603190525, 0.012163726643276784, 0.012979071153041206, 0.013889179012103698, 0.014881361330488507, 0.01593268283182625, 0.01700626846741631, 0.018051269649328495, 0.01900535346798316, 0.019819903361038924, 0.02046341809839061, 0.020929189329815003, 0.021239280530084743, 0.02141303003765638, 0.02146575009123337, 0.02140666960605384, 0.021245422212878014, 0.02098364910284621, 0.020626730699362567, 0.020192747720814797, 0.019702447757175078, 0.01917383603139406, 0.018615598657648294, 0.018036253419207993, 0.017443753555451767, 0.01684582519699072, 0.016244679832932207, 0.015643948119084497, 0.015051485504296764, 0.014474947677763956, 0.013926803096304074, 0.013408172725921238, 0.012909911555699932, 0.012424611758934544, 0.011945642520501547, 0.011467290093614795, 0.010983637513919151, 0.010498229984298573, 0.010013606850355548, 0.009532202604856533, 0.009056186412025873, 0.008589906792301566, 0.00813077216535989, 0.007668906299279446, 0.00720078676767417, 0.006722880809958467, 0.006231094227795471, 0.005721063993816541, 0.004981540154329511, 0.0043876341219594465, 0.004131932033224373, 0.003528759446790926, 0.0028845151714737257, 0.002192004990278185, 0.0014444418123188694, 0.000645368797049345, -5.640676884797893e-05, 0.00019134222131280456], [0.010065763379763979, 0.009943447032571415, 0.009698998213117524, 0.009324380174455953, 0.008809746885645798, 0.008150273649596916, 0.007352899301258564, 0.006450160598010889, 0.005514697614001055, 0.004700989014713367, 0.004137932858763939, 0.0038171371866021426, 0.0036802380660254626, 0.0036730519211711603, 0.0037505401343551174, 0.0038810301348153066, 0.004045451127012922, 0.004236699078986567, 0.004441864995584614, 0.004646938578950461, 0.003279336087089732, 0.0037600840821192237, 0.004208925588747736, 0.004622447122376734, 0.0049962401316657285, 0.0053243535881432715, 0.0056109928252417165, 0.005898628766370512, 0.00620003936170254, 0.006518426037221976, 0.0068585351157002036, 0.00722732976856972, 0.007629490376590426, 0.008066274681503798, 0.008423132813119856, 0.007685439908671902, 0.008178803518104431, 0.008650024599350556, 0.009078094695374184, 0.00954543500958594, 0.010060522193774643, 0.010631169190510156, 0.011265524884855473, 0.011974998019386129, 0.01277703184408482, 0.013672424664545216, 0.014648683849479009, 0.015683229464253535, 0.016739769038455074, 0.017768256083783972, 0.018707321722750796, 0.019509108539511932, 0.02014271974647819, 0.02060156805692822, 0.02090732178449286, 0.02107896857741598, 0.0211314095481545, 0.02107368480409669, 0.020915274503730055, 0.020657984720000227, 0.02030726996036632, 0.019880140460458943, 0.019397719919260575, 0.01887792714400146, 0.018329103033380947, 0.01775962554159724, 0.01717731330765419, 0.01658975939793112, 0.015999162621860106, 0.015409101167424367, 0.014827287986201605, 0.014261230724319755, 0.013723158510219588, 0.013214221188839652, 0.012725510794735042, 0.012249773279849024, 0.011780511812782828, 0.011312148950466741, 0.010838902019785027, 0.01036422638403607, 0.009890539301198606, 0.00942026215609039, 0.008955525159614532, 0.008500601328340764, 0.008053043730421795, 0.007603294949098332, 0.007147983751610738, 0.006683761478853143, 0.006206774406587309, 0.005712938724343829, 0.005183164799347131, 0.004647206169880986, 0.004085756381114564, 0.003492977774779453, 0.0028598297045038723, 0.002178999809171735, 0.0014434833922540421, 0.0006542901306428582, -4.7222215663295676e-05, 0.00027144960329746846], [0.010043912698102507, 0.009922842603300657, 0.009679482936641856, 0.009305814201586897, 0.00879237249129388, 0.008134606270156403, 0.007340028028936371, 0.006440978815972304, 0.005508296209662839, 0.004697163478877233, 0.004137444088777011, 0.0038178569519945428, 0.0036814607136929113, 0.003674101275934893, 0.003751092677054122, 0.003880936068666053, 0.00404462729529034, 0.004235087402660591, 0.004439387567107915, 0.004643470592831332, 0.0040112108278509565, 0.004355424460551468, 0.004679562810168932, 0.004982122856580217, 0.005261123039103561, 0.005513684825589545, 0.005742788113302995, 0.00597410228422066, 0.006215674140666581, 0.006470240311169878, 0.006742034577338308, 0.007037466368554782, 0.007360674409696797, 0.007712687260282321, 0.008012989752886756, 0.007794723860448175, 0.008212082436776126, 0.008636948596435157, 0.00906255094334877, 0.009528681541363323, 0.01004255480038668, 0.010611911505290294, 0.01124488606140645, 0.01195287405805053, 0.012753270326269769, 0.01364686867778872, 0.014621199415701712, 0.015653724200557783, 0.016708220076003408, 0.017734736118676098, 0.018672016097757656, 0.01947229215386876, 0.020104751884820145, 0.020562823505449555, 0.020868112289491376, 0.021039557527648505, 0.021091993181418096, 0.02103443477251245, 0.02087634825517575, 0.020619586628265425, 0.020269638414844235, 0.01984330372989248, 0.01936183861959051, 0.018842864714259996, 0.0182949193230586, 0.017726357733313887, 0.01714497871906936, 0.016558356620033094, 0.015968689480360506, 0.015379549835798962, 0.014798634008491922, 0.014233436011732145, 0.0136961623101399, 0.013187967674710602, 0.012699965824958212, 0.012224915622073836, 0.011756328442961433, 0.011288633350374973, 0.01081605441234315, 0.010342032173881802, 0.009869030204898164, 0.00939943883086371, 0.008935389642433856, 0.008481158663352866, 0.008034369304059678, 0.007585463977747728, 0.007130981205289303, 0.006667599770864909, 0.00619145817179495, 0.005698468424237666, 0.005177374646573782, 0.004642617778024921, 0.004082426513511723, 0.003491721860313528, 0.002859273981759754, 0.0021799229001582834, 0.0014458712632173937, 0.0006575419061777873, -4.5181884835429814e-05, 0.000290548496250554], [0.010027941578325787, 0.009908062960877807, 0.009665659155054619, 0.009292723217014118, 0.008780173745323944, 0.008123734013211294, 0.007331504228162026, 0.006435646608422742, 0.005505210706097579, 0.004696192305106464, 0.004139516736317384, 0.003820959459694431, 0.0036849896356713516, 0.003677449496424933, 0.0037539837614871184, 0.003883250588816587, 0.004046301752542681, 0.004236079390674577, 0.004439626497249813, 0.0046428294806563734, 0.004522953374695439, 0.004771562694329707, 0.005008385121891753, 0.005233256308585432, 0.005445893058645661, 0.005645564836948331, 0.005834391188253577, 0.006026288969366728, 0.006225999798631316, 0.0064359414529952695, 0.006659999041860133, 0.006904212284502851, 0.0071723818797193, 0.007465535302004171, 0.0077379518085519865, 0.00786749688199197, 0.008234645502290468, 0.008629039540449272, 0.009052413724177578, 0.009517618346298995, 0.010030588983148356, 0.010598997742149634, 0.011230969326712909, 0.011937893209195612, 0.012737125205851527, 0.013629451257879618, 0.01460241284101798, 0.015633494848315856, 0.01668651659300592, 0.01771158710667544, 0.018647521481327603, 0.01944661263287358, 0.020078116726317076, 0.020535477755675408, 0.02084027508696631, 0.021011412083392043, 0.021063659884298466, 0.021006012815824718, 0.020847924877662405, 0.020591293532733493, 0.020241637921665747, 0.019815546632070958, 0.019334418555796887, 0.018815838649806363, 0.018268332703849817, 0.017700241835846717, 0.017119351634760582, 0.01653340923984312, 0.01594444036426529, 0.015356009542873207, 0.014775800258580553, 0.01421129807818219, 0.013674697720652634, 0.013167166670342258, 0.012679841551163903, 0.01220548700365218, 0.01173761398082767, 0.011270651144755365, 0.010798822607302758, 0.010325551602157682, 0.009853283722476337, 0.009384399949510987, 0.00892102947005884, 0.00846744144045353, 0.008021213520245759, 0.007572822880239681, 0.007118897665539934, 0.006656092949236167, 0.006180564447890274, 0.00568824311054352, 0.0051747891855403565, 0.004640921182294093, 0.004081660511880177, 0.0034912150822323075, 0.0028605563172199658, 0.002182285134622376, 0.0014492648035616014, 0.0006613218595552343, -4.307228852963657e-05, 0.00031020093268705335], [0.010024007735246476, 0.009904483579788945, 0.009662349944096829, 0.009289602964009892, 0.008777277887224903, 0.00812118201108836, 0.007329596914627681, 0.0064346329901210425, 0.005504797094097987, 0.004696349812830535, 0.004140555462536775, 0.0038222837003583175, 0.003686431698560847, 0.003678835303943224, 0.003755236536905875, 0.0038843387553315657, 0.004047209079064147, 0.004236795441852563, 0.004440130920390896, 0.004643083224395379, 0.004632937619377273, 0.004860927307531793, 0.005078918590599616, 0.005287036015678344, 0.005485362249644217, 0.005673628876307561, 0.005853769214290219, 0.0060371694819318054, 0.006227860821252873, 0.0064281941444096725, 0.006642007144842442, 0.006875240577446725, 0.007131633866370293, 0.007412260824355798, 0.00768213870596442, 0.007881997779256498, 0.008239219762983167, 0.008627611292304514, 0.009050336290589473, 0.009515294727631135, 0.010028029803669552, 0.01059619317333552, 0.011227907184837798, 0.011934560355465286, 0.012733497738891236, 0.013625500991516243, 0.014598112937204947, 0.01562882296464393, 0.016681459570368, 0.01770614533937508, 0.018641711700403206, 0.019440467568800655, 0.02007168943391573, 0.020528827432031504, 0.02083345420047846, 0.021004463438105813, 0.021056607753693078, 0.02099887643031167, 0.020840721319230274, 0.02058405438719671, 0.020234556783244956, 0.019808637440109102, 0.019327739727117193, 0.01880943623900487, 0.018262246651109443, 0.017694504573182484, 0.017113987727224514, 0.016528248427863795, 0.015939479640067592, 0.015351245914745414, 0.014771227582474166, 0.014206907503466626, 0.013670475470903554, 0.013163098457376824, 0.012675915626649692, 0.012201694806115698, 0.011733949476400744, 0.011267110472005638, 0.010795404297385982, 0.010322252781336203, 0.00985010056673611, 0.009381327714148244, 0.008918062740238234, 0.008464573047596588, 0.00801843731679383, 0.007570136342257563, 0.0071162986672583676, 0.00665357942079272, 0.006178133700376236, 0.005685891231614124, 0.005174702142946649, 0.004640874832500466, 0.004081845617745946, 0.003491647881781084, 0.0028621697625269013, 0.0021832674730149467, 0.0014504918405014913, 0.0006625898124183231, -4.2387659368200664e-05, 0.0003163078776206822], [0.010021762731331854, 0.009902459164921171, 0.009660490134726446, 0.009287853530478372, 0.008775657902239963, 0.00811976340104008, 0.007328566098766229, 0.006434144477078406, 0.005504664988190549, 0.004696558744595422, 0.004141306754773574, 0.0038232074899943805, 0.003687426566717763, 0.003679794542844023, 0.0037561137237774184, 0.0038851152213209574, 0.004047875383984602, 0.004237345633281511, 0.004440552493234941, 0.004643351559725687, 0.00469081469501894, 0.00490792854789028, 0.005115987633801036, 0.005315268938193892, 0.005506047951733111, 0.005688299604482224, 0.00586385875967359, 0.006042805149551104, 0.006228768596042117, 0.0064240656937231185, 0.006632472503526336, 0.006859916534703664, 0.007110109326766178, 0.007384165615029691, 0.007653881929206807, 0.007889186629427801, 0.008241464829440156, 0.008626885569449088, 0.009049209865264068, 0.009514023332033092, 0.010026621862235206, 0.01059464437462451, 0.011226211907283798, 0.011932712615151567, 0.012731485267778045, 0.01362330946071543, 0.014595729051451138, 0.015626236176059873, 0.016678664735927357, 0.017703145111056074, 0.018638517847724016, 0.01943710044492953, 0.02006818086878334, 0.020525212342774407, 0.020829763074650093, 0.021000721188722864, 0.021052828173809202, 0.02099518330895037, 0.0208371545632893, 0.020580664282987375, 0.020231250249021365, 0.019805398440080117, 0.019324580968147625, 0.018806364410896434, 0.0182592667135995, 0.017691619330572242, 0.01711119808766217, 0.016525553607985848, 0.01593687970906482, 0.015348740802312815, 0.01476881522535036, 0.014204584171823072, 0.013668234511656897, 0.01316093293101333, 0.012673819989422828, 0.012199665222662106, 0.011731983396446457, 0.011265206422606805, 0.01079356201806744, 0.010320471031703731, 0.009848377442369471, 0.00937966069858051, 0.008916448881359066, 0.0084630083493257, 0.00801691837654345, 0.007568661855583312, 0.007114867565241659, 0.006652190760328326, 0.006176786433004961, 0.005684583569350733, 0.005173538252421822, 0.004640996569354622, 0.004082065808405367, 0.0034920103014006412, 0.0028617671598283427, 0.002183912870029237, 0.0014512749012077632, 0.0006633809900196715, -4.1979614310186276e-05, 0.0003201426829763056], [0.010020495623608051, 0.009901322663823816, 0.00965945001478806, 0.00928687655493108, 0.008774754452162425, 0.008118975323588897, 0.007328003526100281, 0.0064338987521995504, 0.005504625089433877, 0.004696716369371219, 0.004141783653742073, 0.00382378493595, 0.003688045410431136, 0.003680392101415564, 0.0037566629261623612, 0.003885605314383476, 0.0040483009804478725, 0.004237703374500661, 0.00444083502436001, 0.004643544207570132, 0.004721090027658129, 0.004932501989815319, 0.005135354024309774, 0.005330003056957519, 0.005516825597878119, 0.00569595352300673, 0.005869139388881939, 0.006045737800911038, 0.006229210501573302, 0.006421856224289132, 0.006627432000413547, 0.0068518464055479815, 0.007098798171499168, 0.007369430603114606, 0.007639584589146335, 0.007892754229878169, 0.008242573217937931, 0.008626522050830048, 0.009048609945984934, 0.00951333974624522, 0.01002585995464929, 0.01059380195230848, 0.01122528605278444, 0.01193170027808954, 0.012730379758863795, 0.013622102773914214, 0.014594413656609365, 0.015624805985882777, 0.01667711659919099, 0.01770148015424106, 0.01863674221030324, 0.019435225131776025, 0.020066223607561745, 0.0205231927424013, 0.02082769833773343, 0.020998715115163824, 0.021050918417387838, 0.020993293507986146, 0.020835290759319478, 0.02057883703851352, 0.020229473238201186, 0.019803661341481864, 0.01932289069815068, 0.018804724414280046, 0.018257679468002067, 0.01769008609331129, 0.01710971904786358, 0.01652412801493859, 0.015935507367124093, 0.015347421472041933, 0.014767547544251376, 0.01420336584797575, 0.013667061610090098, 0.013159801437299109, 0.012672726754267125, 0.01219860806784763, 0.011730960861969003, 0.011264217650658409, 0.010792606825747883, 0.010319548635273417, 0.009847486672452744, 0.009378800050301091, 0.00891561662002465, 0.008462202165577786, 0.008016136350995755, 0.007567903317638275, 0.007114132002303431, 0.0066514777834540345, 0.006176095700682825, 0.005683914542151357, 0.005173013502489468, 0.004640356370827623, 0.0040826397577977324, 0.0034922585363023183, 0.002862101169160434, 0.0021843321633337642, 0.0014517706175528951, 0.0006638754150316546, -4.171920470707708e-05, 0.0003224466463242157]]], "drag_distribution": [[[-9.726830162035244, 5.775514037867957, 2.6775466792163063, 0.3835654672210781, 0.20610172772903604, 0.17364844338725804, 0.13930131964933015, 0.10162571302082232, 0.06263634722873838, 0.027041820347895703, -0.0019750292885799747, -0.02471411434510696, -0.04187098136460078, -0.054240313162420103, -0.06255728945185343, -0.06739936188435387, -0.06915463549964856, -0.06801430633813015, -0.06419916042619497, -0.057771208361129645, -0.06486789926330659, -0.05480352362922222, -0.04475398871694319, -0.03541863768523622, -0.02743923693895489, -0.02142164171472867, -0.01761804260107246, -0.01467992053640815, -0.012045074558256602, -0.009545230742422774, -0.007107688719160998, -0.004687551740305053, -0.0022514561475671926, 0.0002400359993352485, 0.002814995836092438, 0.005499054376612334, 0.008129771815286896, 0.010298030429043842, 0.012753074881530525, 0.015127103725619715, 0.01729698992090791, 0.01909820678652724, 0.020719875614231553, 0.022440702632871384, 0.024141951977472015, 0.025656112864283223, 0.026972813407049056, 0.02802565455312673, 0.028760251301890832, 0.02915564091171983, 0.026726599957119523, 0.02406591541017037, 0.02175211616063915, 0.019915857875244972, 0.01831253153373124, 0.01657850181063036, 0.014303298219209677, 0.011910701945690216, 0.01018648566477293, 0.009978470024394259, 0.01141548135107231, 0.01391267472769405, 0.016969439644984572, 0.02023858783095808, 0.023560365116796815, 0.02680166750968706, 0.029863956111479083, 0.032716627937594694, 0.0353637993848842, 0.03770754896410383, 0.03962705059069329, 0.04106442543415128, 0.042031124146572875, 0.042677542984498794, 0.04319015473600855, 0.043583936772563135, 0.04387203258682499, 0.04404972332639909, 0.04406214754319488, 0.043784931958800656, 0.0431806834229971, 0.042249901976277565, 0.04102740355403368, 0.03970971314885183, 0.03872678316146311, 0.037759858186389286, 0.03622412777823672, 0.03435781879357012, 0.03210780081181397, 0.02939684979103247, 0.02091058293798812, 0.020625375674566404, 0.02028679776307594, 0.02013474680003895, 0.020572945815057333, 0.02212888644099688, 0.026306610637585062, 0.03856414675366932, 0.09437843299303467, 0.20238146874757965], [-1.6171088162099019, 1.3323154208742123, 0.6725554228542302, 0.26942411482327056, 0.18093615724019083, 0.15279686378190863, 0.12060777434704692, 0.08437150538140466, 0.04656592106903558, 0.012067013579467774, -0.01584393305382735, -0.03754404508697166, -0.05377024264476105, -0.06533082409525912, -0.07296416584082807, -0.0772463203788586, -0.07856270707935309, -0.07711056074624813, -0.07308755169185195, -0.06643756019965133, -0.06461784130276371, -0.05489960447443903, -0.04521614186040373, -0.036257083908209, -0.028655058797273075, -0.023010958600760557, -0.019555098244229605, -0.01696639297865379, -0.014673644388868257, -0.012519737568416895, -0.010437911724562998, -0.008398733818898505, -0.006374642973964416, -0.004332199040175277, -0.0022530975202466135, -0.00012756298241827315, 0.0019388883972013679, 0.003724547642072107, 0.005520709096765594, 0.007121576018401036, 0.008406492531895782, 0.00920767680069295, 0.009713436377347985, 0.010194865318919817, 0.010513840123925701, 0.010472650705519516, 0.010041949222096775, 0.00915471470779845, 0.007771763744167886, 0.005914163334350709, 0.0026066329707767877, -0.0007872262411900158, -0.003651148162793746, -0.005840827553096161, -0.00760880549036142, -0.009346796813520158, -0.011427922535617266, -0.013464328037894966, -0.014728084071010956, -0.01443337975230947, -0.012478513912585793, -0.009381304221325017, -0.005676794341507879, -0.001728123747905668, 0.002298986401008732, 0.006267860560606594, 0.010076888655652011, 0.013693663734462982, 0.017122370966196593, 0.020268953021856384, 0.02301407893253853, 0.025285887923487443, 0.02705530089312595, 0.028449049240249078, 0.029663593240862755, 0.03073090978776979, 0.0316693880303246, 0.03247849349631736, 0.03311770252820253, 0.0334621508561275, 0.03347309187552271, 0.03315540321308283, 0.03253546600791851, 0.031724171000240685, 0.030975701520158792, 0.03018018396286032, 0.02903506363572566, 0.02760030687753637, 0.025804823650665512, 0.023556355371195395, 0.01844254503555852, 0.016526792521353507, 0.014110015065345987, 0.011194320156322084, 0.007807148353252556, 0.003995315384088147, 0.00017318528598964415, -0.011386496199516795, -0.009427230345737059, -0.004219849490137187], [-1.1050894214701505, 1.0852268787762902, 0.6144428545368387, 0.34802996604785613, 0.2507972855655678, 0.21192582634585394, 0.16653948062644555, 0.11511844973822184, 0.06136510271249488, 0.012318406108372176, -0.027289496900715318, -0.05802432906495397, -0.08095523475185219, -0.0972443855880509, -0.10795035595897368, -0.11389771378862784, -0.11563757265744253, -0.11345441731339555, -0.10762369150160157, -0.09802585930868368, -0.09246382757570422, -0.07865995634554585, -0.0649124972871998, -0.052205930555730605, -0.04144328717446295, -0.03348352923791523, -0.028649265715115283, -0.025057512074355318, -0.021887205999160362, -0.018917024196057463, -0.016053319750143652, -0.013259064424360137, -0.010496708711205574, -0.0077203473601345765, -0.004907002025351063, -0.002047928319571989, 0.0007246220284399835, 0.0031552400495370187, 0.005509311144896491, 0.007545794633805365, 0.009092704406123506, 0.009908661501652509, 0.010263093300867688, 0.010541741672215808, 0.010540356867677092, 0.010055835342210797, 0.008970799075252892, 0.007190662570176233, 0.004661943606921903, 0.001430341918258627, -0.00340073651228313, -0.008288449536066665, -0.012341260085789839, -0.015351622601022099, -0.01768703132385074, -0.01992052517252843, -0.02257693901618877, -0.025115258011737612, -0.02651408911550975, -0.02566971929008901, -0.022446593391783776, -0.01775773149716949, -0.012189461219313198, -0.0062663594406891805, -0.00022702397483408994, 0.0057322325353748, 0.01146538887643361, 0.016925879213942185, 0.022120139502616067, 0.026915099518811374, 0.031140623191666265, 0.03468939018654616, 0.03750651872152874, 0.03976583253028856, 0.041752108547321816, 0.04328135773894894, 0.04460683010446348, 0.045733598426943356, 0.04661851212348936, 0.04708008714417686, 0.04706131801339711, 0.04657126917937155, 0.045645503601773045, 0.04441447809182828, 0.043183573856824885, 0.04186444904302111, 0.0401180808933422, 0.03797233566122172, 0.03532033193908901, 0.03202547134084123, 0.03209323685775749, 0.028440613065645482, 0.023733367243777514, 0.017818821185938354, 0.010491992067032562, 0.0016002311628588721, -0.008792443058260392, -0.020179726969954147, -0.06835220735862814, -0.1186099675100887], [-0.3978295541530249, 0.8566485207415608, 0.5498697715772428, 0.4321460038234523, 0.38030216181888443, 0.3215760786603778, 0.251493025897441, 0.17156255719878308, 0.08783789143365389, 0.011452317018727157, -0.05011691149436111, -0.09779811773260998, -0.13329071933044295, -0.15842550665084465, -0.17486522923689807, -0.18390302652157248, -0.18640226876149055, -0.1828125333738323, -0.17355387493995186, -0.15837658305665336, -0.14495860107903488, -0.12348025733301206, -0.10210091865711868, -0.08236027849705067, -0.06567052612816279, -0.05337689601941398, -0.04592475414165995, -0.0404240447672261, -0.03557892806491547, -0.031044335257948804, -0.026674318185220952, -0.02242344993615253, -0.01823340633073036, -0.014033522095591527, -0.009792327760091488, -0.005503930965370818, -0.0013446215142004256, 0.002384634240417911, 0.0058598595703942035, 0.008788767874205938, 0.010904486022200127, 0.011831474838446088, 0.01200320714445825, 0.012030961935715189, 0.011589008639729633, 0.010204450797441991, 0.007794046280412116, 0.004207747972428795, -0.0006322133641081973, -0.00663976870776627, -0.014436649276129379, -0.022257148035071186, -0.028689242655103937, -0.0334047790770179, -0.0369870324594793, -0.04035019797803881, -0.04463466457924652, -0.048654875108876346, -0.05084863464824874, -0.049532405896410496, -0.04451213908246539, -0.03711220674713115, -0.02831674364078017, -0.01896114438226492, -0.009419020171286034, 3.992134192536999e-06, 0.009080999720285749, 0.017743343005284774, 0.026008804912316445, 0.033676999767777674, 0.04048405678391615, 0.04624518697330065, 0.050825998722713046, 0.05447197159481782, 0.05764087418374312, 0.06043202191646331, 0.06289895961859834, 0.06504908677085493, 0.06681560119408758, 0.06791516012594168, 0.06825830239707846, 0.06786114294310525, 0.06677467408095261, 0.06515855302161878, 0.0633997878193287, 0.06146979213114744, 0.05898457508759536, 0.05589338189813952, 0.0520184719165931, 0.047137263918496514, 0.04788617259494979, 0.04152552349175121, 0.04186157252461886, 0.030056304581053687, 0.015232534145956165, -0.003377408970132465, -0.026799903411060682, -0.05720302667414752, -0.09968843409345696, -0.180541002519846], [-0.11412385445095637, 0.7323213499746865, 0.5552358149326028, 0.4514890428853864, 0.3987693325171084, 0.3372645870408023, 0.2633552228445261, 0.17888641351889764, 0.09035270775364129, 0.009582304571360242, -0.05548321630418209, -0.10584091662345958, -0.1432989872311322, -0.1698001176555646, -0.18710712111955194, -0.19659029471094552, -0.19916422443891912, -0.1953064261485929, -0.18545815064818244, -0.16933458303151544, -0.15359192801885885, -0.13083991473302634, -0.1081961811920199, -0.08728995561766396, -0.06961464255661631, -0.05659327660418459, -0.04875083193806098, -0.04297510274587698, -0.037891764866861855, -0.033137848150190725, -0.028560017027138535, -0.024111462299585582, -0.019731727341591333, -0.015347139095872481, -0.010925893902014712, -0.0064642596589658, -0.002138832516907682, 0.0017640408760299807, 0.005353479672726477, 0.008348170294487457, 0.010466572408450392, 0.011310298237053118, 0.011337413101165796, 0.011193592103087251, 0.010530592824934919, 0.008842485205599436, 0.006037855889713305, 0.0019571701848924727, -0.003479758035099606, -0.010176612878117018, -0.01853699574310724, -0.027209095564898592, -0.03440166619665681, -0.03976358998284941, -0.04391836769488573, -0.04784441754425684, -0.052347245498243315, -0.056548267597426455, -0.05879748541328229, -0.057315493858484765, -0.05189920535781209, -0.04393105130257517, -0.034475624114251265, -0.02441972235968033, -0.014160904556763039, -0.004024442276747308, 0.005747969044824008, 0.015082137977867479, 0.02399520796965565, 0.03227394324269769, 0.039637915582789944, 0.04589110672692577, 0.05089075018929598, 0.05489669968402498, 0.05839468820652961, 0.061490907353313404, 0.06424167628041749, 0.06665464585636119, 0.06865931995013515, 0.06995594224769087, 0.07044976126712535, 0.07015847400887844, 0.06913457169986888, 0.06753266443220274, 0.06573302958071543, 0.06374107494174257, 0.06119784081597336, 0.05801889137185872, 0.05401260815433689, 0.04947150743921498, 0.06432759896961812, 0.05602218595272306, 0.04570308641028953, 0.03290792546463248, 0.016972298096222516, -0.002926404720431291, -0.027882823796653917, -0.06019157944764385, -0.10519553257019988, -0.19047991861657837], [0.05466542861507543, 0.7217601562365465, 0.6011944557627789, 0.5000359708201044, 0.44267814654359505, 0.3744529743004945, 0.29210462609771204, 0.19786790530622347, 0.09905724589188522, 0.00891292678179931, -0.06367706014327118, -0.11983638107535562, -0.16159098733654162, -0.19111382617360778, -0.21037554961342686, -0.22090754909100005, -0.22373172060053953, -0.21938250072195262, -0.2083502944725773, -0.19030259242583908, -0.17149174618005472, -0.14610530556345427, -0.12084123165168298, -0.09751948139739003, -0.07780843214847241, -0.06329833334809679, -0.05457237811507451, -0.04815555737956503, -0.04251130105108689, -0.037235640627770746, -0.032158147583033314, -0.02722745264016402, -0.02237694842190936, -0.017525125524937644, -0.012637492087244247, -0.007711665682460383, -0.002937878574013987, 0.0013867165575623063, 0.005329590123476031, 0.008596292875904249, 0.010872796221324532, 0.01171345722086817, 0.011629191089616419, 0.011340016710193844, 0.010454500634560323, 0.008403815091830703, 0.005083552660159027, 0.00031507034275872616, -0.006257420575081203, -0.014291607077109235, -0.024056980000637766, -0.03384029501947717, -0.041949768987313736, -0.047990571369898594, -0.05265867479781566, -0.05704894416814708, -0.06206391460660327, -0.06672509267344497, -0.06919134728625617, -0.06747883544345297, -0.06136241768329019, -0.05237001156017077, -0.041708970451747006, -0.030371717599442936, -0.01880401443070804, -0.007370337285036596, 0.0036582977643669764, 0.014197929798261734, 0.024266460246803987, 0.033624944423075176, 0.04196025576706623, 0.049053181958990444, 0.05474386470379162, 0.05932242437785706, 0.06333203015253643, 0.06689183100437204, 0.070064318427902, 0.07285789450638311, 0.07519396966046264, 0.0767378549352874, 0.07738367063441286, 0.07715164727093624, 0.07609937151893545, 0.07438938338104206, 0.07242569325605529, 0.07023945851537011, 0.06746324729175028, 0.06420902304061263, 0.06011629823468437, 0.05487302587973111, 0.06517137796339123, 0.056781662383552256, 0.045953639064188964, 0.03223236669885875, 0.014916151921067067, -0.006883379350017533, -0.034362197167060016, -0.07006234998681583, -0.11997592988403893, -0.21495875363212685], [0.1607309895265016, 0.7191937386588269, 0.6291804490457068, 0.5306488023476877, 0.47044014257406214, 0.39796951483525494, 0.31026444625288624, 0.20981913866394353, 0.10447374237606186, 0.00836901946420665, -0.06900361931833789, -0.12884906459056902, -0.17333225575764646, -0.20477286788068497, -0.22527392327685886, -0.23646938216786778, -0.23944945104618406, -0.2347848592651175, -0.22299713004826074, -0.20372245536623435, -0.18298181115361056, -0.15593068259322332, -0.12901010480048347, -0.10416180641010787, -0.0831658287396517, -0.0677191010418749, -0.05844179908692365, -0.05162815337883715, -0.04563819980999542, -0.04004229850509801, -0.03465929318237887, -0.029435069269345974, -0.024299267382974134, -0.019165476011799597, -0.013997761730256807, -0.008794850241225746, -0.003755583963940751, 0.000817076611342788, 0.004960169908683866, 0.008371790533896016, 0.01071688627185715, 0.01151919696223067, 0.011322701219247128, 0.010894132088857663, 0.009813922286279043, 0.007472643596946633, 0.0036925226621212855, -0.001720862408669362, -0.008844444179703124, -0.017550902723036742, -0.02800883534208855, -0.0384816906486712, -0.047160255420837564, -0.05362050720859131, -0.05860359826506987, -0.06327805127648696, -0.06860805591493543, -0.07355181925706542, -0.07614746347842788, -0.0742796099165027, -0.06770908960984011, -0.058053129575961746, -0.046613101023561504, -0.03444909973542223, -0.02203706230365649, -0.009766457582923034, 0.0020730181055750784, 0.013391171421311724, 0.024206373394864318, 0.03426333251052514, 0.04322784639497753, 0.0508659521176552, 0.05700691179936486, 0.061960117337635304, 0.06630534545048734, 0.07017003807435444, 0.07362059618566819, 0.07666589770866718, 0.07922221885685192, 0.08093265455751085, 0.08168424543152882, 0.0814988694333469, 0.08043729117489831, 0.07866643169418078, 0.07660404077159046, 0.07429931962553776, 0.07161516085879309, 0.06827315232255775, 0.06399577592440166, 0.05847203377803739, 0.06941449031992802, 0.060332907837400536, 0.04869831765816517, 0.033997457811536624, 0.015475182724762001, -0.007821181172710525, -0.037156300869997376, -0.07519516655417255, -0.1283538890345463, -0.22955450764634822]], [[0.036908031936817846, 0.03714493247001663, 0.037639451242642376, 0.03854142819831398, 0.04105233788874934, 0.11926694047306786, 0.20358786735603068, 0.09778599283897842, 0.11203195011235136, 0.03885766859782934, 0.025881381458308244, 0.02142375509148366, 0.01727504120970769, 0.013448851212377098, 0.009976705955271758, 0.006871929281080797, 0.0041339284980055156, 0.0017519358696524642, -0.000287055445352155, -0.001968673897276696, -0.006424340969376711, -0.007075688100457656, -0.0074287701505641145, -0.007584705637854712, -0.007645134809078348, -0.007714353450228548, -0.007884616983229707, -0.00813707252743544, -0.008423978544563846, -0.00872231442058641, -0.009029055632490875, -0.009347922566943992, -0.009675885187425551, -0.010006973413211655, -0.01033810968362733, -0.010667130525402035, -0.01099668862668975, -0.01133142204748604, -0.0116743811039729, -0.012031831069380133, -0.012423451372406275, -0.012883262272160325, -0.013422376445016194, -0.014045645863467515, -0.014785257696299604, -0.015606480185999833, -0.01644103975851916, -0.0172157892821414, -0.01783818029343754, -0.018194301175249606, -0.01847270319411745, -0.018343156323754255, -0.017785246289750905, -0.016838891781945003, -0.015607741557994716, -0.014124236412682801, -0.012381475027790656, -0.010373779113852287, -0.008098517055861303, -0.0055948665683933675, -0.002938496324087585, -0.00026123862155751467, 0.0023594124916006334, 0.004854832458786737, 0.007182008166576941, 0.009307108963973158, 0.0112077893359007, 0.012876898935793113, 0.014315702651924521, 0.015514116891727348, 0.01647086315064888, 0.017196560400289346, 0.017719294675049985, 0.018124034119382692, 0.018487312082189174, 0.018804653198176986, 0.019110738156404624, 0.019561509470874695, 0.01972724874964011, 0.01973757270274833, 0.01959952582629941, 0.019328448889977947, 0.018938969768618478, 0.018456584986917317, 0.017923222770970745, 0.017347047063663617, 0.016702157783198567, 0.01596490525791825, 0.015109207203429913, 0.014102013901602862, 0.01521143678979458, 0.01443693767927499, 0.01345880000679832, 0.012234040097053462, 0.01141758078509497, 0.010888809823492569, 0.009650967193891184, 0.012276195089667234, 0.0257341515836054, 0.05315344861547669], [0.10162214187120767, 0.10213042219282985, 0.10311058156384457, 0.1046336971937527, 0.10814828753424036, 0.21608102462154394, 0.19977587833781907, 0.13007242966993213, 0.13284681998995965, 0.09094354340300306, 0.06682683638968029, 0.05431118727172348, 0.04237490491687154, 0.03126160091906615, 0.02113318185249824, 0.012056040420563479, 0.004036245432423339, -0.00295743115914662, -0.008931101750367104, -0.013760237523888708, -0.021703112108311492, -0.02372020300545618, -0.02483155302688051, -0.025351160670424394, -0.025593292431610012, -0.025878588404780956, -0.026486729626998346, -0.027350847245514058, -0.02832339400734724, -0.029341771093457196, -0.030399592783539535, -0.03150905777889577, -0.03266141275902253, -0.033839293002758085, -0.03503580886289694, -0.03624802849982114, -0.03748973163132776, -0.038781589752172316, -0.04013959754474792, -0.04158925778021444, -0.043196672575133994, -0.04507267429491819, -0.04725547889324615, -0.04976500984352479, -0.052710120635432185, -0.055994557246535716, -0.05941253109608801, -0.06273669364845574, -0.06567052221604382, -0.06784133284692258, -0.06926737005278381, -0.0693615456887753, -0.0680344898070465, -0.06539958297282945, -0.06178412029163102, -0.0573069178591468, -0.05196931227983733, -0.045769428397913654, -0.03868713644871963, -0.030810472940225046, -0.022377046175988017, -0.013754039820417539, -0.005263082453626196, 0.0028684916076208143, 0.01050106621347981, 0.017526806549111342, 0.023873727922539424, 0.02951778670357605, 0.03446134997809278, 0.03867115560898365, 0.042139650376833954, 0.04489434328669891, 0.04701242793774216, 0.04875225806667178, 0.05035788569906986, 0.05181456402995706, 0.05315319403656068, 0.05456779645575006, 0.055420219222143616, 0.055815638841350726, 0.055754774299557365, 0.0552780642735044, 0.05442817150776212, 0.053278596248637664, 0.05195053643651839, 0.05046863896526582, 0.04874794816447514, 0.046709495059910004, 0.04426696387378076, 0.04131248778022548, 0.040922463333749215, 0.03749546016855427, 0.033298656922419234, 0.02818503743986065, 0.02293610788729698, 0.01722255328050828, 0.00942797712881938, -0.018359901729071683, -0.027301826873728147, -0.03737245935036675], [0.15898977521693178, 0.15972302530218474, 0.16109236459016033, 0.16306204797681534, 0.16709810206892328, 0.2897296619539153, 0.23442605860200708, 0.17413330476714897, 0.14966354717519378, 0.12290503657018349, 0.10264357916215668, 0.08295844241753929, 0.06406303968239213, 0.04642720826309539, 0.030336577950561935, 0.01590780462896556, 0.0031536967678363966, -0.007975282519713753, -0.017475915772681528, -0.025116816843046216, -0.03568237199997016, -0.03893440059127741, -0.0407330185766561, -0.04158479299823814, -0.04199620735805639, -0.04248331308722062, -0.04349472084901798, -0.04491937580367909, -0.04651951108107857, -0.04819752780488304, -0.049944271041696624, -0.05177966716209497, -0.05368984480723727, -0.055647237741414335, -0.05764174862275287, -0.05967009223868577, -0.06175661383836522, -0.06393705429848073, -0.06623970623014375, -0.06870802014119906, -0.07145054206062335, -0.07464805605064864, -0.07836362999048836, -0.08263125913618907, -0.08762995189626056, -0.09320884850312793, -0.09903832716647393, -0.10475153191331332, -0.10986660306357394, -0.1137750635226068, -0.11628991038949629, -0.11663126323054882, -0.11464503132167904, -0.11051009342374293, -0.10475654318434553, -0.0975829622101281, -0.0890001935552863, -0.07901122430329868, -0.06757901697869755, -0.05483277119348237, -0.04115682185581464, -0.02712744130874724, -0.013294407833850415, -2.9907435926050374e-05, 0.012438511921650101, 0.023935821128181354, 0.034344898229780485, 0.04362625210004235, 0.05178310601753992, 0.05876105485114766, 0.06454654600460329, 0.06918187377059144, 0.0727877495533987, 0.07577887374108383, 0.07855141088857152, 0.08108124610063558, 0.08338893149123715, 0.08567674290208276, 0.08718081099618472, 0.08795737365024403, 0.08799951872351501, 0.08736973855718853, 0.08613580677335614, 0.08441413524751198, 0.08239681614805693, 0.08012334308945437, 0.07745493072104317, 0.07426206981790102, 0.0704034777231093, 0.06570313621172248, 0.0636106478081096, 0.05769199691612411, 0.046954314590130546, 0.036669181053831656, 0.02483170285674752, 0.010553373069331582, -0.009037445234445116, -0.029492676133044866, -0.04918986044930562, -0.07424977099738413], [0.23848759443864162, 0.23948655130501634, 0.24127322425718595, 0.24355463725974794, 0.2472264187771799, 0.3558500594407232, 0.27154928237322107, 0.23203180966890677, 0.2149579602112566, 0.18068068659198963, 0.15085891290678116, 0.12116117570751714, 0.09245796769702816, 0.06559854083990474, 0.04106399689270001, 0.019050144166903416, -0.00041840677993360215, -0.017417069841526744, -0.031920201072581214, -0.04352116789552977, -0.05633799764388069, -0.06137288202024518, -0.06416839496182503, -0.0655093351066221, -0.06617955673831413, -0.0669766086544935, -0.06859140498590975, -0.0708468759626973, -0.07337508468965809, -0.07603018188491234, -0.07879979614394321, -0.08171518771298628, -0.08475526160257099, -0.08787801835772287, -0.09106942208872411, -0.09432666523140487, -0.09769080515792924, -0.10122099189858445, -0.1049649890709327, -0.1089937572659191, -0.11347847040846593, -0.11870233669705839, -0.1247652990376837, -0.13172295186241917, -0.1398579905154976, -0.1489436851829142, -0.15847311725896662, -0.1678778098695902, -0.1764057356244523, -0.1831027845633181, -0.18733735038335156, -0.1881654090557863, -0.18533257804889344, -0.17910961023597155, -0.17022878802990657, -0.159058289650687, -0.14564169027784718, -0.12999998961097328, -0.11207328039176735, -0.09204513671449119, -0.0705155041441431, -0.048574027684027965, -0.026912697536988828, -0.00611635455009837, 0.013459100671760529, 0.03154105815063354, 0.04794669697053017, 0.06261389020812363, 0.0755468070591719, 0.08666008199018557, 0.09593065790482327, 0.10342085010332334, 0.10931170403685046, 0.11424245187637957, 0.11883079215567291, 0.12303891019256538, 0.12685240487924368, 0.13040976866963075, 0.1329472375791317, 0.134372761688944, 0.13466289662629305, 0.13391014093716708, 0.13263078085088703, 0.13057656187210068, 0.12790544050514466, 0.12475608490731217, 0.12092807186435661, 0.11622387694578568, 0.11042331519834767, 0.10325000826836848, 0.10845269013493546, 0.0975946483995556, 0.08447875143582173, 0.06870396877024817, 0.04975557504199868, 0.02682866413731906, -0.0011879929790558866, -0.036369300571412626, -0.08233606793103673, -0.15508130098166323], [0.2595908404360472, 0.26064291563342346, 0.2624942405908372, 0.26474225532412304, 0.2679062687364288, 0.35979936366765386, 0.2781300466823564, 0.2465412586606194, 0.23063742458529177, 0.19538277076708768, 0.1631216709523001, 0.13073674632338994, 0.09936791454960411, 0.06999007827639618, 0.043145313709573835, 0.01905403356972709, -0.0022550872922292263, -0.02086452311765284, -0.036739084685446906, -0.04941534408561642, -0.06230668302278555, -0.06784189081873945, -0.07091886876368476, -0.07240057707521678, -0.0731486617850162, -0.07403944541051238, -0.07583126729231826, -0.0783277243165144, -0.08112437835527608, -0.08406266676670365, -0.08712959917519443, -0.09035968092636923, -0.09372984982735463, -0.09719416294061685, -0.10073773044105491, -0.10435823741141106, -0.10810196076718015, -0.11203522022964614, -0.11621186679535088, -0.12067070317925319, -0.12562519011181286, -0.1313887957426927, -0.1380708545304601, -0.14573074021243348, -0.154677092447066, -0.1646590869341725, -0.1751180148059458, -0.18542660204753253, -0.19475536041502303, -0.20205288105095298, -0.2065126965379011, -0.20719119887691986, -0.2038091418965341, -0.1966680796964391, -0.1866811464642108, -0.17420646198793763, -0.15928448576900422, -0.1419350651229775, -0.12208534848435382, -0.0999270042084366, -0.07611758433944553, -0.05186103637703256, -0.027911341916829306, -0.004913325182874879, 0.016741349566015792, 0.036753124988001734, 0.054921094261483165, 0.07117711463765941, 0.08552584052210054, 0.09770647535434053, 0.10781869965634969, 0.11594669759239777, 0.12229472359345184, 0.12756738106226234, 0.13244537511744917, 0.13688859375389645, 0.14087028148050854, 0.14448713831707638, 0.14704411831761277, 0.1485404651546678, 0.1488551058051466, 0.14805752356632373, 0.14624715357880005, 0.1436061474851598, 0.14044225625813297, 0.13681827122223583, 0.13248967698161773, 0.12722686451069348, 0.12078019378267378, 0.11284078810769377, 0.11738703293255086, 0.10548930239333924, 0.09113119938525432, 0.07387007227061361, 0.05306398055364628, 0.027885966788746993, -0.0028628549597939936, -0.041458451720370916, -0.09186355597409387, -0.1716045391683706], [0.2846880896955384, 0.2858170788226205, 0.28778169453110647, 0.2900816428787167, 0.2929661610882352, 0.37521329489979127, 0.29557017645898787, 0.2672575051138377, 0.25058091590927684, 0.21336829344430364, 0.17812849802922212, 0.14257091068554034, 0.1080809416294702, 0.07576325269903939, 0.04622526582104328, 0.01971381969765136, -0.003738312229761143, -0.024221849978799507, -0.04169308695528253, -0.05562915875944782, -0.0690218908012279, -0.0751307666312714, -0.07852919733610575, -0.0801697020387555, -0.08100315736751312, -0.08199637378625499, -0.0839854273313079, -0.08675235016659286, -0.08985083083756268, -0.09310711221118416, -0.096507282464213, -0.10008951963262339, -0.10382846117826305, -0.10763456850217284, -0.11151868808804356, -0.11548150427916173, -0.11957546324902786, -0.12387395507001095, -0.12843661574071305, -0.1333503038660751, -0.1388220133244367, -0.14519409843063588, -0.15258550591338318, -0.16106109259317808, -0.1709622086446186, -0.1820135084358059, -0.19359881958955164, -0.20502602956432558, -0.2153795812370899, -0.2234984132633061, -0.22841461692382053, -0.229151850031534, -0.22540071636803824, -0.21749420510555495, -0.20644169309662927, -0.19264094511184898, -0.1761391777063377, -0.15695973228086063, -0.13501963734923986, -0.1105249313689029, -0.08420109953517779, -0.057355805942577436, -0.030846183653529993, -0.005602968275747428, 0.01811118052448346, 0.039988423001518926, 0.05981782926772899, 0.0775292137952407, 0.09313294931467644, 0.10652783689189733, 0.11768444472652329, 0.1266755888092929, 0.13371667306948176, 0.1395802232322022, 0.1450169561408695, 0.14998148939876732, 0.1546476719134487, 0.15867935646592227, 0.16182380556902487, 0.16366418130487748, 0.16414755725898936, 0.163377717696241, 0.16147398972879926, 0.1586424320650844, 0.15522580562531982, 0.1512953096417363, 0.14658203318310375, 0.1408330868236773, 0.13377333765340652, 0.12506216855228766, 0.12861547447266455, 0.1154410721327374, 0.09955627583115209, 0.08047360541355414, 0.05752735627039662, 0.029771178305817724, -0.004113100352305486, -0.04662814443733226, -0.10212443122066893, -0.18985767722749447], [0.3057411345093361, 0.3069375734495118, 0.30900498517802205, 0.31136803896569665, 0.3140872567844199, 0.3904241051301273, 0.3124332491193877, 0.28544592500700494, 0.26758510678588654, 0.2285623894631054, 0.1908073344939174, 0.15259325764643153, 0.11549553884501927, 0.08072349592283347, 0.048937838302848466, 0.02040696792413029, -0.004833060314783496, -0.026879851317675545, -0.04568315792403639, -0.06067198554015551, -0.07457332114258805, -0.0811588722381782, -0.08482412456291115, -0.08659600056912123, -0.08749952858528967, -0.0885767446021389, -0.09072841253756422, -0.0937187791787733, -0.09706673477400937, -0.10058576016997978, -0.1042228396495154, -0.10804799792738705, -0.11203549559699043, -0.11613078939012755, -0.12031667905578641, -0.1245913315052067, -0.12901034302253547, -0.1336529178024664, -0.13858333722676308, -0.14389522751042055, -0.14981179600126862, -0.15670225293883697, -0.16469488362926682, -0.17385986729435615, -0.18456592078747283, -0.19651720539178638, -0.2090500159340808, -0.22141844392725368, -0.2326353143783774, -0.24144822308402217, -0.24676324388672616, -0.2475691538835743, -0.24353117457844703, -0.23500805070668188, -0.22308875362331726, -0.20820365111349565, -0.19040535672782277, -0.1697200670291716, -0.14605681308999013, -0.11963428837325508, -0.0914712671624467, -0.06276783343257454, -0.03444971018762729, -0.00728122062211618, 0.01827651954141962, 0.04187332646837633, 0.06327405220129823, 0.0824009525466539, 0.09926244437862755, 0.11374726554394028, 0.12582243729465256, 0.13556547263705468, 0.1432073820930147, 0.14958046233751596, 0.15549468630621288, 0.16120314264043598, 0.16634583771109646, 0.17077414183085587, 0.17423329107125712, 0.17627897777274765, 0.1768555581534138, 0.1760747447133494, 0.17406677945979487, 0.1710549521082375, 0.16740965370814784, 0.1632082006098494, 0.15816091281254818, 0.15199527190669615, 0.14441479807461405, 0.13505242418177707, 0.13780840196210523, 0.12361553747971726, 0.10650653667870352, 0.08595328350422121, 0.06119069055756891, 0.031284114290309806, -0.0052022155886969415, -0.05097577480825993, -0.11071272656472074, -0.2051179332138425]], [[0.0041017335632438714, 0.0043666244789597195, 0.004901110356256715, 0.005667889000074652, 0.006592289664196153, 0.0075296760432449795, 0.008180083346880132, 0.005351993450648997, -0.057019248545399616, -0.26736818768070714, 0.6887323338671358, 0.2444646672219139, 0.07103006135982892, 0.014443716992468445, 0.011247560983068658, 0.008806166033531026, 0.006691192128911788, 0.004761499380636783, 0.002971927646100521, 0.0013216130621226815, -0.002506412645574322, -0.003442359705046013, -0.004163068606812764, -0.0047071879911712786, -0.0051169173193442155, -0.005437458793675776, -0.0057247113594095095, -0.006032825087766696, -0.006356027801790355, -0.006686226372296905, -0.007024794109646689, -0.00737468699509346, -0.007733428679931665, -0.008097157623872498, -0.008463824114774523, -0.008831552238540648, -0.009197942886580856, -0.009561554069939015, -0.009920657005585962, -0.010275722638977183, -0.01063645301668987, -0.011019726844549289, -0.01144665085404885, -0.011941401785708433, -0.012524072026302744, -0.01314616516907153, -0.013744394413198581, -0.014250486365711348, -0.014582268960612942, -0.014644094956252683, -0.01448446816054419, -0.013957187575548884, -0.013095886010555542, -0.011954568759897876, -0.01061469338107114, -0.009080390293109862, -0.007316273715503034, -0.005339788455196415, -0.0031820424142816207, -0.0009186800730680377, 0.0013656520816944095, 0.0035712851174574557, 0.00566870911955295, 0.007623448506943965, 0.009408914381341444, 0.01100512864519717, 0.012399620874619205, 0.013587564043955638, 0.014602737351721878, 0.016093993033932573, 0.016772159438643963, 0.01724730879034345, 0.017568039491899366, 0.01780514026189857, 0.018013481236115524, 0.01818422197787534, 0.018307564156188103, 0.018371782167117108, 0.018356238843323623, 0.01823525339730781, 0.018014625653836772, 0.017704199029029494, 0.017314086275701628, 0.016860984300137022, 0.01636860140412581, 0.015838574644870047, 0.01525195750442632, 0.014591323646934114, 0.013837360845970006, 0.012965748612406762, 0.01388517737135232, 0.013191378280720503, 0.012389588967035724, 0.011502367224486972, 0.010562466772889698, 0.009644021199833918, 0.008965005179528918, 0.009574212876880048, 0.018408454951610455, 0.03670112926472989], [0.011302209984928957, 0.01252006299644602, 0.014945509820824649, 0.018459094645536026, 0.022821157000691233, 0.027582316794242154, 0.031894661092667996, 0.02929763800812301, -0.01700557283752034, -0.19548797493392073, 0.6198909650130735, 0.20448970879411185, 0.056543667810195854, 0.041832620660501404, 0.03249728563521433, 0.024470837680486194, 0.017023844613547754, 0.009922522675009818, 0.0031674817324109225, -0.0030963914610968677, -0.013068437850768081, -0.01698455139633035, -0.020008889194648657, -0.022304484312846352, -0.0240489864863622, -0.025431972968515265, -0.026686326989117565, -0.028035324771375002, -0.02945240294305032, -0.030906967811752683, -0.03240789263913195, -0.03396894683894177, -0.035579935424417036, -0.03722501487887733, -0.038897103992164395, -0.04059077014829858, -0.0423003459889283, -0.04402459480165853, -0.04576077327571753, -0.04751540087686941, -0.0493337582764761, -0.051291916632707386, -0.053482803644760414, -0.056012864626332114, -0.058974104607569126, -0.06216748918505079, -0.06532688416858895, -0.06816014099088284, -0.07030877209249264, -0.071349267356344, -0.07112507955286071, -0.06928486577619988, -0.0659523765623933, -0.06134899620589299, -0.055825561462389026, -0.049411710090921705, -0.041970408030852537, -0.03358289203176885, -0.024378541600494876, -0.014670270803444106, -0.004814302725906423, 0.004844587608382028, 0.014080271234511442, 0.022734822114023303, 0.03069027338234835, 0.03786036804738208, 0.044192574874521925, 0.04967236521957915, 0.054364282145274216, 0.0594936826664552, 0.06262063832130409, 0.06493980927529022, 0.06660678854484373, 0.06791573851876781, 0.06911271241451275, 0.07016280888642584, 0.07102030702588437, 0.07163280390219041, 0.07191069669556654, 0.07173366628634863, 0.07110781531581073, 0.07007541566177498, 0.06868163548396557, 0.06700139785904743, 0.06513838820642194, 0.06309815934238105, 0.060795311963163304, 0.05815004054564063, 0.055074479859843685, 0.05145934084460815, 0.050875558663973156, 0.046788521446897116, 0.04200591952838508, 0.03648679948951563, 0.03017174116248969, 0.009978947393450862, -0.0023293197059633336, -0.017109587536881632, -0.02703834370109505, -0.03510093469841456], [0.015187644197572151, 0.017099957619734738, 0.02089767386012784, 0.026410848745899218, 0.033298267746409996, 0.04092733034283302, 0.04814655361160694, 0.052378749584032, 0.03255632643817545, -0.12014609869208813, 0.5100337116532596, 0.23928482828693196, 0.07584556929243016, 0.05736295229770892, 0.04451968681789802, 0.0329995970912699, 0.022077307589544137, 0.011526340744251415, 0.0014181927863842307, -0.007969205573319734, -0.02104386956228258, -0.027062000728024827, -0.03171296338294754, -0.03524779269159688, -0.03793989667067522, -0.04008077623999229, -0.04202794337708323, -0.0441232941952007, -0.046325109391143475, -0.04858759050769341, -0.05092553760713821, -0.05336063255104747, -0.05587726999776606, -0.05845121898262064, -0.06107215384881548, -0.06373262539477084, -0.06642555111983392, -0.06915081591057214, -0.0719058752439358, -0.07470244117744655, -0.07761184354525891, -0.0807530136167589, -0.08427047670409799, -0.08832978171641218, -0.09307527234427332, -0.0982025245599811, -0.1033020568810174, -0.10792249307735576, -0.11150746304438906, -0.11339745629376555, -0.11321808851554205, -0.11052634667108652, -0.10550608812596836, -0.09849582282106145, -0.09003842842930293, -0.08018405004388295, -0.06872620243118628, -0.055792796209863556, -0.041582366583941356, -0.02657445095696008, -0.011317242965627776, 0.003686313652866978, 0.018050502607387588, 0.03152753884298561, 0.04393363575940007, 0.05513524453982076, 0.06505150564512288, 0.0736622018090756, 0.08103793676510296, 0.08850737092634423, 0.09342048391827464, 0.09710773225236367, 0.0997904525423573, 0.10191994800932722, 0.10388047408020454, 0.10561917294107658, 0.1070640243079088, 0.10813325359462835, 0.10868795130910036, 0.10853842616876162, 0.10768729537356234, 0.10619992487525855, 0.10414679009571477, 0.1016449137772547, 0.09885530579932565, 0.09578601681664196, 0.09230352874590117, 0.08830224721498271, 0.08361079199251364, 0.07805115062866443, 0.07417525862799865, 0.0663702708941691, 0.057084302711281766, 0.0460637824409426, 0.03290549147435719, 0.01705061076258131, -0.0023188044652509903, -0.025545994550330717, -0.04553082163111434, -0.06536284157890493], [0.024125814750288545, 0.027768606204222994, 0.034982647611949684, 0.045477308694663016, 0.0586685203958087, 0.07348834767248488, 0.0880811452270294, 0.09881343558542872, 0.08196957489075538, 0.0011002669681655793, 0.3968695069172689, 0.30216972945807985, 0.12018245976431487, 0.09364329428806244, 0.07258633671373661, 0.05267544643563811, 0.033317392404075184, 0.014344760552890017, -0.003973820411010974, -0.02101424535474169, -0.04106936878398369, -0.052287286019963866, -0.0609630617829073, -0.06756557503211258, -0.07260523652429814, -0.07662572819801859, -0.08029274222931726, -0.08424122769461419, -0.08839169676921028, -0.09266111436905825, -0.09707930104870484, -0.10168767278094654, -0.10645725967739948, -0.11134311867714973, -0.11632707006778575, -0.12139695383080688, -0.1265426889921817, -0.13176748607089012, -0.1370698081783656, -0.14247473500097332, -0.14811857291197825, -0.15422690276994086, -0.16107241771408748, -0.16896747936645506, -0.17818681400164937, -0.18816573984827267, -0.19814002216560095, -0.20726365630970378, -0.21448908227173402, -0.21857031435361732, -0.2185527982582216, -0.21379667163959803, -0.20463252872364315, -0.19168808831266462, -0.1759824319305738, -0.15761785349923543, -0.13621733221595253, -0.11202518378217592, -0.08541092509815054, -0.057265859070588315, -0.028613294960032853, -0.0003391390156383032, 0.026764324778350567, 0.052225454733358, 0.07569687357889747, 0.09692773980794285, 0.11576707720101943, 0.13218124772579662, 0.14624702435376088, 0.15937747277514344, 0.1687422780857709, 0.17585179618435745, 0.18108450836383533, 0.1852802062197029, 0.1891669099548216, 0.19264758253581246, 0.19569387057673576, 0.19811351737989216, 0.19961558240235597, 0.1998160499088389, 0.19868396924447249, 0.19633916016610767, 0.19291377694030074, 0.1886293661410644, 0.18378759717267132, 0.17839860893519188, 0.17220495850366985, 0.16496398286630184, 0.1564089237838922, 0.14621033912696363, 0.1378916635562159, 0.12318497431732672, 0.10581414625655468, 0.0853146261356812, 0.060978759631099506, 0.031863566969312106, -0.0034024650957808107, -0.04605626582911447, -0.08946369822064879, -0.14294979598858262], [0.030159486892087563, 0.0350037494506823, 0.04458901954286007, 0.05854205992316969, 0.07611254832123292, 0.09593520754772601, 0.1156775915678531, 0.1310185436256239, 0.11700360819349019, 0.06102795919595334, 0.37713500127585975, 0.3402876661637944, 0.15009538242629006, 0.11827302441913515, 0.09163536819911391, 0.0659715866948487, 0.040808438414448665, 0.0160289723632345, -0.007956570563934956, -0.03028034568540237, -0.05500826737188738, -0.0698275826923794, -0.08129120019679574, -0.09001891397968641, -0.09668531307679513, -0.10200875321559408, -0.10686834682702723, -0.11210192472156415, -0.11760377580654219, -0.12326516227556691, -0.12912639170871903, -0.13524258555401958, -0.14157552202599605, -0.14806592116133743, -0.15469020353128007, -0.1614330111024198, -0.16828230320850945, -0.17524372219221454, -0.18231654931925817, -0.18953524460104762, -0.19708124300195784, -0.2052541373588226, -0.21441551409130868, -0.22497955965142039, -0.23731151650690477, -0.25066655098788065, -0.264034688707716, -0.2762964297100865, -0.2860636204665188, -0.2916834552434612, -0.2917899225739603, -0.28561379518110824, -0.2735868433799392, -0.2565369708144359, -0.23581334826794412, -0.21155471913145002, -0.18326624407484005, -0.1512730823945043, -0.11606315289500431, -0.07881285315850292, -0.04087461488903728, -0.0033976509480379917, 0.0325414143486089, 0.06631552878230534, 0.09746383148635904, 0.1256541720322893, 0.15068700156577727, 0.1725195385789293, 0.19123077209415595, 0.2082523327053059, 0.22070815448141556, 0.23019682166445243, 0.23720437587059937, 0.2429944537357923, 0.24845530913230446, 0.2534317577554374, 0.2577252286570529, 0.26112164365072704, 0.2632696183091536, 0.26367353333786836, 0.26229843892579807, 0.2593063056130707, 0.25487451729038163, 0.24929835989968885, 0.24297885651551118, 0.23593066383558178, 0.2278135356986073, 0.2183064680313478, 0.20705672136728093, 0.19362874560767862, 0.18140638272381923, 0.1619691075620375, 0.1390394139337424, 0.11200958200872603, 0.07996376518791433, 0.04169564697364681, -0.004548757913698872, -0.0606638289634824, -0.12063231742539189, -0.21568478502537924], [0.03214038156419263, 0.037517219817120306, 0.048150656363521366, 0.06363561458041156, 0.08315759201881438, 0.10523930113371326, 0.12738571036880253, 0.14515501309649007, 0.13542610419125306, 0.10037411480412405, 0.3353312455430747, 0.3349613948839855, 0.1598476275087511, 0.12693471290391548, 0.09831529760945447, 0.07039502474445868, 0.04286766737103917, 0.01567675251360174, -0.01068558962556034, -0.035229806238558224, -0.06132879934620485, -0.07770898047738718, -0.09038181694957427, -0.1000326534319613, -0.10740735184111422, -0.1133000207392846, -0.11868216136242524, -0.12447917811362516, -0.13057373358754934, -0.1368463040221676, -0.14334208053872655, -0.15012227624873808, -0.15714467754502195, -0.1643438247106579, -0.17169395983448582, -0.1791786003398149, -0.18678532920459978, -0.19452136181644214, -0.2023868199321257, -0.2104207213148079, -0.2188245670217508, -0.22793061671527579, -0.23813948302559496, -0.24991005597664867, -0.2636476670587854, -0.27852982368315665, -0.29343990210878895, -0.307139166271413, -0.3180902600297256, -0.3244615370332885, -0.3246697554912558, -0.3179177976021418, -0.3046794472099486, -0.28586887352092055, -0.26297939291359573, -0.23616688324050794, -0.20488663495954101, -0.16949973772558335, -0.1305453420127285, -0.08932301836450314, -0.04732806404125112, -0.005815991737304, 0.034002230648233475, 0.07143071515455716, 0.10595868975221379, 0.13721847574789575, 0.16498943438505817, 0.18922543470753223, 0.2099981160221789, 0.22858596694006142, 0.24241277264478456, 0.25316639931283, 0.26124818403490513, 0.26784235126890166, 0.27401754308734033, 0.2796302846995687, 0.2844729709667056, 0.288313370205893, 0.29076496933545165, 0.2912807663257995, 0.28982281529279896, 0.28657082190090183, 0.2817216610832067, 0.2756028021370614, 0.26865876729333155, 0.2609062926387862, 0.25196888693949676, 0.2414911510935328, 0.22908268370719606, 0.21426153837102965, 0.1996686533300168, 0.1878721737925585, 0.1632593895833841, 0.13402696300752467, 0.0993191471325215, 0.05789682443397026, 0.00804656764519005, -0.053368188434450625, -0.13039167954166656, -0.2370973126984825], [0.032405227495747535, 0.03796324854465877, 0.048951546118569056, 0.06495702934451295, 0.08514897266199263, 0.10802365439088035, 0.13105948922599542, 0.14988224055279956, 0.14340291715433204, 0.12046144481510801, 0.303661252857745, 0.32003235849094525, 0.16109706747284333, 0.12855107229508267, 0.09954759846229264, 0.0710328003250395, 0.042824395101824606, 0.014908958178180927, -0.01218224785015634, -0.03741020600905374, -0.06356269682964819, -0.0804529365922126, -0.09352149555899601, -0.10347522529218207, -0.11108334884274042, -0.11716475833264446, -0.12272108017839617, -0.12870612101878767, -0.13499858678893428, -0.1414756424576731, -0.1481842790922904, -0.15518779189061765, -0.16244267365821982, -0.16988146573257437, -0.17747779589800527, -0.18521497181744226, -0.19308073875934265, -0.2010831392263707, -0.20922286269440785, -0.217540713210701, -0.22624505487516572, -0.23567917781816292, -0.24625674881799853, -0.2584516111730684, -0.27268271461446775, -0.28810244248928135, -0.3035592331411234, -0.31777496337410543, -0.3291625632391532, -0.3358304235174508, -0.33610085244569227, -0.32918461277683897, -0.3155681096939611, -0.2959492198968117, -0.27207473971151563, -0.24411307611203995, -0.21151184966823142, -0.17465020539706658, -0.13408840264398517, -0.09116978676088965, -0.04743966203815204, -0.004537475848186134, 0.03661677086836885, 0.07530462064585922, 0.11099915525759181, 0.14332141565596412, 0.17204427411467416, 0.1971212302952852, 0.21861672048777486, 0.2367035615416529, 0.2512620304883891, 0.2625225161384591, 0.27097323466271567, 0.27786553172620626, 0.28431185063278647, 0.2901686950977957, 0.29522237633850185, 0.29923521460015634, 0.3018100172004897, 0.30238340173752165, 0.3009167896434846, 0.29759601898589816, 0.2926246793672848, 0.28599374385812504, 0.2784881570689326, 0.27013095004938736, 0.2605406556234586, 0.24935444774496715, 0.23617202306235044, 0.22049796160415766, 0.21730998004627208, 0.19515244972094026, 0.1690746250778185, 0.13844311717532135, 0.1022698288792308, 0.05930244146518258, 0.007736078235560269, -0.055682019486252066, -0.1351165353388079, -0.24499557997731364]], [[0.0018560861304150803, 0.0018188940167542511, 0.0017417534602855273, 0.001623669632033802, 0.001464454688675848, 0.0012667344010960505, 0.0010391268701847253, 0.0008008363648040861, 0.0005865670677214676, 0.00046325398918358645, 0.0005607847024940449, 0.0015125028356651345, 0.4473342672498148, 0.6447417065056664, -0.05869070442410467, -0.0030297896926656798, -0.0013821516244060428, -0.0008976526954049615, -0.0006004443929244934, -0.00036627418557928646, 0.00017263462262064573, 0.00028016510105337614, 0.00036922492999721815, 0.00044098300284307353, 0.000497102249474988, 0.0005395732000756346, 0.0005726472462269952, 0.0006056436813864272, 0.0006398162326696066, 0.0006748259809877491, 0.00071104260468333, 0.0007486943683766827, 0.0007874088363798141, 0.0008267776280430733, 0.0008665538774676732, 0.0009064712909377208, 0.0009458643673152932, 0.000984119646258038, 0.0010206743790910381, 0.0010552091661329822, 0.0010883122842844954, 0.0011209310857053468, 0.001155990020571817, 0.0011974292508898754, 0.0012469515255704494, 0.0012976211851837374, 0.001342033149725683, 0.0013723523140061684, 0.0013795422094810819, 0.0013535316691177276, 0.0012941706741378112, 0.0011936211192121271, 0.0010597309550627913, 0.0009003594441709649, 0.0007243463710485353, 0.0005304725297755553, 0.00031208128819687334, 7.182156985664206e-05, -0.00018501562318229257, -0.0004464821493433971, -0.0007015898423450926, -0.0009402575333796228, -0.0011615767643673458, -0.001363364820604989, -0.0015442393383680285, -0.0017241282041772536, -0.0018643290466089305, -0.0019797400445821242, -0.002071818933669583, -0.002140744004776433, -0.002188160923294908, -0.0022164007765928186, -0.002229263515691046, -0.0022341754549700427, -0.0022372081265630453, -0.0022372903810822585, -0.0022335744384341413, -0.0022246196137782857, -0.002208067279845099, -0.002181039877598473, -0.002143480920757907, -0.0020965593796342065, -0.002041452158350942, -0.001980094429179478, -0.0019147307105442405, -0.0018450556070172116, -0.001769114237917288, -0.0016850844500147968, -0.001590934489761128, -0.0014841297894287355, -0.0016951881902540088, -0.0016073130396550004, -0.001510512396515716, -0.00140837863010733, -0.0013065873658654507, -0.0012176158442180386, -0.0011691283616163683, -0.0016817615893265727, -0.0019473664503799545, -0.0037227772239297094], [0.006306148364733571, 0.0061786990346124945, 0.005917684981703194, 0.005518141907408298, 0.004976490890668084, 0.004296314673865671, 0.0034971477824183627, 0.0026256479356328855, 0.0017639271391200796, 0.0010768246752087568, 0.0008232312047244466, 0.0019381973514185004, 0.6495383742714332, 0.4190326894051636, -0.03887025774586609, -0.004761822760831834, -0.0022374852518811297, -0.001360132081954384, -0.0007256252377075416, -0.00016914092819054016, 0.000820254975870518, 0.001154488429390513, 0.0014325054343719867, 0.0016573707924810463, 0.0018339547139790368, 0.0019682839804909106, 0.002073662612171995, 0.0021796538634037523, 0.002289998890828712, 0.002403771147647364, 0.002522348734056531, 0.0026465243032119785, 0.002775066451588727, 0.0029066464462825406, 0.0030405259564294084, 0.003175968122067035, 0.0033111145905756418, 0.0034442822612846297, 0.003573897257916191, 0.0036991840962511194, 0.003822296054934649, 0.003946566004786129, 0.004081669021592445, 0.004240578464079107, 0.0044291759934994976, 0.004625291602007547, 0.00480498729794262, 0.004942651333167008, 0.005008319760524041, 0.004968205497387731, 0.004803755287484595, 0.004502418715259625, 0.004088517107147651, 0.003587040459688804, 0.0030269803125576727, 0.002405095739621703, 0.0017005837814854587, 0.0009225132642184799, 8.791778782111415e-05, -0.0007649609827481694, -0.0016009062804235726, -0.0023949549407059605, -0.0031354782974774755, -0.0038149990805385154, -0.004427284201253968, -0.0049985544151936, -0.005471326917669319, -0.005867673323768588, -0.0061897323223773625, -0.0064374189981364575, -0.0066156818412394115, -0.006731735908799183, -0.006797665537822574, -0.006837702288647312, -0.0068718853322678585, -0.006896725410808025, -0.0069082448031537284, -0.0069014816144028265, -0.006868550263851278, -0.0068000092793090005, -0.006695624677105536, -0.006559203322594158, -0.00639471657983709, -0.006208727262585766, -0.006008696052178055, -0.005793464212201559, -0.005556295881889594, -0.005290820244197036, -0.004989965677385863, -0.004645005703788248, -0.004731337485791615, -0.003903567106459242, -0.0033679763794580266, -0.0027391018405489255, -0.0019964574961998426, -0.0011571788794905707, -0.00013257870051658314, 0.00045196421802520305, 0.002157149303696074, 0.002625453863915436], [0.010138450696977124, 0.00993315728085364, 0.00951391025539678, 0.008872157241446358, 0.00800108408822846, 0.006904526000305238, 0.005610374873150735, 0.004186940108841094, 0.002753327048825892, 0.001551987258245146, 0.0009333731352649947, 0.0019620630130881955, 0.7304695578443025, 0.33348910352309524, -0.03164007443486437, -0.005660544763029667, -0.0027108155743005608, -0.0015774708619942538, -0.0006926755765145897, 0.00011577295158359914, 0.0014029999876350953, 0.0019291343459884593, 0.0023672465198910806, 0.002721936948761109, 0.0030007543957523966, 0.0032131227499072523, 0.003380019861449185, 0.0035482178433013595, 0.0037235444581867425, 0.0039045911947132037, 0.0040936176601305985, 0.004291904379881954, 0.004497483862162048, 0.004708241077982043, 0.004923025209091433, 0.005140712131488064, 0.00535845935834613, 0.005573705594727608, 0.005784042406145085, 0.005988334700830568, 0.006190100057602174, 0.006394737935257435, 0.006617708972308267, 0.00687972144723156, 0.007190266146770798, 0.007514202856696309, 0.007813486546365588, 0.00804730457349026, 0.008167749694968418, 0.008120657238413223, 0.007869693281950873, 0.007399757001343437, 0.006749105413261478, 0.005957297796336065, 0.005070568378062013, 0.004084031692564588, 0.0029648964279101364, 0.0017277674843195867, 0.000399689981992852, -0.000958702914000034, -0.002291555862173602, -0.003562084237431412, -0.004748512625370452, -0.00583879761989827, -0.006822364259934339, -0.00772641018632508, -0.008485204603827439, -0.009123939956788398, -0.009645040018409488, -0.010048119246076164, -0.010340901627547684, -0.01053473270759647, -0.010648742694609277, -0.010721528427544843, -0.010785094630625866, -0.010833885686059957, -0.010861110923776974, -0.010858768870312934, -0.010814227950303611, -0.0107124298768784, -0.010552983304382696, -0.010341949154897194, -0.010087783810242671, -0.009799032667984918, -0.009487360402436936, -0.009150482302533524, -0.008777176767738913, -0.008356772446898217, -0.007877421207196917, -0.007324588593363729, -0.007015456545476476, -0.006271672383223242, -0.005409598092618539, -0.004409365738547489, -0.003239955946431852, -0.001861377044436654, -0.0002114416162675138, 0.0010591543686968114, 0.003653162645736092, 0.004960214213617679], [0.020417817591475047, 0.02000358835008974, 0.01916004722345326, 0.01786882082526278, 0.01611405203186972, 0.013899590382098457, 0.011274534613482311, 0.00836296215412709, 0.005378760666498556, 0.0027647911071970984, 0.0010944528399814372, 0.0016286769753597065, 0.8394560115755019, 0.22184710455817253, -0.022896046696625465, -0.007382092984874855, -0.00367515124256924, -0.0019506367832681627, -0.0004410912216949923, 0.001013509238025424, 0.0029951138810624498, 0.00403212079139322, 0.004896604990560231, 0.005597173387664054, 0.006148462607540555, 0.00656891718166593, 0.0068999568546900016, 0.007234252295758639, 0.007583163789089286, 0.007944017982382985, 0.008321454105504498, 0.008718063426222125, 0.009129908263876177, 0.009552771807170396, 0.009984409292001787, 0.010422678683317706, 0.010862147759243075, 0.01129794945838623, 0.011725478793434059, 0.012142674551663481, 0.012556732960944983, 0.012978610858163264, 0.013439255076341194, 0.013980069886138691, 0.014620238794828605, 0.015290004779504965, 0.015913635186800973, 0.016409669296369507, 0.016682162268326348, 0.016622344133861367, 0.016143947611019196, 0.015226779150836383, 0.013946184554400172, 0.012380589618194859, 0.010622349162378862, 0.008662278499853153, 0.006435655161648556, 0.003971941997993356, 0.0013249209151699392, -0.0013850064327900447, -0.004046888694314969, -0.006593385847011465, -0.008974445273904617, -0.011165768221886703, -0.013144942775126097, -0.014936635887886558, -0.01646218266594379, -0.01775160218598075, -0.018807733498395894, -0.019629298933302584, -0.02023138737719811, -0.020666277639683248, -0.020940965850011324, -0.021132528190649362, -0.021305327485302172, -0.02144857029031832, -0.021546744432946803, -0.021583538316445335, -0.02153349263184803, -0.02136656220785437, -0.02108200550366024, -0.020691973256847268, -0.02020938408985387, -0.019655594824120645, -0.019054458967844013, -0.018401804139761425, -0.017675426638947958, -0.01685410795279712, -0.01591429231620366, -0.01482707715673922, -0.013843584213140497, -0.012359854784021695, -0.010646276869168676, -0.008664113104650433, -0.006354739922492398, -0.0036444600467739445, -0.0004226024077357638, 0.0026264966449628256, 0.007605555610883624, 0.011518597758749917], [0.027696190470461783, 0.027133975165411203, 0.025990056979652034, 0.024239039206313723, 0.021858532798210165, 0.018852163285038647, 0.015283617565557718, 0.011315644586058587, 0.007227673088200278, 0.0036017204634408227, 0.0011610441841452001, 0.0012522335906301218, 0.8784201859497732, 0.18022790264688182, -0.02008773185392492, -0.008356450796565768, -0.004250098997741276, -0.0021407432108146687, -0.00020530117295111018, 0.0016963226513717873, 0.004132672104087843, 0.0055300412299100965, 0.0066953432928330975, 0.007639982243857048, 0.00838357911561882, 0.00895093327496272, 0.00939788846671936, 0.009849522041800625, 0.010321088881986552, 0.010809029922937169, 0.011319674657437067, 0.011856543183511382, 0.012414304305247172, 0.012987255608087011, 0.01357238215661567, 0.014166828541167275, 0.014763346525497559, 0.015355454031268099, 0.015937005617175055, 0.016505297908447212, 0.017070138604628617, 0.017646424489270056, 0.018276056053052703, 0.019015073359917107, 0.019889527143268807, 0.02080521087832153, 0.021659760507114975, 0.02234297840434171, 0.02272493876308236, 0.02265822684858148, 0.022020428298586005, 0.02078836121123597, 0.019063529595824087, 0.016951803836719345, 0.014578149032413617, 0.011930375941447953, 0.008921232566321062, 0.0055907050511046245, 0.002011465102109257, -0.0016538693560015484, -0.005255428699340805, -0.008704645358782443, -0.01193107017868853, -0.01490172423495641, -0.017585746986425246, -0.020004193864088863, -0.022072488197694935, -0.023822814501468538, -0.02527297423642254, -0.026412403559727897, -0.027258325099488497, -0.027839452725576936, -0.028206118181972165, -0.02846209229618645, -0.028694081474591807, -0.02888716518559161, -0.02902011523987088, -0.029070692679719862, -0.029004328253420888, -0.028780282298965496, -0.028397432628857418, -0.027872144444823665, -0.027221865024870274, -0.026475489474028672, -0.02566531478953747, -0.024785656800079506, -0.023806391278818964, -0.02269876386825556, -0.021430880099673855, -0.01996362992605945, -0.018566547724707377, -0.016566078235971397, -0.014256164423185167, -0.011584790105984111, -0.008473866099096134, -0.004825772057099157, -0.0004951198312795775, 0.0038514677352417927, 0.010449712366513174, 0.016176203923897455], [0.035086709401614506, 0.03437421283258418, 0.032925304185628695, 0.030707433339501943, 0.027691538070838018, 0.02388094273061919, 0.019354012574757825, 0.014312507219143527, 0.009101912029541942, 0.004444680868643237, 0.0012137194837805742, 0.0008257930835651929, 0.9059413916142894, 0.15216506711842856, -0.01851989142580814, -0.009267830882802404, -0.004799938575923633, -0.0023104445381759583, 5.227285266961059e-05, 0.0024045056321102916, 0.005290985375551857, 0.00705383966919338, 0.00852425537201016, 0.009716464054966366, 0.01065513719224016, 0.01137151673670023, 0.011936076933784515, 0.012506772150137357, 0.013102804714368458, 0.013719719309219244, 0.014365563420218538, 0.0150448005234786, 0.015750684905412062, 0.016476006469274104, 0.01721696962797675, 0.01796999692380553, 0.018726001685915775, 0.019476867474251126, 0.020214889326679225, 0.020936716088379888, 0.0216548093029861, 0.022388067984768507, 0.023189511454690337, 0.024130035369457282, 0.025242664831997066, 0.02640838634782677, 0.02749781097719268, 0.028371575333345018, 0.028865259249329863, 0.028792213722157393, 0.02799307118926793, 0.026441809779409787, 0.02426646241174204, 0.021600743283753897, 0.018602715845376226, 0.015257152453425776, 0.01145394948369426, 0.007243779470706879, 0.0027184819573936284, -0.0019164908765520682, -0.00647178069837135, -0.010837393574245938, -0.01492205158021604, -0.018683961028406346, -0.022083661358409466, -0.025137967965952232, -0.02777096041882554, -0.030013994023874, -0.031863792947175534, -0.03331569665690814, -0.03439421397110352, -0.03513662273038332, -0.03560712760197588, -0.03593718182937248, -0.036236565890028945, -0.03648645166514913, -0.036660014609333096, -0.03672915266574756, -0.03665016564027265, -0.03637153018135366, -0.03589183389459493, -0.03523176353041112, -0.03441339880710819, -0.03347332158290393, -0.03245242781917261, -0.03134355699756821, -0.030108596044601553, -0.028711150362215734, -0.02711092387035185, -0.025258486012262226, -0.023363309333729335, -0.020836891682732846, -0.017920661122010198, -0.01454912974757613, -0.010624518476802628, -0.006025064600404642, -0.0005704298525530408, 0.005102683668433096, 0.013336415380261802, 0.020914676584869573], [0.04140474944115306, 0.04056377292846477, 0.038854139409803055, 0.03623717348065889, 0.03267808967235029, 0.028179921368624804, 0.022833520978006866, 0.016873881097949166, 0.010702733280713162, 0.005162195740456532, 0.0012519617529585638, 0.0004411546125016795, 0.9239884438915392, 0.13473640312304083, -0.017773008129377748, -0.010011003096463295, -0.0052545485806758715, -0.0024449169828068755, 0.00028071595425325455, 0.0030166669002766396, 0.006282675825901846, 0.008357782552451185, 0.010088881029204392, 0.011492614427355854, 0.012597966873332445, 0.013441683368166053, 0.01410673839096942, 0.0147791791866147, 0.015481579441988027, 0.0162087190584636, 0.016970114972993996, 0.017771037248354896, 0.01860353113483875, 0.019459098010253688, 0.02033327555048029, 0.02122187008346873, 0.022114225815876586, 0.02300083163410918, 0.02387265148709434, 0.02472578238594974, 0.025574955574312642, 0.026442492227902646, 0.02739091534639573, 0.02850381780776519, 0.02982018760065604, 0.03119981288458747, 0.032490209229071525, 0.03352708621714786, 0.03411653961815021, 0.03403838236083423, 0.033101542956723094, 0.0312776600284628, 0.028717430951775536, 0.025578362425322083, 0.022046806628277477, 0.01810494409038368, 0.013623147062949405, 0.008661224142737909, 0.003327395243400316, -0.0021362838764954722, -0.007506709875963844, -0.012655630029317794, -0.017473906626919153, -0.02191220999088705, -0.025959011091367057, -0.029551857809525715, -0.03267433543095963, -0.03533068996759604, -0.037520649973840386, -0.03923995190468761, -0.04051805782863774, -0.041399191282890005, -0.04195912041713621, -0.04235299710787533, -0.042710351942790735, -0.04300904490556971, -0.04321749366346373, -0.043302607327539926, -0.04321290202282675, -0.04288766620138147, -0.04232524154589444, -0.04155002205904968, -0.04058805817271183, -0.039482508700826834, -0.038281622224264705, -0.03697697851440897, -0.0355236432444472, -0.033878701956417755, -0.031994582563627826, -0.029812973478237477, -0.02745685828926793, -0.024481109033440876, -0.021046924995387486, -0.01707731492837137, -0.012457701036657515, -0.007045735596636574, -0.0006313016433268671, 0.006179995661392393, 0.015808526698172152, 0.024978227182932713]], [[0.17221343574864087, 0.17140652742166404, 0.16961858389506448, 0.16658843000905607, 0.161926339826379, 0.15514148864349547, 0.14571772725253793, 0.13325228068840667, 0.11754540536722967, 0.09968251936272705, 0.08224511178452178, 0.06700693614634302, 0.05470760768150972, 0.04554426316194585, 0.039537380952813, 0.03682116088177836, 0.037904449155738096, 0.04500154794972178, 0.1578019826813523, 1.5123639258780757, 0.44832248953436576, -0.2734857328521522, -0.06591392276817166, 0.0035694316236353834, 0.011415527166721586, 0.01267006676781435, 0.013366534534203616, 0.013919853150086748, 0.014459533560973804, 0.015009496514967538, 0.015593414501233702, 0.01621251875181335, 0.0168496410886929, 0.017493093912914526, 0.01813367406974157, 0.018759649190695792, 0.01933395637345483, 0.019818452385251744, 0.020179903605105735, 0.020394501070858082, 0.020461473323771535, 0.020368265700132653, 0.02020326703035223, 0.0201107487763601, 0.02011304320484374, 0.019941209873641095, 0.019373298947958098, 0.018192631995150043, 0.016173378439725786, 0.013089328365940681, 0.008819649392863869, 0.0034646472534159162, -0.0025595985211196645, -0.00893118321209834, -0.015398824526892075, -0.02206457873618858, -0.029244727082848466, -0.03690743880650516, -0.04536267793298734, -0.05320610874488742, -0.06043773686718311, -0.06683210914470299, -0.0724702530318936, -0.0773823926296921, -0.08156681598469316, -0.08501861820301132, -0.08775303830141462, -0.08980840458395692, -0.09118956090366154, -0.09190142357437804, -0.09201391795802268, -0.09161085379412394, -0.0908203636747178, -0.0898433374155854, -0.08884490399984135, -0.08779883970653624, -0.08665713296863661, -0.0853696533277327, -0.08386148115016523, -0.08206983517974221, -0.08000001775880876, -0.0776907189846499, -0.07518051539306062, -0.0725316760490422, -0.06978826174319046, -0.06691439637417082, -0.06386397557486077, -0.06054475513411225, -0.05634603280047705, -0.05227968085636983, -0.06004326616617771, -0.056744834176733996, -0.053333334680062815, -0.04997834325791014, -0.0469553557572622, -0.04480584264042191, -0.044686103313031585, -0.04786964426991751, -0.06312943216651558, -0.10882813191537027], [0.7002516780033172, 0.6968532886498291, 0.6894375628035491, 0.6769183838442465, 0.6576737892710919, 0.6296530663979423, 0.5906781347153988, 0.5389944484680809, 0.4736486176209473, 0.39904117270177364, 0.3257541048730967, 0.26093346124274375, 0.2074344879393799, 0.1657949919876308, 0.13562192919089539, 0.11653640923183027, 0.10887283319587888, 0.11619441770869295, 0.3179718615003745, 1.2719297194547194, 0.42559326839981354, -0.182617773280795, -0.011979190106469995, 0.046508555510746896, 0.06214727716586576, 0.0652876090709669, 0.06686333301118051, 0.06820458749960559, 0.06967964016707967, 0.07133220446880291, 0.07323193886097809, 0.07536340169570857, 0.07763998782353931, 0.0800020883806068, 0.08240437376742236, 0.084795045259419, 0.08702887457797714, 0.08895568613413965, 0.09044115050576353, 0.09138993292893056, 0.09180075965513276, 0.09162609589350104, 0.09122687810167185, 0.09119143097298481, 0.09161454958226402, 0.09140654103004121, 0.08966458146580313, 0.08550353447785944, 0.07799153020938092, 0.06618579548377379, 0.04944786236497316, 0.028247356495220203, 0.004242245522354334, -0.021275973904000076, -0.047274339811246055, -0.07414878401547928, -0.10317154699871085, -0.13412329242609777, -0.16717134017714855, -0.19875690119663264, -0.22803897760986616, -0.2543594168548372, -0.27769557968102015, -0.29814109977753694, -0.31562812035982973, -0.3301307691184695, -0.34170633938791084, -0.35050470594364125, -0.3565396488026386, -0.359828620875686, -0.36065528641581895, -0.35936627482762784, -0.35650418469841494, -0.35291317241179126, -0.3492609853819429, -0.34541520746970705, -0.3411642998129786, -0.33629319431637295, -0.3304885131646009, -0.32349027267446745, -0.31512740396786326, -0.30573079351913834, -0.2954555350651438, -0.284563446057271, -0.2732406141805193, -0.26132256051336694, -0.248583114930594, -0.2347124763124172, -0.21844325854027496, -0.201411147466214, -0.1901001319133392, -0.1689360142720368, -0.14508839648757485, -0.11936706624820186, -0.08962895297746193, -0.055531260296459786, -0.01596147465299345, 0.031974005047749256, 0.07926824919416942, 0.08339272937575352], [8.899830913923875, 8.85628801575645, 8.76160229985454, 8.601897588831472, 8.356448082220728, 7.999025933361506, 7.50171152294838, 6.841856024795338, 6.006919845413759, 5.052792574774144, 4.11422064633474, 3.28182798376988, 2.5914479305583686, 2.0491263864647316, 1.6484426704820099, 1.3818146427881557, 1.248301648454906, 1.2769102731089401, 1.6193642532342152, 4.872283817022738, 2.9162140271026717, -0.5619545698518597, 0.5500643113230885, 0.7762572335876214, 0.8369278236737486, 0.8709722162159336, 0.8872397200945499, 0.9015673860704477, 0.9181618699491422, 0.9374184982067721, 0.9601430018826591, 0.9860779379553293, 1.014072340462161, 1.0433324497234704, 1.0732584872216182, 1.103179871453733, 1.1312672144230298, 1.155626591198006, 1.174553153126068, 1.1868396647883122, 1.1924755126955437, 1.1908670721270647, 1.1866062374923523, 1.1871753643533025, 1.1937911816473117, 1.1926158415819699, 1.1721739255952035, 1.1212036006687591, 1.0278205916423073, 0.8799740369339142, 0.6691090466117138, 0.40137913536523717, 0.09775479408927253, -0.22540188245610118, -0.5549289709003367, -0.8958015587353959, -1.2641478071108954, -1.656911034409085, -2.0729469955304447, -2.473463393776874, -2.845254958681951, -3.1807306840899607, -3.478549194701305, -3.7398129600561303, -3.9634773348645673, -4.149195756699301, -4.297682415491976, -4.41082426100727, -4.488778727316181, -4.531760037964286, -4.543636945625485, -4.528732107219267, -4.4939678437668, -4.4501130698025975, -4.4055682707537365, -4.358513429665897, -4.306156998443914, -4.245672042482637, -4.172999253761962, -4.084812132626031, -3.981287475033513, -3.8643614895834477, -3.7360613515513434, -3.599769164651747, -3.457922017064846, -3.308454506100689, -3.148451962242628, -2.9742560296376648, -2.7734986863277524, -2.559668153455615, -2.3991427530954854, -2.1322377391475595, -1.8326078533488332, -1.494647497158592, -1.109443287888272, -0.6662594661775975, -0.17244856204965012, 0.4268979712953816, 1.0399388729029482, 1.2272425947479655], [-1143.3860186552913, -1137.7460224190395, -1125.5245058304215, -1104.9293157581249, -1073.2831694026065, -1027.195008958611, -963.0468846988047, -877.8833400468518, -770.0381290990852, -646.6864637768263, -525.1729232896855, -417.1142475042218, -327.0545034753831, -255.66720543713663, -201.94109072320742, -164.54027849501094, -142.66515192571097, -137.91339640004907, -160.4650797257712, -401.4705019202774, -201.9239494582137, -36.826308623662925, -88.32515586701379, -107.38264469527826, -113.67740459889087, -117.28390410665155, -118.8822713184457, -120.36743763096992, -122.2178827533182, -124.46344034535075, -127.19721708902081, -130.37813729401248, -133.85176087285478, -137.5113825161277, -141.2768526831711, -145.06041842481568, -148.62919605434033, -151.74179367644476, -154.17949949350506, -155.78779451386416, -156.56604423654142, -156.43935937213274, -155.9982724863309, -156.2047239881502, -157.21659089950185, -157.2576002473045, -154.85334211082738, -148.55538028511322, -136.8315868805779, -118.12476931217861, -91.27828118356138, -57.10684970364149, -18.291351593173864, 23.072948666579297, 65.29071899735678, 108.9936693486718, 156.24842265385325, 206.62709834077, 259.55498425097454, 310.91949877339766, 358.78984364626, 402.22612728854557, 440.89712549144645, 474.9224654541569, 504.1129822256864, 528.417981759873, 547.9256362428141, 562.8749624264707, 573.2832879547909, 579.1770773145195, 581.0197931745416, 579.3844354150674, 575.1774778946352, 569.7987960924219, 564.3322684437279, 558.5387643995386, 552.0572891961671, 544.5242970761233, 535.4182009491404, 524.3109461644659, 511.22326245786707, 496.4026266603824, 480.1095423039649, 462.78127394198833, 444.73739585817276, 425.7136591552424, 405.3287219405948, 383.1476967520028, 358.06938175290236, 330.8380391485515, 303.90884044256063, 269.79322695423133, 231.55212366521872, 188.49334796250102, 139.55991675511876, 83.49110506757401, 18.464321110583523, -57.58756838783339, -137.90731596023727, -179.6048553662797], [-23.130926122652834, -23.016542314960112, -22.768944261098856, -22.351817628691844, -21.7109097743267, -20.77748526079102, -19.47815922205263, -17.75285798969634, -15.567529489547745, -13.067298097024375, -10.603255369086725, -8.410248770666797, -6.579835395624185, -5.1249986639808185, -4.024121460299922, -3.247928776219484, -2.776023037948911, -2.6274865704234625, -2.95035176626324, -6.725150220570807, -3.349974252204684, -1.2229714899825324, -1.8966621672343267, -2.2199758710000848, -2.3379933069860077, -2.4061819104353726, -2.4354602265025997, -2.463294327301032, -2.4989786250665937, -2.542986344217079, -2.5971363265900465, -2.660547844029012, -2.7300556707429036, -2.803471729409098, -2.879155335718429, -2.955321270712101, -3.0272715774213848, -3.0901348268279016, -3.1394883938480347, -3.1722099224798535, -3.1882911104629548, -3.1862254855856373, -3.1779633647535217, -3.1829691064775125, -3.2044462986144087, -3.2064700004450084, -3.159211791946972, -3.0333595883497217, -2.797885041398314, -2.421229960162683, -1.8796371018756515, -1.1897388575786918, -0.405687430023846, 0.4301719728137836, 1.2870534919879484, 2.1752031403403373, 3.136154080884146, 4.160213993561658, 5.223790137012152, 6.265958885231365, 7.236370478759948, 8.11743025096013, 8.901844054705501, 9.592089951212964, 10.184381360572843, 10.677725426281143, 11.073922701683758, 11.377814757174276, 11.58975641238666, 11.710287521144458, 11.748796528980543, 11.716885449168704, 11.632933429018998, 11.525327173268975, 11.416001284601967, 11.300071468540802, 11.170210751333768, 11.019055705428746, 10.836049410376011, 10.61252513747069, 10.348887575715965, 10.050133376489939, 9.72153150226057, 9.371943860633932, 9.003288742531348, 8.613870168673971, 8.19625666910095, 7.742812317292766, 7.244789907783275, 6.691597265911361, 6.117712191767743, 5.428692868368463, 4.656631891012519, 3.7876290544671343, 2.800665263532731, 1.6710941671296895, 0.36398149418461306, -1.187997860673842, -2.8170519455277065, -3.770236717246881], [-12.362818400760625, -12.301587340324856, -12.169133907375913, -11.946029351640563, -11.603246642839933, -11.104003633395322, -10.40901319464971, -9.48607194332817, -8.316864288378774, -6.97894441831837, -5.660030545311181, -4.485587527683422, -3.504425289905396, -2.7232668844910064, -2.1301681703847746, -1.7087246654296384, -1.4466126293065669, -1.3495716511282325, -1.4772139418179835, -3.1237321522554153, -1.5867678667805196, -0.7887697476044522, -1.0507122022635005, -1.202548000477892, -1.262483382211643, -1.297321017718532, -1.311939757615373, -1.3260715182099305, -1.3445541067734719, -1.3675965535868904, -1.396149176254356, -1.429724490459566, -1.466617006535047, -1.5056473542981814, -1.5459321532083794, -1.5865139001662703, -1.624886160240121, -1.65844932816285, -1.6848402968415852, -1.7023914668295816, -1.7110999279378838, -1.7101633947681496, -1.7059702248846784, -1.708924946590506, -1.7207430546950606, -1.7222268669107184, -1.697433671515164, -1.6306936519246966, -1.505411895426695, -1.3034374717676929, -1.0126877657237308, -0.6421843936701023, -0.22090459041118757, 0.22847096410135975, 0.6874834422290084, 1.1628648583682641, 1.6769492637946732, 2.2246135448897317, 2.79329337739211, 3.3504753051477523, 3.8692831234035467, 4.340590893478429, 4.7602383659805065, 5.12954171924165, 5.446475860378224, 5.710512467845087, 5.922614108752343, 6.085367225496869, 6.198961316228742, 6.26368480600684, 6.284549539212174, 6.267758154216953, 6.223146859790733, 6.165909582441291, 6.107773735843972, 6.046114766347711, 5.977008176786483, 5.896515161604011, 5.798991475162876, 5.677546573097603, 5.534121602919706, 5.371607932309908, 5.1929339833045125, 5.002908655958173, 4.805118974983721, 4.5967381004820895, 4.373541721423329, 4.13134544845497, 3.865422799423801, 3.5700868956424, 3.2565289559299746, 2.888661985402488, 2.4765315394967726, 2.0127289361648684, 1.4861116991612544, 0.8837169335389732, 0.18729798067854977, -0.6371167870674851, -1.5149042121816074, -2.0612738920751013], [-9.742322137614456, -9.694024808166901, -9.589590943064808, -9.413700737589254, -9.143465559904909, -8.749878682795218, -8.201949979641208, -7.47425713620161, -6.552312497464513, -5.497226410538661, -4.456960007518868, -3.5303583291992924, -2.7558266914952667, -2.1385615589422655, -1.6689672119737493, -1.333760498708967, -1.122562232619899, -1.0378013714778076, -1.1172942346934973, -2.240472863005219, -1.1674909207185589, -0.6775325208499979, -0.8453756754137826, -0.9551782387610287, -1.0009341437703172, -1.0276326672076905, -1.0386692135540525, -1.049455792933417, -1.0637438153607446, -1.0816773917574507, -1.1039951672959547, -1.1303051174123846, -1.159256793416116, -1.1899161600183767, -1.2215840395717028, -1.253504311741036, -1.283703928200763, -1.3101362058084165, -1.3309392453517952, -1.344799490086975, -1.351715363797073, -1.3510559910705686, -1.3478562046580855, -1.3503157779398396, -1.3597881142101418, -1.3604877535155668, -1.340234198188872, -1.286692797952482, -1.1867752758840986, -1.027149342294603, -0.7976538028270638, -0.5053778564185152, -0.17313241049736539, 0.18121045871599925, 0.5431088629282271, 0.9178690086578979, 1.3230871946673277, 1.7547274472099081, 2.2028978282913996, 2.6419938474708498, 3.0508529273230156, 3.42240969706065, 3.753260165826647, 4.044435877225188, 4.294339196381803, 4.502554061755413, 4.669838535174521, 4.798229852481379, 4.887877068102899, 4.9390072040215545, 4.955569313466374, 4.942452110750714, 4.90741277902432, 4.8624344494305385, 4.816757704677058, 4.766626567167008, 4.710273119914503, 4.644755850363142, 4.565699436628755, 4.469464725617717, 4.3562255111456825, 4.228101539258126, 4.087332891414337, 3.937688832716214, 3.7819731650157697, 3.617942673367059, 3.4422595236724076, 3.251620474786802, 3.0422974697236125, 2.809807347964997, 2.5598812464366905, 2.270189013637589, 1.9456736374401526, 1.5805070037485416, 1.1659521599906748, 0.6918931026046414, 0.14414964047619092, -0.5030331575527237, -1.1981775517051274, -1.6460701933752673]], [[0.0179513183877276, 0.017919730298590314, 0.017839452351818812, 0.017681869186091912, 0.017402280780604372, 0.01694014846136378, 0.016223651912215892, 0.01518094335086136, 0.01374775929376683, 0.01198525821244835, 0.010146146256622784, 0.00843795515466902, 0.0069597471055759036, 0.005708070051786919, 0.004710187083451661, 0.003995994116243606, 0.0034852233103600393, 0.0031800232115746286, 0.0030635360833596147, 0.0031306172662034348, 0.2865567424514524, 0.29230766821901377, 0.299045076586484, 0.30684481470740993, 0.3156705804857611, -0.31308469034026837, -0.11811414188446988, 0.000538987554217502, 0.0007636084287133069, 0.0008464664433870223, 0.0008943134727516451, 0.0009293151211943708, 0.0009602946716669628, 0.000986611739340457, 0.0010084320725653566, 0.0010247009457323463, 0.0010263659068246692, 0.0010199956087260254, 0.0010024465673018576, 0.0009689706737178724, 0.0009185680822832583, 0.0008488084973110285, 0.0007660629445020726, 0.0006818412652860213, 0.0005955443446254951, 0.00042107287133166387, 0.00026336479894991044, 4.8796455294918945e-05, -0.00023940909960509763, -0.0006217236062055214, -0.0010906757245292492, -0.00163214642080853, -0.002209372554675605, -0.0027938170828431218, -0.0033656745799129943, -0.003935099664402564, -0.004531682009986574, -0.005151799246146892, -0.005782176365630043, -0.006382533311324682, -0.006908957924930628, -0.007357732565493513, -0.00775910927569207, -0.00810090379373336, -0.008379443305495352, -0.008591655661583979, -0.008711337191086506, -0.008794220205680606, -0.008838221289366071, -0.008831438501271105, -0.008778121946545646, -0.008685146423300798, -0.008563850591064875, -0.00842987873652099, -0.008292480236279239, -0.00799309801671553, -0.007850170124594902, -0.007699561087895761, -0.0075309843494551654, -0.007328178269715632, -0.0071080417655006245, -0.006876301525697891, -0.006630910206932069, -0.006376282478251806, -0.006115310067890404, -0.005844111981546858, -0.005558761631347976, -0.005255204565991237, -0.004928730019245645, -0.004573656768029779, -0.005222202509181537, -0.004935229501733705, -0.004646572447873966, -0.004373288980611831, -0.004143418478798086, -0.004010877215142836, -0.004088361426696748, -0.004505842751455705, -0.005664017919255863, 0.000587190837234619], [0.06623695090958884, 0.06611275989385319, 0.06580726837851335, 0.06521340784516427, 0.06416402379643057, 0.06243265479387009, 0.05975017023250833, 0.055845828868060964, 0.05047642560183341, 0.04386954077899519, 0.036965582940137826, 0.030530191926720292, 0.024922413257002684, 0.02019642360748542, 0.01638734868958769, 0.013505662354314643, 0.011375025462796649, 0.009961321432236518, 0.009162551162500856, 0.00889597367884774, 0.308533287776098, 0.3144417412227672, 0.3214522866267857, 0.32959202676832555, 0.33869553536559105, -0.3309200976667616, -0.19132369603292362, 0.003919434214985956, 0.004232655667821772, 0.00432865309783847, 0.0043842267160376265, 0.004432800857794279, 0.004483406484350083, 0.004531529125300554, 0.004574640253666294, 0.00460801294302047, 0.004609733518042061, 0.0045831773259547, 0.004516346173900172, 0.004396513630795018, 0.00422081750431226, 0.003980740704413981, 0.0036999163280749966, 0.0034209215452521134, 0.0031441142350860448, 0.002679655846758414, 0.0021643930678254715, 0.0014440641891967174, 0.00045846199579192484, -0.000856546874989417, -0.0025081066653976007, -0.004440294786183963, -0.006514457406367555, -0.008625802080684999, -0.010700500478216158, -0.012774793718017197, -0.014956320999259635, -0.017230693970619836, -0.019549594479256124, -0.02176895145995385, -0.023752642194994622, -0.02547978413589857, -0.026993997621176286, -0.028284089183485513, -0.029342395242149197, -0.03016544826406909, -0.030714849794674447, -0.03109055668261604, -0.03128979763685413, -0.03129408191251546, -0.031123512298914184, -0.03080504494741678, -0.030381999911308653, -0.02991411479782793, -0.029432038991309566, -0.028678277570699472, -0.028166689591357128, -0.0276168814163124, -0.026998081161873362, -0.02627442458405954, -0.025474375419028913, -0.02461348527724054, -0.023695045779798984, -0.02273780651223538, -0.021752916644733177, -0.020724542836428963, -0.01963610420426733, -0.01847052979843708, -0.017208077149081805, -0.01582511732945355, -0.014774257831034046, -0.013157325382903451, -0.011318983325195212, -0.009270443124566105, -0.006964862286645487, -0.004347510329159882, -0.0013445099020061003, 0.002223660940694586, 0.0059286028036631, 0.005791575149767959], [0.1119922390963145, 0.1117792086926867, 0.11125898193615812, 0.1102499368377922, 0.10846856487969049, 0.10553073679940099, 0.10097976284624662, 0.0943556271637632, 0.08524469237593739, 0.07403251302039872, 0.06231229872011126, 0.05137853443327426, 0.041835701422801526, 0.03380212851352095, 0.027311054610897244, 0.022340310502038586, 0.018639611096494292, 0.016134478698682463, 0.014636558631318485, 0.013980486667953897, 0.3246498911175748, 0.3306266271045345, 0.3378058846604539, 0.34617501164083764, 0.3554922954580292, -0.34126591256074884, -0.22582605653747911, 0.00739808792668453, 0.007721733343146164, 0.007800269277710262, 0.007845911293539095, 0.007895854935901754, 0.007955972758151164, 0.008017772360789691, 0.008075724285593113, 0.008121502726379782, 0.008122645213779716, 0.008076525804811508, 0.007962698663595563, 0.007761560740349378, 0.007468603044508601, 0.0070696048756538205, 0.006604574665717914, 0.006145544280529231, 0.005694144765923526, 0.004980468988175605, 0.004135894387022847, 0.002946490053239426, 0.0013111363597035697, -0.0008740472729741956, -0.0036350054358314566, -0.006875656969443091, -0.010360368245177125, -0.013912159333726791, -0.01740590302015032, -0.020902384829283846, -0.024582983615070667, -0.028422963393097342, -0.03234089396900359, -0.03609500189386231, -0.03946548063537887, -0.04241416033787725, -0.04498763028318483, -0.04718045135972845, -0.048982018162503554, -0.05038971917002551, -0.05136320669116058, -0.05202810614473361, -0.05238112129192415, -0.05240086672279142, -0.052123038884702745, -0.05159406892962763, -0.05088820684311276, -0.05010722290818796, -0.04932131620225247, -0.048204978510273375, -0.04736388850945299, -0.04645463060069453, -0.04542861368646333, -0.044235027596937766, -0.04290856706812006, -0.04147338420036465, -0.03993934502367445, -0.03833904824682585, -0.036691853102292275, -0.034971075224841386, -0.033148513482832924, -0.03119528215843786, -0.02907813379028564, -0.026757368586165287, -0.02482480853199408, -0.021976839467370397, -0.01880972363848063, -0.015273982257147618, -0.011436282735991973, -0.007019258694304669, -0.001960744585133828, 0.003997295091926372, 0.010254435286233326, 0.011239713285146391], [0.24571137004776844, 0.245237159456013, 0.24408749043631697, 0.24186255887902072, 0.2379383633182804, 0.23146936713550062, 0.2214499050114911, 0.20686566607987975, 0.18680369346022613, 0.16211160757999185, 0.13629203539612564, 0.1121849807796508, 0.09111089433935424, 0.07338915573651444, 0.05903421537210559, 0.04790826286193048, 0.039569204114033744, 0.033816082008023274, 0.030200099920554578, 0.028301501142727593, 0.3601443440837733, 0.3661043094395034, 0.3735303544382449, 0.38230074841241635, 0.39201402099452387, -0.3568408001462349, -0.27708313183813044, 0.017955853569636842, 0.018205425110422006, 0.018190405725384346, 0.018182494955442424, 0.01822010391043133, 0.018295104880647995, 0.018386943787817366, 0.0184806843259965, 0.01855731367913433, 0.018555869967018693, 0.01845195874962403, 0.018200365116391275, 0.01776236104656314, 0.01712879249491794, 0.016268861334926797, 0.015270458054582948, 0.01429171732501503, 0.013338511778122886, 0.011932857591489869, 0.010139387834933072, 0.007593591811712374, 0.004075127969549955, -0.0006337327965482825, -0.00662091685051906, -0.013680750924641199, -0.02129542199953167, -0.029073218478872374, -0.036736698379591086, -0.04441722943221697, -0.05251139041894109, -0.060963805105251186, -0.06959604276552692, -0.07788133567851979, -0.08535724240048886, -0.09193253848711506, -0.09764842979603802, -0.10252295544556805, -0.10653796162820425, -0.1096944240713496, -0.11195303052295232, -0.11349760547436054, -0.11432665492103508, -0.1144166915670907, -0.11385033786284914, -0.11273089637728508, -0.11122237532906606, -0.1095499642622966, -0.10787375562474606, -0.10576380787887915, -0.10395951764811313, -0.10199899652520623, -0.0997829361217625, -0.09722162087619592, -0.09436097355309714, -0.0912361296463522, -0.08787801461036703, -0.08436721750418862, -0.08075055609411114, -0.07697052839373007, -0.07296451868585575, -0.06866897499071077, -0.06401127471173881, -0.05890481668575111, -0.05383339811617725, -0.04762369922154499, -0.04073457634567387, -0.033048025199726105, -0.024380572925669346, -0.014650730290622792, -0.0035948961713676837, 0.009309117025761702, 0.02302102284858772, 0.02790339944373254], [0.3431948351130337, 0.34252955505491345, 0.34092020428475067, 0.3378077911920536, 0.33231989606507856, 0.3232743401058164, 0.30926488642839384, 0.28887264325913625, 0.2608201118275535, 0.22629193314912627, 0.19018342494110957, 0.1564612901883117, 0.12696736938858058, 0.10217343627281153, 0.08207454515017895, 0.0664398908434172, 0.05469797850205939, 0.04655198557429665, 0.041359784701965684, 0.03851061286537559, 0.37680736826254563, 0.38257510157288194, 0.3899735758648632, 0.39880283066966254, 0.4085700493863178, -0.3573011240557483, -0.29316501634160963, 0.02582069919375638, 0.025971389350531667, 0.025869909962418773, 0.025812427999522748, 0.02583403092432604, 0.025914336797989258, 0.0260238110903402, 0.026140386410427954, 0.026237186233934374, 0.02623347214661482, 0.026087164161251886, 0.025734955540034663, 0.025124593073746457, 0.024243608387326865, 0.023049157327519994, 0.021664048095978144, 0.020309195142377064, 0.01899201391796562, 0.017261429390825717, 0.014782849426942942, 0.011247665527926281, 0.006352673654180147, -0.00018412081208442262, -0.00852208653330894, -0.01836711509255951, -0.028984640890098307, -0.039831098789174034, -0.05052012134595713, -0.06123529942624941, -0.07253011522094352, -0.08432688687611146, -0.09637671275381426, -0.10794563371307025, -0.11839865552481567, -0.12760587786221195, -0.13559876422870412, -0.14241546775860903, -0.14803293267356268, -0.15245560537979583, -0.15565093324036933, -0.1578350783990874, -0.15900780451813537, -0.15914602389776153, -0.15836676162473295, -0.15681475930870076, -0.15471945025444706, -0.1523961339523624, -0.15006613716174497, -0.1476733658442146, -0.1451337420387735, -0.14236001874671647, -0.13922861269110112, -0.1356562843834405, -0.13165005420161932, -0.12726818472828372, -0.1225728167265015, -0.11767050722965036, -0.11262420988372732, -0.10735236187541863, -0.10176672297068991, -0.09577809744860055, -0.08928479535234092, -0.08216572402291587, -0.07485341451286492, -0.06619395099088368, -0.05659083117344158, -0.045881730729990126, -0.03381808976932225, -0.02011119512537693, -0.004712132934025613, 0.013239030603396307, 0.03238375103774776, 0.04037197495435394], [0.4492646152169837, 0.4483913007781485, 0.44628161486428936, 0.44220333084448427, 0.4350136907466839, 0.42316416747961294, 0.404812597096626, 0.37809977148807944, 0.3413514332283461, 0.29611896263003207, 0.24881317746451148, 0.2046267171563114, 0.16596862101386528, 0.13347766752352516, 0.10712664427730578, 0.08658178805280962, 0.071132932954621, 0.06037820082848578, 0.053464398583270734, 0.04957180126209929, 0.397053983482409, 0.4026581254839615, 0.4100803761706228, 0.41903758094511495, 0.42894472745096585, -0.35992419277885634, -0.3063208139004361, 0.034412551460616406, 0.03444649808044791, 0.03424722013455176, 0.0341336532502855, 0.03413640996417117, 0.03422135713810712, 0.03434915059969398, 0.034489908025846366, 0.03460818172455577, 0.034601918774141066, 0.03440942556442504, 0.033947702918511395, 0.03314323193100261, 0.031980383144141124, 0.030404461831678293, 0.028576679558086016, 0.026786967549973666, 0.025051502672648867, 0.022779923768279125, 0.019531929331226317, 0.014902660130294329, 0.008494646806376687, -6.18624013004504e-05, -0.010980412652271943, -0.02387251070882687, -0.037776719684666275, -0.05198153199996237, -0.0659809241958638, -0.08001480115050637, -0.09480707602401793, -0.11025582412740789, -0.12603562283035274, -0.1411873472542158, -0.15488894707690842, -0.16696851752036093, -0.17744594245687498, -0.18638203057078384, -0.1937485376867016, -0.1995537755679066, -0.20377364767066, -0.20665770516512863, -0.20820737645734472, -0.20837370657752302, -0.20731835148203026, -0.2052405495744113, -0.20244598270002984, -0.1993531256041164, -0.1962713882317306, -0.1931242448791693, -0.18979324655163093, -0.18616096789921682, -0.18206396742923903, -0.17739199000971567, -0.17215363953050083, -0.1664248100949237, -0.16028655672113784, -0.15387815976132685, -0.147281887896856, -0.14039093269874817, -0.13308984287142805, -0.12526178557694045, -0.11677360373518948, -0.10746677521157903, -0.0977182120059928, -0.0863950400162967, -0.07384110591470425, -0.05984590973311585, -0.04409019923933742, -0.026210322576060364, -0.005913461983146782, 0.01752605512187754, 0.042581775099992135, 0.054003464783356374], [0.5398534647607576, 0.5388023243680938, 0.536265139945292, 0.5313617036025728, 0.5227183302476394, 0.5084735508609144, 0.4864128147998824, 0.45430074810982024, 0.41012411887833905, 0.355747559686615, 0.29887636149539265, 0.2457501719339641, 0.19926231539757683, 0.1601955525044994, 0.12850233134917247, 0.10375894054924417, 0.08513920313833481, 0.07215066889474633, 0.06375908014748023, 0.05896496004211169, 0.41172527028079714, 0.4171379900019288, 0.42452079646387275, 0.4335195824161568, 0.443476264407888, -0.35911185669038737, -0.3126152013608904, 0.041789422434627826, 0.04171324844583943, 0.04142620867834251, 0.04126229860877872, 0.041247331949406885, 0.04133495610078287, 0.04147740550395424, 0.04163806006027541, 0.04177413500327419, 0.041781773883471617, 0.041551939555388696, 0.04098570123536759, 0.040011103341787674, 0.0386100836920629, 0.0367155646708338, 0.03452067671685751, 0.03237338264613323, 0.030292909259872602, 0.027569824693112425, 0.02367483193149272, 0.018121282050583106, 0.010431288744745193, 0.00016036856481036344, -0.012951774931349592, -0.028436108434022764, -0.045137724217245004, -0.062201897574305005, -0.07902051965704103, -0.0958816020379592, -0.11365459924147761, -0.1322168008936993, -0.15117737806425727, -0.169384926446318, -0.18585815165446712, -0.20038908567196992, -0.21298628608626943, -0.22373054570102024, -0.23258930951448673, -0.2395743853058073, -0.24474879051306433, -0.24823665413447496, -0.25005572595070974, -0.2502257455234422, -0.24894221612573023, -0.24643760110308993, -0.2430763249297405, -0.23935969085450576, -0.23565852532606285, -0.23188026959034097, -0.22788189887685148, -0.22352209453943975, -0.21860436248692644, -0.21299651949988171, -0.20670880809876166, -0.19983226073626661, -0.19246413225322023, -0.1847716882313751, -0.1768537314243794, -0.16858191656657773, -0.15981752345073294, -0.15042015950833998, -0.140229826211303, -0.129056060233977, -0.11722004027329325, -0.103622845595219, -0.0885497868308925, -0.07174908874138629, -0.05284078772852932, -0.03139748514027058, -0.0068305049919246815, 0.02120190690179585, 0.05130542982587132, 0.06572084017112392]], [[0.019634644642016485, 0.019686443658146438, 0.01976250078233116, 0.019827895099134928, 0.01983426019355469, 0.019708325942219707, 0.01936113351928592, 0.01867056070184093, 0.01746098313640255, 0.015745841347904545, 0.013813881103139258, 0.011847285439264292, 0.010026720660241989, 0.008411906841022066, 0.007028474868524365, 0.005874448274148982, 0.00493601060710776, 0.0041974442394528645, 0.00362151566138481, 0.003170004628833803, 0.05920011403194875, 0.05986028057647035, 0.06078761231957463, 0.061991532130818844, 0.06348901170980813, 0.0653054342737686, 0.06744060649801982, 0.06979092351075863, 0.0723411074193944, 0.07510725609515256, 0.07810673197681228, 0.08135342937771856, 0.08485208423969544, 0.08855081509301835, 0.0867134244482994, -0.023152005656040392, -0.007906754771409856, -0.00042990858353135237, -0.0003143293729687299, -0.0003791711128233066, -0.000480642434682114, -0.0006137481126474878, -0.0007714424701108214, -0.0009435783869151268, -0.0011302515941190086, -0.001351495105378727, -0.001619387120842588, -0.0019429756896602668, -0.002328799833733787, -0.002780173673266128, -0.003291953948310165, -0.003844136685971305, -0.004398776333735189, -0.004929480710152006, -0.005421615327191577, -0.005885584402239235, -0.0063490913575372995, -0.006813125265737825, -0.007271173164742862, -0.007693606695128922, -0.008055306676371322, -0.008343838540821857, -0.008569985787032237, -0.008741409454009934, -0.008859893573923578, -0.008928028413640866, -0.008949406169582728, -0.008928798783828332, -0.00886662220660381, -0.008763424520623392, -0.008625213714697577, -0.008458864630495905, -0.008275131558680428, -0.008086317088060959, -0.007901060350753044, -0.0077170996952285785, -0.00753030200212841, -0.0073366635108926, -0.007130824280038292, -0.006910405384543088, -0.006675582945153497, -0.006428687304455475, -0.006172334412131059, -0.00591122490132919, -0.005647228951892777, -0.005375772563169425, -0.005093640602347615, -0.004797547317047788, -0.004483788622319832, -0.004148083953330654, -0.004744559865172017, -0.004502193970237197, -0.0028358457923341146, -0.0023429301858050046, -0.001795870441834649, -0.0011822337341540546, -0.00048664622530302274, 0.00033750152588960235, 0.0012878199396726393, 0.0005100094260723892], [0.09118166848152585, 0.0914079992555127, 0.09176445133397992, 0.0920947064906503, 0.09215980836919097, 0.09160459753969191, 0.08997577686537958, 0.08670277425692184, 0.08106534781093555, 0.07304632292247505, 0.06388990218875781, 0.054668009442039735, 0.046133255890924846, 0.038577606625670384, 0.03210198366239004, 0.02668823207762708, 0.022268602145321795, 0.018766623196273764, 0.01601136939562018, 0.013829353348809685, 0.06920243954407326, 0.06877352190464822, 0.06883568273426653, 0.06934007543969534, 0.07025475772107949, 0.07156456670431006, 0.07324136244899268, 0.07517700827849892, 0.07735319725101408, 0.0797794463957159, 0.08246703151502155, 0.08541206967224362, 0.08858764637617488, 0.09185047533184724, 0.08325536437608552, -0.020488974536191935, -0.006676692414951224, -0.00011785781171146648, -0.00014127255186937397, -0.0005778590731587374, -0.0011320070892838405, -0.001801689590483421, -0.0025641442872621017, -0.0033790123126541806, -0.004250742461257275, -0.005274165525724669, -0.006506768778343339, -0.007991926819653373, -0.00976176582002149, -0.011833616778182347, -0.014191316061903188, -0.016738505630057805, -0.019300865320581898, -0.021757341820079462, -0.024040098754943423, -0.026196380602869673, -0.028352551838791307, -0.03051105293570253, -0.03264067617100203, -0.03460393308133051, -0.03628489541556673, -0.03764891248429806, -0.03872278716735614, -0.03953176338401382, -0.04009285711409785, -0.04041805861894133, -0.04052413430873593, -0.04043342644374737, -0.04014820496321846, -0.03967142766457861, -0.03903095220856626, -0.038258816307923424, -0.037405258604766005, -0.03652623554290995, -0.035659775486944524, -0.03479482264914201, -0.03391211378643879, -0.03299259239012082, -0.032010975462295525, -0.030956771841701116, -0.029832636796376034, -0.028648808563866736, -0.027417490740785647, -0.026160551831913733, -0.02488535025715262, -0.023568830255240463, -0.0221948333218738, -0.02074627284203563, -0.0192033887740321, -0.01754321292235152, -0.01634602369227285, -0.014430949391808928, -0.012341613288080946, -0.010048542368571419, -0.00750475150243329, -0.004659907663660109, -0.0014528601011193488, 0.0022469078901106187, 0.006253778235142559, 0.005308301108329319], [0.17394903387951463, 0.17437438490744353, 0.17505586340612517, 0.17569790189982581, 0.17583815670905503, 0.1747923517623908, 0.17167756968757567, 0.16540376186571853, 0.15463998598763692, 0.13931751746129267, 0.12176625146496495, 0.10413317341977654, 0.0878150231138903, 0.07337539800128394, 0.06099864859820738, 0.0506460847796879, 0.042186838312180105, 0.03547345263066702, 0.030180745384387985, 0.02597956048504008, 0.0805191453618115, 0.07883045166023214, 0.07789200831170594, 0.07758757009220796, 0.0778286504956216, 0.07855322279985347, 0.07970103728760093, 0.08115973042753835, 0.08290835374707953, 0.08494985636186422, 0.08729028583728078, 0.08990891512526392, 0.09275167161625054, 0.09561044781877102, 0.0823585141147122, -0.017987440521093644, -0.0051994304433600575, 0.0006239476608773355, 0.00032618125983157324, -0.0005679087851879446, -0.001662533512261131, -0.0029633909948072125, -0.004431555974130959, -0.0059930908956574965, -0.007658291967210911, -0.00960888259583039, -0.011955163593167836, -0.014780494274403248, -0.018146957315659247, -0.022088492138170795, -0.026577751614337432, -0.031429347814532396, -0.0363115833586596, -0.04099434660566015, -0.04535007253071495, -0.049467811760652805, -0.053586911140305366, -0.057710479840371774, -0.06177806382121388, -0.06552702262932734, -0.06873612182532736, -0.07134934518031219, -0.0734071543366453, -0.07497561194041252, -0.07606986989301112, -0.07671333793166972, -0.07693833783018099, -0.0767877576217628, -0.07626623824103959, -0.07537967088560506, -0.07418112938685988, -0.07273151666149445, -0.07112639639432723, -0.06947204124283453, -0.06784054129321666, -0.06621091164773191, -0.06454678296764112, -0.06281213796631287, -0.06095906829575307, -0.058967966412395566, -0.0568417891017533, -0.05460125090832992, -0.05226942162404073, -0.04988756612978305, -0.04746720617882478, -0.044965345087786546, -0.042355021557211575, -0.03960284463160854, -0.03667171185205883, -0.033518254016614527, -0.030813205119065767, -0.027158077663395924, -0.023170804706105705, -0.018769740704686688, -0.013939943403510548, -0.0085149534568718, -0.0024072787383213274, 0.004593244548253939, 0.012053658997496, 0.011454779680303406], [0.4743783199468579, 0.47552042562197705, 0.4773829771505788, 0.4791672846188096, 0.47959445190841904, 0.47677965439616005, 0.4682645731942602, 0.4510721924646536, 0.4216927295558755, 0.3798387199058402, 0.3317424847020106, 0.2835430200456647, 0.2389408017849377, 0.19949121238968687, 0.16567423759544744, 0.1373730819896464, 0.11422634423601774, 0.09582752048971553, 0.08129229563249521, 0.06972805777652702, 0.12093870685362978, 0.11467474892339763, 0.11010148017465839, 0.10685795678579028, 0.10465044111542116, 0.10324677602316039, 0.10247056786257601, 0.10219638835856507, 0.10239542924060209, 0.1030487927049324, 0.104147041290192, 0.10561553308014528, 0.10732007679088679, 0.10889739928314034, 0.0849255748140882, -0.00997245040472387, 0.0002924134918122905, 0.004056376036476406, 0.0025326305424921763, -8.425997601434546e-05, -0.003183022728648453, -0.006806101613435201, -0.010860341275711288, -0.015153451306315045, -0.019719506280198005, -0.02505681530407783, -0.03146822910467051, -0.03918295072579837, -0.04837236375709328, -0.05913081141855095, -0.07139228470684496, -0.08464575623759765, -0.09798808968566644, -0.11079263061147103, -0.12270652744940508, -0.13397235919297718, -0.1452409986693389, -0.1565190764157732, -0.16764127578124227, -0.17789214118432006, -0.1866698957376692, -0.19385138108581332, -0.19951808239318347, -0.20384952438587858, -0.20688693346920622, -0.2086945661622269, -0.20936090113634803, -0.20897338268359958, -0.2075754428132779, -0.20518419687300282, -0.2019439706999416, -0.19801985014507714, -0.1936708926234025, -0.1891840656174397, -0.18475344707246671, -0.18032268707020296, -0.17579446519442835, -0.17107209289490838, -0.16602634235275246, -0.16060548844407377, -0.1548193056727798, -0.1487246938799022, -0.14238420178075378, -0.13591014264154594, -0.1293390768238547, -0.12255137757846836, -0.1154645789522097, -0.10799078878750057, -0.10002777908222674, -0.09145619100232505, -0.08299232333222505, -0.07301983476716555, -0.06214238586635461, -0.05020269211850182, -0.036960417870171416, -0.022172134859197203, -0.005545205423230859, 0.013385486053204283, 0.03321983874840986, 0.03493813954402509], [0.7495328050725384, 0.751328673806289, 0.7542735509795343, 0.7571090591176489, 0.7578057295256466, 0.7533763695288487, 0.7399121895721503, 0.7127073027357901, 0.6662744380605221, 0.6001107267195003, 0.5240043018711537, 0.44779308594530093, 0.3772711266360413, 0.31490492305802475, 0.2614417972684984, 0.21669172025400804, 0.18008147301252983, 0.15096663916230071, 0.12795118555044083, 0.10962720544379473, 0.1574436843775042, 0.14698474079788965, 0.1390769256384731, 0.1331350656630962, 0.1286773275172165, 0.12531559438257292, 0.12276726645510043, 0.12089639633085422, 0.11966784816669279, 0.11904359578760212, 0.1189919128383181, 0.11940066251571801, 0.12007094420836067, 0.12053537712198999, 0.08966182984468352, -0.003127903017266908, 0.005318460449614614, 0.007453955610894443, 0.004693672380704984, 0.0004649269107022597, -0.004494300856171989, -0.01026421357803045, -0.016703867617359064, -0.0235136105887392, -0.030749728472341576, -0.0392008649297295, -0.04934648424766234, -0.061549458257763166, -0.07608133324147083, -0.09309186093773351, -0.11248083376196125, -0.13343791424605955, -0.15453650489361553, -0.17478674059450394, -0.1936306984538828, -0.21145096436851168, -0.22927483175663288, -0.24711180707544067, -0.26470046564803557, -0.28091078816138987, -0.29473447523488977, -0.30604607847192555, -0.31496151543242873, -0.32176515667145117, -0.3265229309062589, -0.3293373124474557, -0.3303489743318477, -0.32974430244152403, -0.32754551447724517, -0.3237794339492412, -0.31867375184305424, -0.3124889030422311, -0.3056339073234544, -0.29856192305936047, -0.2915792877347758, -0.28459674412972935, -0.2774605754188623, -0.27001806003082757, -0.2620650245109719, -0.25351976393846504, -0.24439776599549357, -0.23478891562131712, -0.22479198405160916, -0.2145844176171814, -0.20422400759933831, -0.1935218375577247, -0.1823477616900558, -0.17056308606985618, -0.15800659447089865, -0.14449009239966978, -0.13059386836965683, -0.11486250720084276, -0.09767407778541998, -0.07880671152687765, -0.05775081459753282, -0.034516093353237125, -0.008259551919861162, 0.021573185246787124, 0.05266319161927768, 0.057008030742259935], [1.0706249699233497, 1.0731823392003963, 1.0773905609195757, 1.0814554042892035, 1.082470095824504, 1.0761595547579412, 1.0569183778794964, 1.0180228264451592, 0.9516874475474829, 0.8571501149162903, 0.7483388367083978, 0.639430400569255, 0.538653387913325, 0.4495389780025265, 0.3731446665770559, 0.3091940745571461, 0.2568664461708141, 0.21523938750004712, 0.18231991149571053, 0.15609918390478938, 0.1995468862839548, 0.18418628556175368, 0.17237960978844832, 0.16327985648080734, 0.15618551158123448, 0.15052623832007528, 0.14589555521908484, 0.14213337512540114, 0.1392097595003192, 0.13706451237645764, 0.13566135644261026, 0.1348273778043989, 0.13429254770156612, 0.13348780022817439, 0.09608574599501381, 0.004735293490753492, 0.011269224011187887, 0.011612132915639325, 0.0073553339676715, 0.0012342806333621482, -0.005902130644397271, -0.014180216939502194, -0.023404202826937705, -0.0331497534441571, -0.04349940510713801, -0.05558075394567477, -0.07007949414504148, -0.08751463333462348, -0.10827483068542078, -0.13257479031279495, -0.1602752993616742, -0.1902165263131412, -0.2203613108380952, -0.24929614953315757, -0.2762238392832465, -0.3016902551889216, -0.32716174923020575, -0.35256802603106285, -0.3776147166661179, -0.40068807612808566, -0.42043145942788146, -0.4366011083788247, -0.44934960104057936, -0.4590825504511524, -0.46589384215767665, -0.4699298114853259, -0.47139133107734604, -0.4705445701693149, -0.4674212969421841, -0.4620599390127415, -0.4547856498350401, -0.4459702450222911, -0.43619783433638204, -0.42611558527318033, -0.4161608784796588, -0.4062060940782539, -0.3960317854739478, -0.3854199209456113, -0.37407893265608905, -0.3618921863021354, -0.3488818880695233, -0.33517644775990707, -0.3209169236247873, -0.3063567853556835, -0.2915786156047924, -0.2763126598086544, -0.26037314618438945, -0.24356209208158466, -0.2256494163606737, -0.20636664313311784, -0.18632447556450227, -0.1635988846457386, -0.13905297449034576, -0.11210102357325714, -0.08221034070789046, -0.04884208677405033, -0.01135041045832557, 0.03119200799199857, 0.07537671871283912, 0.08305122146700387], [1.374993201641413, 1.3782716107535125, 1.3836775587261014, 1.3889091996372185, 1.3902273437648405, 1.3821352648301337, 1.3574170575232245, 1.307436036634363, 1.2222336197627879, 1.100797458093233, 0.9609743819378368, 0.8210667377902972, 0.6916059892580484, 0.5771333637446647, 0.4789993589361863, 0.3968452392389312, 0.3296154035502729, 0.27612376340958744, 0.2338115812900177, 0.20010061925033204, 0.23921678536755864, 0.21920695118650418, 0.20370102431724033, 0.19160373573610032, 0.18200525168817033, 0.17414558709865713, 0.16751677505264254, 0.16196166656037708, 0.15743181950408722, 0.15384641470789534, 0.15115631679338626, 0.1491401348477955, 0.14746294379174904, 0.14547052830538332, 0.10274248265170113, 0.012088244127356977, 0.016934353684244518, 0.01564311307294683, 0.009935423957414667, 0.0020121001176737524, -0.007193808162283991, -0.017853533065973246, -0.029719892663137435, -0.04225074182272128, -0.05555371861408476, -0.07107782990278366, -0.08970433388101183, -0.11210029245808907, -0.1387654289958565, -0.1699760614853014, -0.20555636331965316, -0.24401493709786548, -0.28273589483536804, -0.31990419028665984, -0.3544957761835113, -0.38710297317080694, -0.419711188015535, -0.4523372437675482, -0.4845018579852185, -0.5141328033070518, -0.5394883388370932, -0.5602652237787061, -0.5766494616922996, -0.5891615366841811, -0.5979218090739783, -0.6031181895600913, -0.6050086106088057, -0.6039348634910934, -0.5999377703007014, -0.5930667700274015, -0.5837393948618319, -0.5724330211999454, -0.5598977164403426, -0.546964543474638, -0.5341950859755273, -0.5214253485316974, -0.5083735920844348, -0.49475988898116696, -0.48020983603348705, -0.4645736932549603, -0.4478800419748742, -0.43029381010527223, -0.4119961350128035, -0.3933125477196151, -0.374349132763397, -0.3547595144325917, -0.3343051950930911, -0.31273198490662707, -0.28974450806327173, -0.2649981495994108, -0.23909335994895042, -0.20995469040302678, -0.17811714905346354, -0.14361170916430885, -0.10522224494583335, -0.062370017541658704, -0.014229892140932187, 0.04035283776646372, 0.09692714076966803, 0.10790722590393632]]], "reynolds_numbers": [50000.0, 100000.0, 200000.0, 500000.0, 1000000.0, 3500000.0, 5000000.0, 7500000.0], "angle_of_attacks": [-0.24434609527920614, -0.22689280275926285, -0.20943951023931956, -0.19198621771937624, -0.17453292519943295, -0.15707963267948966, -0.13962634015954636, -0.12217304763960307, -0.10471975511965978, -0.08726646259971647, -0.06981317007977318, -0.05235987755982989, -0.03490658503988659, -0.017453292519943295, 0.0, 0.017453292519943295, 0.03490658503988659, 0.05235987755982989, 0.06981317007977318, 0.08726646259971647, 0.10471975511965978, 0.12217304763960307, 0.13962634015954636, 0.15707963267948966, 0.17453292519943295, 0.19198621771937624, 0.20943951023931956, 0.22689280275926285, 0.24434609527920614, 0.2617993877991494, 0.2792526803190927, 0.29670597283903605, 0.3141592653589793, 0.33161255787892263, 0.3490658503988659, 0.3665191429188092, 0.3839724354387525, 0.4014257279586958, 0.4188790204786391, 0.4363323129985824, 0.4537856055185257, 0.47123889803846897, 0.4886921905584123, 0.5061454830783556, 0.5235987755982988, 0.5410520681182421, 0.5585053606381855, 0.5759586531581288, 0.5934119456780721, 0.6108652381980153, 0.6283185307179586, 0.6457718232379019, 0.6632251157578453, 0.6806784082777885, 0.6981317007977318, 0.7155849933176751, 0.7330382858376184, 0.7504915783575618, 0.767944870877505, 0.7853981633974483, 0.8028514559173916, 0.8203047484373349, 0.8377580409572782, 0.8552113334772214, 0.8726646259971648, 0.8901179185171081, 0.9075712110370514, 0.9250245035569946, 0.9424777960769379, 0.9599310885968813, 0.9773843811168246, 0.9948376736367679, 1.0122909661567112, 1.0297442586766545, 1.0471975511965976, 1.064650843716541, 1.0821041362364843, 1.0995574287564276, 1.117010721276371, 1.1344640137963142, 1.1519173063162575, 1.1693705988362009, 1.1868238913561442, 1.2042771838760873, 1.2217304763960306, 1.239183768915974, 1.2566370614359172, 1.2740903539558606, 1.2915436464758039, 1.3089969389957472, 1.3264502315156905, 1.3439035240356338, 1.361356816555577, 1.3788101090755203, 1.3962634015954636, 1.413716694115407, 1.4311699866353502, 1.4486232791552935, 1.4660765716752369, 1.4835298641951802, 1.5009831567151235, 1.5184364492350666, 1.53588974175501, 1.5533430342749532, 1.5707963267948966]}, "prev": null, "next": null, "number_of_points": 201}}, "airfoil_polar_stations": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0], "cruise": {"design_thrust": 200, "design_torque": 107.93214760372817, "design_power": 13699.856787119088, "design_angular_velocity": 126.93027139067017, "design_tip_mach": null, "design_acoustics": null, "design_performance": null, "design_SPL_dBA": 0, "design_pitch_command": 0.5235987755982988, "design_Cl": -0.035497566166820614, "design_thrust_coefficient": 0.04212252028571272, "design_power_coefficient": 0.08046221757787539, "design_altitude": 457.20000000000005, "design_freestream_velocity": 58.1152}, "induced_power_factor": 1.48, "profile_drag_coefficient": 0.03, "clockwise_rotation": true, "phase_offset_angle": 0.0, "orientation_euler_angles": [0.0, 0.0, 0.0], "pitch_command": 0.0, "ducted": false, "sol_tolerance": 1e-08, "use_2d_analysis": false, "nonuniform_freestream": false, "axial_velocities_2d": null, "tangential_velocities_2d": null, "radial_velocities_2d": null, "start_angle": 0.0, "start_angle_idx": 0, "variable_pitch": true, "electric_propulsion_fraction": 1.0, "Wake": {"tag": "rotor_wake", "origin": [[0.0, 0.0, 0.0]], "generative_design_max_per_vehicle": 0, "generative_design_characteristics": [], "generative_design_special_parent": null, "mass_properties": {"mass": 0.0, "volume": 0.0, "center_of_gravity": [[0.0, 0.0, 0.0]], "moments_of_inertia": {"center": [0.0, 0.0, 0.0], "tensor": [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]}}, "symmetric": false, "inputs": {}, "outputs": {}, "wake_method": "Fidelity_Zero"}, "optimization_parameters": {"tip_mach_range": [0.3, 0.7], "multiobjective_aeroacoustic_weight": 1.0, "multiobjective_performance_weight": 0.5, "multiobjective_acoustic_weight": 1.0, "noise_evaluation_angle": 2.356194490192345, "tolerance": 0.0001, "ideal_SPL_dBA": 30, "ideal_efficiency": 1.0, "ideal_figure_of_merit": 1.0}, "use_surrogate": false, "training": {"advance_ratio": [0.0, 0.1, 0.2, 0.30000000000000004, 0.4, 0.5, 0.6000000000000001, 0.7000000000000001, 0.8, 0.9, 1.0, 1.1, 1.2000000000000002, 1.3, 1.4000000000000001, 1.5, 1.6, 1.7000000000000002, 1.8, 1.9000000000000001, 2.0, 2.1, 2.2, 2.3000000000000003, 2.4000000000000004, 2.5], "tip_mach": [0.1, 0.2, 0.30000000000000004, 0.4, 0.5, 0.6, 0.7000000000000001, 0.8, 0.9], "pitch_command": null, "altitude": [0.0, 2500.0, 5000.0]}, "surrogates": {}, "hover": {"design_thrust": 991.4231250000001, "design_torque": 87.94524276184421, "design_power": 23601.335650515724, "design_angular_velocity": 268.3639831938171, "design_tip_mach": null, "design_acoustics": null, "design_performance": null, "design_freestream_velocity": 12.920538169696316, "design_SPL_dBA": 0, "design_pitch_command": 0.0, "design_Cl": 0.5485196648725132, "design_thrust_coefficient": 0.04474887207772273, "design_power_coefficient": 0.014050248937862823, "design_altitude": 12.192}, "oei": {"design_thrust": 1133.0589852596172, "design_torque": 121.32345069500374, "design_power": 28419.76514884707, "design_angular_velocity": 234.24791321087469, "design_tip_mach": null, "design_acoustics": null, "design_performance": null, "design_freestream_velocity": 13.81263630963968, "design_pitch_command": 0.07849405338995467, "design_altitude": 12.192, "design_SPL_dBA": null, "design_Cl": null, "design_thrust_coefficient": null, "design_power_coefficient": null}}
\ No newline at end of file
@@ -0,0 +1,82 @@
+# rotor_multistart_design_test.py
+# 
+
+# ----------------------------------------------------------------------        
+#   Imports
+# ----------------------------------------------------------------------    
+import RCAIDE
+from   RCAIDE.Framework.Core                                                          import Units
+from   RCAIDE.Library.Methods.Propulsors.Converters.Rotor                             import design_rotor_multistart
+from   RCAIDE.Library.Methods.Propulsors.Converters.Rotor.design_rotor_multistart     import compute_pareto_set
+
+import numpy as np
+import os
+
+# ----------------------------------------------------------------------        
+#   Main
+# ----------------------------------------------------------------------    
+def main():
+    
+    # Pareto set of a known set of objectives 
+    objectives = np.array([[1.,4.],[2.,2.],[3.,3.],[4.,1.],[2.,2.]])
+    pareto     = compute_pareto_set(objectives)
+    assert(list(pareto) == [True,True,False,True,True])
+    pareto     = compute_pareto_set(objectives,np.array([False,True,True,True,True]))
+    assert(list(pareto) == [False,True,False,True,True])
+    
+    # two starts for two aeroacoustic weights, with a single optimizer iteration each 
+    rotor   = lift_rotor_setup()
+    results = design_rotor_multistart(rotor,number_of_starts = 2,aeroacoustic_weights = [1.0,0.5],iterations = 1,number_of_processes = 2,seed = 1)
+    
+    assert(len(results.designs) == 4)
+    assert(len(results.best_designs) == 2)
+    assert(len(results.pareto_set) > 0)
+    
+    # the first start of every weight is the default starting geometry, runs from the same start share performance 
+    assert(np.allclose(results.designs[0].initial_values,results.designs[2].initial_values))
+    assert(not np.allclose(results.designs[0].initial_values,results.designs[1].initial_values)) 
+    assert(np.abs(results.designs[0].performance_objective - results.designs[2].performance_objective) < 1E-9)
+    assert(np.abs(results.designs[0].acoustic_objective - results.designs[2].acoustic_objective) < 1E-9)
+    
+    # the input rotor is not modified and the designs keep its tag 
+    assert(rotor.tag == 'lift_rotor')
+    assert(np.size(rotor.chord_distribution) == 1)
+    for design in results.designs:
+        assert(design.rotor.tag == 'lift_rotor')
+        assert(len(design.rotor.chord_distribution) == 20)
+    
+    return 
+
+# ----------------------------------------------------------------------        
+#   Lift rotor 
+# ----------------------------------------------------------------------  
+def lift_rotor_setup():
+    
+    separator     = os.path.sep
+    airfoils_path = os.path.join(os.path.split(os.path.split(os.path.abspath(__file__))[0])[0],'..','Vehicles','Airfoils') + separator
+    
+    lift_rotor                                  = RCAIDE.Library.Components.Propulsors.Converters.Lift_Rotor()   
+    lift_rotor.tag                              = 'lift_rotor'  
+    lift_rotor.tip_radius                       = 2.8/2
+    lift_rotor.hub_radius                       = 0.1 
+    lift_rotor.number_of_blades                 = 3     
+    lift_rotor.hover.design_altitude            = 40 * Units.feet  
+    lift_rotor.hover.design_thrust              = 2700 * 9.81 /8
+    lift_rotor.hover.design_freestream_velocity = np.sqrt(lift_rotor.hover.design_thrust/(2*1.2*np.pi*(lift_rotor.tip_radius**2)))  
+    lift_rotor.oei.design_altitude              = 40 * Units.feet  
+    lift_rotor.oei.design_thrust                = 2700 * 9.81 /7
+    lift_rotor.oei.design_freestream_velocity   = np.sqrt(lift_rotor.oei.design_thrust/(2*1.2*np.pi*(lift_rotor.tip_radius**2)))  
+    airfoil                                     = RCAIDE.Library.Components.Airfoils.Airfoil()   
+    airfoil.coordinate_file                     = airfoils_path + 'NACA_4412.txt'
+    airfoil.polar_files                         = [airfoils_path + 'Polars' + separator + 'NACA_4412_polar_Re_50000.txt' ,
+                                                   airfoils_path + 'Polars' + separator + 'NACA_4412_polar_Re_100000.txt' ,
+                                                   airfoils_path + 'Polars' + separator + 'NACA_4412_polar_Re_200000.txt' ,
+                                                   airfoils_path + 'Polars' + separator + 'NACA_4412_polar_Re_500000.txt' ,
+                                                   airfoils_path + 'Polars' + separator + 'NACA_4412_polar_Re_1000000.txt']
+    lift_rotor.append_airfoil(airfoil)                         
+    lift_rotor.airfoil_polar_stations           = [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0]    
+    
+    return lift_rotor
+
+if __name__ == '__main__': 
+    main()
@@ -0,0 +1,164 @@
+# Regressions/Tests/propulsion/engine_deck_test.py
+#
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+import RCAIDE
+from RCAIDE.Library.Methods.Propulsors.Common                                          import generate_engine_deck, load_engine_deck
+from RCAIDE.Library.Methods.Noise.Correlation_Buildup.Turbofan                         import turbofan_engine_noise
+from RCAIDE.Library.Methods.Emissions.Chemical_Reactor_Network_Method.evaluate_CRN_emission_indices import check_engine_deck
+from RCAIDE.Library.Methods.Noise.Common                                               import generate_hemisphere_microphone_locations
+
+# python imports
+import numpy as np
+import sys
+import os
+
+sys.path.append(os.path.join( os.path.split(os.path.split(sys.path[0])[0])[0], 'Vehicles'))
+from Boeing_737    import vehicle_setup
+from Concorde      import vehicle_setup as concorde_setup
+from ATR_72        import vehicle_setup as ATR_72_setup
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  main
+# ----------------------------------------------------------------------------------------------------------------------
+def main():
+    '''Compares the engine decks of the Boeing 737 turbofan, the Concorde turbojet and the ATR 72 turboprop to their
+    thermodynamic cycles, and checks that the cycle is used outside the deck and that the analyses that need the
+    component conditions reject the engine deck'''
+
+    vehicle  = vehicle_setup()
+    turbofan = vehicle.networks.fuel.propulsors['starboard_propulsor']
+
+    mach_number = np.linspace(0.1,0.8,15)
+    altitude    = np.linspace(0.,12000.,13)
+    throttle    = np.linspace(0.,1.,5)
+    filename    = 'engine_deck_test.npz'
+    generate_engine_deck(turbofan,mach_number,altitude,throttle,filename = filename)
+
+    # the saved deck is the generated deck
+    deck        = turbofan.engine_deck
+    loaded_deck = load_engine_deck(turbofan,filename)
+    os.remove(filename)
+    assert np.all(loaded_deck.thrust == deck.thrust)
+    assert np.all(loaded_deck.fuel_flow_rate == deck.fuel_flow_rate)
+    assert np.all(loaded_deck.altitude == deck.altitude)
+
+    test_mach     = np.array([0.25,0.45,0.62,0.78])
+    test_altitude = np.array([1500.,4200.,7700.,10700.])
+    test_throttle = np.array([0.9,0.8,0.7,0.65])
+
+    # full thermodynamic cycle
+    turbofan.use_engine_deck = False
+    cycle_conditions = run_propulsor(turbofan,test_mach,test_altitude,test_throttle)
+    cycle            = cycle_conditions.energy[turbofan.tag]
+
+    # engine deck
+    turbofan.use_engine_deck = True
+    deck_conditions = run_propulsor(turbofan,test_mach,test_altitude,test_throttle)
+    deck_results    = deck_conditions.energy[turbofan.tag]
+
+    thrust_truth = np.array([72685.47192360541, 43123.501156062564, 32134.92107885528, 22685.681579855634])
+    fuel_truth   = np.array([1.1470607505046195, 0.8414791715702963, 0.5552894095107477, 0.40074246506127914])
+
+    print('deck thrust         :',deck_results.thrust[:,0])
+    print('deck fuel flow rate :',deck_results.fuel_flow_rate[:,0])
+    print('cycle thrust        :',cycle.thrust[:,0])
+    print('cycle fuel flow rate:',cycle.fuel_flow_rate[:,0])
+
+    # the deck reproduces the thermodynamic cycle
+    thrust_error = np.abs(deck_results.thrust - cycle.thrust)/cycle.thrust
+    fuel_error   = np.abs(deck_results.fuel_flow_rate - cycle.fuel_flow_rate)/cycle.fuel_flow_rate
+    power_error  = np.abs(deck_results.power - cycle.power)/cycle.power
+    assert np.all(thrust_error < 2E-2)
+    assert np.all(fuel_error   < 2E-2)
+    assert np.all(power_error  < 2E-2)
+
+    # regression
+    assert np.all(np.abs(deck_results.thrust[:,0] - thrust_truth)/thrust_truth < 1E-6)
+    assert np.all(np.abs(deck_results.fuel_flow_rate[:,0] - fuel_truth)/fuel_truth < 1E-6)
+
+    # above the deck the thermodynamic cycle is used
+    fallback_conditions = run_propulsor(turbofan,np.array([0.25,0.45,0.62,0.85]),test_altitude,test_throttle)
+    assert 'exit_velocity' not in deck_conditions.noise[turbofan.tag].turbofan.core_nozzle
+    assert 'exit_velocity' in fallback_conditions.noise[turbofan.tag].turbofan.core_nozzle
+
+    # the jet noise and the chemical reactor network emissions need the conditions of the engine components
+    settings = RCAIDE.Framework.Analyses.Noise.Correlation_Buildup().settings
+    try:
+        turbofan_engine_noise(generate_hemisphere_microphone_locations(settings),turbofan,deck_conditions.noise[turbofan.tag].turbofan,RCAIDE.Framework.Mission.Segments.Segment(),settings)
+        assert False
+    except ValueError:
+        pass
+    try:
+        check_engine_deck(turbofan)
+        assert False
+    except ValueError:
+        pass
+
+    # turbojet
+    turbojet = list(concorde_setup().networks.fuel.propulsors)[0]
+    deck_test(turbojet,np.linspace(0.1,2.1,21),np.linspace(0.,18000.,13),np.linspace(0.2,1.,5),
+              np.array([0.3,0.9,1.6,2.0]),np.array([1000.,8000.,14000.,17000.]),np.array([0.95,0.8,0.9,0.7]))
+
+    # turboprop
+    turboprop = ATR_72_setup().networks.fuel.propulsors['starboard_propulsor']
+    deck_test(turboprop,np.linspace(0.05,0.6,12),np.linspace(0.,8000.,9),np.linspace(0.2,1.,5),
+              np.array([0.15,0.3,0.42,0.5]),np.array([300.,2500.,5200.,7100.]),np.array([0.95,0.85,0.75,0.6]))
+
+    return
+
+def deck_test(propulsor,mach_number,altitude,throttle,test_mach,test_altitude,test_throttle):
+    '''Compares the engine deck of a propulsor to its thermodynamic cycle inside the deck and checks that the cycle,
+    with the conditions of the combustor, is used above the deck'''
+
+    generate_engine_deck(propulsor,mach_number,altitude,throttle)
+
+    propulsor.use_engine_deck = False
+    cycle                     = run_propulsor(propulsor,test_mach,test_altitude,test_throttle).energy[propulsor.tag]
+    propulsor.use_engine_deck = True
+    deck_conditions           = run_propulsor(propulsor,test_mach,test_altitude,test_throttle)
+    deck_results              = deck_conditions.energy[propulsor.tag]
+
+    print(propulsor.tag,'deck thrust :',deck_results.thrust[:,0])
+    print(propulsor.tag,'cycle thrust:',cycle.thrust[:,0])
+
+    for key in ['thrust','fuel_flow_rate','power']:
+        assert np.all(np.abs(deck_results[key] - cycle[key])/cycle[key] < 2E-2), key
+
+    fallback_mach       = np.append(test_mach[:-1],mach_number[-1] + 0.1)
+    fallback_conditions = run_propulsor(propulsor,fallback_mach,test_altitude,test_throttle)
+    assert 'stagnation_temperature' not in deck_conditions.energy[propulsor.tag][propulsor.combustor.tag].outputs
+    assert 'stagnation_temperature' in fallback_conditions.energy[propulsor.tag][propulsor.combustor.tag].outputs
+
+    return
+
+def run_propulsor(propulsor,mach_number,altitude,throttle):
+    ctrl_pts   = len(mach_number)
+    planet     = RCAIDE.Library.Attributes.Planets.Earth()
+    atmosphere = RCAIDE.Framework.Analyses.Atmospheric.US_Standard_1976()
+    atmo_data  = atmosphere.compute_values(altitude)
+
+    conditions                                        = RCAIDE.Framework.Mission.Common.Results()
+    conditions.freestream.update(atmo_data)
+    conditions.freestream.altitude                    = altitude[:,None]
+    conditions.freestream.mach_number                 = mach_number[:,None]
+    conditions.freestream.velocity                    = atmo_data.speed_of_sound*mach_number[:,None]
+    conditions.freestream.gravity                     = planet.sea_level_gravity * np.ones((ctrl_pts,1))
+
+    segment                  = RCAIDE.Framework.Mission.Segments.Segment()
+    segment.state.conditions = conditions
+    propulsor.append_operating_conditions(segment)
+    for tag, item in  propulsor.items():
+        if issubclass(type(item), RCAIDE.Library.Components.Component):
+            item.append_operating_conditions(segment,propulsor)
+    segment.state.expand_rows(ctrl_pts)
+    segment.state.conditions.energy[propulsor.tag].throttle[:,0] = throttle
+    propulsor.compute_performance(segment.state)
+
+    return segment.state.conditions
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+# Regressions/Tests/propulsion/rotor_airfoil_polars_test.py
+#
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+from RCAIDE.Framework.Core                                          import Units, interp2d
+from RCAIDE.Library.Methods.Aerodynamics.Common.Lift.BET_calculations import build_airfoil_polar_table, interpolate_airfoil_polar_table
+
+# python imports
+import numpy as np
+
+from rotor_surrogate_test import run_rotor, run_propulsor
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  main
+# ----------------------------------------------------------------------------------------------------------------------
+def main():
+    '''Checks that the blade element analysis follows changes of the rotor airfoil polars, made in place or by
+    replacing the polar arrays, and that the polar table interpolation matches interp2d'''
+
+    omega    = np.array([2390,2710]) * Units.rpm
+    velocity = np.array([77.2,60.])
+    altitude = np.array([0.,1000.])
+
+    electric_rotor, baseline = run_rotor(omega,velocity,altitude,use_surrogate = False,return_propulsor = True)
+    rotor    = electric_rotor.rotor
+    airfoils = rotor.Airfoils
+    polars   = [airfoil.polars for airfoil in airfoils]
+    a_loc    = np.array(rotor.airfoil_polar_stations)
+
+    # the polar table interpolation matches interp2d at the blade stations
+    rng   = np.random.default_rng(11)
+    Re    = rng.uniform(1E5,5E6,(4,len(a_loc)))
+    alpha = rng.uniform(-10.,25.,(4,len(a_loc))) * Units.degrees
+    Cl, Cd = interpolate_airfoil_polar_table(build_airfoil_polar_table(airfoils,a_loc),Re,alpha)
+    for jj, pd in enumerate(polars):
+        stations = a_loc == jj
+        Cl_ref   = interp2d(Re[:,stations],alpha[:,stations],pd.reynolds_numbers,pd.angle_of_attacks,pd.lift_coefficients)
+        Cd_ref   = interp2d(Re[:,stations],alpha[:,stations],pd.reynolds_numbers,pd.angle_of_attacks,pd.drag_coefficients)
+        assert np.allclose(Cl[:,stations],Cl_ref,rtol=1E-12,atol=1E-12)
+        assert np.allclose(Cd[:,stations],Cd_ref,rtol=1E-12,atol=1E-12)
+
+    # scaling the lift coefficients in place changes the thrust
+    lift_coefficients = [pd.lift_coefficients.copy() for pd in polars]
+    for pd in polars:
+        pd.lift_coefficients *= 1.1
+    scaled = run_propulsor(electric_rotor,omega,velocity,altitude)
+    print('baseline thrust :',baseline.thrust_per_blade[:,0]*rotor.number_of_blades)
+    print('scaled thrust   :',scaled.thrust_per_blade[:,0]*rotor.number_of_blades)
+    assert np.all(scaled.thrust_per_blade > baseline.thrust_per_blade*1.02)
+
+    # replacing the polar arrays with the original values recovers the baseline
+    for pd, cl in zip(polars,lift_coefficients):
+        pd.lift_coefficients = cl
+    restored = run_propulsor(electric_rotor,omega,velocity,altitude)
+    assert np.all(restored.thrust_per_blade == baseline.thrust_per_blade)
+    assert np.all(restored.power == baseline.power)
+
+    return
+
+if __name__ == '__main__':
+    main()
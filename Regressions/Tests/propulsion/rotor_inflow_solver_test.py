@@ -0,0 +1,103 @@
+# Regressions/Tests/propulsion/rotor_inflow_solver_test.py
+#
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+import RCAIDE
+from RCAIDE.Framework.Core                                                                                      import Units
+from RCAIDE.Framework.Analyses.Propulsion                                                                       import Momentum_Theory_Wake
+from RCAIDE.Library.Methods.Propulsors.Converters.Rotor.Wake.Momentum_Theory_Wake.fidelity_zero_wake_convergence import solve_inflow_angle, bracket_inflow_angle, iteration
+
+# python imports
+import numpy as np
+import scipy as sp
+import sys
+import os
+
+sys.path.append(os.path.join( os.path.split(os.path.split(sys.path[0])[0])[0], 'Vehicles' + os.path.sep + 'Rotors'))
+from F8745_D4_Propeller  import F8745_D4_Propeller
+from rotor_surrogate_test import run_propulsor
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  main
+# ----------------------------------------------------------------------------------------------------------------------
+def main():
+    '''Compares the inflow angles of the vectorized BEVW solver with the banded fsolve solution it replaced, at cruise,
+    at high thrust and with the propeller windmilling at low rotational speeds'''
+
+    omega    = np.array([2390,2710,600,300,150]) * Units.rpm
+    velocity = np.array([77.2,60.,77.,100.,120.])
+    altitude = np.zeros(5)
+
+    for use_2d_analysis in [False,True]:
+        rotor, rotor_conditions = run_rotor(omega,velocity,altitude,use_2d_analysis)
+        wake_inputs = rotor.Wake.inputs
+        thrust      = rotor_conditions.thrust_per_blade[:,0]*rotor.number_of_blades
+        print('thrust :',thrust)
+        assert np.all(thrust[:2] > 0) and np.all(thrust[2:] < 0)
+
+        if use_2d_analysis:
+            PSI_0      = np.ones((wake_inputs.ctrl_pts,wake_inputs.Nr,wake_inputs.Na))
+        else:
+            PSI_0      = np.ones((wake_inputs.ctrl_pts,wake_inputs.Nr))
+        PSI, converged = solve_inflow_angle(PSI_0,wake_inputs,rotor,rotor.sol_tolerance)
+        PSI_fsolve     = fsolve_inflow_angle(PSI_0,wake_inputs,rotor)
+        assert np.all(converged)
+        check_inflow_angle(PSI,PSI_fsolve,wake_inputs,rotor)
+
+        # the bracketing search alone finds the same roots as the Newton-secant iteration
+        PSI_bracket, converged = bracket_inflow_angle(PSI_0,np.zeros(np.shape(PSI_0),dtype=bool),wake_inputs,rotor,rotor.sol_tolerance)
+        assert np.all(converged)
+        assert np.allclose(PSI_bracket,PSI,rtol=0,atol=1E-7)
+
+        # stations left by the Newton-secant iteration are completed by the bracketing search
+        PSI_fallback, converged = solve_inflow_angle(PSI_0,wake_inputs,rotor,rotor.sol_tolerance,max_iterations = 1)
+        assert np.all(converged)
+        assert np.allclose(PSI_fallback,PSI,rtol=0,atol=1E-7)
+
+    return
+
+def check_inflow_angle(PSI,PSI_fsolve,wake_inputs,rotor):
+    '''Checks an inflow angle solution against the fsolve solution. fsolve can converge to a root of the periodic
+    residual outside the range of physical inflow angles, where the residual of the solution is checked instead'''
+
+    physical = (PSI_fsolve >= -np.pi/2) & (PSI_fsolve <= np.pi)
+    R        = iteration(PSI,wake_inputs,rotor).reshape(np.shape(PSI))
+    print('stations with a non-physical fsolve root :',np.count_nonzero(~physical))
+    assert np.all(np.abs(R) < 1E-8)
+    assert np.all((PSI >= -np.pi/2) & (PSI <= np.pi))
+    assert np.allclose(PSI[physical],PSI_fsolve[physical],rtol=0,atol=1E-8)
+
+    return
+
+def fsolve_inflow_angle(PSI,wake_inputs,rotor):
+    '''Inflow angle of the former fidelity zero wake convergence'''
+    PSI_final,infodict,ier,msg = sp.optimize.fsolve(iteration,PSI,args=(wake_inputs,rotor),xtol=rotor.sol_tolerance,full_output = 1,band=(1,0))
+    assert ier == 1, msg
+    return PSI_final.reshape(np.shape(PSI))
+
+class Recording_Wake(Momentum_Theory_Wake):
+    '''Momentum theory wake that keeps the wake inputs of its last evaluation'''
+    def evaluate(self,rotor,wake_inputs,conditions):
+        self.inputs = wake_inputs
+        return super().evaluate(rotor,wake_inputs,conditions)
+
+def run_rotor(omega,velocity,altitude,use_2d_analysis):
+    electric_rotor                   = RCAIDE.Library.Components.Propulsors.Electric_Rotor()
+    rotor                            = F8745_D4_Propeller()
+    rotor.use_2d_analysis            = use_2d_analysis
+    rotor.number_azimuthal_stations  = 4
+    rotor.Wake                       = Recording_Wake()
+
+    # set the three quarter twist of the propeller as in the F8745-D4 tests
+    beta                             = rotor.twist_distribution
+    rotor.twist_distribution         = beta + 21 * Units.degrees - beta[round(len(beta)*0.75)]
+    electric_rotor.rotor             = rotor
+    rotor_conditions                 = run_propulsor(electric_rotor,omega,velocity,altitude)
+
+    return rotor, rotor_conditions
+
+if __name__ == '__main__':
+    main()
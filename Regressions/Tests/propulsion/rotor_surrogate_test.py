@@ -0,0 +1,121 @@
+# Regressions/Tests/propulsion/rotor_surrogate_test.py
+#
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+import RCAIDE
+from RCAIDE.Framework.Core                                                       import Units
+from RCAIDE.Framework.Mission.Common                                             import Results
+from RCAIDE.Framework.Mission.Segments.Segment                                   import Segment
+from RCAIDE.Library.Methods.Propulsors.Converters.Rotor.compute_rotor_performance import compute_rotor_performance
+from RCAIDE.Library.Methods.Noise.Frequency_Domain_Buildup.Rotor                 import compute_rotor_noise
+from RCAIDE.Library.Methods.Noise.Common                                         import generate_hemisphere_microphone_locations
+
+# python imports
+import numpy as np
+import sys
+import os
+
+sys.path.append(os.path.join( os.path.split(os.path.split(sys.path[0])[0])[0], 'Vehicles' + os.path.sep + 'Rotors'))
+from F8745_D4_Propeller  import F8745_D4_Propeller
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  main
+# ----------------------------------------------------------------------------------------------------------------------
+def main():
+    '''Compares the rotor operating map surrogate to the blade element analysis it is trained with, and checks that
+    the blade element analysis is used outside the trained envelope'''
+
+    test_omega = np.array([2390,2710,2630,1800]) * Units.rpm
+    velocity   = np.array([77.2,60.,40.,20.])
+    altitude   = np.array([0.,1000.,2000.,4000.])
+
+    # full blade element analysis
+    bemt = run_rotor(test_omega,velocity,altitude,use_surrogate = False)
+
+    # operating map
+    electric_rotor, surrogate = run_rotor(test_omega,velocity,altitude,use_surrogate = True,return_propulsor = True)
+    rotor = electric_rotor.rotor
+
+    thrust_truth = np.array([831.3442511358949, 3454.632919225683, 4134.201639770807, 1761.8750511389949])
+    power_truth  = np.array([72063.17193571338, 253074.70454499574, 244316.66959062763, 63982.21206953842])
+
+    print('surrogate thrust :',surrogate.thrust_per_blade[:,0]*rotor.number_of_blades)
+    print('surrogate power  :',surrogate.power[:,0])
+    print('BEMT thrust      :',bemt.thrust_per_blade[:,0]*rotor.number_of_blades)
+    print('BEMT power       :',bemt.power[:,0])
+
+    # the map reproduces the blade element analysis
+    thrust_error = np.abs(surrogate.thrust_per_blade - bemt.thrust_per_blade)/bemt.thrust_per_blade
+    power_error  = np.abs(surrogate.power - bemt.power)/bemt.power
+    assert np.all(thrust_error < 2E-2)
+    assert np.all(power_error  < 2E-2)
+    assert 'blade_thrust_distribution' not in surrogate
+
+    # regression
+    assert np.all(np.abs(surrogate.thrust_per_blade[:,0]*rotor.number_of_blades - thrust_truth)/thrust_truth < 1E-6)
+    assert np.all(np.abs(surrogate.power[:,0] - power_truth)/power_truth < 1E-6)
+
+    # above the trained altitudes the blade element analysis is used
+    fallback = run_rotor(test_omega,velocity,np.array([0.,1000.,2000.,8000.]),use_surrogate = True)
+    assert 'blade_thrust_distribution' in fallback
+
+    # the noise analysis rejects rotors with an operating map, which do not compute the blade distributions
+    settings = RCAIDE.Framework.Analyses.Noise.Frequency_Domain_Buildup().settings
+    try:
+        compute_rotor_noise(generate_hemisphere_microphone_locations(settings),electric_rotor,rotor,Segment(),settings)
+        assert False
+    except ValueError:
+        pass
+
+    # the map is retrained when the geometry changes
+    key = rotor.surrogates.geometry_key
+    rotor.twist_distribution = rotor.twist_distribution + 1. * Units.degrees
+    run_propulsor(electric_rotor,test_omega,velocity,altitude)
+    assert rotor.surrogates.geometry_key != key
+
+    return
+
+def run_rotor(omega,velocity,altitude,use_surrogate,return_propulsor = False):
+    electric_rotor                   = RCAIDE.Library.Components.Propulsors.Electric_Rotor()
+    rotor                            = F8745_D4_Propeller()
+    rotor.use_surrogate              = use_surrogate
+
+    # set the three quarter twist of the propeller as in the F8745-D4 tests
+    beta                             = rotor.twist_distribution
+    rotor.twist_distribution         = beta + 21 * Units.degrees - beta[round(len(beta)*0.75)]
+    electric_rotor.rotor             = rotor
+    rotor_conditions                 = run_propulsor(electric_rotor,omega,velocity,altitude)
+    if return_propulsor:
+        return electric_rotor, rotor_conditions
+    return rotor_conditions
+
+def run_propulsor(electric_rotor,omega,velocity,altitude):
+    rotor                    = electric_rotor.rotor
+    ctrl_pts                 = len(omega)
+    atmosphere               = RCAIDE.Framework.Analyses.Atmospheric.US_Standard_1976()
+    atmosphere_conditions    = atmosphere.compute_values(altitude)
+
+    conditions                                  = Results()
+    conditions.freestream.update(atmosphere_conditions)
+    conditions.frames.inertial.velocity_vector  = np.zeros((ctrl_pts,3))
+    conditions.frames.inertial.velocity_vector[:,0] = velocity
+    conditions.frames.body.transform_to_inertial = np.repeat(np.eye(3)[None,:,:],ctrl_pts,axis=0)
+
+    segment                  = Segment()
+    segment.state.conditions = conditions
+    electric_rotor.append_operating_conditions(segment)
+    for tag, item in  electric_rotor.items():
+        if issubclass(type(item), RCAIDE.Library.Components.Component):
+            item.append_operating_conditions(segment,electric_rotor)
+    segment.state.conditions.expand_rows(ctrl_pts)
+    rotor_conditions             =  segment.state.conditions.energy[electric_rotor.tag][rotor.tag]
+    rotor_conditions.omega[:,0]  = omega
+    compute_rotor_performance(electric_rotor,segment.state)
+
+    return segment.state.conditions.energy[electric_rotor.tag][rotor.tag]
+
+if __name__ == '__main__':
+    main()
@@ -18,23 +18,37 @@ modules = [
     'Tests/analysis_aerodynamics/airfoil_panel_method_convergence.py',
     'Tests/analysis_aerodynamics/VLM_control_surface_test.py',    
     'Tests/analysis_aerodynamics/VLM_moving_surface_test.py',    
+    'Tests/analysis_aerodynamics/VLM_fused_surrogate_test.py',
+    'Tests/analysis_aerodynamics/AVL_batch_test.py',
     'Tests/atmosphere/atmosphere.py',
     'Tests/atmosphere/constant_temperature.py',
     'Tests/analysis_emissions/emissions_test.py',   
+    'Tests/analysis_emissions/cantera_batch_test.py',
     'Tests/analysis_noise/digital_elevation_test.py',  
     'Tests/analysis_noise/frequency_domain_test.py', 
     'Tests/analysis_noise/empirical_jet_noise_test.py',    
+    'Tests/analysis_noise/noise_metrics_test.py',
+    'Tests/analysis_noise/noise_post_processing_test.py',
+    'Tests/analysis_noise/topography_test.py',
     'Tests/analysis_stability/trimmed_flight_test.py', 
     'Tests/analysis_stability/untrimmed_flight_test.py', 
+    'Tests/analysis_stability/dynamic_modes_test.py',
     'Tests/analysis_weights/operating_empty_weight_test.py',
     'Tests/analysis_weights/cg_and_moi_test.py',
+    'Tests/analysis_weights/mass_properties_test.py',
+    'Tests/analysis_weights/batch_weights_test.py',
     'Tests/energy_sources/cell_test.py',
+    'Tests/geodesics/geodesic_batch_test.py',
     'Tests/geometry/airfoil_import_test.py', 
     'Tests/geometry/airfoil_interpolation_test.py',    
     'Tests/geometry/wing_volume_test.py',
     'Tests/geometry/wing_fuel_volume_compute.py',
     'Tests/geometry/fuselage_planform_compute.py',    
     'Tests/mission_segments/transition_segment_test.py', 
+    'Tests/mission_segments/discretization_test.py',
+    'Tests/mission_segments/memoization_test.py',
+    'Tests/mission_segments/compiled_process_test.py',
+    'Tests/mission_segments/mission_profiler_test.py',
     'Tests/network_electric/electric_btms_test.py', 
     'Tests/network_ducted_fan/electric_ducted_fan_network_test.py',
     'Tests/network_turbofan/turbofan_network_test.py',
@@ -44,10 +58,15 @@ modules = [
     'Tests/network_internal_combustion_engine/ICE_test.py',
     'Tests/network_internal_combustion_engine/ICE_constant_speed_test.py',
     'Tests/optimization/optimization_packages.py',
+    'Tests/optimization/rotor_multistart_design_test.py',
     'Tests/performance/landing_field_length.py',
     'Tests/performance/payload_range_test.py',
     'Tests/performance/take_off_field_length.py',
     'Tests/performance/take_off_weight_from_tofl.py',    
+    'Tests/propulsion/rotor_surrogate_test.py',
+    'Tests/propulsion/rotor_inflow_solver_test.py',
+    'Tests/propulsion/rotor_airfoil_polars_test.py',
+    'Tests/propulsion/engine_deck_test.py',
 ]
 
 # Parametrize the list of modules so each is run as a separate test